@@ -0,0 +1,190 @@
+"""Response cache for model calls: in-memory LRU over a SQLite store.
+
+Entries are keyed by a hash of (model, prompt version, normalized input);
+bump the prompt version whenever a prompt or its parsing changes.  Inputs
+are normalized (case, whitespace) because many of them come from fixed cloze
+templates and repeat across students.
+
+Lookups try the LRU, then SQLite; a SQLite hit is promoted into the LRU.
+Rows older than the TTL are misses (and are deleted), and once the table
+grows past ``max_rows`` the rows least recently written or read from disk
+are evicted (memory hits do not touch SQLite).  Hit/miss counters and the
+model time spent on misses are kept in ``stats()``; the time a hit saves is
+estimated from the average miss.  ``stream_through`` does the same for
+streamed text, storing it only once the stream has been read to the end.
+
+``get_cache()`` is the process-wide instance (``SYLLABUDDY_AI_CACHE``, default
+``.cache/ai_cache.sqlite3`` in the repo root).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+import streamlit as st
+
+# repo root (one level up from this file's folder), not the working directory
+CACHE_PATH = os.environ.get("SYLLABUDDY_AI_CACHE", os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "ai_cache.sqlite3"))
+TTL_SECONDS = 30 * 24 * 3600
+MAX_ROWS = 50_000
+LRU_SIZE = 2_000
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    return _WS_RE.sub(" ", text or "").strip().lower()
+
+
+def cache_key(model: str, version: str, text: str) -> str:
+    raw = "\x1f".join((model, version, normalize(text)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, path: Optional[str] = CACHE_PATH, ttl: float = TTL_SECONDS,
+                 max_rows: int = MAX_ROWS, lru_size: int = LRU_SIZE):
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.lru_size = lru_size
+        self._lru: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (created, value)
+        self._lock = threading.Lock()
+        self._counts = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evicted": 0, "miss_ms": 0.0}
+        self._db = None
+        self._rows = 0  # rows on disk: counted once, then estimated in memory
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " created REAL NOT NULL, used REAL NOT NULL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_used ON responses(used)")
+            self._rows = self._count()
+
+    # ---------- lookups ----------
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            hit = self._lru.get(key)
+            if hit is not None and now - hit[0] < self.ttl:
+                self._lru.move_to_end(key)
+                self._counts["memory_hits"] += 1
+                return hit[1]
+            self._lru.pop(key, None)
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None and now - row[1] < self.ttl:
+                    self._db.execute("UPDATE responses SET used = ? WHERE key = ?", (now, key))
+                    value = json.loads(row[0])
+                    self._remember(key, row[1], value)
+                    self._counts["disk_hits"] += 1
+                    return value
+                if row is not None:
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._rows -= 1
+            self._counts["misses"] += 1
+            return None
+
+    def put(self, key: str, value: Any):
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created, used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now))
+            # A replaced key (or rows other workers wrote or evicted) makes the
+            # estimate drift, so it is only recounted once it crosses the cap.
+            self._rows += 1
+            if self._rows > self.max_rows:
+                self._rows = self._count()
+            if self._rows > self.max_rows:
+                # drop the least recently used tenth, so eviction is rare
+                drop = self._rows - self.max_rows + self.max_rows // 10
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY used LIMIT ?)", (drop,))
+                self._rows -= drop
+                self._counts["evicted"] += drop
+
+    def _count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get_or_compute(self, model: str, version: str, text: str, compute: Callable[[], Any]) -> Any:
+        """Cached ``compute()``; exceptions propagate and nothing is stored."""
+        key = cache_key(model, version, text)
+        value = self.get(key)
+        if value is not None:
+            return value
+        t0 = time.perf_counter()
+        value = compute()
+        with self._lock:
+            self._counts["miss_ms"] += (time.perf_counter() - t0) * 1000
+        self.put(key, value)
+        return value
+
+    def stream_through(self, model: str, version: str, text: str,
+                       stream: Callable[[], Iterable[str]]) -> Iterator[str]:
+        """The cached text as one chunk, else the chunks of ``stream()``.
+
+        The joined text is stored only if the stream is read to the end (not
+        on an exception or when the consumer stops early) and is not blank.
+        """
+        key = cache_key(model, version, text)
+        value = self.get(key)
+        if value is not None:
+            yield value
+            return
+        t0 = time.perf_counter()
+        parts = []
+        for chunk in stream():
+            parts.append(chunk)
+            yield chunk
+        with self._lock:
+            self._counts["miss_ms"] += (time.perf_counter() - t0) * 1000
+        value = "".join(parts)
+        if value.strip():
+            self.put(key, value)
+
+    def _remember(self, key: str, created: float, value: Any):
+        self._lru[key] = (created, value)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    # ---------- counters ----------
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            c = dict(self._counts)
+            c["memory_entries"] = len(self._lru)
+        hits = c["memory_hits"] + c["disk_hits"]
+        lookups = hits + c["misses"]
+        c["hit_rate"] = hits / lookups if lookups else 0.0
+        avg_miss = c["miss_ms"] / c["misses"] if c["misses"] else 0.0
+        c["saved_ms"] = hits * avg_miss  # model time the hits did not spend
+        return c
+
+
+# One cache per process, shared by every session.
+@st.cache_resource(show_spinner=False)
+def _cache(path: str) -> ResponseCache:
+    return ResponseCache(path)
+
+
+def get_cache() -> ResponseCache:
+    return _cache(CACHE_PATH)
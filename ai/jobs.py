@@ -0,0 +1,91 @@
+"""Model calls off the script thread.
+
+AI work is submitted to one thread pool shared by every session in the
+process (``SYLLABUDDY_AI_WORKERS`` threads, default 4); the futures are kept
+per session under a name (``st.session_state["_ai_jobs"]``), so a page
+renders straight away and picks the result up on a later fragment run.
+Nothing waits on a job: controls that need the result stay disabled until
+it is in.
+
+    jobs.submit("fp", task)          # in the Submit callback
+    value = jobs.take("fp")          # None while the job runs
+    if jobs.pending("fp"):
+        st.caption("Analysing…")
+        jobs.poll("fp")              # reruns the app once the job is done
+
+Tasks run without a script-run context, so they must not touch
+``st.session_state`` or call ``st.cache_*`` functions: resolve providers and
+caches on the script thread and submit a plain callable.  Tasks are expected
+to handle their own errors (return a fallback); an exception is re-raised by
+``take``.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import streamlit as st
+
+from common.ui import fragment
+
+AI_WORKERS = int(os.environ.get("SYLLABUDDY_AI_WORKERS", "4"))
+POLL_SECONDS = 0.5
+
+
+# One pool per process, shared by every session.
+@st.cache_resource(show_spinner=False)
+def _executor(workers: int) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="syllabuddy-ai")
+
+
+def _jobs() -> Dict[str, Future]:
+    return st.session_state.setdefault("_ai_jobs", {})
+
+
+def submit(name: str, fn: Callable[..., Any], *args) -> Future:
+    """Run ``fn(*args)`` on the pool as this session's job ``name``.
+
+    A job already under ``name`` is replaced (and cancelled if not started).
+    """
+    discard(name)
+    future = _jobs()[name] = _executor(AI_WORKERS).submit(fn, *args)
+    return future
+
+
+def discard(name: str):
+    future = _jobs().pop(name, None)
+    if future is not None:
+        future.cancel()
+
+
+def pending(name: str) -> bool:
+    future = _jobs().get(name)
+    return future is not None and not future.done()
+
+
+def take(name: str) -> Optional[Any]:
+    """The result of job ``name`` once done (the job is then forgotten).
+
+    Never waits: ``None`` while the job is still running or if there is no
+    such job.
+    """
+    future = _jobs().get(name)
+    if future is None or not future.done():
+        return None
+    _jobs().pop(name, None)
+    return future.result()
+
+
+@fragment(run_every=POLL_SECONDS)
+def poll(name: str):
+    """Rerun the app once job ``name`` is done.
+
+    Checked every ``POLL_SECONDS``.  The rerun is a full one: Streamlit only
+    accepts a keyed ``st.rerun(scope=...)`` from a widget callback, and
+    ``scope="fragment"`` here would rerun just this poll.  The page that
+    follows takes the result and no longer calls ``poll``, so its timer stops.
+    """
+    if not pending(name):
+        st.rerun()
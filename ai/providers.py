@@ -0,0 +1,165 @@
+"""Pluggable text-generation backends for the AI features.
+
+``get_provider()`` returns the process-wide provider for the configured
+backend, created once (``st.cache_resource``) and shared by every session:
+
+* ``openai``: the OpenAI API through one pooled, keep-alive HTTP client with
+  explicit connect/read timeouts;
+* ``local``: the same client pointed at an OpenAI-compatible stand-in server
+  (``SYLLABUDDY_AI_BASE_URL``, e.g. ``http://localhost:8000/v1``);
+* ``stub``: no model at all; ``complete`` raises ``AIUnavailable`` and callers
+  use their deterministic fallbacks.
+
+``complete`` returns the whole reply; ``stream`` yields it in chunks as the
+model writes it, for text shown while it is generated.
+
+Settings come from the environment, then ``st.secrets``, and are read once
+per process: ``SYLLABUDDY_AI_BACKEND`` (default: ``local`` if a base URL is
+set, else ``openai`` if ``OPENAI_API_KEY`` is, else ``stub``),
+``SYLLABUDDY_AI_MODEL``, ``SYLLABUDDY_AI_CONNECT_TIMEOUT`` and
+``SYLLABUDDY_AI_READ_TIMEOUT`` (seconds).
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from typing import Iterator, NamedTuple, Optional
+
+import streamlit as st
+
+DEFAULT_MODEL = "gpt-5-nano"
+CONNECT_TIMEOUT = 3.0
+READ_TIMEOUT = 20.0
+MAX_CONNECTIONS = 10
+KEEPALIVE_SECONDS = 60.0
+
+
+class AIUnavailable(RuntimeError):
+    """No model is configured (or the backend's SDK is missing)."""
+
+
+class AIConfig(NamedTuple):
+    backend: str
+    model: str
+    base_url: Optional[str]
+    api_key: Optional[str]
+    connect_timeout: float
+    read_timeout: float
+
+    def __repr__(self):  # keep the key out of logs
+        return repr(self._replace(api_key="***" if self.api_key else None)._asdict())
+
+
+def _setting(name: str, default=None):
+    value = os.getenv(name)
+    if value:
+        return value
+    try:
+        return st.secrets.get(name, default) or default
+    except Exception:  # no secrets.toml
+        return default
+
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> AIConfig:
+    base_url = _setting("SYLLABUDDY_AI_BASE_URL")
+    api_key = _setting("OPENAI_API_KEY")
+    backend = _setting("SYLLABUDDY_AI_BACKEND") or (
+        "local" if base_url else "openai" if api_key else "stub")
+    return AIConfig(
+        backend=backend,
+        model=_setting("SYLLABUDDY_AI_MODEL", DEFAULT_MODEL),
+        base_url=base_url,
+        api_key=api_key,
+        connect_timeout=float(_setting("SYLLABUDDY_AI_CONNECT_TIMEOUT", CONNECT_TIMEOUT)),
+        read_timeout=float(_setting("SYLLABUDDY_AI_READ_TIMEOUT", READ_TIMEOUT)),
+    )
+
+
+class Provider:
+    """A backend that completes a single user prompt."""
+
+    name = "stub"
+    live = False  # False: every call raises AIUnavailable
+    model = ""
+
+    def complete(self, prompt: str, max_tokens: int = 120, temperature: float = 0.2) -> str:
+        raise AIUnavailable(f"no AI backend configured ({self.name})")
+
+    def stream(self, prompt: str, max_tokens: int = 120, temperature: float = 0.2) -> Iterator[str]:
+        """``complete`` as text chunks, yielded as the model writes them."""
+        raise AIUnavailable(f"no AI backend configured ({self.name})")
+
+
+class OpenAIProvider(Provider):
+    """OpenAI chat completions (or any server speaking the same API)."""
+
+    live = True
+
+    def __init__(self, name: str, model: str, api_key: Optional[str], base_url: Optional[str] = None,
+                 connect_timeout: float = CONNECT_TIMEOUT, read_timeout: float = READ_TIMEOUT):
+        try:
+            import httpx
+            from openai import OpenAI  # OpenAI v1
+        except ImportError as e:
+            raise AIUnavailable(f"openai SDK not installed: {e}") from e
+        self.name = name
+        self.model = model
+        # One pooled client: later calls reuse the TCP/TLS connection.
+        self._http = httpx.Client(
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS,
+                                max_keepalive_connections=MAX_CONNECTIONS,
+                                keepalive_expiry=KEEPALIVE_SECONDS),
+        )
+        self._client = OpenAI(api_key=api_key, base_url=base_url, http_client=self._http, max_retries=1)
+
+    def complete(self, prompt: str, max_tokens: int = 120, temperature: float = 0.2) -> str:
+        resp = self._client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return (resp.choices[0].message.content or "").strip()
+
+    def stream(self, prompt: str, max_tokens: int = 120, temperature: float = 0.2) -> Iterator[str]:
+        resp = self._client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        try:
+            for chunk in resp:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+        finally:
+            resp.close()  # an abandoned stream frees its pooled connection
+
+
+# One provider per configuration, shared by every session in the process.
+@st.cache_resource(show_spinner=False)
+def _provider(config: AIConfig) -> Provider:
+    if config.backend == "stub":
+        return Provider()
+    if config.backend not in ("openai", "local"):
+        raise ValueError(f"unknown AI backend {config.backend!r}")
+    if config.backend == "openai" and not config.api_key:
+        return Provider()
+    try:
+        return OpenAIProvider(
+            config.backend, config.model,
+            api_key=config.api_key or "local",  # stand-in servers ignore the key
+            base_url=config.base_url if config.backend == "local" else None,
+            connect_timeout=config.connect_timeout, read_timeout=config.read_timeout,
+        )
+    except AIUnavailable:
+        return Provider()
+
+
+def get_provider() -> Provider:
+    return _provider(load_config())
@@ -0,0 +1,86 @@
+"""Local BM25 ranking of dotpoints against free-text weaknesses.
+
+Each dotpoint is a document made of its own text plus its IQ and module
+titles.  Everything query-independent is precomputed once per compiled
+syllabus: for every term, the IDs of the documents containing it and the
+term's full BM25 contribution to each of them.  A query then concatenates
+the postings of its terms and sums them with one ``np.bincount`` over all
+dotpoints; ``np.argpartition`` picks the top k.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, List
+
+import numpy as np
+
+from data.index import SyllabusIndex
+from data.text import stem, tokenize
+
+K1 = 1.2
+B = 0.75
+
+
+def _doc_terms(idx: SyllabusIndex, did: int, iq: str, module: str) -> List[str]:
+    text = f"{idx.dotpoints[did]} {iq} {module}"
+    return [stem(t) for t in tokenize(text)]
+
+
+class BM25Ranker:
+    def __init__(self, idx: SyllabusIndex):
+        self.idx = idx
+        n = idx.n_dotpoints
+        self.n_docs = n
+
+        # one (term, doc, tf) triple per distinct term in each document
+        vocab: Dict[str, int] = {}
+        t_ids: List[int] = []
+        d_ids: List[int] = []
+        tfs: List[int] = []
+        lengths = np.zeros(n, dtype=np.float64)
+        for q in range(idx.n_iqs):
+            iq = idx.iqs[q]
+            module = idx.modules[idx.iq_mod[q]]
+            for did in idx.dps_of(q):
+                tf = Counter(_doc_terms(idx, did, iq, module))
+                lengths[did] = sum(tf.values())
+                for t, f in tf.items():
+                    t_ids.append(vocab.setdefault(t, len(vocab)))
+                    d_ids.append(did)
+                    tfs.append(f)
+        self._vocab = vocab
+
+        terms = np.asarray(t_ids, dtype=np.int64)
+        docs = np.asarray(d_ids, dtype=np.int32)
+        tf = np.asarray(tfs, dtype=np.float64)
+        df = np.bincount(terms, minlength=len(vocab)).astype(np.float64)
+        idf = np.log1p((n - df + 0.5) / (df + 0.5))
+        avgdl = float(lengths.mean()) if n and lengths.any() else 1.0
+        norm = K1 * (1 - B + B * lengths[docs] / avgdl)
+        weights = idf[terms] * tf * (K1 + 1) / (tf + norm)
+
+        # term -> (doc IDs, BM25 weights), stored as one CSR pair of arrays
+        order = np.argsort(terms, kind="stable")
+        self._docs = docs[order]
+        self._w = weights[order].astype(np.float32)
+        self._off = np.concatenate(([0], np.cumsum(df.astype(np.int64))))
+
+    def scores(self, text: str) -> np.ndarray:
+        """BM25 score of every dotpoint for ``text`` (zeros if nothing matches)."""
+        tids = [self._vocab[t] for t in (stem(t) for t in tokenize(text)) if t in self._vocab]
+        if not tids:
+            return np.zeros(self.n_docs, dtype=np.float64)
+        # repeated query terms count once per repetition, as in standard BM25
+        sl = [slice(self._off[t], self._off[t + 1]) for t in tids]
+        docs = np.concatenate([self._docs[s] for s in sl])
+        weights = np.concatenate([self._w[s] for s in sl])
+        return np.bincount(docs, weights=weights, minlength=self.n_docs)
+
+    def top_k(self, text: str, k: int = 40) -> List[int]:
+        """IDs of the ``k`` best-matching dotpoints with a positive score, best first."""
+        s = self.scores(text)
+        hits = np.flatnonzero(s > 0)
+        if len(hits) > k:
+            hits = hits[np.argpartition(-s[hits], k - 1)[:k]]
+        return hits[np.argsort(-s[hits], kind="stable")].tolist()
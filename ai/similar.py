@@ -0,0 +1,254 @@
+"""Near-duplicate answer reuse: a SimHash index over analysed answers.
+
+Free-text answers are rarely byte-identical (so ``ai.cache`` misses them) but
+are often nearly so.  Each answer gets a 64-bit SimHash over its stemmed
+words and word bigrams; answers whose fingerprints differ in at most
+``MAX_DISTANCE`` bits are treated as the same answer and reuse its stored
+model result.
+
+Lookup is banded: the fingerprint is cut into ``MAX_DISTANCE + 1`` bands,
+so (pigeonhole) any match within the distance agrees exactly on at least one
+band.  Each band is a dict from band value to row positions; a lookup is a
+few dict hits plus a popcount per candidate, which stays well under a
+millisecond with hundreds of thousands of answers (the buckets hold a
+handful each).  Fingerprints live in memory; results stay in SQLite (the
+``ai.cache`` file) and are read on a hit.  Entries expire and are evicted
+like ``ai.cache`` responses.
+
+Answers shorter than ``MIN_TOKENS`` words are not indexed: their
+fingerprints are too coarse to trust.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import streamlit as st
+
+from ai.cache import CACHE_PATH, TTL_SECONDS
+from data.text import stem, tokenize
+
+BITS = 64
+MAX_DISTANCE = 3
+BANDS = MAX_DISTANCE + 1
+BAND_BITS = BITS // BANDS
+MIN_TOKENS = 8
+MAX_ENTRIES = 500_000  # per namespace
+
+_BAND_MASK = (1 << BAND_BITS) - 1
+
+
+def _features(tokens: List[str]) -> List[str]:
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def simhash(text: str) -> Optional[int]:
+    """64-bit SimHash of ``text``, or ``None`` if it is too short to index."""
+    tokens = [stem(t) for t in tokenize(text)]
+    if len(tokens) < MIN_TOKENS:
+        return None
+    feats = _features(tokens)
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "little")
+         for f in feats), dtype="<u8", count=len(feats))
+    # bit j of every feature hash votes +1 / -1 for bit j of the fingerprint
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    ones = bits.sum(axis=0, dtype=np.int64) * 2 > len(feats)
+    return int(np.packbits(ones, bitorder="little").view("<u8")[0])
+
+
+def _signed(fp: int) -> int:  # SQLite integers are signed 64-bit
+    return fp - (1 << 64) if fp >= 1 << 63 else fp
+
+
+class SimHashIndex:
+    """Fingerprints of analysed answers in one namespace (model + prompt version).
+
+    Entries follow the ``ai.cache`` policy: older than ``ttl`` they no longer
+    match, and once there are more than ``max_entries`` the least recently
+    used tenth (expired entries first) is evicted, from memory and SQLite.
+    """
+
+    def __init__(self, namespace: str, path: Optional[str] = CACHE_PATH,
+                 max_distance: int = MAX_DISTANCE, ttl: float = TTL_SECONDS,
+                 max_entries: int = MAX_ENTRIES):
+        self.namespace = namespace
+        self.max_distance = max_distance
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # parallel arrays by position; an evicted position has rowid -1
+        self._fps = array("Q")
+        self._rowids = array("q")
+        self._created = array("d")
+        self._used = array("d")
+        self._dead = 0
+        self._bands: List[Dict[int, List[int]]] = [{} for _ in range(BANDS)]
+        self._values: Dict[int, Any] = {}  # rowid -> value, when there is no database
+        self._lock = threading.Lock()
+        self._counts = {"near_hits": 0, "near_misses": 0, "unindexed": 0, "evicted": 0}
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS near_answers ("
+                " id INTEGER PRIMARY KEY, ns TEXT NOT NULL, fp INTEGER NOT NULL,"
+                " value TEXT NOT NULL, created REAL NOT NULL, used REAL NOT NULL)")
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(near_answers)")}
+            if "used" not in columns:  # written before entries were evicted
+                self._db.execute("ALTER TABLE near_answers ADD COLUMN used REAL NOT NULL DEFAULT 0")
+            self._db.execute("CREATE INDEX IF NOT EXISTS near_answers_ns ON near_answers(ns, used)")
+            self._db.execute("DELETE FROM near_answers WHERE ns = ? AND created < ?",
+                             (namespace, time.time() - ttl))
+            rows = self._db.execute(
+                "SELECT id, fp, created, used FROM near_answers WHERE ns = ?"
+                " ORDER BY used DESC LIMIT ?", (namespace, max_entries)).fetchall()
+            for rowid, fp, created, used in sorted(rows):
+                self._insert(rowid, fp & (1 << 64) - 1, created, used)
+
+    def __len__(self) -> int:
+        return len(self._fps) - self._dead
+
+    def _insert(self, rowid: int, fp: int, created: float, used: float):
+        pos = len(self._fps)
+        self._fps.append(fp)
+        self._rowids.append(rowid)
+        self._created.append(created)
+        self._used.append(used)
+        for b, band in enumerate(self._bands):
+            band.setdefault((fp >> (b * BAND_BITS)) & _BAND_MASK, []).append(pos)
+
+    def _nearest(self, fp: int) -> Optional[int]:
+        """Position of the closest live fingerprint within the distance."""
+        best, best_d = None, self.max_distance + 1
+        fps, rowids, created = self._fps, self._rowids, self._created
+        cutoff = time.time() - self.ttl
+        for b, band in enumerate(self._bands):
+            for pos in band.get((fp >> (b * BAND_BITS)) & _BAND_MASK, ()):
+                if rowids[pos] < 0 or created[pos] < cutoff:
+                    continue
+                d = bin(fps[pos] ^ fp).count("1")
+                if d < best_d:
+                    best, best_d = pos, d
+        return best
+
+    def _lookup(self, fp: int) -> Optional[Any]:
+        with self._lock:
+            pos = self._nearest(fp)
+            if pos is None:
+                return None
+            now = self._used[pos] = time.time()
+            rowid = self._rowids[pos]
+            if self._db is None:
+                return self._values[rowid]
+            row = self._db.execute("SELECT value FROM near_answers WHERE id = ?", (rowid,)).fetchone()
+            self._db.execute("UPDATE near_answers SET used = ? WHERE id = ?", (now, rowid))
+        return json.loads(row[0]) if row else None
+
+    def _store(self, fp: int, value: Any):
+        with self._lock:
+            now = time.time()
+            if self._db is None:
+                rowid = max(self._values, default=-1) + 1
+                self._values[rowid] = value
+            else:
+                rowid = self._db.execute(
+                    "INSERT INTO near_answers (ns, fp, value, created, used) VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, _signed(fp), json.dumps(value), now, now)).lastrowid
+            self._insert(rowid, fp, now, now)
+            if len(self) > self.max_entries:
+                self._evict(now)
+
+    def _evict(self, now: float):
+        # drop the least recently used tenth (expired first), so eviction is rare
+        drop = len(self) - self.max_entries + self.max_entries // 10
+        used = np.frombuffer(self._used, dtype=np.float64).copy()
+        used[np.frombuffer(self._created, dtype=np.float64) < now - self.ttl] = -np.inf
+        used[np.frombuffer(self._rowids, dtype=np.int64) < 0] = np.inf
+        victims = np.argpartition(used, drop - 1)[:drop].tolist()
+        gone = [self._rowids[pos] for pos in victims]
+        for pos in victims:
+            self._rowids[pos] = -1
+        self._dead += drop
+        self._counts["evicted"] += drop
+        if self._db is None:
+            for rowid in gone:
+                self._values.pop(rowid, None)
+        else:
+            self._db.executemany("DELETE FROM near_answers WHERE id = ?", [(r,) for r in gone])
+        if self._dead > len(self._fps) // 2:
+            self._compact()
+
+    def _compact(self):
+        """Rebuild the arrays and bands without the evicted positions."""
+        old = (self._fps, self._rowids, self._created, self._used)
+        self._fps, self._rowids = array("Q"), array("q")
+        self._created, self._used = array("d"), array("d")
+        self._bands = [{} for _ in range(BANDS)]
+        self._dead = 0
+        for fp, rowid, created, used in zip(*old):
+            if rowid >= 0:
+                self._insert(rowid, fp, created, used)
+
+    def find(self, text: str) -> Optional[Any]:
+        """The stored result of a near-identical answer, if any."""
+        fp = simhash(text)
+        return None if fp is None else self._lookup(fp)
+
+    def add(self, text: str, value: Any):
+        fp = simhash(text)
+        if fp is not None:
+            self._store(fp, value)
+
+    def get_or_compute(self, text: str, compute: Callable[[], Any]) -> Any:
+        """``find(text)``, else ``compute()`` (stored); exceptions propagate."""
+        fp = simhash(text)
+        if fp is None:
+            with self._lock:
+                self._counts["unindexed"] += 1
+            return compute()
+        value = self._lookup(fp)
+        with self._lock:
+            self._counts["near_hits" if value is not None else "near_misses"] += 1
+        if value is not None:
+            return value
+        value = compute()
+        self._store(fp, value)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts, entries=len(self))
+
+
+_open: List[SimHashIndex] = []  # every index opened in this process
+
+
+# One index per namespace, shared by every session in the process.
+@st.cache_resource(show_spinner=False)
+def _index(path: str, namespace: str) -> SimHashIndex:
+    index = SimHashIndex(namespace, path)
+    _open.append(index)
+    return index
+
+
+def get_near_index(model: str, version: str) -> SimHashIndex:
+    return _index(CACHE_PATH, f"{model}\x1f{version}")
+
+
+def near_stats() -> Dict[str, int]:
+    """Counters summed over the indexes opened in this process."""
+    total = {"near_hits": 0, "near_misses": 0, "unindexed": 0, "evicted": 0, "entries": 0}
+    for index in list(_open):
+        for k, v in index.stats().items():
+            total[k] += v
+    return total
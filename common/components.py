@@ -0,0 +1,52 @@
+"""Registry of the custom components built into the repo.
+
+Each frontend build is declared with Streamlit at most once per process, on
+first use.  Whether its build directory exists is checked at that point and
+remembered (a missing build is cached as ``None``), so render paths can ask
+``get_component`` on every run without touching the filesystem again.
+
+The typed render functions live next to the pages that use them
+(``fp.component``, ``selection.component``, ``review.component``,
+``common.style``) and all resolve their component through here.
+"""
+
+import pathlib
+import threading
+from typing import Callable, Dict, Optional
+
+import streamlit.components.v1 as components
+
+_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+BUILDS: Dict[str, pathlib.Path] = {
+    "dnd_cloze": _ROOT / "frontend" / "build",
+    "gesture_grid": _ROOT / "frontend_gestures" / "build",
+    "review_list": _ROOT / "frontend_review" / "build",
+    "stylesheet": _ROOT / "frontend_style" / "build",
+}
+
+_declared: Dict[str, Optional[Callable]] = {}
+_lock = threading.Lock()
+
+
+def get_component(name: str) -> Optional[Callable]:
+    """The declared component ``name``, or ``None`` if its build is missing."""
+    try:
+        return _declared[name]
+    except KeyError:
+        pass
+    with _lock:
+        if name not in _declared:
+            path = BUILDS[name]
+            comp = None
+            if (path / "index.html").exists():
+                try:
+                    comp = components.declare_component(name, path=str(path))
+                except Exception:
+                    comp = None  # callers fall back to plain widgets
+            _declared[name] = comp
+        return _declared[name]
+
+
+def has_component(name: str) -> bool:
+    return get_component(name) is not None
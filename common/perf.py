@@ -0,0 +1,226 @@
+"""Per-interaction script timing.
+
+``timed(scope)`` wraps a full script run (``scope="app"``) or one fragment
+run (``scope="fragment:<name>"``) and records its wall time, keyed by route,
+in a small ring buffer in ``st.session_state["_perf"]``.  With
+``SYLLABUDDY_PERF=1`` every run is also logged to the ``syllabuddy.perf``
+logger, which is what to watch when comparing full and fragment reruns.
+
+It also counts script runs per user action.  A run that ends in a body-level
+``st.rerun()`` makes the next run part of the same action; anything else
+starts a new one.  One click should cost one run; actions that took more are
+logged, and ``actions()`` keeps the recent counts.
+
+With ``SYLLABUDDY_PERF=1`` every scope also counts the deltas it emitted
+and the bytes of the ForwardMsgs it sent to the browser (by wrapping the run
+context's enqueue; off by default, as that sizes every message).  Besides
+the per-session history, wall time, deltas, bytes and runs per action go
+into process-wide rolling windows (``WINDOW`` samples per route and scope)
+that ``route_stats``/``histogram`` summarise for the hidden diagnostics
+route and ``dump`` writes to a JSON file.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import RerunException, get_script_run_ctx
+
+HISTORY = 50
+LOG = logging.getLogger("syllabuddy.perf")
+ENABLED = os.environ.get("SYLLABUDDY_PERF", "") not in ("", "0")
+WINDOW = 500  # samples per (route, scope) in the process-wide windows
+# repo root (one level up from this file's folder), not the working directory
+DUMP_PATH = os.environ.get("SYLLABUDDY_PERF_DUMP", os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "perf_dump.json"))
+METRICS = ("ms", "deltas", "bytes")
+
+
+_local = threading.local()  # timed() nesting depth and send counter on the script thread
+
+# process-wide rolling windows, shared by every session
+_lock = threading.Lock()
+_windows: Dict[Tuple[str, str], Dict[str, Deque[float]]] = {}
+_totals: Dict[Tuple[str, str], int] = {}
+_runs: Dict[str, Deque[int]] = {}  # route -> script runs per action
+
+
+def _record(route: str, scope: str, ms: float, deltas: int, nbytes: int):
+    with _lock:
+        win = _windows.get((route, scope))
+        if win is None:
+            win = _windows[(route, scope)] = {m: deque(maxlen=WINDOW) for m in METRICS}
+        win["ms"].append(ms)
+        win["deltas"].append(deltas)
+        win["bytes"].append(nbytes)
+        _totals[(route, scope)] = _totals.get((route, scope), 0) + 1
+
+
+class _Sent:
+    """Deltas and ForwardMsg bytes enqueued for the browser so far this run."""
+    __slots__ = ("deltas", "bytes")
+
+    def __init__(self):
+        self.deltas = 0
+        self.bytes = 0
+
+
+def _watch_sends(sent: _Sent) -> Callable[[], None]:
+    """Count what the current run enqueues (with perf logging on); returns the undo."""
+    ctx = get_script_run_ctx(suppress_warning=True) if ENABLED else None
+    # _enqueue is Streamlit-internal: without it, deltas and bytes stay at 0
+    enqueue = getattr(ctx, "_enqueue", None)
+    if enqueue is None:
+        return lambda: None
+
+    def counting(msg):
+        if msg.WhichOneof("type") == "delta":
+            sent.deltas += 1
+        sent.bytes += msg.ByteSize()
+        enqueue(msg)
+
+    ctx._enqueue = counting
+
+    def undo():
+        ctx._enqueue = enqueue
+    return undo
+
+
+def _history() -> Dict[Tuple[str, str], Deque[float]]:
+    return st.session_state.setdefault("_perf", {})
+
+
+def _count_run(route: str, scope: str):
+    state = st.session_state
+    action = state.get("_perf_action")
+    if state.pop("_perf_followup", False) and action is not None:
+        action["runs"] += 1
+        action["scopes"].append(scope)
+        return
+    if action is not None:
+        state.setdefault("_perf_actions", deque(maxlen=HISTORY)).append(
+            (action["route"], action["runs"]))
+        with _lock:
+            _runs.setdefault(action["route"], deque(maxlen=WINDOW)).append(action["runs"])
+        if ENABLED and action["runs"] > 1:
+            LOG.warning("%-16s %d runs for one action: %s",
+                        action["route"], action["runs"], " -> ".join(action["scopes"]))
+    state["_perf_action"] = {"route": route, "runs": 1, "scopes": [scope]}
+
+
+@contextmanager
+def timed(scope: str):
+    route = st.session_state.get("route", "home")
+    # Fragments run inside a full run too; only the outermost scope is a run.
+    outer = not getattr(_local, "depth", 0)
+    if outer:
+        _count_run(route, scope)
+        _local.sent = _Sent()
+        unwatch = _watch_sends(_local.sent)
+    sent = _local.sent
+    d0, b0 = sent.deltas, sent.bytes
+    _local.depth = getattr(_local, "depth", 0) + 1
+    t0 = time.perf_counter()
+    try:
+        yield
+    except RerunException:
+        if outer:
+            st.session_state["_perf_followup"] = True
+        raise
+    finally:
+        _local.depth -= 1
+        ms = (time.perf_counter() - t0) * 1000
+        deltas, nbytes = sent.deltas - d0, sent.bytes - b0
+        if outer:
+            unwatch()
+        _history().setdefault((route, scope), deque(maxlen=HISTORY)).append(ms)
+        _record(route, scope, ms, deltas, nbytes)
+        if ENABLED:
+            LOG.warning("%-16s %-32s %7.1f ms %5d deltas %9d B", route, scope, ms, deltas, nbytes)
+
+
+def summary() -> Dict[Tuple[str, str], Tuple[int, float, float]]:
+    """(route, scope) -> (runs, median ms, max ms) over the recent history."""
+    out = {}
+    for key, times in _history().items():
+        ordered = sorted(times)
+        out[key] = (len(ordered), ordered[len(ordered) // 2], ordered[-1])
+    return out
+
+
+def actions() -> List[Tuple[str, int]]:
+    """(route, script runs) for recent user actions, the current one last."""
+    out = list(st.session_state.get("_perf_actions", ()))
+    action = st.session_state.get("_perf_action")
+    if action is not None:
+        out.append((action["route"], action["runs"]))
+    return out
+
+
+# ---------- process-wide windows ----------
+
+def _pct(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def _snapshot() -> Tuple[Dict[Tuple[str, str], Dict[str, List[float]]], Dict[Tuple[str, str], int],
+                         Dict[str, List[int]]]:
+    with _lock:
+        windows = {key: {m: list(v) for m, v in win.items()} for key, win in _windows.items()}
+        return windows, dict(_totals), {r: list(v) for r, v in _runs.items()}
+
+
+def route_stats() -> List[Dict[str, object]]:
+    """One row per (route, scope): sample counts and p50/p90/max per metric."""
+    windows, totals, runs = _snapshot()
+    rows = []
+    for (route, scope), win in sorted(windows.items()):
+        row = {"route": route, "scope": scope, "runs": totals[(route, scope)]}
+        for m in METRICS:
+            ordered = sorted(win[m])
+            row[f"{m} p50"] = _pct(ordered, .5)
+            row[f"{m} p90"] = _pct(ordered, .9)
+            row[f"{m} max"] = ordered[-1] if ordered else 0
+        per_action = runs.get(route) if scope == "app" else None
+        row["runs/action"] = sum(per_action) / len(per_action) if per_action else None
+        rows.append(row)
+    return rows
+
+
+def histogram(route: str, scope: str, metric: str = "ms") -> List[Tuple[float, int]]:
+    """(upper bound, samples) in powers of two over the rolling window."""
+    windows, _, runs = _snapshot()
+    values = runs.get(route, []) if metric == "runs" else windows.get((route, scope), {}).get(metric, [])
+    counts: Dict[float, int] = {}
+    for v in values:
+        bound = 1.0
+        while bound < v:
+            bound *= 2
+        counts[bound] = counts.get(bound, 0) + 1
+    return sorted(counts.items())
+
+
+def dump(path: Optional[str] = None) -> str:
+    """Write the process-wide windows (raw samples) as JSON; returns the path."""
+    windows, totals, runs = _snapshot()
+    path = os.path.abspath(path or DUMP_PATH)
+    data = {
+        "time": time.time(),
+        "window": WINDOW,
+        "routes": [
+            {"route": route, "scope": scope, "runs": totals[(route, scope)], **win}
+            for (route, scope), win in sorted(windows.items())
+        ],
+        "runs_per_action": runs,
+    }
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+    return path
@@ -0,0 +1,120 @@
+"""Lazily imported route handlers, with an import-time budget.
+
+``lazy("review.review", "page_srs_review")`` stands in for a handler (or a
+button callback) and imports its module on the first call, so a session that
+only visits ``home`` never imports the selection, review, search, AI or FP
+modules (nor NumPy, which most of them pull in).
+
+Every first import through ``load`` is timed; one over ``IMPORT_BUDGET_MS``
+(``SYLLABUDDY_IMPORT_BUDGET_MS``, default 150) is logged to
+``syllabuddy.perf``.  ``python -m common.routes`` times the bootstrap and
+every route's cold import in fresh interpreters (best of 3) and exits
+non-zero when one is over budget.  ``tests/test_import_budget.py`` runs the
+same check with headroom for slow or busy CI machines: the budget is
+multiplied by ``SYLLABUDDY_IMPORT_BUDGET_MARGIN`` (default 2).
+"""
+
+import importlib
+import os
+import pathlib
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from common.perf import ENABLED, LOG
+
+IMPORT_BUDGET_MS = float(os.environ.get("SYLLABUDDY_IMPORT_BUDGET_MS", "150"))
+IMPORT_BUDGET_MARGIN = float(os.environ.get("SYLLABUDDY_IMPORT_BUDGET_MARGIN", "2"))
+
+_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+# module -> ms spent on its first import in this process
+import_ms: Dict[str, float] = {}
+
+
+def load(module: str):
+    """``import_module`` that times (and budget-checks) the first import."""
+    mod = sys.modules.get(module)
+    if mod is not None:
+        return mod
+    t0 = time.perf_counter()
+    mod = importlib.import_module(module)
+    ms = import_ms[module] = (time.perf_counter() - t0) * 1000
+    if ms > IMPORT_BUDGET_MS:
+        LOG.warning("import %-24s %7.1f ms (budget %.0f ms)", module, ms, IMPORT_BUDGET_MS)
+    elif ENABLED:
+        LOG.warning("import %-24s %7.1f ms", module, ms)
+    return mod
+
+
+class Lazy:
+    """Callable proxy for ``module.name``, imported on first call."""
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+
+    def __call__(self, *args, **kwargs):
+        return getattr(load(self.module), self.name)(*args, **kwargs)
+
+    def __repr__(self):
+        return f"lazy({self.module!r}, {self.name!r})"
+
+
+def lazy(module: str, name: str) -> Lazy:
+    return Lazy(module, name)
+
+
+# ---------- budget check (CLI) ----------
+
+def _cold_import_ms(module: str, preload: Tuple[str, ...], repeat: int = 1) -> float:
+    """Best of ``repeat`` timings of ``import module`` in a fresh interpreter
+    after ``preload``."""
+    code = "".join(f"import {m};" for m in preload) + (
+        f"import time;t=time.perf_counter();import {module};"
+        "print((time.perf_counter()-t)*1000)"
+    )
+    best = float("inf")
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=_ROOT, check=True,
+                             capture_output=True, text=True)
+        best = min(best, float(out.stdout.split()[-1]))
+    return best
+
+
+def check_budget(repeat: int = 3) -> List[Tuple[str, str, float]]:
+    """(where, module, ms) for the bootstrap and each lazily loaded module.
+
+    ``where`` is the route (or ``streamlit_app`` attribute) that loads it;
+    ``ms`` is the best of ``repeat`` cold imports.
+    """
+    sys.path.insert(0, str(_ROOT))
+    import streamlit_app
+
+    handlers = [(name, v) for name, v in vars(streamlit_app).items() if isinstance(v, Lazy)]
+    handlers += list(streamlit_app.ROUTES.items())
+    rows = [("(bootstrap)", "streamlit_app", _cold_import_ms("streamlit_app", ("streamlit",), repeat))]
+    cold: Dict[str, float] = {}
+    for where, handler in handlers:
+        if isinstance(handler, Lazy):
+            if handler.module not in cold:
+                cold[handler.module] = _cold_import_ms(handler.module, ("streamlit", "streamlit_app"), repeat)
+            rows.append((where, handler.module, cold[handler.module]))
+    return rows
+
+
+def main() -> int:
+    over = 0
+    for route, module, ms in check_budget():
+        flag = "OVER" if ms > IMPORT_BUDGET_MS else "ok"
+        over += flag == "OVER"
+        print(f"{route:<24} {module:<20} {ms:7.1f} ms  {flag}")
+    print(f"budget {IMPORT_BUDGET_MS:.0f} ms per first import; {over} over")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    # run as common.routes, so ``Lazy`` is the class streamlit_app used
+    from common.routes import main as _main
+    sys.exit(_main())
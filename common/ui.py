@@ -5,10 +5,14 @@ It also offers helpers for generating stable keys for widgets so that
 state can be reliably stored between reruns.
 """
 
+import functools
 import hashlib
-from typing import Iterable
+from typing import Callable, Iterable, Optional
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from common.perf import timed
 
 # ------------------------------
 # Central rerun + navigation
@@ -32,6 +36,12 @@ def set_go(go=None):
     If ``go`` is ``None`` a default implementation is created which sets the
     ``route`` entry in ``session_state`` and triggers a rerun.  The function
     stored in ``session_state['_go']`` is returned.
+
+    Prefer ``st.button(..., on_click=go, args=(route,))``: the route is set
+    before the rerun the click causes anyway, so navigating costs one run.
+    Calling ``go`` after ``if st.button(...)`` costs two.  From a callback the
+    rerun also widens a fragment's click to a full run; that needs Streamlit
+    1.65+ (older versions ignore ``st.rerun()`` in callbacks).
     """
     if go is None:
         def go(route: str):
@@ -48,6 +58,53 @@ def get_go():
         return set_go()
     return st.session_state["_go"]
 
+# ------------------------------
+# Fragments (partial reruns)
+# ------------------------------
+
+def fragment(fn: Optional[Callable] = None, *, watch: Optional[Callable] = None,
+             run_every: Optional[float] = None):
+    """
+    Decorator: run ``fn`` as an ``st.fragment`` so its widgets rerun only ``fn``.
+
+    A fragment rerun skips the bootstrap and the rest of the page, so it must
+    not be used once something *outside* the fragment changed: the route (a
+    callback called ``go``) or the value of ``watch()`` (e.g. the current FP
+    dotpoint).  The wrapper compares both against the values at the last
+    full run and escalates to an app rerun when they moved.
+
+    ``run_every`` (seconds) also reruns the fragment on a timer, as for
+    ``st.fragment``.
+    """
+    def wrap(fn):
+        def state():
+            return st.session_state.get("route"), (watch() if watch else None)
+
+        def body(expected, args, kwargs):
+            with timed(f"fragment:{fn.__name__}"):
+                if state() != expected:
+                    st.rerun()
+                fn(*args, **kwargs)
+        body.__module__, body.__qualname__ = fn.__module__, fn.__qualname__
+        frag = st.fragment(body, run_every=run_every)
+
+        @functools.wraps(fn)
+        def call(*args, **kwargs):
+            frag(state(), args, kwargs)
+        return call
+
+    return wrap(fn) if fn is not None else wrap
+
+def rerun_fragment():
+    """
+    Rerun just the enclosing fragment when this is a fragment rerun; during a
+    full run (where Streamlit rejects fragment scope) rerun the app.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is not None and getattr(ctx, "fragment_ids_this_run", None):
+        st.rerun(scope="fragment")
+    st.rerun()
+
 # ------------------------------
 # UI helpers
 # ------------------------------
@@ -57,8 +114,7 @@ def topbar(title: str, back_to: str = None):
     c1, c2 = st.columns([1, 6], vertical_alignment="center")
     with c1:
         if back_to:
-            if st.button("⬅ Back", key=f"back_{title}"):
-                st.session_state["_go"](back_to)
+            st.button("⬅ Back", key=f"back_{title}", on_click=get_go(), args=(back_to,))
     with c2:
         st.title(title)
 
@@ -24,6 +24,6 @@ def page_cram_how():
         st.caption("These can flow into your tutor screens as initial weaknesses/strengths.")
     mid = st.columns([1,1,1])[1]
     with mid:
-        if st.button("Proceed", type="primary", use_container_width=True):
-            st.session_state["prioritization_mode"] = mode.startswith("Prioritization")
-            go("home")
+        st.button("Proceed", type="primary", use_container_width=True,
+                  on_click=lambda: st.session_state.update(
+                      {"prioritization_mode": mode.startswith("Prioritization")}) or go("home"))
@@ -1,19 +1,16 @@
-import json, os
+import json, os, threading, time, weakref
+from array import array
 import streamlit as st
-from typing import Dict, Tuple, List
+from typing import Dict, Optional, Tuple, List
 
-@st.cache_data(show_spinner=False)
-def load_syllabus() -> Dict:
-    """
-    Loads syllabus.json if present, else returns fallback.
-    Structure: {Subject: {Module: {IQ: [dotpoints...]}}}
-    """
-    # look in repo root (one level up from this file's folder)
-    here = os.path.dirname(__file__)
-    path = os.path.join(os.path.dirname(here), "syllabus.json")
-    if os.path.exists(path):
-        with open(path, "r") as f:
-            return json.load(f)
+from data.index import SyllabusIndex
+from data.shards import ShardedSyllabus
+from data.snapshot import publish, read_snapshot
+
+# look in repo root (one level up from this file's folder)
+SYLLABUS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "syllabus.json")
+
+def _fallback_syllabus() -> Dict:
     # Fallback (from your monolith)
     return {
         "Biology": {
@@ -38,27 +35,193 @@ def load_syllabus() -> Dict:
         }
     }
 
-def explode_syllabus(data: Dict) -> Tuple[List[str], Dict, Dict, Dict]:
-    subjects = list(data.keys())
-    modules_by_subject = {s: list(data[s].keys()) for s in subjects}
-    iqs_by_subject_module = {}
-    dps_by_smi = {}
-    for s in subjects:
-        for m in data[s]:
-            iqs = list(data[s][m].keys())
-            iqs_by_subject_module[(s, m)] = iqs
-            for iq in iqs:
-                dps_by_smi[(s, m, iq)] = list(data[s][m][iq])
-    return subjects, modules_by_subject, iqs_by_subject_module, dps_by_smi
-
-def ensure_core_state():
-    st.session_state.setdefault("sel_dotpoints", set())  # {(s,m,iq,dp)}
-    st.session_state.setdefault("focus_subject", None)
-    st.session_state.setdefault("focus_module", None)    # (s,m)
-    st.session_state.setdefault("focus_iq", None)        # (s,m,iq)
-    st.session_state.setdefault("cram_mode", False)
-    st.session_state.setdefault("prioritization_mode", False)
-    st.session_state.setdefault("ai_weakness_text", "")
-    st.session_state.setdefault("ai_strength_text", "")
-    st.session_state.setdefault("ai_suggested", [])
-    st.session_state.setdefault("ai_chosen", set())
+def _read_json(path: str) -> Optional[Dict]:
+    if os.path.exists(path):
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except Exception:
+            pass
+    return None
+
+def load_syllabus(path: str = SYLLABUS_PATH) -> Dict:
+    """
+    Loads syllabus.json if present (and parseable), else returns fallback.
+    Structure: {Subject: {Module: {IQ: [dotpoints...]}}}
+    """
+    data = _read_json(path)
+    return data if data is not None else _fallback_syllabus()
+
+def load_full_syllabus(path: str = SYLLABUS_PATH) -> Dict:
+    """Whole syllabus tree: every shard when ``path`` is sharded, else the file."""
+    shard_dir = os.path.splitext(path)[0]
+    if ShardedSyllabus.exists(shard_dir):
+        shards = ShardedSyllabus(shard_dir)
+        for subject in shards.subjects():
+            shards.load(subject)
+        return shards.tree()
+    return load_syllabus(path)
+
+def compile_syllabus(path: str = SYLLABUS_PATH) -> SyllabusIndex:
+    """
+    Compiled index for ``path``: map the binary snapshot next to it when that
+    is current, else parse the JSON, compile, and publish a fresh snapshot.
+    """
+    idx = read_snapshot(path)
+    if idx is None:
+        data = _read_json(path)
+        if data is None:
+            return SyllabusIndex.from_tree(_fallback_syllabus())
+        idx = SyllabusIndex.from_tree(data)
+        # prefer the mapped copy: shared with every other worker on the host
+        idx = publish(idx, path) or idx
+    return idx
+
+def _source_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of the syllabus file, or None when it is missing."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return info.st_mtime_ns, info.st_size
+
+class SyllabusStore:
+    """
+    Process-wide holder of the current compiled syllabus.
+
+    The source is either ``syllabus.json`` or, when ``syllabus/manifest.json``
+    exists, a directory of lazily loaded per-subject shards (see
+    ``data.shards``).  A monolithic source is served from the memory-mapped
+    snapshot (``data.snapshot``), so every worker process on the host shares
+    one copy of the ID arrays and dotpoint text (each process still decodes
+    the small subject/module/IQ tables once).  ``current()`` polls the source signature (at most
+    every ``poll_seconds``) and, when it changed, maps a snapshot already
+    republished for the new source or recompiles incrementally from the
+    previous index (unchanged modules are reused).  Every version records an
+    old -> new dotpoint ID remap, so live sessions can carry their selections
+    and FP queues across a hot reload (or a shard load) via ``remap()``.
+    """
+
+    def __init__(self, path: str, poll_seconds: float = 1.0):
+        self.path = path
+        self.poll_seconds = poll_seconds
+        self._lock = threading.Lock()
+        shard_dir = os.path.splitext(path)[0]
+        self.shards = None
+        if ShardedSyllabus.exists(shard_dir):
+            try:
+                self.shards = ShardedSyllabus(shard_dir)
+            except (OSError, ValueError, KeyError):
+                pass  # unreadable manifest: fall back to the monolithic file
+        self._signature = self._source_signature()
+        if self.shards is not None:
+            self._idx = SyllabusIndex.from_tree(self.shards.tree()).warm()
+        else:
+            self._idx = compile_syllabus(path).warm()
+        self._checked = time.monotonic()
+        # old index -> (next index, remap); entries go away with the last
+        # session still holding the old index
+        self._next: "weakref.WeakKeyDictionary[SyllabusIndex, Tuple[SyllabusIndex, array]]" = weakref.WeakKeyDictionary()
+
+    def _source_signature(self):
+        if self.shards is not None:
+            return self.shards.signature()
+        return _source_signature(self.path)
+
+    def current(self) -> SyllabusIndex:
+        now = time.monotonic()
+        if now - self._checked >= self.poll_seconds:
+            self._checked = now
+            signature = self._source_signature()
+            if signature != self._signature:
+                with self._lock:
+                    if signature != self._signature:
+                        self._reload(signature)
+        return self._idx
+
+    def load_subjects(self, subjects: List[str]) -> SyllabusIndex:
+        """Make sure these subjects' shards are loaded (no-op for a monolithic file)."""
+        if self.shards is None or all(self.shards.is_loaded(s) for s in subjects):
+            return self._idx
+        with self._lock:
+            changed = False
+            for subject in subjects:
+                try:
+                    changed = self.shards.load(subject) or changed
+                except (OSError, ValueError):
+                    pass
+            if changed:
+                self._signature = self.shards.signature()
+                self._apply(self.shards.tree())
+        return self._idx
+
+    def _reload(self, signature):
+        # A half-written or broken file keeps the current index; the next save
+        # changes the signature again and retries.
+        self._signature = signature
+        if self.shards is not None:
+            try:
+                self.shards.refresh()
+            except (OSError, ValueError, KeyError):
+                return
+            self._signature = self.shards.signature()
+            data = self.shards.tree()
+        else:
+            # another worker (or the publish CLI) may already have written the
+            # snapshot for the new source: map it instead of re-parsing
+            mapped = read_snapshot(self.path)
+            if mapped is not None:
+                self._swap(mapped, self._idx.remap_to(mapped))
+                return
+            data = _read_json(self.path)
+        if data is not None:
+            self._apply(data)
+
+    def _apply(self, data: Dict):
+        new, remap = self._idx.recompile(data)
+        if self.shards is None and new.fingerprint != self._idx.fingerprint:
+            new = publish(new, self.path) or new
+        self._swap(new, remap)
+
+    def _swap(self, new: SyllabusIndex, remap: array):
+        old = self._idx
+        if new.fingerprint == old.fingerprint:
+            return
+        self._next[old] = (new.warm(), remap)
+        self._idx = new
+
+    def remap(self, old: SyllabusIndex, new: SyllabusIndex) -> Optional[array]:
+        """Composite old -> new dotpoint ID remap, or None if not on record."""
+        out = None
+        cur = old
+        while cur is not new:
+            step = self._next.get(cur)
+            if step is None:
+                return None
+            cur, m = step
+            out = m if out is None else array("i", (m[x] if x >= 0 else -1 for x in out))
+        return out
+
+# cache_resource (not cache_data): every session gets the *same* store (and
+# index) back, with no per-call unpickling.
+@st.cache_resource(show_spinner=False)
+def _store(path: str) -> SyllabusStore:
+    return SyllabusStore(path)
+
+def get_index(path: str = SYLLABUS_PATH) -> SyllabusIndex:
+    """Process-wide, read-only compiled syllabus shared by all sessions."""
+    return _store(path).current()
+
+def load_subject(subject: str, path: str = SYLLABUS_PATH) -> SyllabusIndex:
+    """Load a lazily sharded subject on first open; returns the current index."""
+    return _store(path).load_subjects([subject])
+
+def load_all_subjects(path: str = SYLLABUS_PATH) -> SyllabusIndex:
+    """Load every shard (for whole-syllabus features such as search)."""
+    store = _store(path)
+    idx = store.current()
+    return store.load_subjects(list(idx.subjects))
+
+def remap_between(old: SyllabusIndex, new: SyllabusIndex, path: str = SYLLABUS_PATH) -> Optional[array]:
+    """Dotpoint ID remap for a session still holding ``old`` (None if unknown)."""
+    return _store(path).remap(old, new)
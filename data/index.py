@@ -0,0 +1,344 @@
+"""Compiled, integer-addressed view of the syllabus tree.
+
+The raw tree is nested dicts keyed by full strings, so every page used to
+walk it with nested loops.  ``SyllabusIndex`` compiles the same
+``{Subject: {Module: {IQ: [dotpoints]}}}`` tree once into:
+
+* interned string tables, one per level (subjects, modules, IQs, dotpoints);
+* a dense integer ID per node, assigned in document order;
+* CSR-style offset arrays, so the children of node ``i`` are the IDs
+  ``off[i]:off[i + 1]`` of the next level down.
+
+Because IDs follow document order, every subtree owns a contiguous range of
+dotpoint IDs: fanning a subject, module or IQ out to its dotpoints is a
+``range`` rather than a walk.  Name lookups walk down the same ranges (a
+module is searched among its subject's modules, a dotpoint among its IQ's),
+so the index keeps no per-dotpoint dictionary.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from array import array
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+Item = Tuple[str, str, str, str]  # (subject, module, iq, dotpoint)
+
+
+def _offsets(counts: Iterable[int]) -> array:
+    off = array("I", [0])
+    total = 0
+    for n in counts:
+        total += n
+        off.append(total)
+    return off
+
+
+def _parents(off: Sequence[int]) -> memoryview:
+    """Invert an offset array into a child -> parent ID array."""
+    out = array("I")
+    for parent in range(len(off) - 1):
+        out.extend([parent] * (off[parent + 1] - off[parent]))
+    return _readonly(out)
+
+
+def _readonly(a: array) -> memoryview:
+    return memoryview(a).toreadonly()
+
+
+def _find(table: Sequence[str], value: str, ids: range) -> int:
+    """ID of ``value`` among ``table[ids]``, or -1."""
+    try:
+        return table.index(value, ids.start, ids.stop)
+    except ValueError:
+        return -1
+
+
+class SyllabusIndex:
+    """Read-only compiled syllabus.
+
+    ``subjects``, ``modules``, ``iqs`` and ``dotpoints`` are the string tables
+    (indexed by ID).  ``subj_mod``, ``mod_iq`` and ``iq_dp`` are the offset
+    arrays linking each level to the next.
+
+    Instances are frozen (tuples and read-only memoryviews, no attribute
+    assignment after construction) so one copy can be shared by every session
+    in the process.
+    """
+
+    def __init__(
+        self,
+        subjects: Sequence[str],
+        modules: Sequence[str],
+        iqs: Sequence[str],
+        dotpoints: Sequence[str],
+        subj_mod: Sequence[int],
+        mod_iq: Sequence[int],
+        iq_dp: Sequence[int],
+        parents: Optional[Tuple[Sequence[int], Sequence[int], Sequence[int]]] = None,
+    ):
+        fields = dict(
+            subjects=subjects, modules=modules, iqs=iqs, dotpoints=dotpoints,
+            subj_mod=subj_mod, mod_iq=mod_iq, iq_dp=iq_dp,
+        )
+        if parents is not None:
+            # precomputed (mod_subj, iq_mod, dp_iq), e.g. from a snapshot
+            fields.update(zip(("mod_subj", "iq_mod", "dp_iq"), parents))
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def warm(self) -> "SyllabusIndex":
+        """Build the lazy tables up front (before sharing the index)."""
+        self.mod_subj, self.iq_mod, self.dp_iq, self.items
+        return self
+
+    # ---------- construction ----------
+
+    @classmethod
+    def from_tree(cls, data: Dict) -> "SyllabusIndex":
+        """Compile a ``{Subject: {Module: {IQ: [dotpoints]}}}`` dict."""
+        intern = sys.intern
+        subjects: List[str] = []
+        modules: List[str] = []
+        iqs: List[str] = []
+        dotpoints: List[str] = []
+        mods_per_subject: List[int] = []
+        iqs_per_module: List[int] = []
+        dps_per_iq: List[int] = []
+
+        for s, mods in data.items():
+            subjects.append(intern(str(s)))
+            mods_per_subject.append(len(mods))
+            for m, iq_map in mods.items():
+                modules.append(intern(str(m)))
+                iqs_per_module.append(len(iq_map))
+                for iq, dps in iq_map.items():
+                    iqs.append(intern(str(iq)))
+                    dps = list(dps)
+                    dps_per_iq.append(len(dps))
+                    dotpoints.extend(intern(str(dp)) for dp in dps)
+
+        return cls(
+            tuple(subjects), tuple(modules), tuple(iqs), tuple(dotpoints),
+            _readonly(_offsets(mods_per_subject)),
+            _readonly(_offsets(iqs_per_module)),
+            _readonly(_offsets(dps_per_iq)),
+        )
+
+    def recompile(self, data: Dict) -> Tuple["SyllabusIndex", array]:
+        """Compile an edited tree, reusing every module that did not change.
+
+        Returns ``(new_index, remap)`` where ``remap[old_id]`` is the new ID of
+        each of this index's dotpoints, or -1 if it no longer exists.  Unchanged
+        modules keep their interned strings and item tuples and are remapped by
+        a range shift; only changed modules are re-interned and matched by item.
+        """
+        intern = sys.intern
+        subjects: List[str] = []
+        modules: List[str] = []
+        iqs: List[str] = []
+        dotpoints: List[str] = []
+        items: List[Item] = []
+        mods_per_subject: List[int] = []
+        iqs_per_module: List[int] = []
+        dps_per_iq: List[int] = []
+        remap = array("i", [-1]) * self.n_dotpoints
+
+        for s, mods in data.items():
+            s = intern(str(s))
+            subjects.append(s)
+            mods_per_subject.append(len(mods))
+            for m, iq_map in mods.items():
+                m = intern(str(m))
+                modules.append(m)
+                iqs_per_module.append(len(iq_map))
+                mid = self.module_id(s, m)
+                if mid >= 0 and self._module_matches(mid, iq_map):
+                    qs, ds = self.iqs_of(mid), self.module_dps(mid)
+                    iqs.extend(self.iqs[qs.start:qs.stop])
+                    dps_per_iq.extend(self.iq_dp[q + 1] - self.iq_dp[q] for q in qs)
+                    new_lo = len(dotpoints)
+                    dotpoints.extend(self.dotpoints[ds.start:ds.stop])
+                    items.extend(self.items[ds.start:ds.stop])
+                    remap[ds.start:ds.stop] = array("i", range(new_lo, new_lo + len(ds)))
+                    continue
+                for iq, dps in iq_map.items():
+                    iq = intern(str(iq))
+                    iqs.append(iq)
+                    dps = [intern(str(dp)) for dp in dps]
+                    dps_per_iq.append(len(dps))
+                    for dp in dps:
+                        item = (s, m, iq, dp)
+                        old = self.dotpoint_id(item)
+                        if old >= 0:
+                            remap[old] = len(dotpoints)
+                        dotpoints.append(dp)
+                        items.append(item)
+
+        new = type(self)(
+            tuple(subjects), tuple(modules), tuple(iqs), tuple(dotpoints),
+            _readonly(_offsets(mods_per_subject)),
+            _readonly(_offsets(iqs_per_module)),
+            _readonly(_offsets(dps_per_iq)),
+        )
+        new.__dict__["items"] = tuple(items)
+        return new, remap
+
+    def remap_to(self, new: "SyllabusIndex") -> array:
+        """``remap[old_id]`` = ID of the same item in ``new`` (-1 if gone).
+
+        For an index that was not derived by ``recompile`` (e.g. a snapshot
+        republished by another process).
+        """
+        return array("i", (new.dotpoint_id(it) for it in self.items))
+
+    def _module_matches(self, mid: int, iq_map: Dict) -> bool:
+        qs = self.iqs_of(mid)
+        if len(qs) != len(iq_map):
+            return False
+        for q, (iq, dps) in zip(qs, iq_map.items()):
+            if self.iqs[q] != iq:
+                return False
+            d = self.dps_of(q)
+            if tuple(dps) != self.dotpoints[d.start:d.stop]:
+                return False
+        return True
+
+    # ---------- sizes ----------
+
+    @property
+    def n_subjects(self) -> int:
+        return len(self.subj_mod) - 1
+
+    @property
+    def n_modules(self) -> int:
+        return len(self.mod_iq) - 1
+
+    @property
+    def n_iqs(self) -> int:
+        return len(self.iq_dp) - 1
+
+    @property
+    def n_dotpoints(self) -> int:
+        return self.iq_dp[-1]
+
+    def __len__(self) -> int:
+        return self.n_dotpoints
+
+    # ---------- parents (child ID -> parent ID) ----------
+
+    @cached_property
+    def mod_subj(self) -> memoryview:
+        return _parents(self.subj_mod)
+
+    @cached_property
+    def iq_mod(self) -> memoryview:
+        return _parents(self.mod_iq)
+
+    @cached_property
+    def dp_iq(self) -> memoryview:
+        return _parents(self.iq_dp)
+
+    # ---------- fan-out as ranges ----------
+
+    def modules_of(self, sid: int) -> range:
+        return range(self.subj_mod[sid], self.subj_mod[sid + 1])
+
+    def iqs_of(self, mid: int) -> range:
+        return range(self.mod_iq[mid], self.mod_iq[mid + 1])
+
+    def dps_of(self, qid: int) -> range:
+        return range(self.iq_dp[qid], self.iq_dp[qid + 1])
+
+    def module_dps(self, mid: int) -> range:
+        return range(self.iq_dp[self.mod_iq[mid]], self.iq_dp[self.mod_iq[mid + 1]])
+
+    def subject_dps(self, sid: int) -> range:
+        lo = self.mod_iq[self.subj_mod[sid]]
+        hi = self.mod_iq[self.subj_mod[sid + 1]]
+        return range(self.iq_dp[lo], self.iq_dp[hi])
+
+    # ---------- name -> ID lookups (down the ID ranges) ----------
+
+    def subject_id(self, subject: str) -> int:
+        """Return the subject's ID, or -1 if unknown."""
+        return _find(self.subjects, subject, range(self.n_subjects))
+
+    def module_id(self, subject: str, module: str) -> int:
+        sid = self.subject_id(subject)
+        return -1 if sid < 0 else _find(self.modules, module, self.modules_of(sid))
+
+    def iq_id(self, subject: str, module: str, iq: str) -> int:
+        mid = self.module_id(subject, module)
+        return -1 if mid < 0 else _find(self.iqs, iq, self.iqs_of(mid))
+
+    def dotpoint_id(self, item: Item) -> int:
+        """Return the ID of a ``(subject, module, iq, dotpoint)`` tuple, or -1."""
+        try:
+            s, m, iq, dp = item
+        except (TypeError, ValueError):
+            return -1
+        qid = self.iq_id(s, m, iq)
+        return -1 if qid < 0 else _find(self.dotpoints, dp, self.dps_of(qid))
+
+    def __contains__(self, item) -> bool:
+        return self.dotpoint_id(item) >= 0
+
+    # ---------- ID -> item ----------
+
+    @cached_property
+    def items(self) -> Tuple[Item, ...]:
+        """One shared ``(subject, module, iq, dotpoint)`` tuple per dotpoint ID."""
+        subj, mods, iqs, dps = self.subjects, self.modules, self.iqs, self.dotpoints
+        mod_subj, iq_mod = self.mod_subj, self.iq_mod
+        out: List[Item] = []
+        for q in range(self.n_iqs):
+            m = iq_mod[q]
+            s = mod_subj[m]
+            head = (subj[s], mods[m], iqs[q])
+            out.extend(head + (dps[d],) for d in self.dps_of(q))
+        return tuple(out)
+
+    def item(self, did: int) -> Item:
+        return self.items[did]
+
+    # ---------- name-based views (drop-in for the old fan-out dicts) ----------
+
+    def modules_for(self, subject: str) -> List[str]:
+        sid = self.subject_id(subject)
+        return [] if sid < 0 else [self.modules[m] for m in self.modules_of(sid)]
+
+    def iqs_for(self, subject: str, module: str) -> List[str]:
+        mid = self.module_id(subject, module)
+        return [] if mid < 0 else [self.iqs[q] for q in self.iqs_of(mid)]
+
+    def dotpoints_for(self, subject: str, module: str, iq: str) -> List[str]:
+        qid = self.iq_id(subject, module, iq)
+        return [] if qid < 0 else [self.dotpoints[d] for d in self.dps_of(qid)]
+
+    def to_tree(self) -> Dict:
+        """Rebuild the nested dict this index was compiled from."""
+        tree: Dict = {}
+        for s in range(self.n_subjects):
+            mods = tree[self.subjects[s]] = {}
+            for m in self.modules_of(s):
+                iq_map = mods[self.modules[m]] = {}
+                for q in self.iqs_of(m):
+                    iq_map[self.iqs[q]] = [self.dotpoints[d] for d in self.dps_of(q)]
+        return tree
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Short digest of the compiled structure, for keying derived caches."""
+        h = hashlib.sha256()
+        for table in (self.subjects, self.modules, self.iqs, self.dotpoints):
+            h.update("\x1f".join(table).encode("utf-8"))
+            h.update(b"\x1e")
+        for off in (self.subj_mod, self.mod_iq, self.iq_dp):
+            h.update(array("I", off).tobytes())
+        return h.hexdigest()[:16]
@@ -0,0 +1,217 @@
+"""Precomputed related-dotpoint (k-nearest-neighbour) graph.
+
+Every dotpoint becomes a hashed feature vector: stemmed word tokens plus
+character trigrams, hashed into ``DIM`` buckets with a stable (CRC32) signed
+hash, sublinear TF, L2-normalised.  Cosine similarity is then a dot product,
+computed in blocks of ``CHUNK`` x ``CHUNK`` rows with NumPy while a running
+top-k per row is kept, so neither the vector matrix (a disk-backed memmap
+while building) nor the similarity matrix has to fit in memory at once.
+
+The result is two small arrays, ``neighbors`` (int32, N x K) and ``sims``
+(float16, N x K), saved as ``syllabus.knn.npz`` next to the syllabus with
+each row's ``item_key``.  The graph is built offline, from the whole
+syllabus (every shard), when the syllabus is published::
+
+    python -m data.related [syllabus.json]
+
+The app only loads it (once per file version), and shows no related
+dotpoints while there is none; it never builds one on a request.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import weakref
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import streamlit as st
+
+from data.index import SyllabusIndex
+from data.text import char_ngrams, stem, tokenize
+
+DIM = 1024
+K = 8
+CHUNK = 2048
+MIN_SIM = 0.15
+FEATURES = 2  # bump when _features (or the stemmer) changes: older graphs are ignored
+
+
+def _features(text: str) -> List[str]:
+    feats = []
+    for tok in tokenize(text):
+        feats.append("w:" + stem(tok))
+        feats.extend("c:" + g for g in char_ngrams(f" {tok} "))
+    return feats
+
+
+def _vector(text: str, dim: int) -> np.ndarray:
+    v = np.zeros(dim, dtype=np.float32)
+    counts = {}
+    for f in _features(text):
+        counts[f] = counts.get(f, 0) + 1
+    for f, c in counts.items():
+        h = zlib.crc32(f.encode("utf-8"))
+        v[h % dim] += (1.0 if (h >> 31) & 1 else -1.0) * (1.0 + np.log(c))
+    n = np.linalg.norm(v)
+    return v / n if n else v
+
+
+def build_graph(idx: SyllabusIndex, k: int = K, dim: int = DIM,
+                chunk: int = CHUNK) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(neighbors, sims)`` for every dotpoint, most similar first."""
+    n = idx.n_dotpoints
+    k = min(k, max(n - 1, 0))
+    neighbors = np.full((n, k), -1, dtype=np.int32)
+    sims = np.zeros((n, k), dtype=np.float16)
+    if k == 0:
+        return neighbors, sims
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vecs = np.lib.format.open_memmap(os.path.join(tmp, "vecs.npy"), mode="w+",
+                                         dtype=np.float32, shape=(n, dim))
+        for lo in range(0, n, chunk):
+            hi = min(lo + chunk, n)
+            vecs[lo:hi] = np.stack([_vector(idx.dotpoints[d], dim) for d in range(lo, hi)])
+        vecs.flush()
+
+        for qlo in range(0, n, chunk):
+            qhi = min(qlo + chunk, n)
+            q = np.asarray(vecs[qlo:qhi])
+            best_s = np.full((qhi - qlo, k), -np.inf, dtype=np.float32)
+            best_i = np.full((qhi - qlo, k), -1, dtype=np.int64)
+            for clo in range(0, n, chunk):
+                chi = min(clo + chunk, n)
+                s = q @ np.asarray(vecs[clo:chi]).T
+                if clo < qhi and qlo < chi:  # block overlaps the diagonal
+                    rows = np.arange(max(qlo, clo), min(qhi, chi))
+                    s[rows - qlo, rows - clo] = -np.inf
+                ids = np.broadcast_to(np.arange(clo, chi), s.shape)
+                all_s = np.concatenate([best_s, s], axis=1)
+                all_i = np.concatenate([best_i, ids], axis=1)
+                top = np.argpartition(-all_s, k - 1, axis=1)[:, :k]
+                best_s = np.take_along_axis(all_s, top, axis=1)
+                best_i = np.take_along_axis(all_i, top, axis=1)
+            order = np.argsort(-best_s, axis=1, kind="stable")
+            neighbors[qlo:qhi] = np.take_along_axis(best_i, order, axis=1)
+            sims[qlo:qhi] = np.take_along_axis(best_s, order, axis=1)
+        del vecs
+    return neighbors, sims
+
+
+def item_key(item: Sequence[str]) -> int:
+    """Stable 64-bit key of a ``(subject, module, iq, dotpoint)`` tuple."""
+    digest = hashlib.blake2b("\x1f".join(item).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+class RelatedGraph:
+    """The kNN graph of the full syllabus, looked up from any (partial) index.
+
+    Graph rows are dotpoints of the syllabus it was built from, identified by
+    ``item_key``; a session index (which may hold only the subjects opened so
+    far) is mapped onto them by key, once per index.
+    """
+
+    def __init__(self, neighbors: np.ndarray, sims: np.ndarray, keys: np.ndarray):
+        self.neighbors = neighbors
+        self.sims = sims
+        self.keys = keys
+        self._rows = {k: i for i, k in enumerate(keys.tolist())}
+        self._local: "weakref.WeakKeyDictionary[SyllabusIndex, Dict[int, int]]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _local_ids(self, idx: SyllabusIndex) -> Dict[int, int]:
+        with self._lock:
+            ids = self._local.get(idx)
+            if ids is None:
+                ids = self._local[idx] = {item_key(it): d for d, it in enumerate(idx.items)}
+            return ids
+
+    def related(self, idx: SyllabusIndex, did: int, n: int = 5,
+                min_sim: float = MIN_SIM) -> List[Tuple[int, float]]:
+        """Up to ``n`` (dotpoint ID in ``idx``, cosine) pairs most similar to ``did``.
+
+        Neighbours that ``idx`` does not hold (unloaded subjects, or dotpoints
+        gone since the graph was built) are skipped.
+        """
+        if did < 0 or did >= idx.n_dotpoints:
+            return []
+        row = self._rows.get(item_key(idx.items[did]))
+        if row is None:
+            return []
+        local = self._local_ids(idx)
+        out = []
+        for j, s in zip(self.neighbors[row].tolist(), self.sims[row].tolist()):
+            if j < 0 or s < min_sim:
+                break
+            d = local.get(int(self.keys[j]))
+            if d is not None:
+                out.append((d, s))
+                if len(out) == n:
+                    break
+        return out
+
+
+def graph_path(source_path: str) -> str:
+    return os.path.splitext(source_path)[0] + ".knn.npz"
+
+
+def save_graph(path: str, idx: SyllabusIndex, neighbors: np.ndarray, sims: np.ndarray) -> bool:
+    keys = np.fromiter((item_key(it) for it in idx.items), dtype=np.int64, count=idx.n_dotpoints)
+    tmp = f"{path}.{os.getpid()}.tmp.npz"
+    try:
+        np.savez(tmp, neighbors=neighbors, sims=sims, keys=keys,
+                 fingerprint=np.array(idx.fingerprint), features=np.array(FEATURES))
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        return False
+
+
+def load_graph(path: str) -> Optional[RelatedGraph]:
+    """Load a saved graph, or None if it is missing or from older features."""
+    try:
+        with np.load(path) as z:
+            if "features" not in z.files or int(z["features"]) != FEATURES:
+                return None
+            return RelatedGraph(z["neighbors"], z["sims"], z["keys"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return info.st_mtime_ns, info.st_size
+
+
+# One graph per file version, loaded once per process; never built here.
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _graph(path: str, signature: Optional[Tuple[int, int]]) -> Optional[RelatedGraph]:
+    return None if signature is None else load_graph(path)
+
+
+def get_related_graph(source_path: Optional[str] = None) -> Optional[RelatedGraph]:
+    """The offline-built graph for the syllabus, or None until one is built."""
+    from data.data import SYLLABUS_PATH
+    path = graph_path(source_path or SYLLABUS_PATH)
+    return _graph(path, _file_signature(path))
+
+
+if __name__ == "__main__":
+    from data.data import SYLLABUS_PATH, load_full_syllabus
+
+    src = sys.argv[1] if len(sys.argv) > 1 else SYLLABUS_PATH
+    idx = SyllabusIndex.from_tree(load_full_syllabus(src))
+    neighbors, sims = build_graph(idx)
+    if not save_graph(graph_path(src), idx, neighbors, sims):
+        sys.exit(f"could not write {graph_path(src)}")
+    print(f"{graph_path(src)}: {idx.n_dotpoints} dotpoints x {neighbors.shape[1]} neighbours")
@@ -0,0 +1,156 @@
+"""Sharded syllabus: a directory of per-subject (or per-module) JSON files.
+
+Layout (``syllabus/`` next to ``syllabus.json``)::
+
+    syllabus/manifest.json
+        {"subjects": [
+            {"name": "Biology",   "file": "biology.json"},
+            {"name": "Chemistry", "modules": [
+                {"name": "Module 5: Equilibrium", "file": "chemistry/module-5.json"}
+            ]}
+        ]}
+    syllabus/biology.json              {Module: {IQ: [dotpoints...]}}
+    syllabus/chemistry/module-5.json   {IQ: [dotpoints...]}
+
+Only the manifest is read at startup, so subject names are available
+immediately; a subject's modules, IQs and dotpoints are read the first time
+that subject is opened.  Split an existing monolithic file with::
+
+    python -m data.shards syllabus.json syllabus/
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+MANIFEST = "manifest.json"
+
+# (module name or None for a whole-subject file, path)
+_Shard = Tuple[Optional[str], str]
+
+
+def _signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return info.st_mtime_ns, info.st_size
+
+
+def _read(path: str):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+class ShardedSyllabus:
+    def __init__(self, root: str):
+        self.root = root
+        self.manifest_path = os.path.join(root, MANIFEST)
+        self._shards: Dict[str, List[_Shard]] = {}
+        self._loaded: Dict[str, Dict] = {}
+        self._loaded_sigs: Dict[str, Tuple] = {}
+        self._manifest_sig = None
+        self._read_manifest()
+
+    @staticmethod
+    def exists(root: str) -> bool:
+        return os.path.isfile(os.path.join(root, MANIFEST))
+
+    def _read_manifest(self):
+        self._manifest_sig = _signature(self.manifest_path)
+        shards: Dict[str, List[_Shard]] = {}
+        for entry in _read(self.manifest_path).get("subjects", []):
+            name = str(entry["name"])
+            if "file" in entry:
+                shards[name] = [(None, os.path.join(self.root, entry["file"]))]
+            else:
+                shards[name] = [
+                    (str(m["name"]), os.path.join(self.root, m["file"]))
+                    for m in entry.get("modules", [])
+                ]
+        self._shards = shards
+
+    # ---------- queries ----------
+
+    def subjects(self) -> List[str]:
+        return list(self._shards)
+
+    def is_loaded(self, subject: str) -> bool:
+        return subject in self._loaded
+
+    def tree(self) -> Dict:
+        """Full tree with unloaded subjects present but empty."""
+        return {s: self._loaded.get(s, {}) for s in self._shards}
+
+    def signature(self) -> Tuple:
+        """Changes whenever the manifest or any *loaded* shard changes."""
+        # called unlocked (SyllabusStore.current polls it) while another thread
+        # may be loading a subject: iterate over snapshots, not the live dicts
+        sigs = [self._manifest_sig]
+        shards = self._shards
+        for s in tuple(self._loaded):
+            sigs.extend(_signature(p) for _, p in shards.get(s, []))
+        return tuple(sigs)
+
+    # ---------- loading ----------
+
+    def _load_subject(self, subject: str):
+        modules: Dict = {}
+        for module, path in self._shards[subject]:
+            data = _read(path)
+            if module is None:
+                modules.update(data)
+            else:
+                modules[module] = data
+        self._loaded[subject] = modules
+        self._loaded_sigs[subject] = tuple(_signature(p) for _, p in self._shards[subject])
+
+    def load(self, subject: str) -> bool:
+        """Load one subject's shard(s); True if the tree changed."""
+        if subject in self._loaded or subject not in self._shards:
+            return False
+        self._load_subject(subject)
+        return True
+
+    def refresh(self):
+        """Re-read the manifest and any loaded shard that changed on disk."""
+        if _signature(self.manifest_path) != self._manifest_sig:
+            self._read_manifest()
+        for s in list(self._loaded):
+            if s not in self._shards:
+                del self._loaded[s]
+                del self._loaded_sigs[s]
+            elif tuple(_signature(p) for _, p in self._shards[s]) != self._loaded_sigs[s]:
+                self._load_subject(s)
+
+
+# ---------- splitting a monolithic syllabus ----------
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "subject"
+
+
+def split_syllabus(data: Dict, root: str):
+    """Write ``data`` as one shard per subject plus a manifest under ``root``."""
+    os.makedirs(root, exist_ok=True)
+    entries, used = [], set()
+    for subject, modules in data.items():
+        fname = _slug(subject)
+        while fname in used:
+            fname += "-x"
+        used.add(fname)
+        with open(os.path.join(root, f"{fname}.json"), "w") as f:
+            json.dump(modules, f, indent=2, ensure_ascii=False)
+        entries.append({"name": subject, "file": f"{fname}.json"})
+    with open(os.path.join(root, MANIFEST), "w") as f:
+        json.dump({"subjects": entries}, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m data.shards SYLLABUS_JSON OUT_DIR")
+    split_syllabus(_read(sys.argv[1]), sys.argv[2])
@@ -0,0 +1,284 @@
+"""Binary on-disk snapshot of a compiled ``SyllabusIndex``.
+
+A cold process would otherwise ``json.load`` the syllabus and re-compile it.
+The snapshot (``syllabus.idx`` next to ``syllabus.json``) holds everything the
+index needs in one flat, 4-byte aligned file:
+
+* a fixed header: magic, format version, byte order, table sizes, the index
+  fingerprint, and the source file's ``(mtime_ns, size, sha256)``;
+* the CSR offset arrays and the child -> parent ID arrays (``uint32``);
+* per string table, a ``uint32`` array of byte offsets into its blob;
+* the four string blobs (UTF-8, each padded to 4 bytes).
+
+The file is opened with a read-only ``mmap`` rather than read: the arrays are
+``memoryview`` casts straight over the mapping, and so is the dotpoint table
+(``MappedStrings``), which is compared as UTF-8 bytes on lookup and decoded
+only when a dotpoint is read.  ``items`` is a view (``MappedItems``) that
+builds each tuple on access.  Every worker process on a host that maps the
+same snapshot therefore shares one physical copy of the arrays and the
+dotpoint text through the page cache, and a new worker starts without
+parsing anything.
+
+Python strings cannot live in the mapping, so what a process reads is its
+own: the subject, module and IQ tables (a small fraction of the text) are
+decoded and interned once per process when the snapshot is mapped, and a
+decoded dotpoint lives as long as its caller keeps it.
+
+Snapshots are published by writing a temp file and ``os.replace``-ing it over
+``syllabus.idx``.  Processes that already mapped the old file keep a valid
+mapping of the old inode until they drop that index; the next ``read_snapshot``
+maps the new one, so a republish swaps atomically per process.
+
+The snapshot is stale when the source signature no longer matches; if only
+the mtime moved but the content hash is unchanged, it is still used.  Rebuild
+(or republish) ahead of time with::
+
+    python -m data.snapshot [syllabus.json]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
+from data.index import Item, SyllabusIndex
+
+MAGIC = b"SYLIDX\x00\x01"
+FORMAT_VERSION = 2
+
+# magic, version, byteorder, n_subjects, n_modules, n_iqs, n_dotpoints,
+# index fingerprint, source mtime_ns, source size, source sha256
+_HEADER = struct.Struct("<8sIBxxxIIII16sqQ32s")
+
+
+def snapshot_path(source_path: str) -> str:
+    root, _ = os.path.splitext(source_path)
+    return root + ".idx"
+
+
+def _sha256(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def _u32(values) -> bytes:
+    a = array("I", values)
+    if a.itemsize != 4:
+        raise ValueError("uint32 array type unavailable")
+    return a.tobytes()
+
+
+def _pad4(blob: bytes) -> bytes:
+    return blob + b"\x00" * (-len(blob) % 4)
+
+
+class MappedStrings(Sequence[str]):
+    """Read-only string table decoded lazily from a mapped UTF-8 blob.
+
+    Behaves like the tuple ``SyllabusIndex`` normally holds: integer indexing
+    returns ``str`` and slicing returns a ``tuple``.
+    """
+
+    __slots__ = ("_offsets", "_blob")
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: Union[int, slice]):
+        off = self._offsets
+        if isinstance(i, slice):
+            return tuple(self[j] for j in range(*i.indices(len(off) - 1)))
+        if i < 0:
+            i += len(off) - 1
+        if not 0 <= i < len(off) - 1:
+            raise IndexError("string table index out of range")
+        return str(self._blob[off[i]:off[i + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        off, blob = self._offsets, self._blob
+        for i in range(len(off) - 1):
+            yield str(blob[off[i]:off[i + 1]], "utf-8")
+
+    def index(self, value: str, start: int = 0, stop: Optional[int] = None) -> int:
+        """Like ``tuple.index``, comparing UTF-8 bytes instead of decoding."""
+        off, blob = self._offsets, self._blob
+        n = len(off) - 1
+        stop = n if stop is None else min(stop, n)
+        want = value.encode("utf-8")
+        size = len(want)
+        for i in range(max(start, 0), stop):
+            lo = off[i]
+            if off[i + 1] - lo == size and blob[lo:lo + size] == want:
+                return i
+        raise ValueError(f"{value!r} is not in the string table")
+
+
+class MappedItems(Sequence[Item]):
+    """``SyllabusIndex.items`` for a mapped index, built on access.
+
+    Subject, module and IQ come from the (decoded, interned) upper tables via
+    the parent ID arrays, so items of one IQ share those strings; only the
+    dotpoint is decoded per access.
+    """
+
+    __slots__ = ("_tables", "_parents")
+
+    def __init__(self, tables: Tuple[Sequence[str], ...], parents: Tuple[Sequence[int], ...]):
+        self._tables = tables    # subjects, modules, iqs, dotpoints
+        self._parents = parents  # mod_subj, iq_mod, dp_iq
+
+    def __len__(self) -> int:
+        return len(self._parents[2])
+
+    def __getitem__(self, d: Union[int, slice]):
+        if isinstance(d, slice):
+            return tuple(self[j] for j in range(*d.indices(len(self))))
+        subjects, modules, iqs, dotpoints = self._tables
+        mod_subj, iq_mod, dp_iq = self._parents
+        dp = dotpoints[d]  # bounds (and negative IDs) checked here
+        q = dp_iq[d]
+        m = iq_mod[q]
+        return subjects[mod_subj[m]], modules[m], iqs[q], dp
+
+    def __iter__(self) -> Iterator[Item]:
+        subjects, modules, iqs, dotpoints = self._tables
+        mod_subj, iq_mod, dp_iq = self._parents
+        for d, dp in enumerate(dotpoints):
+            q = dp_iq[d]
+            m = iq_mod[q]
+            yield subjects[mod_subj[m]], modules[m], iqs[q], dp
+
+
+def write_snapshot(idx: SyllabusIndex, source_path: str, snap_path: Optional[str] = None) -> bool:
+    """Publish ``idx`` atomically; returns False if it cannot be written."""
+    snap_path = snap_path or snapshot_path(source_path)
+    tables = (idx.subjects, idx.modules, idx.iqs, idx.dotpoints)
+    try:
+        info = os.stat(source_path)
+        header = _HEADER.pack(
+            MAGIC, FORMAT_VERSION, sys.byteorder == "little",
+            idx.n_subjects, idx.n_modules, idx.n_iqs, idx.n_dotpoints,
+            idx.fingerprint.encode("ascii"),
+            info.st_mtime_ns, info.st_size, _sha256(source_path),
+        )
+        chunks = [header]
+        for arr in (idx.subj_mod, idx.mod_iq, idx.iq_dp, idx.mod_subj, idx.iq_mod, idx.dp_iq):
+            chunks.append(_u32(arr))
+        blobs = []
+        for table in tables:
+            encoded = [s.encode("utf-8") for s in table]
+            offsets, pos = [0], 0
+            for b in encoded:
+                pos += len(b)
+                offsets.append(pos)
+            chunks.append(_u32(offsets))
+            blobs.append(_pad4(b"".join(encoded)))
+        chunks.extend(blobs)
+
+        tmp = f"{snap_path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"".join(chunks))
+        os.replace(tmp, snap_path)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+def _map(snap_path: str) -> Optional[mmap.mmap]:
+    try:
+        with open(snap_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+def _check_source(source_path: str, mtime_ns: int, size: int, digest: bytes) -> bool:
+    try:
+        info = os.stat(source_path)
+        if (mtime_ns, size) == (info.st_mtime_ns, info.st_size):
+            return True
+        return _sha256(source_path) == digest
+    except OSError:
+        return False
+
+
+def read_snapshot(source_path: str, snap_path: Optional[str] = None) -> Optional[SyllabusIndex]:
+    """Map the snapshot for ``source_path``, or None if missing/stale/corrupt."""
+    snap_path = snap_path or snapshot_path(source_path)
+    buf = _map(snap_path)
+    if buf is None:
+        return None
+
+    (magic, version, little, n_s, n_m, n_q, n_d, fingerprint,
+     mtime_ns, size, digest) = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or version != FORMAT_VERSION or bool(little) != (sys.byteorder == "little"):
+        return None
+    if not _check_source(source_path, mtime_ns, size, digest):
+        return None
+
+    try:
+        view = memoryview(buf)
+        pos = _HEADER.size
+
+        def u32(n: int) -> memoryview:
+            nonlocal pos
+            if pos + 4 * n > len(buf):
+                raise ValueError("truncated snapshot")
+            out = view[pos:pos + 4 * n].cast("I").toreadonly()
+            pos += 4 * n
+            return out
+
+        arrays = [u32(n) for n in (n_s + 1, n_m + 1, n_q + 1, n_m, n_q, n_d)]
+        offsets = [u32(n + 1) for n in (n_s, n_m, n_q, n_d)]
+        tables = []
+        for off in offsets:
+            blen = off[-1]
+            if pos + blen > len(buf):
+                raise ValueError("truncated snapshot")
+            tables.append(MappedStrings(off, view[pos:pos + blen].toreadonly()))
+            pos += blen + (-blen % 4)
+    except (ValueError, TypeError, struct.error):
+        return None
+
+    # the upper tables are small and read on every lookup: decode them once
+    intern = sys.intern
+    tables[:3] = [tuple(intern(s) for s in t) for t in tables[:3]]
+    subj_mod, mod_iq, iq_dp, mod_subj, iq_mod, dp_iq = arrays
+    parents = (mod_subj, iq_mod, dp_iq)
+    idx = SyllabusIndex(*tables, subj_mod, mod_iq, iq_dp, parents=parents)
+    idx.__dict__["fingerprint"] = fingerprint.decode("ascii")
+    idx.__dict__["items"] = MappedItems(tuple(tables), parents)
+    return idx
+
+
+def publish(idx: SyllabusIndex, source_path: str) -> Optional[SyllabusIndex]:
+    """Write ``idx`` as the snapshot for ``source_path`` and map it back.
+
+    Returns the mapped index (same IDs and fingerprint as ``idx``), or None if
+    the snapshot could not be written or read back.
+    """
+    if not write_snapshot(idx, source_path):
+        return None
+    return read_snapshot(source_path)
+
+
+if __name__ == "__main__":
+    from data.data import SYLLABUS_PATH, load_syllabus
+
+    src = sys.argv[1] if len(sys.argv) > 1 else SYLLABUS_PATH
+    idx = publish(SyllabusIndex.from_tree(load_syllabus(src)), src)
+    if idx is None:
+        sys.exit(f"could not publish a snapshot for {src}")
+    print(f"{snapshot_path(src)}: {idx.n_subjects} subjects, {idx.n_dotpoints} dotpoints, "
+          f"fingerprint {idx.fingerprint}")
@@ -0,0 +1,45 @@
+"""Small text helpers shared by the search, ranking and similarity code."""
+
+from __future__ import annotations
+
+import re
+from typing import List
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Very common words that carry no topic signal in dotpoints.
+STOPWORDS = frozenset("""
+a an and are as at be by for from how in into is it its of on or that the their
+them these this those to vs with within without what when where which why
+""".split())
+
+
+def tokenize(text: str, drop_stopwords: bool = True) -> List[str]:
+    """Lowercase alphanumeric tokens."""
+    toks = _TOKEN_RE.findall(text.lower())
+    if drop_stopwords:
+        toks = [t for t in toks if t not in STOPWORDS]
+    return toks
+
+
+def char_ngrams(token: str, n: int = 3) -> List[str]:
+    """Distinct character n-grams of a token (empty if it is shorter than n)."""
+    return list({token[i:i + n] for i in range(len(token) - n + 1)})
+
+
+_SUFFIXES = ("ations", "ation", "ings", "ing", "ies", "ed")
+_ES_AFTER = ("s", "x", "z", "ch", "sh")  # box -> boxes, match -> matches
+_KEEP_S = ("ss", "us", "is")  # mass, nucleus, analysis are not plurals
+
+
+def stem(token: str) -> str:
+    """Crude suffix stripping so 'mutation'/'mutations', 'rate'/'rates' and
+    'process'/'processes' meet."""
+    for suf in _SUFFIXES:
+        if token.endswith(suf) and len(token) - len(suf) >= 3:
+            return token[: -len(suf)] + ("y" if suf == "ies" else "")
+    if token.endswith("es") and token[:-2].endswith(_ES_AFTER) and len(token) >= 5:
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(_KEEP_S) and len(token) >= 4:
+        return token[:-1]
+    return token
@@ -0,0 +1 @@
+from .diagnostics import page_diagnostics
@@ -0,0 +1,73 @@
+"""Hidden diagnostics route (open the app with ``?diagnostics``).
+
+Shows the process-wide per-route windows from ``common.perf``: script wall
+time, deltas and bytes sent per run (full runs and each fragment), and script
+runs per user action, with a histogram for one route and a JSON dump; and
+the AI response cache and near-duplicate index counters (``ai.cache``,
+``ai.similar``).
+"""
+
+import streamlit as st
+
+from ai.cache import get_cache
+from ai.similar import near_stats
+from common import perf
+from common.ui import topbar
+
+_UNITS = {"ms": "ms", "deltas": "deltas", "bytes": "B", "runs": "runs"}
+
+
+def _dump():
+    st.session_state["diag:flash"] = f"Wrote {perf.dump()}"
+
+
+def _cache_stats():
+    c = get_cache().stats()
+    st.subheader("AI response cache")
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Hit rate", f"{c['hit_rate']:.0%}")
+    m2.metric("Hits (memory / disk)", f"{c['memory_hits']} / {c['disk_hits']}")
+    m3.metric("Misses", c["misses"])
+    m4.metric("Model time saved", f"{c['saved_ms'] / 1000:.1f} s")
+    n = near_stats()
+    st.caption(f"Near-duplicate answers: {n['near_hits']} reused, {n['near_misses']} new, "
+               f"{n['unindexed']} too short to match; {n['entries']} indexed.")
+    st.subheader("Routes")
+
+
+def page_diagnostics():
+    topbar("Diagnostics", back_to="home")
+    st.caption(f"All sessions in this process; the last {perf.WINDOW} runs per route and scope."
+               + ("" if perf.ENABLED else " Deltas and bytes are counted with SYLLABUDDY_PERF=1."))
+
+    flash = st.session_state.pop("diag:flash", None)
+    if flash:
+        st.success(flash)
+
+    _cache_stats()
+
+    rows = perf.route_stats()
+    if not rows:
+        st.info("No runs recorded yet.")
+        return
+    for row in rows:
+        for m in ("bytes p50", "bytes p90", "bytes max"):
+            row[m] = round(row[m] / 1024, 1)
+    st.dataframe(rows, use_container_width=True, hide_index=True,
+                 column_config={"bytes p50": "kB p50", "bytes p90": "kB p90", "bytes max": "kB max"})
+
+    c1, c2 = st.columns(2)
+    with c1:
+        key = st.selectbox("Route / scope", [(r["route"], r["scope"]) for r in rows],
+                           format_func=lambda k: f"{k[0]} · {k[1]}", key="diag:key")
+    with c2:
+        metric = st.radio("Metric", list(_UNITS), horizontal=True, key="diag:metric")
+    hist = perf.histogram(*key, metric=metric)
+    total = sum(n for _, n in hist) or 1
+    st.dataframe(
+        [{"up to": f"{bound:g} {_UNITS[metric]}", "samples": n, "share": n / total} for bound, n in hist],
+        use_container_width=True, hide_index=True,
+        column_config={"share": st.column_config.ProgressColumn("share", min_value=0, max_value=1)},
+    )
+
+    st.button("Dump to file", on_click=_dump)
@@ -0,0 +1,41 @@
+"""Drag-and-drop cloze (``frontend/build``).
+
+The browser keeps the bank and the filled blanks, reports them after a short
+pause in dragging, and grades on its own Submit button; the value is
+``{"bank", "fills", "submitted"}`` plus ``"correct"``/``"score"`` once
+submitted.  Without the build, ``fp.fp_mvp`` falls back to typed blanks.
+"""
+
+from typing import Callable, Optional, Sequence
+
+from common.components import get_component, has_component
+
+
+def available() -> bool:
+    return has_component("dnd_cloze")
+
+
+def dnd_cloze(
+    segments: Sequence[str],
+    answers: Sequence[str],
+    bank: Sequence[str],
+    fills: Sequence[Optional[str]],
+    key: str,
+    show_feedback: bool = False,
+    page_frame: str = "none",
+    bad_pct: int = 30,
+    on_change: Optional[Callable[[], None]] = None,
+) -> Optional[dict]:
+    """Render one cloze; ``None`` until the browser first reports a value."""
+    return get_component("dnd_cloze")(
+        segments=list(segments),
+        answers=list(answers),
+        initialBank=list(bank),
+        initialFills=list(fills),
+        showFeedback=show_feedback,
+        pageFrame=page_frame,
+        badPct=bad_pct,
+        key=key,
+        default=None,
+        on_change=on_change,
+    )
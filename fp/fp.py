@@ -3,23 +3,16 @@
 # General FP → Weakness report (general) → Cloze (general weakness) → Review → Weakness report (specific)
 # → FP (specific) → Cloze (specific) → loop specifics → next general → finish
 from __future__ import annotations
-import os
-import pathlib
 import random
 import re
 from typing import List, Optional, Tuple
 
 import streamlit as st
-import streamlit.components.v1 as components
+
+from common.components import get_component
 
 # ------------- DnD Cloze Component (fallback if build not present) -------------
-BUILD_DIR = str(pathlib.Path(__file__).resolve().parent.parent / "frontend" / "build")
-_dnd_cloze = None
-if os.path.exists(BUILD_DIR):
-    try:
-        _dnd_cloze = components.declare_component("dnd_cloze", path=BUILD_DIR)
-    except Exception:
-        _dnd_cloze = None  # fall back to text inputs
+_dnd_cloze = get_component("dnd_cloze")
 
 
 def _render_dnd_cloze(segments: List[str], answers: List[str], bank: List[str],
@@ -1,88 +1,48 @@
 from __future__ import annotations
-import os
+import itertools
 import re
 import random
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 
 import streamlit as st
 
-# ================= Theme-aware CSS (dark-mode safe) =================
-FP_CSS = """
-<style>
-:root{
-  --bg:#ffffff; --text:#111827; --muted:#4b5563;
-  --ok:#16a34a; --bad:#dc2626; --border:#e5e7eb;
-  --card:#ffffff; --cardTint:#f8fafc; --inputBg:#ffffff; --inputText:#111827;
-}
-@media (prefers-color-scheme: dark){
-  :root{
-    --bg:#0b1220; --text:#e5e7eb; --muted:#94a3b8;
-    --ok:#22c55e; --bad:#ef4444; --border:#334155;
-    --card:#0f172a; --cardTint:#101826;
-    --inputBg:#0b1220; --inputText:#e5e7eb;
-  }
-}
-
-/* make our containers readable in dark */
-.fp-card, .cloze-card, .ai-box, .weak-box {
-  border:2px solid var(--border); border-radius:12px; padding:12px;
-  background:var(--card); color:var(--text);
-}
-
-.dp-title{ font-weight:800; font-size:1.14rem; margin:.25rem 0 .75rem 0; color:var(--text); }
-.subtle{ color:var(--muted); }
-
-textarea, input[type="text"]{
-  background: var(--inputBg) !important;
-  color: var(--inputText) !important;
-  border:1px solid var(--border) !important;
-}
-
-/* Global full-page frame after cloze submit */
-.global-frame{
-  position:fixed; inset:0; pointer-events:none; z-index:9999;
-  border:6px solid transparent; border-radius:0;
-}
-.global-frame.good{ border-color: var(--ok); }
-.global-frame.mixed{
-  border-image-slice:1; border-style:solid; border-width:6px;
-  border-image-source: linear-gradient(90deg, var(--bad) var(--badpct,30%), var(--ok) var(--badpct,30%));
-}
-
-/* Per-blank inline review (fallback/typed mode) */
-.blank-row{
-  border:2px solid var(--border); border-radius:10px; padding:10px; margin-bottom:10px;
-}
-.blank-row.ok{ border-color: var(--ok); }
-.blank-row.bad{ border-color: var(--bad); }
-.blank-lab{ font-weight:700; color:var(--muted); }
-.blank-you{ margin-top:4px; }
-.blank-correct{ margin-top:2px; color:var(--muted); }
-
-/* Section headers on page */
-.section-title { font-weight:800; margin:10px 0 6px 0; color:var(--text); }
-</style>
-"""
-st.markdown(FP_CSS, unsafe_allow_html=True)
+from common.ui import fragment, get_go, safe_rerun
+from data.data import remap_between
+from data.related import get_related_graph
+from ai import jobs
+from ai.cache import get_cache
+from ai.providers import get_provider
+from ai.similar import get_near_index
+from fp.component import available as cloze_available, dnd_cloze
 
 # ================= Public entrypoints =================
 def ensure_fp_state():
     if "_fp" not in st.session_state:
         _reset_all()
+    _follow_syllabus_reload()
 
-def begin_fp_from_selection():
-    """Build queue from sel_dotpoints → route to fp_run."""
+def start_fp_from_selection() -> bool:
+    """Build queue from sel_dotpoints and set the route to fp_run.
+
+    Only touches session state, so it can be a button's ``on_click``.
+    """
     ensure_fp_state()
     dps = list(st.session_state.get("sel_dotpoints", set()))
     dps.sort()
     if not dps:
-        st.warning("No dotpoints selected. Use Select/Review first.")
-        return
+        return False
     st.session_state._fp["queue"] = dps
     st.session_state._fp["q_idx"] = 0
     _reset_for_current_dp()
     st.session_state["route"] = "fp_run"
-    st.rerun()
+    return True
+
+def begin_fp_from_selection():
+    """Route handler for ``fp_start``: build the queue, then rerun into fp_run."""
+    if not start_fp_from_selection():
+        st.warning("No dotpoints selected. Use Select/Review first.")
+        return
+    safe_rerun()
 
 def page_fp_run():
     """Single-screen FP engine for current dotpoint; keeps review inline."""
@@ -91,13 +51,19 @@ def page_fp_run():
     dp = _current_dp()
     if not dp:
         st.success("All selected dotpoints complete. 🎉")
-        if st.button("Back to Home"):
-            st.session_state["route"] = "home"
-            st.rerun()
+        st.button("Back to Home", on_click=get_go(), args=("home",))
         return
 
     s, m, iq, dotpoint = dp
     st.markdown(f'<div class="dp-title">{dotpoint}</div>', unsafe_allow_html=True)
+    _fp_stage(s, m, iq, dotpoint)
+
+# The stage area is one fragment: a stage transition, cloze drop or rating
+# reruns only the stage.  Moving to another dotpoint (or route) changes
+# ``_current_dp``, which escalates to a full rerun, as does a finished AI job
+# (ai.jobs.poll).
+@fragment(watch=lambda: _current_dp())
+def _fp_stage(s, m, iq, dotpoint):
     stage = st.session_state._fp["stage"]
 
     if stage == "fp_general":
@@ -114,12 +80,13 @@ def page_fp_run():
         _stage_decision()
     else:
         st.session_state._fp["stage"] = "fp_general"
-        st.rerun()
+        _stage_fp_general(s, m, iq, dotpoint)
 
 # ================= Internal state/model =================
 def _reset_all():
     st.session_state._fp = {
         "queue": [], "q_idx": 0,
+        "idx": None,              # SyllabusIndex the queue was built against
         "stage": "fp_general",
 
         # FP general
@@ -130,6 +97,8 @@ def _reset_all():
         "fp_ai_wk": "",
         "fp_ai_st": "",
         "direct_exam": False,
+        "fp_submitted": False,
+        "exam_placeholder": False,
 
         # general weaknesses list
         "general_list": [],
@@ -144,10 +113,12 @@ def _reset_all():
         # follow-ups
         "follow_qs": [],
         "follow_idx": 0,
+        "spec_answered": None,
 
         # cloze
         "current_cloze": None,
         "cloze_specificity": 0,   # 0=general 1=specific
+        "cloze_n": 0,
         "_segs": None, "_ans": None, "_bank": None, "_fills": None,
         "correct_flags": None,
         "cloze_score": None,
@@ -160,6 +131,8 @@ def _reset_all():
 
 def _reset_for_current_dp():
     fp = st.session_state._fp
+    jobs.discard("fp")
+    jobs.discard("cloze")
     fp.update({
         "stage": "fp_general",
         "fp_q": None,
@@ -167,11 +140,11 @@ def _reset_for_current_dp():
         "fp_general_model_answer": None,
         "fp_general_rating": None,
         "fp_ai_wk": "", "fp_ai_st": "",
-        "direct_exam": False,
+        "direct_exam": False, "fp_submitted": False, "exam_placeholder": False,
 
         "general_list": [], "general_idx": 0, "cur_general": None,
         "spec_map": {}, "spec_queue": [], "cur_specific": None,
-        "follow_qs": [], "follow_idx": 0,
+        "follow_qs": [], "follow_idx": 0, "spec_answered": None,
 
         "current_cloze": None, "cloze_specificity": 0,
         "_segs": None, "_ans": None, "_bank": None, "_fills": None,
@@ -180,6 +153,37 @@ def _reset_for_current_dp():
         "cloze_ai_wk": "", "cloze_ai_st": "",
     })
 
+def _follow_syllabus_reload():
+    """Move the FP queue onto the current syllabus index after a hot reload.
+
+    Dotpoints that were removed from the syllabus drop out of the queue; the
+    pointer stays on the current dotpoint (or the next one that survived).
+    """
+    fp = st.session_state._fp
+    idx = st.session_state.get("_IDX")
+    prev = fp.get("idx")
+    fp["idx"] = idx
+    if idx is None or prev is None or prev is idx or not fp["queue"]:
+        return
+    remap = remap_between(prev, idx)
+    queue, q_idx = [], None
+    for i, item in enumerate(fp["queue"]):
+        old_id = prev.dotpoint_id(item)
+        if remap is not None and old_id >= 0:
+            new_id = remap[old_id]
+        else:
+            new_id = idx.dotpoint_id(item)
+        if new_id < 0:
+            continue
+        if q_idx is None and i >= fp["q_idx"]:
+            q_idx = len(queue)
+        queue.append(idx.items[new_id])
+    cur = _current_dp()
+    fp["queue"] = queue
+    fp["q_idx"] = q_idx if q_idx is not None else max(len(queue) - 1, 0)
+    if _current_dp() != cur:
+        _reset_for_current_dp()
+
 def _guard_queue():
     q = st.session_state._fp["queue"]
     if not q: return
@@ -202,7 +206,7 @@ def _smart_fp(dotpoint: str, subject: str) -> str:
     return (f"From first principles, explain and derive: “{dotpoint}”. Include assumptions and edge cases.")
 
 def _model_answer(dotpoint: str, subject: str, mode: str = "general") -> str:
-    """Placeholder model answer (deterministic)."""
+    """Placeholder model answer (deterministic), used without a model."""
     if mode == "specific":
         return (f"**Model answer (specific):** Define the sub-idea precisely, outline the stepwise causal chain, "
                 f"and connect it back to “{dotpoint}”. Include one tight micro-example and the key assumption.")
@@ -215,41 +219,113 @@ def _model_answer(dotpoint: str, subject: str, mode: str = "general") -> str:
                 f"“{dotpoint}”. Predict outcomes if a condition is removed.")
     return (f"**Model answer:** Define the principle, develop it logically, and show a compact example for “{dotpoint}”.")    
 
-def _ai_weak_strengths(text: str) -> Dict[str,List[str]]:
+# Bump when a prompt or its parsing changes: ai.cache keys on it.
+MODEL_ANSWER_PROMPT = "model-answer-1"
+MODEL_ANSWER_TOKENS = 400
+
+def _model_answer_prompt(dotpoint: str, subject: str, question: str) -> str:
+    return (f"You are an HSC {subject or 'science'} teacher. Write a concise model answer "
+            "(at most 150 words, Markdown, no heading) to the question below, for the "
+            f"syllabus dotpoint “{dotpoint}”.\n\nQuestion:\n{question}\n")
+
+def _render_model_answer(dotpoint: str, subject: str, question: str, mode: str = "general") -> str:
     """
-    Try gpt-5-nano for 3 weaknesses + 2 strengths (semicolon short);
-    fallback to a simple deterministic stub if no key.
+    Show the model answer to ``question``, streamed from the configured model
+    as it is written (time to first token is what students notice); the text
+    is cached, so reruns and later students get it at once.  Without a model
+    (or if the stream fails) shows the deterministic placeholder.  Returns the
+    text shown.
     """
-    api_key = os.getenv("OPENAI_API_KEY") or st.secrets.get("OPENAI_API_KEY", None)
-    try:
-        from openai import OpenAI  # OpenAI v1
-        if not api_key:
-            raise RuntimeError("no key")
-        client = OpenAI(api_key=api_key)
-        prompt = (
-            "Summarize the *top 3 weaknesses* and *top 2 strengths* in this answer. "
-            "Return as 'weak: w1; w2; w3' and 'strong: s1; s2' with short phrases.\n\n"
-            f"Answer:\n{text}\n"
-        )
-        resp = client.chat.completions.create(
-            model="gpt-5-nano",
-            messages=[{"role":"user","content":prompt}],
-            temperature=0.2,
-            max_tokens=120,
-        )
-        out = resp.choices[0].message.content.strip()
-        weak, strong = [], []
-        for line in out.splitlines():
-            if line.lower().startswith("weak"):
-                weak = [p.strip(" ;") for p in line.split(":",1)[1].split(";") if p.strip()]
-            if line.lower().startswith("strong"):
-                strong = [p.strip(" ;") for p in line.split(":",1)[1].split(";") if p.strip()]
-        if not weak: weak = ["term precision","linking steps","edge cases"]
-        if not strong: strong = ["structure","clear assumptions"]
-        return {"weak": weak[:3], "strong": strong[:2]}
-    except Exception:
-        return {"weak": ["term precision","linking steps","edge cases"],
-                "strong": ["structure","clear assumptions"]}
+    fallback = _model_answer(dotpoint, subject, mode)
+    provider = get_provider()
+    # one slot: a stream that fails partway is replaced by the fallback, not followed by it
+    slot = st.empty()
+    if provider.live:
+        label = "**Model answer (specific):** " if mode == "specific" else "**Model answer:** "
+        chunks = get_cache().stream_through(
+            provider.model, MODEL_ANSWER_PROMPT, "\x1f".join((mode, subject, dotpoint, question)),
+            lambda: provider.stream(_model_answer_prompt(dotpoint, subject, question),
+                                    max_tokens=MODEL_ANSWER_TOKENS, temperature=0.2))
+        try:
+            with slot.container():
+                return st.write_stream(itertools.chain((label,), chunks))
+        except Exception:
+            pass
+    slot.markdown(fallback, unsafe_allow_html=True)
+    return fallback
+
+WEAK_STRENGTHS_PROMPT = "weak-strengths-1"
+
+def _ask_weak_strengths(provider, text: str) -> Dict[str,List[str]]:
+    prompt = (
+        "Summarize the *top 3 weaknesses* and *top 2 strengths* in this answer. "
+        "Return as 'weak: w1; w2; w3' and 'strong: s1; s2' with short phrases.\n\n"
+        f"Answer:\n{text}\n"
+    )
+    out = provider.complete(prompt, max_tokens=120, temperature=0.2)
+    weak, strong = [], []
+    for line in out.splitlines():
+        if line.lower().startswith("weak"):
+            weak = [p.strip(" ;") for p in line.split(":",1)[1].split(";") if p.strip()]
+        if line.lower().startswith("strong"):
+            strong = [p.strip(" ;") for p in line.split(":",1)[1].split(";") if p.strip()]
+    if not weak: weak = ["term precision","linking steps","edge cases"]
+    if not strong: strong = ["structure","clear assumptions"]
+    return {"weak": weak[:3], "strong": strong[:2]}
+
+_WEAK_STRENGTHS_FALLBACK = {"weak": ["term precision","linking steps","edge cases"],
+                            "strong": ["structure","clear assumptions"]}
+
+def _weak_strengths_task(text: str, near_ok: bool = False) -> Callable[[], Dict[str,List[str]]]:
+    """
+    Ask the configured model (see ai.providers) for 3 weaknesses + 2 strengths
+    (semicolon short), through the response cache (identical cloze answers are
+    common); fallback to a simple deterministic stub without a model.
+
+    ``near_ok`` also consults the near-duplicate index, so free-text blurts
+    that differ by a few words reuse an earlier result.  Never for cloze
+    answers: those are permutations of one word bank, and a wrong order is
+    within SimHash distance of the right one.
+
+    Returned as a call that needs no script-run context (providers and caches
+    are resolved here), so it can run on the ai.jobs pool.
+    """
+    provider = get_provider()
+    if not provider.live:
+        return lambda: _WEAK_STRENGTHS_FALLBACK
+    cache = get_cache()
+    near = get_near_index(provider.model, WEAK_STRENGTHS_PROMPT) if near_ok else None
+
+    def ask():
+        if near is None:
+            return _ask_weak_strengths(provider, text)
+        return near.get_or_compute(text, lambda: _ask_weak_strengths(provider, text))
+
+    def run():
+        try:
+            return cache.get_or_compute(provider.model, WEAK_STRENGTHS_PROMPT, text, ask)
+        except Exception:
+            return _WEAK_STRENGTHS_FALLBACK
+    return run
+
+# Weak/strong analysis runs on the ai.jobs pool, as job "fp" (the FP blurt)
+# or "cloze"; stages show a placeholder until it lands in fp[<job>_ai_wk/st],
+# and the buttons that use it stay disabled until then.
+
+def _submit_weak_strengths(job: str, text: str):
+    fp = st.session_state._fp
+    fp[f"{job}_ai_wk"] = fp[f"{job}_ai_st"] = ""
+    # near-duplicate reuse only for the free-text blurt, never cloze fills
+    jobs.submit(job, _weak_strengths_task(text, near_ok=(job == "fp")))
+
+def _collect_weak_strengths(job: str) -> bool:
+    """Copy a finished job into fp; False while it is still running."""
+    ai = jobs.take(job)
+    if ai is not None:
+        fp = st.session_state._fp
+        fp[f"{job}_ai_wk"] = "; ".join(ai["weak"])
+        fp[f"{job}_ai_st"] = "; ".join(ai["strong"])
+    return not jobs.pending(job)
 
 # ================= Cloze helpers =================
 _BLANK_RE = re.compile(r"\[\[(.+?)\]\]")
@@ -275,31 +351,14 @@ def _split_cloze(cloze: str) -> Tuple[List[str], List[str]]:
         segments.append(parts[i+1] if i+1 < len(parts) else "")
     return segments, answers
 
-def _get_component():
-    import streamlit.components.v1 as components
-    import pathlib
-    BUILD_DIR = str(pathlib.Path(__file__).resolve().parent.parent / "frontend" / "build")
-    if pathlib.Path(BUILD_DIR).exists():
-        try:
-            return components.declare_component("dnd_cloze", path=BUILD_DIR)
-        except Exception:
-            return None
-    return None
-
-def _render_cloze(segments, answers, fills, bank, key, show_feedback=False, page_frame="none", bad_pct=30):
-    comp = _get_component()
-    if comp:
+def _render_cloze(segments, answers, fills, bank, key, show_feedback=False, page_frame="none", bad_pct=30,
+                  on_change=None):
+    if cloze_available():
         # Uses your previous DnD props; feedback stays on same page.
-        return comp(
-            segments=segments,
-            answers=answers,
-            initialBank=bank,
-            initialFills=fills,
-            showFeedback=show_feedback,
-            pageFrame=page_frame,
-            badPct=bad_pct,
-            key=key,
-            default=None,
+        return dnd_cloze(
+            segments, answers, bank, fills, key,
+            show_feedback=show_feedback, page_frame=page_frame, bad_pct=bad_pct,
+            on_change=(lambda: on_change(key)) if on_change else None,
         )
     # Fallback typed blanks (keeps inline review)
     new_fills = list(fills)
@@ -307,13 +366,14 @@ def _render_cloze(segments, answers, fills, bank, key, show_feedback=False, page
         st.write(segments[i])
         new_fills[i] = st.text_input(f"Blank {i+1}", value=new_fills[i] or "", key=f"{key}_txt_{i}")
     st.write(segments[-1])
-    flags = [(a.strip().lower() == (new_fills[i] or "").strip().lower()) for i, a in enumerate(answers)]
-    return {"bank": bank, "fills": new_fills, "correct": flags}
+    return {"bank": bank, "fills": new_fills, "submitted": False}
+
+def _grade(answers: List[str], fills: List[Optional[str]]) -> List[bool]:
+    return [a.strip().lower() == (f or "").strip().lower() for a, f in zip(answers, fills)]
 
 def _render_fallback_review(ans: List[str], fills: List[Optional[str]]):
-    for i, a in enumerate(ans):
+    for i, (a, ok) in enumerate(zip(ans, _grade(ans, fills))):
         yours = (fills[i] or "").strip()
-        ok = (yours.lower() == a.strip().lower())
         klass = "ok" if ok else "bad"
         st.markdown(f'<div class="blank-row {klass}">', unsafe_allow_html=True)
         st.markdown(f'<div class="blank-lab">Blank {i+1}</div>', unsafe_allow_html=True)
@@ -322,6 +382,39 @@ def _render_fallback_review(ans: List[str], fills: List[Optional[str]]):
         st.markdown('</div>', unsafe_allow_html=True)
 
 # ================= Stages =================
+#
+# Every button here applies its transition in an ``on_click`` callback, so the
+# rerun the click causes anyway already renders the next stage: one click, one
+# (fragment) run.  Callbacks that move to another dotpoint or route end with
+# ``safe_rerun()`` to make that run a full one.
+
+def _submit_fp_general():
+    fp = st.session_state._fp
+    fp["user_blurt"] = st.session_state.get("fp_blurt") or ""
+    fp["direct_exam"] = bool(st.session_state.get("fp_direct_exam"))
+    _submit_weak_strengths("fp", fp["user_blurt"])
+    fp["fp_submitted"] = True
+
+def _fp_general_next(focus: bool):
+    fp = st.session_state._fp
+    _collect_weak_strengths("fp")
+    fp["fp_general_rating"] = st.session_state.get("rate_fp_gen", 6)
+    if focus:
+        # Build initial general list from AI (editable later via cloze page box)
+        fp["general_list"] = [w.strip() for w in fp["fp_ai_wk"].split(";") if w.strip()][:5]
+        fp["general_idx"] = 0
+        fp["cur_general"] = fp["general_list"][0] if fp["general_list"] else None
+    fp["ratings"].append({"stage":"fp_general", "score": fp["fp_general_rating"]})
+    if fp["direct_exam"]:
+        fp["exam_placeholder"] = True
+        return
+    if not focus:
+        # go to general cloze with empty/general tag
+        fp["general_list"] = [fp["fp_ai_wk"].split(";")[0]] if fp["fp_ai_wk"] else []
+        fp["general_idx"] = 0
+        fp["cur_general"] = fp["general_list"][0] if fp["general_list"] else None
+    fp["stage"] = "cloze_general" if fp["cur_general"] else "fp_more"
+
 def _stage_fp_general(s, m, iq, dotpoint):
     fp = st.session_state._fp
     if not fp["fp_q"]:
@@ -331,69 +424,133 @@ def _stage_fp_general(s, m, iq, dotpoint):
     st.markdown('<div class="fp-card">', unsafe_allow_html=True)
     st.write(fp["fp_q"])
     with st.form("fp_general_form"):
-        blurt = st.text_area("Your answer", key="fp_blurt", height=280, placeholder="Type your answer here…")
-        direct_exam = st.checkbox("Skip to Exam Mode (optional)", value=False)
-        submitted = st.form_submit_button("Submit", type="primary")
+        st.text_area("Your answer", key="fp_blurt", height=280, placeholder="Type your answer here…")
+        st.checkbox("Skip to Exam Mode (optional)", value=False, key="fp_direct_exam")
+        st.form_submit_button("Submit", type="primary", on_click=_submit_fp_general)
     st.markdown('</div>', unsafe_allow_html=True)
 
-    if submitted:
-        fp["user_blurt"] = blurt or ""
-        fp["direct_exam"] = bool(direct_exam)
-        # Inline model answer + rating + AI weaknesses (ON THE SAME PAGE)
-        model = _model_answer(dotpoint, s, "general")
-        st.markdown('<div class="ai-box">', unsafe_allow_html=True)
-        st.markdown(model, unsafe_allow_html=True)
-        fp["fp_general_rating"] = st.slider("Rate your understanding (0–10)", 0, 10, 6, key="rate_fp_gen")
-        ai = _ai_weak_strengths(fp["user_blurt"])
-        fp["fp_ai_wk"] = "; ".join(ai["weak"])
-        fp["fp_ai_st"] = "; ".join(ai["strong"])
-        st.markdown('</div>', unsafe_allow_html=True)
+    if not fp["fp_submitted"]:
+        return
 
-        c1, c2 = st.columns(2)
-        with c1:
-            if st.button("Focus these weaknesses next", type="primary", use_container_width=True, key="fp_next_focus"):
-                # Build initial general list from AI (editable later via cloze page box)
-                fp["general_list"] = [w.strip() for w in fp["fp_ai_wk"].split(";") if w.strip()][:5]
-                fp["general_idx"] = 0
-                fp["cur_general"] = fp["general_list"][0] if fp["general_list"] else None
-                fp["ratings"].append({"stage":"fp_general", "score": fp["fp_general_rating"]})
-                if fp["direct_exam"]:
-                    st.info("Exam Mode placeholder (HSC-style questions + sample answers).")
-                    if st.button("Return to FP"):
-                        fp["direct_exam"] = False
-                        st.rerun()
-                    return
-                fp["stage"] = "cloze_general" if fp["cur_general"] else "fp_more"
-                st.rerun()
-        with c2:
-            if st.button("Move on", use_container_width=True, key="fp_next_moveon"):
-                fp["ratings"].append({"stage":"fp_general", "score": fp["fp_general_rating"]})
-                if fp["direct_exam"]:
-                    st.info("Exam Mode placeholder (HSC-style questions + sample answers).")
-                    if st.button("Return to FP"):
-                        fp["direct_exam"] = False
-                        st.rerun()
-                    return
-                # go to general cloze with empty/general tag
-                fp["general_list"] = [fp["fp_ai_wk"].split(";")[0]] if fp["fp_ai_wk"] else []
-                fp["general_idx"] = 0
-                fp["cur_general"] = fp["general_list"][0] if fp["general_list"] else None
-                fp["stage"] = "cloze_general" if fp["cur_general"] else "fp_more"
-                st.rerun()
+    # Inline model answer + rating + AI weaknesses (ON THE SAME PAGE); the
+    # weak/strong job runs on the pool while the answer streams
+    st.markdown('<div class="ai-box">', unsafe_allow_html=True)
+    if fp["fp_general_model_answer"]:
+        st.markdown(fp["fp_general_model_answer"], unsafe_allow_html=True)
+    else:
+        fp["fp_general_model_answer"] = _render_model_answer(dotpoint, s, fp["fp_q"], "general")
+    fp["fp_general_rating"] = st.slider("Rate your understanding (0–10)", 0, 10, 6, key="rate_fp_gen")
+    ai_ready = _collect_weak_strengths("fp")
+    if ai_ready:
+        st.caption(f"AI weaknesses: {fp['fp_ai_wk'] or '—'}")
+    else:
+        st.caption("AI is reading your answer…")
+        jobs.poll("fp")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    if fp["exam_placeholder"]:
+        st.info("Exam Mode placeholder (HSC-style questions + sample answers).")
+        st.button("Return to FP", on_click=lambda: st.session_state._fp.update(
+            {"direct_exam": False, "exam_placeholder": False}))
+        return
+
+    c1, c2 = st.columns(2)
+    with c1:
+        st.button("Focus these weaknesses next", type="primary", use_container_width=True,
+                  key="fp_next_focus", on_click=_fp_general_next, args=(True,),
+                  disabled=not ai_ready)
+    with c2:
+        st.button("Move on", use_container_width=True,
+                  key="fp_next_moveon", on_click=_fp_general_next, args=(False,),
+                  disabled=not ai_ready)
+
+def _grade_cloze(flags=None):
+    """Score the current cloze (``flags`` as graded by the component, if any)."""
+    fp = st.session_state._fp
+    if fp["correct_flags"] is not None:
+        return
+    ans = fp["_ans"]
+    got = [(x or "") for x in fp["_fills"]]
+    if not isinstance(flags, list) or len(flags) != len(ans):
+        flags = _grade(ans, got)
+    fp["correct_flags"] = [bool(x) for x in flags]
+    c = sum(fp["correct_flags"]); total = len(fp["correct_flags"]) or 1
+    fp["cloze_score"] = f"{c}/{total}"
+    # trigger AI wk/st on the same page (based on got/answers), off-thread
+    _submit_weak_strengths("cloze", " | ".join(got))
+
+def _cloze_changed(key: str):
+    # The component only reports after a pause in dragging and once on its own
+    # Submit (already graded client-side).
+    fp = st.session_state._fp
+    value = st.session_state.get(key)
+    if not value:
+        return
+    fp["_bank"] = value.get("bank", fp["_bank"])
+    fp["_fills"] = value.get("fills", fp["_fills"])
+    if value.get("submitted"):
+        _grade_cloze(value.get("correct"))
+
+def _submit_fallback_cloze(key: str):
+    fp = st.session_state._fp
+    fp["_fills"] = [st.session_state.get(f"{key}_txt_{i}") or None for i in range(len(fp["_ans"]))]
+    _grade_cloze()
+
+def _cloze_next(is_specific: bool, focus: bool):
+    fp = st.session_state._fp
+    tag = "spec" if is_specific else "gen"
+    _collect_weak_strengths("cloze")
+    fp["cloze_rating"] = st.session_state.get(f"rate_cloze_{tag}", 7)
+    fp["ratings"].append({
+        "stage": f"cloze_{tag}",
+        "score": fp["cloze_rating"],
+        "raw": fp["cloze_score"],
+    })
+    if not focus:
+        # Skip specifics; next general or finish
+        fp["stage"] = "fp_more"
+    elif not is_specific:
+        # Start specifics based on weakness box
+        wk_edit = st.session_state.get(f"wk_edit_{tag}", fp["cloze_ai_wk"])
+        specs = [w.strip() for w in (wk_edit or "").split(";") if w.strip()]
+        fp["spec_queue"] = specs[:]
+        fp["cur_specific"] = fp["spec_queue"].pop(0) if fp["spec_queue"] else None
+        fp["follow_qs"] = _followup_questions_for(fp["cur_specific"] or (fp["cur_general"] or "this topic"))
+        fp["follow_idx"] = 0
+        fp["spec_answered"] = None
+        # reset cloze scratch for specific later
+        fp.update({"current_cloze": None, "_segs": None, "_ans": None, "_bank": None, "_fills": None, "correct_flags": None})
+        # no specific → move on to more FP or next general
+        fp["stage"] = "fp_specific_q" if fp["cur_specific"] else "fp_more"
+    elif fp["spec_queue"]:
+        # Continue specifics if queue remains; else move on
+        fp["cur_specific"] = fp["spec_queue"].pop(0)
+        fp["follow_qs"] = _followup_questions_for(fp["cur_specific"])
+        fp["follow_idx"] = 0
+        fp["spec_answered"] = None
+        fp.update({"current_cloze": None, "_segs": None, "_ans": None, "_bank": None, "_fills": None, "correct_flags": None})
+        fp["stage"] = "fp_specific_q"
+    else:
+        fp["stage"] = "fp_more"
 
 def _stage_cloze(is_specific: bool, subject: str, dotpoint: str):
     """All cloze review/feedback stays on THIS page after Submit."""
     fp = st.session_state._fp
+    tag = "spec" if is_specific else "gen"
 
     # Prepare cloze once per stage
     if not fp["current_cloze"]:
+        jobs.discard("cloze")
         txt = _placeholder_cloze(level=1 if is_specific else 0)
         segs, ans = _split_cloze(txt)
         bank = ans[:]; random.shuffle(bank)
         fp.update({
             "current_cloze": txt, "_segs": segs, "_ans": ans, "_bank": bank,
             "_fills": [None]*len(ans), "correct_flags": None,
-            "cloze_score": None, "cloze_rating": None, "cloze_ai_wk": "", "cloze_ai_st": ""
+            "cloze_score": None, "cloze_rating": None, "cloze_ai_wk": "", "cloze_ai_st": "",
+            # new widget key per cloze, so a previous cloze's submitted value
+            # is never read back as this one's
+            "cloze_n": fp.get("cloze_n", 0) + 1,
         })
 
     segs, ans, bank, fills = fp["_segs"], fp["_ans"], fp["_bank"], fp["_fills"]
@@ -409,36 +566,26 @@ def _stage_cloze(is_specific: bool, subject: str, dotpoint: str):
         bad_pct = int((total - c) / total * 100)
         page_frame = "good" if c == total else "mixed"
 
-    # Render DnD (or fallback) — stays here after submit
+    # Render DnD (or fallback) — stays here after submit; drops and Submit are
+    # applied by _cloze_changed before this run
+    key = f"dnd_{tag}_{fp['general_idx']}_{fp['cloze_n']}"
     comp_state = _render_cloze(
         segments=segs,
         answers=ans,
         fills=fills,
         bank=bank,
-        key=f"dnd_{'spec' if is_specific else 'gen'}_{fp['general_idx']}",
+        key=key,
         show_feedback=(fp["correct_flags"] is not None),
         page_frame=page_frame,
         bad_pct=bad_pct,
+        on_change=_cloze_changed,
     )
-    if comp_state:
-        fp["_bank"]  = comp_state.get("bank", bank)
-        fp["_fills"] = comp_state.get("fills", fills)
-        if comp_state.get("correct") is not None and fp["correct_flags"] is None:
-            fp["correct_flags"] = comp_state.get("correct")
-
-    # Submit grades inline and reveal feedback on THIS page
-    submitted = st.button("Submit", type="primary", key=f"submit_{'spec' if is_specific else 'gen'}")
-    if submitted and fp["correct_flags"] is None:
-        got = [(x or "") for x in fp["_fills"]]
-        fp["correct_flags"] = [a.strip().lower() == g.strip().lower() for a, g in zip(ans, got)]
-        c = sum(fp["correct_flags"]); total = len(fp["correct_flags"]) or 1
-        fp["cloze_score"] = f"{c}/{total}"
-        # trigger AI wk/st on the same page (based on got/answers)
-        joined = " | ".join(got)
-        ai = _ai_weak_strengths(joined)
-        fp["cloze_ai_wk"] = "; ".join(ai["weak"])
-        fp["cloze_ai_st"] = "; ".join(ai["strong"])
-        st.rerun()
+    if not cloze_available():
+        # typed fallback: no client-side Submit, so grade from a button
+        if comp_state:
+            fp["_fills"] = comp_state.get("fills", fills)
+        st.button("Submit", type="primary", key=f"submit_{tag}",
+                  on_click=_submit_fallback_cloze, args=(key,))
 
     # If graded, draw page border and show review box + rating + wk box
     if fp["correct_flags"] is not None:
@@ -450,73 +597,57 @@ def _stage_cloze(is_specific: bool, subject: str, dotpoint: str):
         st.markdown('<div class="cloze-card">', unsafe_allow_html=True)
         st.subheader(f"Cloze score: {fp['cloze_score']}")
         # If we are on fallback typed mode, also show per-blank breakdown:
-        if _get_component() is None:
+        if not cloze_available():
             _render_fallback_review(ans, fp["_fills"])
         st.markdown('</div>', unsafe_allow_html=True)
 
         # Rating + AI weaknesses/strengths combined (same screen)
         st.markdown('<div class="weak-box">', unsafe_allow_html=True)
         fp["cloze_rating"] = st.slider("Rate your understanding (0–10)", 0, 10, 7,
-                                       key=f"rate_cloze_{'spec' if is_specific else 'gen'}")
-        colA, colB = st.columns(2)
-        with colA:
-            wk_edit = st.text_area("AI Weaknesses (edit as needed)",
-                                   value=fp["cloze_ai_wk"], key=f"wk_edit_{'spec' if is_specific else 'gen'}",
-                                   height=120)
-        with colB:
-            st_edit = st.text_area("AI Strengths (edit as needed)",
-                                   value=fp["cloze_ai_st"], key=f"st_edit_{'spec' if is_specific else 'gen'}",
-                                   height=120)
+                                       key=f"rate_cloze_{tag}")
+        # the boxes' value only seeds them, so they wait for the analysis
+        ai_ready = _collect_weak_strengths("cloze")
+        if ai_ready:
+            colA, colB = st.columns(2)
+            with colA:
+                st.text_area("AI Weaknesses (edit as needed)",
+                             value=fp["cloze_ai_wk"], key=f"wk_edit_{tag}",
+                             height=120)
+            with colB:
+                st.text_area("AI Strengths (edit as needed)",
+                             value=fp["cloze_ai_st"], key=f"st_edit_{tag}",
+                             height=120)
+        else:
+            st.caption("AI is reading your answers…")
+            jobs.poll("cloze")
         st.markdown('</div>', unsafe_allow_html=True)
 
         # Branching buttons
         c1, c2 = st.columns(2)
         with c1:
-            if st.button("🔎 Focus this (specifics first)" if not is_specific else "Continue specifics",
-                         type="primary", use_container_width=True, key=f"focus_{'spec' if is_specific else 'gen'}"):
-                st.session_state._fp["ratings"].append({
-                    "stage": f"cloze_{'spec' if is_specific else 'gen'}",
-                    "score": fp["cloze_rating"],
-                    "raw": fp["cloze_score"],
-                })
-                if not is_specific:
-                    # Start specifics based on weakness box
-                    specs = [w.strip() for w in (wk_edit or "").split(";") if w.strip()]
-                    fp["spec_queue"] = specs[:]
-                    fp["cur_specific"] = fp["spec_queue"].pop(0) if fp["spec_queue"] else None
-                    fp["follow_qs"] = _followup_questions_for(fp["cur_specific"] or (fp["cur_general"] or "this topic"))
-                    fp["follow_idx"] = 0
-                    # reset cloze scratch for specific later
-                    fp.update({"current_cloze": None, "_segs": None, "_ans": None, "_bank": None, "_fills": None, "correct_flags": None})
-                    if fp["cur_specific"]:
-                        fp["stage"] = "fp_specific_q"
-                    else:
-                        # no specific → move on to more FP or next general
-                        fp["stage"] = "fp_more"
-                else:
-                    # Continue specifics if queue remains; else move on
-                    if fp["spec_queue"]:
-                        fp["cur_specific"] = fp["spec_queue"].pop(0)
-                        fp["follow_qs"] = _followup_questions_for(fp["cur_specific"])
-                        fp["follow_idx"] = 0
-                        fp.update({"current_cloze": None, "_segs": None, "_ans": None, "_bank": None, "_fills": None, "correct_flags": None})
-                        fp["stage"] = "fp_specific_q"
-                    else:
-                        fp["stage"] = "fp_more"
-                st.rerun()
+            st.button("🔎 Focus this (specifics first)" if not is_specific else "Continue specifics",
+                      type="primary", use_container_width=True, key=f"focus_{tag}",
+                      on_click=_cloze_next, args=(is_specific, True), disabled=not ai_ready)
         with c2:
-            if st.button("➡️ Move on", use_container_width=True, key=f"move_{'spec' if is_specific else 'gen'}"):
-                st.session_state._fp["ratings"].append({
-                    "stage": f"cloze_{'spec' if is_specific else 'gen'}",
-                    "score": fp["cloze_rating"],
-                    "raw": fp["cloze_score"],
-                })
-                if not is_specific:
-                    # Skip specifics; next general or finish
-                    fp["stage"] = "fp_more"
-                else:
-                    fp["stage"] = "fp_more"
-                st.rerun()
+            st.button("➡️ Move on", use_container_width=True, key=f"move_{tag}",
+                      on_click=_cloze_next, args=(is_specific, False), disabled=not ai_ready)
+
+def _start_specific_cloze():
+    st.session_state._fp.update({
+        "current_cloze": None, "cloze_specificity": 1,
+        "_segs": None, "_ans": None, "_bank": None, "_fills": None,
+        "correct_flags": None,
+        "stage": "cloze_specific",
+    })
+
+def _spec_next(idx: int):
+    fp = st.session_state._fp
+    r = st.session_state.get(f"spec_q_rate_{idx}", 7)
+    fp["ratings"].append({"stage":"fp_specific_q", "q_index": idx, "score": r})
+    fp["follow_idx"] = idx + 1
+    if fp["follow_idx"] >= len(fp.get("follow_qs", [])):
+        # After finishing follow-ups, do a specific cloze
+        _start_specific_cloze()
 
 def _stage_fp_specific_question(s, m, iq, dotpoint):
     """One question at a time; inline model answer + rating on submit."""
@@ -526,77 +657,100 @@ def _stage_fp_specific_question(s, m, iq, dotpoint):
     qlist = fp.get("follow_qs", [])
     idx = fp.get("follow_idx", 0)
     if idx >= len(qlist):
-        # After finishing follow-ups, do a specific cloze
-        fp.update({
-            "current_cloze": None, "cloze_specificity": 1,
-            "_segs": None, "_ans": None, "_bank": None, "_fills": None,
-            "correct_flags": None
-        })
-        fp["stage"] = "cloze_specific"
-        st.rerun()
-        return
+        _start_specific_cloze()
+        return _stage_cloze(is_specific=True, subject=s, dotpoint=dotpoint)
 
     st.markdown(f"**Specific FP:** _{cur_gen} → {cur_spec}_")
     st.write(qlist[idx])  # question text (not a textbox)
 
     with st.form(key=f"fp_spec_q_{idx}"):
-        ans = st.text_area("Your answer", height=160, key=f"spec_q_ans_{idx}")
-        submitted = st.form_submit_button("Submit", type="primary")
+        st.text_area("Your answer", height=160, key=f"spec_q_ans_{idx}")
+        st.form_submit_button("Submit", type="primary",
+                              on_click=lambda: st.session_state._fp.update({"spec_answered": idx}))
 
-    if submitted:
+    if fp["spec_answered"] == idx:
         # Inline model answer + rating on the same page
-        st.markdown(_model_answer(dotpoint, s, mode="specific"), unsafe_allow_html=True)
-        r = st.slider("Rate this answer (0–10)", 0, 10, 7, key=f"spec_q_rate_{idx}")
-        if st.button("Next", type="primary"):
-            fp["ratings"].append({"stage":"fp_specific_q", "q_index": idx, "score": r})
-            fp["follow_idx"] = idx + 1
-            st.rerun()
-        return
+        _render_model_answer(dotpoint, s, qlist[idx], mode="specific")
+        st.slider("Rate this answer (0–10)", 0, 10, 7, key=f"spec_q_rate_{idx}")
+        st.button("Next", type="primary", key=f"spec_q_next_{idx}", on_click=_spec_next, args=(idx,))
 
-def _stage_fp_more():
+def _submit_fp_more():
     fp = st.session_state._fp
+    fp["ratings"].append({"stage":"fp_more", "score": st.session_state.get("more_rate", 8)})
+    # Next general in list?
+    if fp["general_list"] and fp["general_idx"] < len(fp["general_list"]) - 1:
+        fp["general_idx"] += 1
+        fp["cur_general"] = fp["general_list"][fp["general_idx"]]
+        fp.update({
+            "spec_queue": [], "cur_specific": None,
+            "follow_qs": [], "follow_idx": 0, "spec_answered": None,
+            "current_cloze": None, "_segs": None, "_ans": None, "_bank": None, "_fills": None,
+            "correct_flags": None
+        })
+        fp["stage"] = "cloze_general"
+    else:
+        fp["stage"] = "decision"
+
+def _stage_fp_more():
     st.markdown("**Quick consolidation (optional)**")
     with st.form(key="fp_more_form"):
         st.text_area("Write a one-minute explanation for a friend.", height=120)
-        rate = st.slider("Rate your overall understanding (0–10)", 0, 10, 8, key="more_rate")
-        submitted = st.form_submit_button("Continue", type="primary")
-    if submitted:
-        fp["ratings"].append({"stage":"fp_more", "score": rate})
-        # Next general in list?
-        if fp["general_list"] and fp["general_idx"] < len(fp["general_list"]) - 1:
-            fp["general_idx"] += 1
-            fp["cur_general"] = fp["general_list"][fp["general_idx"]]
-            fp.update({
-                "spec_queue": [], "cur_specific": None,
-                "follow_qs": [], "follow_idx": 0,
-                "current_cloze": None, "_segs": None, "_ans": None, "_bank": None, "_fills": None,
-                "correct_flags": None
-            })
-            fp["stage"] = "cloze_general"
-        else:
-            fp["stage"] = "decision"
-        st.rerun()
+        st.slider("Rate your overall understanding (0–10)", 0, 10, 8, key="more_rate")
+        st.form_submit_button("Continue", type="primary", on_click=_submit_fp_more)
 
-def _stage_decision():
+def _next_dotpoint():
     fp = st.session_state._fp
+    if fp["q_idx"] < len(fp["queue"]) - 1:
+        fp["q_idx"] += 1
+        _reset_for_current_dp()
+        safe_rerun()
+    else:
+        get_go()("home")
+
+def _stage_decision():
     st.success("Weakness cycle complete for this dotpoint.")
     c1, c2, c3 = st.columns(3)
     with c1:
-        if st.button("Next dotpoint", use_container_width=True):
-            if fp["q_idx"] < len(fp["queue"]) - 1:
-                fp["q_idx"] += 1
-                _reset_for_current_dp()
-            else:
-                st.success("All selected dotpoints done.")
-                st.session_state["route"] = "home"
-            st.rerun()
+        st.button("Next dotpoint", use_container_width=True, on_click=_next_dotpoint)
     with c2:
         if st.button("Exam mode (placeholder)", use_container_width=True):
             st.info("HSC-style questions + sample answers (to come).")
     with c3:
-        if st.button("Quit to Home", use_container_width=True):
-            st.session_state["route"] = "home"
-            st.rerun()
+        st.button("Quit to Home", use_container_width=True, on_click=get_go(), args=("home",))
+    _related_dotpoints()
+
+def _practise_next(item: Tuple[str, str, str, str]):
+    """Move ``item`` right after the current dotpoint and advance to it."""
+    fp = st.session_state._fp
+    queue = fp["queue"]
+    later = queue[fp["q_idx"] + 1:]
+    if item in later:
+        later.remove(item)
+    queue[fp["q_idx"] + 1:] = [item] + later
+    fp["q_idx"] += 1
+    _reset_for_current_dp()
+    safe_rerun()
+
+def _related_dotpoints(n: int = 5):
+    """Offer the nearest neighbours of the current dotpoint from the kNN graph."""
+    idx = st.session_state.get("_IDX")
+    cur = _current_dp()
+    if idx is None or cur is None:
+        return
+    graph = get_related_graph()  # None until built offline (python -m data.related)
+    related = graph.related(idx, idx.dotpoint_id(cur), n=n) if graph is not None else []
+    if not related:
+        return
+    st.markdown('<div class="section-title">Related dotpoints</div>', unsafe_allow_html=True)
+    for did, sim in related:
+        s, m, iq, dp = idx.items[did]
+        c1, c2 = st.columns([5, 1], vertical_alignment="center")
+        with c1:
+            st.caption(f"{s} → {m} → {iq} · similarity {sim:.2f}")
+            st.write(dp)
+        with c2:
+            st.button("Practise next", key=f"fp_related_{did}", use_container_width=True,
+                      on_click=_practise_next, args=(idx.items[did],))
 
 # ================= Follow-up generator =================
 def _followup_questions_for(weakness: str) -> List[str]:
@@ -1,183 +1,30 @@
-"use strict";(()=>{var AI=Object.create;var $_=Object.defineProperty;var FI=Object.getOwnPropertyDescriptor;var OI=Object.getOwnPropertyNames;var MI=Object.getPrototypeOf,xI=Object.prototype.hasOwnProperty;var b=(t,e)=>()=>(e||t((e={exports:{}}).exports,e),e.exports);var EI=(t,e,r,n)=>{if(e&&typeof e=="object"||typeof e=="function")for(let i of OI(e))!xI.call(t,i)&&i!==r&&$_(t,i,{get:()=>e[i],enumerable:!(n=FI(e,i))||n.enumerable});return t};var Ht=(t,e,r)=>(r=t!=null?AI(MI(t)):{},EI(e||!t||!t.__esModule?$_(r,"default",{value:t,enumerable:!0}):r,t));var r0=b(Z=>{"use strict";var Gs=Symbol.for("react.element"),UI=Symbol.for("react.portal"),VI=Symbol.for("react.fragment"),NI=Symbol.for("react.strict_mode"),kI=Symbol.for("react.profiler"),LI=Symbol.for("react.provider"),CI=Symbol.for("react.context"),RI=Symbol.for("react.forward_ref"),PI=Symbol.for("react.suspense"),jI=Symbol.for("react.memo"),zI=Symbol.for("react.lazy"),W_=Symbol.iterator;function qI(t){return t===null||typeof t!="object"?null:(t=W_&&t[W_]||t["@@iterator"],typeof t=="function"?t:null)}var K_={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Q_=Object.assign,J_={};function Li(t,e,r){this.props=t,this.context=e,this.refs=J_,this.updater=r||K_}Li.prototype.isReactComponent={};Li.prototype.setState=function(t,e){if(typeof t!="object"&&typeof t!="function"&&t!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,t,e,"setState")};Li.prototype.forceUpdate=function(t){this.updater.enqueueForceUpdate(this,t,"forceUpdate")};function G_(){}G_.prototype=Li.prototype;function nf(t,e,r){this.props=t,this.context=e,this.refs=J_,this.updater=r||K_}var sf=nf.prototype=new G_;sf.constructor=nf;Q_(sf,Li.prototype);sf.isPureReactComponent=!0;var H_=Array.isArray,Z_=Object.prototype.hasOwnProperty,of={current:null},X_={key:!0,ref:!0,__self:!0,__source:!0};function e0(t,e,r){var n,i={},s=null,a=null;if(e!=null)for(n in e.ref!==void 0&&(a=e.ref),e.key!==void 0&&(s=""+e.key),e)Z_.call(e,n)&&!X_.hasOwnProperty(n)&&(i[n]=e[n]);var l=arguments.length-2;if(l===1)i.children=r;else if(1<l){for(var c=Array(l),o=0;o<l;o++)c[o]=arguments[o+2];i.children=c}if(t&&t.defaultProps)for(n in l=t.defaultProps,l)i[n]===void 0&&(i[n]=l[n]);return{$$typeof:Gs,type:t,key:s,ref:a,props:i,_owner:of.current}}function $I(t,e){return{$$typeof:Gs,type:t.type,key:e,ref:t.ref,props:t.props,_owner:t._owner}}function af(t){return typeof t=="object"&&t!==null&&t.$$typeof===Gs}function WI(t){var e={"=":"=0",":":"=2"};return"$"+t.replace(/[=:]/g,function(r){return e[r]})}var Y_=/\/+/g;function rf(t,e){return typeof t=="object"&&t!==null&&t.key!=null?WI(""+t.key):e.toString(36)}function vl(t,e,r,n,i){var s=typeof t;(s==="undefined"||s==="boolean")&&(t=null);var a=!1;if(t===null)a=!0;else switch(s){case"string":case"number":a=!0;break;case"object":switch(t.$$typeof){case Gs:case UI:a=!0}}if(a)return a=t,i=i(a),t=n===""?"."+rf(a,0):n,H_(i)?(r="",t!=null&&(r=t.replace(Y_,"$&/")+"/"),vl(i,e,r,"",function(o){return o})):i!=null&&(af(i)&&(i=$I(i,r+(!i.key||a&&a.key===i.key?"":(""+i.key).replace(Y_,"$&/")+"/")+t)),e.push(i)),1;if(a=0,n=n===""?".":n+":",H_(t))for(var l=0;l<t.length;l++){s=t[l];var c=n+rf(s,l);a+=vl(s,e,r,c,i)}else if(c=qI(t),typeof c=="function")for(t=c.call(t),l=0;!(s=t.next()).done;)s=s.value,c=n+rf(s,l++),a+=vl(s,e,r,c,i);else if(s==="object")throw e=String(t),Error("Objects are not valid as a React child (found: "+(e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e)+"). If you meant to render a collection of children, use an array instead.");return a}function gl(t,e,r){if(t==null)return t;var n=[],i=0;return vl(t,n,"","",function(s){return e.call(r,s,i++)}),n}function HI(t){if(t._status===-1){var e=t._result;e=e(),e.then(function(r){(t._status===0||t._status===-1)&&(t._status=1,t._result=r)},function(r){(t._status===0||t._status===-1)&&(t._status=2,t._result=r)}),t._status===-1&&(t._status=0,t._result=e)}if(t._status===1)return t._result.default;throw t._result}var ot={current:null},_l={transition:null},YI={ReactCurrentDispatcher:ot,ReactCurrentBatchConfig:_l,ReactCurrentOwner:of};function t0(){throw Error("act(...) is not supported in production builds of React.")}Z.Children={map:gl,forEach:function(t,e,r){gl(t,function(){e.apply(this,arguments)},r)},count:function(t){var e=0;return gl(t,function(){e++}),e},toArray:function(t){return gl(t,function(e){return e})||[]},only:function(t){if(!af(t))throw Error("React.Children.only expected to receive a single React element child.");return t}};Z.Component=Li;Z.Fragment=VI;Z.Profiler=kI;Z.PureComponent=nf;Z.StrictMode=NI;Z.Suspense=PI;Z.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=YI;Z.act=t0;Z.cloneElement=function(t,e,r){if(t==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+t+".");var n=Q_({},t.props),i=t.key,s=t.ref,a=t._owner;if(e!=null){if(e.ref!==void 0&&(s=e.ref,a=of.current),e.key!==void 0&&(i=""+e.key),t.type&&t.type.defaultProps)var l=t.type.defaultProps;for(c in e)Z_.call(e,c)&&!X_.hasOwnProperty(c)&&(n[c]=e[c]===void 0&&l!==void 0?l[c]:e[c])}var c=arguments.length-2;if(c===1)n.children=r;else if(1<c){l=Array(c);for(var o=0;o<c;o++)l[o]=arguments[o+2];n.children=l}return{$$typeof:Gs,type:t.type,key:i,ref:s,props:n,_owner:a}};Z.createContext=function(t){return t={$$typeof:CI,_currentValue:t,_currentValue2:t,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},t.Provider={$$typeof:LI,_context:t},t.Consumer=t};Z.createElement=e0;Z.createFactory=function(t){var e=e0.bind(null,t);return e.type=t,e};Z.createRef=function(){return{current:null}};Z.forwardRef=function(t){return{$$typeof:RI,render:t}};Z.isValidElement=af;Z.lazy=function(t){return{$$typeof:zI,_payload:{_status:-1,_result:t},_init:HI}};Z.memo=function(t,e){return{$$typeof:jI,type:t,compare:e===void 0?null:e}};Z.startTransition=function(t){var e=_l.transition;_l.transition={};try{t()}finally{_l.transition=e}};Z.unstable_act=t0;Z.useCallback=function(t,e){return ot.current.useCallback(t,e)};Z.useContext=function(t){return ot.current.useContext(t)};Z.useDebugValue=function(){};Z.useDeferredValue=function(t){return ot.current.useDeferredValue(t)};Z.useEffect=function(t,e){return ot.current.useEffect(t,e)};Z.useId=function(){return ot.current.useId()};Z.useImperativeHandle=function(t,e,r){return ot.current.useImperativeHandle(t,e,r)};Z.useInsertionEffect=function(t,e){return ot.current.useInsertionEffect(t,e)};Z.useLayoutEffect=function(t,e){return ot.current.useLayoutEffect(t,e)};Z.useMemo=function(t,e){return ot.current.useMemo(t,e)};Z.useReducer=function(t,e,r){return ot.current.useReducer(t,e,r)};Z.useRef=function(t){return ot.current.useRef(t)};Z.useState=function(t){return ot.current.useState(t)};Z.useSyncExternalStore=function(t,e,r){return ot.current.useSyncExternalStore(t,e,r)};Z.useTransition=function(){return ot.current.useTransition()};Z.version="18.3.1"});var Zs=b((PN,n0)=>{"use strict";n0.exports=r0()});var h0=b(ue=>{"use strict";function df(t,e){var r=t.length;t.push(e);e:for(;0<r;){var n=r-1>>>1,i=t[n];if(0<wl(i,e))t[n]=e,t[r]=i,r=n;else break e}}function Yt(t){return t.length===0?null:t[0]}function Sl(t){if(t.length===0)return null;var e=t[0],r=t.pop();if(r!==e){t[0]=r;e:for(var n=0,i=t.length,s=i>>>1;n<s;){var a=2*(n+1)-1,l=t[a],c=a+1,o=t[c];if(0>wl(l,r))c<i&&0>wl(o,l)?(t[n]=o,t[c]=r,n=c):(t[n]=l,t[a]=r,n=a);else if(c<i&&0>wl(o,r))t[n]=o,t[c]=r,n=c;else break e}}return e}function wl(t,e){var r=t.sortIndex-e.sortIndex;return r!==0?r:t.id-e.id}typeof performance=="object"&&typeof performance.now=="function"?(i0=performance,ue.unstable_now=function(){return i0.now()}):(lf=Date,s0=lf.now(),ue.unstable_now=function(){return lf.now()-s0});var i0,lf,s0,gr=[],on=[],KI=1,Nt=null,et=3,Tl=!1,Wn=!1,eo=!1,l0=typeof setTimeout=="function"?setTimeout:null,u0=typeof clearTimeout=="function"?clearTimeout:null,o0=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function ff(t){for(var e=Yt(on);e!==null;){if(e.callback===null)Sl(on);else if(e.startTime<=t)Sl(on),e.sortIndex=e.expirationTime,df(gr,e);else break;e=Yt(on)}}function hf(t){if(eo=!1,ff(t),!Wn)if(Yt(gr)!==null)Wn=!0,yf(pf);else{var e=Yt(on);e!==null&&mf(hf,e.startTime-t)}}function pf(t,e){Wn=!1,eo&&(eo=!1,u0(to),to=-1),Tl=!0;var r=et;try{for(ff(e),Nt=Yt(gr);Nt!==null&&(!(Nt.expirationTime>e)||t&&!f0());){var n=Nt.callback;if(typeof n=="function"){Nt.callback=null,et=Nt.priorityLevel;var i=n(Nt.expirationTime<=e);e=ue.unstable_now(),typeof i=="function"?Nt.callback=i:Nt===Yt(gr)&&Sl(gr),ff(e)}else Sl(gr);Nt=Yt(gr)}if(Nt!==null)var s=!0;else{var a=Yt(on);a!==null&&mf(hf,a.startTime-e),s=!1}return s}finally{Nt=null,et=r,Tl=!1}}var Bl=!1,bl=null,to=-1,c0=5,d0=-1;function f0(){return!(ue.unstable_now()-d0<c0)}function uf(){if(bl!==null){var t=ue.unstable_now();d0=t;var e=!0;try{e=bl(!0,t)}finally{e?Xs():(Bl=!1,bl=null)}}else Bl=!1}var Xs;typeof o0=="function"?Xs=function(){o0(uf)}:typeof MessageChannel<"u"?(cf=new MessageChannel,a0=cf.port2,cf.port1.onmessage=uf,Xs=function(){a0.postMessage(null)}):Xs=function(){l0(uf,0)};var cf,a0;function yf(t){bl=t,Bl||(Bl=!0,Xs())}function mf(t,e){to=l0(function(){t(ue.unstable_now())},e)}ue.unstable_IdlePriority=5;ue.unstable_ImmediatePriority=1;ue.unstable_LowPriority=4;ue.unstable_NormalPriority=3;ue.unstable_Profiling=null;ue.unstable_UserBlockingPriority=2;ue.unstable_cancelCallback=function(t){t.callback=null};ue.unstable_continueExecution=function(){Wn||Tl||(Wn=!0,yf(pf))};ue.unstable_forceFrameRate=function(t){0>t||125<t?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):c0=0<t?Math.floor(1e3/t):5};ue.unstable_getCurrentPriorityLevel=function(){return et};ue.unstable_getFirstCallbackNode=function(){return Yt(gr)};ue.unstable_next=function(t){switch(et){case 1:case 2:case 3:var e=3;break;default:e=et}var r=et;et=e;try{return t()}finally{et=r}};ue.unstable_pauseExecution=function(){};ue.unstable_requestPaint=function(){};ue.unstable_runWithPriority=function(t,e){switch(t){case 1:case 2:case 3:case 4:case 5:break;default:t=3}var r=et;et=t;try{return e()}finally{et=r}};ue.unstable_scheduleCallback=function(t,e,r){var n=ue.unstable_now();switch(typeof r=="object"&&r!==null?(r=r.delay,r=typeof r=="number"&&0<r?n+r:n):r=n,t){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return i=r+i,t={id:KI++,callback:e,priorityLevel:t,startTime:r,expirationTime:i,sortIndex:-1},r>n?(t.sortIndex=r,df(on,t),Yt(gr)===null&&t===Yt(on)&&(eo?(u0(to),to=-1):eo=!0,mf(hf,r-n))):(t.sortIndex=i,df(gr,t),Wn||Tl||(Wn=!0,yf(pf))),t};ue.unstable_shouldYield=f0;ue.unstable_wrapCallback=function(t){var e=et;return function(){var r=et;et=e;try{return t.apply(this,arguments)}finally{et=r}}}});var y0=b((zN,p0)=>{"use strict";p0.exports=h0()});var _b=b(At=>{"use strict";var QI=Zs(),It=y0();function B(t){for(var e="https://reactjs.org/docs/error-decoder.html?invariant="+t,r=1;r<arguments.length;r++)e+="&args[]="+encodeURIComponent(arguments[r]);return"Minified React error #"+t+"; visit "+e+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var S1=new Set,Bo={};function ii(t,e){is(t,e),is(t+"Capture",e)}function is(t,e){for(Bo[t]=e,t=0;t<e.length;t++)S1.add(e[t])}var Pr=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Rf=Object.prototype.hasOwnProperty,JI=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,m0={},g0={};function GI(t){return Rf.call(g0,t)?!0:Rf.call(m0,t)?!1:JI.test(t)?g0[t]=!0:(m0[t]=!0,!1)}function ZI(t,e,r,n){if(r!==null&&r.type===0)return!1;switch(typeof e){case"function":case"symbol":return!0;case"boolean":return n?!1:r!==null?!r.acceptsBooleans:(t=t.toLowerCase().slice(0,5),t!=="data-"&&t!=="aria-");default:return!1}}function XI(t,e,r,n){if(e===null||typeof e>"u"||ZI(t,e,r,n))return!0;if(n)return!1;if(r!==null)switch(r.type){case 3:return!e;case 4:return e===!1;case 5:return isNaN(e);case 6:return isNaN(e)||1>e}return!1}function ut(t,e,r,n,i,s,a){this.acceptsBooleans=e===2||e===3||e===4,this.attributeName=n,this.attributeNamespace=i,this.mustUseProperty=r,this.propertyName=t,this.type=e,this.sanitizeURL=s,this.removeEmptyString=a}var Qe={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(t){Qe[t]=new ut(t,0,!1,t,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(t){var e=t[0];Qe[e]=new ut(e,1,!1,t[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(t){Qe[t]=new ut(t,2,!1,t.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(t){Qe[t]=new ut(t,2,!1,t,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(t){Qe[t]=new ut(t,3,!1,t.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(t){Qe[t]=new ut(t,3,!0,t,null,!1,!1)});["capture","download"].forEach(function(t){Qe[t]=new ut(t,4,!1,t,null,!1,!1)});["cols","rows","size","span"].forEach(function(t){Qe[t]=new ut(t,6,!1,t,null,!1,!1)});["rowSpan","start"].forEach(function(t){Qe[t]=new ut(t,5,!1,t.toLowerCase(),null,!1,!1)});var xh=/[\-:]([a-z])/g;function Eh(t){return t[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(t){var e=t.replace(xh,Eh);Qe[e]=new ut(e,1,!1,t,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(t){var e=t.replace(xh,Eh);Qe[e]=new ut(e,1,!1,t,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(t){var e=t.replace(xh,Eh);Qe[e]=new ut(e,1,!1,t,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(t){Qe[t]=new ut(t,1,!1,t.toLowerCase(),null,!1,!1)});Qe.xlinkHref=new ut("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(t){Qe[t]=new ut(t,1,!1,t.toLowerCase(),null,!0,!0)});function Uh(t,e,r,n){var i=Qe.hasOwnProperty(e)?Qe[e]:null;(i!==null?i.type!==0:n||!(2<e.length)||e[0]!=="o"&&e[0]!=="O"||e[1]!=="n"&&e[1]!=="N")&&(XI(e,r,i,n)&&(r=null),n||i===null?GI(e)&&(r===null?t.removeAttribute(e):t.setAttribute(e,""+r)):i.mustUseProperty?t[i.propertyName]=r===null?i.type===3?!1:"":r:(e=i.attributeName,n=i.attributeNamespace,r===null?t.removeAttribute(e):(i=i.type,r=i===3||i===4&&r===!0?"":""+r,n?t.setAttributeNS(n,e,r):t.setAttribute(e,r))))}var $r=QI.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,Il=Symbol.for("react.element"),Pi=Symbol.for("react.portal"),ji=Symbol.for("react.fragment"),Vh=Symbol.for("react.strict_mode"),Pf=Symbol.for("react.profiler"),T1=Symbol.for("react.provider"),B1=Symbol.for("react.context"),Nh=Symbol.for("react.forward_ref"),jf=Symbol.for("react.suspense"),zf=Symbol.for("react.suspense_list"),kh=Symbol.for("react.memo"),ln=Symbol.for("react.lazy");Symbol.for("react.scope");Symbol.for("react.debug_trace_mode");var I1=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden");Symbol.for("react.cache");Symbol.for("react.tracing_marker");var v0=Symbol.iterator;function ro(t){return t===null||typeof t!="object"?null:(t=v0&&t[v0]||t["@@iterator"],typeof t=="function"?t:null)}var Se=Object.assign,gf;function co(t){if(gf===void 0)try{throw Error()}catch(r){var e=r.stack.trim().match(/\n( *(at )?)/);gf=e&&e[1]||""}return`
-`+gf+t}var vf=!1;function _f(t,e){if(!t||vf)return"";vf=!0;var r=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(e)if(e=function(){throw Error()},Object.defineProperty(e.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(e,[])}catch(o){var n=o}Reflect.construct(t,[],e)}else{try{e.call()}catch(o){n=o}t.call(e.prototype)}else{try{throw Error()}catch(o){n=o}t()}}catch(o){if(o&&n&&typeof o.stack=="string"){for(var i=o.stack.split(`
+(()=>{var kw=Object.create;var{getPrototypeOf:Nw,defineProperty:lf,getOwnPropertyNames:Mw}=Object;var um=Object.prototype.hasOwnProperty;function Lw(e){return this[e]}var Uw,Cw,Vr=(e,t,r)=>{var n=e!=null&&typeof e==="object";if(n){var i=t?Uw??=new WeakMap:Cw??=new WeakMap,s=i.get(e);if(s)return s}r=e!=null?kw(Nw(e)):{};let a=t||!e||!e.__esModule||!um.call(e,"default")?lf(r,"default",{value:e,enumerable:!0}):r;if(e&&typeof e==="object"||typeof e==="function"){for(let l of Mw(e))if(!um.call(a,l))lf(a,l,{get:Lw.bind(e,l),enumerable:!0})}if(n)i.set(e,a);return a};var it=(e,t)=>()=>(t||e((t={exports:{}}).exports,t),t.exports);var Rw=(e)=>e;function Pw(e,t){this[e]=Rw.bind(null,t)}var ts=(e,t)=>{for(var r in t)lf(e,r,{get:t[r],enumerable:!0,configurable:!0,set:Pw.bind(t,r)})};var bm=it(function(X){var ua=Symbol.for("react.element"),zw=Symbol.for("react.portal"),Vw=Symbol.for("react.fragment"),jw=Symbol.for("react.strict_mode"),$w=Symbol.for("react.profiler"),Ww=Symbol.for("react.provider"),Hw=Symbol.for("react.context"),Yw=Symbol.for("react.forward_ref"),Kw=Symbol.for("react.suspense"),Qw=Symbol.for("react.memo"),Jw=Symbol.for("react.lazy"),cm=Symbol.iterator;function Zw(e){if(e===null||typeof e!=="object")return null;return e=cm&&e[cm]||e["@@iterator"],typeof e==="function"?e:null}var hm={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},pm=Object.assign,mm={};function rs(e,t,r){this.props=e,this.context=t,this.refs=mm,this.updater=r||hm}rs.prototype.isReactComponent={};rs.prototype.setState=function(e,t){if(typeof e!=="object"&&typeof e!=="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};rs.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function ym(){}ym.prototype=rs.prototype;function cf(e,t,r){this.props=e,this.context=t,this.refs=mm,this.updater=r||hm}var ff=cf.prototype=new ym;ff.constructor=cf;pm(ff,rs.prototype);ff.isPureReactComponent=!0;var fm=Array.isArray,gm=Object.prototype.hasOwnProperty,df={current:null},vm={key:!0,ref:!0,__self:!0,__source:!0};function _m(e,t,r){var n,i={},s=null,a=null;if(t!=null)for(n in t.ref!==void 0&&(a=t.ref),t.key!==void 0&&(s=""+t.key),t)gm.call(t,n)&&!vm.hasOwnProperty(n)&&(i[n]=t[n]);var l=arguments.length-2;if(l===1)i.children=r;else if(1<l){for(var o=Array(l),u=0;u<l;u++)o[u]=arguments[u+2];i.children=o}if(e&&e.defaultProps)for(n in l=e.defaultProps,l)i[n]===void 0&&(i[n]=l[n]);return{$$typeof:ua,type:e,key:s,ref:a,props:i,_owner:df.current}}function Xw(e,t){return{$$typeof:ua,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function hf(e){return typeof e==="object"&&e!==null&&e.$$typeof===ua}function qw(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(r){return t[r]})}var dm=/\/+/g;function uf(e,t){return typeof e==="object"&&e!==null&&e.key!=null?qw(""+e.key):t.toString(36)}function $l(e,t,r,n,i){var s=typeof e;if(s==="undefined"||s==="boolean")e=null;var a=!1;if(e===null)a=!0;else switch(s){case"string":case"number":a=!0;break;case"object":switch(e.$$typeof){case ua:case zw:a=!0}}if(a)return a=e,i=i(a),e=n===""?"."+uf(a,0):n,fm(i)?(r="",e!=null&&(r=e.replace(dm,"$&/")+"/"),$l(i,t,r,"",function(u){return u})):i!=null&&(hf(i)&&(i=Xw(i,r+(!i.key||a&&a.key===i.key?"":(""+i.key).replace(dm,"$&/")+"/")+e)),t.push(i)),1;if(a=0,n=n===""?".":n+":",fm(e))for(var l=0;l<e.length;l++){s=e[l];var o=n+uf(s,l);a+=$l(s,t,r,o,i)}else if(o=Zw(e),typeof o==="function")for(e=o.call(e),l=0;!(s=e.next()).done;)s=s.value,o=n+uf(s,l++),a+=$l(s,t,r,o,i);else if(s==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return a}function jl(e,t,r){if(e==null)return e;var n=[],i=0;return $l(e,n,"","",function(s){return t.call(r,s,i++)}),n}function Gw(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(r){if(e._status===0||e._status===-1)e._status=1,e._result=r},function(r){if(e._status===0||e._status===-1)e._status=2,e._result=r}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var st={current:null},Wl={transition:null},e1={ReactCurrentDispatcher:st,ReactCurrentBatchConfig:Wl,ReactCurrentOwner:df};function wm(){throw Error("act(...) is not supported in production builds of React.")}X.Children={map:jl,forEach:function(e,t,r){jl(e,function(){t.apply(this,arguments)},r)},count:function(e){var t=0;return jl(e,function(){t++}),t},toArray:function(e){return jl(e,function(t){return t})||[]},only:function(e){if(!hf(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};X.Component=rs;X.Fragment=Vw;X.Profiler=$w;X.PureComponent=cf;X.StrictMode=jw;X.Suspense=Kw;X.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=e1;X.act=wm;X.cloneElement=function(e,t,r){if(e===null||e===void 0)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var n=pm({},e.props),{key:i,ref:s,_owner:a}=e;if(t!=null){if(t.ref!==void 0&&(s=t.ref,a=df.current),t.key!==void 0&&(i=""+t.key),e.type&&e.type.defaultProps)var l=e.type.defaultProps;for(o in t)gm.call(t,o)&&!vm.hasOwnProperty(o)&&(n[o]=t[o]===void 0&&l!==void 0?l[o]:t[o])}var o=arguments.length-2;if(o===1)n.children=r;else if(1<o){l=Array(o);for(var u=0;u<o;u++)l[u]=arguments[u+2];n.children=l}return{$$typeof:ua,type:e.type,key:i,ref:s,props:n,_owner:a}};X.createContext=function(e){return e={$$typeof:Hw,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:Ww,_context:e},e.Consumer=e};X.createElement=_m;X.createFactory=function(e){var t=_m.bind(null,e);return t.type=e,t};X.createRef=function(){return{current:null}};X.forwardRef=function(e){return{$$typeof:Yw,render:e}};X.isValidElement=hf;X.lazy=function(e){return{$$typeof:Jw,_payload:{_status:-1,_result:e},_init:Gw}};X.memo=function(e,t){return{$$typeof:Qw,type:e,compare:t===void 0?null:t}};X.startTransition=function(e){var t=Wl.transition;Wl.transition={};try{e()}finally{Wl.transition=t}};X.unstable_act=wm;X.useCallback=function(e,t){return st.current.useCallback(e,t)};X.useContext=function(e){return st.current.useContext(e)};X.useDebugValue=function(){};X.useDeferredValue=function(e){return st.current.useDeferredValue(e)};X.useEffect=function(e,t){return st.current.useEffect(e,t)};X.useId=function(){return st.current.useId()};X.useImperativeHandle=function(e,t,r){return st.current.useImperativeHandle(e,t,r)};X.useInsertionEffect=function(e,t){return st.current.useInsertionEffect(e,t)};X.useLayoutEffect=function(e,t){return st.current.useLayoutEffect(e,t)};X.useMemo=function(e,t){return st.current.useMemo(e,t)};X.useReducer=function(e,t,r){return st.current.useReducer(e,t,r)};X.useRef=function(e){return st.current.useRef(e)};X.useState=function(e){return st.current.useState(e)};X.useSyncExternalStore=function(e,t,r){return st.current.useSyncExternalStore(e,t,r)};X.useTransition=function(){return st.current.useTransition()};X.version="18.3.1"});var ca=it(function(t1,Sm){Sm.exports=bm()});var Am=it(function(ce){function mf(e,t){var r=e.length;e.push(t);e:for(;0<r;){var n=r-1>>>1,i=e[n];if(0<Hl(i,t))e[n]=t,e[r]=i,r=n;else break e}}function Xt(e){return e.length===0?null:e[0]}function Jl(e){if(e.length===0)return null;var t=e[0],r=e.pop();if(r!==t){e[0]=r;e:for(var n=0,i=e.length,s=i>>>1;n<s;){var a=2*(n+1)-1,l=e[a],o=a+1,u=e[o];if(0>Hl(l,r))o<i&&0>Hl(u,l)?(e[n]=u,e[o]=r,n=o):(e[n]=l,e[a]=r,n=a);else if(o<i&&0>Hl(u,r))e[n]=u,e[o]=r,n=o;else break e}}return t}function Hl(e,t){var r=e.sortIndex-t.sortIndex;return r!==0?r:e.id-t.id}if(typeof performance==="object"&&typeof performance.now==="function")yf=performance,ce.unstable_now=function(){return yf.now()};else Yl=Date,gf=Yl.now(),ce.unstable_now=function(){return Yl.now()-gf};var yf,Yl,gf,br=[],vn=[],r1=1,Vt=null,Qe=3,Zl=!1,li=!1,da=!1,Bm=typeof setTimeout==="function"?setTimeout:null,Im=typeof clearTimeout==="function"?clearTimeout:null,xm=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function vf(e){for(var t=Xt(vn);t!==null;){if(t.callback===null)Jl(vn);else if(t.startTime<=e)Jl(vn),t.sortIndex=t.expirationTime,mf(br,t);else break;t=Xt(vn)}}function wf(e){if(da=!1,vf(e),!li)if(Xt(br)!==null)li=!0,Sf(bf);else{var t=Xt(vn);t!==null&&xf(wf,t.startTime-e)}}function bf(e,t){li=!1,da&&(da=!1,Im(ha),ha=-1),Zl=!0;var r=Qe;try{vf(t);for(Vt=Xt(br);Vt!==null&&(!(Vt.expirationTime>t)||e&&!Dm());){var n=Vt.callback;if(typeof n==="function"){Vt.callback=null,Qe=Vt.priorityLevel;var i=n(Vt.expirationTime<=t);t=ce.unstable_now(),typeof i==="function"?Vt.callback=i:Vt===Xt(br)&&Jl(br),vf(t)}else Jl(br);Vt=Xt(br)}if(Vt!==null)var s=!0;else{var a=Xt(vn);a!==null&&xf(wf,a.startTime-t),s=!1}return s}finally{Vt=null,Qe=r,Zl=!1}}var Xl=!1,Kl=null,ha=-1,Tm=5,Fm=-1;function Dm(){return ce.unstable_now()-Fm<Tm?!1:!0}function pf(){if(Kl!==null){var e=ce.unstable_now();Fm=e;var t=!0;try{t=Kl(!0,e)}finally{t?fa():(Xl=!1,Kl=null)}}else Xl=!1}var fa;if(typeof xm==="function")fa=function(){xm(pf)};else if(typeof MessageChannel<"u")Ql=new MessageChannel,_f=Ql.port2,Ql.port1.onmessage=pf,fa=function(){_f.postMessage(null)};else fa=function(){Bm(pf,0)};var Ql,_f;function Sf(e){Kl=e,Xl||(Xl=!0,fa())}function xf(e,t){ha=Bm(function(){e(ce.unstable_now())},t)}ce.unstable_IdlePriority=5;ce.unstable_ImmediatePriority=1;ce.unstable_LowPriority=4;ce.unstable_NormalPriority=3;ce.unstable_Profiling=null;ce.unstable_UserBlockingPriority=2;ce.unstable_cancelCallback=function(e){e.callback=null};ce.unstable_continueExecution=function(){li||Zl||(li=!0,Sf(bf))};ce.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Tm=0<e?Math.floor(1000/e):5};ce.unstable_getCurrentPriorityLevel=function(){return Qe};ce.unstable_getFirstCallbackNode=function(){return Xt(br)};ce.unstable_next=function(e){switch(Qe){case 1:case 2:case 3:var t=3;break;default:t=Qe}var r=Qe;Qe=t;try{return e()}finally{Qe=r}};ce.unstable_pauseExecution=function(){};ce.unstable_requestPaint=function(){};ce.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var r=Qe;Qe=e;try{return t()}finally{Qe=r}};ce.unstable_scheduleCallback=function(e,t,r){var n=ce.unstable_now();switch(typeof r==="object"&&r!==null?(r=r.delay,r=typeof r==="number"&&0<r?n+r:n):r=n,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5000}return i=r+i,e={id:r1++,callback:t,priorityLevel:e,startTime:r,expirationTime:i,sortIndex:-1},r>n?(e.sortIndex=r,mf(vn,e),Xt(br)===null&&e===Xt(vn)&&(da?(Im(ha),ha=-1):da=!0,xf(wf,r-n))):(e.sortIndex=i,mf(br,e),li||Zl||(li=!0,Sf(bf))),e};ce.unstable_shouldYield=Dm;ce.unstable_wrapCallback=function(e){var t=Qe;return function(){var r=Qe;Qe=t;try{return e.apply(this,arguments)}finally{Qe=r}}}});var Om=it(function(n1,Em){Em.exports=Am()});var Nv=it(function(It){var i1=ca(),xt=Om();function w(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,r=1;r<arguments.length;r++)t+="&args[]="+encodeURIComponent(arguments[r]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var Uy=new Set,Ra={};function Si(e,t){xs(e,t),xs(e+"Capture",t)}function xs(e,t){Ra[e]=t;for(e=0;e<t.length;e++)Uy.add(t[e])}var Kr=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Hf=Object.prototype.hasOwnProperty,s1=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,km={},Nm={};function o1(e){if(Hf.call(Nm,e))return!0;if(Hf.call(km,e))return!1;if(s1.test(e))return Nm[e]=!0;return km[e]=!0,!1}function a1(e,t,r,n){if(r!==null&&r.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":if(n)return!1;if(r!==null)return!r.acceptsBooleans;return e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-";default:return!1}}function l1(e,t,r,n){if(t===null||typeof t>"u"||a1(e,t,r,n))return!0;if(n)return!1;if(r!==null)switch(r.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function lt(e,t,r,n,i,s,a){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=n,this.attributeNamespace=i,this.mustUseProperty=r,this.propertyName=e,this.type=t,this.sanitizeURL=s,this.removeEmptyString=a}var je={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){je[e]=new lt(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];je[t]=new lt(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){je[e]=new lt(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){je[e]=new lt(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){je[e]=new lt(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){je[e]=new lt(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){je[e]=new lt(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){je[e]=new lt(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){je[e]=new lt(e,5,!1,e.toLowerCase(),null,!1,!1)});var Pd=/[\-:]([a-z])/g;function zd(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(Pd,zd);je[t]=new lt(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(Pd,zd);je[t]=new lt(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(Pd,zd);je[t]=new lt(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){je[e]=new lt(e,1,!1,e.toLowerCase(),null,!1,!1)});je.xlinkHref=new lt("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){je[e]=new lt(e,1,!1,e.toLowerCase(),null,!0,!0)});function Vd(e,t,r,n){var i=je.hasOwnProperty(t)?je[t]:null;if(i!==null?i.type!==0:n||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")l1(t,r,i,n)&&(r=null),n||i===null?o1(t)&&(r===null?e.removeAttribute(t):e.setAttribute(t,""+r)):i.mustUseProperty?e[i.propertyName]=r===null?i.type===3?!1:"":r:(t=i.attributeName,n=i.attributeNamespace,r===null?e.removeAttribute(t):(i=i.type,r=i===3||i===4&&r===!0?"":""+r,n?e.setAttributeNS(n,t,r):e.setAttribute(t,r)))}var Xr=i1.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,ql=Symbol.for("react.element"),ss=Symbol.for("react.portal"),os=Symbol.for("react.fragment"),jd=Symbol.for("react.strict_mode"),Yf=Symbol.for("react.profiler"),Cy=Symbol.for("react.provider"),Ry=Symbol.for("react.context"),$d=Symbol.for("react.forward_ref"),Kf=Symbol.for("react.suspense"),Qf=Symbol.for("react.suspense_list"),Wd=Symbol.for("react.memo"),wn=Symbol.for("react.lazy"),Py=Symbol.for("react.offscreen"),Mm=Symbol.iterator;function pa(e){if(e===null||typeof e!=="object")return null;return e=Mm&&e[Mm]||e["@@iterator"],typeof e==="function"?e:null}var _e=Object.assign,Bf;function ba(e){if(Bf===void 0)try{throw Error()}catch(r){var t=r.stack.trim().match(/\n( *(at )?)/);Bf=t&&t[1]||""}return`
+`+Bf+e}var If=!1;function Tf(e,t){if(!e||If)return"";If=!0;var r=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect==="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(u){var n=u}Reflect.construct(e,[],t)}else{try{t.call()}catch(u){n=u}e.call(t.prototype)}else{try{throw Error()}catch(u){n=u}e()}}catch(u){if(u&&n&&typeof u.stack==="string"){for(var i=u.stack.split(`
 `),s=n.stack.split(`
-`),a=i.length-1,l=s.length-1;1<=a&&0<=l&&i[a]!==s[l];)l--;for(;1<=a&&0<=l;a--,l--)if(i[a]!==s[l]){if(a!==1||l!==1)do if(a--,l--,0>l||i[a]!==s[l]){var c=`
-`+i[a].replace(" at new "," at ");return t.displayName&&c.includes("<anonymous>")&&(c=c.replace("<anonymous>",t.displayName)),c}while(1<=a&&0<=l);break}}}finally{vf=!1,Error.prepareStackTrace=r}return(t=t?t.displayName||t.name:"")?co(t):""}function eD(t){switch(t.tag){case 5:return co(t.type);case 16:return co("Lazy");case 13:return co("Suspense");case 19:return co("SuspenseList");case 0:case 2:case 15:return t=_f(t.type,!1),t;case 11:return t=_f(t.type.render,!1),t;case 1:return t=_f(t.type,!0),t;default:return""}}function qf(t){if(t==null)return null;if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t;switch(t){case ji:return"Fragment";case Pi:return"Portal";case Pf:return"Profiler";case Vh:return"StrictMode";case jf:return"Suspense";case zf:return"SuspenseList"}if(typeof t=="object")switch(t.$$typeof){case B1:return(t.displayName||"Context")+".Consumer";case T1:return(t._context.displayName||"Context")+".Provider";case Nh:var e=t.render;return t=t.displayName,t||(t=e.displayName||e.name||"",t=t!==""?"ForwardRef("+t+")":"ForwardRef"),t;case kh:return e=t.displayName||null,e!==null?e:qf(t.type)||"Memo";case ln:e=t._payload,t=t._init;try{return qf(t(e))}catch{}}return null}function tD(t){var e=t.type;switch(t.tag){case 24:return"Cache";case 9:return(e.displayName||"Context")+".Consumer";case 10:return(e._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return t=e.render,t=t.displayName||t.name||"",e.displayName||(t!==""?"ForwardRef("+t+")":"ForwardRef");case 7:return"Fragment";case 5:return e;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return qf(e);case 8:return e===Vh?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e}return null}function Sn(t){switch(typeof t){case"boolean":case"number":case"string":case"undefined":return t;case"object":return t;default:return""}}function D1(t){var e=t.type;return(t=t.nodeName)&&t.toLowerCase()==="input"&&(e==="checkbox"||e==="radio")}function rD(t){var e=D1(t)?"checked":"value",r=Object.getOwnPropertyDescriptor(t.constructor.prototype,e),n=""+t[e];if(!t.hasOwnProperty(e)&&typeof r<"u"&&typeof r.get=="function"&&typeof r.set=="function"){var i=r.get,s=r.set;return Object.defineProperty(t,e,{configurable:!0,get:function(){return i.call(this)},set:function(a){n=""+a,s.call(this,a)}}),Object.defineProperty(t,e,{enumerable:r.enumerable}),{getValue:function(){return n},setValue:function(a){n=""+a},stopTracking:function(){t._valueTracker=null,delete t[e]}}}}function Dl(t){t._valueTracker||(t._valueTracker=rD(t))}function A1(t){if(!t)return!1;var e=t._valueTracker;if(!e)return!0;var r=e.getValue(),n="";return t&&(n=D1(t)?t.checked?"true":"false":t.value),t=n,t!==r?(e.setValue(t),!0):!1}function eu(t){if(t=t||(typeof document<"u"?document:void 0),typeof t>"u")return null;try{return t.activeElement||t.body}catch{return t.body}}function $f(t,e){var r=e.checked;return Se({},e,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:r??t._wrapperState.initialChecked})}function _0(t,e){var r=e.defaultValue==null?"":e.defaultValue,n=e.checked!=null?e.checked:e.defaultChecked;r=Sn(e.value!=null?e.value:r),t._wrapperState={initialChecked:n,initialValue:r,controlled:e.type==="checkbox"||e.type==="radio"?e.checked!=null:e.value!=null}}function F1(t,e){e=e.checked,e!=null&&Uh(t,"checked",e,!1)}function Wf(t,e){F1(t,e);var r=Sn(e.value),n=e.type;if(r!=null)n==="number"?(r===0&&t.value===""||t.value!=r)&&(t.value=""+r):t.value!==""+r&&(t.value=""+r);else if(n==="submit"||n==="reset"){t.removeAttribute("value");return}e.hasOwnProperty("value")?Hf(t,e.type,r):e.hasOwnProperty("defaultValue")&&Hf(t,e.type,Sn(e.defaultValue)),e.checked==null&&e.defaultChecked!=null&&(t.defaultChecked=!!e.defaultChecked)}function w0(t,e,r){if(e.hasOwnProperty("value")||e.hasOwnProperty("defaultValue")){var n=e.type;if(!(n!=="submit"&&n!=="reset"||e.value!==void 0&&e.value!==null))return;e=""+t._wrapperState.initialValue,r||e===t.value||(t.value=e),t.defaultValue=e}r=t.name,r!==""&&(t.name=""),t.defaultChecked=!!t._wrapperState.initialChecked,r!==""&&(t.name=r)}function Hf(t,e,r){(e!=="number"||eu(t.ownerDocument)!==t)&&(r==null?t.defaultValue=""+t._wrapperState.initialValue:t.defaultValue!==""+r&&(t.defaultValue=""+r))}var fo=Array.isArray;function Zi(t,e,r,n){if(t=t.options,e){e={};for(var i=0;i<r.length;i++)e["$"+r[i]]=!0;for(r=0;r<t.length;r++)i=e.hasOwnProperty("$"+t[r].value),t[r].selected!==i&&(t[r].selected=i),i&&n&&(t[r].defaultSelected=!0)}else{for(r=""+Sn(r),e=null,i=0;i<t.length;i++){if(t[i].value===r){t[i].selected=!0,n&&(t[i].defaultSelected=!0);return}e!==null||t[i].disabled||(e=t[i])}e!==null&&(e.selected=!0)}}function Yf(t,e){if(e.dangerouslySetInnerHTML!=null)throw Error(B(91));return Se({},e,{value:void 0,defaultValue:void 0,children:""+t._wrapperState.initialValue})}function b0(t,e){var r=e.value;if(r==null){if(r=e.children,e=e.defaultValue,r!=null){if(e!=null)throw Error(B(92));if(fo(r)){if(1<r.length)throw Error(B(93));r=r[0]}e=r}e==null&&(e=""),r=e}t._wrapperState={initialValue:Sn(r)}}function O1(t,e){var r=Sn(e.value),n=Sn(e.defaultValue);r!=null&&(r=""+r,r!==t.value&&(t.value=r),e.defaultValue==null&&t.defaultValue!==r&&(t.defaultValue=r)),n!=null&&(t.defaultValue=""+n)}function S0(t){var e=t.textContent;e===t._wrapperState.initialValue&&e!==""&&e!==null&&(t.value=e)}function M1(t){switch(t){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function Kf(t,e){return t==null||t==="http://www.w3.org/1999/xhtml"?M1(e):t==="http://www.w3.org/2000/svg"&&e==="foreignObject"?"http://www.w3.org/1999/xhtml":t}var Al,x1=function(t){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(e,r,n,i){MSApp.execUnsafeLocalFunction(function(){return t(e,r,n,i)})}:t}(function(t,e){if(t.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in t)t.innerHTML=e;else{for(Al=Al||document.createElement("div"),Al.innerHTML="<svg>"+e.valueOf().toString()+"</svg>",e=Al.firstChild;t.firstChild;)t.removeChild(t.firstChild);for(;e.firstChild;)t.appendChild(e.firstChild)}});function Io(t,e){if(e){var r=t.firstChild;if(r&&r===t.lastChild&&r.nodeType===3){r.nodeValue=e;return}}t.textContent=e}var yo={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},nD=["Webkit","ms","Moz","O"];Object.keys(yo).forEach(function(t){nD.forEach(function(e){e=e+t.charAt(0).toUpperCase()+t.substring(1),yo[e]=yo[t]})});function E1(t,e,r){return e==null||typeof e=="boolean"||e===""?"":r||typeof e!="number"||e===0||yo.hasOwnProperty(t)&&yo[t]?(""+e).trim():e+"px"}function U1(t,e){t=t.style;for(var r in e)if(e.hasOwnProperty(r)){var n=r.indexOf("--")===0,i=E1(r,e[r],n);r==="float"&&(r="cssFloat"),n?t.setProperty(r,i):t[r]=i}}var iD=Se({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function Qf(t,e){if(e){if(iD[t]&&(e.children!=null||e.dangerouslySetInnerHTML!=null))throw Error(B(137,t));if(e.dangerouslySetInnerHTML!=null){if(e.children!=null)throw Error(B(60));if(typeof e.dangerouslySetInnerHTML!="object"||!("__html"in e.dangerouslySetInnerHTML))throw Error(B(61))}if(e.style!=null&&typeof e.style!="object")throw Error(B(62))}}function Jf(t,e){if(t.indexOf("-")===-1)return typeof e.is=="string";switch(t){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Gf=null;function Lh(t){return t=t.target||t.srcElement||window,t.correspondingUseElement&&(t=t.correspondingUseElement),t.nodeType===3?t.parentNode:t}var Zf=null,Xi=null,es=null;function T0(t){if(t=qo(t)){if(typeof Zf!="function")throw Error(B(280));var e=t.stateNode;e&&(e=Fu(e),Zf(t.stateNode,t.type,e))}}function V1(t){Xi?es?es.push(t):es=[t]:Xi=t}function N1(){if(Xi){var t=Xi,e=es;if(es=Xi=null,T0(t),e)for(t=0;t<e.length;t++)T0(e[t])}}function k1(t,e){return t(e)}function L1(){}var wf=!1;function C1(t,e,r){if(wf)return t(e,r);wf=!0;try{return k1(t,e,r)}finally{wf=!1,(Xi!==null||es!==null)&&(L1(),N1())}}function Do(t,e){var r=t.stateNode;if(r===null)return null;var n=Fu(r);if(n===null)return null;r=n[e];e:switch(e){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(n=!n.disabled)||(t=t.type,n=!(t==="button"||t==="input"||t==="select"||t==="textarea")),t=!n;break e;default:t=!1}if(t)return null;if(r&&typeof r!="function")throw Error(B(231,e,typeof r));return r}var Xf=!1;if(Pr)try{Ci={},Object.defineProperty(Ci,"passive",{get:function(){Xf=!0}}),window.addEventListener("test",Ci,Ci),window.removeEventListener("test",Ci,Ci)}catch{Xf=!1}var Ci;function sD(t,e,r,n,i,s,a,l,c){var o=Array.prototype.slice.call(arguments,3);try{e.apply(r,o)}catch(u){this.onError(u)}}var mo=!1,tu=null,ru=!1,eh=null,oD={onError:function(t){mo=!0,tu=t}};function aD(t,e,r,n,i,s,a,l,c){mo=!1,tu=null,sD.apply(oD,arguments)}function lD(t,e,r,n,i,s,a,l,c){if(aD.apply(this,arguments),mo){if(mo){var o=tu;mo=!1,tu=null}else throw Error(B(198));ru||(ru=!0,eh=o)}}function si(t){var e=t,r=t;if(t.alternate)for(;e.return;)e=e.return;else{t=e;do e=t,e.flags&4098&&(r=e.return),t=e.return;while(t)}return e.tag===3?r:null}function R1(t){if(t.tag===13){var e=t.memoizedState;if(e===null&&(t=t.alternate,t!==null&&(e=t.memoizedState)),e!==null)return e.dehydrated}return null}function B0(t){if(si(t)!==t)throw Error(B(188))}function uD(t){var e=t.alternate;if(!e){if(e=si(t),e===null)throw Error(B(188));return e!==t?null:t}for(var r=t,n=e;;){var i=r.return;if(i===null)break;var s=i.alternate;if(s===null){if(n=i.return,n!==null){r=n;continue}break}if(i.child===s.child){for(s=i.child;s;){if(s===r)return B0(i),t;if(s===n)return B0(i),e;s=s.sibling}throw Error(B(188))}if(r.return!==n.return)r=i,n=s;else{for(var a=!1,l=i.child;l;){if(l===r){a=!0,r=i,n=s;break}if(l===n){a=!0,n=i,r=s;break}l=l.sibling}if(!a){for(l=s.child;l;){if(l===r){a=!0,r=s,n=i;break}if(l===n){a=!0,n=s,r=i;break}l=l.sibling}if(!a)throw Error(B(189))}}if(r.alternate!==n)throw Error(B(190))}if(r.tag!==3)throw Error(B(188));return r.stateNode.current===r?t:e}function P1(t){return t=uD(t),t!==null?j1(t):null}function j1(t){if(t.tag===5||t.tag===6)return t;for(t=t.child;t!==null;){var e=j1(t);if(e!==null)return e;t=t.sibling}return null}var z1=It.unstable_scheduleCallback,I0=It.unstable_cancelCallback,cD=It.unstable_shouldYield,dD=It.unstable_requestPaint,Me=It.unstable_now,fD=It.unstable_getCurrentPriorityLevel,Ch=It.unstable_ImmediatePriority,q1=It.unstable_UserBlockingPriority,nu=It.unstable_NormalPriority,hD=It.unstable_LowPriority,$1=It.unstable_IdlePriority,Bu=null,br=null;function pD(t){if(br&&typeof br.onCommitFiberRoot=="function")try{br.onCommitFiberRoot(Bu,t,void 0,(t.current.flags&128)===128)}catch{}}var Zt=Math.clz32?Math.clz32:gD,yD=Math.log,mD=Math.LN2;function gD(t){return t>>>=0,t===0?32:31-(yD(t)/mD|0)|0}var Fl=64,Ol=4194304;function ho(t){switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return t&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return t}}function iu(t,e){var r=t.pendingLanes;if(r===0)return 0;var n=0,i=t.suspendedLanes,s=t.pingedLanes,a=r&268435455;if(a!==0){var l=a&~i;l!==0?n=ho(l):(s&=a,s!==0&&(n=ho(s)))}else a=r&~i,a!==0?n=ho(a):s!==0&&(n=ho(s));if(n===0)return 0;if(e!==0&&e!==n&&!(e&i)&&(i=n&-n,s=e&-e,i>=s||i===16&&(s&4194240)!==0))return e;if(n&4&&(n|=r&16),e=t.entangledLanes,e!==0)for(t=t.entanglements,e&=n;0<e;)r=31-Zt(e),i=1<<r,n|=t[r],e&=~i;return n}function vD(t,e){switch(t){case 1:case 2:case 4:return e+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function _D(t,e){for(var r=t.suspendedLanes,n=t.pingedLanes,i=t.expirationTimes,s=t.pendingLanes;0<s;){var a=31-Zt(s),l=1<<a,c=i[a];c===-1?(!(l&r)||l&n)&&(i[a]=vD(l,e)):c<=e&&(t.expiredLanes|=l),s&=~l}}function th(t){return t=t.pendingLanes&-1073741825,t!==0?t:t&1073741824?1073741824:0}function W1(){var t=Fl;return Fl<<=1,!(Fl&4194240)&&(Fl=64),t}function bf(t){for(var e=[],r=0;31>r;r++)e.push(t);return e}function jo(t,e,r){t.pendingLanes|=e,e!==536870912&&(t.suspendedLanes=0,t.pingedLanes=0),t=t.eventTimes,e=31-Zt(e),t[e]=r}function wD(t,e){var r=t.pendingLanes&~e;t.pendingLanes=e,t.suspendedLanes=0,t.pingedLanes=0,t.expiredLanes&=e,t.mutableReadLanes&=e,t.entangledLanes&=e,e=t.entanglements;var n=t.eventTimes;for(t=t.expirationTimes;0<r;){var i=31-Zt(r),s=1<<i;e[i]=0,n[i]=-1,t[i]=-1,r&=~s}}function Rh(t,e){var r=t.entangledLanes|=e;for(t=t.entanglements;r;){var n=31-Zt(r),i=1<<n;i&e|t[n]&e&&(t[n]|=e),r&=~i}}var se=0;function H1(t){return t&=-t,1<t?4<t?t&268435455?16:536870912:4:1}var Y1,Ph,K1,Q1,J1,rh=!1,Ml=[],pn=null,yn=null,mn=null,Ao=new Map,Fo=new Map,cn=[],bD="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function D0(t,e){switch(t){case"focusin":case"focusout":pn=null;break;case"dragenter":case"dragleave":yn=null;break;case"mouseover":case"mouseout":mn=null;break;case"pointerover":case"pointerout":Ao.delete(e.pointerId);break;case"gotpointercapture":case"lostpointercapture":Fo.delete(e.pointerId)}}function no(t,e,r,n,i,s){return t===null||t.nativeEvent!==s?(t={blockedOn:e,domEventName:r,eventSystemFlags:n,nativeEvent:s,targetContainers:[i]},e!==null&&(e=qo(e),e!==null&&Ph(e)),t):(t.eventSystemFlags|=n,e=t.targetContainers,i!==null&&e.indexOf(i)===-1&&e.push(i),t)}function SD(t,e,r,n,i){switch(e){case"focusin":return pn=no(pn,t,e,r,n,i),!0;case"dragenter":return yn=no(yn,t,e,r,n,i),!0;case"mouseover":return mn=no(mn,t,e,r,n,i),!0;case"pointerover":var s=i.pointerId;return Ao.set(s,no(Ao.get(s)||null,t,e,r,n,i)),!0;case"gotpointercapture":return s=i.pointerId,Fo.set(s,no(Fo.get(s)||null,t,e,r,n,i)),!0}return!1}function G1(t){var e=Kn(t.target);if(e!==null){var r=si(e);if(r!==null){if(e=r.tag,e===13){if(e=R1(r),e!==null){t.blockedOn=e,J1(t.priority,function(){K1(r)});return}}else if(e===3&&r.stateNode.current.memoizedState.isDehydrated){t.blockedOn=r.tag===3?r.stateNode.containerInfo:null;return}}}t.blockedOn=null}function $l(t){if(t.blockedOn!==null)return!1;for(var e=t.targetContainers;0<e.length;){var r=nh(t.domEventName,t.eventSystemFlags,e[0],t.nativeEvent);if(r===null){r=t.nativeEvent;var n=new r.constructor(r.type,r);Gf=n,r.target.dispatchEvent(n),Gf=null}else return e=qo(r),e!==null&&Ph(e),t.blockedOn=r,!1;e.shift()}return!0}function A0(t,e,r){$l(t)&&r.delete(e)}function TD(){rh=!1,pn!==null&&$l(pn)&&(pn=null),yn!==null&&$l(yn)&&(yn=null),mn!==null&&$l(mn)&&(mn=null),Ao.forEach(A0),Fo.forEach(A0)}function io(t,e){t.blockedOn===e&&(t.blockedOn=null,rh||(rh=!0,It.unstable_scheduleCallback(It.unstable_NormalPriority,TD)))}function Oo(t){function e(i){return io(i,t)}if(0<Ml.length){io(Ml[0],t);for(var r=1;r<Ml.length;r++){var n=Ml[r];n.blockedOn===t&&(n.blockedOn=null)}}for(pn!==null&&io(pn,t),yn!==null&&io(yn,t),mn!==null&&io(mn,t),Ao.forEach(e),Fo.forEach(e),r=0;r<cn.length;r++)n=cn[r],n.blockedOn===t&&(n.blockedOn=null);for(;0<cn.length&&(r=cn[0],r.blockedOn===null);)G1(r),r.blockedOn===null&&cn.shift()}var ts=$r.ReactCurrentBatchConfig,su=!0;function BD(t,e,r,n){var i=se,s=ts.transition;ts.transition=null;try{se=1,jh(t,e,r,n)}finally{se=i,ts.transition=s}}function ID(t,e,r,n){var i=se,s=ts.transition;ts.transition=null;try{se=4,jh(t,e,r,n)}finally{se=i,ts.transition=s}}function jh(t,e,r,n){if(su){var i=nh(t,e,r,n);if(i===null)Ff(t,e,n,ou,r),D0(t,n);else if(SD(i,t,e,r,n))n.stopPropagation();else if(D0(t,n),e&4&&-1<bD.indexOf(t)){for(;i!==null;){var s=qo(i);if(s!==null&&Y1(s),s=nh(t,e,r,n),s===null&&Ff(t,e,n,ou,r),s===i)break;i=s}i!==null&&n.stopPropagation()}else Ff(t,e,n,null,r)}}var ou=null;function nh(t,e,r,n){if(ou=null,t=Lh(n),t=Kn(t),t!==null)if(e=si(t),e===null)t=null;else if(r=e.tag,r===13){if(t=R1(e),t!==null)return t;t=null}else if(r===3){if(e.stateNode.current.memoizedState.isDehydrated)return e.tag===3?e.stateNode.containerInfo:null;t=null}else e!==t&&(t=null);return ou=t,null}function Z1(t){switch(t){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(fD()){case Ch:return 1;case q1:return 4;case nu:case hD:return 16;case $1:return 536870912;default:return 16}default:return 16}}var fn=null,zh=null,Wl=null;function X1(){if(Wl)return Wl;var t,e=zh,r=e.length,n,i="value"in fn?fn.value:fn.textContent,s=i.length;for(t=0;t<r&&e[t]===i[t];t++);var a=r-t;for(n=1;n<=a&&e[r-n]===i[s-n];n++);return Wl=i.slice(t,1<n?1-n:void 0)}function Hl(t){var e=t.keyCode;return"charCode"in t?(t=t.charCode,t===0&&e===13&&(t=13)):t=e,t===10&&(t=13),32<=t||t===13?t:0}function xl(){return!0}function F0(){return!1}function Dt(t){function e(r,n,i,s,a){this._reactName=r,this._targetInst=i,this.type=n,this.nativeEvent=s,this.target=a,this.currentTarget=null;for(var l in t)t.hasOwnProperty(l)&&(r=t[l],this[l]=r?r(s):s[l]);return this.isDefaultPrevented=(s.defaultPrevented!=null?s.defaultPrevented:s.returnValue===!1)?xl:F0,this.isPropagationStopped=F0,this}return Se(e.prototype,{preventDefault:function(){this.defaultPrevented=!0;var r=this.nativeEvent;r&&(r.preventDefault?r.preventDefault():typeof r.returnValue!="unknown"&&(r.returnValue=!1),this.isDefaultPrevented=xl)},stopPropagation:function(){var r=this.nativeEvent;r&&(r.stopPropagation?r.stopPropagation():typeof r.cancelBubble!="unknown"&&(r.cancelBubble=!0),this.isPropagationStopped=xl)},persist:function(){},isPersistent:xl}),e}var ds={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(t){return t.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},qh=Dt(ds),zo=Se({},ds,{view:0,detail:0}),DD=Dt(zo),Sf,Tf,so,Iu=Se({},zo,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:$h,button:0,buttons:0,relatedTarget:function(t){return t.relatedTarget===void 0?t.fromElement===t.srcElement?t.toElement:t.fromElement:t.relatedTarget},movementX:function(t){return"movementX"in t?t.movementX:(t!==so&&(so&&t.type==="mousemove"?(Sf=t.screenX-so.screenX,Tf=t.screenY-so.screenY):Tf=Sf=0,so=t),Sf)},movementY:function(t){return"movementY"in t?t.movementY:Tf}}),O0=Dt(Iu),AD=Se({},Iu,{dataTransfer:0}),FD=Dt(AD),OD=Se({},zo,{relatedTarget:0}),Bf=Dt(OD),MD=Se({},ds,{animationName:0,elapsedTime:0,pseudoElement:0}),xD=Dt(MD),ED=Se({},ds,{clipboardData:function(t){return"clipboardData"in t?t.clipboardData:window.clipboardData}}),UD=Dt(ED),VD=Se({},ds,{data:0}),M0=Dt(VD),ND={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},kD={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},LD={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function CD(t){var e=this.nativeEvent;return e.getModifierState?e.getModifierState(t):(t=LD[t])?!!e[t]:!1}function $h(){return CD}var RD=Se({},zo,{key:function(t){if(t.key){var e=ND[t.key]||t.key;if(e!=="Unidentified")return e}return t.type==="keypress"?(t=Hl(t),t===13?"Enter":String.fromCharCode(t)):t.type==="keydown"||t.type==="keyup"?kD[t.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:$h,charCode:function(t){return t.type==="keypress"?Hl(t):0},keyCode:function(t){return t.type==="keydown"||t.type==="keyup"?t.keyCode:0},which:function(t){return t.type==="keypress"?Hl(t):t.type==="keydown"||t.type==="keyup"?t.keyCode:0}}),PD=Dt(RD),jD=Se({},Iu,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),x0=Dt(jD),zD=Se({},zo,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:$h}),qD=Dt(zD),$D=Se({},ds,{propertyName:0,elapsedTime:0,pseudoElement:0}),WD=Dt($D),HD=Se({},Iu,{deltaX:function(t){return"deltaX"in t?t.deltaX:"wheelDeltaX"in t?-t.wheelDeltaX:0},deltaY:function(t){return"deltaY"in t?t.deltaY:"wheelDeltaY"in t?-t.wheelDeltaY:"wheelDelta"in t?-t.wheelDelta:0},deltaZ:0,deltaMode:0}),YD=Dt(HD),KD=[9,13,27,32],Wh=Pr&&"CompositionEvent"in window,go=null;Pr&&"documentMode"in document&&(go=document.documentMode);var QD=Pr&&"TextEvent"in window&&!go,ew=Pr&&(!Wh||go&&8<go&&11>=go),E0=" ",U0=!1;function tw(t,e){switch(t){case"keyup":return KD.indexOf(e.keyCode)!==-1;case"keydown":return e.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function rw(t){return t=t.detail,typeof t=="object"&&"data"in t?t.data:null}var zi=!1;function JD(t,e){switch(t){case"compositionend":return rw(e);case"keypress":return e.which!==32?null:(U0=!0,E0);case"textInput":return t=e.data,t===E0&&U0?null:t;default:return null}}function GD(t,e){if(zi)return t==="compositionend"||!Wh&&tw(t,e)?(t=X1(),Wl=zh=fn=null,zi=!1,t):null;switch(t){case"paste":return null;case"keypress":if(!(e.ctrlKey||e.altKey||e.metaKey)||e.ctrlKey&&e.altKey){if(e.char&&1<e.char.length)return e.char;if(e.which)return String.fromCharCode(e.which)}return null;case"compositionend":return ew&&e.locale!=="ko"?null:e.data;default:return null}}var ZD={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function V0(t){var e=t&&t.nodeName&&t.nodeName.toLowerCase();return e==="input"?!!ZD[t.type]:e==="textarea"}function nw(t,e,r,n){V1(n),e=au(e,"onChange"),0<e.length&&(r=new qh("onChange","change",null,r,n),t.push({event:r,listeners:e}))}var vo=null,Mo=null;function XD(t){pw(t,0)}function Du(t){var e=Wi(t);if(A1(e))return t}function eA(t,e){if(t==="change")return e}var iw=!1;Pr&&(Pr?(Ul="oninput"in document,Ul||(If=document.createElement("div"),If.setAttribute("oninput","return;"),Ul=typeof If.oninput=="function"),El=Ul):El=!1,iw=El&&(!document.documentMode||9<document.documentMode));var El,Ul,If;function N0(){vo&&(vo.detachEvent("onpropertychange",sw),Mo=vo=null)}function sw(t){if(t.propertyName==="value"&&Du(Mo)){var e=[];nw(e,Mo,t,Lh(t)),C1(XD,e)}}function tA(t,e,r){t==="focusin"?(N0(),vo=e,Mo=r,vo.attachEvent("onpropertychange",sw)):t==="focusout"&&N0()}function rA(t){if(t==="selectionchange"||t==="keyup"||t==="keydown")return Du(Mo)}function nA(t,e){if(t==="click")return Du(e)}function iA(t,e){if(t==="input"||t==="change")return Du(e)}function sA(t,e){return t===e&&(t!==0||1/t===1/e)||t!==t&&e!==e}var er=typeof Object.is=="function"?Object.is:sA;function xo(t,e){if(er(t,e))return!0;if(typeof t!="object"||t===null||typeof e!="object"||e===null)return!1;var r=Object.keys(t),n=Object.keys(e);if(r.length!==n.length)return!1;for(n=0;n<r.length;n++){var i=r[n];if(!Rf.call(e,i)||!er(t[i],e[i]))return!1}return!0}function k0(t){for(;t&&t.firstChild;)t=t.firstChild;return t}function L0(t,e){var r=k0(t);t=0;for(var n;r;){if(r.nodeType===3){if(n=t+r.textContent.length,t<=e&&n>=e)return{node:r,offset:e-t};t=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=k0(r)}}function ow(t,e){return t&&e?t===e?!0:t&&t.nodeType===3?!1:e&&e.nodeType===3?ow(t,e.parentNode):"contains"in t?t.contains(e):t.compareDocumentPosition?!!(t.compareDocumentPosition(e)&16):!1:!1}function aw(){for(var t=window,e=eu();e instanceof t.HTMLIFrameElement;){try{var r=typeof e.contentWindow.location.href=="string"}catch{r=!1}if(r)t=e.contentWindow;else break;e=eu(t.document)}return e}function Hh(t){var e=t&&t.nodeName&&t.nodeName.toLowerCase();return e&&(e==="input"&&(t.type==="text"||t.type==="search"||t.type==="tel"||t.type==="url"||t.type==="password")||e==="textarea"||t.contentEditable==="true")}function oA(t){var e=aw(),r=t.focusedElem,n=t.selectionRange;if(e!==r&&r&&r.ownerDocument&&ow(r.ownerDocument.documentElement,r)){if(n!==null&&Hh(r)){if(e=n.start,t=n.end,t===void 0&&(t=e),"selectionStart"in r)r.selectionStart=e,r.selectionEnd=Math.min(t,r.value.length);else if(t=(e=r.ownerDocument||document)&&e.defaultView||window,t.getSelection){t=t.getSelection();var i=r.textContent.length,s=Math.min(n.start,i);n=n.end===void 0?s:Math.min(n.end,i),!t.extend&&s>n&&(i=n,n=s,s=i),i=L0(r,s);var a=L0(r,n);i&&a&&(t.rangeCount!==1||t.anchorNode!==i.node||t.anchorOffset!==i.offset||t.focusNode!==a.node||t.focusOffset!==a.offset)&&(e=e.createRange(),e.setStart(i.node,i.offset),t.removeAllRanges(),s>n?(t.addRange(e),t.extend(a.node,a.offset)):(e.setEnd(a.node,a.offset),t.addRange(e)))}}for(e=[],t=r;t=t.parentNode;)t.nodeType===1&&e.push({element:t,left:t.scrollLeft,top:t.scrollTop});for(typeof r.focus=="function"&&r.focus(),r=0;r<e.length;r++)t=e[r],t.element.scrollLeft=t.left,t.element.scrollTop=t.top}}var aA=Pr&&"documentMode"in document&&11>=document.documentMode,qi=null,ih=null,_o=null,sh=!1;function C0(t,e,r){var n=r.window===r?r.document:r.nodeType===9?r:r.ownerDocument;sh||qi==null||qi!==eu(n)||(n=qi,"selectionStart"in n&&Hh(n)?n={start:n.selectionStart,end:n.selectionEnd}:(n=(n.ownerDocument&&n.ownerDocument.defaultView||window).getSelection(),n={anchorNode:n.anchorNode,anchorOffset:n.anchorOffset,focusNode:n.focusNode,focusOffset:n.focusOffset}),_o&&xo(_o,n)||(_o=n,n=au(ih,"onSelect"),0<n.length&&(e=new qh("onSelect","select",null,e,r),t.push({event:e,listeners:n}),e.target=qi)))}function Vl(t,e){var r={};return r[t.toLowerCase()]=e.toLowerCase(),r["Webkit"+t]="webkit"+e,r["Moz"+t]="moz"+e,r}var $i={animationend:Vl("Animation","AnimationEnd"),animationiteration:Vl("Animation","AnimationIteration"),animationstart:Vl("Animation","AnimationStart"),transitionend:Vl("Transition","TransitionEnd")},Df={},lw={};Pr&&(lw=document.createElement("div").style,"AnimationEvent"in window||(delete $i.animationend.animation,delete $i.animationiteration.animation,delete $i.animationstart.animation),"TransitionEvent"in window||delete $i.transitionend.transition);function Au(t){if(Df[t])return Df[t];if(!$i[t])return t;var e=$i[t],r;for(r in e)if(e.hasOwnProperty(r)&&r in lw)return Df[t]=e[r];return t}var uw=Au("animationend"),cw=Au("animationiteration"),dw=Au("animationstart"),fw=Au("transitionend"),hw=new Map,R0="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Bn(t,e){hw.set(t,e),ii(e,[t])}for(Nl=0;Nl<R0.length;Nl++)kl=R0[Nl],P0=kl.toLowerCase(),j0=kl[0].toUpperCase()+kl.slice(1),Bn(P0,"on"+j0);var kl,P0,j0,Nl;Bn(uw,"onAnimationEnd");Bn(cw,"onAnimationIteration");Bn(dw,"onAnimationStart");Bn("dblclick","onDoubleClick");Bn("focusin","onFocus");Bn("focusout","onBlur");Bn(fw,"onTransitionEnd");is("onMouseEnter",["mouseout","mouseover"]);is("onMouseLeave",["mouseout","mouseover"]);is("onPointerEnter",["pointerout","pointerover"]);is("onPointerLeave",["pointerout","pointerover"]);ii("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));ii("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));ii("onBeforeInput",["compositionend","keypress","textInput","paste"]);ii("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));ii("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));ii("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var po="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),lA=new Set("cancel close invalid load scroll toggle".split(" ").concat(po));function z0(t,e,r){var n=t.type||"unknown-event";t.currentTarget=r,lD(n,e,void 0,t),t.currentTarget=null}function pw(t,e){e=(e&4)!==0;for(var r=0;r<t.length;r++){var n=t[r],i=n.event;n=n.listeners;e:{var s=void 0;if(e)for(var a=n.length-1;0<=a;a--){var l=n[a],c=l.instance,o=l.currentTarget;if(l=l.listener,c!==s&&i.isPropagationStopped())break e;z0(i,l,o),s=c}else for(a=0;a<n.length;a++){if(l=n[a],c=l.instance,o=l.currentTarget,l=l.listener,c!==s&&i.isPropagationStopped())break e;z0(i,l,o),s=c}}}if(ru)throw t=eh,ru=!1,eh=null,t}function fe(t,e){var r=e[ch];r===void 0&&(r=e[ch]=new Set);var n=t+"__bubble";r.has(n)||(yw(e,t,2,!1),r.add(n))}function Af(t,e,r){var n=0;e&&(n|=4),yw(r,t,n,e)}var Ll="_reactListening"+Math.random().toString(36).slice(2);function Eo(t){if(!t[Ll]){t[Ll]=!0,S1.forEach(function(r){r!=="selectionchange"&&(lA.has(r)||Af(r,!1,t),Af(r,!0,t))});var e=t.nodeType===9?t:t.ownerDocument;e===null||e[Ll]||(e[Ll]=!0,Af("selectionchange",!1,e))}}function yw(t,e,r,n){switch(Z1(e)){case 1:var i=BD;break;case 4:i=ID;break;default:i=jh}r=i.bind(null,e,r,t),i=void 0,!Xf||e!=="touchstart"&&e!=="touchmove"&&e!=="wheel"||(i=!0),n?i!==void 0?t.addEventListener(e,r,{capture:!0,passive:i}):t.addEventListener(e,r,!0):i!==void 0?t.addEventListener(e,r,{passive:i}):t.addEventListener(e,r,!1)}function Ff(t,e,r,n,i){var s=n;if(!(e&1)&&!(e&2)&&n!==null)e:for(;;){if(n===null)return;var a=n.tag;if(a===3||a===4){var l=n.stateNode.containerInfo;if(l===i||l.nodeType===8&&l.parentNode===i)break;if(a===4)for(a=n.return;a!==null;){var c=a.tag;if((c===3||c===4)&&(c=a.stateNode.containerInfo,c===i||c.nodeType===8&&c.parentNode===i))return;a=a.return}for(;l!==null;){if(a=Kn(l),a===null)return;if(c=a.tag,c===5||c===6){n=s=a;continue e}l=l.parentNode}}n=n.return}C1(function(){var o=s,u=Lh(r),d=[];e:{var v=hw.get(t);if(v!==void 0){var T=qh,I=t;switch(t){case"keypress":if(Hl(r)===0)break e;case"keydown":case"keyup":T=PD;break;case"focusin":I="focus",T=Bf;break;case"focusout":I="blur",T=Bf;break;case"beforeblur":case"afterblur":T=Bf;break;case"click":if(r.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":T=O0;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":T=FD;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":T=qD;break;case uw:case cw:case dw:T=xD;break;case fw:T=WD;break;case"scroll":T=DD;break;case"wheel":T=YD;break;case"copy":case"cut":case"paste":T=UD;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":T=x0}var D=(e&4)!==0,ne=!D&&t==="scroll",g=D?v!==null?v+"Capture":null:v;D=[];for(var f=o,h;f!==null;){h=f;var S=h.stateNode;if(h.tag===5&&S!==null&&(h=S,g!==null&&(S=Do(f,g),S!=null&&D.push(Uo(f,S,h)))),ne)break;f=f.return}0<D.length&&(v=new T(v,I,null,r,u),d.push({event:v,listeners:D}))}}if(!(e&7)){e:{if(v=t==="mouseover"||t==="pointerover",T=t==="mouseout"||t==="pointerout",v&&r!==Gf&&(I=r.relatedTarget||r.fromElement)&&(Kn(I)||I[jr]))break e;if((T||v)&&(v=u.window===u?u:(v=u.ownerDocument)?v.defaultView||v.parentWindow:window,T?(I=r.relatedTarget||r.toElement,T=o,I=I?Kn(I):null,I!==null&&(ne=si(I),I!==ne||I.tag!==5&&I.tag!==6)&&(I=null)):(T=null,I=o),T!==I)){if(D=O0,S="onMouseLeave",g="onMouseEnter",f="mouse",(t==="pointerout"||t==="pointerover")&&(D=x0,S="onPointerLeave",g="onPointerEnter",f="pointer"),ne=T==null?v:Wi(T),h=I==null?v:Wi(I),v=new D(S,f+"leave",T,r,u),v.target=ne,v.relatedTarget=h,S=null,Kn(u)===o&&(D=new D(g,f+"enter",I,r,u),D.target=h,D.relatedTarget=ne,S=D),ne=S,T&&I)t:{for(D=T,g=I,f=0,h=D;h;h=Ri(h))f++;for(h=0,S=g;S;S=Ri(S))h++;for(;0<f-h;)D=Ri(D),f--;for(;0<h-f;)g=Ri(g),h--;for(;f--;){if(D===g||g!==null&&D===g.alternate)break t;D=Ri(D),g=Ri(g)}D=null}else D=null;T!==null&&q0(d,v,T,D,!1),I!==null&&ne!==null&&q0(d,ne,I,D,!0)}}e:{if(v=o?Wi(o):window,T=v.nodeName&&v.nodeName.toLowerCase(),T==="select"||T==="input"&&v.type==="file")var A=eA;else if(V0(v))if(iw)A=iA;else{A=rA;var E=tA}else(T=v.nodeName)&&T.toLowerCase()==="input"&&(v.type==="checkbox"||v.type==="radio")&&(A=nA);if(A&&(A=A(t,o))){nw(d,A,r,u);break e}E&&E(t,v,o),t==="focusout"&&(E=v._wrapperState)&&E.controlled&&v.type==="number"&&Hf(v,"number",v.value)}switch(E=o?Wi(o):window,t){case"focusin":(V0(E)||E.contentEditable==="true")&&(qi=E,ih=o,_o=null);break;case"focusout":_o=ih=qi=null;break;case"mousedown":sh=!0;break;case"contextmenu":case"mouseup":case"dragend":sh=!1,C0(d,r,u);break;case"selectionchange":if(aA)break;case"keydown":case"keyup":C0(d,r,u)}var U;if(Wh)e:{switch(t){case"compositionstart":var V="onCompositionStart";break e;case"compositionend":V="onCompositionEnd";break e;case"compositionupdate":V="onCompositionUpdate";break e}V=void 0}else zi?tw(t,r)&&(V="onCompositionEnd"):t==="keydown"&&r.keyCode===229&&(V="onCompositionStart");V&&(ew&&r.locale!=="ko"&&(zi||V!=="onCompositionStart"?V==="onCompositionEnd"&&zi&&(U=X1()):(fn=u,zh="value"in fn?fn.value:fn.textContent,zi=!0)),E=au(o,V),0<E.length&&(V=new M0(V,t,null,r,u),d.push({event:V,listeners:E}),U?V.data=U:(U=rw(r),U!==null&&(V.data=U)))),(U=QD?JD(t,r):GD(t,r))&&(o=au(o,"onBeforeInput"),0<o.length&&(u=new M0("onBeforeInput","beforeinput",null,r,u),d.push({event:u,listeners:o}),u.data=U))}pw(d,e)})}function Uo(t,e,r){return{instance:t,listener:e,currentTarget:r}}function au(t,e){for(var r=e+"Capture",n=[];t!==null;){var i=t,s=i.stateNode;i.tag===5&&s!==null&&(i=s,s=Do(t,r),s!=null&&n.unshift(Uo(t,s,i)),s=Do(t,e),s!=null&&n.push(Uo(t,s,i))),t=t.return}return n}function Ri(t){if(t===null)return null;do t=t.return;while(t&&t.tag!==5);return t||null}function q0(t,e,r,n,i){for(var s=e._reactName,a=[];r!==null&&r!==n;){var l=r,c=l.alternate,o=l.stateNode;if(c!==null&&c===n)break;l.tag===5&&o!==null&&(l=o,i?(c=Do(r,s),c!=null&&a.unshift(Uo(r,c,l))):i||(c=Do(r,s),c!=null&&a.push(Uo(r,c,l)))),r=r.return}a.length!==0&&t.push({event:e,listeners:a})}var uA=/\r\n?/g,cA=/\u0000|\uFFFD/g;function $0(t){return(typeof t=="string"?t:""+t).replace(uA,`
-`).replace(cA,"")}function Cl(t,e,r){if(e=$0(e),$0(t)!==e&&r)throw Error(B(425))}function lu(){}var oh=null,ah=null;function lh(t,e){return t==="textarea"||t==="noscript"||typeof e.children=="string"||typeof e.children=="number"||typeof e.dangerouslySetInnerHTML=="object"&&e.dangerouslySetInnerHTML!==null&&e.dangerouslySetInnerHTML.__html!=null}var uh=typeof setTimeout=="function"?setTimeout:void 0,dA=typeof clearTimeout=="function"?clearTimeout:void 0,W0=typeof Promise=="function"?Promise:void 0,fA=typeof queueMicrotask=="function"?queueMicrotask:typeof W0<"u"?function(t){return W0.resolve(null).then(t).catch(hA)}:uh;function hA(t){setTimeout(function(){throw t})}function Of(t,e){var r=e,n=0;do{var i=r.nextSibling;if(t.removeChild(r),i&&i.nodeType===8)if(r=i.data,r==="/$"){if(n===0){t.removeChild(i),Oo(e);return}n--}else r!=="$"&&r!=="$?"&&r!=="$!"||n++;r=i}while(r);Oo(e)}function gn(t){for(;t!=null;t=t.nextSibling){var e=t.nodeType;if(e===1||e===3)break;if(e===8){if(e=t.data,e==="$"||e==="$!"||e==="$?")break;if(e==="/$")return null}}return t}function H0(t){t=t.previousSibling;for(var e=0;t;){if(t.nodeType===8){var r=t.data;if(r==="$"||r==="$!"||r==="$?"){if(e===0)return t;e--}else r==="/$"&&e++}t=t.previousSibling}return null}var fs=Math.random().toString(36).slice(2),wr="__reactFiber$"+fs,Vo="__reactProps$"+fs,jr="__reactContainer$"+fs,ch="__reactEvents$"+fs,pA="__reactListeners$"+fs,yA="__reactHandles$"+fs;function Kn(t){var e=t[wr];if(e)return e;for(var r=t.parentNode;r;){if(e=r[jr]||r[wr]){if(r=e.alternate,e.child!==null||r!==null&&r.child!==null)for(t=H0(t);t!==null;){if(r=t[wr])return r;t=H0(t)}return e}t=r,r=t.parentNode}return null}function qo(t){return t=t[wr]||t[jr],!t||t.tag!==5&&t.tag!==6&&t.tag!==13&&t.tag!==3?null:t}function Wi(t){if(t.tag===5||t.tag===6)return t.stateNode;throw Error(B(33))}function Fu(t){return t[Vo]||null}var dh=[],Hi=-1;function In(t){return{current:t}}function he(t){0>Hi||(t.current=dh[Hi],dh[Hi]=null,Hi--)}function ce(t,e){Hi++,dh[Hi]=t.current,t.current=e}var Tn={},it=In(Tn),yt=In(!1),Xn=Tn;function ss(t,e){var r=t.type.contextTypes;if(!r)return Tn;var n=t.stateNode;if(n&&n.__reactInternalMemoizedUnmaskedChildContext===e)return n.__reactInternalMemoizedMaskedChildContext;var i={},s;for(s in r)i[s]=e[s];return n&&(t=t.stateNode,t.__reactInternalMemoizedUnmaskedChildContext=e,t.__reactInternalMemoizedMaskedChildContext=i),i}function mt(t){return t=t.childContextTypes,t!=null}function uu(){he(yt),he(it)}function Y0(t,e,r){if(it.current!==Tn)throw Error(B(168));ce(it,e),ce(yt,r)}function mw(t,e,r){var n=t.stateNode;if(e=e.childContextTypes,typeof n.getChildContext!="function")return r;n=n.getChildContext();for(var i in n)if(!(i in e))throw Error(B(108,tD(t)||"Unknown",i));return Se({},r,n)}function cu(t){return t=(t=t.stateNode)&&t.__reactInternalMemoizedMergedChildContext||Tn,Xn=it.current,ce(it,t),ce(yt,yt.current),!0}function K0(t,e,r){var n=t.stateNode;if(!n)throw Error(B(169));r?(t=mw(t,e,Xn),n.__reactInternalMemoizedMergedChildContext=t,he(yt),he(it),ce(it,t)):he(yt),ce(yt,r)}var kr=null,Ou=!1,Mf=!1;function gw(t){kr===null?kr=[t]:kr.push(t)}function mA(t){Ou=!0,gw(t)}function Dn(){if(!Mf&&kr!==null){Mf=!0;var t=0,e=se;try{var r=kr;for(se=1;t<r.length;t++){var n=r[t];do n=n(!0);while(n!==null)}kr=null,Ou=!1}catch(i){throw kr!==null&&(kr=kr.slice(t+1)),z1(Ch,Dn),i}finally{se=e,Mf=!1}}return null}var Yi=[],Ki=0,du=null,fu=0,kt=[],Lt=0,ei=null,Lr=1,Cr="";function Hn(t,e){Yi[Ki++]=fu,Yi[Ki++]=du,du=t,fu=e}function vw(t,e,r){kt[Lt++]=Lr,kt[Lt++]=Cr,kt[Lt++]=ei,ei=t;var n=Lr;t=Cr;var i=32-Zt(n)-1;n&=~(1<<i),r+=1;var s=32-Zt(e)+i;if(30<s){var a=i-i%5;s=(n&(1<<a)-1).toString(32),n>>=a,i-=a,Lr=1<<32-Zt(e)+i|r<<i|n,Cr=s+t}else Lr=1<<s|r<<i|n,Cr=t}function Yh(t){t.return!==null&&(Hn(t,1),vw(t,1,0))}function Kh(t){for(;t===du;)du=Yi[--Ki],Yi[Ki]=null,fu=Yi[--Ki],Yi[Ki]=null;for(;t===ei;)ei=kt[--Lt],kt[Lt]=null,Cr=kt[--Lt],kt[Lt]=null,Lr=kt[--Lt],kt[Lt]=null}var Bt=null,Tt=null,ge=!1,Gt=null;function _w(t,e){var r=Ct(5,null,null,0);r.elementType="DELETED",r.stateNode=e,r.return=t,e=t.deletions,e===null?(t.deletions=[r],t.flags|=16):e.push(r)}function Q0(t,e){switch(t.tag){case 5:var r=t.type;return e=e.nodeType!==1||r.toLowerCase()!==e.nodeName.toLowerCase()?null:e,e!==null?(t.stateNode=e,Bt=t,Tt=gn(e.firstChild),!0):!1;case 6:return e=t.pendingProps===""||e.nodeType!==3?null:e,e!==null?(t.stateNode=e,Bt=t,Tt=null,!0):!1;case 13:return e=e.nodeType!==8?null:e,e!==null?(r=ei!==null?{id:Lr,overflow:Cr}:null,t.memoizedState={dehydrated:e,treeContext:r,retryLane:1073741824},r=Ct(18,null,null,0),r.stateNode=e,r.return=t,t.child=r,Bt=t,Tt=null,!0):!1;default:return!1}}function fh(t){return(t.mode&1)!==0&&(t.flags&128)===0}function hh(t){if(ge){var e=Tt;if(e){var r=e;if(!Q0(t,e)){if(fh(t))throw Error(B(418));e=gn(r.nextSibling);var n=Bt;e&&Q0(t,e)?_w(n,r):(t.flags=t.flags&-4097|2,ge=!1,Bt=t)}}else{if(fh(t))throw Error(B(418));t.flags=t.flags&-4097|2,ge=!1,Bt=t}}}function J0(t){for(t=t.return;t!==null&&t.tag!==5&&t.tag!==3&&t.tag!==13;)t=t.return;Bt=t}function Rl(t){if(t!==Bt)return!1;if(!ge)return J0(t),ge=!0,!1;var e;if((e=t.tag!==3)&&!(e=t.tag!==5)&&(e=t.type,e=e!=="head"&&e!=="body"&&!lh(t.type,t.memoizedProps)),e&&(e=Tt)){if(fh(t))throw ww(),Error(B(418));for(;e;)_w(t,e),e=gn(e.nextSibling)}if(J0(t),t.tag===13){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(B(317));e:{for(t=t.nextSibling,e=0;t;){if(t.nodeType===8){var r=t.data;if(r==="/$"){if(e===0){Tt=gn(t.nextSibling);break e}e--}else r!=="$"&&r!=="$!"&&r!=="$?"||e++}t=t.nextSibling}Tt=null}}else Tt=Bt?gn(t.stateNode.nextSibling):null;return!0}function ww(){for(var t=Tt;t;)t=gn(t.nextSibling)}function os(){Tt=Bt=null,ge=!1}function Qh(t){Gt===null?Gt=[t]:Gt.push(t)}var gA=$r.ReactCurrentBatchConfig;function oo(t,e,r){if(t=r.ref,t!==null&&typeof t!="function"&&typeof t!="object"){if(r._owner){if(r=r._owner,r){if(r.tag!==1)throw Error(B(309));var n=r.stateNode}if(!n)throw Error(B(147,t));var i=n,s=""+t;return e!==null&&e.ref!==null&&typeof e.ref=="function"&&e.ref._stringRef===s?e.ref:(e=function(a){var l=i.refs;a===null?delete l[s]:l[s]=a},e._stringRef=s,e)}if(typeof t!="string")throw Error(B(284));if(!r._owner)throw Error(B(290,t))}return t}function Pl(t,e){throw t=Object.prototype.toString.call(e),Error(B(31,t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t))}function G0(t){var e=t._init;return e(t._payload)}function bw(t){function e(g,f){if(t){var h=g.deletions;h===null?(g.deletions=[f],g.flags|=16):h.push(f)}}function r(g,f){if(!t)return null;for(;f!==null;)e(g,f),f=f.sibling;return null}function n(g,f){for(g=new Map;f!==null;)f.key!==null?g.set(f.key,f):g.set(f.index,f),f=f.sibling;return g}function i(g,f){return g=bn(g,f),g.index=0,g.sibling=null,g}function s(g,f,h){return g.index=h,t?(h=g.alternate,h!==null?(h=h.index,h<f?(g.flags|=2,f):h):(g.flags|=2,f)):(g.flags|=1048576,f)}function a(g){return t&&g.alternate===null&&(g.flags|=2),g}function l(g,f,h,S){return f===null||f.tag!==6?(f=Lf(h,g.mode,S),f.return=g,f):(f=i(f,h),f.return=g,f)}function c(g,f,h,S){var A=h.type;return A===ji?u(g,f,h.props.children,S,h.key):f!==null&&(f.elementType===A||typeof A=="object"&&A!==null&&A.$$typeof===ln&&G0(A)===f.type)?(S=i(f,h.props),S.ref=oo(g,f,h),S.return=g,S):(S=Xl(h.type,h.key,h.props,null,g.mode,S),S.ref=oo(g,f,h),S.return=g,S)}function o(g,f,h,S){return f===null||f.tag!==4||f.stateNode.containerInfo!==h.containerInfo||f.stateNode.implementation!==h.implementation?(f=Cf(h,g.mode,S),f.return=g,f):(f=i(f,h.children||[]),f.return=g,f)}function u(g,f,h,S,A){return f===null||f.tag!==7?(f=Zn(h,g.mode,S,A),f.return=g,f):(f=i(f,h),f.return=g,f)}function d(g,f,h){if(typeof f=="string"&&f!==""||typeof f=="number")return f=Lf(""+f,g.mode,h),f.return=g,f;if(typeof f=="object"&&f!==null){switch(f.$$typeof){case Il:return h=Xl(f.type,f.key,f.props,null,g.mode,h),h.ref=oo(g,null,f),h.return=g,h;case Pi:return f=Cf(f,g.mode,h),f.return=g,f;case ln:var S=f._init;return d(g,S(f._payload),h)}if(fo(f)||ro(f))return f=Zn(f,g.mode,h,null),f.return=g,f;Pl(g,f)}return null}function v(g,f,h,S){var A=f!==null?f.key:null;if(typeof h=="string"&&h!==""||typeof h=="number")return A!==null?null:l(g,f,""+h,S);if(typeof h=="object"&&h!==null){switch(h.$$typeof){case Il:return h.key===A?c(g,f,h,S):null;case Pi:return h.key===A?o(g,f,h,S):null;case ln:return A=h._init,v(g,f,A(h._payload),S)}if(fo(h)||ro(h))return A!==null?null:u(g,f,h,S,null);Pl(g,h)}return null}function T(g,f,h,S,A){if(typeof S=="string"&&S!==""||typeof S=="number")return g=g.get(h)||null,l(f,g,""+S,A);if(typeof S=="object"&&S!==null){switch(S.$$typeof){case Il:return g=g.get(S.key===null?h:S.key)||null,c(f,g,S,A);case Pi:return g=g.get(S.key===null?h:S.key)||null,o(f,g,S,A);case ln:var E=S._init;return T(g,f,h,E(S._payload),A)}if(fo(S)||ro(S))return g=g.get(h)||null,u(f,g,S,A,null);Pl(f,S)}return null}function I(g,f,h,S){for(var A=null,E=null,U=f,V=f=0,me=null;U!==null&&V<h.length;V++){U.index>V?(me=U,U=null):me=U.sibling;var ee=v(g,U,h[V],S);if(ee===null){U===null&&(U=me);break}t&&U&&ee.alternate===null&&e(g,U),f=s(ee,f,V),E===null?A=ee:E.sibling=ee,E=ee,U=me}if(V===h.length)return r(g,U),ge&&Hn(g,V),A;if(U===null){for(;V<h.length;V++)U=d(g,h[V],S),U!==null&&(f=s(U,f,V),E===null?A=U:E.sibling=U,E=U);return ge&&Hn(g,V),A}for(U=n(g,U);V<h.length;V++)me=T(U,g,V,h[V],S),me!==null&&(t&&me.alternate!==null&&U.delete(me.key===null?V:me.key),f=s(me,f,V),E===null?A=me:E.sibling=me,E=me);return t&&U.forEach(function(sn){return e(g,sn)}),ge&&Hn(g,V),A}function D(g,f,h,S){var A=ro(h);if(typeof A!="function")throw Error(B(150));if(h=A.call(h),h==null)throw Error(B(151));for(var E=A=null,U=f,V=f=0,me=null,ee=h.next();U!==null&&!ee.done;V++,ee=h.next()){U.index>V?(me=U,U=null):me=U.sibling;var sn=v(g,U,ee.value,S);if(sn===null){U===null&&(U=me);break}t&&U&&sn.alternate===null&&e(g,U),f=s(sn,f,V),E===null?A=sn:E.sibling=sn,E=sn,U=me}if(ee.done)return r(g,U),ge&&Hn(g,V),A;if(U===null){for(;!ee.done;V++,ee=h.next())ee=d(g,ee.value,S),ee!==null&&(f=s(ee,f,V),E===null?A=ee:E.sibling=ee,E=ee);return ge&&Hn(g,V),A}for(U=n(g,U);!ee.done;V++,ee=h.next())ee=T(U,g,V,ee.value,S),ee!==null&&(t&&ee.alternate!==null&&U.delete(ee.key===null?V:ee.key),f=s(ee,f,V),E===null?A=ee:E.sibling=ee,E=ee);return t&&U.forEach(function(DI){return e(g,DI)}),ge&&Hn(g,V),A}function ne(g,f,h,S){if(typeof h=="object"&&h!==null&&h.type===ji&&h.key===null&&(h=h.props.children),typeof h=="object"&&h!==null){switch(h.$$typeof){case Il:e:{for(var A=h.key,E=f;E!==null;){if(E.key===A){if(A=h.type,A===ji){if(E.tag===7){r(g,E.sibling),f=i(E,h.props.children),f.return=g,g=f;break e}}else if(E.elementType===A||typeof A=="object"&&A!==null&&A.$$typeof===ln&&G0(A)===E.type){r(g,E.sibling),f=i(E,h.props),f.ref=oo(g,E,h),f.return=g,g=f;break e}r(g,E);break}else e(g,E);E=E.sibling}h.type===ji?(f=Zn(h.props.children,g.mode,S,h.key),f.return=g,g=f):(S=Xl(h.type,h.key,h.props,null,g.mode,S),S.ref=oo(g,f,h),S.return=g,g=S)}return a(g);case Pi:e:{for(E=h.key;f!==null;){if(f.key===E)if(f.tag===4&&f.stateNode.containerInfo===h.containerInfo&&f.stateNode.implementation===h.implementation){r(g,f.sibling),f=i(f,h.children||[]),f.return=g,g=f;break e}else{r(g,f);break}else e(g,f);f=f.sibling}f=Cf(h,g.mode,S),f.return=g,g=f}return a(g);case ln:return E=h._init,ne(g,f,E(h._payload),S)}if(fo(h))return I(g,f,h,S);if(ro(h))return D(g,f,h,S);Pl(g,h)}return typeof h=="string"&&h!==""||typeof h=="number"?(h=""+h,f!==null&&f.tag===6?(r(g,f.sibling),f=i(f,h),f.return=g,g=f):(r(g,f),f=Lf(h,g.mode,S),f.return=g,g=f),a(g)):r(g,f)}return ne}var as=bw(!0),Sw=bw(!1),hu=In(null),pu=null,Qi=null,Jh=null;function Gh(){Jh=Qi=pu=null}function Zh(t){var e=hu.current;he(hu),t._currentValue=e}function ph(t,e,r){for(;t!==null;){var n=t.alternate;if((t.childLanes&e)!==e?(t.childLanes|=e,n!==null&&(n.childLanes|=e)):n!==null&&(n.childLanes&e)!==e&&(n.childLanes|=e),t===r)break;t=t.return}}function rs(t,e){pu=t,Jh=Qi=null,t=t.dependencies,t!==null&&t.firstContext!==null&&(t.lanes&e&&(pt=!0),t.firstContext=null)}function Pt(t){var e=t._currentValue;if(Jh!==t)if(t={context:t,memoizedValue:e,next:null},Qi===null){if(pu===null)throw Error(B(308));Qi=t,pu.dependencies={lanes:0,firstContext:t}}else Qi=Qi.next=t;return e}var Qn=null;function Xh(t){Qn===null?Qn=[t]:Qn.push(t)}function Tw(t,e,r,n){var i=e.interleaved;return i===null?(r.next=r,Xh(e)):(r.next=i.next,i.next=r),e.interleaved=r,zr(t,n)}function zr(t,e){t.lanes|=e;var r=t.alternate;for(r!==null&&(r.lanes|=e),r=t,t=t.return;t!==null;)t.childLanes|=e,r=t.alternate,r!==null&&(r.childLanes|=e),r=t,t=t.return;return r.tag===3?r.stateNode:null}var un=!1;function ep(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Bw(t,e){t=t.updateQueue,e.updateQueue===t&&(e.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,effects:t.effects})}function Rr(t,e){return{eventTime:t,lane:e,tag:0,payload:null,callback:null,next:null}}function vn(t,e,r){var n=t.updateQueue;if(n===null)return null;if(n=n.shared,re&2){var i=n.pending;return i===null?e.next=e:(e.next=i.next,i.next=e),n.pending=e,zr(t,r)}return i=n.interleaved,i===null?(e.next=e,Xh(n)):(e.next=i.next,i.next=e),n.interleaved=e,zr(t,r)}function Yl(t,e,r){if(e=e.updateQueue,e!==null&&(e=e.shared,(r&4194240)!==0)){var n=e.lanes;n&=t.pendingLanes,r|=n,e.lanes=r,Rh(t,r)}}function Z0(t,e){var r=t.updateQueue,n=t.alternate;if(n!==null&&(n=n.updateQueue,r===n)){var i=null,s=null;if(r=r.firstBaseUpdate,r!==null){do{var a={eventTime:r.eventTime,lane:r.lane,tag:r.tag,payload:r.payload,callback:r.callback,next:null};s===null?i=s=a:s=s.next=a,r=r.next}while(r!==null);s===null?i=s=e:s=s.next=e}else i=s=e;r={baseState:n.baseState,firstBaseUpdate:i,lastBaseUpdate:s,shared:n.shared,effects:n.effects},t.updateQueue=r;return}t=r.lastBaseUpdate,t===null?r.firstBaseUpdate=e:t.next=e,r.lastBaseUpdate=e}function yu(t,e,r,n){var i=t.updateQueue;un=!1;var s=i.firstBaseUpdate,a=i.lastBaseUpdate,l=i.shared.pending;if(l!==null){i.shared.pending=null;var c=l,o=c.next;c.next=null,a===null?s=o:a.next=o,a=c;var u=t.alternate;u!==null&&(u=u.updateQueue,l=u.lastBaseUpdate,l!==a&&(l===null?u.firstBaseUpdate=o:l.next=o,u.lastBaseUpdate=c))}if(s!==null){var d=i.baseState;a=0,u=o=c=null,l=s;do{var v=l.lane,T=l.eventTime;if((n&v)===v){u!==null&&(u=u.next={eventTime:T,lane:0,tag:l.tag,payload:l.payload,callback:l.callback,next:null});e:{var I=t,D=l;switch(v=e,T=r,D.tag){case 1:if(I=D.payload,typeof I=="function"){d=I.call(T,d,v);break e}d=I;break e;case 3:I.flags=I.flags&-65537|128;case 0:if(I=D.payload,v=typeof I=="function"?I.call(T,d,v):I,v==null)break e;d=Se({},d,v);break e;case 2:un=!0}}l.callback!==null&&l.lane!==0&&(t.flags|=64,v=i.effects,v===null?i.effects=[l]:v.push(l))}else T={eventTime:T,lane:v,tag:l.tag,payload:l.payload,callback:l.callback,next:null},u===null?(o=u=T,c=d):u=u.next=T,a|=v;if(l=l.next,l===null){if(l=i.shared.pending,l===null)break;v=l,l=v.next,v.next=null,i.lastBaseUpdate=v,i.shared.pending=null}}while(!0);if(u===null&&(c=d),i.baseState=c,i.firstBaseUpdate=o,i.lastBaseUpdate=u,e=i.shared.interleaved,e!==null){i=e;do a|=i.lane,i=i.next;while(i!==e)}else s===null&&(i.shared.lanes=0);ri|=a,t.lanes=a,t.memoizedState=d}}function X0(t,e,r){if(t=e.effects,e.effects=null,t!==null)for(e=0;e<t.length;e++){var n=t[e],i=n.callback;if(i!==null){if(n.callback=null,n=r,typeof i!="function")throw Error(B(191,i));i.call(n)}}}var $o={},Sr=In($o),No=In($o),ko=In($o);function Jn(t){if(t===$o)throw Error(B(174));return t}function tp(t,e){switch(ce(ko,e),ce(No,t),ce(Sr,$o),t=e.nodeType,t){case 9:case 11:e=(e=e.documentElement)?e.namespaceURI:Kf(null,"");break;default:t=t===8?e.parentNode:e,e=t.namespaceURI||null,t=t.tagName,e=Kf(e,t)}he(Sr),ce(Sr,e)}function ls(){he(Sr),he(No),he(ko)}function Iw(t){Jn(ko.current);var e=Jn(Sr.current),r=Kf(e,t.type);e!==r&&(ce(No,t),ce(Sr,r))}function rp(t){No.current===t&&(he(Sr),he(No))}var we=In(0);function mu(t){for(var e=t;e!==null;){if(e.tag===13){var r=e.memoizedState;if(r!==null&&(r=r.dehydrated,r===null||r.data==="$?"||r.data==="$!"))return e}else if(e.tag===19&&e.memoizedProps.revealOrder!==void 0){if(e.flags&128)return e}else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break;for(;e.sibling===null;){if(e.return===null||e.return===t)return null;e=e.return}e.sibling.return=e.return,e=e.sibling}return null}var xf=[];function np(){for(var t=0;t<xf.length;t++)xf[t]._workInProgressVersionPrimary=null;xf.length=0}var Kl=$r.ReactCurrentDispatcher,Ef=$r.ReactCurrentBatchConfig,ti=0,be=null,ke=null,je=null,gu=!1,wo=!1,Lo=0,vA=0;function tt(){throw Error(B(321))}function ip(t,e){if(e===null)return!1;for(var r=0;r<e.length&&r<t.length;r++)if(!er(t[r],e[r]))return!1;return!0}function sp(t,e,r,n,i,s){if(ti=s,be=e,e.memoizedState=null,e.updateQueue=null,e.lanes=0,Kl.current=t===null||t.memoizedState===null?SA:TA,t=r(n,i),wo){s=0;do{if(wo=!1,Lo=0,25<=s)throw Error(B(301));s+=1,je=ke=null,e.updateQueue=null,Kl.current=BA,t=r(n,i)}while(wo)}if(Kl.current=vu,e=ke!==null&&ke.next!==null,ti=0,je=ke=be=null,gu=!1,e)throw Error(B(300));return t}function op(){var t=Lo!==0;return Lo=0,t}function _r(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return je===null?be.memoizedState=je=t:je=je.next=t,je}function jt(){if(ke===null){var t=be.alternate;t=t!==null?t.memoizedState:null}else t=ke.next;var e=je===null?be.memoizedState:je.next;if(e!==null)je=e,ke=t;else{if(t===null)throw Error(B(310));ke=t,t={memoizedState:ke.memoizedState,baseState:ke.baseState,baseQueue:ke.baseQueue,queue:ke.queue,next:null},je===null?be.memoizedState=je=t:je=je.next=t}return je}function Co(t,e){return typeof e=="function"?e(t):e}function Uf(t){var e=jt(),r=e.queue;if(r===null)throw Error(B(311));r.lastRenderedReducer=t;var n=ke,i=n.baseQueue,s=r.pending;if(s!==null){if(i!==null){var a=i.next;i.next=s.next,s.next=a}n.baseQueue=i=s,r.pending=null}if(i!==null){s=i.next,n=n.baseState;var l=a=null,c=null,o=s;do{var u=o.lane;if((ti&u)===u)c!==null&&(c=c.next={lane:0,action:o.action,hasEagerState:o.hasEagerState,eagerState:o.eagerState,next:null}),n=o.hasEagerState?o.eagerState:t(n,o.action);else{var d={lane:u,action:o.action,hasEagerState:o.hasEagerState,eagerState:o.eagerState,next:null};c===null?(l=c=d,a=n):c=c.next=d,be.lanes|=u,ri|=u}o=o.next}while(o!==null&&o!==s);c===null?a=n:c.next=l,er(n,e.memoizedState)||(pt=!0),e.memoizedState=n,e.baseState=a,e.baseQueue=c,r.lastRenderedState=n}if(t=r.interleaved,t!==null){i=t;do s=i.lane,be.lanes|=s,ri|=s,i=i.next;while(i!==t)}else i===null&&(r.lanes=0);return[e.memoizedState,r.dispatch]}function Vf(t){var e=jt(),r=e.queue;if(r===null)throw Error(B(311));r.lastRenderedReducer=t;var n=r.dispatch,i=r.pending,s=e.memoizedState;if(i!==null){r.pending=null;var a=i=i.next;do s=t(s,a.action),a=a.next;while(a!==i);er(s,e.memoizedState)||(pt=!0),e.memoizedState=s,e.baseQueue===null&&(e.baseState=s),r.lastRenderedState=s}return[s,n]}function Dw(){}function Aw(t,e){var r=be,n=jt(),i=e(),s=!er(n.memoizedState,i);if(s&&(n.memoizedState=i,pt=!0),n=n.queue,ap(Mw.bind(null,r,n,t),[t]),n.getSnapshot!==e||s||je!==null&&je.memoizedState.tag&1){if(r.flags|=2048,Ro(9,Ow.bind(null,r,n,i,e),void 0,null),ze===null)throw Error(B(349));ti&30||Fw(r,e,i)}return i}function Fw(t,e,r){t.flags|=16384,t={getSnapshot:e,value:r},e=be.updateQueue,e===null?(e={lastEffect:null,stores:null},be.updateQueue=e,e.stores=[t]):(r=e.stores,r===null?e.stores=[t]:r.push(t))}function Ow(t,e,r,n){e.value=r,e.getSnapshot=n,xw(e)&&Ew(t)}function Mw(t,e,r){return r(function(){xw(e)&&Ew(t)})}function xw(t){var e=t.getSnapshot;t=t.value;try{var r=e();return!er(t,r)}catch{return!0}}function Ew(t){var e=zr(t,1);e!==null&&Xt(e,t,1,-1)}function e1(t){var e=_r();return typeof t=="function"&&(t=t()),e.memoizedState=e.baseState=t,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Co,lastRenderedState:t},e.queue=t,t=t.dispatch=bA.bind(null,be,t),[e.memoizedState,t]}function Ro(t,e,r,n){return t={tag:t,create:e,destroy:r,deps:n,next:null},e=be.updateQueue,e===null?(e={lastEffect:null,stores:null},be.updateQueue=e,e.lastEffect=t.next=t):(r=e.lastEffect,r===null?e.lastEffect=t.next=t:(n=r.next,r.next=t,t.next=n,e.lastEffect=t)),t}function Uw(){return jt().memoizedState}function Ql(t,e,r,n){var i=_r();be.flags|=t,i.memoizedState=Ro(1|e,r,void 0,n===void 0?null:n)}function Mu(t,e,r,n){var i=jt();n=n===void 0?null:n;var s=void 0;if(ke!==null){var a=ke.memoizedState;if(s=a.destroy,n!==null&&ip(n,a.deps)){i.memoizedState=Ro(e,r,s,n);return}}be.flags|=t,i.memoizedState=Ro(1|e,r,s,n)}function t1(t,e){return Ql(8390656,8,t,e)}function ap(t,e){return Mu(2048,8,t,e)}function Vw(t,e){return Mu(4,2,t,e)}function Nw(t,e){return Mu(4,4,t,e)}function kw(t,e){if(typeof e=="function")return t=t(),e(t),function(){e(null)};if(e!=null)return t=t(),e.current=t,function(){e.current=null}}function Lw(t,e,r){return r=r!=null?r.concat([t]):null,Mu(4,4,kw.bind(null,e,t),r)}function lp(){}function Cw(t,e){var r=jt();e=e===void 0?null:e;var n=r.memoizedState;return n!==null&&e!==null&&ip(e,n[1])?n[0]:(r.memoizedState=[t,e],t)}function Rw(t,e){var r=jt();e=e===void 0?null:e;var n=r.memoizedState;return n!==null&&e!==null&&ip(e,n[1])?n[0]:(t=t(),r.memoizedState=[t,e],t)}function Pw(t,e,r){return ti&21?(er(r,e)||(r=W1(),be.lanes|=r,ri|=r,t.baseState=!0),e):(t.baseState&&(t.baseState=!1,pt=!0),t.memoizedState=r)}function _A(t,e){var r=se;se=r!==0&&4>r?r:4,t(!0);var n=Ef.transition;Ef.transition={};try{t(!1),e()}finally{se=r,Ef.transition=n}}function jw(){return jt().memoizedState}function wA(t,e,r){var n=wn(t);if(r={lane:n,action:r,hasEagerState:!1,eagerState:null,next:null},zw(t))qw(e,r);else if(r=Tw(t,e,r,n),r!==null){var i=lt();Xt(r,t,n,i),$w(r,e,n)}}function bA(t,e,r){var n=wn(t),i={lane:n,action:r,hasEagerState:!1,eagerState:null,next:null};if(zw(t))qw(e,i);else{var s=t.alternate;if(t.lanes===0&&(s===null||s.lanes===0)&&(s=e.lastRenderedReducer,s!==null))try{var a=e.lastRenderedState,l=s(a,r);if(i.hasEagerState=!0,i.eagerState=l,er(l,a)){var c=e.interleaved;c===null?(i.next=i,Xh(e)):(i.next=c.next,c.next=i),e.interleaved=i;return}}catch{}finally{}r=Tw(t,e,i,n),r!==null&&(i=lt(),Xt(r,t,n,i),$w(r,e,n))}}function zw(t){var e=t.alternate;return t===be||e!==null&&e===be}function qw(t,e){wo=gu=!0;var r=t.pending;r===null?e.next=e:(e.next=r.next,r.next=e),t.pending=e}function $w(t,e,r){if(r&4194240){var n=e.lanes;n&=t.pendingLanes,r|=n,e.lanes=r,Rh(t,r)}}var vu={readContext:Pt,useCallback:tt,useContext:tt,useEffect:tt,useImperativeHandle:tt,useInsertionEffect:tt,useLayoutEffect:tt,useMemo:tt,useReducer:tt,useRef:tt,useState:tt,useDebugValue:tt,useDeferredValue:tt,useTransition:tt,useMutableSource:tt,useSyncExternalStore:tt,useId:tt,unstable_isNewReconciler:!1},SA={readContext:Pt,useCallback:function(t,e){return _r().memoizedState=[t,e===void 0?null:e],t},useContext:Pt,useEffect:t1,useImperativeHandle:function(t,e,r){return r=r!=null?r.concat([t]):null,Ql(4194308,4,kw.bind(null,e,t),r)},useLayoutEffect:function(t,e){return Ql(4194308,4,t,e)},useInsertionEffect:function(t,e){return Ql(4,2,t,e)},useMemo:function(t,e){var r=_r();return e=e===void 0?null:e,t=t(),r.memoizedState=[t,e],t},useReducer:function(t,e,r){var n=_r();return e=r!==void 0?r(e):e,n.memoizedState=n.baseState=e,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:e},n.queue=t,t=t.dispatch=wA.bind(null,be,t),[n.memoizedState,t]},useRef:function(t){var e=_r();return t={current:t},e.memoizedState=t},useState:e1,useDebugValue:lp,useDeferredValue:function(t){return _r().memoizedState=t},useTransition:function(){var t=e1(!1),e=t[0];return t=_A.bind(null,t[1]),_r().memoizedState=t,[e,t]},useMutableSource:function(){},useSyncExternalStore:function(t,e,r){var n=be,i=_r();if(ge){if(r===void 0)throw Error(B(407));r=r()}else{if(r=e(),ze===null)throw Error(B(349));ti&30||Fw(n,e,r)}i.memoizedState=r;var s={value:r,getSnapshot:e};return i.queue=s,t1(Mw.bind(null,n,s,t),[t]),n.flags|=2048,Ro(9,Ow.bind(null,n,s,r,e),void 0,null),r},useId:function(){var t=_r(),e=ze.identifierPrefix;if(ge){var r=Cr,n=Lr;r=(n&~(1<<32-Zt(n)-1)).toString(32)+r,e=":"+e+"R"+r,r=Lo++,0<r&&(e+="H"+r.toString(32)),e+=":"}else r=vA++,e=":"+e+"r"+r.toString(32)+":";return t.memoizedState=e},unstable_isNewReconciler:!1},TA={readContext:Pt,useCallback:Cw,useContext:Pt,useEffect:ap,useImperativeHandle:Lw,useInsertionEffect:Vw,useLayoutEffect:Nw,useMemo:Rw,useReducer:Uf,useRef:Uw,useState:function(){return Uf(Co)},useDebugValue:lp,useDeferredValue:function(t){var e=jt();return Pw(e,ke.memoizedState,t)},useTransition:function(){var t=Uf(Co)[0],e=jt().memoizedState;return[t,e]},useMutableSource:Dw,useSyncExternalStore:Aw,useId:jw,unstable_isNewReconciler:!1},BA={readContext:Pt,useCallback:Cw,useContext:Pt,useEffect:ap,useImperativeHandle:Lw,useInsertionEffect:Vw,useLayoutEffect:Nw,useMemo:Rw,useReducer:Vf,useRef:Uw,useState:function(){return Vf(Co)},useDebugValue:lp,useDeferredValue:function(t){var e=jt();return ke===null?e.memoizedState=t:Pw(e,ke.memoizedState,t)},useTransition:function(){var t=Vf(Co)[0],e=jt().memoizedState;return[t,e]},useMutableSource:Dw,useSyncExternalStore:Aw,useId:jw,unstable_isNewReconciler:!1};function Qt(t,e){if(t&&t.defaultProps){e=Se({},e),t=t.defaultProps;for(var r in t)e[r]===void 0&&(e[r]=t[r]);return e}return e}function yh(t,e,r,n){e=t.memoizedState,r=r(n,e),r=r==null?e:Se({},e,r),t.memoizedState=r,t.lanes===0&&(t.updateQueue.baseState=r)}var xu={isMounted:function(t){return(t=t._reactInternals)?si(t)===t:!1},enqueueSetState:function(t,e,r){t=t._reactInternals;var n=lt(),i=wn(t),s=Rr(n,i);s.payload=e,r!=null&&(s.callback=r),e=vn(t,s,i),e!==null&&(Xt(e,t,i,n),Yl(e,t,i))},enqueueReplaceState:function(t,e,r){t=t._reactInternals;var n=lt(),i=wn(t),s=Rr(n,i);s.tag=1,s.payload=e,r!=null&&(s.callback=r),e=vn(t,s,i),e!==null&&(Xt(e,t,i,n),Yl(e,t,i))},enqueueForceUpdate:function(t,e){t=t._reactInternals;var r=lt(),n=wn(t),i=Rr(r,n);i.tag=2,e!=null&&(i.callback=e),e=vn(t,i,n),e!==null&&(Xt(e,t,n,r),Yl(e,t,n))}};function r1(t,e,r,n,i,s,a){return t=t.stateNode,typeof t.shouldComponentUpdate=="function"?t.shouldComponentUpdate(n,s,a):e.prototype&&e.prototype.isPureReactComponent?!xo(r,n)||!xo(i,s):!0}function Ww(t,e,r){var n=!1,i=Tn,s=e.contextType;return typeof s=="object"&&s!==null?s=Pt(s):(i=mt(e)?Xn:it.current,n=e.contextTypes,s=(n=n!=null)?ss(t,i):Tn),e=new e(r,s),t.memoizedState=e.state!==null&&e.state!==void 0?e.state:null,e.updater=xu,t.stateNode=e,e._reactInternals=t,n&&(t=t.stateNode,t.__reactInternalMemoizedUnmaskedChildContext=i,t.__reactInternalMemoizedMaskedChildContext=s),e}function n1(t,e,r,n){t=e.state,typeof e.componentWillReceiveProps=="function"&&e.componentWillReceiveProps(r,n),typeof e.UNSAFE_componentWillReceiveProps=="function"&&e.UNSAFE_componentWillReceiveProps(r,n),e.state!==t&&xu.enqueueReplaceState(e,e.state,null)}function mh(t,e,r,n){var i=t.stateNode;i.props=r,i.state=t.memoizedState,i.refs={},ep(t);var s=e.contextType;typeof s=="object"&&s!==null?i.context=Pt(s):(s=mt(e)?Xn:it.current,i.context=ss(t,s)),i.state=t.memoizedState,s=e.getDerivedStateFromProps,typeof s=="function"&&(yh(t,e,s,r),i.state=t.memoizedState),typeof e.getDerivedStateFromProps=="function"||typeof i.getSnapshotBeforeUpdate=="function"||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(e=i.state,typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount(),e!==i.state&&xu.enqueueReplaceState(i,i.state,null),yu(t,r,i,n),i.state=t.memoizedState),typeof i.componentDidMount=="function"&&(t.flags|=4194308)}function us(t,e){try{var r="",n=e;do r+=eD(n),n=n.return;while(n);var i=r}catch(s){i=`
+`),a=i.length-1,l=s.length-1;1<=a&&0<=l&&i[a]!==s[l];)l--;for(;1<=a&&0<=l;a--,l--)if(i[a]!==s[l]){if(a!==1||l!==1)do if(a--,l--,0>l||i[a]!==s[l]){var o=`
+`+i[a].replace(" at new "," at ");return e.displayName&&o.includes("<anonymous>")&&(o=o.replace("<anonymous>",e.displayName)),o}while(1<=a&&0<=l);break}}}finally{If=!1,Error.prepareStackTrace=r}return(e=e?e.displayName||e.name:"")?ba(e):""}function u1(e){switch(e.tag){case 5:return ba(e.type);case 16:return ba("Lazy");case 13:return ba("Suspense");case 19:return ba("SuspenseList");case 0:case 2:case 15:return e=Tf(e.type,!1),e;case 11:return e=Tf(e.type.render,!1),e;case 1:return e=Tf(e.type,!0),e;default:return""}}function Jf(e){if(e==null)return null;if(typeof e==="function")return e.displayName||e.name||null;if(typeof e==="string")return e;switch(e){case os:return"Fragment";case ss:return"Portal";case Yf:return"Profiler";case jd:return"StrictMode";case Kf:return"Suspense";case Qf:return"SuspenseList"}if(typeof e==="object")switch(e.$$typeof){case Ry:return(e.displayName||"Context")+".Consumer";case Cy:return(e._context.displayName||"Context")+".Provider";case $d:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case Wd:return t=e.displayName||null,t!==null?t:Jf(e.type)||"Memo";case wn:t=e._payload,e=e._init;try{return Jf(e(t))}catch(r){}}return null}function c1(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return Jf(t);case 8:return t===jd?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t==="function")return t.displayName||t.name||null;if(typeof t==="string")return t}return null}function Mn(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function zy(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function f1(e){var t=zy(e)?"checked":"value",r=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),n=""+e[t];if(!e.hasOwnProperty(t)&&typeof r<"u"&&typeof r.get==="function"&&typeof r.set==="function"){var{get:i,set:s}=r;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(a){n=""+a,s.call(this,a)}}),Object.defineProperty(e,t,{enumerable:r.enumerable}),{getValue:function(){return n},setValue:function(a){n=""+a},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function Gl(e){e._valueTracker||(e._valueTracker=f1(e))}function Vy(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var r=t.getValue(),n="";return e&&(n=zy(e)?e.checked?"true":"false":e.value),e=n,e!==r?(t.setValue(e),!0):!1}function Bu(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch(t){return e.body}}function Zf(e,t){var r=t.checked;return _e({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:r!=null?r:e._wrapperState.initialChecked})}function Lm(e,t){var r=t.defaultValue==null?"":t.defaultValue,n=t.checked!=null?t.checked:t.defaultChecked;r=Mn(t.value!=null?t.value:r),e._wrapperState={initialChecked:n,initialValue:r,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function jy(e,t){t=t.checked,t!=null&&Vd(e,"checked",t,!1)}function Xf(e,t){jy(e,t);var r=Mn(t.value),n=t.type;if(r!=null)if(n==="number"){if(r===0&&e.value===""||e.value!=r)e.value=""+r}else e.value!==""+r&&(e.value=""+r);else if(n==="submit"||n==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?qf(e,t.type,r):t.hasOwnProperty("defaultValue")&&qf(e,t.type,Mn(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Um(e,t,r){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var n=t.type;if(!(n!=="submit"&&n!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,r||t===e.value||(e.value=t),e.defaultValue=t}r=e.name,r!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,r!==""&&(e.name=r)}function qf(e,t,r){if(t!=="number"||Bu(e.ownerDocument)!==e)r==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+r&&(e.defaultValue=""+r)}var Sa=Array.isArray;function gs(e,t,r,n){if(e=e.options,t){t={};for(var i=0;i<r.length;i++)t["$"+r[i]]=!0;for(r=0;r<e.length;r++)i=t.hasOwnProperty("$"+e[r].value),e[r].selected!==i&&(e[r].selected=i),i&&n&&(e[r].defaultSelected=!0)}else{r=""+Mn(r),t=null;for(i=0;i<e.length;i++){if(e[i].value===r){e[i].selected=!0,n&&(e[i].defaultSelected=!0);return}t!==null||e[i].disabled||(t=e[i])}t!==null&&(t.selected=!0)}}function Gf(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(w(91));return _e({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Cm(e,t){var r=t.value;if(r==null){if(r=t.children,t=t.defaultValue,r!=null){if(t!=null)throw Error(w(92));if(Sa(r)){if(1<r.length)throw Error(w(93));r=r[0]}t=r}t==null&&(t=""),r=t}e._wrapperState={initialValue:Mn(r)}}function $y(e,t){var r=Mn(t.value),n=Mn(t.defaultValue);r!=null&&(r=""+r,r!==e.value&&(e.value=r),t.defaultValue==null&&e.defaultValue!==r&&(e.defaultValue=r)),n!=null&&(e.defaultValue=""+n)}function Rm(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function Wy(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ed(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?Wy(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var eu,Hy=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,r,n,i){MSApp.execUnsafeLocalFunction(function(){return e(t,r,n,i)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{eu=eu||document.createElement("div"),eu.innerHTML="<svg>"+t.valueOf().toString()+"</svg>";for(t=eu.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Pa(e,t){if(t){var r=e.firstChild;if(r&&r===e.lastChild&&r.nodeType===3){r.nodeValue=t;return}}e.textContent=t}var Aa={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},d1=["Webkit","ms","Moz","O"];Object.keys(Aa).forEach(function(e){d1.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Aa[t]=Aa[e]})});function Yy(e,t,r){return t==null||typeof t==="boolean"||t===""?"":r||typeof t!=="number"||t===0||Aa.hasOwnProperty(e)&&Aa[e]?(""+t).trim():t+"px"}function Ky(e,t){e=e.style;for(var r in t)if(t.hasOwnProperty(r)){var n=r.indexOf("--")===0,i=Yy(r,t[r],n);r==="float"&&(r="cssFloat"),n?e.setProperty(r,i):e[r]=i}}var h1=_e({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function td(e,t){if(t){if(h1[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(w(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(w(60));if(typeof t.dangerouslySetInnerHTML!=="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(w(61))}if(t.style!=null&&typeof t.style!=="object")throw Error(w(62))}}function rd(e,t){if(e.indexOf("-")===-1)return typeof t.is==="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var nd=null;function Hd(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var id=null,vs=null,_s=null;function Pm(e){if(e=nl(e)){if(typeof id!=="function")throw Error(w(280));var t=e.stateNode;t&&(t=qu(t),id(e.stateNode,e.type,t))}}function Qy(e){vs?_s?_s.push(e):_s=[e]:vs=e}function Jy(){if(vs){var e=vs,t=_s;if(_s=vs=null,Pm(e),t)for(e=0;e<t.length;e++)Pm(t[e])}}function Zy(e,t){return e(t)}function Xy(){}var Ff=!1;function qy(e,t,r){if(Ff)return e(t,r);Ff=!0;try{return Zy(e,t,r)}finally{if(Ff=!1,vs!==null||_s!==null)Xy(),Jy()}}function za(e,t){var r=e.stateNode;if(r===null)return null;var n=qu(r);if(n===null)return null;r=n[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(n=!n.disabled)||(e=e.type,n=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!n;break e;default:e=!1}if(e)return null;if(r&&typeof r!=="function")throw Error(w(231,t,typeof r));return r}var sd=!1;if(Kr)try{ui={},Object.defineProperty(ui,"passive",{get:function(){sd=!0}}),window.addEventListener("test",ui,ui),window.removeEventListener("test",ui,ui)}catch(e){sd=!1}var ui;function p1(e,t,r,n,i,s,a,l,o){var u=Array.prototype.slice.call(arguments,3);try{t.apply(r,u)}catch(c){this.onError(c)}}var Ea=!1,Iu=null,Tu=!1,od=null,m1={onError:function(e){Ea=!0,Iu=e}};function y1(e,t,r,n,i,s,a,l,o){Ea=!1,Iu=null,p1.apply(m1,arguments)}function g1(e,t,r,n,i,s,a,l,o){if(y1.apply(this,arguments),Ea){if(Ea){var u=Iu;Ea=!1,Iu=null}else throw Error(w(198));Tu||(Tu=!0,od=u)}}function xi(e){var t=e,r=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,(t.flags&4098)!==0&&(r=t.return),e=t.return;while(e)}return t.tag===3?r:null}function Gy(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function zm(e){if(xi(e)!==e)throw Error(w(188))}function v1(e){var t=e.alternate;if(!t){if(t=xi(e),t===null)throw Error(w(188));return t!==e?null:e}for(var r=e,n=t;;){var i=r.return;if(i===null)break;var s=i.alternate;if(s===null){if(n=i.return,n!==null){r=n;continue}break}if(i.child===s.child){for(s=i.child;s;){if(s===r)return zm(i),e;if(s===n)return zm(i),t;s=s.sibling}throw Error(w(188))}if(r.return!==n.return)r=i,n=s;else{for(var a=!1,l=i.child;l;){if(l===r){a=!0,r=i,n=s;break}if(l===n){a=!0,n=i,r=s;break}l=l.sibling}if(!a){for(l=s.child;l;){if(l===r){a=!0,r=s,n=i;break}if(l===n){a=!0,n=s,r=i;break}l=l.sibling}if(!a)throw Error(w(189))}}if(r.alternate!==n)throw Error(w(190))}if(r.tag!==3)throw Error(w(188));return r.stateNode.current===r?e:t}function eg(e){return e=v1(e),e!==null?tg(e):null}function tg(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=tg(e);if(t!==null)return t;e=e.sibling}return null}var{unstable_scheduleCallback:rg,unstable_cancelCallback:Vm,unstable_shouldYield:_1,unstable_requestPaint:w1,unstable_now:xe,unstable_getCurrentPriorityLevel:b1,unstable_ImmediatePriority:Yd,unstable_UserBlockingPriority:ng,unstable_NormalPriority:Fu,unstable_LowPriority:S1,unstable_IdlePriority:ig}=xt,Qu=null,Ir=null;function x1(e){if(Ir&&typeof Ir.onCommitFiberRoot==="function")try{Ir.onCommitFiberRoot(Qu,e,void 0,(e.current.flags&128)===128)}catch(t){}}var rr=Math.clz32?Math.clz32:T1,{log:B1,LN2:I1}=Math;function T1(e){return e>>>=0,e===0?32:31-(B1(e)/I1|0)|0}var tu=64,ru=4194304;function xa(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Du(e,t){var r=e.pendingLanes;if(r===0)return 0;var n=0,i=e.suspendedLanes,s=e.pingedLanes,a=r&268435455;if(a!==0){var l=a&~i;l!==0?n=xa(l):(s&=a,s!==0&&(n=xa(s)))}else a=r&~i,a!==0?n=xa(a):s!==0&&(n=xa(s));if(n===0)return 0;if(t!==0&&t!==n&&(t&i)===0&&(i=n&-n,s=t&-t,i>=s||i===16&&(s&4194240)!==0))return t;if((n&4)!==0&&(n|=r&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=n;0<t;)r=31-rr(t),i=1<<r,n|=e[r],t&=~i;return n}function F1(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5000;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function D1(e,t){for(var{suspendedLanes:r,pingedLanes:n,expirationTimes:i,pendingLanes:s}=e;0<s;){var a=31-rr(s),l=1<<a,o=i[a];if(o===-1){if((l&r)===0||(l&n)!==0)i[a]=F1(l,t)}else o<=t&&(e.expiredLanes|=l);s&=~l}}function ad(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function sg(){var e=tu;return tu<<=1,(tu&4194240)===0&&(tu=64),e}function Df(e){for(var t=[],r=0;31>r;r++)t.push(e);return t}function tl(e,t,r){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-rr(t),e[t]=r}function A1(e,t){var r=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var n=e.eventTimes;for(e=e.expirationTimes;0<r;){var i=31-rr(r),s=1<<i;t[i]=0,n[i]=-1,e[i]=-1,r&=~s}}function Kd(e,t){var r=e.entangledLanes|=t;for(e=e.entanglements;r;){var n=31-rr(r),i=1<<n;i&t|e[n]&t&&(e[n]|=t),r&=~i}}var se=0;function og(e){return e&=-e,1<e?4<e?(e&268435455)!==0?16:536870912:4:1}var ag,Qd,lg,ug,cg,ld=!1,nu=[],Tn=null,Fn=null,Dn=null,Va=new Map,ja=new Map,Sn=[],E1="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function jm(e,t){switch(e){case"focusin":case"focusout":Tn=null;break;case"dragenter":case"dragleave":Fn=null;break;case"mouseover":case"mouseout":Dn=null;break;case"pointerover":case"pointerout":Va.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ja.delete(t.pointerId)}}function ma(e,t,r,n,i,s){if(e===null||e.nativeEvent!==s)return e={blockedOn:t,domEventName:r,eventSystemFlags:n,nativeEvent:s,targetContainers:[i]},t!==null&&(t=nl(t),t!==null&&Qd(t)),e;return e.eventSystemFlags|=n,t=e.targetContainers,i!==null&&t.indexOf(i)===-1&&t.push(i),e}function O1(e,t,r,n,i){switch(t){case"focusin":return Tn=ma(Tn,e,t,r,n,i),!0;case"dragenter":return Fn=ma(Fn,e,t,r,n,i),!0;case"mouseover":return Dn=ma(Dn,e,t,r,n,i),!0;case"pointerover":var s=i.pointerId;return Va.set(s,ma(Va.get(s)||null,e,t,r,n,i)),!0;case"gotpointercapture":return s=i.pointerId,ja.set(s,ma(ja.get(s)||null,e,t,r,n,i)),!0}return!1}function fg(e){var t=di(e.target);if(t!==null){var r=xi(t);if(r!==null){if(t=r.tag,t===13){if(t=Gy(r),t!==null){e.blockedOn=t,cg(e.priority,function(){lg(r)});return}}else if(t===3&&r.stateNode.current.memoizedState.isDehydrated){e.blockedOn=r.tag===3?r.stateNode.containerInfo:null;return}}}e.blockedOn=null}function hu(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var r=ud(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(r===null){r=e.nativeEvent;var n=new r.constructor(r.type,r);nd=n,r.target.dispatchEvent(n),nd=null}else return t=nl(r),t!==null&&Qd(t),e.blockedOn=r,!1;t.shift()}return!0}function $m(e,t,r){hu(e)&&r.delete(t)}function k1(){ld=!1,Tn!==null&&hu(Tn)&&(Tn=null),Fn!==null&&hu(Fn)&&(Fn=null),Dn!==null&&hu(Dn)&&(Dn=null),Va.forEach($m),ja.forEach($m)}function ya(e,t){e.blockedOn===t&&(e.blockedOn=null,ld||(ld=!0,xt.unstable_scheduleCallback(xt.unstable_NormalPriority,k1)))}function $a(e){function t(i){return ya(i,e)}if(0<nu.length){ya(nu[0],e);for(var r=1;r<nu.length;r++){var n=nu[r];n.blockedOn===e&&(n.blockedOn=null)}}Tn!==null&&ya(Tn,e),Fn!==null&&ya(Fn,e),Dn!==null&&ya(Dn,e),Va.forEach(t),ja.forEach(t);for(r=0;r<Sn.length;r++)n=Sn[r],n.blockedOn===e&&(n.blockedOn=null);for(;0<Sn.length&&(r=Sn[0],r.blockedOn===null);)fg(r),r.blockedOn===null&&Sn.shift()}var ws=Xr.ReactCurrentBatchConfig,Au=!0;function N1(e,t,r,n){var i=se,s=ws.transition;ws.transition=null;try{se=1,Jd(e,t,r,n)}finally{se=i,ws.transition=s}}function M1(e,t,r,n){var i=se,s=ws.transition;ws.transition=null;try{se=4,Jd(e,t,r,n)}finally{se=i,ws.transition=s}}function Jd(e,t,r,n){if(Au){var i=ud(e,t,r,n);if(i===null)Mf(e,t,n,Eu,r),jm(e,n);else if(O1(i,e,t,r,n))n.stopPropagation();else if(jm(e,n),t&4&&-1<E1.indexOf(e)){for(;i!==null;){var s=nl(i);if(s!==null&&ag(s),s=ud(e,t,r,n),s===null&&Mf(e,t,n,Eu,r),s===i)break;i=s}i!==null&&n.stopPropagation()}else Mf(e,t,n,null,r)}}var Eu=null;function ud(e,t,r,n){if(Eu=null,e=Hd(n),e=di(e),e!==null)if(t=xi(e),t===null)e=null;else if(r=t.tag,r===13){if(e=Gy(t),e!==null)return e;e=null}else if(r===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Eu=e,null}function dg(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(b1()){case Yd:return 1;case ng:return 4;case Fu:case S1:return 16;case ig:return 536870912;default:return 16}default:return 16}}var Bn=null,Zd=null,pu=null;function hg(){if(pu)return pu;var e,t=Zd,r=t.length,n,i="value"in Bn?Bn.value:Bn.textContent,s=i.length;for(e=0;e<r&&t[e]===i[e];e++);var a=r-e;for(n=1;n<=a&&t[r-n]===i[s-n];n++);return pu=i.slice(e,1<n?1-n:void 0)}function mu(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function iu(){return!0}function Wm(){return!1}function Bt(e){function t(r,n,i,s,a){this._reactName=r,this._targetInst=i,this.type=n,this.nativeEvent=s,this.target=a,this.currentTarget=null;for(var l in e)e.hasOwnProperty(l)&&(r=e[l],this[l]=r?r(s):s[l]);return this.isDefaultPrevented=(s.defaultPrevented!=null?s.defaultPrevented:s.returnValue===!1)?iu:Wm,this.isPropagationStopped=Wm,this}return _e(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var r=this.nativeEvent;r&&(r.preventDefault?r.preventDefault():typeof r.returnValue!=="unknown"&&(r.returnValue=!1),this.isDefaultPrevented=iu)},stopPropagation:function(){var r=this.nativeEvent;r&&(r.stopPropagation?r.stopPropagation():typeof r.cancelBubble!=="unknown"&&(r.cancelBubble=!0),this.isPropagationStopped=iu)},persist:function(){},isPersistent:iu}),t}var Es={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Xd=Bt(Es),rl=_e({},Es,{view:0,detail:0}),L1=Bt(rl),Af,Ef,ga,Ju=_e({},rl,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:qd,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){if("movementX"in e)return e.movementX;return e!==ga&&(ga&&e.type==="mousemove"?(Af=e.screenX-ga.screenX,Ef=e.screenY-ga.screenY):Ef=Af=0,ga=e),Af},movementY:function(e){return"movementY"in e?e.movementY:Ef}}),Hm=Bt(Ju),U1=_e({},Ju,{dataTransfer:0}),C1=Bt(U1),R1=_e({},rl,{relatedTarget:0}),Of=Bt(R1),P1=_e({},Es,{animationName:0,elapsedTime:0,pseudoElement:0}),z1=Bt(P1),V1=_e({},Es,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),j1=Bt(V1),$1=_e({},Es,{data:0}),Ym=Bt($1),W1={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},H1={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Y1={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function K1(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=Y1[e])?!!t[e]:!1}function qd(){return K1}var Q1=_e({},rl,{key:function(e){if(e.key){var t=W1[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=mu(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?H1[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:qd,charCode:function(e){return e.type==="keypress"?mu(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?mu(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),J1=Bt(Q1),Z1=_e({},Ju,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Km=Bt(Z1),X1=_e({},rl,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:qd}),q1=Bt(X1),G1=_e({},Es,{propertyName:0,elapsedTime:0,pseudoElement:0}),eb=Bt(G1),tb=_e({},Ju,{deltaX:function(e){return"deltaX"in e?e.deltaX:("wheelDeltaX"in e)?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:("wheelDeltaY"in e)?-e.wheelDeltaY:("wheelDelta"in e)?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),rb=Bt(tb),nb=[9,13,27,32],Gd=Kr&&"CompositionEvent"in window,Oa=null;Kr&&"documentMode"in document&&(Oa=document.documentMode);var ib=Kr&&"TextEvent"in window&&!Oa,pg=Kr&&(!Gd||Oa&&8<Oa&&11>=Oa),Qm=String.fromCharCode(32),Jm=!1;function mg(e,t){switch(e){case"keyup":return nb.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function yg(e){return e=e.detail,typeof e==="object"&&"data"in e?e.data:null}var as=!1;function sb(e,t){switch(e){case"compositionend":return yg(t);case"keypress":if(t.which!==32)return null;return Jm=!0,Qm;case"textInput":return e=t.data,e===Qm&&Jm?null:e;default:return null}}function ob(e,t){if(as)return e==="compositionend"||!Gd&&mg(e,t)?(e=hg(),pu=Zd=Bn=null,as=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return pg&&t.locale!=="ko"?null:t.data;default:return null}}var ab={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Zm(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!ab[e.type]:t==="textarea"?!0:!1}function gg(e,t,r,n){Qy(n),t=Ou(t,"onChange"),0<t.length&&(r=new Xd("onChange","change",null,r,n),e.push({event:r,listeners:t}))}var ka=null,Wa=null;function lb(e){Dg(e,0)}function Zu(e){var t=cs(e);if(Vy(t))return e}function ub(e,t){if(e==="change")return t}var vg=!1;if(Kr){if(Kr){if(Ia="oninput"in document,!Ia)yu=document.createElement("div"),yu.setAttribute("oninput","return;"),Ia=typeof yu.oninput==="function";Ba=Ia}else Ba=!1;vg=Ba&&(!document.documentMode||9<document.documentMode)}var Ba,Ia,yu;function Xm(){ka&&(ka.detachEvent("onpropertychange",_g),Wa=ka=null)}function _g(e){if(e.propertyName==="value"&&Zu(Wa)){var t=[];gg(t,Wa,e,Hd(e)),qy(lb,t)}}function cb(e,t,r){e==="focusin"?(Xm(),ka=t,Wa=r,ka.attachEvent("onpropertychange",_g)):e==="focusout"&&Xm()}function fb(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return Zu(Wa)}function db(e,t){if(e==="click")return Zu(t)}function hb(e,t){if(e==="input"||e==="change")return Zu(t)}function pb(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var ir=typeof Object.is==="function"?Object.is:pb;function Ha(e,t){if(ir(e,t))return!0;if(typeof e!=="object"||e===null||typeof t!=="object"||t===null)return!1;var r=Object.keys(e),n=Object.keys(t);if(r.length!==n.length)return!1;for(n=0;n<r.length;n++){var i=r[n];if(!Hf.call(t,i)||!ir(e[i],t[i]))return!1}return!0}function qm(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Gm(e,t){var r=qm(e);e=0;for(var n;r;){if(r.nodeType===3){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=qm(r)}}function wg(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?wg(e,t.parentNode):("contains"in e)?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function bg(){for(var e=window,t=Bu();t instanceof e.HTMLIFrameElement;){try{var r=typeof t.contentWindow.location.href==="string"}catch(n){r=!1}if(r)e=t.contentWindow;else break;t=Bu(e.document)}return t}function eh(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function mb(e){var t=bg(),r=e.focusedElem,n=e.selectionRange;if(t!==r&&r&&r.ownerDocument&&wg(r.ownerDocument.documentElement,r)){if(n!==null&&eh(r)){if(t=n.start,e=n.end,e===void 0&&(e=t),"selectionStart"in r)r.selectionStart=t,r.selectionEnd=Math.min(e,r.value.length);else if(e=(t=r.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var i=r.textContent.length,s=Math.min(n.start,i);n=n.end===void 0?s:Math.min(n.end,i),!e.extend&&s>n&&(i=n,n=s,s=i),i=Gm(r,s);var a=Gm(r,n);i&&a&&(e.rangeCount!==1||e.anchorNode!==i.node||e.anchorOffset!==i.offset||e.focusNode!==a.node||e.focusOffset!==a.offset)&&(t=t.createRange(),t.setStart(i.node,i.offset),e.removeAllRanges(),s>n?(e.addRange(t),e.extend(a.node,a.offset)):(t.setEnd(a.node,a.offset),e.addRange(t)))}}t=[];for(e=r;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});typeof r.focus==="function"&&r.focus();for(r=0;r<t.length;r++)e=t[r],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var yb=Kr&&"documentMode"in document&&11>=document.documentMode,ls=null,cd=null,Na=null,fd=!1;function ey(e,t,r){var n=r.window===r?r.document:r.nodeType===9?r:r.ownerDocument;fd||ls==null||ls!==Bu(n)||(n=ls,("selectionStart"in n)&&eh(n)?n={start:n.selectionStart,end:n.selectionEnd}:(n=(n.ownerDocument&&n.ownerDocument.defaultView||window).getSelection(),n={anchorNode:n.anchorNode,anchorOffset:n.anchorOffset,focusNode:n.focusNode,focusOffset:n.focusOffset}),Na&&Ha(Na,n)||(Na=n,n=Ou(cd,"onSelect"),0<n.length&&(t=new Xd("onSelect","select",null,t,r),e.push({event:t,listeners:n}),t.target=ls)))}function su(e,t){var r={};return r[e.toLowerCase()]=t.toLowerCase(),r["Webkit"+e]="webkit"+t,r["Moz"+e]="moz"+t,r}var us={animationend:su("Animation","AnimationEnd"),animationiteration:su("Animation","AnimationIteration"),animationstart:su("Animation","AnimationStart"),transitionend:su("Transition","TransitionEnd")},kf={},Sg={};Kr&&(Sg=document.createElement("div").style,("AnimationEvent"in window)||(delete us.animationend.animation,delete us.animationiteration.animation,delete us.animationstart.animation),("TransitionEvent"in window)||delete us.transitionend.transition);function Xu(e){if(kf[e])return kf[e];if(!us[e])return e;var t=us[e],r;for(r in t)if(t.hasOwnProperty(r)&&r in Sg)return kf[e]=t[r];return e}var xg=Xu("animationend"),Bg=Xu("animationiteration"),Ig=Xu("animationstart"),Tg=Xu("transitionend"),Fg=new Map,ty="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Un(e,t){Fg.set(e,t),Si(t,[e])}for(Ta=0;Ta<ty.length;Ta++)Fa=ty[Ta],dd=Fa.toLowerCase(),hd=Fa[0].toUpperCase()+Fa.slice(1),Un(dd,"on"+hd);var Fa,dd,hd,Ta;Un(xg,"onAnimationEnd");Un(Bg,"onAnimationIteration");Un(Ig,"onAnimationStart");Un("dblclick","onDoubleClick");Un("focusin","onFocus");Un("focusout","onBlur");Un(Tg,"onTransitionEnd");xs("onMouseEnter",["mouseout","mouseover"]);xs("onMouseLeave",["mouseout","mouseover"]);xs("onPointerEnter",["pointerout","pointerover"]);xs("onPointerLeave",["pointerout","pointerover"]);Si("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Si("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Si("onBeforeInput",["compositionend","keypress","textInput","paste"]);Si("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Si("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Si("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Da="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),gb=new Set("cancel close invalid load scroll toggle".split(" ").concat(Da));function ry(e,t,r){var n=e.type||"unknown-event";e.currentTarget=r,g1(n,t,void 0,e),e.currentTarget=null}function Dg(e,t){t=(t&4)!==0;for(var r=0;r<e.length;r++){var n=e[r],i=n.event;n=n.listeners;e:{var s=void 0;if(t)for(var a=n.length-1;0<=a;a--){var l=n[a],o=l.instance,u=l.currentTarget;if(l=l.listener,o!==s&&i.isPropagationStopped())break e;ry(i,l,u),s=o}else for(a=0;a<n.length;a++){if(l=n[a],o=l.instance,u=l.currentTarget,l=l.listener,o!==s&&i.isPropagationStopped())break e;ry(i,l,u),s=o}}}if(Tu)throw e=od,Tu=!1,od=null,e}function he(e,t){var r=t[vd];r===void 0&&(r=t[vd]=new Set);var n=e+"__bubble";r.has(n)||(Ag(t,e,2,!1),r.add(n))}function Nf(e,t,r){var n=0;t&&(n|=4),Ag(r,e,n,t)}var ou="_reactListening"+Math.random().toString(36).slice(2);function Ya(e){if(!e[ou]){e[ou]=!0,Uy.forEach(function(r){r!=="selectionchange"&&(gb.has(r)||Nf(r,!1,e),Nf(r,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[ou]||(t[ou]=!0,Nf("selectionchange",!1,t))}}function Ag(e,t,r,n){switch(dg(t)){case 1:var i=N1;break;case 4:i=M1;break;default:i=Jd}r=i.bind(null,t,r,e),i=void 0,!sd||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(i=!0),n?i!==void 0?e.addEventListener(t,r,{capture:!0,passive:i}):e.addEventListener(t,r,!0):i!==void 0?e.addEventListener(t,r,{passive:i}):e.addEventListener(t,r,!1)}function Mf(e,t,r,n,i){var s=n;if((t&1)===0&&(t&2)===0&&n!==null)e:for(;;){if(n===null)return;var a=n.tag;if(a===3||a===4){var l=n.stateNode.containerInfo;if(l===i||l.nodeType===8&&l.parentNode===i)break;if(a===4)for(a=n.return;a!==null;){var o=a.tag;if(o===3||o===4){if(o=a.stateNode.containerInfo,o===i||o.nodeType===8&&o.parentNode===i)return}a=a.return}for(;l!==null;){if(a=di(l),a===null)return;if(o=a.tag,o===5||o===6){n=s=a;continue e}l=l.parentNode}}n=n.return}qy(function(){var u=s,c=Hd(r),p=[];e:{var y=Fg.get(e);if(y!==void 0){var _=Xd,x=e;switch(e){case"keypress":if(mu(r)===0)break e;case"keydown":case"keyup":_=J1;break;case"focusin":x="focus",_=Of;break;case"focusout":x="blur",_=Of;break;case"beforeblur":case"afterblur":_=Of;break;case"click":if(r.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":_=Hm;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":_=C1;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":_=q1;break;case xg:case Bg:case Ig:_=z1;break;case Tg:_=eb;break;case"scroll":_=L1;break;case"wheel":_=rb;break;case"copy":case"cut":case"paste":_=j1;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":_=Km}var B=(t&4)!==0,re=!B&&e==="scroll",h=B?y!==null?y+"Capture":null:y;B=[];for(var d=u,m;d!==null;){m=d;var b=m.stateNode;if(m.tag===5&&b!==null&&(m=b,h!==null&&(b=za(d,h),b!=null&&B.push(Ka(d,b,m)))),re)break;d=d.return}0<B.length&&(y=new _(y,x,null,r,c),p.push({event:y,listeners:B}))}}if((t&7)===0){e:{if(y=e==="mouseover"||e==="pointerover",_=e==="mouseout"||e==="pointerout",y&&r!==nd&&(x=r.relatedTarget||r.fromElement)&&(di(x)||x[Qr]))break e;if(_||y){if(y=c.window===c?c:(y=c.ownerDocument)?y.defaultView||y.parentWindow:window,_){if(x=r.relatedTarget||r.toElement,_=u,x=x?di(x):null,x!==null&&(re=xi(x),x!==re||x.tag!==5&&x.tag!==6))x=null}else _=null,x=u;if(_!==x){if(B=Hm,b="onMouseLeave",h="onMouseEnter",d="mouse",e==="pointerout"||e==="pointerover")B=Km,b="onPointerLeave",h="onPointerEnter",d="pointer";if(re=_==null?y:cs(_),m=x==null?y:cs(x),y=new B(b,d+"leave",_,r,c),y.target=re,y.relatedTarget=m,b=null,di(c)===u&&(B=new B(h,d+"enter",x,r,c),B.target=m,B.relatedTarget=re,b=B),re=b,_&&x)t:{B=_,h=x,d=0;for(m=B;m;m=ns(m))d++;m=0;for(b=h;b;b=ns(b))m++;for(;0<d-m;)B=ns(B),d--;for(;0<m-d;)h=ns(h),m--;for(;d--;){if(B===h||h!==null&&B===h.alternate)break t;B=ns(B),h=ns(h)}B=null}else B=null;_!==null&&ny(p,y,_,B,!1),x!==null&&re!==null&&ny(p,re,x,B,!0)}}}e:{if(y=u?cs(u):window,_=y.nodeName&&y.nodeName.toLowerCase(),_==="select"||_==="input"&&y.type==="file")var T=ub;else if(Zm(y))if(vg)T=hb;else{T=fb;var O=cb}else(_=y.nodeName)&&_.toLowerCase()==="input"&&(y.type==="checkbox"||y.type==="radio")&&(T=db);if(T&&(T=T(e,u))){gg(p,T,r,c);break e}O&&O(e,y,u),e==="focusout"&&(O=y._wrapperState)&&O.controlled&&y.type==="number"&&qf(y,"number",y.value)}switch(O=u?cs(u):window,e){case"focusin":if(Zm(O)||O.contentEditable==="true")ls=O,cd=u,Na=null;break;case"focusout":Na=cd=ls=null;break;case"mousedown":fd=!0;break;case"contextmenu":case"mouseup":case"dragend":fd=!1,ey(p,r,c);break;case"selectionchange":if(yb)break;case"keydown":case"keyup":ey(p,r,c)}var k;if(Gd)e:{switch(e){case"compositionstart":var N="onCompositionStart";break e;case"compositionend":N="onCompositionEnd";break e;case"compositionupdate":N="onCompositionUpdate";break e}N=void 0}else as?mg(e,r)&&(N="onCompositionEnd"):e==="keydown"&&r.keyCode===229&&(N="onCompositionStart");if(N&&(pg&&r.locale!=="ko"&&(as||N!=="onCompositionStart"?N==="onCompositionEnd"&&as&&(k=hg()):(Bn=c,Zd=("value"in Bn)?Bn.value:Bn.textContent,as=!0)),O=Ou(u,N),0<O.length&&(N=new Ym(N,e,null,r,c),p.push({event:N,listeners:O}),k?N.data=k:(k=yg(r),k!==null&&(N.data=k)))),k=ib?sb(e,r):ob(e,r))u=Ou(u,"onBeforeInput"),0<u.length&&(c=new Ym("onBeforeInput","beforeinput",null,r,c),p.push({event:c,listeners:u}),c.data=k)}Dg(p,t)})}function Ka(e,t,r){return{instance:e,listener:t,currentTarget:r}}function Ou(e,t){for(var r=t+"Capture",n=[];e!==null;){var i=e,s=i.stateNode;i.tag===5&&s!==null&&(i=s,s=za(e,r),s!=null&&n.unshift(Ka(e,s,i)),s=za(e,t),s!=null&&n.push(Ka(e,s,i))),e=e.return}return n}function ns(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e?e:null}function ny(e,t,r,n,i){for(var s=t._reactName,a=[];r!==null&&r!==n;){var l=r,o=l.alternate,u=l.stateNode;if(o!==null&&o===n)break;l.tag===5&&u!==null&&(l=u,i?(o=za(r,s),o!=null&&a.unshift(Ka(r,o,l))):i||(o=za(r,s),o!=null&&a.push(Ka(r,o,l)))),r=r.return}a.length!==0&&e.push({event:t,listeners:a})}var vb=/\r\n?/g,_b=/\u0000|\uFFFD/g;function iy(e){return(typeof e==="string"?e:""+e).replace(vb,`
+`).replace(_b,"")}function au(e,t,r){if(t=iy(t),iy(e)!==t&&r)throw Error(w(425))}function ku(){}var pd=null,md=null;function yd(e,t){return e==="textarea"||e==="noscript"||typeof t.children==="string"||typeof t.children==="number"||typeof t.dangerouslySetInnerHTML==="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var gd=typeof setTimeout==="function"?setTimeout:void 0,wb=typeof clearTimeout==="function"?clearTimeout:void 0,sy=typeof Promise==="function"?Promise:void 0,bb=typeof queueMicrotask==="function"?queueMicrotask:typeof sy<"u"?function(e){return sy.resolve(null).then(e).catch(Sb)}:gd;function Sb(e){setTimeout(function(){throw e})}function Lf(e,t){var r=t,n=0;do{var i=r.nextSibling;if(e.removeChild(r),i&&i.nodeType===8)if(r=i.data,r==="/$"){if(n===0){e.removeChild(i),$a(t);return}n--}else r!=="$"&&r!=="$?"&&r!=="$!"||n++;r=i}while(r);$a(t)}function An(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function oy(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var r=e.data;if(r==="$"||r==="$!"||r==="$?"){if(t===0)return e;t--}else r==="/$"&&t++}e=e.previousSibling}return null}var Os=Math.random().toString(36).slice(2),Br="__reactFiber$"+Os,Qa="__reactProps$"+Os,Qr="__reactContainer$"+Os,vd="__reactEvents$"+Os,xb="__reactListeners$"+Os,Bb="__reactHandles$"+Os;function di(e){var t=e[Br];if(t)return t;for(var r=e.parentNode;r;){if(t=r[Qr]||r[Br]){if(r=t.alternate,t.child!==null||r!==null&&r.child!==null)for(e=oy(e);e!==null;){if(r=e[Br])return r;e=oy(e)}return t}e=r,r=e.parentNode}return null}function nl(e){return e=e[Br]||e[Qr],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function cs(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(w(33))}function qu(e){return e[Qa]||null}var _d=[],fs=-1;function Cn(e){return{current:e}}function pe(e){0>fs||(e.current=_d[fs],_d[fs]=null,fs--)}function fe(e,t){fs++,_d[fs]=e.current,e.current=t}var Ln={},qe=Cn(Ln),ht=Cn(!1),gi=Ln;function Bs(e,t){var r=e.type.contextTypes;if(!r)return Ln;var n=e.stateNode;if(n&&n.__reactInternalMemoizedUnmaskedChildContext===t)return n.__reactInternalMemoizedMaskedChildContext;var i={},s;for(s in r)i[s]=t[s];return n&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=i),i}function pt(e){return e=e.childContextTypes,e!==null&&e!==void 0}function Nu(){pe(ht),pe(qe)}function ay(e,t,r){if(qe.current!==Ln)throw Error(w(168));fe(qe,t),fe(ht,r)}function Eg(e,t,r){var n=e.stateNode;if(t=t.childContextTypes,typeof n.getChildContext!=="function")return r;n=n.getChildContext();for(var i in n)if(!(i in t))throw Error(w(108,c1(e)||"Unknown",i));return _e({},r,n)}function Mu(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Ln,gi=qe.current,fe(qe,e),fe(ht,ht.current),!0}function ly(e,t,r){var n=e.stateNode;if(!n)throw Error(w(169));r?(e=Eg(e,t,gi),n.__reactInternalMemoizedMergedChildContext=e,pe(ht),pe(qe),fe(qe,e)):pe(ht),fe(ht,r)}var $r=null,Gu=!1,Uf=!1;function Og(e){$r===null?$r=[e]:$r.push(e)}function Ib(e){Gu=!0,Og(e)}function Rn(){if(!Uf&&$r!==null){Uf=!0;var e=0,t=se;try{var r=$r;for(se=1;e<r.length;e++){var n=r[e];do n=n(!0);while(n!==null)}$r=null,Gu=!1}catch(i){throw $r!==null&&($r=$r.slice(e+1)),rg(Yd,Rn),i}finally{se=t,Uf=!1}}return null}var ds=[],hs=0,Lu=null,Uu=0,jt=[],$t=0,vi=null,Wr=1,Hr="";function ci(e,t){ds[hs++]=Uu,ds[hs++]=Lu,Lu=e,Uu=t}function kg(e,t,r){jt[$t++]=Wr,jt[$t++]=Hr,jt[$t++]=vi,vi=e;var n=Wr;e=Hr;var i=32-rr(n)-1;n&=~(1<<i),r+=1;var s=32-rr(t)+i;if(30<s){var a=i-i%5;s=(n&(1<<a)-1).toString(32),n>>=a,i-=a,Wr=1<<32-rr(t)+i|r<<i|n,Hr=s+e}else Wr=1<<s|r<<i|n,Hr=e}function th(e){e.return!==null&&(ci(e,1),kg(e,1,0))}function rh(e){for(;e===Lu;)Lu=ds[--hs],ds[hs]=null,Uu=ds[--hs],ds[hs]=null;for(;e===vi;)vi=jt[--$t],jt[$t]=null,Hr=jt[--$t],jt[$t]=null,Wr=jt[--$t],jt[$t]=null}var St=null,bt=null,ye=!1,tr=null;function Ng(e,t){var r=Wt(5,null,null,0);r.elementType="DELETED",r.stateNode=t,r.return=e,t=e.deletions,t===null?(e.deletions=[r],e.flags|=16):t.push(r)}function uy(e,t){switch(e.tag){case 5:var r=e.type;return t=t.nodeType!==1||r.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,St=e,bt=An(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,St=e,bt=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(r=vi!==null?{id:Wr,overflow:Hr}:null,e.memoizedState={dehydrated:t,treeContext:r,retryLane:1073741824},r=Wt(18,null,null,0),r.stateNode=t,r.return=e,e.child=r,St=e,bt=null,!0):!1;default:return!1}}function wd(e){return(e.mode&1)!==0&&(e.flags&128)===0}function bd(e){if(ye){var t=bt;if(t){var r=t;if(!uy(e,t)){if(wd(e))throw Error(w(418));t=An(r.nextSibling);var n=St;t&&uy(e,t)?Ng(n,r):(e.flags=e.flags&-4097|2,ye=!1,St=e)}}else{if(wd(e))throw Error(w(418));e.flags=e.flags&-4097|2,ye=!1,St=e}}}function cy(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;St=e}function lu(e){if(e!==St)return!1;if(!ye)return cy(e),ye=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!yd(e.type,e.memoizedProps)),t&&(t=bt)){if(wd(e))throw Mg(),Error(w(418));for(;t;)Ng(e,t),t=An(t.nextSibling)}if(cy(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(w(317));e:{e=e.nextSibling;for(t=0;e;){if(e.nodeType===8){var r=e.data;if(r==="/$"){if(t===0){bt=An(e.nextSibling);break e}t--}else r!=="$"&&r!=="$!"&&r!=="$?"||t++}e=e.nextSibling}bt=null}}else bt=St?An(e.stateNode.nextSibling):null;return!0}function Mg(){for(var e=bt;e;)e=An(e.nextSibling)}function Is(){bt=St=null,ye=!1}function nh(e){tr===null?tr=[e]:tr.push(e)}var Tb=Xr.ReactCurrentBatchConfig;function va(e,t,r){if(e=r.ref,e!==null&&typeof e!=="function"&&typeof e!=="object"){if(r._owner){if(r=r._owner,r){if(r.tag!==1)throw Error(w(309));var n=r.stateNode}if(!n)throw Error(w(147,e));var i=n,s=""+e;if(t!==null&&t.ref!==null&&typeof t.ref==="function"&&t.ref._stringRef===s)return t.ref;return t=function(a){var l=i.refs;a===null?delete l[s]:l[s]=a},t._stringRef=s,t}if(typeof e!=="string")throw Error(w(284));if(!r._owner)throw Error(w(290,e))}return e}function uu(e,t){throw e=Object.prototype.toString.call(t),Error(w(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function fy(e){var t=e._init;return t(e._payload)}function Lg(e){function t(h,d){if(e){var m=h.deletions;m===null?(h.deletions=[d],h.flags|=16):m.push(d)}}function r(h,d){if(!e)return null;for(;d!==null;)t(h,d),d=d.sibling;return null}function n(h,d){for(h=new Map;d!==null;)d.key!==null?h.set(d.key,d):h.set(d.index,d),d=d.sibling;return h}function i(h,d){return h=Nn(h,d),h.index=0,h.sibling=null,h}function s(h,d,m){if(h.index=m,!e)return h.flags|=1048576,d;if(m=h.alternate,m!==null)return m=m.index,m<d?(h.flags|=2,d):m;return h.flags|=2,d}function a(h){return e&&h.alternate===null&&(h.flags|=2),h}function l(h,d,m,b){if(d===null||d.tag!==6)return d=$f(m,h.mode,b),d.return=h,d;return d=i(d,m),d.return=h,d}function o(h,d,m,b){var T=m.type;if(T===os)return c(h,d,m.props.children,b,m.key);if(d!==null&&(d.elementType===T||typeof T==="object"&&T!==null&&T.$$typeof===wn&&fy(T)===d.type))return b=i(d,m.props),b.ref=va(h,d,m),b.return=h,b;return b=xu(m.type,m.key,m.props,null,h.mode,b),b.ref=va(h,d,m),b.return=h,b}function u(h,d,m,b){if(d===null||d.tag!==4||d.stateNode.containerInfo!==m.containerInfo||d.stateNode.implementation!==m.implementation)return d=Wf(m,h.mode,b),d.return=h,d;return d=i(d,m.children||[]),d.return=h,d}function c(h,d,m,b,T){if(d===null||d.tag!==7)return d=yi(m,h.mode,b,T),d.return=h,d;return d=i(d,m),d.return=h,d}function p(h,d,m){if(typeof d==="string"&&d!==""||typeof d==="number")return d=$f(""+d,h.mode,m),d.return=h,d;if(typeof d==="object"&&d!==null){switch(d.$$typeof){case ql:return m=xu(d.type,d.key,d.props,null,h.mode,m),m.ref=va(h,null,d),m.return=h,m;case ss:return d=Wf(d,h.mode,m),d.return=h,d;case wn:var b=d._init;return p(h,b(d._payload),m)}if(Sa(d)||pa(d))return d=yi(d,h.mode,m,null),d.return=h,d;uu(h,d)}return null}function y(h,d,m,b){var T=d!==null?d.key:null;if(typeof m==="string"&&m!==""||typeof m==="number")return T!==null?null:l(h,d,""+m,b);if(typeof m==="object"&&m!==null){switch(m.$$typeof){case ql:return m.key===T?o(h,d,m,b):null;case ss:return m.key===T?u(h,d,m,b):null;case wn:return T=m._init,y(h,d,T(m._payload),b)}if(Sa(m)||pa(m))return T!==null?null:c(h,d,m,b,null);uu(h,m)}return null}function _(h,d,m,b,T){if(typeof b==="string"&&b!==""||typeof b==="number")return h=h.get(m)||null,l(d,h,""+b,T);if(typeof b==="object"&&b!==null){switch(b.$$typeof){case ql:return h=h.get(b.key===null?m:b.key)||null,o(d,h,b,T);case ss:return h=h.get(b.key===null?m:b.key)||null,u(d,h,b,T);case wn:var O=b._init;return _(h,d,m,O(b._payload),T)}if(Sa(b)||pa(b))return h=h.get(m)||null,c(d,h,b,T,null);uu(d,b)}return null}function x(h,d,m,b){for(var T=null,O=null,k=d,N=d=0,be=null;k!==null&&N<m.length;N++){k.index>N?(be=k,k=null):be=k.sibling;var G=y(h,k,m[N],b);if(G===null){k===null&&(k=be);break}e&&k&&G.alternate===null&&t(h,k),d=s(G,d,N),O===null?T=G:O.sibling=G,O=G,k=be}if(N===m.length)return r(h,k),ye&&ci(h,N),T;if(k===null){for(;N<m.length;N++)k=p(h,m[N],b),k!==null&&(d=s(k,d,N),O===null?T=k:O.sibling=k,O=k);return ye&&ci(h,N),T}for(k=n(h,k);N<m.length;N++)be=_(k,h,N,m[N],b),be!==null&&(e&&be.alternate!==null&&k.delete(be.key===null?N:be.key),d=s(be,d,N),O===null?T=be:O.sibling=be,O=be);return e&&k.forEach(function(wr){return t(h,wr)}),ye&&ci(h,N),T}function B(h,d,m,b){var T=pa(m);if(typeof T!=="function")throw Error(w(150));if(m=T.call(m),m==null)throw Error(w(151));for(var O=T=null,k=d,N=d=0,be=null,G=m.next();k!==null&&!G.done;N++,G=m.next()){k.index>N?(be=k,k=null):be=k.sibling;var wr=y(h,k,G.value,b);if(wr===null){k===null&&(k=be);break}e&&k&&wr.alternate===null&&t(h,k),d=s(wr,d,N),O===null?T=wr:O.sibling=wr,O=wr,k=be}if(G.done)return r(h,k),ye&&ci(h,N),T;if(k===null){for(;!G.done;N++,G=m.next())G=p(h,G.value,b),G!==null&&(d=s(G,d,N),O===null?T=G:O.sibling=G,O=G);return ye&&ci(h,N),T}for(k=n(h,k);!G.done;N++,G=m.next())G=_(k,h,N,G.value,b),G!==null&&(e&&G.alternate!==null&&k.delete(G.key===null?N:G.key),d=s(G,d,N),O===null?T=G:O.sibling=G,O=G);return e&&k.forEach(function(ne){return t(h,ne)}),ye&&ci(h,N),T}function re(h,d,m,b){if(typeof m==="object"&&m!==null&&m.type===os&&m.key===null&&(m=m.props.children),typeof m==="object"&&m!==null){switch(m.$$typeof){case ql:e:{for(var T=m.key,O=d;O!==null;){if(O.key===T){if(T=m.type,T===os){if(O.tag===7){r(h,O.sibling),d=i(O,m.props.children),d.return=h,h=d;break e}}else if(O.elementType===T||typeof T==="object"&&T!==null&&T.$$typeof===wn&&fy(T)===O.type){r(h,O.sibling),d=i(O,m.props),d.ref=va(h,O,m),d.return=h,h=d;break e}r(h,O);break}else t(h,O);O=O.sibling}m.type===os?(d=yi(m.props.children,h.mode,b,m.key),d.return=h,h=d):(b=xu(m.type,m.key,m.props,null,h.mode,b),b.ref=va(h,d,m),b.return=h,h=b)}return a(h);case ss:e:{for(O=m.key;d!==null;){if(d.key===O)if(d.tag===4&&d.stateNode.containerInfo===m.containerInfo&&d.stateNode.implementation===m.implementation){r(h,d.sibling),d=i(d,m.children||[]),d.return=h,h=d;break e}else{r(h,d);break}else t(h,d);d=d.sibling}d=Wf(m,h.mode,b),d.return=h,h=d}return a(h);case wn:return O=m._init,re(h,d,O(m._payload),b)}if(Sa(m))return x(h,d,m,b);if(pa(m))return B(h,d,m,b);uu(h,m)}return typeof m==="string"&&m!==""||typeof m==="number"?(m=""+m,d!==null&&d.tag===6?(r(h,d.sibling),d=i(d,m),d.return=h,h=d):(r(h,d),d=$f(m,h.mode,b),d.return=h,h=d),a(h)):r(h,d)}return re}var Ts=Lg(!0),Ug=Lg(!1),Cu=Cn(null),Ru=null,ps=null,ih=null;function sh(){ih=ps=Ru=null}function oh(e){var t=Cu.current;pe(Cu),e._currentValue=t}function Sd(e,t,r){for(;e!==null;){var n=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,n!==null&&(n.childLanes|=t)):n!==null&&(n.childLanes&t)!==t&&(n.childLanes|=t),e===r)break;e=e.return}}function bs(e,t){Ru=e,ih=ps=null,e=e.dependencies,e!==null&&e.firstContext!==null&&((e.lanes&t)!==0&&(dt=!0),e.firstContext=null)}function Yt(e){var t=e._currentValue;if(ih!==e)if(e={context:e,memoizedValue:t,next:null},ps===null){if(Ru===null)throw Error(w(308));ps=e,Ru.dependencies={lanes:0,firstContext:e}}else ps=ps.next=e;return t}var hi=null;function ah(e){hi===null?hi=[e]:hi.push(e)}function Cg(e,t,r,n){var i=t.interleaved;return i===null?(r.next=r,ah(t)):(r.next=i.next,i.next=r),t.interleaved=r,Jr(e,n)}function Jr(e,t){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),r=e;for(e=e.return;e!==null;)e.childLanes|=t,r=e.alternate,r!==null&&(r.childLanes|=t),r=e,e=e.return;return r.tag===3?r.stateNode:null}var bn=!1;function lh(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Rg(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Yr(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function En(e,t,r){var n=e.updateQueue;if(n===null)return null;if(n=n.shared,(te&2)!==0){var i=n.pending;return i===null?t.next=t:(t.next=i.next,i.next=t),n.pending=t,Jr(e,r)}return i=n.interleaved,i===null?(t.next=t,ah(n)):(t.next=i.next,i.next=t),n.interleaved=t,Jr(e,r)}function gu(e,t,r){if(t=t.updateQueue,t!==null&&(t=t.shared,(r&4194240)!==0)){var n=t.lanes;n&=e.pendingLanes,r|=n,t.lanes=r,Kd(e,r)}}function dy(e,t){var r=e.updateQueue,n=e.alternate;if(n!==null&&(n=n.updateQueue,r===n)){var i=null,s=null;if(r=r.firstBaseUpdate,r!==null){do{var a={eventTime:r.eventTime,lane:r.lane,tag:r.tag,payload:r.payload,callback:r.callback,next:null};s===null?i=s=a:s=s.next=a,r=r.next}while(r!==null);s===null?i=s=t:s=s.next=t}else i=s=t;r={baseState:n.baseState,firstBaseUpdate:i,lastBaseUpdate:s,shared:n.shared,effects:n.effects},e.updateQueue=r;return}e=r.lastBaseUpdate,e===null?r.firstBaseUpdate=t:e.next=t,r.lastBaseUpdate=t}function Pu(e,t,r,n){var i=e.updateQueue;bn=!1;var s=i.firstBaseUpdate,a=i.lastBaseUpdate,l=i.shared.pending;if(l!==null){i.shared.pending=null;var o=l,u=o.next;o.next=null,a===null?s=u:a.next=u,a=o;var c=e.alternate;c!==null&&(c=c.updateQueue,l=c.lastBaseUpdate,l!==a&&(l===null?c.firstBaseUpdate=u:l.next=u,c.lastBaseUpdate=o))}if(s!==null){var p=i.baseState;a=0,c=u=o=null,l=s;do{var y=l.lane,_=l.eventTime;if((n&y)===y){c!==null&&(c=c.next={eventTime:_,lane:0,tag:l.tag,payload:l.payload,callback:l.callback,next:null});e:{var x=e,B=l;switch(y=t,_=r,B.tag){case 1:if(x=B.payload,typeof x==="function"){p=x.call(_,p,y);break e}p=x;break e;case 3:x.flags=x.flags&-65537|128;case 0:if(x=B.payload,y=typeof x==="function"?x.call(_,p,y):x,y===null||y===void 0)break e;p=_e({},p,y);break e;case 2:bn=!0}}l.callback!==null&&l.lane!==0&&(e.flags|=64,y=i.effects,y===null?i.effects=[l]:y.push(l))}else _={eventTime:_,lane:y,tag:l.tag,payload:l.payload,callback:l.callback,next:null},c===null?(u=c=_,o=p):c=c.next=_,a|=y;if(l=l.next,l===null)if(l=i.shared.pending,l===null)break;else y=l,l=y.next,y.next=null,i.lastBaseUpdate=y,i.shared.pending=null}while(1);if(c===null&&(o=p),i.baseState=o,i.firstBaseUpdate=u,i.lastBaseUpdate=c,t=i.shared.interleaved,t!==null){i=t;do a|=i.lane,i=i.next;while(i!==t)}else s===null&&(i.shared.lanes=0);wi|=a,e.lanes=a,e.memoizedState=p}}function hy(e,t,r){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var n=e[t],i=n.callback;if(i!==null){if(n.callback=null,n=r,typeof i!=="function")throw Error(w(191,i));i.call(n)}}}var il={},Tr=Cn(il),Ja=Cn(il),Za=Cn(il);function pi(e){if(e===il)throw Error(w(174));return e}function uh(e,t){switch(fe(Za,t),fe(Ja,e),fe(Tr,il),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:ed(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=ed(t,e)}pe(Tr),fe(Tr,t)}function Fs(){pe(Tr),pe(Ja),pe(Za)}function Pg(e){pi(Za.current);var t=pi(Tr.current),r=ed(t,e.type);t!==r&&(fe(Ja,e),fe(Tr,r))}function ch(e){Ja.current===e&&(pe(Tr),pe(Ja))}var ge=Cn(0);function zu(e){for(var t=e;t!==null;){if(t.tag===13){var r=t.memoizedState;if(r!==null&&(r=r.dehydrated,r===null||r.data==="$?"||r.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Cf=[];function fh(){for(var e=0;e<Cf.length;e++)Cf[e]._workInProgressVersionPrimary=null;Cf.length=0}var{ReactCurrentDispatcher:vu,ReactCurrentBatchConfig:Rf}=Xr,_i=0,ve=null,Ae=null,Ce=null,Vu=!1,Ma=!1,Xa=0,Fb=0;function Je(){throw Error(w(321))}function dh(e,t){if(t===null)return!1;for(var r=0;r<t.length&&r<e.length;r++)if(!ir(e[r],t[r]))return!1;return!0}function hh(e,t,r,n,i,s){if(_i=s,ve=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,vu.current=e===null||e.memoizedState===null?Ob:kb,e=r(n,i),Ma){s=0;do{if(Ma=!1,Xa=0,25<=s)throw Error(w(301));s+=1,Ce=Ae=null,t.updateQueue=null,vu.current=Nb,e=r(n,i)}while(Ma)}if(vu.current=ju,t=Ae!==null&&Ae.next!==null,_i=0,Ce=Ae=ve=null,Vu=!1,t)throw Error(w(300));return e}function ph(){var e=Xa!==0;return Xa=0,e}function xr(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Ce===null?ve.memoizedState=Ce=e:Ce=Ce.next=e,Ce}function Kt(){if(Ae===null){var e=ve.alternate;e=e!==null?e.memoizedState:null}else e=Ae.next;var t=Ce===null?ve.memoizedState:Ce.next;if(t!==null)Ce=t,Ae=e;else{if(e===null)throw Error(w(310));Ae=e,e={memoizedState:Ae.memoizedState,baseState:Ae.baseState,baseQueue:Ae.baseQueue,queue:Ae.queue,next:null},Ce===null?ve.memoizedState=Ce=e:Ce=Ce.next=e}return Ce}function qa(e,t){return typeof t==="function"?t(e):t}function Pf(e){var t=Kt(),r=t.queue;if(r===null)throw Error(w(311));r.lastRenderedReducer=e;var n=Ae,i=n.baseQueue,s=r.pending;if(s!==null){if(i!==null){var a=i.next;i.next=s.next,s.next=a}n.baseQueue=i=s,r.pending=null}if(i!==null){s=i.next,n=n.baseState;var l=a=null,o=null,u=s;do{var c=u.lane;if((_i&c)===c)o!==null&&(o=o.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),n=u.hasEagerState?u.eagerState:e(n,u.action);else{var p={lane:c,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};o===null?(l=o=p,a=n):o=o.next=p,ve.lanes|=c,wi|=c}u=u.next}while(u!==null&&u!==s);o===null?a=n:o.next=l,ir(n,t.memoizedState)||(dt=!0),t.memoizedState=n,t.baseState=a,t.baseQueue=o,r.lastRenderedState=n}if(e=r.interleaved,e!==null){i=e;do s=i.lane,ve.lanes|=s,wi|=s,i=i.next;while(i!==e)}else i===null&&(r.lanes=0);return[t.memoizedState,r.dispatch]}function zf(e){var t=Kt(),r=t.queue;if(r===null)throw Error(w(311));r.lastRenderedReducer=e;var{dispatch:n,pending:i}=r,s=t.memoizedState;if(i!==null){r.pending=null;var a=i=i.next;do s=e(s,a.action),a=a.next;while(a!==i);ir(s,t.memoizedState)||(dt=!0),t.memoizedState=s,t.baseQueue===null&&(t.baseState=s),r.lastRenderedState=s}return[s,n]}function zg(){}function Vg(e,t){var r=ve,n=Kt(),i=t(),s=!ir(n.memoizedState,i);if(s&&(n.memoizedState=i,dt=!0),n=n.queue,mh(Wg.bind(null,r,n,e),[e]),n.getSnapshot!==t||s||Ce!==null&&Ce.memoizedState.tag&1){if(r.flags|=2048,Ga(9,$g.bind(null,r,n,i,t),void 0,null),Re===null)throw Error(w(349));(_i&30)!==0||jg(r,t,i)}return i}function jg(e,t,r){e.flags|=16384,e={getSnapshot:t,value:r},t=ve.updateQueue,t===null?(t={lastEffect:null,stores:null},ve.updateQueue=t,t.stores=[e]):(r=t.stores,r===null?t.stores=[e]:r.push(e))}function $g(e,t,r,n){t.value=r,t.getSnapshot=n,Hg(t)&&Yg(e)}function Wg(e,t,r){return r(function(){Hg(t)&&Yg(e)})}function Hg(e){var t=e.getSnapshot;e=e.value;try{var r=t();return!ir(e,r)}catch(n){return!0}}function Yg(e){var t=Jr(e,1);t!==null&&nr(t,e,1,-1)}function py(e){var t=xr();return typeof e==="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:qa,lastRenderedState:e},t.queue=e,e=e.dispatch=Eb.bind(null,ve,e),[t.memoizedState,e]}function Ga(e,t,r,n){return e={tag:e,create:t,destroy:r,deps:n,next:null},t=ve.updateQueue,t===null?(t={lastEffect:null,stores:null},ve.updateQueue=t,t.lastEffect=e.next=e):(r=t.lastEffect,r===null?t.lastEffect=e.next=e:(n=r.next,r.next=e,e.next=n,t.lastEffect=e)),e}function Kg(){return Kt().memoizedState}function _u(e,t,r,n){var i=xr();ve.flags|=e,i.memoizedState=Ga(1|t,r,void 0,n===void 0?null:n)}function ec(e,t,r,n){var i=Kt();n=n===void 0?null:n;var s=void 0;if(Ae!==null){var a=Ae.memoizedState;if(s=a.destroy,n!==null&&dh(n,a.deps)){i.memoizedState=Ga(t,r,s,n);return}}ve.flags|=e,i.memoizedState=Ga(1|t,r,s,n)}function my(e,t){return _u(8390656,8,e,t)}function mh(e,t){return ec(2048,8,e,t)}function Qg(e,t){return ec(4,2,e,t)}function Jg(e,t){return ec(4,4,e,t)}function Zg(e,t){if(typeof t==="function")return e=e(),t(e),function(){t(null)};if(t!==null&&t!==void 0)return e=e(),t.current=e,function(){t.current=null}}function Xg(e,t,r){return r=r!==null&&r!==void 0?r.concat([e]):null,ec(4,4,Zg.bind(null,t,e),r)}function yh(){}function qg(e,t){var r=Kt();t=t===void 0?null:t;var n=r.memoizedState;if(n!==null&&t!==null&&dh(t,n[1]))return n[0];return r.memoizedState=[e,t],e}function Gg(e,t){var r=Kt();t=t===void 0?null:t;var n=r.memoizedState;if(n!==null&&t!==null&&dh(t,n[1]))return n[0];return e=e(),r.memoizedState=[e,t],e}function ev(e,t,r){if((_i&21)===0)return e.baseState&&(e.baseState=!1,dt=!0),e.memoizedState=r;return ir(r,t)||(r=sg(),ve.lanes|=r,wi|=r,e.baseState=!0),t}function Db(e,t){var r=se;se=r!==0&&4>r?r:4,e(!0);var n=Rf.transition;Rf.transition={};try{e(!1),t()}finally{se=r,Rf.transition=n}}function tv(){return Kt().memoizedState}function Ab(e,t,r){var n=kn(e);if(r={lane:n,action:r,hasEagerState:!1,eagerState:null,next:null},rv(e))nv(t,r);else if(r=Cg(e,t,r,n),r!==null){var i=at();nr(r,e,n,i),iv(r,t,n)}}function Eb(e,t,r){var n=kn(e),i={lane:n,action:r,hasEagerState:!1,eagerState:null,next:null};if(rv(e))nv(t,i);else{var s=e.alternate;if(e.lanes===0&&(s===null||s.lanes===0)&&(s=t.lastRenderedReducer,s!==null))try{var a=t.lastRenderedState,l=s(a,r);if(i.hasEagerState=!0,i.eagerState=l,ir(l,a)){var o=t.interleaved;o===null?(i.next=i,ah(t)):(i.next=o.next,o.next=i),t.interleaved=i;return}}catch(u){}finally{}r=Cg(e,t,i,n),r!==null&&(i=at(),nr(r,e,n,i),iv(r,t,n))}}function rv(e){var t=e.alternate;return e===ve||t!==null&&t===ve}function nv(e,t){Ma=Vu=!0;var r=e.pending;r===null?t.next=t:(t.next=r.next,r.next=t),e.pending=t}function iv(e,t,r){if((r&4194240)!==0){var n=t.lanes;n&=e.pendingLanes,r|=n,t.lanes=r,Kd(e,r)}}var ju={readContext:Yt,useCallback:Je,useContext:Je,useEffect:Je,useImperativeHandle:Je,useInsertionEffect:Je,useLayoutEffect:Je,useMemo:Je,useReducer:Je,useRef:Je,useState:Je,useDebugValue:Je,useDeferredValue:Je,useTransition:Je,useMutableSource:Je,useSyncExternalStore:Je,useId:Je,unstable_isNewReconciler:!1},Ob={readContext:Yt,useCallback:function(e,t){return xr().memoizedState=[e,t===void 0?null:t],e},useContext:Yt,useEffect:my,useImperativeHandle:function(e,t,r){return r=r!==null&&r!==void 0?r.concat([e]):null,_u(4194308,4,Zg.bind(null,t,e),r)},useLayoutEffect:function(e,t){return _u(4194308,4,e,t)},useInsertionEffect:function(e,t){return _u(4,2,e,t)},useMemo:function(e,t){var r=xr();return t=t===void 0?null:t,e=e(),r.memoizedState=[e,t],e},useReducer:function(e,t,r){var n=xr();return t=r!==void 0?r(t):t,n.memoizedState=n.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},n.queue=e,e=e.dispatch=Ab.bind(null,ve,e),[n.memoizedState,e]},useRef:function(e){var t=xr();return e={current:e},t.memoizedState=e},useState:py,useDebugValue:yh,useDeferredValue:function(e){return xr().memoizedState=e},useTransition:function(){var e=py(!1),t=e[0];return e=Db.bind(null,e[1]),xr().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,r){var n=ve,i=xr();if(ye){if(r===void 0)throw Error(w(407));r=r()}else{if(r=t(),Re===null)throw Error(w(349));(_i&30)!==0||jg(n,t,r)}i.memoizedState=r;var s={value:r,getSnapshot:t};return i.queue=s,my(Wg.bind(null,n,s,e),[e]),n.flags|=2048,Ga(9,$g.bind(null,n,s,r,t),void 0,null),r},useId:function(){var e=xr(),t=Re.identifierPrefix;if(ye){var r=Hr,n=Wr;r=(n&~(1<<32-rr(n)-1)).toString(32)+r,t=":"+t+"R"+r,r=Xa++,0<r&&(t+="H"+r.toString(32)),t+=":"}else r=Fb++,t=":"+t+"r"+r.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},kb={readContext:Yt,useCallback:qg,useContext:Yt,useEffect:mh,useImperativeHandle:Xg,useInsertionEffect:Qg,useLayoutEffect:Jg,useMemo:Gg,useReducer:Pf,useRef:Kg,useState:function(){return Pf(qa)},useDebugValue:yh,useDeferredValue:function(e){var t=Kt();return ev(t,Ae.memoizedState,e)},useTransition:function(){var e=Pf(qa)[0],t=Kt().memoizedState;return[e,t]},useMutableSource:zg,useSyncExternalStore:Vg,useId:tv,unstable_isNewReconciler:!1},Nb={readContext:Yt,useCallback:qg,useContext:Yt,useEffect:mh,useImperativeHandle:Xg,useInsertionEffect:Qg,useLayoutEffect:Jg,useMemo:Gg,useReducer:zf,useRef:Kg,useState:function(){return zf(qa)},useDebugValue:yh,useDeferredValue:function(e){var t=Kt();return Ae===null?t.memoizedState=e:ev(t,Ae.memoizedState,e)},useTransition:function(){var e=zf(qa)[0],t=Kt().memoizedState;return[e,t]},useMutableSource:zg,useSyncExternalStore:Vg,useId:tv,unstable_isNewReconciler:!1};function Gt(e,t){if(e&&e.defaultProps){t=_e({},t),e=e.defaultProps;for(var r in e)t[r]===void 0&&(t[r]=e[r]);return t}return t}function xd(e,t,r,n){t=e.memoizedState,r=r(n,t),r=r===null||r===void 0?t:_e({},t,r),e.memoizedState=r,e.lanes===0&&(e.updateQueue.baseState=r)}var tc={isMounted:function(e){return(e=e._reactInternals)?xi(e)===e:!1},enqueueSetState:function(e,t,r){e=e._reactInternals;var n=at(),i=kn(e),s=Yr(n,i);s.payload=t,r!==void 0&&r!==null&&(s.callback=r),t=En(e,s,i),t!==null&&(nr(t,e,i,n),gu(t,e,i))},enqueueReplaceState:function(e,t,r){e=e._reactInternals;var n=at(),i=kn(e),s=Yr(n,i);s.tag=1,s.payload=t,r!==void 0&&r!==null&&(s.callback=r),t=En(e,s,i),t!==null&&(nr(t,e,i,n),gu(t,e,i))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var r=at(),n=kn(e),i=Yr(r,n);i.tag=2,t!==void 0&&t!==null&&(i.callback=t),t=En(e,i,n),t!==null&&(nr(t,e,n,r),gu(t,e,n))}};function yy(e,t,r,n,i,s,a){return e=e.stateNode,typeof e.shouldComponentUpdate==="function"?e.shouldComponentUpdate(n,s,a):t.prototype&&t.prototype.isPureReactComponent?!Ha(r,n)||!Ha(i,s):!0}function sv(e,t,r){var n=!1,i=Ln,s=t.contextType;return typeof s==="object"&&s!==null?s=Yt(s):(i=pt(t)?gi:qe.current,n=t.contextTypes,s=(n=n!==null&&n!==void 0)?Bs(e,i):Ln),t=new t(r,s),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=tc,e.stateNode=t,t._reactInternals=e,n&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=i,e.__reactInternalMemoizedMaskedChildContext=s),t}function gy(e,t,r,n){e=t.state,typeof t.componentWillReceiveProps==="function"&&t.componentWillReceiveProps(r,n),typeof t.UNSAFE_componentWillReceiveProps==="function"&&t.UNSAFE_componentWillReceiveProps(r,n),t.state!==e&&tc.enqueueReplaceState(t,t.state,null)}function Bd(e,t,r,n){var i=e.stateNode;i.props=r,i.state=e.memoizedState,i.refs={},lh(e);var s=t.contextType;typeof s==="object"&&s!==null?i.context=Yt(s):(s=pt(t)?gi:qe.current,i.context=Bs(e,s)),i.state=e.memoizedState,s=t.getDerivedStateFromProps,typeof s==="function"&&(xd(e,t,s,r),i.state=e.memoizedState),typeof t.getDerivedStateFromProps==="function"||typeof i.getSnapshotBeforeUpdate==="function"||typeof i.UNSAFE_componentWillMount!=="function"&&typeof i.componentWillMount!=="function"||(t=i.state,typeof i.componentWillMount==="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount==="function"&&i.UNSAFE_componentWillMount(),t!==i.state&&tc.enqueueReplaceState(i,i.state,null),Pu(e,r,i,n),i.state=e.memoizedState),typeof i.componentDidMount==="function"&&(e.flags|=4194308)}function Ds(e,t){try{var r="",n=t;do r+=u1(n),n=n.return;while(n);var i=r}catch(s){i=`
 Error generating stack: `+s.message+`
-`+s.stack}return{value:t,source:e,stack:i,digest:null}}function Nf(t,e,r){return{value:t,source:null,stack:r??null,digest:e??null}}function gh(t,e){try{console.error(e.value)}catch(r){setTimeout(function(){throw r})}}var IA=typeof WeakMap=="function"?WeakMap:Map;function Hw(t,e,r){r=Rr(-1,r),r.tag=3,r.payload={element:null};var n=e.value;return r.callback=function(){wu||(wu=!0,Ah=n),gh(t,e)},r}function Yw(t,e,r){r=Rr(-1,r),r.tag=3;var n=t.type.getDerivedStateFromError;if(typeof n=="function"){var i=e.value;r.payload=function(){return n(i)},r.callback=function(){gh(t,e)}}var s=t.stateNode;return s!==null&&typeof s.componentDidCatch=="function"&&(r.callback=function(){gh(t,e),typeof n!="function"&&(_n===null?_n=new Set([this]):_n.add(this));var a=e.stack;this.componentDidCatch(e.value,{componentStack:a!==null?a:""})}),r}function i1(t,e,r){var n=t.pingCache;if(n===null){n=t.pingCache=new IA;var i=new Set;n.set(e,i)}else i=n.get(e),i===void 0&&(i=new Set,n.set(e,i));i.has(r)||(i.add(r),t=RA.bind(null,t,e,r),e.then(t,t))}function s1(t){do{var e;if((e=t.tag===13)&&(e=t.memoizedState,e=e!==null?e.dehydrated!==null:!0),e)return t;t=t.return}while(t!==null);return null}function o1(t,e,r,n,i){return t.mode&1?(t.flags|=65536,t.lanes=i,t):(t===e?t.flags|=65536:(t.flags|=128,r.flags|=131072,r.flags&=-52805,r.tag===1&&(r.alternate===null?r.tag=17:(e=Rr(-1,1),e.tag=2,vn(r,e,1))),r.lanes|=1),t)}var DA=$r.ReactCurrentOwner,pt=!1;function at(t,e,r,n){e.child=t===null?Sw(e,null,r,n):as(e,t.child,r,n)}function a1(t,e,r,n,i){r=r.render;var s=e.ref;return rs(e,i),n=sp(t,e,r,n,s,i),r=op(),t!==null&&!pt?(e.updateQueue=t.updateQueue,e.flags&=-2053,t.lanes&=~i,qr(t,e,i)):(ge&&r&&Yh(e),e.flags|=1,at(t,e,n,i),e.child)}function l1(t,e,r,n,i){if(t===null){var s=r.type;return typeof s=="function"&&!mp(s)&&s.defaultProps===void 0&&r.compare===null&&r.defaultProps===void 0?(e.tag=15,e.type=s,Kw(t,e,s,n,i)):(t=Xl(r.type,null,n,e,e.mode,i),t.ref=e.ref,t.return=e,e.child=t)}if(s=t.child,!(t.lanes&i)){var a=s.memoizedProps;if(r=r.compare,r=r!==null?r:xo,r(a,n)&&t.ref===e.ref)return qr(t,e,i)}return e.flags|=1,t=bn(s,n),t.ref=e.ref,t.return=e,e.child=t}function Kw(t,e,r,n,i){if(t!==null){var s=t.memoizedProps;if(xo(s,n)&&t.ref===e.ref)if(pt=!1,e.pendingProps=n=s,(t.lanes&i)!==0)t.flags&131072&&(pt=!0);else return e.lanes=t.lanes,qr(t,e,i)}return vh(t,e,r,n,i)}function Qw(t,e,r){var n=e.pendingProps,i=n.children,s=t!==null?t.memoizedState:null;if(n.mode==="hidden")if(!(e.mode&1))e.memoizedState={baseLanes:0,cachePool:null,transitions:null},ce(Gi,St),St|=r;else{if(!(r&1073741824))return t=s!==null?s.baseLanes|r:r,e.lanes=e.childLanes=1073741824,e.memoizedState={baseLanes:t,cachePool:null,transitions:null},e.updateQueue=null,ce(Gi,St),St|=t,null;e.memoizedState={baseLanes:0,cachePool:null,transitions:null},n=s!==null?s.baseLanes:r,ce(Gi,St),St|=n}else s!==null?(n=s.baseLanes|r,e.memoizedState=null):n=r,ce(Gi,St),St|=n;return at(t,e,i,r),e.child}function Jw(t,e){var r=e.ref;(t===null&&r!==null||t!==null&&t.ref!==r)&&(e.flags|=512,e.flags|=2097152)}function vh(t,e,r,n,i){var s=mt(r)?Xn:it.current;return s=ss(e,s),rs(e,i),r=sp(t,e,r,n,s,i),n=op(),t!==null&&!pt?(e.updateQueue=t.updateQueue,e.flags&=-2053,t.lanes&=~i,qr(t,e,i)):(ge&&n&&Yh(e),e.flags|=1,at(t,e,r,i),e.child)}function u1(t,e,r,n,i){if(mt(r)){var s=!0;cu(e)}else s=!1;if(rs(e,i),e.stateNode===null)Jl(t,e),Ww(e,r,n),mh(e,r,n,i),n=!0;else if(t===null){var a=e.stateNode,l=e.memoizedProps;a.props=l;var c=a.context,o=r.contextType;typeof o=="object"&&o!==null?o=Pt(o):(o=mt(r)?Xn:it.current,o=ss(e,o));var u=r.getDerivedStateFromProps,d=typeof u=="function"||typeof a.getSnapshotBeforeUpdate=="function";d||typeof a.UNSAFE_componentWillReceiveProps!="function"&&typeof a.componentWillReceiveProps!="function"||(l!==n||c!==o)&&n1(e,a,n,o),un=!1;var v=e.memoizedState;a.state=v,yu(e,n,a,i),c=e.memoizedState,l!==n||v!==c||yt.current||un?(typeof u=="function"&&(yh(e,r,u,n),c=e.memoizedState),(l=un||r1(e,r,l,n,v,c,o))?(d||typeof a.UNSAFE_componentWillMount!="function"&&typeof a.componentWillMount!="function"||(typeof a.componentWillMount=="function"&&a.componentWillMount(),typeof a.UNSAFE_componentWillMount=="function"&&a.UNSAFE_componentWillMount()),typeof a.componentDidMount=="function"&&(e.flags|=4194308)):(typeof a.componentDidMount=="function"&&(e.flags|=4194308),e.memoizedProps=n,e.memoizedState=c),a.props=n,a.state=c,a.context=o,n=l):(typeof a.componentDidMount=="function"&&(e.flags|=4194308),n=!1)}else{a=e.stateNode,Bw(t,e),l=e.memoizedProps,o=e.type===e.elementType?l:Qt(e.type,l),a.props=o,d=e.pendingProps,v=a.context,c=r.contextType,typeof c=="object"&&c!==null?c=Pt(c):(c=mt(r)?Xn:it.current,c=ss(e,c));var T=r.getDerivedStateFromProps;(u=typeof T=="function"||typeof a.getSnapshotBeforeUpdate=="function")||typeof a.UNSAFE_componentWillReceiveProps!="function"&&typeof a.componentWillReceiveProps!="function"||(l!==d||v!==c)&&n1(e,a,n,c),un=!1,v=e.memoizedState,a.state=v,yu(e,n,a,i);var I=e.memoizedState;l!==d||v!==I||yt.current||un?(typeof T=="function"&&(yh(e,r,T,n),I=e.memoizedState),(o=un||r1(e,r,o,n,v,I,c)||!1)?(u||typeof a.UNSAFE_componentWillUpdate!="function"&&typeof a.componentWillUpdate!="function"||(typeof a.componentWillUpdate=="function"&&a.componentWillUpdate(n,I,c),typeof a.UNSAFE_componentWillUpdate=="function"&&a.UNSAFE_componentWillUpdate(n,I,c)),typeof a.componentDidUpdate=="function"&&(e.flags|=4),typeof a.getSnapshotBeforeUpdate=="function"&&(e.flags|=1024)):(typeof a.componentDidUpdate!="function"||l===t.memoizedProps&&v===t.memoizedState||(e.flags|=4),typeof a.getSnapshotBeforeUpdate!="function"||l===t.memoizedProps&&v===t.memoizedState||(e.flags|=1024),e.memoizedProps=n,e.memoizedState=I),a.props=n,a.state=I,a.context=c,n=o):(typeof a.componentDidUpdate!="function"||l===t.memoizedProps&&v===t.memoizedState||(e.flags|=4),typeof a.getSnapshotBeforeUpdate!="function"||l===t.memoizedProps&&v===t.memoizedState||(e.flags|=1024),n=!1)}return _h(t,e,r,n,s,i)}function _h(t,e,r,n,i,s){Jw(t,e);var a=(e.flags&128)!==0;if(!n&&!a)return i&&K0(e,r,!1),qr(t,e,s);n=e.stateNode,DA.current=e;var l=a&&typeof r.getDerivedStateFromError!="function"?null:n.render();return e.flags|=1,t!==null&&a?(e.child=as(e,t.child,null,s),e.child=as(e,null,l,s)):at(t,e,l,s),e.memoizedState=n.state,i&&K0(e,r,!0),e.child}function Gw(t){var e=t.stateNode;e.pendingContext?Y0(t,e.pendingContext,e.pendingContext!==e.context):e.context&&Y0(t,e.context,!1),tp(t,e.containerInfo)}function c1(t,e,r,n,i){return os(),Qh(i),e.flags|=256,at(t,e,r,n),e.child}var wh={dehydrated:null,treeContext:null,retryLane:0};function bh(t){return{baseLanes:t,cachePool:null,transitions:null}}function Zw(t,e,r){var n=e.pendingProps,i=we.current,s=!1,a=(e.flags&128)!==0,l;if((l=a)||(l=t!==null&&t.memoizedState===null?!1:(i&2)!==0),l?(s=!0,e.flags&=-129):(t===null||t.memoizedState!==null)&&(i|=1),ce(we,i&1),t===null)return hh(e),t=e.memoizedState,t!==null&&(t=t.dehydrated,t!==null)?(e.mode&1?t.data==="$!"?e.lanes=8:e.lanes=1073741824:e.lanes=1,null):(a=n.children,t=n.fallback,s?(n=e.mode,s=e.child,a={mode:"hidden",children:a},!(n&1)&&s!==null?(s.childLanes=0,s.pendingProps=a):s=Vu(a,n,0,null),t=Zn(t,n,r,null),s.return=e,t.return=e,s.sibling=t,e.child=s,e.child.memoizedState=bh(r),e.memoizedState=wh,t):up(e,a));if(i=t.memoizedState,i!==null&&(l=i.dehydrated,l!==null))return AA(t,e,a,n,l,i,r);if(s){s=n.fallback,a=e.mode,i=t.child,l=i.sibling;var c={mode:"hidden",children:n.children};return!(a&1)&&e.child!==i?(n=e.child,n.childLanes=0,n.pendingProps=c,e.deletions=null):(n=bn(i,c),n.subtreeFlags=i.subtreeFlags&14680064),l!==null?s=bn(l,s):(s=Zn(s,a,r,null),s.flags|=2),s.return=e,n.return=e,n.sibling=s,e.child=n,n=s,s=e.child,a=t.child.memoizedState,a=a===null?bh(r):{baseLanes:a.baseLanes|r,cachePool:null,transitions:a.transitions},s.memoizedState=a,s.childLanes=t.childLanes&~r,e.memoizedState=wh,n}return s=t.child,t=s.sibling,n=bn(s,{mode:"visible",children:n.children}),!(e.mode&1)&&(n.lanes=r),n.return=e,n.sibling=null,t!==null&&(r=e.deletions,r===null?(e.deletions=[t],e.flags|=16):r.push(t)),e.child=n,e.memoizedState=null,n}function up(t,e){return e=Vu({mode:"visible",children:e},t.mode,0,null),e.return=t,t.child=e}function jl(t,e,r,n){return n!==null&&Qh(n),as(e,t.child,null,r),t=up(e,e.pendingProps.children),t.flags|=2,e.memoizedState=null,t}function AA(t,e,r,n,i,s,a){if(r)return e.flags&256?(e.flags&=-257,n=Nf(Error(B(422))),jl(t,e,a,n)):e.memoizedState!==null?(e.child=t.child,e.flags|=128,null):(s=n.fallback,i=e.mode,n=Vu({mode:"visible",children:n.children},i,0,null),s=Zn(s,i,a,null),s.flags|=2,n.return=e,s.return=e,n.sibling=s,e.child=n,e.mode&1&&as(e,t.child,null,a),e.child.memoizedState=bh(a),e.memoizedState=wh,s);if(!(e.mode&1))return jl(t,e,a,null);if(i.data==="$!"){if(n=i.nextSibling&&i.nextSibling.dataset,n)var l=n.dgst;return n=l,s=Error(B(419)),n=Nf(s,n,void 0),jl(t,e,a,n)}if(l=(a&t.childLanes)!==0,pt||l){if(n=ze,n!==null){switch(a&-a){case 4:i=2;break;case 16:i=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:i=32;break;case 536870912:i=268435456;break;default:i=0}i=i&(n.suspendedLanes|a)?0:i,i!==0&&i!==s.retryLane&&(s.retryLane=i,zr(t,i),Xt(n,t,i,-1))}return yp(),n=Nf(Error(B(421))),jl(t,e,a,n)}return i.data==="$?"?(e.flags|=128,e.child=t.child,e=PA.bind(null,t),i._reactRetry=e,null):(t=s.treeContext,Tt=gn(i.nextSibling),Bt=e,ge=!0,Gt=null,t!==null&&(kt[Lt++]=Lr,kt[Lt++]=Cr,kt[Lt++]=ei,Lr=t.id,Cr=t.overflow,ei=e),e=up(e,n.children),e.flags|=4096,e)}function d1(t,e,r){t.lanes|=e;var n=t.alternate;n!==null&&(n.lanes|=e),ph(t.return,e,r)}function kf(t,e,r,n,i){var s=t.memoizedState;s===null?t.memoizedState={isBackwards:e,rendering:null,renderingStartTime:0,last:n,tail:r,tailMode:i}:(s.isBackwards=e,s.rendering=null,s.renderingStartTime=0,s.last=n,s.tail=r,s.tailMode=i)}function Xw(t,e,r){var n=e.pendingProps,i=n.revealOrder,s=n.tail;if(at(t,e,n.children,r),n=we.current,n&2)n=n&1|2,e.flags|=128;else{if(t!==null&&t.flags&128)e:for(t=e.child;t!==null;){if(t.tag===13)t.memoizedState!==null&&d1(t,r,e);else if(t.tag===19)d1(t,r,e);else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;t.sibling===null;){if(t.return===null||t.return===e)break e;t=t.return}t.sibling.return=t.return,t=t.sibling}n&=1}if(ce(we,n),!(e.mode&1))e.memoizedState=null;else switch(i){case"forwards":for(r=e.child,i=null;r!==null;)t=r.alternate,t!==null&&mu(t)===null&&(i=r),r=r.sibling;r=i,r===null?(i=e.child,e.child=null):(i=r.sibling,r.sibling=null),kf(e,!1,i,r,s);break;case"backwards":for(r=null,i=e.child,e.child=null;i!==null;){if(t=i.alternate,t!==null&&mu(t)===null){e.child=i;break}t=i.sibling,i.sibling=r,r=i,i=t}kf(e,!0,r,null,s);break;case"together":kf(e,!1,null,null,void 0);break;default:e.memoizedState=null}return e.child}function Jl(t,e){!(e.mode&1)&&t!==null&&(t.alternate=null,e.alternate=null,e.flags|=2)}function qr(t,e,r){if(t!==null&&(e.dependencies=t.dependencies),ri|=e.lanes,!(r&e.childLanes))return null;if(t!==null&&e.child!==t.child)throw Error(B(153));if(e.child!==null){for(t=e.child,r=bn(t,t.pendingProps),e.child=r,r.return=e;t.sibling!==null;)t=t.sibling,r=r.sibling=bn(t,t.pendingProps),r.return=e;r.sibling=null}return e.child}function FA(t,e,r){switch(e.tag){case 3:Gw(e),os();break;case 5:Iw(e);break;case 1:mt(e.type)&&cu(e);break;case 4:tp(e,e.stateNode.containerInfo);break;case 10:var n=e.type._context,i=e.memoizedProps.value;ce(hu,n._currentValue),n._currentValue=i;break;case 13:if(n=e.memoizedState,n!==null)return n.dehydrated!==null?(ce(we,we.current&1),e.flags|=128,null):r&e.child.childLanes?Zw(t,e,r):(ce(we,we.current&1),t=qr(t,e,r),t!==null?t.sibling:null);ce(we,we.current&1);break;case 19:if(n=(r&e.childLanes)!==0,t.flags&128){if(n)return Xw(t,e,r);e.flags|=128}if(i=e.memoizedState,i!==null&&(i.rendering=null,i.tail=null,i.lastEffect=null),ce(we,we.current),n)break;return null;case 22:case 23:return e.lanes=0,Qw(t,e,r)}return qr(t,e,r)}var eb,Sh,tb,rb;eb=function(t,e){for(var r=e.child;r!==null;){if(r.tag===5||r.tag===6)t.appendChild(r.stateNode);else if(r.tag!==4&&r.child!==null){r.child.return=r,r=r.child;continue}if(r===e)break;for(;r.sibling===null;){if(r.return===null||r.return===e)return;r=r.return}r.sibling.return=r.return,r=r.sibling}};Sh=function(){};tb=function(t,e,r,n){var i=t.memoizedProps;if(i!==n){t=e.stateNode,Jn(Sr.current);var s=null;switch(r){case"input":i=$f(t,i),n=$f(t,n),s=[];break;case"select":i=Se({},i,{value:void 0}),n=Se({},n,{value:void 0}),s=[];break;case"textarea":i=Yf(t,i),n=Yf(t,n),s=[];break;default:typeof i.onClick!="function"&&typeof n.onClick=="function"&&(t.onclick=lu)}Qf(r,n);var a;r=null;for(o in i)if(!n.hasOwnProperty(o)&&i.hasOwnProperty(o)&&i[o]!=null)if(o==="style"){var l=i[o];for(a in l)l.hasOwnProperty(a)&&(r||(r={}),r[a]="")}else o!=="dangerouslySetInnerHTML"&&o!=="children"&&o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(Bo.hasOwnProperty(o)?s||(s=[]):(s=s||[]).push(o,null));for(o in n){var c=n[o];if(l=i?.[o],n.hasOwnProperty(o)&&c!==l&&(c!=null||l!=null))if(o==="style")if(l){for(a in l)!l.hasOwnProperty(a)||c&&c.hasOwnProperty(a)||(r||(r={}),r[a]="");for(a in c)c.hasOwnProperty(a)&&l[a]!==c[a]&&(r||(r={}),r[a]=c[a])}else r||(s||(s=[]),s.push(o,r)),r=c;else o==="dangerouslySetInnerHTML"?(c=c?c.__html:void 0,l=l?l.__html:void 0,c!=null&&l!==c&&(s=s||[]).push(o,c)):o==="children"?typeof c!="string"&&typeof c!="number"||(s=s||[]).push(o,""+c):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&(Bo.hasOwnProperty(o)?(c!=null&&o==="onScroll"&&fe("scroll",t),s||l===c||(s=[])):(s=s||[]).push(o,c))}r&&(s=s||[]).push("style",r);var o=s;(e.updateQueue=o)&&(e.flags|=4)}};rb=function(t,e,r,n){r!==n&&(e.flags|=4)};function ao(t,e){if(!ge)switch(t.tailMode){case"hidden":e=t.tail;for(var r=null;e!==null;)e.alternate!==null&&(r=e),e=e.sibling;r===null?t.tail=null:r.sibling=null;break;case"collapsed":r=t.tail;for(var n=null;r!==null;)r.alternate!==null&&(n=r),r=r.sibling;n===null?e||t.tail===null?t.tail=null:t.tail.sibling=null:n.sibling=null}}function rt(t){var e=t.alternate!==null&&t.alternate.child===t.child,r=0,n=0;if(e)for(var i=t.child;i!==null;)r|=i.lanes|i.childLanes,n|=i.subtreeFlags&14680064,n|=i.flags&14680064,i.return=t,i=i.sibling;else for(i=t.child;i!==null;)r|=i.lanes|i.childLanes,n|=i.subtreeFlags,n|=i.flags,i.return=t,i=i.sibling;return t.subtreeFlags|=n,t.childLanes=r,e}function OA(t,e,r){var n=e.pendingProps;switch(Kh(e),e.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return rt(e),null;case 1:return mt(e.type)&&uu(),rt(e),null;case 3:return n=e.stateNode,ls(),he(yt),he(it),np(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),(t===null||t.child===null)&&(Rl(e)?e.flags|=4:t===null||t.memoizedState.isDehydrated&&!(e.flags&256)||(e.flags|=1024,Gt!==null&&(Mh(Gt),Gt=null))),Sh(t,e),rt(e),null;case 5:rp(e);var i=Jn(ko.current);if(r=e.type,t!==null&&e.stateNode!=null)tb(t,e,r,n,i),t.ref!==e.ref&&(e.flags|=512,e.flags|=2097152);else{if(!n){if(e.stateNode===null)throw Error(B(166));return rt(e),null}if(t=Jn(Sr.current),Rl(e)){n=e.stateNode,r=e.type;var s=e.memoizedProps;switch(n[wr]=e,n[Vo]=s,t=(e.mode&1)!==0,r){case"dialog":fe("cancel",n),fe("close",n);break;case"iframe":case"object":case"embed":fe("load",n);break;case"video":case"audio":for(i=0;i<po.length;i++)fe(po[i],n);break;case"source":fe("error",n);break;case"img":case"image":case"link":fe("error",n),fe("load",n);break;case"details":fe("toggle",n);break;case"input":_0(n,s),fe("invalid",n);break;case"select":n._wrapperState={wasMultiple:!!s.multiple},fe("invalid",n);break;case"textarea":b0(n,s),fe("invalid",n)}Qf(r,s),i=null;for(var a in s)if(s.hasOwnProperty(a)){var l=s[a];a==="children"?typeof l=="string"?n.textContent!==l&&(s.suppressHydrationWarning!==!0&&Cl(n.textContent,l,t),i=["children",l]):typeof l=="number"&&n.textContent!==""+l&&(s.suppressHydrationWarning!==!0&&Cl(n.textContent,l,t),i=["children",""+l]):Bo.hasOwnProperty(a)&&l!=null&&a==="onScroll"&&fe("scroll",n)}switch(r){case"input":Dl(n),w0(n,s,!0);break;case"textarea":Dl(n),S0(n);break;case"select":case"option":break;default:typeof s.onClick=="function"&&(n.onclick=lu)}n=i,e.updateQueue=n,n!==null&&(e.flags|=4)}else{a=i.nodeType===9?i:i.ownerDocument,t==="http://www.w3.org/1999/xhtml"&&(t=M1(r)),t==="http://www.w3.org/1999/xhtml"?r==="script"?(t=a.createElement("div"),t.innerHTML="<script><\/script>",t=t.removeChild(t.firstChild)):typeof n.is=="string"?t=a.createElement(r,{is:n.is}):(t=a.createElement(r),r==="select"&&(a=t,n.multiple?a.multiple=!0:n.size&&(a.size=n.size))):t=a.createElementNS(t,r),t[wr]=e,t[Vo]=n,eb(t,e,!1,!1),e.stateNode=t;e:{switch(a=Jf(r,n),r){case"dialog":fe("cancel",t),fe("close",t),i=n;break;case"iframe":case"object":case"embed":fe("load",t),i=n;break;case"video":case"audio":for(i=0;i<po.length;i++)fe(po[i],t);i=n;break;case"source":fe("error",t),i=n;break;case"img":case"image":case"link":fe("error",t),fe("load",t),i=n;break;case"details":fe("toggle",t),i=n;break;case"input":_0(t,n),i=$f(t,n),fe("invalid",t);break;case"option":i=n;break;case"select":t._wrapperState={wasMultiple:!!n.multiple},i=Se({},n,{value:void 0}),fe("invalid",t);break;case"textarea":b0(t,n),i=Yf(t,n),fe("invalid",t);break;default:i=n}Qf(r,i),l=i;for(s in l)if(l.hasOwnProperty(s)){var c=l[s];s==="style"?U1(t,c):s==="dangerouslySetInnerHTML"?(c=c?c.__html:void 0,c!=null&&x1(t,c)):s==="children"?typeof c=="string"?(r!=="textarea"||c!=="")&&Io(t,c):typeof c=="number"&&Io(t,""+c):s!=="suppressContentEditableWarning"&&s!=="suppressHydrationWarning"&&s!=="autoFocus"&&(Bo.hasOwnProperty(s)?c!=null&&s==="onScroll"&&fe("scroll",t):c!=null&&Uh(t,s,c,a))}switch(r){case"input":Dl(t),w0(t,n,!1);break;case"textarea":Dl(t),S0(t);break;case"option":n.value!=null&&t.setAttribute("value",""+Sn(n.value));break;case"select":t.multiple=!!n.multiple,s=n.value,s!=null?Zi(t,!!n.multiple,s,!1):n.defaultValue!=null&&Zi(t,!!n.multiple,n.defaultValue,!0);break;default:typeof i.onClick=="function"&&(t.onclick=lu)}switch(r){case"button":case"input":case"select":case"textarea":n=!!n.autoFocus;break e;case"img":n=!0;break e;default:n=!1}}n&&(e.flags|=4)}e.ref!==null&&(e.flags|=512,e.flags|=2097152)}return rt(e),null;case 6:if(t&&e.stateNode!=null)rb(t,e,t.memoizedProps,n);else{if(typeof n!="string"&&e.stateNode===null)throw Error(B(166));if(r=Jn(ko.current),Jn(Sr.current),Rl(e)){if(n=e.stateNode,r=e.memoizedProps,n[wr]=e,(s=n.nodeValue!==r)&&(t=Bt,t!==null))switch(t.tag){case 3:Cl(n.nodeValue,r,(t.mode&1)!==0);break;case 5:t.memoizedProps.suppressHydrationWarning!==!0&&Cl(n.nodeValue,r,(t.mode&1)!==0)}s&&(e.flags|=4)}else n=(r.nodeType===9?r:r.ownerDocument).createTextNode(n),n[wr]=e,e.stateNode=n}return rt(e),null;case 13:if(he(we),n=e.memoizedState,t===null||t.memoizedState!==null&&t.memoizedState.dehydrated!==null){if(ge&&Tt!==null&&e.mode&1&&!(e.flags&128))ww(),os(),e.flags|=98560,s=!1;else if(s=Rl(e),n!==null&&n.dehydrated!==null){if(t===null){if(!s)throw Error(B(318));if(s=e.memoizedState,s=s!==null?s.dehydrated:null,!s)throw Error(B(317));s[wr]=e}else os(),!(e.flags&128)&&(e.memoizedState=null),e.flags|=4;rt(e),s=!1}else Gt!==null&&(Mh(Gt),Gt=null),s=!0;if(!s)return e.flags&65536?e:null}return e.flags&128?(e.lanes=r,e):(n=n!==null,n!==(t!==null&&t.memoizedState!==null)&&n&&(e.child.flags|=8192,e.mode&1&&(t===null||we.current&1?Le===0&&(Le=3):yp())),e.updateQueue!==null&&(e.flags|=4),rt(e),null);case 4:return ls(),Sh(t,e),t===null&&Eo(e.stateNode.containerInfo),rt(e),null;case 10:return Zh(e.type._context),rt(e),null;case 17:return mt(e.type)&&uu(),rt(e),null;case 19:if(he(we),s=e.memoizedState,s===null)return rt(e),null;if(n=(e.flags&128)!==0,a=s.rendering,a===null)if(n)ao(s,!1);else{if(Le!==0||t!==null&&t.flags&128)for(t=e.child;t!==null;){if(a=mu(t),a!==null){for(e.flags|=128,ao(s,!1),n=a.updateQueue,n!==null&&(e.updateQueue=n,e.flags|=4),e.subtreeFlags=0,n=r,r=e.child;r!==null;)s=r,t=n,s.flags&=14680066,a=s.alternate,a===null?(s.childLanes=0,s.lanes=t,s.child=null,s.subtreeFlags=0,s.memoizedProps=null,s.memoizedState=null,s.updateQueue=null,s.dependencies=null,s.stateNode=null):(s.childLanes=a.childLanes,s.lanes=a.lanes,s.child=a.child,s.subtreeFlags=0,s.deletions=null,s.memoizedProps=a.memoizedProps,s.memoizedState=a.memoizedState,s.updateQueue=a.updateQueue,s.type=a.type,t=a.dependencies,s.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),r=r.sibling;return ce(we,we.current&1|2),e.child}t=t.sibling}s.tail!==null&&Me()>cs&&(e.flags|=128,n=!0,ao(s,!1),e.lanes=4194304)}else{if(!n)if(t=mu(a),t!==null){if(e.flags|=128,n=!0,r=t.updateQueue,r!==null&&(e.updateQueue=r,e.flags|=4),ao(s,!0),s.tail===null&&s.tailMode==="hidden"&&!a.alternate&&!ge)return rt(e),null}else 2*Me()-s.renderingStartTime>cs&&r!==1073741824&&(e.flags|=128,n=!0,ao(s,!1),e.lanes=4194304);s.isBackwards?(a.sibling=e.child,e.child=a):(r=s.last,r!==null?r.sibling=a:e.child=a,s.last=a)}return s.tail!==null?(e=s.tail,s.rendering=e,s.tail=e.sibling,s.renderingStartTime=Me(),e.sibling=null,r=we.current,ce(we,n?r&1|2:r&1),e):(rt(e),null);case 22:case 23:return pp(),n=e.memoizedState!==null,t!==null&&t.memoizedState!==null!==n&&(e.flags|=8192),n&&e.mode&1?St&1073741824&&(rt(e),e.subtreeFlags&6&&(e.flags|=8192)):rt(e),null;case 24:return null;case 25:return null}throw Error(B(156,e.tag))}function MA(t,e){switch(Kh(e),e.tag){case 1:return mt(e.type)&&uu(),t=e.flags,t&65536?(e.flags=t&-65537|128,e):null;case 3:return ls(),he(yt),he(it),np(),t=e.flags,t&65536&&!(t&128)?(e.flags=t&-65537|128,e):null;case 5:return rp(e),null;case 13:if(he(we),t=e.memoizedState,t!==null&&t.dehydrated!==null){if(e.alternate===null)throw Error(B(340));os()}return t=e.flags,t&65536?(e.flags=t&-65537|128,e):null;case 19:return he(we),null;case 4:return ls(),null;case 10:return Zh(e.type._context),null;case 22:case 23:return pp(),null;case 24:return null;default:return null}}var zl=!1,nt=!1,xA=typeof WeakSet=="function"?WeakSet:Set,M=null;function Ji(t,e){var r=t.ref;if(r!==null)if(typeof r=="function")try{r(null)}catch(n){De(t,e,n)}else r.current=null}function Th(t,e,r){try{r()}catch(n){De(t,e,n)}}var f1=!1;function EA(t,e){if(oh=su,t=aw(),Hh(t)){if("selectionStart"in t)var r={start:t.selectionStart,end:t.selectionEnd};else e:{r=(r=t.ownerDocument)&&r.defaultView||window;var n=r.getSelection&&r.getSelection();if(n&&n.rangeCount!==0){r=n.anchorNode;var i=n.anchorOffset,s=n.focusNode;n=n.focusOffset;try{r.nodeType,s.nodeType}catch{r=null;break e}var a=0,l=-1,c=-1,o=0,u=0,d=t,v=null;t:for(;;){for(var T;d!==r||i!==0&&d.nodeType!==3||(l=a+i),d!==s||n!==0&&d.nodeType!==3||(c=a+n),d.nodeType===3&&(a+=d.nodeValue.length),(T=d.firstChild)!==null;)v=d,d=T;for(;;){if(d===t)break t;if(v===r&&++o===i&&(l=a),v===s&&++u===n&&(c=a),(T=d.nextSibling)!==null)break;d=v,v=d.parentNode}d=T}r=l===-1||c===-1?null:{start:l,end:c}}else r=null}r=r||{start:0,end:0}}else r=null;for(ah={focusedElem:t,selectionRange:r},su=!1,M=e;M!==null;)if(e=M,t=e.child,(e.subtreeFlags&1028)!==0&&t!==null)t.return=e,M=t;else for(;M!==null;){e=M;try{var I=e.alternate;if(e.flags&1024)switch(e.tag){case 0:case 11:case 15:break;case 1:if(I!==null){var D=I.memoizedProps,ne=I.memoizedState,g=e.stateNode,f=g.getSnapshotBeforeUpdate(e.elementType===e.type?D:Qt(e.type,D),ne);g.__reactInternalSnapshotBeforeUpdate=f}break;case 3:var h=e.stateNode.containerInfo;h.nodeType===1?h.textContent="":h.nodeType===9&&h.documentElement&&h.removeChild(h.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(B(163))}}catch(S){De(e,e.return,S)}if(t=e.sibling,t!==null){t.return=e.return,M=t;break}M=e.return}return I=f1,f1=!1,I}function bo(t,e,r){var n=e.updateQueue;if(n=n!==null?n.lastEffect:null,n!==null){var i=n=n.next;do{if((i.tag&t)===t){var s=i.destroy;i.destroy=void 0,s!==void 0&&Th(e,r,s)}i=i.next}while(i!==n)}}function Eu(t,e){if(e=e.updateQueue,e=e!==null?e.lastEffect:null,e!==null){var r=e=e.next;do{if((r.tag&t)===t){var n=r.create;r.destroy=n()}r=r.next}while(r!==e)}}function Bh(t){var e=t.ref;if(e!==null){var r=t.stateNode;switch(t.tag){case 5:t=r;break;default:t=r}typeof e=="function"?e(t):e.current=t}}function nb(t){var e=t.alternate;e!==null&&(t.alternate=null,nb(e)),t.child=null,t.deletions=null,t.sibling=null,t.tag===5&&(e=t.stateNode,e!==null&&(delete e[wr],delete e[Vo],delete e[ch],delete e[pA],delete e[yA])),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}function ib(t){return t.tag===5||t.tag===3||t.tag===4}function h1(t){e:for(;;){for(;t.sibling===null;){if(t.return===null||ib(t.return))return null;t=t.return}for(t.sibling.return=t.return,t=t.sibling;t.tag!==5&&t.tag!==6&&t.tag!==18;){if(t.flags&2||t.child===null||t.tag===4)continue e;t.child.return=t,t=t.child}if(!(t.flags&2))return t.stateNode}}function Ih(t,e,r){var n=t.tag;if(n===5||n===6)t=t.stateNode,e?r.nodeType===8?r.parentNode.insertBefore(t,e):r.insertBefore(t,e):(r.nodeType===8?(e=r.parentNode,e.insertBefore(t,r)):(e=r,e.appendChild(t)),r=r._reactRootContainer,r!=null||e.onclick!==null||(e.onclick=lu));else if(n!==4&&(t=t.child,t!==null))for(Ih(t,e,r),t=t.sibling;t!==null;)Ih(t,e,r),t=t.sibling}function Dh(t,e,r){var n=t.tag;if(n===5||n===6)t=t.stateNode,e?r.insertBefore(t,e):r.appendChild(t);else if(n!==4&&(t=t.child,t!==null))for(Dh(t,e,r),t=t.sibling;t!==null;)Dh(t,e,r),t=t.sibling}var Ye=null,Jt=!1;function an(t,e,r){for(r=r.child;r!==null;)sb(t,e,r),r=r.sibling}function sb(t,e,r){if(br&&typeof br.onCommitFiberUnmount=="function")try{br.onCommitFiberUnmount(Bu,r)}catch{}switch(r.tag){case 5:nt||Ji(r,e);case 6:var n=Ye,i=Jt;Ye=null,an(t,e,r),Ye=n,Jt=i,Ye!==null&&(Jt?(t=Ye,r=r.stateNode,t.nodeType===8?t.parentNode.removeChild(r):t.removeChild(r)):Ye.removeChild(r.stateNode));break;case 18:Ye!==null&&(Jt?(t=Ye,r=r.stateNode,t.nodeType===8?Of(t.parentNode,r):t.nodeType===1&&Of(t,r),Oo(t)):Of(Ye,r.stateNode));break;case 4:n=Ye,i=Jt,Ye=r.stateNode.containerInfo,Jt=!0,an(t,e,r),Ye=n,Jt=i;break;case 0:case 11:case 14:case 15:if(!nt&&(n=r.updateQueue,n!==null&&(n=n.lastEffect,n!==null))){i=n=n.next;do{var s=i,a=s.destroy;s=s.tag,a!==void 0&&(s&2||s&4)&&Th(r,e,a),i=i.next}while(i!==n)}an(t,e,r);break;case 1:if(!nt&&(Ji(r,e),n=r.stateNode,typeof n.componentWillUnmount=="function"))try{n.props=r.memoizedProps,n.state=r.memoizedState,n.componentWillUnmount()}catch(l){De(r,e,l)}an(t,e,r);break;case 21:an(t,e,r);break;case 22:r.mode&1?(nt=(n=nt)||r.memoizedState!==null,an(t,e,r),nt=n):an(t,e,r);break;default:an(t,e,r)}}function p1(t){var e=t.updateQueue;if(e!==null){t.updateQueue=null;var r=t.stateNode;r===null&&(r=t.stateNode=new xA),e.forEach(function(n){var i=jA.bind(null,t,n);r.has(n)||(r.add(n),n.then(i,i))})}}function Kt(t,e){var r=e.deletions;if(r!==null)for(var n=0;n<r.length;n++){var i=r[n];try{var s=t,a=e,l=a;e:for(;l!==null;){switch(l.tag){case 5:Ye=l.stateNode,Jt=!1;break e;case 3:Ye=l.stateNode.containerInfo,Jt=!0;break e;case 4:Ye=l.stateNode.containerInfo,Jt=!0;break e}l=l.return}if(Ye===null)throw Error(B(160));sb(s,a,i),Ye=null,Jt=!1;var c=i.alternate;c!==null&&(c.return=null),i.return=null}catch(o){De(i,e,o)}}if(e.subtreeFlags&12854)for(e=e.child;e!==null;)ob(e,t),e=e.sibling}function ob(t,e){var r=t.alternate,n=t.flags;switch(t.tag){case 0:case 11:case 14:case 15:if(Kt(e,t),vr(t),n&4){try{bo(3,t,t.return),Eu(3,t)}catch(D){De(t,t.return,D)}try{bo(5,t,t.return)}catch(D){De(t,t.return,D)}}break;case 1:Kt(e,t),vr(t),n&512&&r!==null&&Ji(r,r.return);break;case 5:if(Kt(e,t),vr(t),n&512&&r!==null&&Ji(r,r.return),t.flags&32){var i=t.stateNode;try{Io(i,"")}catch(D){De(t,t.return,D)}}if(n&4&&(i=t.stateNode,i!=null)){var s=t.memoizedProps,a=r!==null?r.memoizedProps:s,l=t.type,c=t.updateQueue;if(t.updateQueue=null,c!==null)try{l==="input"&&s.type==="radio"&&s.name!=null&&F1(i,s),Jf(l,a);var o=Jf(l,s);for(a=0;a<c.length;a+=2){var u=c[a],d=c[a+1];u==="style"?U1(i,d):u==="dangerouslySetInnerHTML"?x1(i,d):u==="children"?Io(i,d):Uh(i,u,d,o)}switch(l){case"input":Wf(i,s);break;case"textarea":O1(i,s);break;case"select":var v=i._wrapperState.wasMultiple;i._wrapperState.wasMultiple=!!s.multiple;var T=s.value;T!=null?Zi(i,!!s.multiple,T,!1):v!==!!s.multiple&&(s.defaultValue!=null?Zi(i,!!s.multiple,s.defaultValue,!0):Zi(i,!!s.multiple,s.multiple?[]:"",!1))}i[Vo]=s}catch(D){De(t,t.return,D)}}break;case 6:if(Kt(e,t),vr(t),n&4){if(t.stateNode===null)throw Error(B(162));i=t.stateNode,s=t.memoizedProps;try{i.nodeValue=s}catch(D){De(t,t.return,D)}}break;case 3:if(Kt(e,t),vr(t),n&4&&r!==null&&r.memoizedState.isDehydrated)try{Oo(e.containerInfo)}catch(D){De(t,t.return,D)}break;case 4:Kt(e,t),vr(t);break;case 13:Kt(e,t),vr(t),i=t.child,i.flags&8192&&(s=i.memoizedState!==null,i.stateNode.isHidden=s,!s||i.alternate!==null&&i.alternate.memoizedState!==null||(fp=Me())),n&4&&p1(t);break;case 22:if(u=r!==null&&r.memoizedState!==null,t.mode&1?(nt=(o=nt)||u,Kt(e,t),nt=o):Kt(e,t),vr(t),n&8192){if(o=t.memoizedState!==null,(t.stateNode.isHidden=o)&&!u&&t.mode&1)for(M=t,u=t.child;u!==null;){for(d=M=u;M!==null;){switch(v=M,T=v.child,v.tag){case 0:case 11:case 14:case 15:bo(4,v,v.return);break;case 1:Ji(v,v.return);var I=v.stateNode;if(typeof I.componentWillUnmount=="function"){n=v,r=v.return;try{e=n,I.props=e.memoizedProps,I.state=e.memoizedState,I.componentWillUnmount()}catch(D){De(n,r,D)}}break;case 5:Ji(v,v.return);break;case 22:if(v.memoizedState!==null){m1(d);continue}}T!==null?(T.return=v,M=T):m1(d)}u=u.sibling}e:for(u=null,d=t;;){if(d.tag===5){if(u===null){u=d;try{i=d.stateNode,o?(s=i.style,typeof s.setProperty=="function"?s.setProperty("display","none","important"):s.display="none"):(l=d.stateNode,c=d.memoizedProps.style,a=c!=null&&c.hasOwnProperty("display")?c.display:null,l.style.display=E1("display",a))}catch(D){De(t,t.return,D)}}}else if(d.tag===6){if(u===null)try{d.stateNode.nodeValue=o?"":d.memoizedProps}catch(D){De(t,t.return,D)}}else if((d.tag!==22&&d.tag!==23||d.memoizedState===null||d===t)&&d.child!==null){d.child.return=d,d=d.child;continue}if(d===t)break e;for(;d.sibling===null;){if(d.return===null||d.return===t)break e;u===d&&(u=null),d=d.return}u===d&&(u=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:Kt(e,t),vr(t),n&4&&p1(t);break;case 21:break;default:Kt(e,t),vr(t)}}function vr(t){var e=t.flags;if(e&2){try{e:{for(var r=t.return;r!==null;){if(ib(r)){var n=r;break e}r=r.return}throw Error(B(160))}switch(n.tag){case 5:var i=n.stateNode;n.flags&32&&(Io(i,""),n.flags&=-33);var s=h1(t);Dh(t,s,i);break;case 3:case 4:var a=n.stateNode.containerInfo,l=h1(t);Ih(t,l,a);break;default:throw Error(B(161))}}catch(c){De(t,t.return,c)}t.flags&=-3}e&4096&&(t.flags&=-4097)}function UA(t,e,r){M=t,ab(t,e,r)}function ab(t,e,r){for(var n=(t.mode&1)!==0;M!==null;){var i=M,s=i.child;if(i.tag===22&&n){var a=i.memoizedState!==null||zl;if(!a){var l=i.alternate,c=l!==null&&l.memoizedState!==null||nt;l=zl;var o=nt;if(zl=a,(nt=c)&&!o)for(M=i;M!==null;)a=M,c=a.child,a.tag===22&&a.memoizedState!==null?g1(i):c!==null?(c.return=a,M=c):g1(i);for(;s!==null;)M=s,ab(s,e,r),s=s.sibling;M=i,zl=l,nt=o}y1(t,e,r)}else i.subtreeFlags&8772&&s!==null?(s.return=i,M=s):y1(t,e,r)}}function y1(t){for(;M!==null;){var e=M;if(e.flags&8772){var r=e.alternate;try{if(e.flags&8772)switch(e.tag){case 0:case 11:case 15:nt||Eu(5,e);break;case 1:var n=e.stateNode;if(e.flags&4&&!nt)if(r===null)n.componentDidMount();else{var i=e.elementType===e.type?r.memoizedProps:Qt(e.type,r.memoizedProps);n.componentDidUpdate(i,r.memoizedState,n.__reactInternalSnapshotBeforeUpdate)}var s=e.updateQueue;s!==null&&X0(e,s,n);break;case 3:var a=e.updateQueue;if(a!==null){if(r=null,e.child!==null)switch(e.child.tag){case 5:r=e.child.stateNode;break;case 1:r=e.child.stateNode}X0(e,a,r)}break;case 5:var l=e.stateNode;if(r===null&&e.flags&4){r=l;var c=e.memoizedProps;switch(e.type){case"button":case"input":case"select":case"textarea":c.autoFocus&&r.focus();break;case"img":c.src&&(r.src=c.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(e.memoizedState===null){var o=e.alternate;if(o!==null){var u=o.memoizedState;if(u!==null){var d=u.dehydrated;d!==null&&Oo(d)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(B(163))}nt||e.flags&512&&Bh(e)}catch(v){De(e,e.return,v)}}if(e===t){M=null;break}if(r=e.sibling,r!==null){r.return=e.return,M=r;break}M=e.return}}function m1(t){for(;M!==null;){var e=M;if(e===t){M=null;break}var r=e.sibling;if(r!==null){r.return=e.return,M=r;break}M=e.return}}function g1(t){for(;M!==null;){var e=M;try{switch(e.tag){case 0:case 11:case 15:var r=e.return;try{Eu(4,e)}catch(c){De(e,r,c)}break;case 1:var n=e.stateNode;if(typeof n.componentDidMount=="function"){var i=e.return;try{n.componentDidMount()}catch(c){De(e,i,c)}}var s=e.return;try{Bh(e)}catch(c){De(e,s,c)}break;case 5:var a=e.return;try{Bh(e)}catch(c){De(e,a,c)}}}catch(c){De(e,e.return,c)}if(e===t){M=null;break}var l=e.sibling;if(l!==null){l.return=e.return,M=l;break}M=e.return}}var VA=Math.ceil,_u=$r.ReactCurrentDispatcher,cp=$r.ReactCurrentOwner,Rt=$r.ReactCurrentBatchConfig,re=0,ze=null,Ue=null,Ke=0,St=0,Gi=In(0),Le=0,Po=null,ri=0,Uu=0,dp=0,So=null,ht=null,fp=0,cs=1/0,Nr=null,wu=!1,Ah=null,_n=null,ql=!1,hn=null,bu=0,To=0,Fh=null,Gl=-1,Zl=0;function lt(){return re&6?Me():Gl!==-1?Gl:Gl=Me()}function wn(t){return t.mode&1?re&2&&Ke!==0?Ke&-Ke:gA.transition!==null?(Zl===0&&(Zl=W1()),Zl):(t=se,t!==0||(t=window.event,t=t===void 0?16:Z1(t.type)),t):1}function Xt(t,e,r,n){if(50<To)throw To=0,Fh=null,Error(B(185));jo(t,r,n),(!(re&2)||t!==ze)&&(t===ze&&(!(re&2)&&(Uu|=r),Le===4&&dn(t,Ke)),gt(t,n),r===1&&re===0&&!(e.mode&1)&&(cs=Me()+500,Ou&&Dn()))}function gt(t,e){var r=t.callbackNode;_D(t,e);var n=iu(t,t===ze?Ke:0);if(n===0)r!==null&&I0(r),t.callbackNode=null,t.callbackPriority=0;else if(e=n&-n,t.callbackPriority!==e){if(r!=null&&I0(r),e===1)t.tag===0?mA(v1.bind(null,t)):gw(v1.bind(null,t)),fA(function(){!(re&6)&&Dn()}),r=null;else{switch(H1(n)){case 1:r=Ch;break;case 4:r=q1;break;case 16:r=nu;break;case 536870912:r=$1;break;default:r=nu}r=yb(r,lb.bind(null,t))}t.callbackPriority=e,t.callbackNode=r}}function lb(t,e){if(Gl=-1,Zl=0,re&6)throw Error(B(327));var r=t.callbackNode;if(ns()&&t.callbackNode!==r)return null;var n=iu(t,t===ze?Ke:0);if(n===0)return null;if(n&30||n&t.expiredLanes||e)e=Su(t,n);else{e=n;var i=re;re|=2;var s=cb();(ze!==t||Ke!==e)&&(Nr=null,cs=Me()+500,Gn(t,e));do try{LA();break}catch(l){ub(t,l)}while(!0);Gh(),_u.current=s,re=i,Ue!==null?e=0:(ze=null,Ke=0,e=Le)}if(e!==0){if(e===2&&(i=th(t),i!==0&&(n=i,e=Oh(t,i))),e===1)throw r=Po,Gn(t,0),dn(t,n),gt(t,Me()),r;if(e===6)dn(t,n);else{if(i=t.current.alternate,!(n&30)&&!NA(i)&&(e=Su(t,n),e===2&&(s=th(t),s!==0&&(n=s,e=Oh(t,s))),e===1))throw r=Po,Gn(t,0),dn(t,n),gt(t,Me()),r;switch(t.finishedWork=i,t.finishedLanes=n,e){case 0:case 1:throw Error(B(345));case 2:Yn(t,ht,Nr);break;case 3:if(dn(t,n),(n&130023424)===n&&(e=fp+500-Me(),10<e)){if(iu(t,0)!==0)break;if(i=t.suspendedLanes,(i&n)!==n){lt(),t.pingedLanes|=t.suspendedLanes&i;break}t.timeoutHandle=uh(Yn.bind(null,t,ht,Nr),e);break}Yn(t,ht,Nr);break;case 4:if(dn(t,n),(n&4194240)===n)break;for(e=t.eventTimes,i=-1;0<n;){var a=31-Zt(n);s=1<<a,a=e[a],a>i&&(i=a),n&=~s}if(n=i,n=Me()-n,n=(120>n?120:480>n?480:1080>n?1080:1920>n?1920:3e3>n?3e3:4320>n?4320:1960*VA(n/1960))-n,10<n){t.timeoutHandle=uh(Yn.bind(null,t,ht,Nr),n);break}Yn(t,ht,Nr);break;case 5:Yn(t,ht,Nr);break;default:throw Error(B(329))}}}return gt(t,Me()),t.callbackNode===r?lb.bind(null,t):null}function Oh(t,e){var r=So;return t.current.memoizedState.isDehydrated&&(Gn(t,e).flags|=256),t=Su(t,e),t!==2&&(e=ht,ht=r,e!==null&&Mh(e)),t}function Mh(t){ht===null?ht=t:ht.push.apply(ht,t)}function NA(t){for(var e=t;;){if(e.flags&16384){var r=e.updateQueue;if(r!==null&&(r=r.stores,r!==null))for(var n=0;n<r.length;n++){var i=r[n],s=i.getSnapshot;i=i.value;try{if(!er(s(),i))return!1}catch{return!1}}}if(r=e.child,e.subtreeFlags&16384&&r!==null)r.return=e,e=r;else{if(e===t)break;for(;e.sibling===null;){if(e.return===null||e.return===t)return!0;e=e.return}e.sibling.return=e.return,e=e.sibling}}return!0}function dn(t,e){for(e&=~dp,e&=~Uu,t.suspendedLanes|=e,t.pingedLanes&=~e,t=t.expirationTimes;0<e;){var r=31-Zt(e),n=1<<r;t[r]=-1,e&=~n}}function v1(t){if(re&6)throw Error(B(327));ns();var e=iu(t,0);if(!(e&1))return gt(t,Me()),null;var r=Su(t,e);if(t.tag!==0&&r===2){var n=th(t);n!==0&&(e=n,r=Oh(t,n))}if(r===1)throw r=Po,Gn(t,0),dn(t,e),gt(t,Me()),r;if(r===6)throw Error(B(345));return t.finishedWork=t.current.alternate,t.finishedLanes=e,Yn(t,ht,Nr),gt(t,Me()),null}function hp(t,e){var r=re;re|=1;try{return t(e)}finally{re=r,re===0&&(cs=Me()+500,Ou&&Dn())}}function ni(t){hn!==null&&hn.tag===0&&!(re&6)&&ns();var e=re;re|=1;var r=Rt.transition,n=se;try{if(Rt.transition=null,se=1,t)return t()}finally{se=n,Rt.transition=r,re=e,!(re&6)&&Dn()}}function pp(){St=Gi.current,he(Gi)}function Gn(t,e){t.finishedWork=null,t.finishedLanes=0;var r=t.timeoutHandle;if(r!==-1&&(t.timeoutHandle=-1,dA(r)),Ue!==null)for(r=Ue.return;r!==null;){var n=r;switch(Kh(n),n.tag){case 1:n=n.type.childContextTypes,n!=null&&uu();break;case 3:ls(),he(yt),he(it),np();break;case 5:rp(n);break;case 4:ls();break;case 13:he(we);break;case 19:he(we);break;case 10:Zh(n.type._context);break;case 22:case 23:pp()}r=r.return}if(ze=t,Ue=t=bn(t.current,null),Ke=St=e,Le=0,Po=null,dp=Uu=ri=0,ht=So=null,Qn!==null){for(e=0;e<Qn.length;e++)if(r=Qn[e],n=r.interleaved,n!==null){r.interleaved=null;var i=n.next,s=r.pending;if(s!==null){var a=s.next;s.next=i,n.next=a}r.pending=n}Qn=null}return t}function ub(t,e){do{var r=Ue;try{if(Gh(),Kl.current=vu,gu){for(var n=be.memoizedState;n!==null;){var i=n.queue;i!==null&&(i.pending=null),n=n.next}gu=!1}if(ti=0,je=ke=be=null,wo=!1,Lo=0,cp.current=null,r===null||r.return===null){Le=1,Po=e,Ue=null;break}e:{var s=t,a=r.return,l=r,c=e;if(e=Ke,l.flags|=32768,c!==null&&typeof c=="object"&&typeof c.then=="function"){var o=c,u=l,d=u.tag;if(!(u.mode&1)&&(d===0||d===11||d===15)){var v=u.alternate;v?(u.updateQueue=v.updateQueue,u.memoizedState=v.memoizedState,u.lanes=v.lanes):(u.updateQueue=null,u.memoizedState=null)}var T=s1(a);if(T!==null){T.flags&=-257,o1(T,a,l,s,e),T.mode&1&&i1(s,o,e),e=T,c=o;var I=e.updateQueue;if(I===null){var D=new Set;D.add(c),e.updateQueue=D}else I.add(c);break e}else{if(!(e&1)){i1(s,o,e),yp();break e}c=Error(B(426))}}else if(ge&&l.mode&1){var ne=s1(a);if(ne!==null){!(ne.flags&65536)&&(ne.flags|=256),o1(ne,a,l,s,e),Qh(us(c,l));break e}}s=c=us(c,l),Le!==4&&(Le=2),So===null?So=[s]:So.push(s),s=a;do{switch(s.tag){case 3:s.flags|=65536,e&=-e,s.lanes|=e;var g=Hw(s,c,e);Z0(s,g);break e;case 1:l=c;var f=s.type,h=s.stateNode;if(!(s.flags&128)&&(typeof f.getDerivedStateFromError=="function"||h!==null&&typeof h.componentDidCatch=="function"&&(_n===null||!_n.has(h)))){s.flags|=65536,e&=-e,s.lanes|=e;var S=Yw(s,l,e);Z0(s,S);break e}}s=s.return}while(s!==null)}fb(r)}catch(A){e=A,Ue===r&&r!==null&&(Ue=r=r.return);continue}break}while(!0)}function cb(){var t=_u.current;return _u.current=vu,t===null?vu:t}function yp(){(Le===0||Le===3||Le===2)&&(Le=4),ze===null||!(ri&268435455)&&!(Uu&268435455)||dn(ze,Ke)}function Su(t,e){var r=re;re|=2;var n=cb();(ze!==t||Ke!==e)&&(Nr=null,Gn(t,e));do try{kA();break}catch(i){ub(t,i)}while(!0);if(Gh(),re=r,_u.current=n,Ue!==null)throw Error(B(261));return ze=null,Ke=0,Le}function kA(){for(;Ue!==null;)db(Ue)}function LA(){for(;Ue!==null&&!cD();)db(Ue)}function db(t){var e=pb(t.alternate,t,St);t.memoizedProps=t.pendingProps,e===null?fb(t):Ue=e,cp.current=null}function fb(t){var e=t;do{var r=e.alternate;if(t=e.return,e.flags&32768){if(r=MA(r,e),r!==null){r.flags&=32767,Ue=r;return}if(t!==null)t.flags|=32768,t.subtreeFlags=0,t.deletions=null;else{Le=6,Ue=null;return}}else if(r=OA(r,e,St),r!==null){Ue=r;return}if(e=e.sibling,e!==null){Ue=e;return}Ue=e=t}while(e!==null);Le===0&&(Le=5)}function Yn(t,e,r){var n=se,i=Rt.transition;try{Rt.transition=null,se=1,CA(t,e,r,n)}finally{Rt.transition=i,se=n}return null}function CA(t,e,r,n){do ns();while(hn!==null);if(re&6)throw Error(B(327));r=t.finishedWork;var i=t.finishedLanes;if(r===null)return null;if(t.finishedWork=null,t.finishedLanes=0,r===t.current)throw Error(B(177));t.callbackNode=null,t.callbackPriority=0;var s=r.lanes|r.childLanes;if(wD(t,s),t===ze&&(Ue=ze=null,Ke=0),!(r.subtreeFlags&2064)&&!(r.flags&2064)||ql||(ql=!0,yb(nu,function(){return ns(),null})),s=(r.flags&15990)!==0,r.subtreeFlags&15990||s){s=Rt.transition,Rt.transition=null;var a=se;se=1;var l=re;re|=4,cp.current=null,EA(t,r),ob(r,t),oA(ah),su=!!oh,ah=oh=null,t.current=r,UA(r,t,i),dD(),re=l,se=a,Rt.transition=s}else t.current=r;if(ql&&(ql=!1,hn=t,bu=i),s=t.pendingLanes,s===0&&(_n=null),pD(r.stateNode,n),gt(t,Me()),e!==null)for(n=t.onRecoverableError,r=0;r<e.length;r++)i=e[r],n(i.value,{componentStack:i.stack,digest:i.digest});if(wu)throw wu=!1,t=Ah,Ah=null,t;return bu&1&&t.tag!==0&&ns(),s=t.pendingLanes,s&1?t===Fh?To++:(To=0,Fh=t):To=0,Dn(),null}function ns(){if(hn!==null){var t=H1(bu),e=Rt.transition,r=se;try{if(Rt.transition=null,se=16>t?16:t,hn===null)var n=!1;else{if(t=hn,hn=null,bu=0,re&6)throw Error(B(331));var i=re;for(re|=4,M=t.current;M!==null;){var s=M,a=s.child;if(M.flags&16){var l=s.deletions;if(l!==null){for(var c=0;c<l.length;c++){var o=l[c];for(M=o;M!==null;){var u=M;switch(u.tag){case 0:case 11:case 15:bo(8,u,s)}var d=u.child;if(d!==null)d.return=u,M=d;else for(;M!==null;){u=M;var v=u.sibling,T=u.return;if(nb(u),u===o){M=null;break}if(v!==null){v.return=T,M=v;break}M=T}}}var I=s.alternate;if(I!==null){var D=I.child;if(D!==null){I.child=null;do{var ne=D.sibling;D.sibling=null,D=ne}while(D!==null)}}M=s}}if(s.subtreeFlags&2064&&a!==null)a.return=s,M=a;else e:for(;M!==null;){if(s=M,s.flags&2048)switch(s.tag){case 0:case 11:case 15:bo(9,s,s.return)}var g=s.sibling;if(g!==null){g.return=s.return,M=g;break e}M=s.return}}var f=t.current;for(M=f;M!==null;){a=M;var h=a.child;if(a.subtreeFlags&2064&&h!==null)h.return=a,M=h;else e:for(a=f;M!==null;){if(l=M,l.flags&2048)try{switch(l.tag){case 0:case 11:case 15:Eu(9,l)}}catch(A){De(l,l.return,A)}if(l===a){M=null;break e}var S=l.sibling;if(S!==null){S.return=l.return,M=S;break e}M=l.return}}if(re=i,Dn(),br&&typeof br.onPostCommitFiberRoot=="function")try{br.onPostCommitFiberRoot(Bu,t)}catch{}n=!0}return n}finally{se=r,Rt.transition=e}}return!1}function _1(t,e,r){e=us(r,e),e=Hw(t,e,1),t=vn(t,e,1),e=lt(),t!==null&&(jo(t,1,e),gt(t,e))}function De(t,e,r){if(t.tag===3)_1(t,t,r);else for(;e!==null;){if(e.tag===3){_1(e,t,r);break}else if(e.tag===1){var n=e.stateNode;if(typeof e.type.getDerivedStateFromError=="function"||typeof n.componentDidCatch=="function"&&(_n===null||!_n.has(n))){t=us(r,t),t=Yw(e,t,1),e=vn(e,t,1),t=lt(),e!==null&&(jo(e,1,t),gt(e,t));break}}e=e.return}}function RA(t,e,r){var n=t.pingCache;n!==null&&n.delete(e),e=lt(),t.pingedLanes|=t.suspendedLanes&r,ze===t&&(Ke&r)===r&&(Le===4||Le===3&&(Ke&130023424)===Ke&&500>Me()-fp?Gn(t,0):dp|=r),gt(t,e)}function hb(t,e){e===0&&(t.mode&1?(e=Ol,Ol<<=1,!(Ol&130023424)&&(Ol=4194304)):e=1);var r=lt();t=zr(t,e),t!==null&&(jo(t,e,r),gt(t,r))}function PA(t){var e=t.memoizedState,r=0;e!==null&&(r=e.retryLane),hb(t,r)}function jA(t,e){var r=0;switch(t.tag){case 13:var n=t.stateNode,i=t.memoizedState;i!==null&&(r=i.retryLane);break;case 19:n=t.stateNode;break;default:throw Error(B(314))}n!==null&&n.delete(e),hb(t,r)}var pb;pb=function(t,e,r){if(t!==null)if(t.memoizedProps!==e.pendingProps||yt.current)pt=!0;else{if(!(t.lanes&r)&&!(e.flags&128))return pt=!1,FA(t,e,r);pt=!!(t.flags&131072)}else pt=!1,ge&&e.flags&1048576&&vw(e,fu,e.index);switch(e.lanes=0,e.tag){case 2:var n=e.type;Jl(t,e),t=e.pendingProps;var i=ss(e,it.current);rs(e,r),i=sp(null,e,n,t,i,r);var s=op();return e.flags|=1,typeof i=="object"&&i!==null&&typeof i.render=="function"&&i.$$typeof===void 0?(e.tag=1,e.memoizedState=null,e.updateQueue=null,mt(n)?(s=!0,cu(e)):s=!1,e.memoizedState=i.state!==null&&i.state!==void 0?i.state:null,ep(e),i.updater=xu,e.stateNode=i,i._reactInternals=e,mh(e,n,t,r),e=_h(null,e,n,!0,s,r)):(e.tag=0,ge&&s&&Yh(e),at(null,e,i,r),e=e.child),e;case 16:n=e.elementType;e:{switch(Jl(t,e),t=e.pendingProps,i=n._init,n=i(n._payload),e.type=n,i=e.tag=qA(n),t=Qt(n,t),i){case 0:e=vh(null,e,n,t,r);break e;case 1:e=u1(null,e,n,t,r);break e;case 11:e=a1(null,e,n,t,r);break e;case 14:e=l1(null,e,n,Qt(n.type,t),r);break e}throw Error(B(306,n,""))}return e;case 0:return n=e.type,i=e.pendingProps,i=e.elementType===n?i:Qt(n,i),vh(t,e,n,i,r);case 1:return n=e.type,i=e.pendingProps,i=e.elementType===n?i:Qt(n,i),u1(t,e,n,i,r);case 3:e:{if(Gw(e),t===null)throw Error(B(387));n=e.pendingProps,s=e.memoizedState,i=s.element,Bw(t,e),yu(e,n,null,r);var a=e.memoizedState;if(n=a.element,s.isDehydrated)if(s={element:n,isDehydrated:!1,cache:a.cache,pendingSuspenseBoundaries:a.pendingSuspenseBoundaries,transitions:a.transitions},e.updateQueue.baseState=s,e.memoizedState=s,e.flags&256){i=us(Error(B(423)),e),e=c1(t,e,n,r,i);break e}else if(n!==i){i=us(Error(B(424)),e),e=c1(t,e,n,r,i);break e}else for(Tt=gn(e.stateNode.containerInfo.firstChild),Bt=e,ge=!0,Gt=null,r=Sw(e,null,n,r),e.child=r;r;)r.flags=r.flags&-3|4096,r=r.sibling;else{if(os(),n===i){e=qr(t,e,r);break e}at(t,e,n,r)}e=e.child}return e;case 5:return Iw(e),t===null&&hh(e),n=e.type,i=e.pendingProps,s=t!==null?t.memoizedProps:null,a=i.children,lh(n,i)?a=null:s!==null&&lh(n,s)&&(e.flags|=32),Jw(t,e),at(t,e,a,r),e.child;case 6:return t===null&&hh(e),null;case 13:return Zw(t,e,r);case 4:return tp(e,e.stateNode.containerInfo),n=e.pendingProps,t===null?e.child=as(e,null,n,r):at(t,e,n,r),e.child;case 11:return n=e.type,i=e.pendingProps,i=e.elementType===n?i:Qt(n,i),a1(t,e,n,i,r);case 7:return at(t,e,e.pendingProps,r),e.child;case 8:return at(t,e,e.pendingProps.children,r),e.child;case 12:return at(t,e,e.pendingProps.children,r),e.child;case 10:e:{if(n=e.type._context,i=e.pendingProps,s=e.memoizedProps,a=i.value,ce(hu,n._currentValue),n._currentValue=a,s!==null)if(er(s.value,a)){if(s.children===i.children&&!yt.current){e=qr(t,e,r);break e}}else for(s=e.child,s!==null&&(s.return=e);s!==null;){var l=s.dependencies;if(l!==null){a=s.child;for(var c=l.firstContext;c!==null;){if(c.context===n){if(s.tag===1){c=Rr(-1,r&-r),c.tag=2;var o=s.updateQueue;if(o!==null){o=o.shared;var u=o.pending;u===null?c.next=c:(c.next=u.next,u.next=c),o.pending=c}}s.lanes|=r,c=s.alternate,c!==null&&(c.lanes|=r),ph(s.return,r,e),l.lanes|=r;break}c=c.next}}else if(s.tag===10)a=s.type===e.type?null:s.child;else if(s.tag===18){if(a=s.return,a===null)throw Error(B(341));a.lanes|=r,l=a.alternate,l!==null&&(l.lanes|=r),ph(a,r,e),a=s.sibling}else a=s.child;if(a!==null)a.return=s;else for(a=s;a!==null;){if(a===e){a=null;break}if(s=a.sibling,s!==null){s.return=a.return,a=s;break}a=a.return}s=a}at(t,e,i.children,r),e=e.child}return e;case 9:return i=e.type,n=e.pendingProps.children,rs(e,r),i=Pt(i),n=n(i),e.flags|=1,at(t,e,n,r),e.child;case 14:return n=e.type,i=Qt(n,e.pendingProps),i=Qt(n.type,i),l1(t,e,n,i,r);case 15:return Kw(t,e,e.type,e.pendingProps,r);case 17:return n=e.type,i=e.pendingProps,i=e.elementType===n?i:Qt(n,i),Jl(t,e),e.tag=1,mt(n)?(t=!0,cu(e)):t=!1,rs(e,r),Ww(e,n,i),mh(e,n,i,r),_h(null,e,n,!0,t,r);case 19:return Xw(t,e,r);case 22:return Qw(t,e,r)}throw Error(B(156,e.tag))};function yb(t,e){return z1(t,e)}function zA(t,e,r,n){this.tag=t,this.key=r,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=e,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=n,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ct(t,e,r,n){return new zA(t,e,r,n)}function mp(t){return t=t.prototype,!(!t||!t.isReactComponent)}function qA(t){if(typeof t=="function")return mp(t)?1:0;if(t!=null){if(t=t.$$typeof,t===Nh)return 11;if(t===kh)return 14}return 2}function bn(t,e){var r=t.alternate;return r===null?(r=Ct(t.tag,e,t.key,t.mode),r.elementType=t.elementType,r.type=t.type,r.stateNode=t.stateNode,r.alternate=t,t.alternate=r):(r.pendingProps=e,r.type=t.type,r.flags=0,r.subtreeFlags=0,r.deletions=null),r.flags=t.flags&14680064,r.childLanes=t.childLanes,r.lanes=t.lanes,r.child=t.child,r.memoizedProps=t.memoizedProps,r.memoizedState=t.memoizedState,r.updateQueue=t.updateQueue,e=t.dependencies,r.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext},r.sibling=t.sibling,r.index=t.index,r.ref=t.ref,r}function Xl(t,e,r,n,i,s){var a=2;if(n=t,typeof t=="function")mp(t)&&(a=1);else if(typeof t=="string")a=5;else e:switch(t){case ji:return Zn(r.children,i,s,e);case Vh:a=8,i|=8;break;case Pf:return t=Ct(12,r,e,i|2),t.elementType=Pf,t.lanes=s,t;case jf:return t=Ct(13,r,e,i),t.elementType=jf,t.lanes=s,t;case zf:return t=Ct(19,r,e,i),t.elementType=zf,t.lanes=s,t;case I1:return Vu(r,i,s,e);default:if(typeof t=="object"&&t!==null)switch(t.$$typeof){case T1:a=10;break e;case B1:a=9;break e;case Nh:a=11;break e;case kh:a=14;break e;case ln:a=16,n=null;break e}throw Error(B(130,t==null?t:typeof t,""))}return e=Ct(a,r,e,i),e.elementType=t,e.type=n,e.lanes=s,e}function Zn(t,e,r,n){return t=Ct(7,t,n,e),t.lanes=r,t}function Vu(t,e,r,n){return t=Ct(22,t,n,e),t.elementType=I1,t.lanes=r,t.stateNode={isHidden:!1},t}function Lf(t,e,r){return t=Ct(6,t,null,e),t.lanes=r,t}function Cf(t,e,r){return e=Ct(4,t.children!==null?t.children:[],t.key,e),e.lanes=r,e.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},e}function $A(t,e,r,n,i){this.tag=e,this.containerInfo=t,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=bf(0),this.expirationTimes=bf(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=bf(0),this.identifierPrefix=n,this.onRecoverableError=i,this.mutableSourceEagerHydrationData=null}function gp(t,e,r,n,i,s,a,l,c){return t=new $A(t,e,r,l,c),e===1?(e=1,s===!0&&(e|=8)):e=0,s=Ct(3,null,null,e),t.current=s,s.stateNode=t,s.memoizedState={element:n,isDehydrated:r,cache:null,transitions:null,pendingSuspenseBoundaries:null},ep(s),t}function WA(t,e,r){var n=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Pi,key:n==null?null:""+n,children:t,containerInfo:e,implementation:r}}function mb(t){if(!t)return Tn;t=t._reactInternals;e:{if(si(t)!==t||t.tag!==1)throw Error(B(170));var e=t;do{switch(e.tag){case 3:e=e.stateNode.context;break e;case 1:if(mt(e.type)){e=e.stateNode.__reactInternalMemoizedMergedChildContext;break e}}e=e.return}while(e!==null);throw Error(B(171))}if(t.tag===1){var r=t.type;if(mt(r))return mw(t,r,e)}return e}function gb(t,e,r,n,i,s,a,l,c){return t=gp(r,n,!0,t,i,s,a,l,c),t.context=mb(null),r=t.current,n=lt(),i=wn(r),s=Rr(n,i),s.callback=e??null,vn(r,s,i),t.current.lanes=i,jo(t,i,n),gt(t,n),t}function Nu(t,e,r,n){var i=e.current,s=lt(),a=wn(i);return r=mb(r),e.context===null?e.context=r:e.pendingContext=r,e=Rr(s,a),e.payload={element:t},n=n===void 0?null:n,n!==null&&(e.callback=n),t=vn(i,e,a),t!==null&&(Xt(t,i,a,s),Yl(t,i,a)),a}function Tu(t){if(t=t.current,!t.child)return null;switch(t.child.tag){case 5:return t.child.stateNode;default:return t.child.stateNode}}function w1(t,e){if(t=t.memoizedState,t!==null&&t.dehydrated!==null){var r=t.retryLane;t.retryLane=r!==0&&r<e?r:e}}function vp(t,e){w1(t,e),(t=t.alternate)&&w1(t,e)}function HA(){return null}var vb=typeof reportError=="function"?reportError:function(t){console.error(t)};function _p(t){this._internalRoot=t}ku.prototype.render=_p.prototype.render=function(t){var e=this._internalRoot;if(e===null)throw Error(B(409));Nu(t,e,null,null)};ku.prototype.unmount=_p.prototype.unmount=function(){var t=this._internalRoot;if(t!==null){this._internalRoot=null;var e=t.containerInfo;ni(function(){Nu(null,t,null,null)}),e[jr]=null}};function ku(t){this._internalRoot=t}ku.prototype.unstable_scheduleHydration=function(t){if(t){var e=Q1();t={blockedOn:null,target:t,priority:e};for(var r=0;r<cn.length&&e!==0&&e<cn[r].priority;r++);cn.splice(r,0,t),r===0&&G1(t)}};function wp(t){return!(!t||t.nodeType!==1&&t.nodeType!==9&&t.nodeType!==11)}function Lu(t){return!(!t||t.nodeType!==1&&t.nodeType!==9&&t.nodeType!==11&&(t.nodeType!==8||t.nodeValue!==" react-mount-point-unstable "))}function b1(){}function YA(t,e,r,n,i){if(i){if(typeof n=="function"){var s=n;n=function(){var o=Tu(a);s.call(o)}}var a=gb(e,n,t,0,null,!1,!1,"",b1);return t._reactRootContainer=a,t[jr]=a.current,Eo(t.nodeType===8?t.parentNode:t),ni(),a}for(;i=t.lastChild;)t.removeChild(i);if(typeof n=="function"){var l=n;n=function(){var o=Tu(c);l.call(o)}}var c=gp(t,0,!1,null,null,!1,!1,"",b1);return t._reactRootContainer=c,t[jr]=c.current,Eo(t.nodeType===8?t.parentNode:t),ni(function(){Nu(e,c,r,n)}),c}function Cu(t,e,r,n,i){var s=r._reactRootContainer;if(s){var a=s;if(typeof i=="function"){var l=i;i=function(){var c=Tu(a);l.call(c)}}Nu(e,a,t,i)}else a=YA(r,e,t,i,n);return Tu(a)}Y1=function(t){switch(t.tag){case 3:var e=t.stateNode;if(e.current.memoizedState.isDehydrated){var r=ho(e.pendingLanes);r!==0&&(Rh(e,r|1),gt(e,Me()),!(re&6)&&(cs=Me()+500,Dn()))}break;case 13:ni(function(){var n=zr(t,1);if(n!==null){var i=lt();Xt(n,t,1,i)}}),vp(t,1)}};Ph=function(t){if(t.tag===13){var e=zr(t,134217728);if(e!==null){var r=lt();Xt(e,t,134217728,r)}vp(t,134217728)}};K1=function(t){if(t.tag===13){var e=wn(t),r=zr(t,e);if(r!==null){var n=lt();Xt(r,t,e,n)}vp(t,e)}};Q1=function(){return se};J1=function(t,e){var r=se;try{return se=t,e()}finally{se=r}};Zf=function(t,e,r){switch(e){case"input":if(Wf(t,r),e=r.name,r.type==="radio"&&e!=null){for(r=t;r.parentNode;)r=r.parentNode;for(r=r.querySelectorAll("input[name="+JSON.stringify(""+e)+'][type="radio"]'),e=0;e<r.length;e++){var n=r[e];if(n!==t&&n.form===t.form){var i=Fu(n);if(!i)throw Error(B(90));A1(n),Wf(n,i)}}}break;case"textarea":O1(t,r);break;case"select":e=r.value,e!=null&&Zi(t,!!r.multiple,e,!1)}};k1=hp;L1=ni;var KA={usingClientEntryPoint:!1,Events:[qo,Wi,Fu,V1,N1,hp]},lo={findFiberByHostInstance:Kn,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},QA={bundleType:lo.bundleType,version:lo.version,rendererPackageName:lo.rendererPackageName,rendererConfig:lo.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:$r.ReactCurrentDispatcher,findHostInstanceByFiber:function(t){return t=P1(t),t===null?null:t.stateNode},findFiberByHostInstance:lo.findFiberByHostInstance||HA,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"&&(uo=__REACT_DEVTOOLS_GLOBAL_HOOK__,!uo.isDisabled&&uo.supportsFiber))try{Bu=uo.inject(QA),br=uo}catch{}var uo;At.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=KA;At.createPortal=function(t,e){var r=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!wp(e))throw Error(B(200));return WA(t,e,null,r)};At.createRoot=function(t,e){if(!wp(t))throw Error(B(299));var r=!1,n="",i=vb;return e!=null&&(e.unstable_strictMode===!0&&(r=!0),e.identifierPrefix!==void 0&&(n=e.identifierPrefix),e.onRecoverableError!==void 0&&(i=e.onRecoverableError)),e=gp(t,1,!1,null,null,r,!1,n,i),t[jr]=e.current,Eo(t.nodeType===8?t.parentNode:t),new _p(e)};At.findDOMNode=function(t){if(t==null)return null;if(t.nodeType===1)return t;var e=t._reactInternals;if(e===void 0)throw typeof t.render=="function"?Error(B(188)):(t=Object.keys(t).join(","),Error(B(268,t)));return t=P1(e),t=t===null?null:t.stateNode,t};At.flushSync=function(t){return ni(t)};At.hydrate=function(t,e,r){if(!Lu(e))throw Error(B(200));return Cu(null,t,e,!0,r)};At.hydrateRoot=function(t,e,r){if(!wp(t))throw Error(B(405));var n=r!=null&&r.hydratedSources||null,i=!1,s="",a=vb;if(r!=null&&(r.unstable_strictMode===!0&&(i=!0),r.identifierPrefix!==void 0&&(s=r.identifierPrefix),r.onRecoverableError!==void 0&&(a=r.onRecoverableError)),e=gb(e,null,t,1,r??null,i,!1,s,a),t[jr]=e.current,Eo(t),n)for(t=0;t<n.length;t++)r=n[t],i=r._getVersion,i=i(r._source),e.mutableSourceEagerHydrationData==null?e.mutableSourceEagerHydrationData=[r,i]:e.mutableSourceEagerHydrationData.push(r,i);return new ku(e)};At.render=function(t,e,r){if(!Lu(e))throw Error(B(200));return Cu(null,t,e,!1,r)};At.unmountComponentAtNode=function(t){if(!Lu(t))throw Error(B(40));return t._reactRootContainer?(ni(function(){Cu(null,null,t,!1,function(){t._reactRootContainer=null,t[jr]=null})}),!0):!1};At.unstable_batchedUpdates=hp;At.unstable_renderSubtreeIntoContainer=function(t,e,r,n){if(!Lu(r))throw Error(B(200));if(t==null||t._reactInternals===void 0)throw Error(B(38));return Cu(t,e,r,!1,n)};At.version="18.3.1-next-f1338f8080-20240426"});var Sb=b(($N,bb)=>{"use strict";function wb(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(wb)}catch(t){console.error(t)}}wb(),bb.exports=_b()});var Bb=b(bp=>{"use strict";var Tb=Sb();bp.createRoot=Tb.createRoot,bp.hydrateRoot=Tb.hydrateRoot;var WN});var Db=b(oe=>{"use strict";var qe=typeof Symbol=="function"&&Symbol.for,Sp=qe?Symbol.for("react.element"):60103,Tp=qe?Symbol.for("react.portal"):60106,Ru=qe?Symbol.for("react.fragment"):60107,Pu=qe?Symbol.for("react.strict_mode"):60108,ju=qe?Symbol.for("react.profiler"):60114,zu=qe?Symbol.for("react.provider"):60109,qu=qe?Symbol.for("react.context"):60110,Bp=qe?Symbol.for("react.async_mode"):60111,$u=qe?Symbol.for("react.concurrent_mode"):60111,Wu=qe?Symbol.for("react.forward_ref"):60112,Hu=qe?Symbol.for("react.suspense"):60113,JA=qe?Symbol.for("react.suspense_list"):60120,Yu=qe?Symbol.for("react.memo"):60115,Ku=qe?Symbol.for("react.lazy"):60116,GA=qe?Symbol.for("react.block"):60121,ZA=qe?Symbol.for("react.fundamental"):60117,XA=qe?Symbol.for("react.responder"):60118,eF=qe?Symbol.for("react.scope"):60119;function Ft(t){if(typeof t=="object"&&t!==null){var e=t.$$typeof;switch(e){case Sp:switch(t=t.type,t){case Bp:case $u:case Ru:case ju:case Pu:case Hu:return t;default:switch(t=t&&t.$$typeof,t){case qu:case Wu:case Ku:case Yu:case zu:return t;default:return e}}case Tp:return e}}}function Ib(t){return Ft(t)===$u}oe.AsyncMode=Bp;oe.ConcurrentMode=$u;oe.ContextConsumer=qu;oe.ContextProvider=zu;oe.Element=Sp;oe.ForwardRef=Wu;oe.Fragment=Ru;oe.Lazy=Ku;oe.Memo=Yu;oe.Portal=Tp;oe.Profiler=ju;oe.StrictMode=Pu;oe.Suspense=Hu;oe.isAsyncMode=function(t){return Ib(t)||Ft(t)===Bp};oe.isConcurrentMode=Ib;oe.isContextConsumer=function(t){return Ft(t)===qu};oe.isContextProvider=function(t){return Ft(t)===zu};oe.isElement=function(t){return typeof t=="object"&&t!==null&&t.$$typeof===Sp};oe.isForwardRef=function(t){return Ft(t)===Wu};oe.isFragment=function(t){return Ft(t)===Ru};oe.isLazy=function(t){return Ft(t)===Ku};oe.isMemo=function(t){return Ft(t)===Yu};oe.isPortal=function(t){return Ft(t)===Tp};oe.isProfiler=function(t){return Ft(t)===ju};oe.isStrictMode=function(t){return Ft(t)===Pu};oe.isSuspense=function(t){return Ft(t)===Hu};oe.isValidElementType=function(t){return typeof t=="string"||typeof t=="function"||t===Ru||t===$u||t===ju||t===Pu||t===Hu||t===JA||typeof t=="object"&&t!==null&&(t.$$typeof===Ku||t.$$typeof===Yu||t.$$typeof===zu||t.$$typeof===qu||t.$$typeof===Wu||t.$$typeof===ZA||t.$$typeof===XA||t.$$typeof===eF||t.$$typeof===GA)};oe.typeOf=Ft});var Fb=b((KN,Ab)=>{"use strict";Ab.exports=Db()});var Nb=b((QN,Vb)=>{"use strict";var Ip=Fb(),tF={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},rF={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},nF={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},Eb={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},Dp={};Dp[Ip.ForwardRef]=nF;Dp[Ip.Memo]=Eb;function Ob(t){return Ip.isMemo(t)?Eb:Dp[t.$$typeof]||tF}var iF=Object.defineProperty,sF=Object.getOwnPropertyNames,Mb=Object.getOwnPropertySymbols,oF=Object.getOwnPropertyDescriptor,aF=Object.getPrototypeOf,xb=Object.prototype;function Ub(t,e,r){if(typeof e!="string"){if(xb){var n=aF(e);n&&n!==xb&&Ub(t,n,r)}var i=sF(e);Mb&&(i=i.concat(Mb(e)));for(var s=Ob(t),a=Ob(e),l=0;l<i.length;++l){var c=i[l];if(!rF[c]&&!(r&&r[c])&&!(a&&a[c])&&!(s&&s[c])){var o=oF(e,c);try{iF(t,c,o)}catch{}}}}return t}Vb.exports=Ub});var Cb=b((JN,Lb)=>{"use strict";var kb=Object.getOwnPropertySymbols,lF=Object.prototype.hasOwnProperty,uF=Object.prototype.propertyIsEnumerable;function cF(t){if(t==null)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(t)}function dF(){try{if(!Object.assign)return!1;var t=new String("abc");if(t[5]="de",Object.getOwnPropertyNames(t)[0]==="5")return!1;for(var e={},r=0;r<10;r++)e["_"+String.fromCharCode(r)]=r;var n=Object.getOwnPropertyNames(e).map(function(s){return e[s]});if(n.join("")!=="0123456789")return!1;var i={};return"abcdefghijklmnopqrst".split("").forEach(function(s){i[s]=s}),Object.keys(Object.assign({},i)).join("")==="abcdefghijklmnopqrst"}catch{return!1}}Lb.exports=dF()?Object.assign:function(t,e){for(var r,n=cF(t),i,s=1;s<arguments.length;s++){r=Object(arguments[s]);for(var a in r)lF.call(r,a)&&(n[a]=r[a]);if(kb){i=kb(r);for(var l=0;l<i.length;l++)uF.call(r,i[l])&&(n[i[l]]=r[i[l]])}}return n}});var Jb=b(ae=>{"use strict";var xp=Cb(),tr=typeof Symbol=="function"&&Symbol.for,Wo=tr?Symbol.for("react.element"):60103,fF=tr?Symbol.for("react.portal"):60106,hF=tr?Symbol.for("react.fragment"):60107,pF=tr?Symbol.for("react.strict_mode"):60108,yF=tr?Symbol.for("react.profiler"):60114,mF=tr?Symbol.for("react.provider"):60109,gF=tr?Symbol.for("react.context"):60110,vF=tr?Symbol.for("react.forward_ref"):60112,_F=tr?Symbol.for("react.suspense"):60113,wF=tr?Symbol.for("react.memo"):60115,bF=tr?Symbol.for("react.lazy"):60116,Rb=typeof Symbol=="function"&&Symbol.iterator;function Ho(t){for(var e="https://reactjs.org/docs/error-decoder.html?invariant="+t,r=1;r<arguments.length;r++)e+="&args[]="+encodeURIComponent(arguments[r]);return"Minified React error #"+t+"; visit "+e+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var Pb={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},jb={};function hs(t,e,r){this.props=t,this.context=e,this.refs=jb,this.updater=r||Pb}hs.prototype.isReactComponent={};hs.prototype.setState=function(t,e){if(typeof t!="object"&&typeof t!="function"&&t!=null)throw Error(Ho(85));this.updater.enqueueSetState(this,t,e,"setState")};hs.prototype.forceUpdate=function(t){this.updater.enqueueForceUpdate(this,t,"forceUpdate")};function zb(){}zb.prototype=hs.prototype;function Ep(t,e,r){this.props=t,this.context=e,this.refs=jb,this.updater=r||Pb}var Up=Ep.prototype=new zb;Up.constructor=Ep;xp(Up,hs.prototype);Up.isPureReactComponent=!0;var Vp={current:null},qb=Object.prototype.hasOwnProperty,$b={key:!0,ref:!0,__self:!0,__source:!0};function Wb(t,e,r){var n,i={},s=null,a=null;if(e!=null)for(n in e.ref!==void 0&&(a=e.ref),e.key!==void 0&&(s=""+e.key),e)qb.call(e,n)&&!$b.hasOwnProperty(n)&&(i[n]=e[n]);var l=arguments.length-2;if(l===1)i.children=r;else if(1<l){for(var c=Array(l),o=0;o<l;o++)c[o]=arguments[o+2];i.children=c}if(t&&t.defaultProps)for(n in l=t.defaultProps,l)i[n]===void 0&&(i[n]=l[n]);return{$$typeof:Wo,type:t,key:s,ref:a,props:i,_owner:Vp.current}}function SF(t,e){return{$$typeof:Wo,type:t.type,key:e,ref:t.ref,props:t.props,_owner:t._owner}}function Np(t){return typeof t=="object"&&t!==null&&t.$$typeof===Wo}function TF(t){var e={"=":"=0",":":"=2"};return"$"+(""+t).replace(/[=:]/g,function(r){return e[r]})}var Hb=/\/+/g,Qu=[];function Yb(t,e,r,n){if(Qu.length){var i=Qu.pop();return i.result=t,i.keyPrefix=e,i.func=r,i.context=n,i.count=0,i}return{result:t,keyPrefix:e,func:r,context:n,count:0}}function Kb(t){t.result=null,t.keyPrefix=null,t.func=null,t.context=null,t.count=0,10>Qu.length&&Qu.push(t)}function Fp(t,e,r,n){var i=typeof t;(i==="undefined"||i==="boolean")&&(t=null);var s=!1;if(t===null)s=!0;else switch(i){case"string":case"number":s=!0;break;case"object":switch(t.$$typeof){case Wo:case fF:s=!0}}if(s)return r(n,t,e===""?"."+Ap(t,0):e),1;if(s=0,e=e===""?".":e+":",Array.isArray(t))for(var a=0;a<t.length;a++){i=t[a];var l=e+Ap(i,a);s+=Fp(i,l,r,n)}else if(t===null||typeof t!="object"?l=null:(l=Rb&&t[Rb]||t["@@iterator"],l=typeof l=="function"?l:null),typeof l=="function")for(t=l.call(t),a=0;!(i=t.next()).done;)i=i.value,l=e+Ap(i,a++),s+=Fp(i,l,r,n);else if(i==="object")throw r=""+t,Error(Ho(31,r==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":r,""));return s}function Op(t,e,r){return t==null?0:Fp(t,"",e,r)}function Ap(t,e){return typeof t=="object"&&t!==null&&t.key!=null?TF(t.key):e.toString(36)}function BF(t,e){t.func.call(t.context,e,t.count++)}function IF(t,e,r){var n=t.result,i=t.keyPrefix;t=t.func.call(t.context,e,t.count++),Array.isArray(t)?Mp(t,n,r,function(s){return s}):t!=null&&(Np(t)&&(t=SF(t,i+(!t.key||e&&e.key===t.key?"":(""+t.key).replace(Hb,"$&/")+"/")+r)),n.push(t))}function Mp(t,e,r,n,i){var s="";r!=null&&(s=(""+r).replace(Hb,"$&/")+"/"),e=Yb(e,s,n,i),Op(t,IF,e),Kb(e)}var Qb={current:null};function Wr(){var t=Qb.current;if(t===null)throw Error(Ho(321));return t}var DF={ReactCurrentDispatcher:Qb,ReactCurrentBatchConfig:{suspense:null},ReactCurrentOwner:Vp,IsSomeRendererActing:{current:!1},assign:xp};ae.Children={map:function(t,e,r){if(t==null)return t;var n=[];return Mp(t,n,null,e,r),n},forEach:function(t,e,r){if(t==null)return t;e=Yb(null,null,e,r),Op(t,BF,e),Kb(e)},count:function(t){return Op(t,function(){return null},null)},toArray:function(t){var e=[];return Mp(t,e,null,function(r){return r}),e},only:function(t){if(!Np(t))throw Error(Ho(143));return t}};ae.Component=hs;ae.Fragment=hF;ae.Profiler=yF;ae.PureComponent=Ep;ae.StrictMode=pF;ae.Suspense=_F;ae.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=DF;ae.cloneElement=function(t,e,r){if(t==null)throw Error(Ho(267,t));var n=xp({},t.props),i=t.key,s=t.ref,a=t._owner;if(e!=null){if(e.ref!==void 0&&(s=e.ref,a=Vp.current),e.key!==void 0&&(i=""+e.key),t.type&&t.type.defaultProps)var l=t.type.defaultProps;for(c in e)qb.call(e,c)&&!$b.hasOwnProperty(c)&&(n[c]=e[c]===void 0&&l!==void 0?l[c]:e[c])}var c=arguments.length-2;if(c===1)n.children=r;else if(1<c){l=Array(c);for(var o=0;o<c;o++)l[o]=arguments[o+2];n.children=l}return{$$typeof:Wo,type:t.type,key:i,ref:s,props:n,_owner:a}};ae.createContext=function(t,e){return e===void 0&&(e=null),t={$$typeof:gF,_calculateChangedBits:e,_currentValue:t,_currentValue2:t,_threadCount:0,Provider:null,Consumer:null},t.Provider={$$typeof:mF,_context:t},t.Consumer=t};ae.createElement=Wb;ae.createFactory=function(t){var e=Wb.bind(null,t);return e.type=t,e};ae.createRef=function(){return{current:null}};ae.forwardRef=function(t){return{$$typeof:vF,render:t}};ae.isValidElement=Np;ae.lazy=function(t){return{$$typeof:bF,_ctor:t,_status:-1,_result:null}};ae.memo=function(t,e){return{$$typeof:wF,type:t,compare:e===void 0?null:e}};ae.useCallback=function(t,e){return Wr().useCallback(t,e)};ae.useContext=function(t,e){return Wr().useContext(t,e)};ae.useDebugValue=function(){};ae.useEffect=function(t,e){return Wr().useEffect(t,e)};ae.useImperativeHandle=function(t,e,r){return Wr().useImperativeHandle(t,e,r)};ae.useLayoutEffect=function(t,e){return Wr().useLayoutEffect(t,e)};ae.useMemo=function(t,e){return Wr().useMemo(t,e)};ae.useReducer=function(t,e,r){return Wr().useReducer(t,e,r)};ae.useRef=function(t){return Wr().useRef(t)};ae.useState=function(t){return Wr().useState(t)};ae.version="16.14.0"});var Zb=b((ZN,Gb)=>{"use strict";Gb.exports=Jb()});var lS=b((Qo,Ko)=>{"use strict";Object.defineProperty(Qo,"__esModule",{value:!0});var iS=new WeakMap,kp=new WeakMap;function pe(t){let e=iS.get(t);return console.assert(e!=null,"'this' is expected an Event object, but got",t),e}function Xb(t){if(t.passiveListener!=null){typeof console<"u"&&typeof console.error=="function"&&console.error("Unable to preventDefault inside passive event listener invocation.",t.passiveListener);return}t.event.cancelable&&(t.canceled=!0,typeof t.event.preventDefault=="function"&&t.event.preventDefault())}function ps(t,e){iS.set(this,{eventTarget:t,event:e,eventPhase:2,currentTarget:t,canceled:!1,stopped:!1,immediateStopped:!1,passiveListener:null,timeStamp:e.timeStamp||Date.now()}),Object.defineProperty(this,"isTrusted",{value:!1,enumerable:!0});let r=Object.keys(e);for(let n=0;n<r.length;++n){let i=r[n];i in this||Object.defineProperty(this,i,sS(i))}}ps.prototype={get type(){return pe(this).event.type},get target(){return pe(this).eventTarget},get currentTarget(){return pe(this).currentTarget},composedPath(){let t=pe(this).currentTarget;return t==null?[]:[t]},get NONE(){return 0},get CAPTURING_PHASE(){return 1},get AT_TARGET(){return 2},get BUBBLING_PHASE(){return 3},get eventPhase(){return pe(this).eventPhase},stopPropagation(){let t=pe(this);t.stopped=!0,typeof t.event.stopPropagation=="function"&&t.event.stopPropagation()},stopImmediatePropagation(){let t=pe(this);t.stopped=!0,t.immediateStopped=!0,typeof t.event.stopImmediatePropagation=="function"&&t.event.stopImmediatePropagation()},get bubbles(){return!!pe(this).event.bubbles},get cancelable(){return!!pe(this).event.cancelable},preventDefault(){Xb(pe(this))},get defaultPrevented(){return pe(this).canceled},get composed(){return!!pe(this).event.composed},get timeStamp(){return pe(this).timeStamp},get srcElement(){return pe(this).eventTarget},get cancelBubble(){return pe(this).stopped},set cancelBubble(t){if(!t)return;let e=pe(this);e.stopped=!0,typeof e.event.cancelBubble=="boolean"&&(e.event.cancelBubble=!0)},get returnValue(){return!pe(this).canceled},set returnValue(t){t||Xb(pe(this))},initEvent(){}};Object.defineProperty(ps.prototype,"constructor",{value:ps,configurable:!0,writable:!0});typeof window<"u"&&typeof window.Event<"u"&&(Object.setPrototypeOf(ps.prototype,window.Event.prototype),kp.set(window.Event.prototype,ps));function sS(t){return{get(){return pe(this).event[t]},set(e){pe(this).event[t]=e},configurable:!0,enumerable:!0}}function AF(t){return{value(){let e=pe(this).event;return e[t].apply(e,arguments)},configurable:!0,enumerable:!0}}function FF(t,e){let r=Object.keys(e);if(r.length===0)return t;function n(i,s){t.call(this,i,s)}n.prototype=Object.create(t.prototype,{constructor:{value:n,configurable:!0,writable:!0}});for(let i=0;i<r.length;++i){let s=r[i];if(!(s in t.prototype)){let l=typeof Object.getOwnPropertyDescriptor(e,s).value=="function";Object.defineProperty(n.prototype,s,l?AF(s):sS(s))}}return n}function oS(t){if(t==null||t===Object.prototype)return ps;let e=kp.get(t);return e==null&&(e=FF(oS(Object.getPrototypeOf(t)),t),kp.set(t,e)),e}function OF(t,e){let r=oS(Object.getPrototypeOf(e));return new r(t,e)}function MF(t){return pe(t).immediateStopped}function xF(t,e){pe(t).eventPhase=e}function EF(t,e){pe(t).currentTarget=e}function eS(t,e){pe(t).passiveListener=e}var aS=new WeakMap,tS=1,rS=2,Ju=3;function Gu(t){return t!==null&&typeof t=="object"}function Yo(t){let e=aS.get(t);if(e==null)throw new TypeError("'this' is expected an EventTarget object, but got another value.");return e}function UF(t){return{get(){let r=Yo(this).get(t);for(;r!=null;){if(r.listenerType===Ju)return r.listener;r=r.next}return null},set(e){typeof e!="function"&&!Gu(e)&&(e=null);let r=Yo(this),n=null,i=r.get(t);for(;i!=null;)i.listenerType===Ju?n!==null?n.next=i.next:i.next!==null?r.set(t,i.next):r.delete(t):n=i,i=i.next;if(e!==null){let s={listener:e,listenerType:Ju,passive:!1,once:!1,next:null};n===null?r.set(t,s):n.next=s}},configurable:!0,enumerable:!0}}function Lp(t,e){Object.defineProperty(t,`on${e}`,UF(e))}function nS(t){function e(){rr.call(this)}e.prototype=Object.create(rr.prototype,{constructor:{value:e,configurable:!0,writable:!0}});for(let r=0;r<t.length;++r)Lp(e.prototype,t[r]);return e}function rr(){if(this instanceof rr){aS.set(this,new Map);return}if(arguments.length===1&&Array.isArray(arguments[0]))return nS(arguments[0]);if(arguments.length>0){let t=new Array(arguments.length);for(let e=0;e<arguments.length;++e)t[e]=arguments[e];return nS(t)}throw new TypeError("Cannot call a class as a function")}rr.prototype={addEventListener(t,e,r){if(e==null)return;if(typeof e!="function"&&!Gu(e))throw new TypeError("'listener' should be a function or an object.");let n=Yo(this),i=Gu(r),a=(i?!!r.capture:!!r)?tS:rS,l={listener:e,listenerType:a,passive:i&&!!r.passive,once:i&&!!r.once,next:null},c=n.get(t);if(c===void 0){n.set(t,l);return}let o=null;for(;c!=null;){if(c.listener===e&&c.listenerType===a)return;o=c,c=c.next}o.next=l},removeEventListener(t,e,r){if(e==null)return;let n=Yo(this),s=(Gu(r)?!!r.capture:!!r)?tS:rS,a=null,l=n.get(t);for(;l!=null;){if(l.listener===e&&l.listenerType===s){a!==null?a.next=l.next:l.next!==null?n.set(t,l.next):n.delete(t);return}a=l,l=l.next}},dispatchEvent(t){if(t==null||typeof t.type!="string")throw new TypeError('"event.type" should be a string.');let e=Yo(this),r=t.type,n=e.get(r);if(n==null)return!0;let i=OF(this,t),s=null;for(;n!=null;){if(n.once?s!==null?s.next=n.next:n.next!==null?e.set(r,n.next):e.delete(r):s=n,eS(i,n.passive?n.listener:null),typeof n.listener=="function")try{n.listener.call(this,i)}catch(a){typeof console<"u"&&typeof console.error=="function"&&console.error(a)}else n.listenerType!==Ju&&typeof n.listener.handleEvent=="function"&&n.listener.handleEvent(i);if(MF(i))break;n=n.next}return eS(i,null),xF(i,0),EF(i,null),!i.defaultPrevented}};Object.defineProperty(rr.prototype,"constructor",{value:rr,configurable:!0,writable:!0});typeof window<"u"&&typeof window.EventTarget<"u"&&Object.setPrototypeOf(rr.prototype,window.EventTarget.prototype);Qo.defineEventAttribute=Lp;Qo.EventTarget=rr;Qo.default=rr;Ko.exports=rr;Ko.exports.EventTarget=Ko.exports.default=rr;Ko.exports.defineEventAttribute=Lp});var ys=b(uS=>{var _={};_.Offset;_.Table;_.SIZEOF_SHORT=2;_.SIZEOF_INT=4;_.FILE_IDENTIFIER_LENGTH=4;_.Encoding={UTF8_BYTES:1,UTF16_STRING:2};_.int32=new Int32Array(2);_.float32=new Float32Array(_.int32.buffer);_.float64=new Float64Array(_.int32.buffer);_.isLittleEndian=new Uint16Array(new Uint8Array([1,0]).buffer)[0]===1;_.Long=function(t,e){this.low=t|0,this.high=e|0};_.Long.create=function(t,e){return t==0&&e==0?_.Long.ZERO:new _.Long(t,e)};_.Long.prototype.toFloat64=function(){return(this.low>>>0)+this.high*4294967296};_.Long.prototype.equals=function(t){return this.low==t.low&&this.high==t.high};_.Long.ZERO=new _.Long(0,0);_.Builder=function(t){if(t)var e=t;else var e=1024;this.bb=_.ByteBuffer.allocate(e),this.space=e,this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1};_.Builder.prototype.clear=function(){this.bb.clear(),this.space=this.bb.capacity(),this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1};_.Builder.prototype.forceDefaults=function(t){this.force_defaults=t};_.Builder.prototype.dataBuffer=function(){return this.bb};_.Builder.prototype.asUint8Array=function(){return this.bb.bytes().subarray(this.bb.position(),this.bb.position()+this.offset())};_.Builder.prototype.prep=function(t,e){t>this.minalign&&(this.minalign=t);for(var r=~(this.bb.capacity()-this.space+e)+1&t-1;this.space<r+t+e;){var n=this.bb.capacity();this.bb=_.Builder.growByteBuffer(this.bb),this.space+=this.bb.capacity()-n}this.pad(r)};_.Builder.prototype.pad=function(t){for(var e=0;e<t;e++)this.bb.writeInt8(--this.space,0)};_.Builder.prototype.writeInt8=function(t){this.bb.writeInt8(this.space-=1,t)};_.Builder.prototype.writeInt16=function(t){this.bb.writeInt16(this.space-=2,t)};_.Builder.prototype.writeInt32=function(t){this.bb.writeInt32(this.space-=4,t)};_.Builder.prototype.writeInt64=function(t){this.bb.writeInt64(this.space-=8,t)};_.Builder.prototype.writeFloat32=function(t){this.bb.writeFloat32(this.space-=4,t)};_.Builder.prototype.writeFloat64=function(t){this.bb.writeFloat64(this.space-=8,t)};_.Builder.prototype.addInt8=function(t){this.prep(1,0),this.writeInt8(t)};_.Builder.prototype.addInt16=function(t){this.prep(2,0),this.writeInt16(t)};_.Builder.prototype.addInt32=function(t){this.prep(4,0),this.writeInt32(t)};_.Builder.prototype.addInt64=function(t){this.prep(8,0),this.writeInt64(t)};_.Builder.prototype.addFloat32=function(t){this.prep(4,0),this.writeFloat32(t)};_.Builder.prototype.addFloat64=function(t){this.prep(8,0),this.writeFloat64(t)};_.Builder.prototype.addFieldInt8=function(t,e,r){(this.force_defaults||e!=r)&&(this.addInt8(e),this.slot(t))};_.Builder.prototype.addFieldInt16=function(t,e,r){(this.force_defaults||e!=r)&&(this.addInt16(e),this.slot(t))};_.Builder.prototype.addFieldInt32=function(t,e,r){(this.force_defaults||e!=r)&&(this.addInt32(e),this.slot(t))};_.Builder.prototype.addFieldInt64=function(t,e,r){(this.force_defaults||!e.equals(r))&&(this.addInt64(e),this.slot(t))};_.Builder.prototype.addFieldFloat32=function(t,e,r){(this.force_defaults||e!=r)&&(this.addFloat32(e),this.slot(t))};_.Builder.prototype.addFieldFloat64=function(t,e,r){(this.force_defaults||e!=r)&&(this.addFloat64(e),this.slot(t))};_.Builder.prototype.addFieldOffset=function(t,e,r){(this.force_defaults||e!=r)&&(this.addOffset(e),this.slot(t))};_.Builder.prototype.addFieldStruct=function(t,e,r){e!=r&&(this.nested(e),this.slot(t))};_.Builder.prototype.nested=function(t){if(t!=this.offset())throw new Error("FlatBuffers: struct must be serialized inline.")};_.Builder.prototype.notNested=function(){if(this.isNested)throw new Error("FlatBuffers: object serialization must not be nested.")};_.Builder.prototype.slot=function(t){this.vtable[t]=this.offset()};_.Builder.prototype.offset=function(){return this.bb.capacity()-this.space};_.Builder.growByteBuffer=function(t){var e=t.capacity();if(e&3221225472)throw new Error("FlatBuffers: cannot grow buffer beyond 2 gigabytes.");var r=e<<1,n=_.ByteBuffer.allocate(r);return n.setPosition(r-e),n.bytes().set(t.bytes(),r-e),n};_.Builder.prototype.addOffset=function(t){this.prep(_.SIZEOF_INT,0),this.writeInt32(this.offset()-t+_.SIZEOF_INT)};_.Builder.prototype.startObject=function(t){this.notNested(),this.vtable==null&&(this.vtable=[]),this.vtable_in_use=t;for(var e=0;e<t;e++)this.vtable[e]=0;this.isNested=!0,this.object_start=this.offset()};_.Builder.prototype.endObject=function(){if(this.vtable==null||!this.isNested)throw new Error("FlatBuffers: endObject called without startObject");this.addInt32(0);for(var t=this.offset(),e=this.vtable_in_use-1;e>=0&&this.vtable[e]==0;e--);for(var r=e+1;e>=0;e--)this.addInt16(this.vtable[e]!=0?t-this.vtable[e]:0);var n=2;this.addInt16(t-this.object_start);var i=(r+n)*_.SIZEOF_SHORT;this.addInt16(i);var s=0,a=this.space;e:for(e=0;e<this.vtables.length;e++){var l=this.bb.capacity()-this.vtables[e];if(i==this.bb.readInt16(l)){for(var c=_.SIZEOF_SHORT;c<i;c+=_.SIZEOF_SHORT)if(this.bb.readInt16(a+c)!=this.bb.readInt16(l+c))continue e;s=this.vtables[e];break}}return s?(this.space=this.bb.capacity()-t,this.bb.writeInt32(this.space,s-t)):(this.vtables.push(this.offset()),this.bb.writeInt32(this.bb.capacity()-t,this.offset()-t)),this.isNested=!1,t};_.Builder.prototype.finish=function(t,e){if(e){var r=e;if(this.prep(this.minalign,_.SIZEOF_INT+_.FILE_IDENTIFIER_LENGTH),r.length!=_.FILE_IDENTIFIER_LENGTH)throw new Error("FlatBuffers: file identifier must be length "+_.FILE_IDENTIFIER_LENGTH);for(var n=_.FILE_IDENTIFIER_LENGTH-1;n>=0;n--)this.writeInt8(r.charCodeAt(n))}this.prep(this.minalign,_.SIZEOF_INT),this.addOffset(t),this.bb.setPosition(this.space)};_.Builder.prototype.requiredField=function(t,e){var r=this.bb.capacity()-t,n=r-this.bb.readInt32(r),i=this.bb.readInt16(n+e)!=0;if(!i)throw new Error("FlatBuffers: field "+e+" must be set")};_.Builder.prototype.startVector=function(t,e,r){this.notNested(),this.vector_num_elems=e,this.prep(_.SIZEOF_INT,t*e),this.prep(r,t*e)};_.Builder.prototype.endVector=function(){return this.writeInt32(this.vector_num_elems),this.offset()};_.Builder.prototype.createString=function(t){if(t instanceof Uint8Array)var e=t;else for(var e=[],r=0;r<t.length;){var n,i=t.charCodeAt(r++);if(i<55296||i>=56320)n=i;else{var s=t.charCodeAt(r++);n=(i<<10)+s+-56613888}n<128?e.push(n):(n<2048?e.push(n>>6&31|192):(n<65536?e.push(n>>12&15|224):e.push(n>>18&7|240,n>>12&63|128),e.push(n>>6&63|128)),e.push(n&63|128))}this.addInt8(0),this.startVector(1,e.length,1),this.bb.setPosition(this.space-=e.length);for(var r=0,a=this.space,l=this.bb.bytes();r<e.length;r++)l[a++]=e[r];return this.endVector()};_.Builder.prototype.createLong=function(t,e){return _.Long.create(t,e)};_.ByteBuffer=function(t){this.bytes_=t,this.position_=0};_.ByteBuffer.allocate=function(t){return new _.ByteBuffer(new Uint8Array(t))};_.ByteBuffer.prototype.clear=function(){this.position_=0};_.ByteBuffer.prototype.bytes=function(){return this.bytes_};_.ByteBuffer.prototype.position=function(){return this.position_};_.ByteBuffer.prototype.setPosition=function(t){this.position_=t};_.ByteBuffer.prototype.capacity=function(){return this.bytes_.length};_.ByteBuffer.prototype.readInt8=function(t){return this.readUint8(t)<<24>>24};_.ByteBuffer.prototype.readUint8=function(t){return this.bytes_[t]};_.ByteBuffer.prototype.readInt16=function(t){return this.readUint16(t)<<16>>16};_.ByteBuffer.prototype.readUint16=function(t){return this.bytes_[t]|this.bytes_[t+1]<<8};_.ByteBuffer.prototype.readInt32=function(t){return this.bytes_[t]|this.bytes_[t+1]<<8|this.bytes_[t+2]<<16|this.bytes_[t+3]<<24};_.ByteBuffer.prototype.readUint32=function(t){return this.readInt32(t)>>>0};_.ByteBuffer.prototype.readInt64=function(t){return new _.Long(this.readInt32(t),this.readInt32(t+4))};_.ByteBuffer.prototype.readUint64=function(t){return new _.Long(this.readUint32(t),this.readUint32(t+4))};_.ByteBuffer.prototype.readFloat32=function(t){return _.int32[0]=this.readInt32(t),_.float32[0]};_.ByteBuffer.prototype.readFloat64=function(t){return _.int32[_.isLittleEndian?0:1]=this.readInt32(t),_.int32[_.isLittleEndian?1:0]=this.readInt32(t+4),_.float64[0]};_.ByteBuffer.prototype.writeInt8=function(t,e){this.bytes_[t]=e};_.ByteBuffer.prototype.writeUint8=function(t,e){this.bytes_[t]=e};_.ByteBuffer.prototype.writeInt16=function(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8};_.ByteBuffer.prototype.writeUint16=function(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8};_.ByteBuffer.prototype.writeInt32=function(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8,this.bytes_[t+2]=e>>16,this.bytes_[t+3]=e>>24};_.ByteBuffer.prototype.writeUint32=function(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8,this.bytes_[t+2]=e>>16,this.bytes_[t+3]=e>>24};_.ByteBuffer.prototype.writeInt64=function(t,e){this.writeInt32(t,e.low),this.writeInt32(t+4,e.high)};_.ByteBuffer.prototype.writeUint64=function(t,e){this.writeUint32(t,e.low),this.writeUint32(t+4,e.high)};_.ByteBuffer.prototype.writeFloat32=function(t,e){_.float32[0]=e,this.writeInt32(t,_.int32[0])};_.ByteBuffer.prototype.writeFloat64=function(t,e){_.float64[0]=e,this.writeInt32(t,_.int32[_.isLittleEndian?0:1]),this.writeInt32(t+4,_.int32[_.isLittleEndian?1:0])};_.ByteBuffer.prototype.getBufferIdentifier=function(){if(this.bytes_.length<this.position_+_.SIZEOF_INT+_.FILE_IDENTIFIER_LENGTH)throw new Error("FlatBuffers: ByteBuffer is too short to contain an identifier.");for(var t="",e=0;e<_.FILE_IDENTIFIER_LENGTH;e++)t+=String.fromCharCode(this.readInt8(this.position_+_.SIZEOF_INT+e));return t};_.ByteBuffer.prototype.__offset=function(t,e){var r=t-this.readInt32(t);return e<this.readInt16(r)?this.readInt16(r+e):0};_.ByteBuffer.prototype.__union=function(t,e){return t.bb_pos=e+this.readInt32(e),t.bb=this,t};_.ByteBuffer.prototype.__string=function(t,e){t+=this.readInt32(t);var r=this.readInt32(t),n="",i=0;if(t+=_.SIZEOF_INT,e===_.Encoding.UTF8_BYTES)return this.bytes_.subarray(t,t+r);for(;i<r;){var s,a=this.readUint8(t+i++);if(a<192)s=a;else{var l=this.readUint8(t+i++);if(a<224)s=(a&31)<<6|l&63;else{var c=this.readUint8(t+i++);if(a<240)s=(a&15)<<12|(l&63)<<6|c&63;else{var o=this.readUint8(t+i++);s=(a&7)<<18|(l&63)<<12|(c&63)<<6|o&63}}}s<65536?n+=String.fromCharCode(s):(s-=65536,n+=String.fromCharCode((s>>10)+55296,(s&1023)+56320))}return n};_.ByteBuffer.prototype.__indirect=function(t){return t+this.readInt32(t)};_.ByteBuffer.prototype.__vector=function(t){return t+this.readInt32(t)+_.SIZEOF_INT};_.ByteBuffer.prototype.__vector_len=function(t){return this.readInt32(t+this.readInt32(t))};_.ByteBuffer.prototype.__has_identifier=function(t){if(t.length!=_.FILE_IDENTIFIER_LENGTH)throw new Error("FlatBuffers: file identifier must be length "+_.FILE_IDENTIFIER_LENGTH);for(var e=0;e<_.FILE_IDENTIFIER_LENGTH;e++)if(t.charCodeAt(e)!=this.readInt8(this.position_+_.SIZEOF_INT+e))return!1;return!0};_.ByteBuffer.prototype.createLong=function(t,e){return _.Long.create(t,e)};uS.flatbuffers=_});var cS=b(Pp=>{"use strict";function Hr(t,e,r){return e<=t&&t<=r}function rc(t){if(t===void 0)return{};if(t===Object(t))return t;throw TypeError("Could not convert argument to dictionary")}function VF(t){for(var e=String(t),r=e.length,n=0,i=[];n<r;){var s=e.charCodeAt(n);if(s<55296||s>57343)i.push(s);else if(56320<=s&&s<=57343)i.push(65533);else if(55296<=s&&s<=56319)if(n===r-1)i.push(65533);else{var a=t.charCodeAt(n+1);if(56320<=a&&a<=57343){var l=s&1023,c=a&1023;i.push(65536+(l<<10)+c),n+=1}else i.push(65533)}n+=1}return i}function NF(t){for(var e="",r=0;r<t.length;++r){var n=t[r];n<=65535?e+=String.fromCharCode(n):(n-=65536,e+=String.fromCharCode((n>>10)+55296,(n&1023)+56320))}return e}var Zu=-1;function Rp(t){this.tokens=[].slice.call(t)}Rp.prototype={endOfStream:function(){return!this.tokens.length},read:function(){return this.tokens.length?this.tokens.shift():Zu},prepend:function(t){if(Array.isArray(t))for(var e=t;e.length;)this.tokens.unshift(e.pop());else this.tokens.unshift(t)},push:function(t){if(Array.isArray(t))for(var e=t;e.length;)this.tokens.push(e.shift());else this.tokens.push(t)}};var ms=-1;function Cp(t,e){if(t)throw TypeError("Decoder error");return e||65533}var Xu="utf-8";function ec(t,e){if(!(this instanceof ec))return new ec(t,e);if(t=t!==void 0?String(t).toLowerCase():Xu,t!==Xu)throw new Error("Encoding not supported. Only utf-8 is supported");e=rc(e),this._streaming=!1,this._BOMseen=!1,this._decoder=null,this._fatal=!!e.fatal,this._ignoreBOM=!!e.ignoreBOM,Object.defineProperty(this,"encoding",{value:"utf-8"}),Object.defineProperty(this,"fatal",{value:this._fatal}),Object.defineProperty(this,"ignoreBOM",{value:this._ignoreBOM})}ec.prototype={decode:function(e,r){var n;typeof e=="object"&&e instanceof ArrayBuffer?n=new Uint8Array(e):typeof e=="object"&&"buffer"in e&&e.buffer instanceof ArrayBuffer?n=new Uint8Array(e.buffer,e.byteOffset,e.byteLength):n=new Uint8Array(0),r=rc(r),this._streaming||(this._decoder=new kF({fatal:this._fatal}),this._BOMseen=!1),this._streaming=!!r.stream;for(var i=new Rp(n),s=[],a;!i.endOfStream()&&(a=this._decoder.handler(i,i.read()),a!==ms);)a!==null&&(Array.isArray(a)?s.push.apply(s,a):s.push(a));if(!this._streaming){do{if(a=this._decoder.handler(i,i.read()),a===ms)break;a!==null&&(Array.isArray(a)?s.push.apply(s,a):s.push(a))}while(!i.endOfStream());this._decoder=null}return s.length&&["utf-8"].indexOf(this.encoding)!==-1&&!this._ignoreBOM&&!this._BOMseen&&(s[0]===65279?(this._BOMseen=!0,s.shift()):this._BOMseen=!0),NF(s)}};function tc(t,e){if(!(this instanceof tc))return new tc(t,e);if(t=t!==void 0?String(t).toLowerCase():Xu,t!==Xu)throw new Error("Encoding not supported. Only utf-8 is supported");e=rc(e),this._streaming=!1,this._encoder=null,this._options={fatal:!!e.fatal},Object.defineProperty(this,"encoding",{value:"utf-8"})}tc.prototype={encode:function(e,r){e=e?String(e):"",r=rc(r),this._streaming||(this._encoder=new LF(this._options)),this._streaming=!!r.stream;for(var n=[],i=new Rp(VF(e)),s;!i.endOfStream()&&(s=this._encoder.handler(i,i.read()),s!==ms);)Array.isArray(s)?n.push.apply(n,s):n.push(s);if(!this._streaming){for(;s=this._encoder.handler(i,i.read()),s!==ms;)Array.isArray(s)?n.push.apply(n,s):n.push(s);this._encoder=null}return new Uint8Array(n)}};function kF(t){var e=t.fatal,r=0,n=0,i=0,s=128,a=191;this.handler=function(l,c){if(c===Zu&&i!==0)return i=0,Cp(e);if(c===Zu)return ms;if(i===0){if(Hr(c,0,127))return c;if(Hr(c,194,223))i=1,r=c-192;else if(Hr(c,224,239))c===224&&(s=160),c===237&&(a=159),i=2,r=c-224;else if(Hr(c,240,244))c===240&&(s=144),c===244&&(a=143),i=3,r=c-240;else return Cp(e);return r=r<<6*i,null}if(!Hr(c,s,a))return r=i=n=0,s=128,a=191,l.prepend(c),Cp(e);if(s=128,a=191,n+=1,r+=c-128<<6*(i-n),n!==i)return null;var o=r;return r=i=n=0,o}}function LF(t){var e=t.fatal;this.handler=function(r,n){if(n===Zu)return ms;if(Hr(n,0,127))return n;var i,s;Hr(n,128,2047)?(i=1,s=192):Hr(n,2048,65535)?(i=2,s=224):Hr(n,65536,1114111)&&(i=3,s=240);for(var a=[(n>>6*i)+s];i>0;){var l=n>>6*(i-1);a.push(128|l&63),i-=1}return a}}Pp.TextEncoder=tc;Pp.TextDecoder=ec});var oi=b(ic=>{"use strict";Object.defineProperty(ic,"__esModule",{value:!0});var dS=Ve(),fS=cS(),nc=typeof Buffer=="function"?Buffer:null,hS=typeof TextDecoder=="function"&&typeof TextEncoder=="function";ic.decodeUtf8=(t=>{if(hS||!nc){let e=new t("utf-8");return r=>e.decode(r)}return e=>{let{buffer:r,byteOffset:n,length:i}=dS.toUint8Array(e);return nc.from(r,n,i).toString()}})(typeof TextDecoder<"u"?TextDecoder:fS.TextDecoder);ic.encodeUtf8=(t=>{if(hS||!nc){let e=new t;return r=>e.encode(r)}return(e="")=>dS.toUint8Array(nc.from(e,"utf8"))})(typeof TextEncoder<"u"?TextEncoder:fS.TextEncoder)});var gs=b(Tr=>{"use strict";Object.defineProperty(Tr,"__esModule",{value:!0});var pS=Jo();Tr.ITERATOR_DONE=Object.freeze({done:!0,value:void 0});var jp=class{constructor(e){this._json=e}get schema(){return this._json.schema}get batches(){return this._json.batches||[]}get dictionaries(){return this._json.dictionaries||[]}};Tr.ArrowJSON=jp;var sc=class{tee(){return this._getDOMStream().tee()}pipe(e,r){return this._getNodeStream().pipe(e,r)}pipeTo(e,r){return this._getDOMStream().pipeTo(e,r)}pipeThrough(e,r){return this._getDOMStream().pipeThrough(e,r)}_getDOMStream(){return this._DOMStream||(this._DOMStream=this.toDOMStream())}_getNodeStream(){return this._nodeStream||(this._nodeStream=this.toNodeStream())}};Tr.ReadableInterop=sc;var zp=class extends sc{constructor(){super(),this._values=[],this.resolvers=[],this._closedPromise=new Promise(e=>this._closedPromiseResolve=e)}get closed(){return this._closedPromise}async cancel(e){await this.return(e)}write(e){this._ensureOpen()&&(this.resolvers.length<=0?this._values.push(e):this.resolvers.shift().resolve({done:!1,value:e}))}abort(e){this._closedPromiseResolve&&(this.resolvers.length<=0?this._error={error:e}:this.resolvers.shift().reject({done:!0,value:e}))}close(){if(this._closedPromiseResolve){let{resolvers:e}=this;for(;e.length>0;)e.shift().resolve(Tr.ITERATOR_DONE);this._closedPromiseResolve(),this._closedPromiseResolve=void 0}}[Symbol.asyncIterator](){return this}toDOMStream(e){return pS.default.toDOMStream(this._closedPromiseResolve||this._error?this:this._values,e)}toNodeStream(e){return pS.default.toNodeStream(this._closedPromiseResolve||this._error?this:this._values,e)}async throw(e){return await this.abort(e),Tr.ITERATOR_DONE}async return(e){return await this.close(),Tr.ITERATOR_DONE}async read(e){return(await this.next(e,"read")).value}async peek(e){return(await this.next(e,"peek")).value}next(...e){return this._values.length>0?Promise.resolve({done:!1,value:this._values.shift()}):this._error?Promise.reject({done:!0,value:this._error.error}):this._closedPromiseResolve?new Promise((r,n)=>{this.resolvers.push({resolve:r,reject:n})}):Promise.resolve(Tr.ITERATOR_DONE)}_ensureOpen(){if(this._closedPromiseResolve)return!0;throw new Error(`${this} is closed`)}};Tr.AsyncQueue=zp});var st=b(Q=>{"use strict";Object.defineProperty(Q,"__esModule",{value:!0});var oc=gs(),[CF,RF]=(()=>{let t=()=>{throw new Error("BigInt is not available in this environment")};function e(){throw t()}return e.asIntN=()=>{throw t()},e.asUintN=()=>{throw t()},typeof BigInt<"u"?[BigInt,!0]:[e,!1]})();Q.BigInt=CF;Q.BigIntAvailable=RF;var[PF,jF]=(()=>{let t=()=>{throw new Error("BigInt64Array is not available in this environment")};class e{static get BYTES_PER_ELEMENT(){return 8}static of(){throw t()}static from(){throw t()}constructor(){throw t()}}return typeof BigInt64Array<"u"?[BigInt64Array,!0]:[e,!1]})();Q.BigInt64Array=PF;Q.BigInt64ArrayAvailable=jF;var[zF,qF]=(()=>{let t=()=>{throw new Error("BigUint64Array is not available in this environment")};class e{static get BYTES_PER_ELEMENT(){return 8}static of(){throw t()}static from(){throw t()}constructor(){throw t()}}return typeof BigUint64Array<"u"?[BigUint64Array,!0]:[e,!1]})();Q.BigUint64Array=zF;Q.BigUint64ArrayAvailable=qF;var qp=t=>typeof t=="number",yS=t=>typeof t=="boolean",Je=t=>typeof t=="function";Q.isObject=t=>t!=null&&Object(t)===t;Q.isPromise=t=>Q.isObject(t)&&Je(t.then);Q.isObservable=t=>Q.isObject(t)&&Je(t.subscribe);Q.isIterable=t=>Q.isObject(t)&&Je(t[Symbol.iterator]);Q.isAsyncIterable=t=>Q.isObject(t)&&Je(t[Symbol.asyncIterator]);Q.isArrowJSON=t=>Q.isObject(t)&&Q.isObject(t.schema);Q.isArrayLike=t=>Q.isObject(t)&&qp(t.length);Q.isIteratorResult=t=>Q.isObject(t)&&"done"in t&&"value"in t;Q.isUnderlyingSink=t=>Q.isObject(t)&&Je(t.abort)&&Je(t.close)&&Je(t.start)&&Je(t.write);Q.isFileHandle=t=>Q.isObject(t)&&Je(t.stat)&&qp(t.fd);Q.isFSReadStream=t=>Q.isReadableNodeStream(t)&&qp(t.bytesRead);Q.isFetchResponse=t=>Q.isObject(t)&&Q.isReadableDOMStream(t.body);Q.isWritableDOMStream=t=>Q.isObject(t)&&Je(t.abort)&&Je(t.getWriter)&&!(t instanceof oc.ReadableInterop);Q.isReadableDOMStream=t=>Q.isObject(t)&&Je(t.cancel)&&Je(t.getReader)&&!(t instanceof oc.ReadableInterop);Q.isWritableNodeStream=t=>Q.isObject(t)&&Je(t.end)&&Je(t.write)&&yS(t.writable)&&!(t instanceof oc.ReadableInterop);Q.isReadableNodeStream=t=>Q.isObject(t)&&Je(t.read)&&Je(t.pipe)&&yS(t.readable)&&!(t instanceof oc.ReadableInterop)});var Ve=b(G=>{"use strict";Object.defineProperty(G,"__esModule",{value:!0});var $F=ys(),WF=oi(),HF=$F.flatbuffers.ByteBuffer,ai=st(),Hp=typeof SharedArrayBuffer<"u"?SharedArrayBuffer:ArrayBuffer;function YF(t){let e=t[0]?[t[0]]:[],r,n,i,s;for(let a,l,c=0,o=0,u=t.length;++c<u;){if(a=e[o],l=t[c],!a||!l||a.buffer!==l.buffer||l.byteOffset<a.byteOffset){l&&(e[++o]=l);continue}if({byteOffset:r,byteLength:i}=a,{byteOffset:n,byteLength:s}=l,r+i<n||n+s<r){l&&(e[++o]=l);continue}e[o]=new Uint8Array(a.buffer,r,n-r+s)}return e}function $p(t,e,r=0,n=e.byteLength){let i=t.byteLength,s=new Uint8Array(t.buffer,t.byteOffset,i),a=new Uint8Array(e.buffer,e.byteOffset,Math.min(n,i));return s.set(a,r),t}G.memcpy=$p;function KF(t,e){let r=YF(t),n=r.reduce((u,d)=>u+d.byteLength,0),i,s,a,l=0,c=-1,o=Math.min(e||1/0,n);for(let u=r.length;++c<u;){if(i=r[c],s=i.subarray(0,Math.min(i.length,o-l)),o<=l+s.length){s.length<i.length?r[c]=i.subarray(s.length):s.length===i.length&&c++,a?$p(a,s,l):a=s;break}$p(a||(a=new Uint8Array(o)),s,l),l+=s.length}return[a||new Uint8Array(0),r.slice(c),n-(a?a.byteLength:0)]}G.joinUint8Arrays=KF;function ct(t,e){let r=ai.isIteratorResult(e)?e.value:e;return r instanceof t?t===Uint8Array?new t(r.buffer,r.byteOffset,r.byteLength):r:r?(typeof r=="string"&&(r=WF.encodeUtf8(r)),r instanceof ArrayBuffer?new t(r):r instanceof Hp?new t(r):r instanceof HF?ct(t,r.bytes()):ArrayBuffer.isView(r)?r.byteLength<=0?new t(0):new t(r.buffer,r.byteOffset,r.byteLength/t.BYTES_PER_ELEMENT):t.from(r)):new t(0)}G.toArrayBufferView=ct;G.toInt8Array=t=>ct(Int8Array,t);G.toInt16Array=t=>ct(Int16Array,t);G.toInt32Array=t=>ct(Int32Array,t);G.toBigInt64Array=t=>ct(ai.BigInt64Array,t);G.toUint8Array=t=>ct(Uint8Array,t);G.toUint16Array=t=>ct(Uint16Array,t);G.toUint32Array=t=>ct(Uint32Array,t);G.toBigUint64Array=t=>ct(ai.BigUint64Array,t);G.toFloat32Array=t=>ct(Float32Array,t);G.toFloat64Array=t=>ct(Float64Array,t);G.toUint8ClampedArray=t=>ct(Uint8ClampedArray,t);var Wp=t=>(t.next(),t);function*Br(t,e){let r=function*(i){yield i},n=typeof e=="string"||ArrayBuffer.isView(e)||e instanceof ArrayBuffer||e instanceof Hp?r(e):ai.isIterable(e)?e:r(e);yield*Wp(function*(i){let s=null;do s=i.next(yield ct(t,s));while(!s.done)}(n[Symbol.iterator]()))}G.toArrayBufferViewIterator=Br;G.toInt8ArrayIterator=t=>Br(Int8Array,t);G.toInt16ArrayIterator=t=>Br(Int16Array,t);G.toInt32ArrayIterator=t=>Br(Int32Array,t);G.toUint8ArrayIterator=t=>Br(Uint8Array,t);G.toUint16ArrayIterator=t=>Br(Uint16Array,t);G.toUint32ArrayIterator=t=>Br(Uint32Array,t);G.toFloat32ArrayIterator=t=>Br(Float32Array,t);G.toFloat64ArrayIterator=t=>Br(Float64Array,t);G.toUint8ClampedArrayIterator=t=>Br(Uint8ClampedArray,t);async function*nr(t,e){if(ai.isPromise(e))return yield*nr(t,await e);let r=async function*(s){yield await s},n=async function*(s){yield*Wp(function*(a){let l=null;do l=a.next(yield l&&l.value);while(!l.done)}(s[Symbol.iterator]()))},i=typeof e=="string"||ArrayBuffer.isView(e)||e instanceof ArrayBuffer||e instanceof Hp?r(e):ai.isIterable(e)?n(e):ai.isAsyncIterable(e)?e:r(e);yield*Wp(async function*(s){let a=null;do a=await s.next(yield ct(t,a));while(!a.done)}(i[Symbol.asyncIterator]()))}G.toArrayBufferViewAsyncIterator=nr;G.toInt8ArrayAsyncIterator=t=>nr(Int8Array,t);G.toInt16ArrayAsyncIterator=t=>nr(Int16Array,t);G.toInt32ArrayAsyncIterator=t=>nr(Int32Array,t);G.toUint8ArrayAsyncIterator=t=>nr(Uint8Array,t);G.toUint16ArrayAsyncIterator=t=>nr(Uint16Array,t);G.toUint32ArrayAsyncIterator=t=>nr(Uint32Array,t);G.toFloat32ArrayAsyncIterator=t=>nr(Float32Array,t);G.toFloat64ArrayAsyncIterator=t=>nr(Float64Array,t);G.toUint8ClampedArrayAsyncIterator=t=>nr(Uint8ClampedArray,t);function QF(t,e,r){if(t!==0){r=r.slice(0,e+1);for(let n=-1;++n<=e;)r[n]+=t}return r}G.rebaseValueOffsets=QF;function JF(t,e){let r=0,n=t.length;if(n!==e.length)return!1;if(n>0)do if(t[r]!==e[r])return!1;while(++r<n);return!0}G.compareArrayLike=JF});var Jo=b(Qp=>{"use strict";Object.defineProperty(Qp,"__esModule",{value:!0});var dt=Ve();Qp.default={fromIterable(t){return ac(GF(t))},fromAsyncIterable(t){return ac(ZF(t))},fromDOMStream(t){return ac(XF(t))},fromNodeStream(t){return ac(eO(t))},toDOMStream(t,e){throw new Error('"toDOMStream" not available in this environment')},toNodeStream(t,e){throw new Error('"toNodeStream" not available in this environment')}};var ac=t=>(t.next(),t);function*GF(t){let e,r=!1,n=[],i,s,a,l=0;function c(){return s==="peek"?dt.joinUint8Arrays(n,a)[0]:([i,n,l]=dt.joinUint8Arrays(n,a),i)}({cmd:s,size:a}=yield null);let o=dt.toUint8ArrayIterator(t)[Symbol.iterator]();try{do if({done:e,value:i}=isNaN(a-l)?o.next(void 0):o.next(a-l),!e&&i.byteLength>0&&(n.push(i),l+=i.byteLength),e||a<=l)do({cmd:s,size:a}=yield c());while(a<l);while(!e)}catch(u){(r=!0)&&typeof o.throw=="function"&&o.throw(u)}finally{r===!1&&typeof o.return=="function"&&o.return()}}async function*ZF(t){let e,r=!1,n=[],i,s,a,l=0;function c(){return s==="peek"?dt.joinUint8Arrays(n,a)[0]:([i,n,l]=dt.joinUint8Arrays(n,a),i)}({cmd:s,size:a}=yield null);let o=dt.toUint8ArrayAsyncIterator(t)[Symbol.asyncIterator]();try{do if({done:e,value:i}=isNaN(a-l)?await o.next(void 0):await o.next(a-l),!e&&i.byteLength>0&&(n.push(i),l+=i.byteLength),e||a<=l)do({cmd:s,size:a}=yield c());while(a<l);while(!e)}catch(u){(r=!0)&&typeof o.throw=="function"&&await o.throw(u)}finally{r===!1&&typeof o.return=="function"&&await o.return()}}async function*XF(t){let e=!1,r=!1,n=[],i,s,a,l=0;function c(){return s==="peek"?dt.joinUint8Arrays(n,a)[0]:([i,n,l]=dt.joinUint8Arrays(n,a),i)}({cmd:s,size:a}=yield null);let o=new Kp(t);try{do if({done:e,value:i}=isNaN(a-l)?await o.read(void 0):await o.read(a-l),!e&&i.byteLength>0&&(n.push(dt.toUint8Array(i)),l+=i.byteLength),e||a<=l)do({cmd:s,size:a}=yield c());while(a<l);while(!e)}catch(u){(r=!0)&&await o.cancel(u)}finally{r===!1?await o.cancel():t.locked&&o.releaseLock()}}var Kp=class{constructor(e){this.source=e,this.byobReader=null,this.defaultReader=null;try{this.supportsBYOB=!!(this.reader=this.getBYOBReader())}catch{this.supportsBYOB=!(this.reader=this.getDefaultReader())}}get closed(){return this.reader?this.reader.closed.catch(()=>{}):Promise.resolve()}releaseLock(){this.reader&&this.reader.releaseLock(),this.reader=this.byobReader=this.defaultReader=null}async cancel(e){let{reader:r,source:n}=this;r&&await r.cancel(e).catch(()=>{}),n&&n.locked&&this.releaseLock()}async read(e){if(e===0)return{done:this.reader==null,value:new Uint8Array(0)};let r=!this.supportsBYOB||typeof e!="number"?await this.getDefaultReader().read():await this.readFromBYOBReader(e);return!r.done&&(r.value=dt.toUint8Array(r)),r}getDefaultReader(){return this.byobReader&&this.releaseLock(),this.defaultReader||(this.defaultReader=this.source.getReader(),this.defaultReader.closed.catch(()=>{})),this.reader=this.defaultReader}getBYOBReader(){return this.defaultReader&&this.releaseLock(),this.byobReader||(this.byobReader=this.source.getReader({mode:"byob"}),this.byobReader.closed.catch(()=>{})),this.reader=this.byobReader}async readFromBYOBReader(e){return await mS(this.getBYOBReader(),new ArrayBuffer(e),0,e)}};async function mS(t,e,r,n){if(r>=n)return{done:!1,value:new Uint8Array(e,0,n)};let{done:i,value:s}=await t.read(new Uint8Array(e,r,n-r));return(r+=s.byteLength)<n&&!i?await mS(t,s.buffer,r,n):{done:i,value:new Uint8Array(s.buffer,0,r)}}var Yp=(t,e)=>{let r=i=>n([e,i]),n;return[e,r,new Promise(i=>(n=i)&&t.once(e,r))]};async function*eO(t){let e=[],r="error",n=!1,i=null,s,a,l=0,c=[],o;function u(){return s==="peek"?dt.joinUint8Arrays(c,a)[0]:([o,c,l]=dt.joinUint8Arrays(c,a),o)}if({cmd:s,size:a}=yield null,t.isTTY)return yield new Uint8Array(0);try{e[0]=Yp(t,"end"),e[1]=Yp(t,"error");do{if(e[2]=Yp(t,"readable"),[r,i]=await Promise.race(e.map(v=>v[2])),r==="error")break;if((n=r==="end")||(isFinite(a-l)?(o=dt.toUint8Array(t.read(a-l)),o.byteLength<a-l&&(o=dt.toUint8Array(t.read(void 0)))):o=dt.toUint8Array(t.read(void 0)),o.byteLength>0&&(c.push(o),l+=o.byteLength)),n||a<=l)do({cmd:s,size:a}=yield u());while(a<l)}while(!n)}finally{await d(e,r==="error"?i:null)}function d(v,T){return o=c=null,new Promise(async(I,D)=>{for(let[ne,g]of v)t.off(ne,g);try{let ne=t.destroy;ne&&ne.call(t,T),T=void 0}catch(ne){T=ne||T}finally{T!=null?D(T):I()}})}}});var xe=b(uc=>{"use strict";Object.defineProperty(uc,"__esModule",{value:!0});var lc=class{};uc.AbstractVector=lc;uc.Vector=lc});var vs=b(F=>{"use strict";Object.defineProperty(F,"__esModule",{value:!0});var te;(function(t){var e;(function(r){var n;(function(i){var s;(function(a){let l;(function(c){c[c.V1=0]="V1",c[c.V2=1]="V2",c[c.V3=2]="V3",c[c.V4=3]="V4"})(l=a.MetadataVersion||(a.MetadataVersion={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){let l;(function(c){c[c.Sparse=0]="Sparse",c[c.Dense=1]="Dense"})(l=a.UnionMode||(a.UnionMode={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){let l;(function(c){c[c.HALF=0]="HALF",c[c.SINGLE=1]="SINGLE",c[c.DOUBLE=2]="DOUBLE"})(l=a.Precision||(a.Precision={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){let l;(function(c){c[c.DAY=0]="DAY",c[c.MILLISECOND=1]="MILLISECOND"})(l=a.DateUnit||(a.DateUnit={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){let l;(function(c){c[c.SECOND=0]="SECOND",c[c.MILLISECOND=1]="MILLISECOND",c[c.MICROSECOND=2]="MICROSECOND",c[c.NANOSECOND=3]="NANOSECOND"})(l=a.TimeUnit||(a.TimeUnit={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){let l;(function(c){c[c.YEAR_MONTH=0]="YEAR_MONTH",c[c.DAY_TIME=1]="DAY_TIME"})(l=a.IntervalUnit||(a.IntervalUnit={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){let l;(function(c){c[c.NONE=0]="NONE",c[c.Null=1]="Null",c[c.Int=2]="Int",c[c.FloatingPoint=3]="FloatingPoint",c[c.Binary=4]="Binary",c[c.Utf8=5]="Utf8",c[c.Bool=6]="Bool",c[c.Decimal=7]="Decimal",c[c.Date=8]="Date",c[c.Time=9]="Time",c[c.Timestamp=10]="Timestamp",c[c.Interval=11]="Interval",c[c.List=12]="List",c[c.Struct_=13]="Struct_",c[c.Union=14]="Union",c[c.FixedSizeBinary=15]="FixedSizeBinary",c[c.FixedSizeList=16]="FixedSizeList",c[c.Map=17]="Map",c[c.Duration=18]="Duration",c[c.LargeBinary=19]="LargeBinary",c[c.LargeUtf8=20]="LargeUtf8",c[c.LargeList=21]="LargeList"})(l=a.Type||(a.Type={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){let l;(function(c){c[c.Little=0]="Little",c[c.Big=1]="Big"})(l=a.Endianness||(a.Endianness={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsNull(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startNull(o){o.startObject(0)}static endNull(o){return o.endObject()}static createNull(o){return l.startNull(o),l.endNull(o)}}a.Null=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsStruct_(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startStruct_(o){o.startObject(0)}static endStruct_(o){return o.endObject()}static createStruct_(o){return l.startStruct_(o),l.endStruct_(o)}}a.Struct_=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsList(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startList(o){o.startObject(0)}static endList(o){return o.endObject()}static createList(o){return l.startList(o),l.endList(o)}}a.List=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsLargeList(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startLargeList(o){o.startObject(0)}static endLargeList(o){return o.endObject()}static createLargeList(o){return l.startLargeList(o),l.endLargeList(o)}}a.LargeList=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsFixedSizeList(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}listSize(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt32(this.bb_pos+o):0}static startFixedSizeList(o){o.startObject(1)}static addListSize(o,u){o.addFieldInt32(0,u,0)}static endFixedSizeList(o){return o.endObject()}static createFixedSizeList(o,u){return l.startFixedSizeList(o),l.addListSize(o,u),l.endFixedSizeList(o)}}a.FixedSizeList=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsMap(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}keysSorted(){let o=this.bb.__offset(this.bb_pos,4);return o?!!this.bb.readInt8(this.bb_pos+o):!1}static startMap(o){o.startObject(1)}static addKeysSorted(o,u){o.addFieldInt8(0,+u,0)}static endMap(o){return o.endObject()}static createMap(o,u){return l.startMap(o),l.addKeysSorted(o,u),l.endMap(o)}}a.Map=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsUnion(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}mode(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):t.apache.arrow.flatbuf.UnionMode.Sparse}typeIds(o){let u=this.bb.__offset(this.bb_pos,6);return u?this.bb.readInt32(this.bb.__vector(this.bb_pos+u)+o*4):0}typeIdsLength(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.__vector_len(this.bb_pos+o):0}typeIdsArray(){let o=this.bb.__offset(this.bb_pos,6);return o?new Int32Array(this.bb.bytes().buffer,this.bb.bytes().byteOffset+this.bb.__vector(this.bb_pos+o),this.bb.__vector_len(this.bb_pos+o)):null}static startUnion(o){o.startObject(2)}static addMode(o,u){o.addFieldInt16(0,u,t.apache.arrow.flatbuf.UnionMode.Sparse)}static addTypeIds(o,u){o.addFieldOffset(1,u,0)}static createTypeIdsVector(o,u){o.startVector(4,u.length,4);for(let d=u.length-1;d>=0;d--)o.addInt32(u[d]);return o.endVector()}static startTypeIdsVector(o,u){o.startVector(4,u,4)}static endUnion(o){return o.endObject()}static createUnion(o,u,d){return l.startUnion(o),l.addMode(o,u),l.addTypeIds(o,d),l.endUnion(o)}}a.Union=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsInt(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}bitWidth(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt32(this.bb_pos+o):0}isSigned(){let o=this.bb.__offset(this.bb_pos,6);return o?!!this.bb.readInt8(this.bb_pos+o):!1}static startInt(o){o.startObject(2)}static addBitWidth(o,u){o.addFieldInt32(0,u,0)}static addIsSigned(o,u){o.addFieldInt8(1,+u,0)}static endInt(o){return o.endObject()}static createInt(o,u,d){return l.startInt(o),l.addBitWidth(o,u),l.addIsSigned(o,d),l.endInt(o)}}a.Int=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsFloatingPoint(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}precision(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):t.apache.arrow.flatbuf.Precision.HALF}static startFloatingPoint(o){o.startObject(1)}static addPrecision(o,u){o.addFieldInt16(0,u,t.apache.arrow.flatbuf.Precision.HALF)}static endFloatingPoint(o){return o.endObject()}static createFloatingPoint(o,u){return l.startFloatingPoint(o),l.addPrecision(o,u),l.endFloatingPoint(o)}}a.FloatingPoint=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsUtf8(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startUtf8(o){o.startObject(0)}static endUtf8(o){return o.endObject()}static createUtf8(o){return l.startUtf8(o),l.endUtf8(o)}}a.Utf8=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsBinary(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startBinary(o){o.startObject(0)}static endBinary(o){return o.endObject()}static createBinary(o){return l.startBinary(o),l.endBinary(o)}}a.Binary=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsLargeUtf8(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startLargeUtf8(o){o.startObject(0)}static endLargeUtf8(o){return o.endObject()}static createLargeUtf8(o){return l.startLargeUtf8(o),l.endLargeUtf8(o)}}a.LargeUtf8=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsLargeBinary(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startLargeBinary(o){o.startObject(0)}static endLargeBinary(o){return o.endObject()}static createLargeBinary(o){return l.startLargeBinary(o),l.endLargeBinary(o)}}a.LargeBinary=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsFixedSizeBinary(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}byteWidth(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt32(this.bb_pos+o):0}static startFixedSizeBinary(o){o.startObject(1)}static addByteWidth(o,u){o.addFieldInt32(0,u,0)}static endFixedSizeBinary(o){return o.endObject()}static createFixedSizeBinary(o,u){return l.startFixedSizeBinary(o),l.addByteWidth(o,u),l.endFixedSizeBinary(o)}}a.FixedSizeBinary=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsBool(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startBool(o){o.startObject(0)}static endBool(o){return o.endObject()}static createBool(o){return l.startBool(o),l.endBool(o)}}a.Bool=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsDecimal(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}precision(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt32(this.bb_pos+o):0}scale(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.readInt32(this.bb_pos+o):0}static startDecimal(o){o.startObject(2)}static addPrecision(o,u){o.addFieldInt32(0,u,0)}static addScale(o,u){o.addFieldInt32(1,u,0)}static endDecimal(o){return o.endObject()}static createDecimal(o,u,d){return l.startDecimal(o),l.addPrecision(o,u),l.addScale(o,d),l.endDecimal(o)}}a.Decimal=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsDate(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}unit(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):t.apache.arrow.flatbuf.DateUnit.MILLISECOND}static startDate(o){o.startObject(1)}static addUnit(o,u){o.addFieldInt16(0,u,t.apache.arrow.flatbuf.DateUnit.MILLISECOND)}static endDate(o){return o.endObject()}static createDate(o,u){return l.startDate(o),l.addUnit(o,u),l.endDate(o)}}a.Date=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsTime(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}unit(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):t.apache.arrow.flatbuf.TimeUnit.MILLISECOND}bitWidth(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.readInt32(this.bb_pos+o):32}static startTime(o){o.startObject(2)}static addUnit(o,u){o.addFieldInt16(0,u,t.apache.arrow.flatbuf.TimeUnit.MILLISECOND)}static addBitWidth(o,u){o.addFieldInt32(1,u,32)}static endTime(o){return o.endObject()}static createTime(o,u,d){return l.startTime(o),l.addUnit(o,u),l.addBitWidth(o,d),l.endTime(o)}}a.Time=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsTimestamp(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}unit(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):t.apache.arrow.flatbuf.TimeUnit.SECOND}timezone(o){let u=this.bb.__offset(this.bb_pos,6);return u?this.bb.__string(this.bb_pos+u,o):null}static startTimestamp(o){o.startObject(2)}static addUnit(o,u){o.addFieldInt16(0,u,t.apache.arrow.flatbuf.TimeUnit.SECOND)}static addTimezone(o,u){o.addFieldOffset(1,u,0)}static endTimestamp(o){return o.endObject()}static createTimestamp(o,u,d){return l.startTimestamp(o),l.addUnit(o,u),l.addTimezone(o,d),l.endTimestamp(o)}}a.Timestamp=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsInterval(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}unit(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):t.apache.arrow.flatbuf.IntervalUnit.YEAR_MONTH}static startInterval(o){o.startObject(1)}static addUnit(o,u){o.addFieldInt16(0,u,t.apache.arrow.flatbuf.IntervalUnit.YEAR_MONTH)}static endInterval(o){return o.endObject()}static createInterval(o,u){return l.startInterval(o),l.addUnit(o,u),l.endInterval(o)}}a.Interval=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsDuration(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}unit(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):t.apache.arrow.flatbuf.TimeUnit.MILLISECOND}static startDuration(o){o.startObject(1)}static addUnit(o,u){o.addFieldInt16(0,u,t.apache.arrow.flatbuf.TimeUnit.MILLISECOND)}static endDuration(o){return o.endObject()}static createDuration(o,u){return l.startDuration(o),l.addUnit(o,u),l.endDuration(o)}}a.Duration=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsKeyValue(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}key(o){let u=this.bb.__offset(this.bb_pos,4);return u?this.bb.__string(this.bb_pos+u,o):null}value(o){let u=this.bb.__offset(this.bb_pos,6);return u?this.bb.__string(this.bb_pos+u,o):null}static startKeyValue(o){o.startObject(2)}static addKey(o,u){o.addFieldOffset(0,u,0)}static addValue(o,u){o.addFieldOffset(1,u,0)}static endKeyValue(o){return o.endObject()}static createKeyValue(o,u,d){return l.startKeyValue(o),l.addKey(o,u),l.addValue(o,d),l.endKeyValue(o)}}a.KeyValue=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsDictionaryEncoding(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}id(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt64(this.bb_pos+o):this.bb.createLong(0,0)}indexType(o){let u=this.bb.__offset(this.bb_pos,6);return u?(o||new t.apache.arrow.flatbuf.Int).__init(this.bb.__indirect(this.bb_pos+u),this.bb):null}isOrdered(){let o=this.bb.__offset(this.bb_pos,8);return o?!!this.bb.readInt8(this.bb_pos+o):!1}static startDictionaryEncoding(o){o.startObject(3)}static addId(o,u){o.addFieldInt64(0,u,o.createLong(0,0))}static addIndexType(o,u){o.addFieldOffset(1,u,0)}static addIsOrdered(o,u){o.addFieldInt8(2,+u,0)}static endDictionaryEncoding(o){return o.endObject()}static createDictionaryEncoding(o,u,d,v){return l.startDictionaryEncoding(o),l.addId(o,u),l.addIndexType(o,d),l.addIsOrdered(o,v),l.endDictionaryEncoding(o)}}a.DictionaryEncoding=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsField(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}name(o){let u=this.bb.__offset(this.bb_pos,4);return u?this.bb.__string(this.bb_pos+u,o):null}nullable(){let o=this.bb.__offset(this.bb_pos,6);return o?!!this.bb.readInt8(this.bb_pos+o):!1}typeType(){let o=this.bb.__offset(this.bb_pos,8);return o?this.bb.readUint8(this.bb_pos+o):t.apache.arrow.flatbuf.Type.NONE}type(o){let u=this.bb.__offset(this.bb_pos,10);return u?this.bb.__union(o,this.bb_pos+u):null}dictionary(o){let u=this.bb.__offset(this.bb_pos,12);return u?(o||new t.apache.arrow.flatbuf.DictionaryEncoding).__init(this.bb.__indirect(this.bb_pos+u),this.bb):null}children(o,u){let d=this.bb.__offset(this.bb_pos,14);return d?(u||new t.apache.arrow.flatbuf.Field).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+d)+o*4),this.bb):null}childrenLength(){let o=this.bb.__offset(this.bb_pos,14);return o?this.bb.__vector_len(this.bb_pos+o):0}customMetadata(o,u){let d=this.bb.__offset(this.bb_pos,16);return d?(u||new t.apache.arrow.flatbuf.KeyValue).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+d)+o*4),this.bb):null}customMetadataLength(){let o=this.bb.__offset(this.bb_pos,16);return o?this.bb.__vector_len(this.bb_pos+o):0}static startField(o){o.startObject(7)}static addName(o,u){o.addFieldOffset(0,u,0)}static addNullable(o,u){o.addFieldInt8(1,+u,0)}static addTypeType(o,u){o.addFieldInt8(2,u,t.apache.arrow.flatbuf.Type.NONE)}static addType(o,u){o.addFieldOffset(3,u,0)}static addDictionary(o,u){o.addFieldOffset(4,u,0)}static addChildren(o,u){o.addFieldOffset(5,u,0)}static createChildrenVector(o,u){o.startVector(4,u.length,4);for(let d=u.length-1;d>=0;d--)o.addOffset(u[d]);return o.endVector()}static startChildrenVector(o,u){o.startVector(4,u,4)}static addCustomMetadata(o,u){o.addFieldOffset(6,u,0)}static createCustomMetadataVector(o,u){o.startVector(4,u.length,4);for(let d=u.length-1;d>=0;d--)o.addOffset(u[d]);return o.endVector()}static startCustomMetadataVector(o,u){o.startVector(4,u,4)}static endField(o){return o.endObject()}static createField(o,u,d,v,T,I,D,ne){return l.startField(o),l.addName(o,u),l.addNullable(o,d),l.addTypeType(o,v),l.addType(o,T),l.addDictionary(o,I),l.addChildren(o,D),l.addCustomMetadata(o,ne),l.endField(o)}}a.Field=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}offset(){return this.bb.readInt64(this.bb_pos)}length(){return this.bb.readInt64(this.bb_pos+8)}static createBuffer(o,u,d){return o.prep(8,16),o.writeInt64(d),o.writeInt64(u),o.offset()}}a.Buffer=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsSchema(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}endianness(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):t.apache.arrow.flatbuf.Endianness.Little}fields(o,u){let d=this.bb.__offset(this.bb_pos,6);return d?(u||new t.apache.arrow.flatbuf.Field).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+d)+o*4),this.bb):null}fieldsLength(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.__vector_len(this.bb_pos+o):0}customMetadata(o,u){let d=this.bb.__offset(this.bb_pos,8);return d?(u||new t.apache.arrow.flatbuf.KeyValue).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+d)+o*4),this.bb):null}customMetadataLength(){let o=this.bb.__offset(this.bb_pos,8);return o?this.bb.__vector_len(this.bb_pos+o):0}static startSchema(o){o.startObject(3)}static addEndianness(o,u){o.addFieldInt16(0,u,t.apache.arrow.flatbuf.Endianness.Little)}static addFields(o,u){o.addFieldOffset(1,u,0)}static createFieldsVector(o,u){o.startVector(4,u.length,4);for(let d=u.length-1;d>=0;d--)o.addOffset(u[d]);return o.endVector()}static startFieldsVector(o,u){o.startVector(4,u,4)}static addCustomMetadata(o,u){o.addFieldOffset(2,u,0)}static createCustomMetadataVector(o,u){o.startVector(4,u.length,4);for(let d=u.length-1;d>=0;d--)o.addOffset(u[d]);return o.endVector()}static startCustomMetadataVector(o,u){o.startVector(4,u,4)}static endSchema(o){return o.endObject()}static finishSchemaBuffer(o,u){o.finish(u)}static createSchema(o,u,d,v){return l.startSchema(o),l.addEndianness(o,u),l.addFields(o,d),l.addCustomMetadata(o,v),l.endSchema(o)}}a.Schema=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(te=F.org||(F.org={}))});var Jp=b(vt=>{"use strict";Object.defineProperty(vt,"__esModule",{value:!0});var Go=vs(),_s;(function(t){var e;(function(r){var n;(function(i){var s;(function(a){a.Schema=Go.org.apache.arrow.flatbuf.Schema})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(_s=vt.org||(vt.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){let l;(function(c){c[c.NONE=0]="NONE",c[c.Schema=1]="Schema",c[c.DictionaryBatch=2]="DictionaryBatch",c[c.RecordBatch=3]="RecordBatch",c[c.Tensor=4]="Tensor",c[c.SparseTensor=5]="SparseTensor"})(l=a.MessageHeader||(a.MessageHeader={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(_s=vt.org||(vt.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}length(){return this.bb.readInt64(this.bb_pos)}nullCount(){return this.bb.readInt64(this.bb_pos+8)}static createFieldNode(o,u,d){return o.prep(8,16),o.writeInt64(d),o.writeInt64(u),o.offset()}}a.FieldNode=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(_s=vt.org||(vt.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsRecordBatch(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}length(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt64(this.bb_pos+o):this.bb.createLong(0,0)}nodes(o,u){let d=this.bb.__offset(this.bb_pos,6);return d?(u||new t.apache.arrow.flatbuf.FieldNode).__init(this.bb.__vector(this.bb_pos+d)+o*16,this.bb):null}nodesLength(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.__vector_len(this.bb_pos+o):0}buffers(o,u){let d=this.bb.__offset(this.bb_pos,8);return d?(u||new Go.org.apache.arrow.flatbuf.Buffer).__init(this.bb.__vector(this.bb_pos+d)+o*16,this.bb):null}buffersLength(){let o=this.bb.__offset(this.bb_pos,8);return o?this.bb.__vector_len(this.bb_pos+o):0}static startRecordBatch(o){o.startObject(3)}static addLength(o,u){o.addFieldInt64(0,u,o.createLong(0,0))}static addNodes(o,u){o.addFieldOffset(1,u,0)}static startNodesVector(o,u){o.startVector(16,u,8)}static addBuffers(o,u){o.addFieldOffset(2,u,0)}static startBuffersVector(o,u){o.startVector(16,u,8)}static endRecordBatch(o){return o.endObject()}static createRecordBatch(o,u,d,v){return l.startRecordBatch(o),l.addLength(o,u),l.addNodes(o,d),l.addBuffers(o,v),l.endRecordBatch(o)}}a.RecordBatch=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(_s=vt.org||(vt.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsDictionaryBatch(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}id(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt64(this.bb_pos+o):this.bb.createLong(0,0)}data(o){let u=this.bb.__offset(this.bb_pos,6);return u?(o||new t.apache.arrow.flatbuf.RecordBatch).__init(this.bb.__indirect(this.bb_pos+u),this.bb):null}isDelta(){let o=this.bb.__offset(this.bb_pos,8);return o?!!this.bb.readInt8(this.bb_pos+o):!1}static startDictionaryBatch(o){o.startObject(3)}static addId(o,u){o.addFieldInt64(0,u,o.createLong(0,0))}static addData(o,u){o.addFieldOffset(1,u,0)}static addIsDelta(o,u){o.addFieldInt8(2,+u,0)}static endDictionaryBatch(o){return o.endObject()}static createDictionaryBatch(o,u,d,v){return l.startDictionaryBatch(o),l.addId(o,u),l.addData(o,d),l.addIsDelta(o,v),l.endDictionaryBatch(o)}}a.DictionaryBatch=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(_s=vt.org||(vt.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsMessage(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}version(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):Go.org.apache.arrow.flatbuf.MetadataVersion.V1}headerType(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.readUint8(this.bb_pos+o):t.apache.arrow.flatbuf.MessageHeader.NONE}header(o){let u=this.bb.__offset(this.bb_pos,8);return u?this.bb.__union(o,this.bb_pos+u):null}bodyLength(){let o=this.bb.__offset(this.bb_pos,10);return o?this.bb.readInt64(this.bb_pos+o):this.bb.createLong(0,0)}customMetadata(o,u){let d=this.bb.__offset(this.bb_pos,12);return d?(u||new Go.org.apache.arrow.flatbuf.KeyValue).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+d)+o*4),this.bb):null}customMetadataLength(){let o=this.bb.__offset(this.bb_pos,12);return o?this.bb.__vector_len(this.bb_pos+o):0}static startMessage(o){o.startObject(5)}static addVersion(o,u){o.addFieldInt16(0,u,Go.org.apache.arrow.flatbuf.MetadataVersion.V1)}static addHeaderType(o,u){o.addFieldInt8(1,u,t.apache.arrow.flatbuf.MessageHeader.NONE)}static addHeader(o,u){o.addFieldOffset(2,u,0)}static addBodyLength(o,u){o.addFieldInt64(3,u,o.createLong(0,0))}static addCustomMetadata(o,u){o.addFieldOffset(4,u,0)}static createCustomMetadataVector(o,u){o.startVector(4,u.length,4);for(let d=u.length-1;d>=0;d--)o.addOffset(u[d]);return o.endVector()}static startCustomMetadataVector(o,u){o.startVector(4,u,4)}static endMessage(o){return o.endObject()}static finishMessageBuffer(o,u){o.finish(u)}static createMessage(o,u,d,v,T,I){return l.startMessage(o),l.addVersion(o,u),l.addHeaderType(o,d),l.addHeader(o,v),l.addBodyLength(o,T),l.addCustomMetadata(o,I),l.endMessage(o)}}a.Message=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(_s=vt.org||(vt.org={}))});var de=b(_t=>{"use strict";Object.defineProperty(_t,"__esModule",{value:!0});var li=vs(),tO=Jp();_t.ArrowType=li.org.apache.arrow.flatbuf.Type;_t.DateUnit=li.org.apache.arrow.flatbuf.DateUnit;_t.TimeUnit=li.org.apache.arrow.flatbuf.TimeUnit;_t.Precision=li.org.apache.arrow.flatbuf.Precision;_t.UnionMode=li.org.apache.arrow.flatbuf.UnionMode;_t.IntervalUnit=li.org.apache.arrow.flatbuf.IntervalUnit;_t.MessageHeader=tO.org.apache.arrow.flatbuf.MessageHeader;_t.MetadataVersion=li.org.apache.arrow.flatbuf.MetadataVersion;var rO;(function(t){t[t.NONE=0]="NONE",t[t.Null=1]="Null",t[t.Int=2]="Int",t[t.Float=3]="Float",t[t.Binary=4]="Binary",t[t.Utf8=5]="Utf8",t[t.Bool=6]="Bool",t[t.Decimal=7]="Decimal",t[t.Date=8]="Date",t[t.Time=9]="Time",t[t.Timestamp=10]="Timestamp",t[t.Interval=11]="Interval",t[t.List=12]="List",t[t.Struct=13]="Struct",t[t.Union=14]="Union",t[t.FixedSizeBinary=15]="FixedSizeBinary",t[t.FixedSizeList=16]="FixedSizeList",t[t.Map=17]="Map",t[t.Dictionary=-1]="Dictionary",t[t.Int8=-2]="Int8",t[t.Int16=-3]="Int16",t[t.Int32=-4]="Int32",t[t.Int64=-5]="Int64",t[t.Uint8=-6]="Uint8",t[t.Uint16=-7]="Uint16",t[t.Uint32=-8]="Uint32",t[t.Uint64=-9]="Uint64",t[t.Float16=-10]="Float16",t[t.Float32=-11]="Float32",t[t.Float64=-12]="Float64",t[t.DateDay=-13]="DateDay",t[t.DateMillisecond=-14]="DateMillisecond",t[t.TimestampSecond=-15]="TimestampSecond",t[t.TimestampMillisecond=-16]="TimestampMillisecond",t[t.TimestampMicrosecond=-17]="TimestampMicrosecond",t[t.TimestampNanosecond=-18]="TimestampNanosecond",t[t.TimeSecond=-19]="TimeSecond",t[t.TimeMillisecond=-20]="TimeMillisecond",t[t.TimeMicrosecond=-21]="TimeMicrosecond",t[t.TimeNanosecond=-22]="TimeNanosecond",t[t.DenseUnion=-23]="DenseUnion",t[t.SparseUnion=-24]="SparseUnion",t[t.IntervalDayTime=-25]="IntervalDayTime",t[t.IntervalYearMonth=-26]="IntervalYearMonth"})(rO=_t.Type||(_t.Type={}));var nO;(function(t){t[t.OFFSET=0]="OFFSET",t[t.DATA=1]="DATA",t[t.VALIDITY=2]="VALIDITY",t[t.TYPE=3]="TYPE"})(nO=_t.BufferType||(_t.BufferType={}))});var Ir=b(ir=>{"use strict";Object.defineProperty(ir,"__esModule",{value:!0});function gS(t,e,r,n){return(r&1<<n)!==0}ir.getBool=gS;function vS(t,e,r,n){return(r&1<<n)>>n}ir.getBit=vS;function iO(t,e,r){return r?!!(t[e>>3]|=1<<e%8)||!0:!(t[e>>3]&=~(1<<e%8))&&!1}ir.setBool=iO;function sO(t,e,r){let n=r.byteLength+7&-8;if(t>0||r.byteLength<n){let i=new Uint8Array(n);return i.set(t%8===0?r.subarray(t>>3):_S(Zp(r,t,e,null,gS)).subarray(0,n)),i}return r}ir.truncateBitmap=sO;function _S(t){let e=[],r=0,n=0,i=0;for(let a of t)a&&(i|=1<<n),++n===8&&(e[r++]=i,i=n=0);(r===0||n>0)&&(e[r++]=i);let s=new Uint8Array(e.length+7&-8);return s.set(e),s}ir.packBools=_S;function*Zp(t,e,r,n,i){let s=e%8,a=e>>3,l=0,c=r;for(;c>0;s=0){let o=t[a++];do yield i(n,l++,o,s);while(--c>0&&++s<8)}}ir.iterateBits=Zp;function Gp(t,e,r){if(r-e<=0)return 0;if(r-e<8){let s=0;for(let a of Zp(t,e,r-e,t,vS))s+=a;return s}let n=r>>3<<3,i=e+(e%8===0?0:8-e%8);return Gp(t,e,i)+Gp(t,n,r)+wS(t,i>>3,n-i>>3)}ir.popcnt_bit_range=Gp;function wS(t,e,r){let n=0,i=e|0,s=new DataView(t.buffer,t.byteOffset,t.byteLength),a=r===void 0?t.byteLength:i+r;for(;a-i>=4;)n+=cc(s.getUint32(i)),i+=4;for(;a-i>=2;)n+=cc(s.getUint16(i)),i+=2;for(;a-i>=1;)n+=cc(s.getUint8(i)),i+=1;return n}ir.popcnt_array=wS;function cc(t){let e=t|0;return e=e-(e>>>1&1431655765),e=(e&858993459)+(e>>>2&858993459),(e+(e>>>4)&252645135)*16843009>>>24}ir.popcnt_uint32=cc});var Ge=b(ey=>{"use strict";Object.defineProperty(ey,"__esModule",{value:!0});var oO=sr(),aO=xe(),w=de(),lO=ie(),le=class{visitMany(e,...r){return e.map((n,i)=>this.visit(n,...r.map(s=>s[i])))}visit(...e){return this.getVisitFn(e[0],!1).apply(this,e)}getVisitFn(e,r=!0){return uO(this,e,r)}visitNull(e,...r){return null}visitBool(e,...r){return null}visitInt(e,...r){return null}visitFloat(e,...r){return null}visitUtf8(e,...r){return null}visitBinary(e,...r){return null}visitFixedSizeBinary(e,...r){return null}visitDate(e,...r){return null}visitTimestamp(e,...r){return null}visitTime(e,...r){return null}visitDecimal(e,...r){return null}visitList(e,...r){return null}visitStruct(e,...r){return null}visitUnion(e,...r){return null}visitDictionary(e,...r){return null}visitInterval(e,...r){return null}visitFixedSizeList(e,...r){return null}visitMap(e,...r){return null}};ey.Visitor=le;function uO(t,e,r=!0){let n=null,i=w.Type.NONE;switch(e instanceof oO.Data||e instanceof aO.Vector?i=Xp(e.type):e instanceof lO.DataType?i=Xp(e):typeof(i=e)!="number"&&(i=w.Type[e]),i){case w.Type.Null:n=t.visitNull;break;case w.Type.Bool:n=t.visitBool;break;case w.Type.Int:n=t.visitInt;break;case w.Type.Int8:n=t.visitInt8||t.visitInt;break;case w.Type.Int16:n=t.visitInt16||t.visitInt;break;case w.Type.Int32:n=t.visitInt32||t.visitInt;break;case w.Type.Int64:n=t.visitInt64||t.visitInt;break;case w.Type.Uint8:n=t.visitUint8||t.visitInt;break;case w.Type.Uint16:n=t.visitUint16||t.visitInt;break;case w.Type.Uint32:n=t.visitUint32||t.visitInt;break;case w.Type.Uint64:n=t.visitUint64||t.visitInt;break;case w.Type.Float:n=t.visitFloat;break;case w.Type.Float16:n=t.visitFloat16||t.visitFloat;break;case w.Type.Float32:n=t.visitFloat32||t.visitFloat;break;case w.Type.Float64:n=t.visitFloat64||t.visitFloat;break;case w.Type.Utf8:n=t.visitUtf8;break;case w.Type.Binary:n=t.visitBinary;break;case w.Type.FixedSizeBinary:n=t.visitFixedSizeBinary;break;case w.Type.Date:n=t.visitDate;break;case w.Type.DateDay:n=t.visitDateDay||t.visitDate;break;case w.Type.DateMillisecond:n=t.visitDateMillisecond||t.visitDate;break;case w.Type.Timestamp:n=t.visitTimestamp;break;case w.Type.TimestampSecond:n=t.visitTimestampSecond||t.visitTimestamp;break;case w.Type.TimestampMillisecond:n=t.visitTimestampMillisecond||t.visitTimestamp;break;case w.Type.TimestampMicrosecond:n=t.visitTimestampMicrosecond||t.visitTimestamp;break;case w.Type.TimestampNanosecond:n=t.visitTimestampNanosecond||t.visitTimestamp;break;case w.Type.Time:n=t.visitTime;break;case w.Type.TimeSecond:n=t.visitTimeSecond||t.visitTime;break;case w.Type.TimeMillisecond:n=t.visitTimeMillisecond||t.visitTime;break;case w.Type.TimeMicrosecond:n=t.visitTimeMicrosecond||t.visitTime;break;case w.Type.TimeNanosecond:n=t.visitTimeNanosecond||t.visitTime;break;case w.Type.Decimal:n=t.visitDecimal;break;case w.Type.List:n=t.visitList;break;case w.Type.Struct:n=t.visitStruct;break;case w.Type.Union:n=t.visitUnion;break;case w.Type.DenseUnion:n=t.visitDenseUnion||t.visitUnion;break;case w.Type.SparseUnion:n=t.visitSparseUnion||t.visitUnion;break;case w.Type.Dictionary:n=t.visitDictionary;break;case w.Type.Interval:n=t.visitInterval;break;case w.Type.IntervalDayTime:n=t.visitIntervalDayTime||t.visitInterval;break;case w.Type.IntervalYearMonth:n=t.visitIntervalYearMonth||t.visitInterval;break;case w.Type.FixedSizeList:n=t.visitFixedSizeList;break;case w.Type.Map:n=t.visitMap;break}if(typeof n=="function")return n;if(!r)return()=>null;throw new Error(`Unrecognized type '${w.Type[i]}'`)}function Xp(t){switch(t.typeId){case w.Type.Null:return w.Type.Null;case w.Type.Int:let{bitWidth:e,isSigned:r}=t;switch(e){case 8:return r?w.Type.Int8:w.Type.Uint8;case 16:return r?w.Type.Int16:w.Type.Uint16;case 32:return r?w.Type.Int32:w.Type.Uint32;case 64:return r?w.Type.Int64:w.Type.Uint64}return w.Type.Int;case w.Type.Float:switch(t.precision){case w.Precision.HALF:return w.Type.Float16;case w.Precision.SINGLE:return w.Type.Float32;case w.Precision.DOUBLE:return w.Type.Float64}return w.Type.Float;case w.Type.Binary:return w.Type.Binary;case w.Type.Utf8:return w.Type.Utf8;case w.Type.Bool:return w.Type.Bool;case w.Type.Decimal:return w.Type.Decimal;case w.Type.Time:switch(t.unit){case w.TimeUnit.SECOND:return w.Type.TimeSecond;case w.TimeUnit.MILLISECOND:return w.Type.TimeMillisecond;case w.TimeUnit.MICROSECOND:return w.Type.TimeMicrosecond;case w.TimeUnit.NANOSECOND:return w.Type.TimeNanosecond}return w.Type.Time;case w.Type.Timestamp:switch(t.unit){case w.TimeUnit.SECOND:return w.Type.TimestampSecond;case w.TimeUnit.MILLISECOND:return w.Type.TimestampMillisecond;case w.TimeUnit.MICROSECOND:return w.Type.TimestampMicrosecond;case w.TimeUnit.NANOSECOND:return w.Type.TimestampNanosecond}return w.Type.Timestamp;case w.Type.Date:switch(t.unit){case w.DateUnit.DAY:return w.Type.DateDay;case w.DateUnit.MILLISECOND:return w.Type.DateMillisecond}return w.Type.Date;case w.Type.Interval:switch(t.unit){case w.IntervalUnit.DAY_TIME:return w.Type.IntervalDayTime;case w.IntervalUnit.YEAR_MONTH:return w.Type.IntervalYearMonth}return w.Type.Interval;case w.Type.Map:return w.Type.Map;case w.Type.List:return w.Type.List;case w.Type.Struct:return w.Type.Struct;case w.Type.Union:switch(t.mode){case w.UnionMode.Dense:return w.Type.DenseUnion;case w.UnionMode.Sparse:return w.Type.SparseUnion}return w.Type.Union;case w.Type.FixedSizeBinary:return w.Type.FixedSizeBinary;case w.Type.FixedSizeList:return w.Type.FixedSizeList;case w.Type.Dictionary:return w.Type.Dictionary}throw new Error(`Unrecognized type '${w.Type[t.typeId]}'`)}le.prototype.visitInt8=null;le.prototype.visitInt16=null;le.prototype.visitInt32=null;le.prototype.visitInt64=null;le.prototype.visitUint8=null;le.prototype.visitUint16=null;le.prototype.visitUint32=null;le.prototype.visitUint64=null;le.prototype.visitFloat16=null;le.prototype.visitFloat32=null;le.prototype.visitFloat64=null;le.prototype.visitDateDay=null;le.prototype.visitDateMillisecond=null;le.prototype.visitTimestampSecond=null;le.prototype.visitTimestampMillisecond=null;le.prototype.visitTimestampMicrosecond=null;le.prototype.visitTimestampNanosecond=null;le.prototype.visitTimeSecond=null;le.prototype.visitTimeMillisecond=null;le.prototype.visitTimeMicrosecond=null;le.prototype.visitTimeNanosecond=null;le.prototype.visitDenseUnion=null;le.prototype.visitSparseUnion=null;le.prototype.visitIntervalDayTime=null;le.prototype.visitIntervalYearMonth=null});var iy=b(wt=>{"use strict";Object.defineProperty(wt,"__esModule",{value:!0});var cO=Ge(),k=class extends cO.Visitor{compareSchemas(e,r){return e===r||r instanceof e.constructor&&wt.instance.compareFields(e.fields,r.fields)}compareFields(e,r){return e===r||Array.isArray(e)&&Array.isArray(r)&&e.length===r.length&&e.every((n,i)=>wt.instance.compareField(n,r[i]))}compareField(e,r){return e===r||r instanceof e.constructor&&e.name===r.name&&e.nullable===r.nullable&&wt.instance.visit(e.type,r.type)}};wt.TypeComparator=k;function bt(t,e){return e instanceof t.constructor}function Zo(t,e){return t===e||bt(t,e)}function Yr(t,e){return t===e||bt(t,e)&&t.bitWidth===e.bitWidth&&t.isSigned===e.isSigned}function dc(t,e){return t===e||bt(t,e)&&t.precision===e.precision}function dO(t,e){return t===e||bt(t,e)&&t.byteWidth===e.byteWidth}function ty(t,e){return t===e||bt(t,e)&&t.unit===e.unit}function Xo(t,e){return t===e||bt(t,e)&&t.unit===e.unit&&t.timezone===e.timezone}function ea(t,e){return t===e||bt(t,e)&&t.unit===e.unit&&t.bitWidth===e.bitWidth}function fO(t,e){return t===e||bt(t,e)&&t.children.length===e.children.length&&wt.instance.compareFields(t.children,e.children)}function hO(t,e){return t===e||bt(t,e)&&t.children.length===e.children.length&&wt.instance.compareFields(t.children,e.children)}function ry(t,e){return t===e||bt(t,e)&&t.mode===e.mode&&t.typeIds.every((r,n)=>r===e.typeIds[n])&&wt.instance.compareFields(t.children,e.children)}function pO(t,e){return t===e||bt(t,e)&&t.id===e.id&&t.isOrdered===e.isOrdered&&wt.instance.visit(t.indices,e.indices)&&wt.instance.visit(t.dictionary,e.dictionary)}function ny(t,e){return t===e||bt(t,e)&&t.unit===e.unit}function yO(t,e){return t===e||bt(t,e)&&t.listSize===e.listSize&&t.children.length===e.children.length&&wt.instance.compareFields(t.children,e.children)}function mO(t,e){return t===e||bt(t,e)&&t.keysSorted===e.keysSorted&&t.children.length===e.children.length&&wt.instance.compareFields(t.children,e.children)}k.prototype.visitNull=Zo;k.prototype.visitBool=Zo;k.prototype.visitInt=Yr;k.prototype.visitInt8=Yr;k.prototype.visitInt16=Yr;k.prototype.visitInt32=Yr;k.prototype.visitInt64=Yr;k.prototype.visitUint8=Yr;k.prototype.visitUint16=Yr;k.prototype.visitUint32=Yr;k.prototype.visitUint64=Yr;k.prototype.visitFloat=dc;k.prototype.visitFloat16=dc;k.prototype.visitFloat32=dc;k.prototype.visitFloat64=dc;k.prototype.visitUtf8=Zo;k.prototype.visitBinary=Zo;k.prototype.visitFixedSizeBinary=dO;k.prototype.visitDate=ty;k.prototype.visitDateDay=ty;k.prototype.visitDateMillisecond=ty;k.prototype.visitTimestamp=Xo;k.prototype.visitTimestampSecond=Xo;k.prototype.visitTimestampMillisecond=Xo;k.prototype.visitTimestampMicrosecond=Xo;k.prototype.visitTimestampNanosecond=Xo;k.prototype.visitTime=ea;k.prototype.visitTimeSecond=ea;k.prototype.visitTimeMillisecond=ea;k.prototype.visitTimeMicrosecond=ea;k.prototype.visitTimeNanosecond=ea;k.prototype.visitDecimal=Zo;k.prototype.visitList=fO;k.prototype.visitStruct=hO;k.prototype.visitUnion=ry;k.prototype.visitDenseUnion=ry;k.prototype.visitSparseUnion=ry;k.prototype.visitDictionary=pO;k.prototype.visitInterval=ny;k.prototype.visitIntervalDayTime=ny;k.prototype.visitIntervalYearMonth=ny;k.prototype.visitFixedSizeList=yO;k.prototype.visitMap=mO;wt.instance=new k});var ie=b(L=>{"use strict";Object.defineProperty(L,"__esModule",{value:!0});var gO=iy(),O=de(),Te=class{static isNull(e){return e&&e.typeId===O.Type.Null}static isInt(e){return e&&e.typeId===O.Type.Int}static isFloat(e){return e&&e.typeId===O.Type.Float}static isBinary(e){return e&&e.typeId===O.Type.Binary}static isUtf8(e){return e&&e.typeId===O.Type.Utf8}static isBool(e){return e&&e.typeId===O.Type.Bool}static isDecimal(e){return e&&e.typeId===O.Type.Decimal}static isDate(e){return e&&e.typeId===O.Type.Date}static isTime(e){return e&&e.typeId===O.Type.Time}static isTimestamp(e){return e&&e.typeId===O.Type.Timestamp}static isInterval(e){return e&&e.typeId===O.Type.Interval}static isList(e){return e&&e.typeId===O.Type.List}static isStruct(e){return e&&e.typeId===O.Type.Struct}static isUnion(e){return e&&e.typeId===O.Type.Union}static isFixedSizeBinary(e){return e&&e.typeId===O.Type.FixedSizeBinary}static isFixedSizeList(e){return e&&e.typeId===O.Type.FixedSizeList}static isMap(e){return e&&e.typeId===O.Type.Map}static isDictionary(e){return e&&e.typeId===O.Type.Dictionary}get typeId(){return O.Type.NONE}compareTo(e){return gO.instance.visit(this,e)}};Te[Symbol.toStringTag]=(t=>(t.children=null,t.ArrayType=Array,t[Symbol.toStringTag]="DataType"))(Te.prototype);L.DataType=Te;var ta=class extends Te{toString(){return"Null"}get typeId(){return O.Type.Null}};ta[Symbol.toStringTag]=(t=>t[Symbol.toStringTag]="Null")(ta.prototype);L.Null=ta;var Ot=class extends Te{constructor(e,r){super(),this.isSigned=e,this.bitWidth=r}get typeId(){return O.Type.Int}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?Int32Array:Uint32Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`${this.isSigned?"I":"Ui"}nt${this.bitWidth}`}};Ot[Symbol.toStringTag]=(t=>(t.isSigned=null,t.bitWidth=null,t[Symbol.toStringTag]="Int"))(Ot.prototype);L.Int=Ot;var fc=class extends Ot{constructor(){super(!0,8)}};L.Int8=fc;var hc=class extends Ot{constructor(){super(!0,16)}};L.Int16=hc;var pc=class extends Ot{constructor(){super(!0,32)}};L.Int32=pc;var yc=class extends Ot{constructor(){super(!0,64)}};L.Int64=yc;var mc=class extends Ot{constructor(){super(!1,8)}};L.Uint8=mc;var gc=class extends Ot{constructor(){super(!1,16)}};L.Uint16=gc;var vc=class extends Ot{constructor(){super(!1,32)}};L.Uint32=vc;var _c=class extends Ot{constructor(){super(!1,64)}};L.Uint64=_c;Object.defineProperty(fc.prototype,"ArrayType",{value:Int8Array});Object.defineProperty(hc.prototype,"ArrayType",{value:Int16Array});Object.defineProperty(pc.prototype,"ArrayType",{value:Int32Array});Object.defineProperty(yc.prototype,"ArrayType",{value:Int32Array});Object.defineProperty(mc.prototype,"ArrayType",{value:Uint8Array});Object.defineProperty(gc.prototype,"ArrayType",{value:Uint16Array});Object.defineProperty(vc.prototype,"ArrayType",{value:Uint32Array});Object.defineProperty(_c.prototype,"ArrayType",{value:Uint32Array});var An=class extends Te{constructor(e){super(),this.precision=e}get typeId(){return O.Type.Float}get ArrayType(){switch(this.precision){case O.Precision.HALF:return Uint16Array;case O.Precision.SINGLE:return Float32Array;case O.Precision.DOUBLE:return Float64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`Float${this.precision<<5||16}`}};An[Symbol.toStringTag]=(t=>(t.precision=null,t[Symbol.toStringTag]="Float"))(An.prototype);L.Float=An;var wc=class extends An{constructor(){super(O.Precision.HALF)}};L.Float16=wc;var bc=class extends An{constructor(){super(O.Precision.SINGLE)}};L.Float32=bc;var Sc=class extends An{constructor(){super(O.Precision.DOUBLE)}};L.Float64=Sc;Object.defineProperty(wc.prototype,"ArrayType",{value:Uint16Array});Object.defineProperty(bc.prototype,"ArrayType",{value:Float32Array});Object.defineProperty(Sc.prototype,"ArrayType",{value:Float64Array});var ra=class extends Te{constructor(){super()}get typeId(){return O.Type.Binary}toString(){return"Binary"}};ra[Symbol.toStringTag]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Binary"))(ra.prototype);L.Binary=ra;var na=class extends Te{constructor(){super()}get typeId(){return O.Type.Utf8}toString(){return"Utf8"}};na[Symbol.toStringTag]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Utf8"))(na.prototype);L.Utf8=na;var ia=class extends Te{constructor(){super()}get typeId(){return O.Type.Bool}toString(){return"Bool"}};ia[Symbol.toStringTag]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Bool"))(ia.prototype);L.Bool=ia;var sa=class extends Te{constructor(e,r){super(),this.scale=e,this.precision=r}get typeId(){return O.Type.Decimal}toString(){return`Decimal[${this.precision}e${this.scale>0?"+":""}${this.scale}]`}};sa[Symbol.toStringTag]=(t=>(t.scale=null,t.precision=null,t.ArrayType=Uint32Array,t[Symbol.toStringTag]="Decimal"))(sa.prototype);L.Decimal=sa;var ui=class extends Te{constructor(e){super(),this.unit=e}get typeId(){return O.Type.Date}toString(){return`Date${(this.unit+1)*32}<${O.DateUnit[this.unit]}>`}};ui[Symbol.toStringTag]=(t=>(t.unit=null,t.ArrayType=Int32Array,t[Symbol.toStringTag]="Date"))(ui.prototype);L.Date_=ui;var sy=class extends ui{constructor(){super(O.DateUnit.DAY)}};L.DateDay=sy;var oy=class extends ui{constructor(){super(O.DateUnit.MILLISECOND)}};L.DateMillisecond=oy;var Kr=class extends Te{constructor(e,r){super(),this.unit=e,this.bitWidth=r}get typeId(){return O.Type.Time}toString(){return`Time${this.bitWidth}<${O.TimeUnit[this.unit]}>`}};Kr[Symbol.toStringTag]=(t=>(t.unit=null,t.bitWidth=null,t.ArrayType=Int32Array,t[Symbol.toStringTag]="Time"))(Kr.prototype);L.Time=Kr;var ay=class extends Kr{constructor(){super(O.TimeUnit.SECOND,32)}};L.TimeSecond=ay;var ly=class extends Kr{constructor(){super(O.TimeUnit.MILLISECOND,32)}};L.TimeMillisecond=ly;var uy=class extends Kr{constructor(){super(O.TimeUnit.MICROSECOND,64)}};L.TimeMicrosecond=uy;var cy=class extends Kr{constructor(){super(O.TimeUnit.NANOSECOND,64)}};L.TimeNanosecond=cy;var Qr=class extends Te{constructor(e,r){super(),this.unit=e,this.timezone=r}get typeId(){return O.Type.Timestamp}toString(){return`Timestamp<${O.TimeUnit[this.unit]}${this.timezone?`, ${this.timezone}`:""}>`}};Qr[Symbol.toStringTag]=(t=>(t.unit=null,t.timezone=null,t.ArrayType=Int32Array,t[Symbol.toStringTag]="Timestamp"))(Qr.prototype);L.Timestamp=Qr;var dy=class extends Qr{constructor(e){super(O.TimeUnit.SECOND,e)}};L.TimestampSecond=dy;var fy=class extends Qr{constructor(e){super(O.TimeUnit.MILLISECOND,e)}};L.TimestampMillisecond=fy;var hy=class extends Qr{constructor(e){super(O.TimeUnit.MICROSECOND,e)}};L.TimestampMicrosecond=hy;var py=class extends Qr{constructor(e){super(O.TimeUnit.NANOSECOND,e)}};L.TimestampNanosecond=py;var ci=class extends Te{constructor(e){super(),this.unit=e}get typeId(){return O.Type.Interval}toString(){return`Interval<${O.IntervalUnit[this.unit]}>`}};ci[Symbol.toStringTag]=(t=>(t.unit=null,t.ArrayType=Int32Array,t[Symbol.toStringTag]="Interval"))(ci.prototype);L.Interval=ci;var yy=class extends ci{constructor(){super(O.IntervalUnit.DAY_TIME)}};L.IntervalDayTime=yy;var my=class extends ci{constructor(){super(O.IntervalUnit.YEAR_MONTH)}};L.IntervalYearMonth=my;var oa=class extends Te{constructor(e){super(),this.children=[e]}get typeId(){return O.Type.List}toString(){return`List<${this.valueType}>`}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}};oa[Symbol.toStringTag]=(t=>(t.children=null,t[Symbol.toStringTag]="List"))(oa.prototype);L.List=oa;var aa=class extends Te{constructor(e){super(),this.children=e}get typeId(){return O.Type.Struct}toString(){return`Struct<{${this.children.map(e=>`${e.name}:${e.type}`).join(", ")}}>`}};aa[Symbol.toStringTag]=(t=>(t.children=null,t[Symbol.toStringTag]="Struct"))(aa.prototype);L.Struct=aa;var di=class extends Te{constructor(e,r,n){super(),this.mode=e,this.children=n,this.typeIds=r=Int32Array.from(r),this.typeIdToChildIndex=r.reduce((i,s,a)=>(i[s]=a)&&i||i,Object.create(null))}get typeId(){return O.Type.Union}toString(){return`${this[Symbol.toStringTag]}<${this.children.map(e=>`${e.type}`).join(" | ")}>`}};di[Symbol.toStringTag]=(t=>(t.mode=null,t.typeIds=null,t.children=null,t.typeIdToChildIndex=null,t.ArrayType=Int8Array,t[Symbol.toStringTag]="Union"))(di.prototype);L.Union=di;var gy=class extends di{constructor(e,r){super(O.UnionMode.Dense,e,r)}};L.DenseUnion=gy;var vy=class extends di{constructor(e,r){super(O.UnionMode.Sparse,e,r)}};L.SparseUnion=vy;var la=class extends Te{constructor(e){super(),this.byteWidth=e}get typeId(){return O.Type.FixedSizeBinary}toString(){return`FixedSizeBinary[${this.byteWidth}]`}};la[Symbol.toStringTag]=(t=>(t.byteWidth=null,t.ArrayType=Uint8Array,t[Symbol.toStringTag]="FixedSizeBinary"))(la.prototype);L.FixedSizeBinary=la;var ua=class extends Te{constructor(e,r){super(),this.listSize=e,this.children=[r]}get typeId(){return O.Type.FixedSizeList}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return`FixedSizeList[${this.listSize}]<${this.valueType}>`}};ua[Symbol.toStringTag]=(t=>(t.children=null,t.listSize=null,t[Symbol.toStringTag]="FixedSizeList"))(ua.prototype);L.FixedSizeList=ua;var ca=class extends Te{constructor(e,r=!1){super(),this.children=[e],this.keysSorted=r}get typeId(){return O.Type.Map}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}toString(){return`Map<{${this.children[0].type.children.map(e=>`${e.name}:${e.type}`).join(", ")}}>`}};ca[Symbol.toStringTag]=(t=>(t.children=null,t.keysSorted=null,t[Symbol.toStringTag]="Map_"))(ca.prototype);L.Map_=ca;var vO=(t=>()=>++t)(-1),da=class extends Te{constructor(e,r,n,i){super(),this.indices=r,this.dictionary=e,this.isOrdered=i||!1,this.id=n==null?vO():typeof n=="number"?n:n.low}get typeId(){return O.Type.Dictionary}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return`Dictionary<${this.indices}, ${this.dictionary}>`}};da[Symbol.toStringTag]=(t=>(t.id=null,t.indices=null,t.isOrdered=null,t.dictionary=null,t[Symbol.toStringTag]="Dictionary"))(da.prototype);L.Dictionary=da;function _O(t){let e=t;switch(t.typeId){case O.Type.Decimal:return 4;case O.Type.Timestamp:return 2;case O.Type.Date:return 1+e.unit;case O.Type.Interval:return 1+e.unit;case O.Type.Int:return 1+ +(e.bitWidth>32);case O.Type.Time:return 1+ +(e.bitWidth>32);case O.Type.FixedSizeList:return e.listSize;case O.Type.FixedSizeBinary:return e.byteWidth;default:return 1}}L.strideForType=_O});var sr=b(fa=>{"use strict";Object.defineProperty(fa,"__esModule",{value:!0});var wO=Ir(),bO=Ir(),x=de(),SO=ie(),X=Ve();fa.kUnknownNullCount=-1;var Tc=class t{constructor(e,r,n,i,s,a,l){this.type=e,this.dictionary=l,this.offset=Math.floor(Math.max(r||0,0)),this.length=Math.floor(Math.max(n||0,0)),this._nullCount=Math.floor(Math.max(i||0,-1)),this.childData=(a||[]).map(o=>o instanceof t?o:o.data);let c;s instanceof t?(this.stride=s.stride,this.values=s.values,this.typeIds=s.typeIds,this.nullBitmap=s.nullBitmap,this.valueOffsets=s.valueOffsets):(this.stride=SO.strideForType(e),s&&((c=s[0])&&(this.valueOffsets=c),(c=s[1])&&(this.values=c),(c=s[2])&&(this.nullBitmap=c),(c=s[3])&&(this.typeIds=c)))}get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get byteLength(){let e=0,{valueOffsets:r,values:n,nullBitmap:i,typeIds:s}=this;return r&&(e+=r.byteLength),n&&(e+=n.byteLength),i&&(e+=i.byteLength),s&&(e+=s.byteLength),this.childData.reduce((a,l)=>a+l.byteLength,e)}get nullCount(){let e=this._nullCount,r;return e<=fa.kUnknownNullCount&&(r=this.nullBitmap)&&(this._nullCount=e=this.length-bO.popcnt_bit_range(r,this.offset,this.offset+this.length)),e}clone(e,r=this.offset,n=this.length,i=this._nullCount,s=this,a=this.childData){return new t(e,r,n,i,s,a,this.dictionary)}slice(e,r){let{stride:n,typeId:i,childData:s}=this,a=+(this._nullCount===0)-1,l=i===16?n:1,c=this._sliceBuffers(e,r,n,i);return this.clone(this.type,this.offset+e,r,a,c,!s.length||this.valueOffsets?s:this._sliceChildren(s,l*e,l*r))}_changeLengthAndBackfillNullBitmap(e){if(this.typeId===x.Type.Null)return this.clone(this.type,0,e,0);let{length:r,nullCount:n}=this,i=new Uint8Array((e+63&-64)>>3).fill(255,0,r>>3);i[r>>3]=(1<<r-(r&-8))-1,n>0&&i.set(wO.truncateBitmap(this.offset,r,this.nullBitmap),0);let s=this.buffers;return s[x.BufferType.VALIDITY]=i,this.clone(this.type,0,e,n+(e-r),s)}_sliceBuffers(e,r,n,i){let s,{buffers:a}=this;return(s=a[x.BufferType.TYPE])&&(a[x.BufferType.TYPE]=s.subarray(e,e+r)),(s=a[x.BufferType.OFFSET])&&(a[x.BufferType.OFFSET]=s.subarray(e,e+r+1))||(s=a[x.BufferType.DATA])&&(a[x.BufferType.DATA]=i===6?s:s.subarray(n*e,n*(e+r))),a}_sliceChildren(e,r,n){return e.map(i=>i.slice(r,n))}static new(e,r,n,i,s,a,l){switch(s instanceof t?s=s.buffers:s||(s=[]),e.typeId){case x.Type.Null:return t.Null(e,r,n);case x.Type.Int:return t.Int(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.DATA]||[]);case x.Type.Dictionary:return t.Dictionary(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.DATA]||[],l);case x.Type.Float:return t.Float(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.DATA]||[]);case x.Type.Bool:return t.Bool(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.DATA]||[]);case x.Type.Decimal:return t.Decimal(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.DATA]||[]);case x.Type.Date:return t.Date(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.DATA]||[]);case x.Type.Time:return t.Time(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.DATA]||[]);case x.Type.Timestamp:return t.Timestamp(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.DATA]||[]);case x.Type.Interval:return t.Interval(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.DATA]||[]);case x.Type.FixedSizeBinary:return t.FixedSizeBinary(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.DATA]||[]);case x.Type.Binary:return t.Binary(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.OFFSET]||[],s[x.BufferType.DATA]||[]);case x.Type.Utf8:return t.Utf8(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.OFFSET]||[],s[x.BufferType.DATA]||[]);case x.Type.List:return t.List(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.OFFSET]||[],(a||[])[0]);case x.Type.FixedSizeList:return t.FixedSizeList(e,r,n,i||0,s[x.BufferType.VALIDITY],(a||[])[0]);case x.Type.Struct:return t.Struct(e,r,n,i||0,s[x.BufferType.VALIDITY],a||[]);case x.Type.Map:return t.Map(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.OFFSET]||[],(a||[])[0]);case x.Type.Union:return t.Union(e,r,n,i||0,s[x.BufferType.VALIDITY],s[x.BufferType.TYPE]||[],s[x.BufferType.OFFSET]||a,a)}throw new Error(`Unrecognized typeId ${e.typeId}`)}static Null(e,r,n){return new t(e,r,n,0)}static Int(e,r,n,i,s,a){return new t(e,r,n,i,[void 0,X.toArrayBufferView(e.ArrayType,a),X.toUint8Array(s)])}static Dictionary(e,r,n,i,s,a,l){return new t(e,r,n,i,[void 0,X.toArrayBufferView(e.indices.ArrayType,a),X.toUint8Array(s)],[],l)}static Float(e,r,n,i,s,a){return new t(e,r,n,i,[void 0,X.toArrayBufferView(e.ArrayType,a),X.toUint8Array(s)])}static Bool(e,r,n,i,s,a){return new t(e,r,n,i,[void 0,X.toArrayBufferView(e.ArrayType,a),X.toUint8Array(s)])}static Decimal(e,r,n,i,s,a){return new t(e,r,n,i,[void 0,X.toArrayBufferView(e.ArrayType,a),X.toUint8Array(s)])}static Date(e,r,n,i,s,a){return new t(e,r,n,i,[void 0,X.toArrayBufferView(e.ArrayType,a),X.toUint8Array(s)])}static Time(e,r,n,i,s,a){return new t(e,r,n,i,[void 0,X.toArrayBufferView(e.ArrayType,a),X.toUint8Array(s)])}static Timestamp(e,r,n,i,s,a){return new t(e,r,n,i,[void 0,X.toArrayBufferView(e.ArrayType,a),X.toUint8Array(s)])}static Interval(e,r,n,i,s,a){return new t(e,r,n,i,[void 0,X.toArrayBufferView(e.ArrayType,a),X.toUint8Array(s)])}static FixedSizeBinary(e,r,n,i,s,a){return new t(e,r,n,i,[void 0,X.toArrayBufferView(e.ArrayType,a),X.toUint8Array(s)])}static Binary(e,r,n,i,s,a,l){return new t(e,r,n,i,[X.toInt32Array(a),X.toUint8Array(l),X.toUint8Array(s)])}static Utf8(e,r,n,i,s,a,l){return new t(e,r,n,i,[X.toInt32Array(a),X.toUint8Array(l),X.toUint8Array(s)])}static List(e,r,n,i,s,a,l){return new t(e,r,n,i,[X.toInt32Array(a),void 0,X.toUint8Array(s)],[l])}static FixedSizeList(e,r,n,i,s,a){return new t(e,r,n,i,[void 0,void 0,X.toUint8Array(s)],[a])}static Struct(e,r,n,i,s,a){return new t(e,r,n,i,[void 0,void 0,X.toUint8Array(s)],a)}static Map(e,r,n,i,s,a,l){return new t(e,r,n,i,[X.toInt32Array(a),void 0,X.toUint8Array(s)],[l])}static Union(e,r,n,i,s,a,l,c){let o=[void 0,void 0,X.toUint8Array(s),X.toArrayBufferView(e.ArrayType,a)];return e.mode===x.UnionMode.Sparse?new t(e,r,n,i,o,l):(o[x.BufferType.OFFSET]=X.toInt32Array(l),new t(e,r,n,i,o,c))}};fa.Data=Tc;Tc.prototype.childData=Object.freeze([])});var wy=b(_y=>{"use strict";Object.defineProperty(_y,"__esModule",{value:!0});var TO=void 0;function BO(t){if(t===null)return"null";if(t===TO)return"undefined";switch(typeof t){case"number":return`${t}`;case"bigint":return`${t}`;case"string":return`"${t}"`}return typeof t[Symbol.toPrimitive]=="function"?t[Symbol.toPrimitive]("string"):ArrayBuffer.isView(t)?`[${t}]`:JSON.stringify(t)}_y.valueToString=BO});var bS=b(Sy=>{"use strict";Object.defineProperty(Sy,"__esModule",{value:!0});var by=wy(),IO=st();function DO(t){if(!t||t.length<=0)return function(i){return!0};let e="",r=t.filter(n=>n===n);return r.length>0&&(e=`
-    switch (x) {${r.map(n=>`
-        case ${AO(n)}:`).join("")}
+`+s.stack}return{value:e,source:t,stack:i,digest:null}}function Vf(e,t,r){return{value:e,source:null,stack:r!=null?r:null,digest:t!=null?t:null}}function Id(e,t){try{console.error(t.value)}catch(r){setTimeout(function(){throw r})}}var Mb=typeof WeakMap==="function"?WeakMap:Map;function ov(e,t,r){r=Yr(-1,r),r.tag=3,r.payload={element:null};var n=t.value;return r.callback=function(){Wu||(Wu=!0,Ld=n),Id(e,t)},r}function av(e,t,r){r=Yr(-1,r),r.tag=3;var n=e.type.getDerivedStateFromError;if(typeof n==="function"){var i=t.value;r.payload=function(){return n(i)},r.callback=function(){Id(e,t)}}var s=e.stateNode;return s!==null&&typeof s.componentDidCatch==="function"&&(r.callback=function(){Id(e,t),typeof n!=="function"&&(On===null?On=new Set([this]):On.add(this));var a=t.stack;this.componentDidCatch(t.value,{componentStack:a!==null?a:""})}),r}function vy(e,t,r){var n=e.pingCache;if(n===null){n=e.pingCache=new Mb;var i=new Set;n.set(t,i)}else i=n.get(t),i===void 0&&(i=new Set,n.set(t,i));i.has(r)||(i.add(r),e=Qb.bind(null,e,t,r),t.then(e,e))}function _y(e){do{var t;if(t=e.tag===13)t=e.memoizedState,t=t!==null?t.dehydrated!==null?!0:!1:!0;if(t)return e;e=e.return}while(e!==null);return null}function wy(e,t,r,n,i){if((e.mode&1)===0)return e===t?e.flags|=65536:(e.flags|=128,r.flags|=131072,r.flags&=-52805,r.tag===1&&(r.alternate===null?r.tag=17:(t=Yr(-1,1),t.tag=2,En(r,t,1))),r.lanes|=1),e;return e.flags|=65536,e.lanes=i,e}var Lb=Xr.ReactCurrentOwner,dt=!1;function ot(e,t,r,n){t.child=e===null?Ug(t,null,r,n):Ts(t,e.child,r,n)}function by(e,t,r,n,i){r=r.render;var s=t.ref;if(bs(t,i),n=hh(e,t,r,n,s,i),r=ph(),e!==null&&!dt)return t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,Zr(e,t,i);return ye&&r&&th(t),t.flags|=1,ot(e,t,n,i),t.child}function Sy(e,t,r,n,i){if(e===null){var s=r.type;if(typeof s==="function"&&!Bh(s)&&s.defaultProps===void 0&&r.compare===null&&r.defaultProps===void 0)return t.tag=15,t.type=s,lv(e,t,s,n,i);return e=xu(r.type,null,n,t,t.mode,i),e.ref=t.ref,e.return=t,t.child=e}if(s=e.child,(e.lanes&i)===0){var a=s.memoizedProps;if(r=r.compare,r=r!==null?r:Ha,r(a,n)&&e.ref===t.ref)return Zr(e,t,i)}return t.flags|=1,e=Nn(s,n),e.ref=t.ref,e.return=t,t.child=e}function lv(e,t,r,n,i){if(e!==null){var s=e.memoizedProps;if(Ha(s,n)&&e.ref===t.ref)if(dt=!1,t.pendingProps=n=s,(e.lanes&i)!==0)(e.flags&131072)!==0&&(dt=!0);else return t.lanes=e.lanes,Zr(e,t,i)}return Td(e,t,r,n,i)}function uv(e,t,r){var n=t.pendingProps,i=n.children,s=e!==null?e.memoizedState:null;if(n.mode==="hidden")if((t.mode&1)===0)t.memoizedState={baseLanes:0,cachePool:null,transitions:null},fe(ys,wt),wt|=r;else{if((r&1073741824)===0)return e=s!==null?s.baseLanes|r:r,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,fe(ys,wt),wt|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},n=s!==null?s.baseLanes:r,fe(ys,wt),wt|=n}else s!==null?(n=s.baseLanes|r,t.memoizedState=null):n=r,fe(ys,wt),wt|=n;return ot(e,t,i,r),t.child}function cv(e,t){var r=t.ref;if(e===null&&r!==null||e!==null&&e.ref!==r)t.flags|=512,t.flags|=2097152}function Td(e,t,r,n,i){var s=pt(r)?gi:qe.current;if(s=Bs(t,s),bs(t,i),r=hh(e,t,r,n,s,i),n=ph(),e!==null&&!dt)return t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,Zr(e,t,i);return ye&&n&&th(t),t.flags|=1,ot(e,t,r,i),t.child}function xy(e,t,r,n,i){if(pt(r)){var s=!0;Mu(t)}else s=!1;if(bs(t,i),t.stateNode===null)wu(e,t),sv(t,r,n),Bd(t,r,n,i),n=!0;else if(e===null){var{stateNode:a,memoizedProps:l}=t;a.props=l;var o=a.context,u=r.contextType;typeof u==="object"&&u!==null?u=Yt(u):(u=pt(r)?gi:qe.current,u=Bs(t,u));var c=r.getDerivedStateFromProps,p=typeof c==="function"||typeof a.getSnapshotBeforeUpdate==="function";p||typeof a.UNSAFE_componentWillReceiveProps!=="function"&&typeof a.componentWillReceiveProps!=="function"||(l!==n||o!==u)&&gy(t,a,n,u),bn=!1;var y=t.memoizedState;a.state=y,Pu(t,n,a,i),o=t.memoizedState,l!==n||y!==o||ht.current||bn?(typeof c==="function"&&(xd(t,r,c,n),o=t.memoizedState),(l=bn||yy(t,r,l,n,y,o,u))?(p||typeof a.UNSAFE_componentWillMount!=="function"&&typeof a.componentWillMount!=="function"||(typeof a.componentWillMount==="function"&&a.componentWillMount(),typeof a.UNSAFE_componentWillMount==="function"&&a.UNSAFE_componentWillMount()),typeof a.componentDidMount==="function"&&(t.flags|=4194308)):(typeof a.componentDidMount==="function"&&(t.flags|=4194308),t.memoizedProps=n,t.memoizedState=o),a.props=n,a.state=o,a.context=u,n=l):(typeof a.componentDidMount==="function"&&(t.flags|=4194308),n=!1)}else{a=t.stateNode,Rg(e,t),l=t.memoizedProps,u=t.type===t.elementType?l:Gt(t.type,l),a.props=u,p=t.pendingProps,y=a.context,o=r.contextType,typeof o==="object"&&o!==null?o=Yt(o):(o=pt(r)?gi:qe.current,o=Bs(t,o));var _=r.getDerivedStateFromProps;(c=typeof _==="function"||typeof a.getSnapshotBeforeUpdate==="function")||typeof a.UNSAFE_componentWillReceiveProps!=="function"&&typeof a.componentWillReceiveProps!=="function"||(l!==p||y!==o)&&gy(t,a,n,o),bn=!1,y=t.memoizedState,a.state=y,Pu(t,n,a,i);var x=t.memoizedState;l!==p||y!==x||ht.current||bn?(typeof _==="function"&&(xd(t,r,_,n),x=t.memoizedState),(u=bn||yy(t,r,u,n,y,x,o)||!1)?(c||typeof a.UNSAFE_componentWillUpdate!=="function"&&typeof a.componentWillUpdate!=="function"||(typeof a.componentWillUpdate==="function"&&a.componentWillUpdate(n,x,o),typeof a.UNSAFE_componentWillUpdate==="function"&&a.UNSAFE_componentWillUpdate(n,x,o)),typeof a.componentDidUpdate==="function"&&(t.flags|=4),typeof a.getSnapshotBeforeUpdate==="function"&&(t.flags|=1024)):(typeof a.componentDidUpdate!=="function"||l===e.memoizedProps&&y===e.memoizedState||(t.flags|=4),typeof a.getSnapshotBeforeUpdate!=="function"||l===e.memoizedProps&&y===e.memoizedState||(t.flags|=1024),t.memoizedProps=n,t.memoizedState=x),a.props=n,a.state=x,a.context=o,n=u):(typeof a.componentDidUpdate!=="function"||l===e.memoizedProps&&y===e.memoizedState||(t.flags|=4),typeof a.getSnapshotBeforeUpdate!=="function"||l===e.memoizedProps&&y===e.memoizedState||(t.flags|=1024),n=!1)}return Fd(e,t,r,n,s,i)}function Fd(e,t,r,n,i,s){cv(e,t);var a=(t.flags&128)!==0;if(!n&&!a)return i&&ly(t,r,!1),Zr(e,t,s);n=t.stateNode,Lb.current=t;var l=a&&typeof r.getDerivedStateFromError!=="function"?null:n.render();return t.flags|=1,e!==null&&a?(t.child=Ts(t,e.child,null,s),t.child=Ts(t,null,l,s)):ot(e,t,l,s),t.memoizedState=n.state,i&&ly(t,r,!0),t.child}function fv(e){var t=e.stateNode;t.pendingContext?ay(e,t.pendingContext,t.pendingContext!==t.context):t.context&&ay(e,t.context,!1),uh(e,t.containerInfo)}function By(e,t,r,n,i){return Is(),nh(i),t.flags|=256,ot(e,t,r,n),t.child}var Dd={dehydrated:null,treeContext:null,retryLane:0};function Ad(e){return{baseLanes:e,cachePool:null,transitions:null}}function dv(e,t,r){var n=t.pendingProps,i=ge.current,s=!1,a=(t.flags&128)!==0,l;if((l=a)||(l=e!==null&&e.memoizedState===null?!1:(i&2)!==0),l)s=!0,t.flags&=-129;else if(e===null||e.memoizedState!==null)i|=1;if(fe(ge,i&1),e===null){if(bd(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null))return(t.mode&1)===0?t.lanes=1:e.data==="$!"?t.lanes=8:t.lanes=1073741824,null;return a=n.children,e=n.fallback,s?(n=t.mode,s=t.child,a={mode:"hidden",children:a},(n&1)===0&&s!==null?(s.childLanes=0,s.pendingProps=a):s=ic(a,n,0,null),e=yi(e,n,r,null),s.return=t,e.return=t,s.sibling=e,t.child=s,t.child.memoizedState=Ad(r),t.memoizedState=Dd,e):gh(t,a)}if(i=e.memoizedState,i!==null&&(l=i.dehydrated,l!==null))return Ub(e,t,a,n,l,i,r);if(s){s=n.fallback,a=t.mode,i=e.child,l=i.sibling;var o={mode:"hidden",children:n.children};return(a&1)===0&&t.child!==i?(n=t.child,n.childLanes=0,n.pendingProps=o,t.deletions=null):(n=Nn(i,o),n.subtreeFlags=i.subtreeFlags&14680064),l!==null?s=Nn(l,s):(s=yi(s,a,r,null),s.flags|=2),s.return=t,n.return=t,n.sibling=s,t.child=n,n=s,s=t.child,a=e.child.memoizedState,a=a===null?Ad(r):{baseLanes:a.baseLanes|r,cachePool:null,transitions:a.transitions},s.memoizedState=a,s.childLanes=e.childLanes&~r,t.memoizedState=Dd,n}return s=e.child,e=s.sibling,n=Nn(s,{mode:"visible",children:n.children}),(t.mode&1)===0&&(n.lanes=r),n.return=t,n.sibling=null,e!==null&&(r=t.deletions,r===null?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=n,t.memoizedState=null,n}function gh(e,t){return t=ic({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function cu(e,t,r,n){return n!==null&&nh(n),Ts(t,e.child,null,r),e=gh(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Ub(e,t,r,n,i,s,a){if(r){if(t.flags&256)return t.flags&=-257,n=Vf(Error(w(422))),cu(e,t,a,n);if(t.memoizedState!==null)return t.child=e.child,t.flags|=128,null;return s=n.fallback,i=t.mode,n=ic({mode:"visible",children:n.children},i,0,null),s=yi(s,i,a,null),s.flags|=2,n.return=t,s.return=t,n.sibling=s,t.child=n,(t.mode&1)!==0&&Ts(t,e.child,null,a),t.child.memoizedState=Ad(a),t.memoizedState=Dd,s}if((t.mode&1)===0)return cu(e,t,a,null);if(i.data==="$!"){if(n=i.nextSibling&&i.nextSibling.dataset,n)var l=n.dgst;return n=l,s=Error(w(419)),n=Vf(s,n,void 0),cu(e,t,a,n)}if(l=(a&e.childLanes)!==0,dt||l){if(n=Re,n!==null){switch(a&-a){case 4:i=2;break;case 16:i=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:i=32;break;case 536870912:i=268435456;break;default:i=0}i=(i&(n.suspendedLanes|a))!==0?0:i,i!==0&&i!==s.retryLane&&(s.retryLane=i,Jr(e,i),nr(n,e,i,-1))}return xh(),n=Vf(Error(w(421))),cu(e,t,a,n)}if(i.data==="$?")return t.flags|=128,t.child=e.child,t=Jb.bind(null,e),i._reactRetry=t,null;return e=s.treeContext,bt=An(i.nextSibling),St=t,ye=!0,tr=null,e!==null&&(jt[$t++]=Wr,jt[$t++]=Hr,jt[$t++]=vi,Wr=e.id,Hr=e.overflow,vi=t),t=gh(t,n.children),t.flags|=4096,t}function Iy(e,t,r){e.lanes|=t;var n=e.alternate;n!==null&&(n.lanes|=t),Sd(e.return,t,r)}function jf(e,t,r,n,i){var s=e.memoizedState;s===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:n,tail:r,tailMode:i}:(s.isBackwards=t,s.rendering=null,s.renderingStartTime=0,s.last=n,s.tail=r,s.tailMode=i)}function hv(e,t,r){var n=t.pendingProps,i=n.revealOrder,s=n.tail;if(ot(e,t,n.children,r),n=ge.current,(n&2)!==0)n=n&1|2,t.flags|=128;else{if(e!==null&&(e.flags&128)!==0)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Iy(e,r,t);else if(e.tag===19)Iy(e,r,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}n&=1}if(fe(ge,n),(t.mode&1)===0)t.memoizedState=null;else switch(i){case"forwards":r=t.child;for(i=null;r!==null;)e=r.alternate,e!==null&&zu(e)===null&&(i=r),r=r.sibling;r=i,r===null?(i=t.child,t.child=null):(i=r.sibling,r.sibling=null),jf(t,!1,i,r,s);break;case"backwards":r=null,i=t.child;for(t.child=null;i!==null;){if(e=i.alternate,e!==null&&zu(e)===null){t.child=i;break}e=i.sibling,i.sibling=r,r=i,i=e}jf(t,!0,r,null,s);break;case"together":jf(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function wu(e,t){(t.mode&1)===0&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Zr(e,t,r){if(e!==null&&(t.dependencies=e.dependencies),wi|=t.lanes,(r&t.childLanes)===0)return null;if(e!==null&&t.child!==e.child)throw Error(w(153));if(t.child!==null){e=t.child,r=Nn(e,e.pendingProps),t.child=r;for(r.return=t;e.sibling!==null;)e=e.sibling,r=r.sibling=Nn(e,e.pendingProps),r.return=t;r.sibling=null}return t.child}function Cb(e,t,r){switch(t.tag){case 3:fv(t),Is();break;case 5:Pg(t);break;case 1:pt(t.type)&&Mu(t);break;case 4:uh(t,t.stateNode.containerInfo);break;case 10:var n=t.type._context,i=t.memoizedProps.value;fe(Cu,n._currentValue),n._currentValue=i;break;case 13:if(n=t.memoizedState,n!==null){if(n.dehydrated!==null)return fe(ge,ge.current&1),t.flags|=128,null;if((r&t.child.childLanes)!==0)return dv(e,t,r);return fe(ge,ge.current&1),e=Zr(e,t,r),e!==null?e.sibling:null}fe(ge,ge.current&1);break;case 19:if(n=(r&t.childLanes)!==0,(e.flags&128)!==0){if(n)return hv(e,t,r);t.flags|=128}if(i=t.memoizedState,i!==null&&(i.rendering=null,i.tail=null,i.lastEffect=null),fe(ge,ge.current),n)break;else return null;case 22:case 23:return t.lanes=0,uv(e,t,r)}return Zr(e,t,r)}var pv,Ed,mv,yv;pv=function(e,t){for(var r=t.child;r!==null;){if(r.tag===5||r.tag===6)e.appendChild(r.stateNode);else if(r.tag!==4&&r.child!==null){r.child.return=r,r=r.child;continue}if(r===t)break;for(;r.sibling===null;){if(r.return===null||r.return===t)return;r=r.return}r.sibling.return=r.return,r=r.sibling}};Ed=function(){};mv=function(e,t,r,n){var i=e.memoizedProps;if(i!==n){e=t.stateNode,pi(Tr.current);var s=null;switch(r){case"input":i=Zf(e,i),n=Zf(e,n),s=[];break;case"select":i=_e({},i,{value:void 0}),n=_e({},n,{value:void 0}),s=[];break;case"textarea":i=Gf(e,i),n=Gf(e,n),s=[];break;default:typeof i.onClick!=="function"&&typeof n.onClick==="function"&&(e.onclick=ku)}td(r,n);var a;r=null;for(u in i)if(!n.hasOwnProperty(u)&&i.hasOwnProperty(u)&&i[u]!=null)if(u==="style"){var l=i[u];for(a in l)l.hasOwnProperty(a)&&(r||(r={}),r[a]="")}else u!=="dangerouslySetInnerHTML"&&u!=="children"&&u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&u!=="autoFocus"&&(Ra.hasOwnProperty(u)?s||(s=[]):(s=s||[]).push(u,null));for(u in n){var o=n[u];if(l=i!=null?i[u]:void 0,n.hasOwnProperty(u)&&o!==l&&(o!=null||l!=null))if(u==="style")if(l){for(a in l)!l.hasOwnProperty(a)||o&&o.hasOwnProperty(a)||(r||(r={}),r[a]="");for(a in o)o.hasOwnProperty(a)&&l[a]!==o[a]&&(r||(r={}),r[a]=o[a])}else r||(s||(s=[]),s.push(u,r)),r=o;else u==="dangerouslySetInnerHTML"?(o=o?o.__html:void 0,l=l?l.__html:void 0,o!=null&&l!==o&&(s=s||[]).push(u,o)):u==="children"?typeof o!=="string"&&typeof o!=="number"||(s=s||[]).push(u,""+o):u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&(Ra.hasOwnProperty(u)?(o!=null&&u==="onScroll"&&he("scroll",e),s||l===o||(s=[])):(s=s||[]).push(u,o))}r&&(s=s||[]).push("style",r);var u=s;if(t.updateQueue=u)t.flags|=4}};yv=function(e,t,r,n){r!==n&&(t.flags|=4)};function _a(e,t){if(!ye)switch(e.tailMode){case"hidden":t=e.tail;for(var r=null;t!==null;)t.alternate!==null&&(r=t),t=t.sibling;r===null?e.tail=null:r.sibling=null;break;case"collapsed":r=e.tail;for(var n=null;r!==null;)r.alternate!==null&&(n=r),r=r.sibling;n===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:n.sibling=null}}function Ze(e){var t=e.alternate!==null&&e.alternate.child===e.child,r=0,n=0;if(t)for(var i=e.child;i!==null;)r|=i.lanes|i.childLanes,n|=i.subtreeFlags&14680064,n|=i.flags&14680064,i.return=e,i=i.sibling;else for(i=e.child;i!==null;)r|=i.lanes|i.childLanes,n|=i.subtreeFlags,n|=i.flags,i.return=e,i=i.sibling;return e.subtreeFlags|=n,e.childLanes=r,t}function Rb(e,t,r){var n=t.pendingProps;switch(rh(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Ze(t),null;case 1:return pt(t.type)&&Nu(),Ze(t),null;case 3:if(n=t.stateNode,Fs(),pe(ht),pe(qe),fh(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),e===null||e.child===null)lu(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,tr!==null&&(Rd(tr),tr=null));return Ed(e,t),Ze(t),null;case 5:ch(t);var i=pi(Za.current);if(r=t.type,e!==null&&t.stateNode!=null)mv(e,t,r,n,i),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!n){if(t.stateNode===null)throw Error(w(166));return Ze(t),null}if(e=pi(Tr.current),lu(t)){n=t.stateNode,r=t.type;var s=t.memoizedProps;switch(n[Br]=t,n[Qa]=s,e=(t.mode&1)!==0,r){case"dialog":he("cancel",n),he("close",n);break;case"iframe":case"object":case"embed":he("load",n);break;case"video":case"audio":for(i=0;i<Da.length;i++)he(Da[i],n);break;case"source":he("error",n);break;case"img":case"image":case"link":he("error",n),he("load",n);break;case"details":he("toggle",n);break;case"input":Lm(n,s),he("invalid",n);break;case"select":n._wrapperState={wasMultiple:!!s.multiple},he("invalid",n);break;case"textarea":Cm(n,s),he("invalid",n)}td(r,s),i=null;for(var a in s)if(s.hasOwnProperty(a)){var l=s[a];a==="children"?typeof l==="string"?n.textContent!==l&&(s.suppressHydrationWarning!==!0&&au(n.textContent,l,e),i=["children",l]):typeof l==="number"&&n.textContent!==""+l&&(s.suppressHydrationWarning!==!0&&au(n.textContent,l,e),i=["children",""+l]):Ra.hasOwnProperty(a)&&l!=null&&a==="onScroll"&&he("scroll",n)}switch(r){case"input":Gl(n),Um(n,s,!0);break;case"textarea":Gl(n),Rm(n);break;case"select":case"option":break;default:typeof s.onClick==="function"&&(n.onclick=ku)}n=i,t.updateQueue=n,n!==null&&(t.flags|=4)}else{a=i.nodeType===9?i:i.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=Wy(r)),e==="http://www.w3.org/1999/xhtml"?r==="script"?(e=a.createElement("div"),e.innerHTML="<script></script>",e=e.removeChild(e.firstChild)):typeof n.is==="string"?e=a.createElement(r,{is:n.is}):(e=a.createElement(r),r==="select"&&(a=e,n.multiple?a.multiple=!0:n.size&&(a.size=n.size))):e=a.createElementNS(e,r),e[Br]=t,e[Qa]=n,pv(e,t,!1,!1),t.stateNode=e;e:{switch(a=rd(r,n),r){case"dialog":he("cancel",e),he("close",e),i=n;break;case"iframe":case"object":case"embed":he("load",e),i=n;break;case"video":case"audio":for(i=0;i<Da.length;i++)he(Da[i],e);i=n;break;case"source":he("error",e),i=n;break;case"img":case"image":case"link":he("error",e),he("load",e),i=n;break;case"details":he("toggle",e),i=n;break;case"input":Lm(e,n),i=Zf(e,n),he("invalid",e);break;case"option":i=n;break;case"select":e._wrapperState={wasMultiple:!!n.multiple},i=_e({},n,{value:void 0}),he("invalid",e);break;case"textarea":Cm(e,n),i=Gf(e,n),he("invalid",e);break;default:i=n}td(r,i),l=i;for(s in l)if(l.hasOwnProperty(s)){var o=l[s];s==="style"?Ky(e,o):s==="dangerouslySetInnerHTML"?(o=o?o.__html:void 0,o!=null&&Hy(e,o)):s==="children"?typeof o==="string"?(r!=="textarea"||o!=="")&&Pa(e,o):typeof o==="number"&&Pa(e,""+o):s!=="suppressContentEditableWarning"&&s!=="suppressHydrationWarning"&&s!=="autoFocus"&&(Ra.hasOwnProperty(s)?o!=null&&s==="onScroll"&&he("scroll",e):o!=null&&Vd(e,s,o,a))}switch(r){case"input":Gl(e),Um(e,n,!1);break;case"textarea":Gl(e),Rm(e);break;case"option":n.value!=null&&e.setAttribute("value",""+Mn(n.value));break;case"select":e.multiple=!!n.multiple,s=n.value,s!=null?gs(e,!!n.multiple,s,!1):n.defaultValue!=null&&gs(e,!!n.multiple,n.defaultValue,!0);break;default:typeof i.onClick==="function"&&(e.onclick=ku)}switch(r){case"button":case"input":case"select":case"textarea":n=!!n.autoFocus;break e;case"img":n=!0;break e;default:n=!1}}n&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return Ze(t),null;case 6:if(e&&t.stateNode!=null)yv(e,t,e.memoizedProps,n);else{if(typeof n!=="string"&&t.stateNode===null)throw Error(w(166));if(r=pi(Za.current),pi(Tr.current),lu(t)){if(n=t.stateNode,r=t.memoizedProps,n[Br]=t,s=n.nodeValue!==r){if(e=St,e!==null)switch(e.tag){case 3:au(n.nodeValue,r,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&au(n.nodeValue,r,(e.mode&1)!==0)}}s&&(t.flags|=4)}else n=(r.nodeType===9?r:r.ownerDocument).createTextNode(n),n[Br]=t,t.stateNode=n}return Ze(t),null;case 13:if(pe(ge),n=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(ye&&bt!==null&&(t.mode&1)!==0&&(t.flags&128)===0)Mg(),Is(),t.flags|=98560,s=!1;else if(s=lu(t),n!==null&&n.dehydrated!==null){if(e===null){if(!s)throw Error(w(318));if(s=t.memoizedState,s=s!==null?s.dehydrated:null,!s)throw Error(w(317));s[Br]=t}else Is(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;Ze(t),s=!1}else tr!==null&&(Rd(tr),tr=null),s=!0;if(!s)return t.flags&65536?t:null}if((t.flags&128)!==0)return t.lanes=r,t;return n=n!==null,n!==(e!==null&&e.memoizedState!==null)&&n&&(t.child.flags|=8192,(t.mode&1)!==0&&(e===null||(ge.current&1)!==0?Ee===0&&(Ee=3):xh())),t.updateQueue!==null&&(t.flags|=4),Ze(t),null;case 4:return Fs(),Ed(e,t),e===null&&Ya(t.stateNode.containerInfo),Ze(t),null;case 10:return oh(t.type._context),Ze(t),null;case 17:return pt(t.type)&&Nu(),Ze(t),null;case 19:if(pe(ge),s=t.memoizedState,s===null)return Ze(t),null;if(n=(t.flags&128)!==0,a=s.rendering,a===null)if(n)_a(s,!1);else{if(Ee!==0||e!==null&&(e.flags&128)!==0)for(e=t.child;e!==null;){if(a=zu(e),a!==null){t.flags|=128,_a(s,!1),n=a.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),t.subtreeFlags=0,n=r;for(r=t.child;r!==null;)s=r,e=n,s.flags&=14680066,a=s.alternate,a===null?(s.childLanes=0,s.lanes=e,s.child=null,s.subtreeFlags=0,s.memoizedProps=null,s.memoizedState=null,s.updateQueue=null,s.dependencies=null,s.stateNode=null):(s.childLanes=a.childLanes,s.lanes=a.lanes,s.child=a.child,s.subtreeFlags=0,s.deletions=null,s.memoizedProps=a.memoizedProps,s.memoizedState=a.memoizedState,s.updateQueue=a.updateQueue,s.type=a.type,e=a.dependencies,s.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),r=r.sibling;return fe(ge,ge.current&1|2),t.child}e=e.sibling}s.tail!==null&&xe()>As&&(t.flags|=128,n=!0,_a(s,!1),t.lanes=4194304)}else{if(!n)if(e=zu(a),e!==null){if(t.flags|=128,n=!0,r=e.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),_a(s,!0),s.tail===null&&s.tailMode==="hidden"&&!a.alternate&&!ye)return Ze(t),null}else 2*xe()-s.renderingStartTime>As&&r!==1073741824&&(t.flags|=128,n=!0,_a(s,!1),t.lanes=4194304);s.isBackwards?(a.sibling=t.child,t.child=a):(r=s.last,r!==null?r.sibling=a:t.child=a,s.last=a)}if(s.tail!==null)return t=s.tail,s.rendering=t,s.tail=t.sibling,s.renderingStartTime=xe(),t.sibling=null,r=ge.current,fe(ge,n?r&1|2:r&1),t;return Ze(t),null;case 22:case 23:return Sh(),n=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==n&&(t.flags|=8192),n&&(t.mode&1)!==0?(wt&1073741824)!==0&&(Ze(t),t.subtreeFlags&6&&(t.flags|=8192)):Ze(t),null;case 24:return null;case 25:return null}throw Error(w(156,t.tag))}function Pb(e,t){switch(rh(t),t.tag){case 1:return pt(t.type)&&Nu(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Fs(),pe(ht),pe(qe),fh(),e=t.flags,(e&65536)!==0&&(e&128)===0?(t.flags=e&-65537|128,t):null;case 5:return ch(t),null;case 13:if(pe(ge),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(w(340));Is()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return pe(ge),null;case 4:return Fs(),null;case 10:return oh(t.type._context),null;case 22:case 23:return Sh(),null;case 24:return null;default:return null}}var fu=!1,Xe=!1,zb=typeof WeakSet==="function"?WeakSet:Set,I=null;function ms(e,t){var r=e.ref;if(r!==null)if(typeof r==="function")try{r(null)}catch(n){Se(e,t,n)}else r.current=null}function Od(e,t,r){try{r()}catch(n){Se(e,t,n)}}var Ty=!1;function Vb(e,t){if(pd=Au,e=bg(),eh(e)){if("selectionStart"in e)var r={start:e.selectionStart,end:e.selectionEnd};else e:{r=(r=e.ownerDocument)&&r.defaultView||window;var n=r.getSelection&&r.getSelection();if(n&&n.rangeCount!==0){r=n.anchorNode;var i=n.anchorOffset,s=n.focusNode;n=n.focusOffset;try{r.nodeType,s.nodeType}catch(b){r=null;break e}var a=0,l=-1,o=-1,u=0,c=0,p=e,y=null;t:for(;;){for(var _;;){if(p!==r||i!==0&&p.nodeType!==3||(l=a+i),p!==s||n!==0&&p.nodeType!==3||(o=a+n),p.nodeType===3&&(a+=p.nodeValue.length),(_=p.firstChild)===null)break;y=p,p=_}for(;;){if(p===e)break t;if(y===r&&++u===i&&(l=a),y===s&&++c===n&&(o=a),(_=p.nextSibling)!==null)break;p=y,y=p.parentNode}p=_}r=l===-1||o===-1?null:{start:l,end:o}}else r=null}r=r||{start:0,end:0}}else r=null;md={focusedElem:e,selectionRange:r},Au=!1;for(I=t;I!==null;)if(t=I,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,I=e;else for(;I!==null;){t=I;try{var x=t.alternate;if((t.flags&1024)!==0)switch(t.tag){case 0:case 11:case 15:break;case 1:if(x!==null){var B=x.memoizedProps,re=x.memoizedState,h=t.stateNode,d=h.getSnapshotBeforeUpdate(t.elementType===t.type?B:Gt(t.type,B),re);h.__reactInternalSnapshotBeforeUpdate=d}break;case 3:var m=t.stateNode.containerInfo;m.nodeType===1?m.textContent="":m.nodeType===9&&m.documentElement&&m.removeChild(m.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(w(163))}}catch(b){Se(t,t.return,b)}if(e=t.sibling,e!==null){e.return=t.return,I=e;break}I=t.return}return x=Ty,Ty=!1,x}function La(e,t,r){var n=t.updateQueue;if(n=n!==null?n.lastEffect:null,n!==null){var i=n=n.next;do{if((i.tag&e)===e){var s=i.destroy;i.destroy=void 0,s!==void 0&&Od(t,r,s)}i=i.next}while(i!==n)}}function rc(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var r=t=t.next;do{if((r.tag&e)===e){var n=r.create;r.destroy=n()}r=r.next}while(r!==t)}}function kd(e){var t=e.ref;if(t!==null){var r=e.stateNode;switch(e.tag){case 5:e=r;break;default:e=r}typeof t==="function"?t(e):t.current=e}}function gv(e){var t=e.alternate;t!==null&&(e.alternate=null,gv(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Br],delete t[Qa],delete t[vd],delete t[xb],delete t[Bb])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function vv(e){return e.tag===5||e.tag===3||e.tag===4}function Fy(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||vv(e.return))return null;e=e.return}e.sibling.return=e.return;for(e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2)continue e;if(e.child===null||e.tag===4)continue e;else e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Nd(e,t,r){var n=e.tag;if(n===5||n===6)e=e.stateNode,t?r.nodeType===8?r.parentNode.insertBefore(e,t):r.insertBefore(e,t):(r.nodeType===8?(t=r.parentNode,t.insertBefore(e,r)):(t=r,t.appendChild(e)),r=r._reactRootContainer,r!==null&&r!==void 0||t.onclick!==null||(t.onclick=ku));else if(n!==4&&(e=e.child,e!==null))for(Nd(e,t,r),e=e.sibling;e!==null;)Nd(e,t,r),e=e.sibling}function Md(e,t,r){var n=e.tag;if(n===5||n===6)e=e.stateNode,t?r.insertBefore(e,t):r.appendChild(e);else if(n!==4&&(e=e.child,e!==null))for(Md(e,t,r),e=e.sibling;e!==null;)Md(e,t,r),e=e.sibling}var ze=null,er=!1;function _n(e,t,r){for(r=r.child;r!==null;)_v(e,t,r),r=r.sibling}function _v(e,t,r){if(Ir&&typeof Ir.onCommitFiberUnmount==="function")try{Ir.onCommitFiberUnmount(Qu,r)}catch(l){}switch(r.tag){case 5:Xe||ms(r,t);case 6:var n=ze,i=er;ze=null,_n(e,t,r),ze=n,er=i,ze!==null&&(er?(e=ze,r=r.stateNode,e.nodeType===8?e.parentNode.removeChild(r):e.removeChild(r)):ze.removeChild(r.stateNode));break;case 18:ze!==null&&(er?(e=ze,r=r.stateNode,e.nodeType===8?Lf(e.parentNode,r):e.nodeType===1&&Lf(e,r),$a(e)):Lf(ze,r.stateNode));break;case 4:n=ze,i=er,ze=r.stateNode.containerInfo,er=!0,_n(e,t,r),ze=n,er=i;break;case 0:case 11:case 14:case 15:if(!Xe&&(n=r.updateQueue,n!==null&&(n=n.lastEffect,n!==null))){i=n=n.next;do{var s=i,a=s.destroy;s=s.tag,a!==void 0&&((s&2)!==0?Od(r,t,a):(s&4)!==0&&Od(r,t,a)),i=i.next}while(i!==n)}_n(e,t,r);break;case 1:if(!Xe&&(ms(r,t),n=r.stateNode,typeof n.componentWillUnmount==="function"))try{n.props=r.memoizedProps,n.state=r.memoizedState,n.componentWillUnmount()}catch(l){Se(r,t,l)}_n(e,t,r);break;case 21:_n(e,t,r);break;case 22:r.mode&1?(Xe=(n=Xe)||r.memoizedState!==null,_n(e,t,r),Xe=n):_n(e,t,r);break;default:_n(e,t,r)}}function Dy(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var r=e.stateNode;r===null&&(r=e.stateNode=new zb),t.forEach(function(n){var i=Zb.bind(null,e,n);r.has(n)||(r.add(n),n.then(i,i))})}}function qt(e,t){var r=t.deletions;if(r!==null)for(var n=0;n<r.length;n++){var i=r[n];try{var s=e,a=t,l=a;e:for(;l!==null;){switch(l.tag){case 5:ze=l.stateNode,er=!1;break e;case 3:ze=l.stateNode.containerInfo,er=!0;break e;case 4:ze=l.stateNode.containerInfo,er=!0;break e}l=l.return}if(ze===null)throw Error(w(160));_v(s,a,i),ze=null,er=!1;var o=i.alternate;o!==null&&(o.return=null),i.return=null}catch(u){Se(i,t,u)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)wv(t,e),t=t.sibling}function wv(e,t){var{alternate:r,flags:n}=e;switch(e.tag){case 0:case 11:case 14:case 15:if(qt(t,e),Sr(e),n&4){try{La(3,e,e.return),rc(3,e)}catch(B){Se(e,e.return,B)}try{La(5,e,e.return)}catch(B){Se(e,e.return,B)}}break;case 1:qt(t,e),Sr(e),n&512&&r!==null&&ms(r,r.return);break;case 5:if(qt(t,e),Sr(e),n&512&&r!==null&&ms(r,r.return),e.flags&32){var i=e.stateNode;try{Pa(i,"")}catch(B){Se(e,e.return,B)}}if(n&4&&(i=e.stateNode,i!=null)){var s=e.memoizedProps,a=r!==null?r.memoizedProps:s,{type:l,updateQueue:o}=e;if(e.updateQueue=null,o!==null)try{l==="input"&&s.type==="radio"&&s.name!=null&&jy(i,s),rd(l,a);var u=rd(l,s);for(a=0;a<o.length;a+=2){var c=o[a],p=o[a+1];c==="style"?Ky(i,p):c==="dangerouslySetInnerHTML"?Hy(i,p):c==="children"?Pa(i,p):Vd(i,c,p,u)}switch(l){case"input":Xf(i,s);break;case"textarea":$y(i,s);break;case"select":var y=i._wrapperState.wasMultiple;i._wrapperState.wasMultiple=!!s.multiple;var _=s.value;_!=null?gs(i,!!s.multiple,_,!1):y!==!!s.multiple&&(s.defaultValue!=null?gs(i,!!s.multiple,s.defaultValue,!0):gs(i,!!s.multiple,s.multiple?[]:"",!1))}i[Qa]=s}catch(B){Se(e,e.return,B)}}break;case 6:if(qt(t,e),Sr(e),n&4){if(e.stateNode===null)throw Error(w(162));i=e.stateNode,s=e.memoizedProps;try{i.nodeValue=s}catch(B){Se(e,e.return,B)}}break;case 3:if(qt(t,e),Sr(e),n&4&&r!==null&&r.memoizedState.isDehydrated)try{$a(t.containerInfo)}catch(B){Se(e,e.return,B)}break;case 4:qt(t,e),Sr(e);break;case 13:qt(t,e),Sr(e),i=e.child,i.flags&8192&&(s=i.memoizedState!==null,i.stateNode.isHidden=s,!s||i.alternate!==null&&i.alternate.memoizedState!==null||(wh=xe())),n&4&&Dy(e);break;case 22:if(c=r!==null&&r.memoizedState!==null,e.mode&1?(Xe=(u=Xe)||c,qt(t,e),Xe=u):qt(t,e),Sr(e),n&8192){if(u=e.memoizedState!==null,(e.stateNode.isHidden=u)&&!c&&(e.mode&1)!==0)for(I=e,c=e.child;c!==null;){for(p=I=c;I!==null;){switch(y=I,_=y.child,y.tag){case 0:case 11:case 14:case 15:La(4,y,y.return);break;case 1:ms(y,y.return);var x=y.stateNode;if(typeof x.componentWillUnmount==="function"){n=y,r=y.return;try{t=n,x.props=t.memoizedProps,x.state=t.memoizedState,x.componentWillUnmount()}catch(B){Se(n,r,B)}}break;case 5:ms(y,y.return);break;case 22:if(y.memoizedState!==null){Ey(p);continue}}_!==null?(_.return=y,I=_):Ey(p)}c=c.sibling}e:for(c=null,p=e;;){if(p.tag===5){if(c===null){c=p;try{i=p.stateNode,u?(s=i.style,typeof s.setProperty==="function"?s.setProperty("display","none","important"):s.display="none"):(l=p.stateNode,o=p.memoizedProps.style,a=o!==void 0&&o!==null&&o.hasOwnProperty("display")?o.display:null,l.style.display=Yy("display",a))}catch(B){Se(e,e.return,B)}}}else if(p.tag===6){if(c===null)try{p.stateNode.nodeValue=u?"":p.memoizedProps}catch(B){Se(e,e.return,B)}}else if((p.tag!==22&&p.tag!==23||p.memoizedState===null||p===e)&&p.child!==null){p.child.return=p,p=p.child;continue}if(p===e)break e;for(;p.sibling===null;){if(p.return===null||p.return===e)break e;c===p&&(c=null),p=p.return}c===p&&(c=null),p.sibling.return=p.return,p=p.sibling}}break;case 19:qt(t,e),Sr(e),n&4&&Dy(e);break;case 21:break;default:qt(t,e),Sr(e)}}function Sr(e){var t=e.flags;if(t&2){try{e:{for(var r=e.return;r!==null;){if(vv(r)){var n=r;break e}r=r.return}throw Error(w(160))}switch(n.tag){case 5:var i=n.stateNode;n.flags&32&&(Pa(i,""),n.flags&=-33);var s=Fy(e);Md(e,s,i);break;case 3:case 4:var a=n.stateNode.containerInfo,l=Fy(e);Nd(e,l,a);break;default:throw Error(w(161))}}catch(o){Se(e,e.return,o)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function jb(e,t,r){I=e,bv(e,t,r)}function bv(e,t,r){for(var n=(e.mode&1)!==0;I!==null;){var i=I,s=i.child;if(i.tag===22&&n){var a=i.memoizedState!==null||fu;if(!a){var l=i.alternate,o=l!==null&&l.memoizedState!==null||Xe;l=fu;var u=Xe;if(fu=a,(Xe=o)&&!u)for(I=i;I!==null;)a=I,o=a.child,a.tag===22&&a.memoizedState!==null?Oy(i):o!==null?(o.return=a,I=o):Oy(i);for(;s!==null;)I=s,bv(s,t,r),s=s.sibling;I=i,fu=l,Xe=u}Ay(e,t,r)}else(i.subtreeFlags&8772)!==0&&s!==null?(s.return=i,I=s):Ay(e,t,r)}}function Ay(e){for(;I!==null;){var t=I;if((t.flags&8772)!==0){var r=t.alternate;try{if((t.flags&8772)!==0)switch(t.tag){case 0:case 11:case 15:Xe||rc(5,t);break;case 1:var n=t.stateNode;if(t.flags&4&&!Xe)if(r===null)n.componentDidMount();else{var i=t.elementType===t.type?r.memoizedProps:Gt(t.type,r.memoizedProps);n.componentDidUpdate(i,r.memoizedState,n.__reactInternalSnapshotBeforeUpdate)}var s=t.updateQueue;s!==null&&hy(t,s,n);break;case 3:var a=t.updateQueue;if(a!==null){if(r=null,t.child!==null)switch(t.child.tag){case 5:r=t.child.stateNode;break;case 1:r=t.child.stateNode}hy(t,a,r)}break;case 5:var l=t.stateNode;if(r===null&&t.flags&4){r=l;var o=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":o.autoFocus&&r.focus();break;case"img":o.src&&(r.src=o.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var u=t.alternate;if(u!==null){var c=u.memoizedState;if(c!==null){var p=c.dehydrated;p!==null&&$a(p)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(w(163))}Xe||t.flags&512&&kd(t)}catch(y){Se(t,t.return,y)}}if(t===e){I=null;break}if(r=t.sibling,r!==null){r.return=t.return,I=r;break}I=t.return}}function Ey(e){for(;I!==null;){var t=I;if(t===e){I=null;break}var r=t.sibling;if(r!==null){r.return=t.return,I=r;break}I=t.return}}function Oy(e){for(;I!==null;){var t=I;try{switch(t.tag){case 0:case 11:case 15:var r=t.return;try{rc(4,t)}catch(o){Se(t,r,o)}break;case 1:var n=t.stateNode;if(typeof n.componentDidMount==="function"){var i=t.return;try{n.componentDidMount()}catch(o){Se(t,i,o)}}var s=t.return;try{kd(t)}catch(o){Se(t,s,o)}break;case 5:var a=t.return;try{kd(t)}catch(o){Se(t,a,o)}}}catch(o){Se(t,t.return,o)}if(t===e){I=null;break}var l=t.sibling;if(l!==null){l.return=t.return,I=l;break}I=t.return}}var $b=Math.ceil,{ReactCurrentDispatcher:$u,ReactCurrentOwner:vh,ReactCurrentBatchConfig:Ht}=Xr,te=0,Re=null,Fe=null,Ve=0,wt=0,ys=Cn(0),Ee=0,el=null,wi=0,nc=0,_h=0,Ua=null,ft=null,wh=0,As=1/0,jr=null,Wu=!1,Ld=null,On=null,du=!1,In=null,Hu=0,Ca=0,Ud=null,bu=-1,Su=0;function at(){return(te&6)!==0?xe():bu!==-1?bu:bu=xe()}function kn(e){if((e.mode&1)===0)return 1;if((te&2)!==0&&Ve!==0)return Ve&-Ve;if(Tb.transition!==null)return Su===0&&(Su=sg()),Su;if(e=se,e!==0)return e;return e=window.event,e=e===void 0?16:dg(e.type),e}function nr(e,t,r,n){if(50<Ca)throw Ca=0,Ud=null,Error(w(185));if(tl(e,r,n),(te&2)===0||e!==Re)e===Re&&((te&2)===0&&(nc|=r),Ee===4&&xn(e,Ve)),mt(e,n),r===1&&te===0&&(t.mode&1)===0&&(As=xe()+500,Gu&&Rn())}function mt(e,t){var r=e.callbackNode;D1(e,t);var n=Du(e,e===Re?Ve:0);if(n===0)r!==null&&Vm(r),e.callbackNode=null,e.callbackPriority=0;else if(t=n&-n,e.callbackPriority!==t){if(r!=null&&Vm(r),t===1)e.tag===0?Ib(ky.bind(null,e)):Og(ky.bind(null,e)),bb(function(){(te&6)===0&&Rn()}),r=null;else{switch(og(n)){case 1:r=Yd;break;case 4:r=ng;break;case 16:r=Fu;break;case 536870912:r=ig;break;default:r=Fu}r=Av(r,Sv.bind(null,e))}e.callbackPriority=t,e.callbackNode=r}}function Sv(e,t){if(bu=-1,Su=0,(te&6)!==0)throw Error(w(327));var r=e.callbackNode;if(Ss()&&e.callbackNode!==r)return null;var n=Du(e,e===Re?Ve:0);if(n===0)return null;if((n&30)!==0||(n&e.expiredLanes)!==0||t)t=Yu(e,n);else{t=n;var i=te;te|=2;var s=Bv();if(Re!==e||Ve!==t)jr=null,As=xe()+500,mi(e,t);do try{Yb();break}catch(l){xv(e,l)}while(1);sh(),$u.current=s,te=i,Fe!==null?t=0:(Re=null,Ve=0,t=Ee)}if(t!==0){if(t===2&&(i=ad(e),i!==0&&(n=i,t=Cd(e,i))),t===1)throw r=el,mi(e,0),xn(e,n),mt(e,xe()),r;if(t===6)xn(e,n);else{if(i=e.current.alternate,(n&30)===0&&!Wb(i)&&(t=Yu(e,n),t===2&&(s=ad(e),s!==0&&(n=s,t=Cd(e,s))),t===1))throw r=el,mi(e,0),xn(e,n),mt(e,xe()),r;switch(e.finishedWork=i,e.finishedLanes=n,t){case 0:case 1:throw Error(w(345));case 2:fi(e,ft,jr);break;case 3:if(xn(e,n),(n&130023424)===n&&(t=wh+500-xe(),10<t)){if(Du(e,0)!==0)break;if(i=e.suspendedLanes,(i&n)!==n){at(),e.pingedLanes|=e.suspendedLanes&i;break}e.timeoutHandle=gd(fi.bind(null,e,ft,jr),t);break}fi(e,ft,jr);break;case 4:if(xn(e,n),(n&4194240)===n)break;t=e.eventTimes;for(i=-1;0<n;){var a=31-rr(n);s=1<<a,a=t[a],a>i&&(i=a),n&=~s}if(n=i,n=xe()-n,n=(120>n?120:480>n?480:1080>n?1080:1920>n?1920:3000>n?3000:4320>n?4320:1960*$b(n/1960))-n,10<n){e.timeoutHandle=gd(fi.bind(null,e,ft,jr),n);break}fi(e,ft,jr);break;case 5:fi(e,ft,jr);break;default:throw Error(w(329))}}}return mt(e,xe()),e.callbackNode===r?Sv.bind(null,e):null}function Cd(e,t){var r=Ua;return e.current.memoizedState.isDehydrated&&(mi(e,t).flags|=256),e=Yu(e,t),e!==2&&(t=ft,ft=r,t!==null&&Rd(t)),e}function Rd(e){ft===null?ft=e:ft.push.apply(ft,e)}function Wb(e){for(var t=e;;){if(t.flags&16384){var r=t.updateQueue;if(r!==null&&(r=r.stores,r!==null))for(var n=0;n<r.length;n++){var i=r[n],s=i.getSnapshot;i=i.value;try{if(!ir(s(),i))return!1}catch(a){return!1}}}if(r=t.child,t.subtreeFlags&16384&&r!==null)r.return=t,t=r;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function xn(e,t){t&=~_h,t&=~nc,e.suspendedLanes|=t,e.pingedLanes&=~t;for(e=e.expirationTimes;0<t;){var r=31-rr(t),n=1<<r;e[r]=-1,t&=~n}}function ky(e){if((te&6)!==0)throw Error(w(327));Ss();var t=Du(e,0);if((t&1)===0)return mt(e,xe()),null;var r=Yu(e,t);if(e.tag!==0&&r===2){var n=ad(e);n!==0&&(t=n,r=Cd(e,n))}if(r===1)throw r=el,mi(e,0),xn(e,t),mt(e,xe()),r;if(r===6)throw Error(w(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,fi(e,ft,jr),mt(e,xe()),null}function bh(e,t){var r=te;te|=1;try{return e(t)}finally{te=r,te===0&&(As=xe()+500,Gu&&Rn())}}function bi(e){In!==null&&In.tag===0&&(te&6)===0&&Ss();var t=te;te|=1;var r=Ht.transition,n=se;try{if(Ht.transition=null,se=1,e)return e()}finally{se=n,Ht.transition=r,te=t,(te&6)===0&&Rn()}}function Sh(){wt=ys.current,pe(ys)}function mi(e,t){e.finishedWork=null,e.finishedLanes=0;var r=e.timeoutHandle;if(r!==-1&&(e.timeoutHandle=-1,wb(r)),Fe!==null)for(r=Fe.return;r!==null;){var n=r;switch(rh(n),n.tag){case 1:n=n.type.childContextTypes,n!==null&&n!==void 0&&Nu();break;case 3:Fs(),pe(ht),pe(qe),fh();break;case 5:ch(n);break;case 4:Fs();break;case 13:pe(ge);break;case 19:pe(ge);break;case 10:oh(n.type._context);break;case 22:case 23:Sh()}r=r.return}if(Re=e,Fe=e=Nn(e.current,null),Ve=wt=t,Ee=0,el=null,_h=nc=wi=0,ft=Ua=null,hi!==null){for(t=0;t<hi.length;t++)if(r=hi[t],n=r.interleaved,n!==null){r.interleaved=null;var i=n.next,s=r.pending;if(s!==null){var a=s.next;s.next=i,n.next=a}r.pending=n}hi=null}return e}function xv(e,t){do{var r=Fe;try{if(sh(),vu.current=ju,Vu){for(var n=ve.memoizedState;n!==null;){var i=n.queue;i!==null&&(i.pending=null),n=n.next}Vu=!1}if(_i=0,Ce=Ae=ve=null,Ma=!1,Xa=0,vh.current=null,r===null||r.return===null){Ee=1,el=t,Fe=null;break}e:{var s=e,a=r.return,l=r,o=t;if(t=Ve,l.flags|=32768,o!==null&&typeof o==="object"&&typeof o.then==="function"){var u=o,c=l,p=c.tag;if((c.mode&1)===0&&(p===0||p===11||p===15)){var y=c.alternate;y?(c.updateQueue=y.updateQueue,c.memoizedState=y.memoizedState,c.lanes=y.lanes):(c.updateQueue=null,c.memoizedState=null)}var _=_y(a);if(_!==null){_.flags&=-257,wy(_,a,l,s,t),_.mode&1&&vy(s,u,t),t=_,o=u;var x=t.updateQueue;if(x===null){var B=new Set;B.add(o),t.updateQueue=B}else x.add(o);break e}else{if((t&1)===0){vy(s,u,t),xh();break e}o=Error(w(426))}}else if(ye&&l.mode&1){var re=_y(a);if(re!==null){(re.flags&65536)===0&&(re.flags|=256),wy(re,a,l,s,t),nh(Ds(o,l));break e}}s=o=Ds(o,l),Ee!==4&&(Ee=2),Ua===null?Ua=[s]:Ua.push(s),s=a;do{switch(s.tag){case 3:s.flags|=65536,t&=-t,s.lanes|=t;var h=ov(s,o,t);dy(s,h);break e;case 1:l=o;var d=s.type,m=s.stateNode;if((s.flags&128)===0&&(typeof d.getDerivedStateFromError==="function"||m!==null&&typeof m.componentDidCatch==="function"&&(On===null||!On.has(m)))){s.flags|=65536,t&=-t,s.lanes|=t;var b=av(s,l,t);dy(s,b);break e}}s=s.return}while(s!==null)}Tv(r)}catch(T){t=T,Fe===r&&r!==null&&(Fe=r=r.return);continue}break}while(1)}function Bv(){var e=$u.current;return $u.current=ju,e===null?ju:e}function xh(){if(Ee===0||Ee===3||Ee===2)Ee=4;Re===null||(wi&268435455)===0&&(nc&268435455)===0||xn(Re,Ve)}function Yu(e,t){var r=te;te|=2;var n=Bv();if(Re!==e||Ve!==t)jr=null,mi(e,t);do try{Hb();break}catch(i){xv(e,i)}while(1);if(sh(),te=r,$u.current=n,Fe!==null)throw Error(w(261));return Re=null,Ve=0,Ee}function Hb(){for(;Fe!==null;)Iv(Fe)}function Yb(){for(;Fe!==null&&!_1();)Iv(Fe)}function Iv(e){var t=Dv(e.alternate,e,wt);e.memoizedProps=e.pendingProps,t===null?Tv(e):Fe=t,vh.current=null}function Tv(e){var t=e;do{var r=t.alternate;if(e=t.return,(t.flags&32768)===0){if(r=Rb(r,t,wt),r!==null){Fe=r;return}}else{if(r=Pb(r,t),r!==null){r.flags&=32767,Fe=r;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{Ee=6,Fe=null;return}}if(t=t.sibling,t!==null){Fe=t;return}Fe=t=e}while(t!==null);Ee===0&&(Ee=5)}function fi(e,t,r){var n=se,i=Ht.transition;try{Ht.transition=null,se=1,Kb(e,t,r,n)}finally{Ht.transition=i,se=n}return null}function Kb(e,t,r,n){do Ss();while(In!==null);if((te&6)!==0)throw Error(w(327));r=e.finishedWork;var i=e.finishedLanes;if(r===null)return null;if(e.finishedWork=null,e.finishedLanes=0,r===e.current)throw Error(w(177));e.callbackNode=null,e.callbackPriority=0;var s=r.lanes|r.childLanes;if(A1(e,s),e===Re&&(Fe=Re=null,Ve=0),(r.subtreeFlags&2064)===0&&(r.flags&2064)===0||du||(du=!0,Av(Fu,function(){return Ss(),null})),s=(r.flags&15990)!==0,(r.subtreeFlags&15990)!==0||s){s=Ht.transition,Ht.transition=null;var a=se;se=1;var l=te;te|=4,vh.current=null,Vb(e,r),wv(r,e),mb(md),Au=!!pd,md=pd=null,e.current=r,jb(r,e,i),w1(),te=l,se=a,Ht.transition=s}else e.current=r;if(du&&(du=!1,In=e,Hu=i),s=e.pendingLanes,s===0&&(On=null),x1(r.stateNode,n),mt(e,xe()),t!==null)for(n=e.onRecoverableError,r=0;r<t.length;r++)i=t[r],n(i.value,{componentStack:i.stack,digest:i.digest});if(Wu)throw Wu=!1,e=Ld,Ld=null,e;return(Hu&1)!==0&&e.tag!==0&&Ss(),s=e.pendingLanes,(s&1)!==0?e===Ud?Ca++:(Ca=0,Ud=e):Ca=0,Rn(),null}function Ss(){if(In!==null){var e=og(Hu),t=Ht.transition,r=se;try{if(Ht.transition=null,se=16>e?16:e,In===null)var n=!1;else{if(e=In,In=null,Hu=0,(te&6)!==0)throw Error(w(331));var i=te;te|=4;for(I=e.current;I!==null;){var s=I,a=s.child;if((I.flags&16)!==0){var l=s.deletions;if(l!==null){for(var o=0;o<l.length;o++){var u=l[o];for(I=u;I!==null;){var c=I;switch(c.tag){case 0:case 11:case 15:La(8,c,s)}var p=c.child;if(p!==null)p.return=c,I=p;else for(;I!==null;){c=I;var y=c.sibling,_=c.return;if(gv(c),c===u){I=null;break}if(y!==null){y.return=_,I=y;break}I=_}}}var x=s.alternate;if(x!==null){var B=x.child;if(B!==null){x.child=null;do{var re=B.sibling;B.sibling=null,B=re}while(B!==null)}}I=s}}if((s.subtreeFlags&2064)!==0&&a!==null)a.return=s,I=a;else e:for(;I!==null;){if(s=I,(s.flags&2048)!==0)switch(s.tag){case 0:case 11:case 15:La(9,s,s.return)}var h=s.sibling;if(h!==null){h.return=s.return,I=h;break e}I=s.return}}var d=e.current;for(I=d;I!==null;){a=I;var m=a.child;if((a.subtreeFlags&2064)!==0&&m!==null)m.return=a,I=m;else e:for(a=d;I!==null;){if(l=I,(l.flags&2048)!==0)try{switch(l.tag){case 0:case 11:case 15:rc(9,l)}}catch(T){Se(l,l.return,T)}if(l===a){I=null;break e}var b=l.sibling;if(b!==null){b.return=l.return,I=b;break e}I=l.return}}if(te=i,Rn(),Ir&&typeof Ir.onPostCommitFiberRoot==="function")try{Ir.onPostCommitFiberRoot(Qu,e)}catch(T){}n=!0}return n}finally{se=r,Ht.transition=t}}return!1}function Ny(e,t,r){t=Ds(r,t),t=ov(e,t,1),e=En(e,t,1),t=at(),e!==null&&(tl(e,1,t),mt(e,t))}function Se(e,t,r){if(e.tag===3)Ny(e,e,r);else for(;t!==null;){if(t.tag===3){Ny(t,e,r);break}else if(t.tag===1){var n=t.stateNode;if(typeof t.type.getDerivedStateFromError==="function"||typeof n.componentDidCatch==="function"&&(On===null||!On.has(n))){e=Ds(r,e),e=av(t,e,1),t=En(t,e,1),e=at(),t!==null&&(tl(t,1,e),mt(t,e));break}}t=t.return}}function Qb(e,t,r){var n=e.pingCache;n!==null&&n.delete(t),t=at(),e.pingedLanes|=e.suspendedLanes&r,Re===e&&(Ve&r)===r&&(Ee===4||Ee===3&&(Ve&130023424)===Ve&&500>xe()-wh?mi(e,0):_h|=r),mt(e,t)}function Fv(e,t){t===0&&((e.mode&1)===0?t=1:(t=ru,ru<<=1,(ru&130023424)===0&&(ru=4194304)));var r=at();e=Jr(e,t),e!==null&&(tl(e,t,r),mt(e,r))}function Jb(e){var t=e.memoizedState,r=0;t!==null&&(r=t.retryLane),Fv(e,r)}function Zb(e,t){var r=0;switch(e.tag){case 13:var{stateNode:n,memoizedState:i}=e;i!==null&&(r=i.retryLane);break;case 19:n=e.stateNode;break;default:throw Error(w(314))}n!==null&&n.delete(t),Fv(e,r)}var Dv;Dv=function(e,t,r){if(e!==null)if(e.memoizedProps!==t.pendingProps||ht.current)dt=!0;else{if((e.lanes&r)===0&&(t.flags&128)===0)return dt=!1,Cb(e,t,r);dt=(e.flags&131072)!==0?!0:!1}else dt=!1,ye&&(t.flags&1048576)!==0&&kg(t,Uu,t.index);switch(t.lanes=0,t.tag){case 2:var n=t.type;wu(e,t),e=t.pendingProps;var i=Bs(t,qe.current);bs(t,r),i=hh(null,t,n,e,i,r);var s=ph();return t.flags|=1,typeof i==="object"&&i!==null&&typeof i.render==="function"&&i.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,pt(n)?(s=!0,Mu(t)):s=!1,t.memoizedState=i.state!==null&&i.state!==void 0?i.state:null,lh(t),i.updater=tc,t.stateNode=i,i._reactInternals=t,Bd(t,n,e,r),t=Fd(null,t,n,!0,s,r)):(t.tag=0,ye&&s&&th(t),ot(null,t,i,r),t=t.child),t;case 16:n=t.elementType;e:{switch(wu(e,t),e=t.pendingProps,i=n._init,n=i(n._payload),t.type=n,i=t.tag=qb(n),e=Gt(n,e),i){case 0:t=Td(null,t,n,e,r);break e;case 1:t=xy(null,t,n,e,r);break e;case 11:t=by(null,t,n,e,r);break e;case 14:t=Sy(null,t,n,Gt(n.type,e),r);break e}throw Error(w(306,n,""))}return t;case 0:return n=t.type,i=t.pendingProps,i=t.elementType===n?i:Gt(n,i),Td(e,t,n,i,r);case 1:return n=t.type,i=t.pendingProps,i=t.elementType===n?i:Gt(n,i),xy(e,t,n,i,r);case 3:e:{if(fv(t),e===null)throw Error(w(387));n=t.pendingProps,s=t.memoizedState,i=s.element,Rg(e,t),Pu(t,n,null,r);var a=t.memoizedState;if(n=a.element,s.isDehydrated)if(s={element:n,isDehydrated:!1,cache:a.cache,pendingSuspenseBoundaries:a.pendingSuspenseBoundaries,transitions:a.transitions},t.updateQueue.baseState=s,t.memoizedState=s,t.flags&256){i=Ds(Error(w(423)),t),t=By(e,t,n,r,i);break e}else if(n!==i){i=Ds(Error(w(424)),t),t=By(e,t,n,r,i);break e}else for(bt=An(t.stateNode.containerInfo.firstChild),St=t,ye=!0,tr=null,r=Ug(t,null,n,r),t.child=r;r;)r.flags=r.flags&-3|4096,r=r.sibling;else{if(Is(),n===i){t=Zr(e,t,r);break e}ot(e,t,n,r)}t=t.child}return t;case 5:return Pg(t),e===null&&bd(t),n=t.type,i=t.pendingProps,s=e!==null?e.memoizedProps:null,a=i.children,yd(n,i)?a=null:s!==null&&yd(n,s)&&(t.flags|=32),cv(e,t),ot(e,t,a,r),t.child;case 6:return e===null&&bd(t),null;case 13:return dv(e,t,r);case 4:return uh(t,t.stateNode.containerInfo),n=t.pendingProps,e===null?t.child=Ts(t,null,n,r):ot(e,t,n,r),t.child;case 11:return n=t.type,i=t.pendingProps,i=t.elementType===n?i:Gt(n,i),by(e,t,n,i,r);case 7:return ot(e,t,t.pendingProps,r),t.child;case 8:return ot(e,t,t.pendingProps.children,r),t.child;case 12:return ot(e,t,t.pendingProps.children,r),t.child;case 10:e:{if(n=t.type._context,i=t.pendingProps,s=t.memoizedProps,a=i.value,fe(Cu,n._currentValue),n._currentValue=a,s!==null)if(ir(s.value,a)){if(s.children===i.children&&!ht.current){t=Zr(e,t,r);break e}}else for(s=t.child,s!==null&&(s.return=t);s!==null;){var l=s.dependencies;if(l!==null){a=s.child;for(var o=l.firstContext;o!==null;){if(o.context===n){if(s.tag===1){o=Yr(-1,r&-r),o.tag=2;var u=s.updateQueue;if(u!==null){u=u.shared;var c=u.pending;c===null?o.next=o:(o.next=c.next,c.next=o),u.pending=o}}s.lanes|=r,o=s.alternate,o!==null&&(o.lanes|=r),Sd(s.return,r,t),l.lanes|=r;break}o=o.next}}else if(s.tag===10)a=s.type===t.type?null:s.child;else if(s.tag===18){if(a=s.return,a===null)throw Error(w(341));a.lanes|=r,l=a.alternate,l!==null&&(l.lanes|=r),Sd(a,r,t),a=s.sibling}else a=s.child;if(a!==null)a.return=s;else for(a=s;a!==null;){if(a===t){a=null;break}if(s=a.sibling,s!==null){s.return=a.return,a=s;break}a=a.return}s=a}ot(e,t,i.children,r),t=t.child}return t;case 9:return i=t.type,n=t.pendingProps.children,bs(t,r),i=Yt(i),n=n(i),t.flags|=1,ot(e,t,n,r),t.child;case 14:return n=t.type,i=Gt(n,t.pendingProps),i=Gt(n.type,i),Sy(e,t,n,i,r);case 15:return lv(e,t,t.type,t.pendingProps,r);case 17:return n=t.type,i=t.pendingProps,i=t.elementType===n?i:Gt(n,i),wu(e,t),t.tag=1,pt(n)?(e=!0,Mu(t)):e=!1,bs(t,r),sv(t,n,i),Bd(t,n,i,r),Fd(null,t,n,!0,e,r);case 19:return hv(e,t,r);case 22:return uv(e,t,r)}throw Error(w(156,t.tag))};function Av(e,t){return rg(e,t)}function Xb(e,t,r,n){this.tag=e,this.key=r,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=n,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Wt(e,t,r,n){return new Xb(e,t,r,n)}function Bh(e){return e=e.prototype,!(!e||!e.isReactComponent)}function qb(e){if(typeof e==="function")return Bh(e)?1:0;if(e!==void 0&&e!==null){if(e=e.$$typeof,e===$d)return 11;if(e===Wd)return 14}return 2}function Nn(e,t){var r=e.alternate;return r===null?(r=Wt(e.tag,t,e.key,e.mode),r.elementType=e.elementType,r.type=e.type,r.stateNode=e.stateNode,r.alternate=e,e.alternate=r):(r.pendingProps=t,r.type=e.type,r.flags=0,r.subtreeFlags=0,r.deletions=null),r.flags=e.flags&14680064,r.childLanes=e.childLanes,r.lanes=e.lanes,r.child=e.child,r.memoizedProps=e.memoizedProps,r.memoizedState=e.memoizedState,r.updateQueue=e.updateQueue,t=e.dependencies,r.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},r.sibling=e.sibling,r.index=e.index,r.ref=e.ref,r}function xu(e,t,r,n,i,s){var a=2;if(n=e,typeof e==="function")Bh(e)&&(a=1);else if(typeof e==="string")a=5;else e:switch(e){case os:return yi(r.children,i,s,t);case jd:a=8,i|=8;break;case Yf:return e=Wt(12,r,t,i|2),e.elementType=Yf,e.lanes=s,e;case Kf:return e=Wt(13,r,t,i),e.elementType=Kf,e.lanes=s,e;case Qf:return e=Wt(19,r,t,i),e.elementType=Qf,e.lanes=s,e;case Py:return ic(r,i,s,t);default:if(typeof e==="object"&&e!==null)switch(e.$$typeof){case Cy:a=10;break e;case Ry:a=9;break e;case $d:a=11;break e;case Wd:a=14;break e;case wn:a=16,n=null;break e}throw Error(w(130,e==null?e:typeof e,""))}return t=Wt(a,r,t,i),t.elementType=e,t.type=n,t.lanes=s,t}function yi(e,t,r,n){return e=Wt(7,e,n,t),e.lanes=r,e}function ic(e,t,r,n){return e=Wt(22,e,n,t),e.elementType=Py,e.lanes=r,e.stateNode={isHidden:!1},e}function $f(e,t,r){return e=Wt(6,e,null,t),e.lanes=r,e}function Wf(e,t,r){return t=Wt(4,e.children!==null?e.children:[],e.key,t),t.lanes=r,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Gb(e,t,r,n,i){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Df(0),this.expirationTimes=Df(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Df(0),this.identifierPrefix=n,this.onRecoverableError=i,this.mutableSourceEagerHydrationData=null}function Ih(e,t,r,n,i,s,a,l,o){return e=new Gb(e,t,r,l,o),t===1?(t=1,s===!0&&(t|=8)):t=0,s=Wt(3,null,null,t),e.current=s,s.stateNode=e,s.memoizedState={element:n,isDehydrated:r,cache:null,transitions:null,pendingSuspenseBoundaries:null},lh(s),e}function eS(e,t,r){var n=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:ss,key:n==null?null:""+n,children:e,containerInfo:t,implementation:r}}function Ev(e){if(!e)return Ln;e=e._reactInternals;e:{if(xi(e)!==e||e.tag!==1)throw Error(w(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(pt(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(w(171))}if(e.tag===1){var r=e.type;if(pt(r))return Eg(e,r,t)}return t}function Ov(e,t,r,n,i,s,a,l,o){return e=Ih(r,n,!0,e,i,s,a,l,o),e.context=Ev(null),r=e.current,n=at(),i=kn(r),s=Yr(n,i),s.callback=t!==void 0&&t!==null?t:null,En(r,s,i),e.current.lanes=i,tl(e,i,n),mt(e,n),e}function sc(e,t,r,n){var i=t.current,s=at(),a=kn(i);return r=Ev(r),t.context===null?t.context=r:t.pendingContext=r,t=Yr(s,a),t.payload={element:e},n=n===void 0?null:n,n!==null&&(t.callback=n),e=En(i,t,a),e!==null&&(nr(e,i,a,s),gu(e,i,a)),a}function Ku(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function My(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var r=e.retryLane;e.retryLane=r!==0&&r<t?r:t}}function Th(e,t){My(e,t),(e=e.alternate)&&My(e,t)}function tS(){return null}var kv=typeof reportError==="function"?reportError:function(e){console.error(e)};function Fh(e){this._internalRoot=e}oc.prototype.render=Fh.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(w(409));sc(e,t,null,null)};oc.prototype.unmount=Fh.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;bi(function(){sc(null,e,null,null)}),t[Qr]=null}};function oc(e){this._internalRoot=e}oc.prototype.unstable_scheduleHydration=function(e){if(e){var t=ug();e={blockedOn:null,target:e,priority:t};for(var r=0;r<Sn.length&&t!==0&&t<Sn[r].priority;r++);Sn.splice(r,0,e),r===0&&fg(e)}};function Dh(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function ac(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Ly(){}function rS(e,t,r,n,i){if(i){if(typeof n==="function"){var s=n;n=function(){var u=Ku(a);s.call(u)}}var a=Ov(t,n,e,0,null,!1,!1,"",Ly);return e._reactRootContainer=a,e[Qr]=a.current,Ya(e.nodeType===8?e.parentNode:e),bi(),a}for(;i=e.lastChild;)e.removeChild(i);if(typeof n==="function"){var l=n;n=function(){var u=Ku(o);l.call(u)}}var o=Ih(e,0,!1,null,null,!1,!1,"",Ly);return e._reactRootContainer=o,e[Qr]=o.current,Ya(e.nodeType===8?e.parentNode:e),bi(function(){sc(t,o,r,n)}),o}function lc(e,t,r,n,i){var s=r._reactRootContainer;if(s){var a=s;if(typeof i==="function"){var l=i;i=function(){var o=Ku(a);l.call(o)}}sc(t,a,e,i)}else a=rS(r,t,e,i,n);return Ku(a)}ag=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var r=xa(t.pendingLanes);r!==0&&(Kd(t,r|1),mt(t,xe()),(te&6)===0&&(As=xe()+500,Rn()))}break;case 13:bi(function(){var n=Jr(e,1);if(n!==null){var i=at();nr(n,e,1,i)}}),Th(e,1)}};Qd=function(e){if(e.tag===13){var t=Jr(e,134217728);if(t!==null){var r=at();nr(t,e,134217728,r)}Th(e,134217728)}};lg=function(e){if(e.tag===13){var t=kn(e),r=Jr(e,t);if(r!==null){var n=at();nr(r,e,t,n)}Th(e,t)}};ug=function(){return se};cg=function(e,t){var r=se;try{return se=e,t()}finally{se=r}};id=function(e,t,r){switch(t){case"input":if(Xf(e,r),t=r.name,r.type==="radio"&&t!=null){for(r=e;r.parentNode;)r=r.parentNode;r=r.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]');for(t=0;t<r.length;t++){var n=r[t];if(n!==e&&n.form===e.form){var i=qu(n);if(!i)throw Error(w(90));Vy(n),Xf(n,i)}}}break;case"textarea":$y(e,r);break;case"select":t=r.value,t!=null&&gs(e,!!r.multiple,t,!1)}};Zy=bh;Xy=bi;var nS={usingClientEntryPoint:!1,Events:[nl,cs,qu,Qy,Jy,bh]},wa={findFiberByHostInstance:di,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},iS={bundleType:wa.bundleType,version:wa.version,rendererPackageName:wa.rendererPackageName,rendererConfig:wa.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:Xr.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=eg(e),e===null?null:e.stateNode},findFiberByHostInstance:wa.findFiberByHostInstance||tS,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){if(is=__REACT_DEVTOOLS_GLOBAL_HOOK__,!is.isDisabled&&is.supportsFiber)try{Qu=is.inject(iS),Ir=is}catch(e){}}var is;It.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=nS;It.createPortal=function(e,t){var r=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Dh(t))throw Error(w(200));return eS(e,t,null,r)};It.createRoot=function(e,t){if(!Dh(e))throw Error(w(299));var r=!1,n="",i=kv;return t!==null&&t!==void 0&&(t.unstable_strictMode===!0&&(r=!0),t.identifierPrefix!==void 0&&(n=t.identifierPrefix),t.onRecoverableError!==void 0&&(i=t.onRecoverableError)),t=Ih(e,1,!1,null,null,r,!1,n,i),e[Qr]=t.current,Ya(e.nodeType===8?e.parentNode:e),new Fh(t)};It.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0){if(typeof e.render==="function")throw Error(w(188));throw e=Object.keys(e).join(","),Error(w(268,e))}return e=eg(t),e=e===null?null:e.stateNode,e};It.flushSync=function(e){return bi(e)};It.hydrate=function(e,t,r){if(!ac(t))throw Error(w(200));return lc(null,e,t,!0,r)};It.hydrateRoot=function(e,t,r){if(!Dh(e))throw Error(w(405));var n=r!=null&&r.hydratedSources||null,i=!1,s="",a=kv;if(r!==null&&r!==void 0&&(r.unstable_strictMode===!0&&(i=!0),r.identifierPrefix!==void 0&&(s=r.identifierPrefix),r.onRecoverableError!==void 0&&(a=r.onRecoverableError)),t=Ov(t,null,e,1,r!=null?r:null,i,!1,s,a),e[Qr]=t.current,Ya(e),n)for(e=0;e<n.length;e++)r=n[e],i=r._getVersion,i=i(r._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[r,i]:t.mutableSourceEagerHydrationData.push(r,i);return new oc(t)};It.render=function(e,t,r){if(!ac(t))throw Error(w(200));return lc(null,e,t,!1,r)};It.unmountComponentAtNode=function(e){if(!ac(e))throw Error(w(40));return e._reactRootContainer?(bi(function(){lc(null,null,e,!1,function(){e._reactRootContainer=null,e[Qr]=null})}),!0):!1};It.unstable_batchedUpdates=bh;It.unstable_renderSubtreeIntoContainer=function(e,t,r,n){if(!ac(r))throw Error(w(200));if(e==null||e._reactInternals===void 0)throw Error(w(38));return lc(e,t,r,!1,n)};It.version="18.3.1-next-f1338f8080-20240426"});var Uv=it(function(sS,Lv){function Mv(){if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!=="function")return;try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(Mv)}catch(e){console.error(e)}}Mv(),Lv.exports=Nv()});var Rv=it(function(Ah){var Cv=Uv();Ah.createRoot=Cv.createRoot,Ah.hydrateRoot=Cv.hydrateRoot;var oS});var Z_=it(function(oe){var Pe=typeof Symbol==="function"&&Symbol.for,Kp=Pe?Symbol.for("react.element"):60103,Qp=Pe?Symbol.for("react.portal"):60106,Jc=Pe?Symbol.for("react.fragment"):60107,Zc=Pe?Symbol.for("react.strict_mode"):60108,Xc=Pe?Symbol.for("react.profiler"):60114,qc=Pe?Symbol.for("react.provider"):60109,Gc=Pe?Symbol.for("react.context"):60110,Jp=Pe?Symbol.for("react.async_mode"):60111,ef=Pe?Symbol.for("react.concurrent_mode"):60111,tf=Pe?Symbol.for("react.forward_ref"):60112,rf=Pe?Symbol.for("react.suspense"):60113,MI=Pe?Symbol.for("react.suspense_list"):60120,nf=Pe?Symbol.for("react.memo"):60115,sf=Pe?Symbol.for("react.lazy"):60116,LI=Pe?Symbol.for("react.block"):60121,UI=Pe?Symbol.for("react.fundamental"):60117,CI=Pe?Symbol.for("react.responder"):60118,RI=Pe?Symbol.for("react.scope"):60119;function Rt(e){if(typeof e==="object"&&e!==null){var t=e.$$typeof;switch(t){case Kp:switch(e=e.type,e){case Jp:case ef:case Jc:case Xc:case Zc:case rf:return e;default:switch(e=e&&e.$$typeof,e){case Gc:case tf:case sf:case nf:case qc:return e;default:return t}}case Qp:return t}}}function J_(e){return Rt(e)===ef}oe.AsyncMode=Jp;oe.ConcurrentMode=ef;oe.ContextConsumer=Gc;oe.ContextProvider=qc;oe.Element=Kp;oe.ForwardRef=tf;oe.Fragment=Jc;oe.Lazy=sf;oe.Memo=nf;oe.Portal=Qp;oe.Profiler=Xc;oe.StrictMode=Zc;oe.Suspense=rf;oe.isAsyncMode=function(e){return J_(e)||Rt(e)===Jp};oe.isConcurrentMode=J_;oe.isContextConsumer=function(e){return Rt(e)===Gc};oe.isContextProvider=function(e){return Rt(e)===qc};oe.isElement=function(e){return typeof e==="object"&&e!==null&&e.$$typeof===Kp};oe.isForwardRef=function(e){return Rt(e)===tf};oe.isFragment=function(e){return Rt(e)===Jc};oe.isLazy=function(e){return Rt(e)===sf};oe.isMemo=function(e){return Rt(e)===nf};oe.isPortal=function(e){return Rt(e)===Qp};oe.isProfiler=function(e){return Rt(e)===Xc};oe.isStrictMode=function(e){return Rt(e)===Zc};oe.isSuspense=function(e){return Rt(e)===rf};oe.isValidElementType=function(e){return typeof e==="string"||typeof e==="function"||e===Jc||e===ef||e===Xc||e===Zc||e===rf||e===MI||typeof e==="object"&&e!==null&&(e.$$typeof===sf||e.$$typeof===nf||e.$$typeof===qc||e.$$typeof===Gc||e.$$typeof===tf||e.$$typeof===UI||e.$$typeof===CI||e.$$typeof===RI||e.$$typeof===LI)};oe.typeOf=Rt});var q_=it(function(PI,X_){X_.exports=Z_()});var sw=it(function(_3,iw){var Zp=q_(),zI={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},VI={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},jI={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},rw={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},Xp={};Xp[Zp.ForwardRef]=jI;Xp[Zp.Memo]=rw;function G_(e){if(Zp.isMemo(e))return rw;return Xp[e.$$typeof]||zI}var{defineProperty:$I,getOwnPropertyNames:WI,getOwnPropertySymbols:ew,getOwnPropertyDescriptor:HI,getPrototypeOf:YI,prototype:tw}=Object;function nw(e,t,r){if(typeof t!=="string"){if(tw){var n=YI(t);if(n&&n!==tw)nw(e,n,r)}var i=WI(t);if(ew)i=i.concat(ew(t));var s=G_(e),a=G_(t);for(var l=0;l<i.length;++l){var o=i[l];if(!VI[o]&&!(r&&r[o])&&!(a&&a[o])&&!(s&&s[o])){var u=HI(t,o);try{$I(e,o,u)}catch(c){}}}}return e}iw.exports=nw});var lw=it(function(w3,aw){var ow=Object.getOwnPropertySymbols,KI=Object.prototype.hasOwnProperty,QI=Object.prototype.propertyIsEnumerable;function JI(e){if(e===null||e===void 0)throw TypeError("Object.assign cannot be called with null or undefined");return Object(e)}function ZI(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de",Object.getOwnPropertyNames(e)[0]==="5")return!1;var t={};for(var r=0;r<10;r++)t["_"+String.fromCharCode(r)]=r;var n=Object.getOwnPropertyNames(t).map(function(s){return t[s]});if(n.join("")!=="0123456789")return!1;var i={};if("abcdefghijklmnopqrst".split("").forEach(function(s){i[s]=s}),Object.keys(Object.assign({},i)).join("")!=="abcdefghijklmnopqrst")return!1;return!0}catch(s){return!1}}aw.exports=ZI()?Object.assign:function(e,t){var r,n=JI(e),i;for(var s=1;s<arguments.length;s++){r=Object(arguments[s]);for(var a in r)if(KI.call(r,a))n[a]=r[a];if(ow){i=ow(r);for(var l=0;l<i.length;l++)if(QI.call(r,i[l]))n[i[l]]=r[i[l]]}}return n}});var ww=it(function(ae){var rm=lw(),_r=typeof Symbol==="function"&&Symbol.for,Cl=_r?Symbol.for("react.element"):60103,XI=_r?Symbol.for("react.portal"):60106,qI=_r?Symbol.for("react.fragment"):60107,GI=_r?Symbol.for("react.strict_mode"):60108,eT=_r?Symbol.for("react.profiler"):60114,tT=_r?Symbol.for("react.provider"):60109,rT=_r?Symbol.for("react.context"):60110,nT=_r?Symbol.for("react.forward_ref"):60112,iT=_r?Symbol.for("react.suspense"):60113,sT=_r?Symbol.for("react.memo"):60115,oT=_r?Symbol.for("react.lazy"):60116,uw=typeof Symbol==="function"&&Symbol.iterator;function Rl(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,r=1;r<arguments.length;r++)t+="&args[]="+encodeURIComponent(arguments[r]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var cw={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},fw={};function oa(e,t,r){this.props=e,this.context=t,this.refs=fw,this.updater=r||cw}oa.prototype.isReactComponent={};oa.prototype.setState=function(e,t){if(typeof e!=="object"&&typeof e!=="function"&&e!=null)throw Error(Rl(85));this.updater.enqueueSetState(this,e,t,"setState")};oa.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function dw(){}dw.prototype=oa.prototype;function nm(e,t,r){this.props=e,this.context=t,this.refs=fw,this.updater=r||cw}var im=nm.prototype=new dw;im.constructor=nm;rm(im,oa.prototype);im.isPureReactComponent=!0;var sm={current:null},hw=Object.prototype.hasOwnProperty,pw={key:!0,ref:!0,__self:!0,__source:!0};function mw(e,t,r){var n,i={},s=null,a=null;if(t!=null)for(n in t.ref!==void 0&&(a=t.ref),t.key!==void 0&&(s=""+t.key),t)hw.call(t,n)&&!pw.hasOwnProperty(n)&&(i[n]=t[n]);var l=arguments.length-2;if(l===1)i.children=r;else if(1<l){for(var o=Array(l),u=0;u<l;u++)o[u]=arguments[u+2];i.children=o}if(e&&e.defaultProps)for(n in l=e.defaultProps,l)i[n]===void 0&&(i[n]=l[n]);return{$$typeof:Cl,type:e,key:s,ref:a,props:i,_owner:sm.current}}function aT(e,t){return{$$typeof:Cl,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function om(e){return typeof e==="object"&&e!==null&&e.$$typeof===Cl}function lT(e){var t={"=":"=0",":":"=2"};return"$"+(""+e).replace(/[=:]/g,function(r){return t[r]})}var yw=/\/+/g,of=[];function gw(e,t,r,n){if(of.length){var i=of.pop();return i.result=e,i.keyPrefix=t,i.func=r,i.context=n,i.count=0,i}return{result:e,keyPrefix:t,func:r,context:n,count:0}}function vw(e){e.result=null,e.keyPrefix=null,e.func=null,e.context=null,e.count=0,10>of.length&&of.push(e)}function Gp(e,t,r,n){var i=typeof e;if(i==="undefined"||i==="boolean")e=null;var s=!1;if(e===null)s=!0;else switch(i){case"string":case"number":s=!0;break;case"object":switch(e.$$typeof){case Cl:case XI:s=!0}}if(s)return r(n,e,t===""?"."+qp(e,0):t),1;if(s=0,t=t===""?".":t+":",Array.isArray(e))for(var a=0;a<e.length;a++){i=e[a];var l=t+qp(i,a);s+=Gp(i,l,r,n)}else if(e===null||typeof e!=="object"?l=null:(l=uw&&e[uw]||e["@@iterator"],l=typeof l==="function"?l:null),typeof l==="function")for(e=l.call(e),a=0;!(i=e.next()).done;)i=i.value,l=t+qp(i,a++),s+=Gp(i,l,r,n);else if(i==="object")throw r=""+e,Error(Rl(31,r==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":r,""));return s}function em(e,t,r){return e==null?0:Gp(e,"",t,r)}function qp(e,t){return typeof e==="object"&&e!==null&&e.key!=null?lT(e.key):t.toString(36)}function uT(e,t){e.func.call(e.context,t,e.count++)}function cT(e,t,r){var n=e.result,i=e.keyPrefix;e=e.func.call(e.context,t,e.count++),Array.isArray(e)?tm(e,n,r,function(s){return s}):e!=null&&(om(e)&&(e=aT(e,i+(!e.key||t&&t.key===e.key?"":(""+e.key).replace(yw,"$&/")+"/")+r)),n.push(e))}function tm(e,t,r,n,i){var s="";r!=null&&(s=(""+r).replace(yw,"$&/")+"/"),t=gw(t,s,n,i),em(e,cT,t),vw(t)}var _w={current:null};function yn(){var e=_w.current;if(e===null)throw Error(Rl(321));return e}var fT={ReactCurrentDispatcher:_w,ReactCurrentBatchConfig:{suspense:null},ReactCurrentOwner:sm,IsSomeRendererActing:{current:!1},assign:rm};ae.Children={map:function(e,t,r){if(e==null)return e;var n=[];return tm(e,n,null,t,r),n},forEach:function(e,t,r){if(e==null)return e;t=gw(null,null,t,r),em(e,uT,t),vw(t)},count:function(e){return em(e,function(){return null},null)},toArray:function(e){var t=[];return tm(e,t,null,function(r){return r}),t},only:function(e){if(!om(e))throw Error(Rl(143));return e}};ae.Component=oa;ae.Fragment=qI;ae.Profiler=eT;ae.PureComponent=nm;ae.StrictMode=GI;ae.Suspense=iT;ae.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=fT;ae.cloneElement=function(e,t,r){if(e===null||e===void 0)throw Error(Rl(267,e));var n=rm({},e.props),{key:i,ref:s,_owner:a}=e;if(t!=null){if(t.ref!==void 0&&(s=t.ref,a=sm.current),t.key!==void 0&&(i=""+t.key),e.type&&e.type.defaultProps)var l=e.type.defaultProps;for(o in t)hw.call(t,o)&&!pw.hasOwnProperty(o)&&(n[o]=t[o]===void 0&&l!==void 0?l[o]:t[o])}var o=arguments.length-2;if(o===1)n.children=r;else if(1<o){l=Array(o);for(var u=0;u<o;u++)l[u]=arguments[u+2];n.children=l}return{$$typeof:Cl,type:e.type,key:i,ref:s,props:n,_owner:a}};ae.createContext=function(e,t){return t===void 0&&(t=null),e={$$typeof:rT,_calculateChangedBits:t,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null},e.Provider={$$typeof:tT,_context:e},e.Consumer=e};ae.createElement=mw;ae.createFactory=function(e){var t=mw.bind(null,e);return t.type=e,t};ae.createRef=function(){return{current:null}};ae.forwardRef=function(e){return{$$typeof:nT,render:e}};ae.isValidElement=om;ae.lazy=function(e){return{$$typeof:oT,_ctor:e,_status:-1,_result:null}};ae.memo=function(e,t){return{$$typeof:sT,type:e,compare:t===void 0?null:t}};ae.useCallback=function(e,t){return yn().useCallback(e,t)};ae.useContext=function(e,t){return yn().useContext(e,t)};ae.useDebugValue=function(){};ae.useEffect=function(e,t){return yn().useEffect(e,t)};ae.useImperativeHandle=function(e,t,r){return yn().useImperativeHandle(e,t,r)};ae.useLayoutEffect=function(e,t){return yn().useLayoutEffect(e,t)};ae.useMemo=function(e,t){return yn().useMemo(e,t)};ae.useReducer=function(e,t,r){return yn().useReducer(e,t,r)};ae.useRef=function(e){return yn().useRef(e)};ae.useState=function(e){return yn().useState(e)};ae.version="16.14.0"});var Sw=it(function(S3,bw){bw.exports=ww()});var Tw=it(function(af){var hT=ca(),pT=Symbol.for("react.element"),mT=Symbol.for("react.fragment"),yT=Object.prototype.hasOwnProperty,gT=hT.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,vT={key:!0,ref:!0,__self:!0,__source:!0};function Iw(e,t,r){var n,i={},s=null,a=null;r!==void 0&&(s=""+r),t.key!==void 0&&(s=""+t.key),t.ref!==void 0&&(a=t.ref);for(n in t)yT.call(t,n)&&!vT.hasOwnProperty(n)&&(i[n]=t[n]);if(e&&e.defaultProps)for(n in t=e.defaultProps,t)i[n]===void 0&&(i[n]=t[n]);return{$$typeof:pT,type:e,key:s,ref:a,props:i,_owner:gT.current}}af.Fragment=mT;af.jsx=Iw;af.jsxs=Iw});var Pl=it(function(_T,Fw){Fw.exports=Tw()});var zl=Vr(ca()),Ew=Vr(Rv());var zh={};ts(zh,{compareArrayLike:()=>Ph,joinUint8Arrays:()=>Ft,memcpy:()=>Ns,rebaseValueOffsets:()=>ul,toArrayBufferView:()=>Y,toArrayBufferViewAsyncIterator:()=>ar,toArrayBufferViewIterator:()=>Fr,toBigInt64Array:()=>Lh,toBigUint64Array:()=>Uh,toFloat32Array:()=>wS,toFloat32ArrayAsyncIterator:()=>US,toFloat32ArrayIterator:()=>DS,toFloat64Array:()=>bS,toFloat64ArrayAsyncIterator:()=>CS,toFloat64ArrayIterator:()=>AS,toInt16Array:()=>gS,toInt16ArrayAsyncIterator:()=>kS,toInt16ArrayIterator:()=>BS,toInt32Array:()=>Bi,toInt32ArrayAsyncIterator:()=>NS,toInt32ArrayIterator:()=>IS,toInt8Array:()=>yS,toInt8ArrayAsyncIterator:()=>OS,toInt8ArrayIterator:()=>xS,toUint16Array:()=>vS,toUint16ArrayAsyncIterator:()=>MS,toUint16ArrayIterator:()=>TS,toUint32Array:()=>_S,toUint32ArrayAsyncIterator:()=>LS,toUint32ArrayIterator:()=>FS,toUint8Array:()=>L,toUint8ArrayAsyncIterator:()=>Rh,toUint8ArrayIterator:()=>Ch,toUint8ClampedArray:()=>SS,toUint8ClampedArrayAsyncIterator:()=>RS,toUint8ClampedArrayIterator:()=>ES});var g={};g.Offset;g.Table;g.SIZEOF_SHORT=2;g.SIZEOF_INT=4;g.FILE_IDENTIFIER_LENGTH=4;g.Encoding={UTF8_BYTES:1,UTF16_STRING:2};g.int32=new Int32Array(2);g.float32=new Float32Array(g.int32.buffer);g.float64=new Float64Array(g.int32.buffer);g.isLittleEndian=new Uint16Array(new Uint8Array([1,0]).buffer)[0]===1;g.Long=function(e,t){this.low=e|0,this.high=t|0};g.Long.create=function(e,t){return e==0&&t==0?g.Long.ZERO:new g.Long(e,t)};g.Long.prototype.toFloat64=function(){return(this.low>>>0)+this.high*4294967296};g.Long.prototype.equals=function(e){return this.low==e.low&&this.high==e.high};g.Long.ZERO=new g.Long(0,0);g.Builder=function(e){if(!e)var t=1024;else var t=e;this.bb=g.ByteBuffer.allocate(t),this.space=t,this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1};g.Builder.prototype.clear=function(){this.bb.clear(),this.space=this.bb.capacity(),this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1};g.Builder.prototype.forceDefaults=function(e){this.force_defaults=e};g.Builder.prototype.dataBuffer=function(){return this.bb};g.Builder.prototype.asUint8Array=function(){return this.bb.bytes().subarray(this.bb.position(),this.bb.position()+this.offset())};g.Builder.prototype.prep=function(e,t){if(e>this.minalign)this.minalign=e;var r=~(this.bb.capacity()-this.space+t)+1&e-1;while(this.space<r+e+t){var n=this.bb.capacity();this.bb=g.Builder.growByteBuffer(this.bb),this.space+=this.bb.capacity()-n}this.pad(r)};g.Builder.prototype.pad=function(e){for(var t=0;t<e;t++)this.bb.writeInt8(--this.space,0)};g.Builder.prototype.writeInt8=function(e){this.bb.writeInt8(this.space-=1,e)};g.Builder.prototype.writeInt16=function(e){this.bb.writeInt16(this.space-=2,e)};g.Builder.prototype.writeInt32=function(e){this.bb.writeInt32(this.space-=4,e)};g.Builder.prototype.writeInt64=function(e){this.bb.writeInt64(this.space-=8,e)};g.Builder.prototype.writeFloat32=function(e){this.bb.writeFloat32(this.space-=4,e)};g.Builder.prototype.writeFloat64=function(e){this.bb.writeFloat64(this.space-=8,e)};g.Builder.prototype.addInt8=function(e){this.prep(1,0),this.writeInt8(e)};g.Builder.prototype.addInt16=function(e){this.prep(2,0),this.writeInt16(e)};g.Builder.prototype.addInt32=function(e){this.prep(4,0),this.writeInt32(e)};g.Builder.prototype.addInt64=function(e){this.prep(8,0),this.writeInt64(e)};g.Builder.prototype.addFloat32=function(e){this.prep(4,0),this.writeFloat32(e)};g.Builder.prototype.addFloat64=function(e){this.prep(8,0),this.writeFloat64(e)};g.Builder.prototype.addFieldInt8=function(e,t,r){if(this.force_defaults||t!=r)this.addInt8(t),this.slot(e)};g.Builder.prototype.addFieldInt16=function(e,t,r){if(this.force_defaults||t!=r)this.addInt16(t),this.slot(e)};g.Builder.prototype.addFieldInt32=function(e,t,r){if(this.force_defaults||t!=r)this.addInt32(t),this.slot(e)};g.Builder.prototype.addFieldInt64=function(e,t,r){if(this.force_defaults||!t.equals(r))this.addInt64(t),this.slot(e)};g.Builder.prototype.addFieldFloat32=function(e,t,r){if(this.force_defaults||t!=r)this.addFloat32(t),this.slot(e)};g.Builder.prototype.addFieldFloat64=function(e,t,r){if(this.force_defaults||t!=r)this.addFloat64(t),this.slot(e)};g.Builder.prototype.addFieldOffset=function(e,t,r){if(this.force_defaults||t!=r)this.addOffset(t),this.slot(e)};g.Builder.prototype.addFieldStruct=function(e,t,r){if(t!=r)this.nested(t),this.slot(e)};g.Builder.prototype.nested=function(e){if(e!=this.offset())throw Error("FlatBuffers: struct must be serialized inline.")};g.Builder.prototype.notNested=function(){if(this.isNested)throw Error("FlatBuffers: object serialization must not be nested.")};g.Builder.prototype.slot=function(e){this.vtable[e]=this.offset()};g.Builder.prototype.offset=function(){return this.bb.capacity()-this.space};g.Builder.growByteBuffer=function(e){var t=e.capacity();if(t&3221225472)throw Error("FlatBuffers: cannot grow buffer beyond 2 gigabytes.");var r=t<<1,n=g.ByteBuffer.allocate(r);return n.setPosition(r-t),n.bytes().set(e.bytes(),r-t),n};g.Builder.prototype.addOffset=function(e){this.prep(g.SIZEOF_INT,0),this.writeInt32(this.offset()-e+g.SIZEOF_INT)};g.Builder.prototype.startObject=function(e){if(this.notNested(),this.vtable==null)this.vtable=[];this.vtable_in_use=e;for(var t=0;t<e;t++)this.vtable[t]=0;this.isNested=!0,this.object_start=this.offset()};g.Builder.prototype.endObject=function(){if(this.vtable==null||!this.isNested)throw Error("FlatBuffers: endObject called without startObject");this.addInt32(0);var e=this.offset(),t=this.vtable_in_use-1;for(;t>=0&&this.vtable[t]==0;t--);var r=t+1;for(;t>=0;t--)this.addInt16(this.vtable[t]!=0?e-this.vtable[t]:0);var n=2;this.addInt16(e-this.object_start);var i=(r+n)*g.SIZEOF_SHORT;this.addInt16(i);var s=0,a=this.space;e:for(t=0;t<this.vtables.length;t++){var l=this.bb.capacity()-this.vtables[t];if(i==this.bb.readInt16(l)){for(var o=g.SIZEOF_SHORT;o<i;o+=g.SIZEOF_SHORT)if(this.bb.readInt16(a+o)!=this.bb.readInt16(l+o))continue e;s=this.vtables[t];break}}if(s)this.space=this.bb.capacity()-e,this.bb.writeInt32(this.space,s-e);else this.vtables.push(this.offset()),this.bb.writeInt32(this.bb.capacity()-e,this.offset()-e);return this.isNested=!1,e};g.Builder.prototype.finish=function(e,t){if(t){var r=t;if(this.prep(this.minalign,g.SIZEOF_INT+g.FILE_IDENTIFIER_LENGTH),r.length!=g.FILE_IDENTIFIER_LENGTH)throw Error("FlatBuffers: file identifier must be length "+g.FILE_IDENTIFIER_LENGTH);for(var n=g.FILE_IDENTIFIER_LENGTH-1;n>=0;n--)this.writeInt8(r.charCodeAt(n))}this.prep(this.minalign,g.SIZEOF_INT),this.addOffset(e),this.bb.setPosition(this.space)};g.Builder.prototype.requiredField=function(e,t){var r=this.bb.capacity()-e,n=r-this.bb.readInt32(r),i=this.bb.readInt16(n+t)!=0;if(!i)throw Error("FlatBuffers: field "+t+" must be set")};g.Builder.prototype.startVector=function(e,t,r){this.notNested(),this.vector_num_elems=t,this.prep(g.SIZEOF_INT,e*t),this.prep(r,e*t)};g.Builder.prototype.endVector=function(){return this.writeInt32(this.vector_num_elems),this.offset()};g.Builder.prototype.createString=function(e){if(e instanceof Uint8Array)var t=e;else{var t=[],r=0;while(r<e.length){var n,i=e.charCodeAt(r++);if(i<55296||i>=56320)n=i;else{var s=e.charCodeAt(r++);n=(i<<10)+s+-56613888}if(n<128)t.push(n);else{if(n<2048)t.push(n>>6&31|192);else{if(n<65536)t.push(n>>12&15|224);else t.push(n>>18&7|240,n>>12&63|128);t.push(n>>6&63|128)}t.push(n&63|128)}}}this.addInt8(0),this.startVector(1,t.length,1),this.bb.setPosition(this.space-=t.length);for(var r=0,a=this.space,l=this.bb.bytes();r<t.length;r++)l[a++]=t[r];return this.endVector()};g.Builder.prototype.createLong=function(e,t){return g.Long.create(e,t)};g.ByteBuffer=function(e){this.bytes_=e,this.position_=0};g.ByteBuffer.allocate=function(e){return new g.ByteBuffer(new Uint8Array(e))};g.ByteBuffer.prototype.clear=function(){this.position_=0};g.ByteBuffer.prototype.bytes=function(){return this.bytes_};g.ByteBuffer.prototype.position=function(){return this.position_};g.ByteBuffer.prototype.setPosition=function(e){this.position_=e};g.ByteBuffer.prototype.capacity=function(){return this.bytes_.length};g.ByteBuffer.prototype.readInt8=function(e){return this.readUint8(e)<<24>>24};g.ByteBuffer.prototype.readUint8=function(e){return this.bytes_[e]};g.ByteBuffer.prototype.readInt16=function(e){return this.readUint16(e)<<16>>16};g.ByteBuffer.prototype.readUint16=function(e){return this.bytes_[e]|this.bytes_[e+1]<<8};g.ByteBuffer.prototype.readInt32=function(e){return this.bytes_[e]|this.bytes_[e+1]<<8|this.bytes_[e+2]<<16|this.bytes_[e+3]<<24};g.ByteBuffer.prototype.readUint32=function(e){return this.readInt32(e)>>>0};g.ByteBuffer.prototype.readInt64=function(e){return new g.Long(this.readInt32(e),this.readInt32(e+4))};g.ByteBuffer.prototype.readUint64=function(e){return new g.Long(this.readUint32(e),this.readUint32(e+4))};g.ByteBuffer.prototype.readFloat32=function(e){return g.int32[0]=this.readInt32(e),g.float32[0]};g.ByteBuffer.prototype.readFloat64=function(e){return g.int32[g.isLittleEndian?0:1]=this.readInt32(e),g.int32[g.isLittleEndian?1:0]=this.readInt32(e+4),g.float64[0]};g.ByteBuffer.prototype.writeInt8=function(e,t){this.bytes_[e]=t};g.ByteBuffer.prototype.writeUint8=function(e,t){this.bytes_[e]=t};g.ByteBuffer.prototype.writeInt16=function(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8};g.ByteBuffer.prototype.writeUint16=function(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8};g.ByteBuffer.prototype.writeInt32=function(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24};g.ByteBuffer.prototype.writeUint32=function(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24};g.ByteBuffer.prototype.writeInt64=function(e,t){this.writeInt32(e,t.low),this.writeInt32(e+4,t.high)};g.ByteBuffer.prototype.writeUint64=function(e,t){this.writeUint32(e,t.low),this.writeUint32(e+4,t.high)};g.ByteBuffer.prototype.writeFloat32=function(e,t){g.float32[0]=t,this.writeInt32(e,g.int32[0])};g.ByteBuffer.prototype.writeFloat64=function(e,t){g.float64[0]=t,this.writeInt32(e,g.int32[g.isLittleEndian?0:1]),this.writeInt32(e+4,g.int32[g.isLittleEndian?1:0])};g.ByteBuffer.prototype.getBufferIdentifier=function(){if(this.bytes_.length<this.position_+g.SIZEOF_INT+g.FILE_IDENTIFIER_LENGTH)throw Error("FlatBuffers: ByteBuffer is too short to contain an identifier.");var e="";for(var t=0;t<g.FILE_IDENTIFIER_LENGTH;t++)e+=String.fromCharCode(this.readInt8(this.position_+g.SIZEOF_INT+t));return e};g.ByteBuffer.prototype.__offset=function(e,t){var r=e-this.readInt32(e);return t<this.readInt16(r)?this.readInt16(r+t):0};g.ByteBuffer.prototype.__union=function(e,t){return e.bb_pos=t+this.readInt32(t),e.bb=this,e};g.ByteBuffer.prototype.__string=function(e,t){e+=this.readInt32(e);var r=this.readInt32(e),n="",i=0;if(e+=g.SIZEOF_INT,t===g.Encoding.UTF8_BYTES)return this.bytes_.subarray(e,e+r);while(i<r){var s,a=this.readUint8(e+i++);if(a<192)s=a;else{var l=this.readUint8(e+i++);if(a<224)s=(a&31)<<6|l&63;else{var o=this.readUint8(e+i++);if(a<240)s=(a&15)<<12|(l&63)<<6|o&63;else{var u=this.readUint8(e+i++);s=(a&7)<<18|(l&63)<<12|(o&63)<<6|u&63}}}if(s<65536)n+=String.fromCharCode(s);else s-=65536,n+=String.fromCharCode((s>>10)+55296,(s&1023)+56320)}return n};g.ByteBuffer.prototype.__indirect=function(e){return e+this.readInt32(e)};g.ByteBuffer.prototype.__vector=function(e){return e+this.readInt32(e)+g.SIZEOF_INT};g.ByteBuffer.prototype.__vector_len=function(e){return this.readInt32(e+this.readInt32(e))};g.ByteBuffer.prototype.__has_identifier=function(e){if(e.length!=g.FILE_IDENTIFIER_LENGTH)throw Error("FlatBuffers: file identifier must be length "+g.FILE_IDENTIFIER_LENGTH);for(var t=0;t<g.FILE_IDENTIFIER_LENGTH;t++)if(e.charCodeAt(t)!=this.readInt8(this.position_+g.SIZEOF_INT+t))return!1;return!0};g.ByteBuffer.prototype.createLong=function(e,t){return g.Long.create(e,t)};function qr(e,t,r){return t<=e&&e<=r}function fc(e){if(e===void 0)return{};if(e===Object(e))return e;throw TypeError("Could not convert argument to dictionary")}function aS(e){var t=String(e),r=t.length,n=0,i=[];while(n<r){var s=t.charCodeAt(n);if(s<55296||s>57343)i.push(s);else if(56320<=s&&s<=57343)i.push(65533);else if(55296<=s&&s<=56319)if(n===r-1)i.push(65533);else{var a=e.charCodeAt(n+1);if(56320<=a&&a<=57343){var l=s&1023,o=a&1023;i.push(65536+(l<<10)+o),n+=1}else i.push(65533)}n+=1}return i}function lS(e){var t="";for(var r=0;r<e.length;++r){var n=e[r];if(n<=65535)t+=String.fromCharCode(n);else n-=65536,t+=String.fromCharCode((n>>10)+55296,(n&1023)+56320)}return t}var uc=-1;function Oh(e){this.tokens=[].slice.call(e)}Oh.prototype={endOfStream:function(){return!this.tokens.length},read:function(){if(!this.tokens.length)return uc;return this.tokens.shift()},prepend:function(e){if(Array.isArray(e)){var t=e;while(t.length)this.tokens.unshift(t.pop())}else this.tokens.unshift(e)},push:function(e){if(Array.isArray(e)){var t=e;while(t.length)this.tokens.push(t.shift())}else this.tokens.push(e)}};var ks=-1;function Eh(e,t){if(e)throw TypeError("Decoder error");return t||65533}function uS(){}uS.prototype={handler:function(e,t){}};function cS(){}cS.prototype={handler:function(e,t){}};var cc="utf-8";function sl(e,t){if(!(this instanceof sl))return new sl(e,t);if(e=e!==void 0?String(e).toLowerCase():cc,e!==cc)throw Error("Encoding not supported. Only utf-8 is supported");t=fc(t),this._streaming=!1,this._BOMseen=!1,this._decoder=null,this._fatal=Boolean(t.fatal),this._ignoreBOM=Boolean(t.ignoreBOM),Object.defineProperty(this,"encoding",{value:"utf-8"}),Object.defineProperty(this,"fatal",{value:this._fatal}),Object.defineProperty(this,"ignoreBOM",{value:this._ignoreBOM})}sl.prototype={decode:function(t,r){var n;if(typeof t==="object"&&t instanceof ArrayBuffer)n=new Uint8Array(t);else if(typeof t==="object"&&"buffer"in t&&t.buffer instanceof ArrayBuffer)n=new Uint8Array(t.buffer,t.byteOffset,t.byteLength);else n=new Uint8Array(0);if(r=fc(r),!this._streaming)this._decoder=new fS({fatal:this._fatal}),this._BOMseen=!1;this._streaming=Boolean(r.stream);var i=new Oh(n),s=[],a;while(!i.endOfStream()){if(a=this._decoder.handler(i,i.read()),a===ks)break;if(a===null)continue;if(Array.isArray(a))s.push.apply(s,a);else s.push(a)}if(!this._streaming){do{if(a=this._decoder.handler(i,i.read()),a===ks)break;if(a===null)continue;if(Array.isArray(a))s.push.apply(s,a);else s.push(a)}while(!i.endOfStream());this._decoder=null}if(s.length){if(["utf-8"].indexOf(this.encoding)!==-1&&!this._ignoreBOM&&!this._BOMseen)if(s[0]===65279)this._BOMseen=!0,s.shift();else this._BOMseen=!0}return lS(s)}};function ol(e,t){if(!(this instanceof ol))return new ol(e,t);if(e=e!==void 0?String(e).toLowerCase():cc,e!==cc)throw Error("Encoding not supported. Only utf-8 is supported");t=fc(t),this._streaming=!1,this._encoder=null,this._options={fatal:Boolean(t.fatal)},Object.defineProperty(this,"encoding",{value:"utf-8"})}ol.prototype={encode:function(t,r){if(t=t?String(t):"",r=fc(r),!this._streaming)this._encoder=new dS(this._options);this._streaming=Boolean(r.stream);var n=[],i=new Oh(aS(t)),s;while(!i.endOfStream()){if(s=this._encoder.handler(i,i.read()),s===ks)break;if(Array.isArray(s))n.push.apply(n,s);else n.push(s)}if(!this._streaming){while(!0){if(s=this._encoder.handler(i,i.read()),s===ks)break;if(Array.isArray(s))n.push.apply(n,s);else n.push(s)}this._encoder=null}return new Uint8Array(n)}};function fS(e){var t=e.fatal,r=0,n=0,i=0,s=128,a=191;this.handler=function(l,o){if(o===uc&&i!==0)return i=0,Eh(t);if(o===uc)return ks;if(i===0){if(qr(o,0,127))return o;if(qr(o,194,223))i=1,r=o-192;else if(qr(o,224,239)){if(o===224)s=160;if(o===237)a=159;i=2,r=o-224}else if(qr(o,240,244)){if(o===240)s=144;if(o===244)a=143;i=3,r=o-240}else return Eh(t);return r=r<<6*i,null}if(!qr(o,s,a))return r=i=n=0,s=128,a=191,l.prepend(o),Eh(t);if(s=128,a=191,n+=1,r+=o-128<<6*(i-n),n!==i)return null;var u=r;return r=i=n=0,u}}function dS(e){var t=e.fatal;this.handler=function(r,n){if(n===uc)return ks;if(qr(n,0,127))return n;var i,s;if(qr(n,128,2047))i=1,s=192;else if(qr(n,2048,65535))i=2,s=224;else if(qr(n,65536,1114111))i=3,s=240;var a=[(n>>6*i)+s];while(i>0){var l=n>>6*(i-1);a.push(128|l&63),i-=1}return a}}var dc=typeof Buffer==="function"?Buffer:null,Pv=typeof TextDecoder==="function"&&typeof TextEncoder==="function",al=((e)=>{if(Pv||!dc){let t=new e("utf-8");return(r)=>t.decode(r)}return(t)=>{let{buffer:r,byteOffset:n,length:i}=L(t);return dc.from(r,n,i).toString()}})(typeof TextDecoder<"u"?TextDecoder:sl),Pn=((e)=>{if(Pv||!dc){let t=new e;return(r)=>t.encode(r)}return(t="")=>L(dc.from(t,"utf8"))})(typeof TextEncoder<"u"?TextEncoder:ol);var de=Object.freeze({done:!0,value:void 0});class hc{constructor(e){this._json=e}get schema(){return this._json.schema}get batches(){return this._json.batches||[]}get dictionaries(){return this._json.dictionaries||[]}}class sr{tee(){return this._getDOMStream().tee()}pipe(e,t){return this._getNodeStream().pipe(e,t)}pipeTo(e,t){return this._getDOMStream().pipeTo(e,t)}pipeThrough(e,t){return this._getDOMStream().pipeThrough(e,t)}_getDOMStream(){return this._DOMStream||(this._DOMStream=this.toDOMStream())}_getNodeStream(){return this._nodeStream||(this._nodeStream=this.toNodeStream())}}class kh extends sr{constructor(){super();this._values=[],this.resolvers=[],this._closedPromise=new Promise((e)=>this._closedPromiseResolve=e)}get closed(){return this._closedPromise}async cancel(e){await this.return(e)}write(e){if(this._ensureOpen())this.resolvers.length<=0?this._values.push(e):this.resolvers.shift().resolve({done:!1,value:e})}abort(e){if(this._closedPromiseResolve)this.resolvers.length<=0?this._error={error:e}:this.resolvers.shift().reject({done:!0,value:e})}close(){if(this._closedPromiseResolve){let{resolvers:e}=this;while(e.length>0)e.shift().resolve(de);this._closedPromiseResolve(),this._closedPromiseResolve=void 0}}[Symbol.asyncIterator](){return this}toDOMStream(e){return $e.toDOMStream(this._closedPromiseResolve||this._error?this:this._values,e)}toNodeStream(e){return $e.toNodeStream(this._closedPromiseResolve||this._error?this:this._values,e)}async throw(e){return await this.abort(e),de}async return(e){return await this.close(),de}async read(e){return(await this.next(e,"read")).value}async peek(e){return(await this.next(e,"peek")).value}next(...e){if(this._values.length>0)return Promise.resolve({done:!1,value:this._values.shift()});else if(this._error)return Promise.reject({done:!0,value:this._error.error});else if(!this._closedPromiseResolve)return Promise.resolve(de);else return new Promise((t,r)=>{this.resolvers.push({resolve:t,reject:r})})}_ensureOpen(){if(this._closedPromiseResolve)return!0;throw Error(`${this} is closed`)}}var[zv,zn]=(()=>{let e=()=>{throw Error("BigInt is not available in this environment")};function t(){throw e()}return t.asIntN=()=>{throw e()},t.asUintN=()=>{throw e()},typeof BigInt<"u"?[BigInt,!0]:[t,!1]})(),[or,RT]=(()=>{let e=()=>{throw Error("BigInt64Array is not available in this environment")};class t{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}}return typeof BigInt64Array<"u"?[BigInt64Array,!0]:[t,!1]})(),[Gr,PT]=(()=>{let e=()=>{throw Error("BigUint64Array is not available in this environment")};class t{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}}return typeof BigUint64Array<"u"?[BigUint64Array,!0]:[t,!1]})();var hS=(e)=>typeof e==="number",Vv=(e)=>typeof e==="boolean",Qt=(e)=>typeof e==="function",yt=(e)=>e!=null&&Object(e)===e,Tt=(e)=>yt(e)&&Qt(e.then);var Oe=(e)=>yt(e)&&Qt(e[Symbol.iterator]),Ge=(e)=>yt(e)&&Qt(e[Symbol.asyncIterator]),pc=(e)=>yt(e)&&yt(e.schema);var mc=(e)=>yt(e)&&("done"in e)&&("value"in e);var yc=(e)=>yt(e)&&Qt(e.stat)&&hS(e.fd);var gc=(e)=>yt(e)&&ll(e.body),jv=(e)=>yt(e)&&Qt(e.abort)&&Qt(e.getWriter)&&!(e instanceof sr),ll=(e)=>yt(e)&&Qt(e.cancel)&&Qt(e.getReader)&&!(e instanceof sr),$v=(e)=>yt(e)&&Qt(e.end)&&Qt(e.write)&&Vv(e.writable)&&!(e instanceof sr),vc=(e)=>yt(e)&&Qt(e.read)&&Qt(e.pipe)&&Vv(e.readable)&&!(e instanceof sr);var pS=g.ByteBuffer,Mh=typeof SharedArrayBuffer<"u"?SharedArrayBuffer:ArrayBuffer;function mS(e){let t=e[0]?[e[0]]:[],r,n,i,s;for(let a,l,o=0,u=0,c=e.length;++o<c;){if(a=t[u],l=e[o],!a||!l||a.buffer!==l.buffer||l.byteOffset<a.byteOffset){l&&(t[++u]=l);continue}if({byteOffset:r,byteLength:i}=a,{byteOffset:n,byteLength:s}=l,r+i<n||n+s<r){l&&(t[++u]=l);continue}t[u]=new Uint8Array(a.buffer,r,n-r+s)}return t}function Ns(e,t,r=0,n=t.byteLength){let i=e.byteLength,s=new Uint8Array(e.buffer,e.byteOffset,i),a=new Uint8Array(t.buffer,t.byteOffset,Math.min(n,i));return s.set(a,r),e}function Ft(e,t){let r=mS(e),n=r.reduce((c,p)=>c+p.byteLength,0),i,s,a,l=0,o=-1,u=Math.min(t||1/0,n);for(let c=r.length;++o<c;){if(i=r[o],s=i.subarray(0,Math.min(i.length,u-l)),u<=l+s.length){if(s.length<i.length)r[o]=i.subarray(s.length);else if(s.length===i.length)o++;a?Ns(a,s,l):a=s;break}Ns(a||(a=new Uint8Array(u)),s,l),l+=s.length}return[a||new Uint8Array(0),r.slice(o),n-(a?a.byteLength:0)]}function Y(e,t){let r=mc(t)?t.value:t;if(r instanceof e){if(e===Uint8Array)return new e(r.buffer,r.byteOffset,r.byteLength);return r}if(!r)return new e(0);if(typeof r==="string")r=Pn(r);if(r instanceof ArrayBuffer)return new e(r);if(r instanceof Mh)return new e(r);if(r instanceof pS)return Y(e,r.bytes());return!ArrayBuffer.isView(r)?e.from(r):r.byteLength<=0?new e(0):new e(r.buffer,r.byteOffset,r.byteLength/e.BYTES_PER_ELEMENT)}var yS=(e)=>Y(Int8Array,e),gS=(e)=>Y(Int16Array,e),Bi=(e)=>Y(Int32Array,e),Lh=(e)=>Y(or,e),L=(e)=>Y(Uint8Array,e),vS=(e)=>Y(Uint16Array,e),_S=(e)=>Y(Uint32Array,e),Uh=(e)=>Y(Gr,e),wS=(e)=>Y(Float32Array,e),bS=(e)=>Y(Float64Array,e),SS=(e)=>Y(Uint8ClampedArray,e),Nh=(e)=>(e.next(),e);function*Fr(e,t){let r=function*(i){yield i},n=typeof t==="string"?r(t):ArrayBuffer.isView(t)?r(t):t instanceof ArrayBuffer?r(t):t instanceof Mh?r(t):!Oe(t)?r(t):t;yield*Nh(function*(i){let s=null;do s=i.next(yield Y(e,s));while(!s.done)}(n[Symbol.iterator]()))}var xS=(e)=>Fr(Int8Array,e),BS=(e)=>Fr(Int16Array,e),IS=(e)=>Fr(Int32Array,e),Ch=(e)=>Fr(Uint8Array,e),TS=(e)=>Fr(Uint16Array,e),FS=(e)=>Fr(Uint32Array,e),DS=(e)=>Fr(Float32Array,e),AS=(e)=>Fr(Float64Array,e),ES=(e)=>Fr(Uint8ClampedArray,e);async function*ar(e,t){if(Tt(t))return yield*ar(e,await t);let r=async function*(s){yield await s},n=async function*(s){yield*Nh(function*(a){let l=null;do l=a.next(yield l&&l.value);while(!l.done)}(s[Symbol.iterator]()))},i=typeof t==="string"?r(t):ArrayBuffer.isView(t)?r(t):t instanceof ArrayBuffer?r(t):t instanceof Mh?r(t):Oe(t)?n(t):!Ge(t)?r(t):t;yield*Nh(async function*(s){let a=null;do a=await s.next(yield Y(e,a));while(!a.done)}(i[Symbol.asyncIterator]()))}var OS=(e)=>ar(Int8Array,e),kS=(e)=>ar(Int16Array,e),NS=(e)=>ar(Int32Array,e),Rh=(e)=>ar(Uint8Array,e),MS=(e)=>ar(Uint16Array,e),LS=(e)=>ar(Uint32Array,e),US=(e)=>ar(Float32Array,e),CS=(e)=>ar(Float64Array,e),RS=(e)=>ar(Uint8ClampedArray,e);function ul(e,t,r){if(e!==0){r=r.slice(0,t+1);for(let n=-1;++n<=t;)r[n]+=e}return r}function Ph(e,t){let r=0,n=e.length;if(n!==t.length)return!1;if(n>0)do if(e[r]!==t[r])return!1;while(++r<n);return!0}var $e={fromIterable(e){return _c(PS(e))},fromAsyncIterable(e){return _c(zS(e))},fromDOMStream(e){return _c(VS(e))},fromNodeStream(e){return _c(jS(e))},toDOMStream(e,t){throw Error('"toDOMStream" not available in this environment')},toNodeStream(e,t){throw Error('"toNodeStream" not available in this environment')}},_c=(e)=>(e.next(),e);function*PS(e){let t,r=!1,n=[],i,s,a,l=0;function o(){if(s==="peek")return Ft(n,a)[0];return[i,n,l]=Ft(n,a),i}({cmd:s,size:a}=yield null);let u=Ch(e)[Symbol.iterator]();try{do{if({done:t,value:i}=isNaN(a-l)?u.next(void 0):u.next(a-l),!t&&i.byteLength>0)n.push(i),l+=i.byteLength;if(t||a<=l)do({cmd:s,size:a}=yield o());while(a<l)}while(!t)}catch(c){(r=!0)&&typeof u.throw==="function"&&u.throw(c)}finally{r===!1&&typeof u.return==="function"&&u.return()}}async function*zS(e){let t,r=!1,n=[],i,s,a,l=0;function o(){if(s==="peek")return Ft(n,a)[0];return[i,n,l]=Ft(n,a),i}({cmd:s,size:a}=yield null);let u=Rh(e)[Symbol.asyncIterator]();try{do{if({done:t,value:i}=isNaN(a-l)?await u.next(void 0):await u.next(a-l),!t&&i.byteLength>0)n.push(i),l+=i.byteLength;if(t||a<=l)do({cmd:s,size:a}=yield o());while(a<l)}while(!t)}catch(c){(r=!0)&&typeof u.throw==="function"&&await u.throw(c)}finally{r===!1&&typeof u.return==="function"&&await u.return()}}async function*VS(e){let t=!1,r=!1,n=[],i,s,a,l=0;function o(){if(s==="peek")return Ft(n,a)[0];return[i,n,l]=Ft(n,a),i}({cmd:s,size:a}=yield null);let u=new Wv(e);try{do{if({done:t,value:i}=isNaN(a-l)?await u.read(void 0):await u.read(a-l),!t&&i.byteLength>0)n.push(L(i)),l+=i.byteLength;if(t||a<=l)do({cmd:s,size:a}=yield o());while(a<l)}while(!t)}catch(c){(r=!0)&&await u.cancel(c)}finally{r===!1?await u.cancel():e.locked&&u.releaseLock()}}class Wv{constructor(e){this.source=e,this.byobReader=null,this.defaultReader=null;try{this.supportsBYOB=!!(this.reader=this.getBYOBReader())}catch(t){this.supportsBYOB=!(this.reader=this.getDefaultReader())}}get closed(){return this.reader?this.reader.closed.catch(()=>{}):Promise.resolve()}releaseLock(){if(this.reader)this.reader.releaseLock();this.reader=this.byobReader=this.defaultReader=null}async cancel(e){let{reader:t,source:r}=this;t&&await t.cancel(e).catch(()=>{}),r&&(r.locked&&this.releaseLock())}async read(e){if(e===0)return{done:this.reader==null,value:new Uint8Array(0)};let t=!this.supportsBYOB||typeof e!=="number"?await this.getDefaultReader().read():await this.readFromBYOBReader(e);return!t.done&&(t.value=L(t)),t}getDefaultReader(){if(this.byobReader)this.releaseLock();if(!this.defaultReader)this.defaultReader=this.source.getReader(),this.defaultReader.closed.catch(()=>{});return this.reader=this.defaultReader}getBYOBReader(){if(this.defaultReader)this.releaseLock();if(!this.byobReader)this.byobReader=this.source.getReader({mode:"byob"}),this.byobReader.closed.catch(()=>{});return this.reader=this.byobReader}async readFromBYOBReader(e){return await Hv(this.getBYOBReader(),new ArrayBuffer(e),0,e)}}async function Hv(e,t,r,n){if(r>=n)return{done:!1,value:new Uint8Array(t,0,n)};let{done:i,value:s}=await e.read(new Uint8Array(t,r,n-r));if((r+=s.byteLength)<n&&!i)return await Hv(e,s.buffer,r,n);return{done:i,value:new Uint8Array(s.buffer,0,r)}}var Vh=(e,t)=>{let r=(i)=>n([t,i]),n;return[t,r,new Promise((i)=>(n=i)&&e.once(t,r))]};async function*jS(e){let t=[],r="error",n=!1,i=null,s,a,l=0,o=[],u;function c(){if(s==="peek")return Ft(o,a)[0];return[u,o,l]=Ft(o,a),u}if({cmd:s,size:a}=yield null,e.isTTY)return yield new Uint8Array(0);try{t[0]=Vh(e,"end"),t[1]=Vh(e,"error");do{if(t[2]=Vh(e,"readable"),[r,i]=await Promise.race(t.map((y)=>y[2])),r==="error")break;if(!(n=r==="end")){if(!isFinite(a-l))u=L(e.read(void 0));else if(u=L(e.read(a-l)),u.byteLength<a-l)u=L(e.read(void 0));if(u.byteLength>0)o.push(u),l+=u.byteLength}if(n||a<=l)do({cmd:s,size:a}=yield c());while(a<l)}while(!n)}finally{await p(t,r==="error"?i:null)}function p(y,_){return u=o=null,new Promise(async(x,B)=>{for(let[re,h]of y)e.off(re,h);try{let re=e.destroy;re&&re.call(e,_),_=void 0}catch(re){_=re||_}finally{_!=null?B(_):x()}})}}class F{}var v;(function(e){var t;(function(r){var n;(function(i){var s;(function(a){let l;(function(o){o[o.V1=0]="V1",o[o.V2=1]="V2",o[o.V3=2]="V3",o[o.V4=3]="V4"})(l=a.MetadataVersion||(a.MetadataVersion={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){let l;(function(o){o[o.Sparse=0]="Sparse",o[o.Dense=1]="Dense"})(l=a.UnionMode||(a.UnionMode={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){let l;(function(o){o[o.HALF=0]="HALF",o[o.SINGLE=1]="SINGLE",o[o.DOUBLE=2]="DOUBLE"})(l=a.Precision||(a.Precision={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){let l;(function(o){o[o.DAY=0]="DAY",o[o.MILLISECOND=1]="MILLISECOND"})(l=a.DateUnit||(a.DateUnit={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){let l;(function(o){o[o.SECOND=0]="SECOND",o[o.MILLISECOND=1]="MILLISECOND",o[o.MICROSECOND=2]="MICROSECOND",o[o.NANOSECOND=3]="NANOSECOND"})(l=a.TimeUnit||(a.TimeUnit={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){let l;(function(o){o[o.YEAR_MONTH=0]="YEAR_MONTH",o[o.DAY_TIME=1]="DAY_TIME"})(l=a.IntervalUnit||(a.IntervalUnit={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){let l;(function(o){o[o.NONE=0]="NONE",o[o.Null=1]="Null",o[o.Int=2]="Int",o[o.FloatingPoint=3]="FloatingPoint",o[o.Binary=4]="Binary",o[o.Utf8=5]="Utf8",o[o.Bool=6]="Bool",o[o.Decimal=7]="Decimal",o[o.Date=8]="Date",o[o.Time=9]="Time",o[o.Timestamp=10]="Timestamp",o[o.Interval=11]="Interval",o[o.List=12]="List",o[o.Struct_=13]="Struct_",o[o.Union=14]="Union",o[o.FixedSizeBinary=15]="FixedSizeBinary",o[o.FixedSizeList=16]="FixedSizeList",o[o.Map=17]="Map",o[o.Duration=18]="Duration",o[o.LargeBinary=19]="LargeBinary",o[o.LargeUtf8=20]="LargeUtf8",o[o.LargeList=21]="LargeList"})(l=a.Type||(a.Type={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){let l;(function(o){o[o.Little=0]="Little",o[o.Big=1]="Big"})(l=a.Endianness||(a.Endianness={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsNull(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startNull(o){o.startObject(0)}static endNull(o){return o.endObject()}static createNull(o){return l.startNull(o),l.endNull(o)}}a.Null=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsStruct_(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startStruct_(o){o.startObject(0)}static endStruct_(o){return o.endObject()}static createStruct_(o){return l.startStruct_(o),l.endStruct_(o)}}a.Struct_=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsList(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startList(o){o.startObject(0)}static endList(o){return o.endObject()}static createList(o){return l.startList(o),l.endList(o)}}a.List=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsLargeList(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startLargeList(o){o.startObject(0)}static endLargeList(o){return o.endObject()}static createLargeList(o){return l.startLargeList(o),l.endLargeList(o)}}a.LargeList=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsFixedSizeList(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}listSize(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt32(this.bb_pos+o):0}static startFixedSizeList(o){o.startObject(1)}static addListSize(o,u){o.addFieldInt32(0,u,0)}static endFixedSizeList(o){return o.endObject()}static createFixedSizeList(o,u){return l.startFixedSizeList(o),l.addListSize(o,u),l.endFixedSizeList(o)}}a.FixedSizeList=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsMap(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}keysSorted(){let o=this.bb.__offset(this.bb_pos,4);return o?!!this.bb.readInt8(this.bb_pos+o):!1}static startMap(o){o.startObject(1)}static addKeysSorted(o,u){o.addFieldInt8(0,+u,0)}static endMap(o){return o.endObject()}static createMap(o,u){return l.startMap(o),l.addKeysSorted(o,u),l.endMap(o)}}a.Map=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsUnion(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}mode(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):e.apache.arrow.flatbuf.UnionMode.Sparse}typeIds(o){let u=this.bb.__offset(this.bb_pos,6);return u?this.bb.readInt32(this.bb.__vector(this.bb_pos+u)+o*4):0}typeIdsLength(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.__vector_len(this.bb_pos+o):0}typeIdsArray(){let o=this.bb.__offset(this.bb_pos,6);return o?new Int32Array(this.bb.bytes().buffer,this.bb.bytes().byteOffset+this.bb.__vector(this.bb_pos+o),this.bb.__vector_len(this.bb_pos+o)):null}static startUnion(o){o.startObject(2)}static addMode(o,u){o.addFieldInt16(0,u,e.apache.arrow.flatbuf.UnionMode.Sparse)}static addTypeIds(o,u){o.addFieldOffset(1,u,0)}static createTypeIdsVector(o,u){o.startVector(4,u.length,4);for(let c=u.length-1;c>=0;c--)o.addInt32(u[c]);return o.endVector()}static startTypeIdsVector(o,u){o.startVector(4,u,4)}static endUnion(o){return o.endObject()}static createUnion(o,u,c){return l.startUnion(o),l.addMode(o,u),l.addTypeIds(o,c),l.endUnion(o)}}a.Union=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsInt(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}bitWidth(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt32(this.bb_pos+o):0}isSigned(){let o=this.bb.__offset(this.bb_pos,6);return o?!!this.bb.readInt8(this.bb_pos+o):!1}static startInt(o){o.startObject(2)}static addBitWidth(o,u){o.addFieldInt32(0,u,0)}static addIsSigned(o,u){o.addFieldInt8(1,+u,0)}static endInt(o){return o.endObject()}static createInt(o,u,c){return l.startInt(o),l.addBitWidth(o,u),l.addIsSigned(o,c),l.endInt(o)}}a.Int=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsFloatingPoint(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}precision(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):e.apache.arrow.flatbuf.Precision.HALF}static startFloatingPoint(o){o.startObject(1)}static addPrecision(o,u){o.addFieldInt16(0,u,e.apache.arrow.flatbuf.Precision.HALF)}static endFloatingPoint(o){return o.endObject()}static createFloatingPoint(o,u){return l.startFloatingPoint(o),l.addPrecision(o,u),l.endFloatingPoint(o)}}a.FloatingPoint=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsUtf8(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startUtf8(o){o.startObject(0)}static endUtf8(o){return o.endObject()}static createUtf8(o){return l.startUtf8(o),l.endUtf8(o)}}a.Utf8=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsBinary(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startBinary(o){o.startObject(0)}static endBinary(o){return o.endObject()}static createBinary(o){return l.startBinary(o),l.endBinary(o)}}a.Binary=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsLargeUtf8(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startLargeUtf8(o){o.startObject(0)}static endLargeUtf8(o){return o.endObject()}static createLargeUtf8(o){return l.startLargeUtf8(o),l.endLargeUtf8(o)}}a.LargeUtf8=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsLargeBinary(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startLargeBinary(o){o.startObject(0)}static endLargeBinary(o){return o.endObject()}static createLargeBinary(o){return l.startLargeBinary(o),l.endLargeBinary(o)}}a.LargeBinary=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsFixedSizeBinary(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}byteWidth(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt32(this.bb_pos+o):0}static startFixedSizeBinary(o){o.startObject(1)}static addByteWidth(o,u){o.addFieldInt32(0,u,0)}static endFixedSizeBinary(o){return o.endObject()}static createFixedSizeBinary(o,u){return l.startFixedSizeBinary(o),l.addByteWidth(o,u),l.endFixedSizeBinary(o)}}a.FixedSizeBinary=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsBool(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}static startBool(o){o.startObject(0)}static endBool(o){return o.endObject()}static createBool(o){return l.startBool(o),l.endBool(o)}}a.Bool=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsDecimal(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}precision(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt32(this.bb_pos+o):0}scale(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.readInt32(this.bb_pos+o):0}static startDecimal(o){o.startObject(2)}static addPrecision(o,u){o.addFieldInt32(0,u,0)}static addScale(o,u){o.addFieldInt32(1,u,0)}static endDecimal(o){return o.endObject()}static createDecimal(o,u,c){return l.startDecimal(o),l.addPrecision(o,u),l.addScale(o,c),l.endDecimal(o)}}a.Decimal=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsDate(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}unit(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):e.apache.arrow.flatbuf.DateUnit.MILLISECOND}static startDate(o){o.startObject(1)}static addUnit(o,u){o.addFieldInt16(0,u,e.apache.arrow.flatbuf.DateUnit.MILLISECOND)}static endDate(o){return o.endObject()}static createDate(o,u){return l.startDate(o),l.addUnit(o,u),l.endDate(o)}}a.Date=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsTime(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}unit(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):e.apache.arrow.flatbuf.TimeUnit.MILLISECOND}bitWidth(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.readInt32(this.bb_pos+o):32}static startTime(o){o.startObject(2)}static addUnit(o,u){o.addFieldInt16(0,u,e.apache.arrow.flatbuf.TimeUnit.MILLISECOND)}static addBitWidth(o,u){o.addFieldInt32(1,u,32)}static endTime(o){return o.endObject()}static createTime(o,u,c){return l.startTime(o),l.addUnit(o,u),l.addBitWidth(o,c),l.endTime(o)}}a.Time=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsTimestamp(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}unit(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):e.apache.arrow.flatbuf.TimeUnit.SECOND}timezone(o){let u=this.bb.__offset(this.bb_pos,6);return u?this.bb.__string(this.bb_pos+u,o):null}static startTimestamp(o){o.startObject(2)}static addUnit(o,u){o.addFieldInt16(0,u,e.apache.arrow.flatbuf.TimeUnit.SECOND)}static addTimezone(o,u){o.addFieldOffset(1,u,0)}static endTimestamp(o){return o.endObject()}static createTimestamp(o,u,c){return l.startTimestamp(o),l.addUnit(o,u),l.addTimezone(o,c),l.endTimestamp(o)}}a.Timestamp=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsInterval(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}unit(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):e.apache.arrow.flatbuf.IntervalUnit.YEAR_MONTH}static startInterval(o){o.startObject(1)}static addUnit(o,u){o.addFieldInt16(0,u,e.apache.arrow.flatbuf.IntervalUnit.YEAR_MONTH)}static endInterval(o){return o.endObject()}static createInterval(o,u){return l.startInterval(o),l.addUnit(o,u),l.endInterval(o)}}a.Interval=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsDuration(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}unit(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):e.apache.arrow.flatbuf.TimeUnit.MILLISECOND}static startDuration(o){o.startObject(1)}static addUnit(o,u){o.addFieldInt16(0,u,e.apache.arrow.flatbuf.TimeUnit.MILLISECOND)}static endDuration(o){return o.endObject()}static createDuration(o,u){return l.startDuration(o),l.addUnit(o,u),l.endDuration(o)}}a.Duration=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsKeyValue(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}key(o){let u=this.bb.__offset(this.bb_pos,4);return u?this.bb.__string(this.bb_pos+u,o):null}value(o){let u=this.bb.__offset(this.bb_pos,6);return u?this.bb.__string(this.bb_pos+u,o):null}static startKeyValue(o){o.startObject(2)}static addKey(o,u){o.addFieldOffset(0,u,0)}static addValue(o,u){o.addFieldOffset(1,u,0)}static endKeyValue(o){return o.endObject()}static createKeyValue(o,u,c){return l.startKeyValue(o),l.addKey(o,u),l.addValue(o,c),l.endKeyValue(o)}}a.KeyValue=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsDictionaryEncoding(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}id(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt64(this.bb_pos+o):this.bb.createLong(0,0)}indexType(o){let u=this.bb.__offset(this.bb_pos,6);return u?(o||new e.apache.arrow.flatbuf.Int).__init(this.bb.__indirect(this.bb_pos+u),this.bb):null}isOrdered(){let o=this.bb.__offset(this.bb_pos,8);return o?!!this.bb.readInt8(this.bb_pos+o):!1}static startDictionaryEncoding(o){o.startObject(3)}static addId(o,u){o.addFieldInt64(0,u,o.createLong(0,0))}static addIndexType(o,u){o.addFieldOffset(1,u,0)}static addIsOrdered(o,u){o.addFieldInt8(2,+u,0)}static endDictionaryEncoding(o){return o.endObject()}static createDictionaryEncoding(o,u,c,p){return l.startDictionaryEncoding(o),l.addId(o,u),l.addIndexType(o,c),l.addIsOrdered(o,p),l.endDictionaryEncoding(o)}}a.DictionaryEncoding=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsField(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}name(o){let u=this.bb.__offset(this.bb_pos,4);return u?this.bb.__string(this.bb_pos+u,o):null}nullable(){let o=this.bb.__offset(this.bb_pos,6);return o?!!this.bb.readInt8(this.bb_pos+o):!1}typeType(){let o=this.bb.__offset(this.bb_pos,8);return o?this.bb.readUint8(this.bb_pos+o):e.apache.arrow.flatbuf.Type.NONE}type(o){let u=this.bb.__offset(this.bb_pos,10);return u?this.bb.__union(o,this.bb_pos+u):null}dictionary(o){let u=this.bb.__offset(this.bb_pos,12);return u?(o||new e.apache.arrow.flatbuf.DictionaryEncoding).__init(this.bb.__indirect(this.bb_pos+u),this.bb):null}children(o,u){let c=this.bb.__offset(this.bb_pos,14);return c?(u||new e.apache.arrow.flatbuf.Field).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+c)+o*4),this.bb):null}childrenLength(){let o=this.bb.__offset(this.bb_pos,14);return o?this.bb.__vector_len(this.bb_pos+o):0}customMetadata(o,u){let c=this.bb.__offset(this.bb_pos,16);return c?(u||new e.apache.arrow.flatbuf.KeyValue).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+c)+o*4),this.bb):null}customMetadataLength(){let o=this.bb.__offset(this.bb_pos,16);return o?this.bb.__vector_len(this.bb_pos+o):0}static startField(o){o.startObject(7)}static addName(o,u){o.addFieldOffset(0,u,0)}static addNullable(o,u){o.addFieldInt8(1,+u,0)}static addTypeType(o,u){o.addFieldInt8(2,u,e.apache.arrow.flatbuf.Type.NONE)}static addType(o,u){o.addFieldOffset(3,u,0)}static addDictionary(o,u){o.addFieldOffset(4,u,0)}static addChildren(o,u){o.addFieldOffset(5,u,0)}static createChildrenVector(o,u){o.startVector(4,u.length,4);for(let c=u.length-1;c>=0;c--)o.addOffset(u[c]);return o.endVector()}static startChildrenVector(o,u){o.startVector(4,u,4)}static addCustomMetadata(o,u){o.addFieldOffset(6,u,0)}static createCustomMetadataVector(o,u){o.startVector(4,u.length,4);for(let c=u.length-1;c>=0;c--)o.addOffset(u[c]);return o.endVector()}static startCustomMetadataVector(o,u){o.startVector(4,u,4)}static endField(o){return o.endObject()}static createField(o,u,c,p,y,_,x,B){return l.startField(o),l.addName(o,u),l.addNullable(o,c),l.addTypeType(o,p),l.addType(o,y),l.addDictionary(o,_),l.addChildren(o,x),l.addCustomMetadata(o,B),l.endField(o)}}a.Field=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}offset(){return this.bb.readInt64(this.bb_pos)}length(){return this.bb.readInt64(this.bb_pos+8)}static createBuffer(o,u,c){return o.prep(8,16),o.writeInt64(c),o.writeInt64(u),o.offset()}}a.Buffer=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsSchema(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}endianness(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):e.apache.arrow.flatbuf.Endianness.Little}fields(o,u){let c=this.bb.__offset(this.bb_pos,6);return c?(u||new e.apache.arrow.flatbuf.Field).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+c)+o*4),this.bb):null}fieldsLength(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.__vector_len(this.bb_pos+o):0}customMetadata(o,u){let c=this.bb.__offset(this.bb_pos,8);return c?(u||new e.apache.arrow.flatbuf.KeyValue).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+c)+o*4),this.bb):null}customMetadataLength(){let o=this.bb.__offset(this.bb_pos,8);return o?this.bb.__vector_len(this.bb_pos+o):0}static startSchema(o){o.startObject(3)}static addEndianness(o,u){o.addFieldInt16(0,u,e.apache.arrow.flatbuf.Endianness.Little)}static addFields(o,u){o.addFieldOffset(1,u,0)}static createFieldsVector(o,u){o.startVector(4,u.length,4);for(let c=u.length-1;c>=0;c--)o.addOffset(u[c]);return o.endVector()}static startFieldsVector(o,u){o.startVector(4,u,4)}static addCustomMetadata(o,u){o.addFieldOffset(2,u,0)}static createCustomMetadataVector(o,u){o.startVector(4,u.length,4);for(let c=u.length-1;c>=0;c--)o.addOffset(u[c]);return o.endVector()}static startCustomMetadataVector(o,u){o.startVector(4,u,4)}static endSchema(o){return o.endObject()}static finishSchemaBuffer(o,u){o.finish(u)}static createSchema(o,u,c,p){return l.startSchema(o),l.addEndianness(o,u),l.addFields(o,c),l.addCustomMetadata(o,p),l.endSchema(o)}}a.Schema=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(v||(v={}));var ke;(function(e){var t;(function(r){var n;(function(i){var s;(function(a){a.Schema=v.apache.arrow.flatbuf.Schema})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(ke||(ke={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){let l;(function(o){o[o.NONE=0]="NONE",o[o.Schema=1]="Schema",o[o.DictionaryBatch=2]="DictionaryBatch",o[o.RecordBatch=3]="RecordBatch",o[o.Tensor=4]="Tensor",o[o.SparseTensor=5]="SparseTensor"})(l=a.MessageHeader||(a.MessageHeader={}))})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(ke||(ke={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}length(){return this.bb.readInt64(this.bb_pos)}nullCount(){return this.bb.readInt64(this.bb_pos+8)}static createFieldNode(o,u,c){return o.prep(8,16),o.writeInt64(c),o.writeInt64(u),o.offset()}}a.FieldNode=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(ke||(ke={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsRecordBatch(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}length(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt64(this.bb_pos+o):this.bb.createLong(0,0)}nodes(o,u){let c=this.bb.__offset(this.bb_pos,6);return c?(u||new e.apache.arrow.flatbuf.FieldNode).__init(this.bb.__vector(this.bb_pos+c)+o*16,this.bb):null}nodesLength(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.__vector_len(this.bb_pos+o):0}buffers(o,u){let c=this.bb.__offset(this.bb_pos,8);return c?(u||new v.apache.arrow.flatbuf.Buffer).__init(this.bb.__vector(this.bb_pos+c)+o*16,this.bb):null}buffersLength(){let o=this.bb.__offset(this.bb_pos,8);return o?this.bb.__vector_len(this.bb_pos+o):0}static startRecordBatch(o){o.startObject(3)}static addLength(o,u){o.addFieldInt64(0,u,o.createLong(0,0))}static addNodes(o,u){o.addFieldOffset(1,u,0)}static startNodesVector(o,u){o.startVector(16,u,8)}static addBuffers(o,u){o.addFieldOffset(2,u,0)}static startBuffersVector(o,u){o.startVector(16,u,8)}static endRecordBatch(o){return o.endObject()}static createRecordBatch(o,u,c,p){return l.startRecordBatch(o),l.addLength(o,u),l.addNodes(o,c),l.addBuffers(o,p),l.endRecordBatch(o)}}a.RecordBatch=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(ke||(ke={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsDictionaryBatch(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}id(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt64(this.bb_pos+o):this.bb.createLong(0,0)}data(o){let u=this.bb.__offset(this.bb_pos,6);return u?(o||new e.apache.arrow.flatbuf.RecordBatch).__init(this.bb.__indirect(this.bb_pos+u),this.bb):null}isDelta(){let o=this.bb.__offset(this.bb_pos,8);return o?!!this.bb.readInt8(this.bb_pos+o):!1}static startDictionaryBatch(o){o.startObject(3)}static addId(o,u){o.addFieldInt64(0,u,o.createLong(0,0))}static addData(o,u){o.addFieldOffset(1,u,0)}static addIsDelta(o,u){o.addFieldInt8(2,+u,0)}static endDictionaryBatch(o){return o.endObject()}static createDictionaryBatch(o,u,c,p){return l.startDictionaryBatch(o),l.addId(o,u),l.addData(o,c),l.addIsDelta(o,p),l.endDictionaryBatch(o)}}a.DictionaryBatch=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(ke||(ke={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsMessage(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}version(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):v.apache.arrow.flatbuf.MetadataVersion.V1}headerType(){let o=this.bb.__offset(this.bb_pos,6);return o?this.bb.readUint8(this.bb_pos+o):e.apache.arrow.flatbuf.MessageHeader.NONE}header(o){let u=this.bb.__offset(this.bb_pos,8);return u?this.bb.__union(o,this.bb_pos+u):null}bodyLength(){let o=this.bb.__offset(this.bb_pos,10);return o?this.bb.readInt64(this.bb_pos+o):this.bb.createLong(0,0)}customMetadata(o,u){let c=this.bb.__offset(this.bb_pos,12);return c?(u||new v.apache.arrow.flatbuf.KeyValue).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+c)+o*4),this.bb):null}customMetadataLength(){let o=this.bb.__offset(this.bb_pos,12);return o?this.bb.__vector_len(this.bb_pos+o):0}static startMessage(o){o.startObject(5)}static addVersion(o,u){o.addFieldInt16(0,u,v.apache.arrow.flatbuf.MetadataVersion.V1)}static addHeaderType(o,u){o.addFieldInt8(1,u,e.apache.arrow.flatbuf.MessageHeader.NONE)}static addHeader(o,u){o.addFieldOffset(2,u,0)}static addBodyLength(o,u){o.addFieldInt64(3,u,o.createLong(0,0))}static addCustomMetadata(o,u){o.addFieldOffset(4,u,0)}static createCustomMetadataVector(o,u){o.startVector(4,u.length,4);for(let c=u.length-1;c>=0;c--)o.addOffset(u[c]);return o.endVector()}static startCustomMetadataVector(o,u){o.startVector(4,u,4)}static endMessage(o){return o.endObject()}static finishMessageBuffer(o,u){o.finish(u)}static createMessage(o,u,c,p,y,_){return l.startMessage(o),l.addVersion(o,u),l.addHeaderType(o,c),l.addHeader(o,p),l.addBodyLength(o,y),l.addCustomMetadata(o,_),l.endMessage(o)}}a.Message=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(ke||(ke={}));var jh=v.apache.arrow.flatbuf.Type,Be=v.apache.arrow.flatbuf.DateUnit,Q=v.apache.arrow.flatbuf.TimeUnit,De=v.apache.arrow.flatbuf.Precision,Ie=v.apache.arrow.flatbuf.UnionMode,gt=v.apache.arrow.flatbuf.IntervalUnit,ee=ke.apache.arrow.flatbuf.MessageHeader,et=v.apache.arrow.flatbuf.MetadataVersion,f;(function(e){e[e.NONE=0]="NONE",e[e.Null=1]="Null",e[e.Int=2]="Int",e[e.Float=3]="Float",e[e.Binary=4]="Binary",e[e.Utf8=5]="Utf8",e[e.Bool=6]="Bool",e[e.Decimal=7]="Decimal",e[e.Date=8]="Date",e[e.Time=9]="Time",e[e.Timestamp=10]="Timestamp",e[e.Interval=11]="Interval",e[e.List=12]="List",e[e.Struct=13]="Struct",e[e.Union=14]="Union",e[e.FixedSizeBinary=15]="FixedSizeBinary",e[e.FixedSizeList=16]="FixedSizeList",e[e.Map=17]="Map",e[e.Dictionary=-1]="Dictionary",e[e.Int8=-2]="Int8",e[e.Int16=-3]="Int16",e[e.Int32=-4]="Int32",e[e.Int64=-5]="Int64",e[e.Uint8=-6]="Uint8",e[e.Uint16=-7]="Uint16",e[e.Uint32=-8]="Uint32",e[e.Uint64=-9]="Uint64",e[e.Float16=-10]="Float16",e[e.Float32=-11]="Float32",e[e.Float64=-12]="Float64",e[e.DateDay=-13]="DateDay",e[e.DateMillisecond=-14]="DateMillisecond",e[e.TimestampSecond=-15]="TimestampSecond",e[e.TimestampMillisecond=-16]="TimestampMillisecond",e[e.TimestampMicrosecond=-17]="TimestampMicrosecond",e[e.TimestampNanosecond=-18]="TimestampNanosecond",e[e.TimeSecond=-19]="TimeSecond",e[e.TimeMillisecond=-20]="TimeMillisecond",e[e.TimeMicrosecond=-21]="TimeMicrosecond",e[e.TimeNanosecond=-22]="TimeNanosecond",e[e.DenseUnion=-23]="DenseUnion",e[e.SparseUnion=-24]="SparseUnion",e[e.IntervalDayTime=-25]="IntervalDayTime",e[e.IntervalYearMonth=-26]="IntervalYearMonth"})(f||(f={}));var D;(function(e){e[e.OFFSET=0]="OFFSET",e[e.DATA=1]="DATA",e[e.VALIDITY=2]="VALIDITY",e[e.TYPE=3]="TYPE"})(D||(D={}));var Hh={};ts(Hh,{getBit:()=>$h,getBool:()=>dl,iterateBits:()=>Vn,packBools:()=>Ii,popcnt_array:()=>Kv,popcnt_bit_range:()=>fl,popcnt_uint32:()=>wc,setBool:()=>Wh,truncateBitmap:()=>Ms});function dl(e,t,r,n){return(r&1<<n)!==0}function $h(e,t,r,n){return(r&1<<n)>>n}function Wh(e,t,r){return r?!!(e[t>>3]|=1<<t%8)||!0:!(e[t>>3]&=~(1<<t%8))&&!1}function Ms(e,t,r){let n=r.byteLength+7&-8;if(e>0||r.byteLength<n){let i=new Uint8Array(n);return i.set(e%8===0?r.subarray(e>>3):Ii(Vn(r,e,t,null,dl)).subarray(0,n)),i}return r}function Ii(e){let t=[],r=0,n=0,i=0;for(let a of e)if(a&&(i|=1<<n),++n===8)t[r++]=i,i=n=0;if(r===0||n>0)t[r++]=i;let s=new Uint8Array(t.length+7&-8);return s.set(t),s}function*Vn(e,t,r,n,i){let s=t%8,a=t>>3,l=0,o=r;for(;o>0;s=0){let u=e[a++];do yield i(n,l++,u,s);while(--o>0&&++s<8)}}function fl(e,t,r){if(r-t<=0)return 0;if(r-t<8){let s=0;for(let a of Vn(e,t,r-t,e,$h))s+=a;return s}let n=r>>3<<3,i=t+(t%8===0?0:8-t%8);return fl(e,t,i)+fl(e,n,r)+Kv(e,i>>3,n-i>>3)}function Kv(e,t,r){let n=0,i=t|0,s=new DataView(e.buffer,e.byteOffset,e.byteLength),a=r===void 0?e.byteLength:i+r;while(a-i>=4)n+=wc(s.getUint32(i)),i+=4;while(a-i>=2)n+=wc(s.getUint16(i)),i+=2;while(a-i>=1)n+=wc(s.getUint8(i)),i+=1;return n}function wc(e){let t=e|0;return t=t-(t>>>1&1431655765),t=(t&858993459)+(t>>>2&858993459),(t+(t>>>4)&252645135)*16843009>>>24}class A{visitMany(e,...t){return e.map((r,n)=>this.visit(r,...t.map((i)=>i[n])))}visit(...e){return this.getVisitFn(e[0],!1).apply(this,e)}getVisitFn(e,t=!0){return $S(this,e,t)}visitNull(e,...t){return null}visitBool(e,...t){return null}visitInt(e,...t){return null}visitFloat(e,...t){return null}visitUtf8(e,...t){return null}visitBinary(e,...t){return null}visitFixedSizeBinary(e,...t){return null}visitDate(e,...t){return null}visitTimestamp(e,...t){return null}visitTime(e,...t){return null}visitDecimal(e,...t){return null}visitList(e,...t){return null}visitStruct(e,...t){return null}visitUnion(e,...t){return null}visitDictionary(e,...t){return null}visitInterval(e,...t){return null}visitFixedSizeList(e,...t){return null}visitMap(e,...t){return null}}function $S(e,t,r=!0){let n=null,i=f.NONE;if(t instanceof S)i=Yh(t.type);else if(t instanceof F)i=Yh(t.type);else if(t instanceof E)i=Yh(t);else if(typeof(i=t)!=="number")i=f[t];switch(i){case f.Null:n=e.visitNull;break;case f.Bool:n=e.visitBool;break;case f.Int:n=e.visitInt;break;case f.Int8:n=e.visitInt8||e.visitInt;break;case f.Int16:n=e.visitInt16||e.visitInt;break;case f.Int32:n=e.visitInt32||e.visitInt;break;case f.Int64:n=e.visitInt64||e.visitInt;break;case f.Uint8:n=e.visitUint8||e.visitInt;break;case f.Uint16:n=e.visitUint16||e.visitInt;break;case f.Uint32:n=e.visitUint32||e.visitInt;break;case f.Uint64:n=e.visitUint64||e.visitInt;break;case f.Float:n=e.visitFloat;break;case f.Float16:n=e.visitFloat16||e.visitFloat;break;case f.Float32:n=e.visitFloat32||e.visitFloat;break;case f.Float64:n=e.visitFloat64||e.visitFloat;break;case f.Utf8:n=e.visitUtf8;break;case f.Binary:n=e.visitBinary;break;case f.FixedSizeBinary:n=e.visitFixedSizeBinary;break;case f.Date:n=e.visitDate;break;case f.DateDay:n=e.visitDateDay||e.visitDate;break;case f.DateMillisecond:n=e.visitDateMillisecond||e.visitDate;break;case f.Timestamp:n=e.visitTimestamp;break;case f.TimestampSecond:n=e.visitTimestampSecond||e.visitTimestamp;break;case f.TimestampMillisecond:n=e.visitTimestampMillisecond||e.visitTimestamp;break;case f.TimestampMicrosecond:n=e.visitTimestampMicrosecond||e.visitTimestamp;break;case f.TimestampNanosecond:n=e.visitTimestampNanosecond||e.visitTimestamp;break;case f.Time:n=e.visitTime;break;case f.TimeSecond:n=e.visitTimeSecond||e.visitTime;break;case f.TimeMillisecond:n=e.visitTimeMillisecond||e.visitTime;break;case f.TimeMicrosecond:n=e.visitTimeMicrosecond||e.visitTime;break;case f.TimeNanosecond:n=e.visitTimeNanosecond||e.visitTime;break;case f.Decimal:n=e.visitDecimal;break;case f.List:n=e.visitList;break;case f.Struct:n=e.visitStruct;break;case f.Union:n=e.visitUnion;break;case f.DenseUnion:n=e.visitDenseUnion||e.visitUnion;break;case f.SparseUnion:n=e.visitSparseUnion||e.visitUnion;break;case f.Dictionary:n=e.visitDictionary;break;case f.Interval:n=e.visitInterval;break;case f.IntervalDayTime:n=e.visitIntervalDayTime||e.visitInterval;break;case f.IntervalYearMonth:n=e.visitIntervalYearMonth||e.visitInterval;break;case f.FixedSizeList:n=e.visitFixedSizeList;break;case f.Map:n=e.visitMap;break}if(typeof n==="function")return n;if(!r)return()=>null;throw Error(`Unrecognized type '${f[i]}'`)}function Yh(e){switch(e.typeId){case f.Null:return f.Null;case f.Int:let{bitWidth:t,isSigned:r}=e;switch(t){case 8:return r?f.Int8:f.Uint8;case 16:return r?f.Int16:f.Uint16;case 32:return r?f.Int32:f.Uint32;case 64:return r?f.Int64:f.Uint64}return f.Int;case f.Float:switch(e.precision){case De.HALF:return f.Float16;case De.SINGLE:return f.Float32;case De.DOUBLE:return f.Float64}return f.Float;case f.Binary:return f.Binary;case f.Utf8:return f.Utf8;case f.Bool:return f.Bool;case f.Decimal:return f.Decimal;case f.Time:switch(e.unit){case Q.SECOND:return f.TimeSecond;case Q.MILLISECOND:return f.TimeMillisecond;case Q.MICROSECOND:return f.TimeMicrosecond;case Q.NANOSECOND:return f.TimeNanosecond}return f.Time;case f.Timestamp:switch(e.unit){case Q.SECOND:return f.TimestampSecond;case Q.MILLISECOND:return f.TimestampMillisecond;case Q.MICROSECOND:return f.TimestampMicrosecond;case Q.NANOSECOND:return f.TimestampNanosecond}return f.Timestamp;case f.Date:switch(e.unit){case Be.DAY:return f.DateDay;case Be.MILLISECOND:return f.DateMillisecond}return f.Date;case f.Interval:switch(e.unit){case gt.DAY_TIME:return f.IntervalDayTime;case gt.YEAR_MONTH:return f.IntervalYearMonth}return f.Interval;case f.Map:return f.Map;case f.List:return f.List;case f.Struct:return f.Struct;case f.Union:switch(e.mode){case Ie.Dense:return f.DenseUnion;case Ie.Sparse:return f.SparseUnion}return f.Union;case f.FixedSizeBinary:return f.FixedSizeBinary;case f.FixedSizeList:return f.FixedSizeList;case f.Dictionary:return f.Dictionary}throw Error(`Unrecognized type '${f[e.typeId]}'`)}A.prototype.visitInt8=null;A.prototype.visitInt16=null;A.prototype.visitInt32=null;A.prototype.visitInt64=null;A.prototype.visitUint8=null;A.prototype.visitUint16=null;A.prototype.visitUint32=null;A.prototype.visitUint64=null;A.prototype.visitFloat16=null;A.prototype.visitFloat32=null;A.prototype.visitFloat64=null;A.prototype.visitDateDay=null;A.prototype.visitDateMillisecond=null;A.prototype.visitTimestampSecond=null;A.prototype.visitTimestampMillisecond=null;A.prototype.visitTimestampMicrosecond=null;A.prototype.visitTimestampNanosecond=null;A.prototype.visitTimeSecond=null;A.prototype.visitTimeMillisecond=null;A.prototype.visitTimeMicrosecond=null;A.prototype.visitTimeNanosecond=null;A.prototype.visitDenseUnion=null;A.prototype.visitSparseUnion=null;A.prototype.visitIntervalDayTime=null;A.prototype.visitIntervalYearMonth=null;class C extends A{compareSchemas(e,t){return e===t||t instanceof e.constructor&&ut.compareFields(e.fields,t.fields)}compareFields(e,t){return e===t||Array.isArray(e)&&Array.isArray(t)&&e.length===t.length&&e.every((r,n)=>ut.compareField(r,t[n]))}compareField(e,t){return e===t||t instanceof e.constructor&&e.name===t.name&&e.nullable===t.nullable&&ut.visit(e.type,t.type)}}function vt(e,t){return t instanceof e.constructor}function hl(e,t){return e===t||vt(e,t)}function en(e,t){return e===t||vt(e,t)&&e.bitWidth===t.bitWidth&&e.isSigned===t.isSigned}function bc(e,t){return e===t||vt(e,t)&&e.precision===t.precision}function WS(e,t){return e===t||vt(e,t)&&e.byteWidth===t.byteWidth}function Kh(e,t){return e===t||vt(e,t)&&e.unit===t.unit}function pl(e,t){return e===t||vt(e,t)&&e.unit===t.unit&&e.timezone===t.timezone}function ml(e,t){return e===t||vt(e,t)&&e.unit===t.unit&&e.bitWidth===t.bitWidth}function HS(e,t){return e===t||vt(e,t)&&e.children.length===t.children.length&&ut.compareFields(e.children,t.children)}function YS(e,t){return e===t||vt(e,t)&&e.children.length===t.children.length&&ut.compareFields(e.children,t.children)}function Qh(e,t){return e===t||vt(e,t)&&e.mode===t.mode&&e.typeIds.every((r,n)=>r===t.typeIds[n])&&ut.compareFields(e.children,t.children)}function KS(e,t){return e===t||vt(e,t)&&e.id===t.id&&e.isOrdered===t.isOrdered&&ut.visit(e.indices,t.indices)&&ut.visit(e.dictionary,t.dictionary)}function Jh(e,t){return e===t||vt(e,t)&&e.unit===t.unit}function QS(e,t){return e===t||vt(e,t)&&e.listSize===t.listSize&&e.children.length===t.children.length&&ut.compareFields(e.children,t.children)}function JS(e,t){return e===t||vt(e,t)&&e.keysSorted===t.keysSorted&&e.children.length===t.children.length&&ut.compareFields(e.children,t.children)}C.prototype.visitNull=hl;C.prototype.visitBool=hl;C.prototype.visitInt=en;C.prototype.visitInt8=en;C.prototype.visitInt16=en;C.prototype.visitInt32=en;C.prototype.visitInt64=en;C.prototype.visitUint8=en;C.prototype.visitUint16=en;C.prototype.visitUint32=en;C.prototype.visitUint64=en;C.prototype.visitFloat=bc;C.prototype.visitFloat16=bc;C.prototype.visitFloat32=bc;C.prototype.visitFloat64=bc;C.prototype.visitUtf8=hl;C.prototype.visitBinary=hl;C.prototype.visitFixedSizeBinary=WS;C.prototype.visitDate=Kh;C.prototype.visitDateDay=Kh;C.prototype.visitDateMillisecond=Kh;C.prototype.visitTimestamp=pl;C.prototype.visitTimestampSecond=pl;C.prototype.visitTimestampMillisecond=pl;C.prototype.visitTimestampMicrosecond=pl;C.prototype.visitTimestampNanosecond=pl;C.prototype.visitTime=ml;C.prototype.visitTimeSecond=ml;C.prototype.visitTimeMillisecond=ml;C.prototype.visitTimeMicrosecond=ml;C.prototype.visitTimeNanosecond=ml;C.prototype.visitDecimal=hl;C.prototype.visitList=HS;C.prototype.visitStruct=YS;C.prototype.visitUnion=Qh;C.prototype.visitDenseUnion=Qh;C.prototype.visitSparseUnion=Qh;C.prototype.visitDictionary=KS;C.prototype.visitInterval=Jh;C.prototype.visitIntervalDayTime=Jh;C.prototype.visitIntervalYearMonth=Jh;C.prototype.visitFixedSizeList=QS;C.prototype.visitMap=JS;var ut=new C;class E{static isNull(e){return e&&e.typeId===f.Null}static isInt(e){return e&&e.typeId===f.Int}static isFloat(e){return e&&e.typeId===f.Float}static isBinary(e){return e&&e.typeId===f.Binary}static isUtf8(e){return e&&e.typeId===f.Utf8}static isBool(e){return e&&e.typeId===f.Bool}static isDecimal(e){return e&&e.typeId===f.Decimal}static isDate(e){return e&&e.typeId===f.Date}static isTime(e){return e&&e.typeId===f.Time}static isTimestamp(e){return e&&e.typeId===f.Timestamp}static isInterval(e){return e&&e.typeId===f.Interval}static isList(e){return e&&e.typeId===f.List}static isStruct(e){return e&&e.typeId===f.Struct}static isUnion(e){return e&&e.typeId===f.Union}static isFixedSizeBinary(e){return e&&e.typeId===f.FixedSizeBinary}static isFixedSizeList(e){return e&&e.typeId===f.FixedSizeList}static isMap(e){return e&&e.typeId===f.Map}static isDictionary(e){return e&&e.typeId===f.Dictionary}get typeId(){return f.NONE}compareTo(e){return ut.visit(this,e)}}E[Symbol.toStringTag]=((e)=>(e.children=null,e.ArrayType=Array,e[Symbol.toStringTag]="DataType"))(E.prototype);class lr extends E{toString(){return"Null"}get typeId(){return f.Null}}lr[Symbol.toStringTag]=((e)=>e[Symbol.toStringTag]="Null")(lr.prototype);class Ne extends E{constructor(e,t){super();this.isSigned=e,this.bitWidth=t}get typeId(){return f.Int}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?Int32Array:Uint32Array}throw Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`${this.isSigned?"I":"Ui"}nt${this.bitWidth}`}}Ne[Symbol.toStringTag]=((e)=>(e.isSigned=null,e.bitWidth=null,e[Symbol.toStringTag]="Int"))(Ne.prototype);class Ti extends Ne{constructor(){super(!0,8)}}class Fi extends Ne{constructor(){super(!0,16)}}class Et extends Ne{constructor(){super(!0,32)}}class Dr extends Ne{constructor(){super(!0,64)}}class Di extends Ne{constructor(){super(!1,8)}}class Ai extends Ne{constructor(){super(!1,16)}}class Ei extends Ne{constructor(){super(!1,32)}}class Ar extends Ne{constructor(){super(!1,64)}}Object.defineProperty(Ti.prototype,"ArrayType",{value:Int8Array});Object.defineProperty(Fi.prototype,"ArrayType",{value:Int16Array});Object.defineProperty(Et.prototype,"ArrayType",{value:Int32Array});Object.defineProperty(Dr.prototype,"ArrayType",{value:Int32Array});Object.defineProperty(Di.prototype,"ArrayType",{value:Uint8Array});Object.defineProperty(Ai.prototype,"ArrayType",{value:Uint16Array});Object.defineProperty(Ei.prototype,"ArrayType",{value:Uint32Array});Object.defineProperty(Ar.prototype,"ArrayType",{value:Uint32Array});class Jt extends E{constructor(e){super();this.precision=e}get typeId(){return f.Float}get ArrayType(){switch(this.precision){case De.HALF:return Uint16Array;case De.SINGLE:return Float32Array;case De.DOUBLE:return Float64Array}throw Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`Float${this.precision<<5||16}`}}Jt[Symbol.toStringTag]=((e)=>(e.precision=null,e[Symbol.toStringTag]="Float"))(Jt.prototype);class jn extends Jt{constructor(){super(De.HALF)}}class Oi extends Jt{constructor(){super(De.SINGLE)}}class ki extends Jt{constructor(){super(De.DOUBLE)}}Object.defineProperty(jn.prototype,"ArrayType",{value:Uint16Array});Object.defineProperty(Oi.prototype,"ArrayType",{value:Float32Array});Object.defineProperty(ki.prototype,"ArrayType",{value:Float64Array});class ur extends E{constructor(){super()}get typeId(){return f.Binary}toString(){return"Binary"}}ur[Symbol.toStringTag]=((e)=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Binary"))(ur.prototype);class Dt extends E{constructor(){super()}get typeId(){return f.Utf8}toString(){return"Utf8"}}Dt[Symbol.toStringTag]=((e)=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Utf8"))(Dt.prototype);class cr extends E{constructor(){super()}get typeId(){return f.Bool}toString(){return"Bool"}}cr[Symbol.toStringTag]=((e)=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Bool"))(cr.prototype);class tn extends E{constructor(e,t){super();this.scale=e,this.precision=t}get typeId(){return f.Decimal}toString(){return`Decimal[${this.precision}e${this.scale>0?"+":""}${this.scale}]`}}tn[Symbol.toStringTag]=((e)=>(e.scale=null,e.precision=null,e.ArrayType=Uint32Array,e[Symbol.toStringTag]="Decimal"))(tn.prototype);class fr extends E{constructor(e){super();this.unit=e}get typeId(){return f.Date}toString(){return`Date${(this.unit+1)*32}<${Be[this.unit]}>`}}fr[Symbol.toStringTag]=((e)=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Date"))(fr.prototype);class yl extends fr{constructor(){super(Be.DAY)}}class Ls extends fr{constructor(){super(Be.MILLISECOND)}}class rn extends E{constructor(e,t){super();this.unit=e,this.bitWidth=t}get typeId(){return f.Time}toString(){return`Time${this.bitWidth}<${Q[this.unit]}>`}}rn[Symbol.toStringTag]=((e)=>(e.unit=null,e.bitWidth=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Time"))(rn.prototype);class nn extends E{constructor(e,t){super();this.unit=e,this.timezone=t}get typeId(){return f.Timestamp}toString(){return`Timestamp<${Q[this.unit]}${this.timezone?`, ${this.timezone}`:""}>`}}nn[Symbol.toStringTag]=((e)=>(e.unit=null,e.timezone=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Timestamp"))(nn.prototype);class sn extends E{constructor(e){super();this.unit=e}get typeId(){return f.Interval}toString(){return`Interval<${gt[this.unit]}>`}}sn[Symbol.toStringTag]=((e)=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Interval"))(sn.prototype);class At extends E{constructor(e){super();this.children=[e]}get typeId(){return f.List}toString(){return`List<${this.valueType}>`}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}}At[Symbol.toStringTag]=((e)=>(e.children=null,e[Symbol.toStringTag]="List"))(At.prototype);class Me extends E{constructor(e){super();this.children=e}get typeId(){return f.Struct}toString(){return`Struct<{${this.children.map((e)=>`${e.name}:${e.type}`).join(", ")}}>`}}Me[Symbol.toStringTag]=((e)=>(e.children=null,e[Symbol.toStringTag]="Struct"))(Me.prototype);class dr extends E{constructor(e,t,r){super();this.mode=e,this.children=r,this.typeIds=t=Int32Array.from(t),this.typeIdToChildIndex=t.reduce((n,i,s)=>(n[i]=s)&&n||n,Object.create(null))}get typeId(){return f.Union}toString(){return`${this[Symbol.toStringTag]}<${this.children.map((e)=>`${e.type}`).join(" | ")}>`}}dr[Symbol.toStringTag]=((e)=>(e.mode=null,e.typeIds=null,e.children=null,e.typeIdToChildIndex=null,e.ArrayType=Int8Array,e[Symbol.toStringTag]="Union"))(dr.prototype);class on extends E{constructor(e){super();this.byteWidth=e}get typeId(){return f.FixedSizeBinary}toString(){return`FixedSizeBinary[${this.byteWidth}]`}}on[Symbol.toStringTag]=((e)=>(e.byteWidth=null,e.ArrayType=Uint8Array,e[Symbol.toStringTag]="FixedSizeBinary"))(on.prototype);class hr extends E{constructor(e,t){super();this.listSize=e,this.children=[t]}get typeId(){return f.FixedSizeList}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return`FixedSizeList[${this.listSize}]<${this.valueType}>`}}hr[Symbol.toStringTag]=((e)=>(e.children=null,e.listSize=null,e[Symbol.toStringTag]="FixedSizeList"))(hr.prototype);class pr extends E{constructor(e,t=!1){super();this.children=[e],this.keysSorted=t}get typeId(){return f.Map}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}toString(){return`Map<{${this.children[0].type.children.map((e)=>`${e.name}:${e.type}`).join(", ")}}>`}}pr[Symbol.toStringTag]=((e)=>(e.children=null,e.keysSorted=null,e[Symbol.toStringTag]="Map_"))(pr.prototype);var ZS=((e)=>()=>++e)(-1);class ct extends E{constructor(e,t,r,n){super();this.indices=t,this.dictionary=e,this.isOrdered=n||!1,this.id=r==null?ZS():typeof r==="number"?r:r.low}get typeId(){return f.Dictionary}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return`Dictionary<${this.indices}, ${this.dictionary}>`}}ct[Symbol.toStringTag]=((e)=>(e.id=null,e.indices=null,e.isOrdered=null,e.dictionary=null,e[Symbol.toStringTag]="Dictionary"))(ct.prototype);function Sc(e){let t=e;switch(e.typeId){case f.Decimal:return 4;case f.Timestamp:return 2;case f.Date:return 1+t.unit;case f.Interval:return 1+t.unit;case f.Int:return 1+ +(t.bitWidth>32);case f.Time:return 1+ +(t.bitWidth>32);case f.FixedSizeList:return t.listSize;case f.FixedSizeBinary:return t.byteWidth;default:return 1}}var XS=-1;class S{constructor(e,t,r,n,i,s,a){this.type=e,this.dictionary=a,this.offset=Math.floor(Math.max(t||0,0)),this.length=Math.floor(Math.max(r||0,0)),this._nullCount=Math.floor(Math.max(n||0,-1)),this.childData=(s||[]).map((o)=>o instanceof S?o:o.data);let l;if(i instanceof S)this.stride=i.stride,this.values=i.values,this.typeIds=i.typeIds,this.nullBitmap=i.nullBitmap,this.valueOffsets=i.valueOffsets;else if(this.stride=Sc(e),i)(l=i[0])&&(this.valueOffsets=l),(l=i[1])&&(this.values=l),(l=i[2])&&(this.nullBitmap=l),(l=i[3])&&(this.typeIds=l)}get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get byteLength(){let e=0,{valueOffsets:t,values:r,nullBitmap:n,typeIds:i}=this;return t&&(e+=t.byteLength),r&&(e+=r.byteLength),n&&(e+=n.byteLength),i&&(e+=i.byteLength),this.childData.reduce((s,a)=>s+a.byteLength,e)}get nullCount(){let e=this._nullCount,t;if(e<=XS&&(t=this.nullBitmap))this._nullCount=e=this.length-fl(t,this.offset,this.offset+this.length);return e}clone(e,t=this.offset,r=this.length,n=this._nullCount,i=this,s=this.childData){return new S(e,t,r,n,i,s,this.dictionary)}slice(e,t){let{stride:r,typeId:n,childData:i}=this,s=+(this._nullCount===0)-1,a=n===16?r:1,l=this._sliceBuffers(e,t,r,n);return this.clone(this.type,this.offset+e,t,s,l,!i.length||this.valueOffsets?i:this._sliceChildren(i,a*e,a*t))}_changeLengthAndBackfillNullBitmap(e){if(this.typeId===f.Null)return this.clone(this.type,0,e,0);let{length:t,nullCount:r}=this,n=new Uint8Array((e+63&-64)>>3).fill(255,0,t>>3);if(n[t>>3]=(1<<t-(t&-8))-1,r>0)n.set(Ms(this.offset,t,this.nullBitmap),0);let i=this.buffers;return i[D.VALIDITY]=n,this.clone(this.type,0,e,r+(e-t),i)}_sliceBuffers(e,t,r,n){let i,{buffers:s}=this;return(i=s[D.TYPE])&&(s[D.TYPE]=i.subarray(e,e+t)),(i=s[D.OFFSET])&&(s[D.OFFSET]=i.subarray(e,e+t+1))||(i=s[D.DATA])&&(s[D.DATA]=n===6?i:i.subarray(r*e,r*(e+t))),s}_sliceChildren(e,t,r){return e.map((n)=>n.slice(t,r))}static new(e,t,r,n,i,s,a){if(i instanceof S)i=i.buffers;else if(!i)i=[];switch(e.typeId){case f.Null:return S.Null(e,t,r);case f.Int:return S.Int(e,t,r,n||0,i[D.VALIDITY],i[D.DATA]||[]);case f.Dictionary:return S.Dictionary(e,t,r,n||0,i[D.VALIDITY],i[D.DATA]||[],a);case f.Float:return S.Float(e,t,r,n||0,i[D.VALIDITY],i[D.DATA]||[]);case f.Bool:return S.Bool(e,t,r,n||0,i[D.VALIDITY],i[D.DATA]||[]);case f.Decimal:return S.Decimal(e,t,r,n||0,i[D.VALIDITY],i[D.DATA]||[]);case f.Date:return S.Date(e,t,r,n||0,i[D.VALIDITY],i[D.DATA]||[]);case f.Time:return S.Time(e,t,r,n||0,i[D.VALIDITY],i[D.DATA]||[]);case f.Timestamp:return S.Timestamp(e,t,r,n||0,i[D.VALIDITY],i[D.DATA]||[]);case f.Interval:return S.Interval(e,t,r,n||0,i[D.VALIDITY],i[D.DATA]||[]);case f.FixedSizeBinary:return S.FixedSizeBinary(e,t,r,n||0,i[D.VALIDITY],i[D.DATA]||[]);case f.Binary:return S.Binary(e,t,r,n||0,i[D.VALIDITY],i[D.OFFSET]||[],i[D.DATA]||[]);case f.Utf8:return S.Utf8(e,t,r,n||0,i[D.VALIDITY],i[D.OFFSET]||[],i[D.DATA]||[]);case f.List:return S.List(e,t,r,n||0,i[D.VALIDITY],i[D.OFFSET]||[],(s||[])[0]);case f.FixedSizeList:return S.FixedSizeList(e,t,r,n||0,i[D.VALIDITY],(s||[])[0]);case f.Struct:return S.Struct(e,t,r,n||0,i[D.VALIDITY],s||[]);case f.Map:return S.Map(e,t,r,n||0,i[D.VALIDITY],i[D.OFFSET]||[],(s||[])[0]);case f.Union:return S.Union(e,t,r,n||0,i[D.VALIDITY],i[D.TYPE]||[],i[D.OFFSET]||s,s)}throw Error(`Unrecognized typeId ${e.typeId}`)}static Null(e,t,r){return new S(e,t,r,0)}static Int(e,t,r,n,i,s){return new S(e,t,r,n,[void 0,Y(e.ArrayType,s),L(i)])}static Dictionary(e,t,r,n,i,s,a){return new S(e,t,r,n,[void 0,Y(e.indices.ArrayType,s),L(i)],[],a)}static Float(e,t,r,n,i,s){return new S(e,t,r,n,[void 0,Y(e.ArrayType,s),L(i)])}static Bool(e,t,r,n,i,s){return new S(e,t,r,n,[void 0,Y(e.ArrayType,s),L(i)])}static Decimal(e,t,r,n,i,s){return new S(e,t,r,n,[void 0,Y(e.ArrayType,s),L(i)])}static Date(e,t,r,n,i,s){return new S(e,t,r,n,[void 0,Y(e.ArrayType,s),L(i)])}static Time(e,t,r,n,i,s){return new S(e,t,r,n,[void 0,Y(e.ArrayType,s),L(i)])}static Timestamp(e,t,r,n,i,s){return new S(e,t,r,n,[void 0,Y(e.ArrayType,s),L(i)])}static Interval(e,t,r,n,i,s){return new S(e,t,r,n,[void 0,Y(e.ArrayType,s),L(i)])}static FixedSizeBinary(e,t,r,n,i,s){return new S(e,t,r,n,[void 0,Y(e.ArrayType,s),L(i)])}static Binary(e,t,r,n,i,s,a){return new S(e,t,r,n,[Bi(s),L(a),L(i)])}static Utf8(e,t,r,n,i,s,a){return new S(e,t,r,n,[Bi(s),L(a),L(i)])}static List(e,t,r,n,i,s,a){return new S(e,t,r,n,[Bi(s),void 0,L(i)],[a])}static FixedSizeList(e,t,r,n,i,s){return new S(e,t,r,n,[void 0,void 0,L(i)],[s])}static Struct(e,t,r,n,i,s){return new S(e,t,r,n,[void 0,void 0,L(i)],s)}static Map(e,t,r,n,i,s,a){return new S(e,t,r,n,[Bi(s),void 0,L(i)],[a])}static Union(e,t,r,n,i,s,a,l){let o=[void 0,void 0,L(i),Y(e.ArrayType,s)];if(e.mode===Ie.Sparse)return new S(e,t,r,n,o,a);return o[D.OFFSET]=Bi(a),new S(e,t,r,n,o,l)}}S.prototype.childData=Object.freeze([]);function Ni(e){if(e===null)return"null";if(e===void 0)return"undefined";switch(typeof e){case"number":return`${e}`;case"bigint":return`${e}`;case"string":return`"${e}"`}if(typeof e[Symbol.toPrimitive]==="function")return e[Symbol.toPrimitive]("string");return ArrayBuffer.isView(e)?`[${e}]`:JSON.stringify(e)}function Qv(e){if(!e||e.length<=0)return function(i){return!0};let t="",r=e.filter((n)=>n===n);if(r.length>0)t=`
+    switch (x) {${r.map((n)=>`
+        case ${qS(n)}:`).join("")}
             return false;
-    }`),t.length!==r.length&&(e=`if (x !== x) return false;
-${e}`),new Function("x",`${e}
-return true;`)}Sy.createIsValidFunction=DO;function AO(t){return typeof t!="bigint"?by.valueToString(t):IO.BigIntAvailable?`${by.valueToString(t)}n`:`"${by.valueToString(t)}"`}});var Fn=b(fi=>{"use strict";Object.defineProperty(fi,"__esModule",{value:!0});var SS=Ve(),Ty=st(),By=(t,e)=>(t*e+63&-64||64)/e,FO=(t,e=0)=>t.length>=e?t.subarray(0,e):SS.memcpy(new t.constructor(e),t,0),ws=class{constructor(e,r=1){this.buffer=e,this.stride=r,this.BYTES_PER_ELEMENT=e.BYTES_PER_ELEMENT,this.ArrayType=e.constructor,this._resize(this.length=e.length/r|0)}get byteLength(){return this.length*this.stride*this.BYTES_PER_ELEMENT|0}get reservedLength(){return this.buffer.length/this.stride}get reservedByteLength(){return this.buffer.byteLength}set(e,r){return this}append(e){return this.set(this.length,e)}reserve(e){if(e>0){this.length+=e;let r=this.stride,n=this.length*r,i=this.buffer.length;n>=i&&this._resize(i===0?By(n*1,this.BYTES_PER_ELEMENT):By(n*2,this.BYTES_PER_ELEMENT))}return this}flush(e=this.length){e=By(e*this.stride,this.BYTES_PER_ELEMENT);let r=FO(this.buffer,e);return this.clear(),r}clear(){return this.length=0,this._resize(0),this}_resize(e){return this.buffer=SS.memcpy(new this.ArrayType(e),this.buffer)}};fi.BufferBuilder=ws;ws.prototype.offset=0;var ha=class extends ws{last(){return this.get(this.length-1)}get(e){return this.buffer[e]}set(e,r){return this.reserve(e-this.length+1),this.buffer[e*this.stride]=r,this}};fi.DataBufferBuilder=ha;var Iy=class extends ha{constructor(e=new Uint8Array(0)){super(e,1/8),this.numValid=0}get numInvalid(){return this.length-this.numValid}get(e){return this.buffer[e>>3]>>e%8&1}set(e,r){let{buffer:n}=this.reserve(e-this.length+1),i=e>>3,s=e%8,a=n[i]>>s&1;return r?a===0&&(n[i]|=1<<s,++this.numValid):a===1&&(n[i]&=~(1<<s),--this.numValid),this}clear(){return this.numValid=0,super.clear()}};fi.BitmapBufferBuilder=Iy;var Dy=class extends ha{constructor(e=new Int32Array(1)){super(e,1)}append(e){return this.set(this.length-1,e)}set(e,r){let n=this.length-1,i=this.reserve(e-n+1).buffer;return n<e++&&i.fill(i[n],n,e),i[e]=i[e-1]+r,this}flush(e=this.length-1){return e>this.length&&this.set(e-1,0),super.flush(e+1)}};fi.OffsetsBufferBuilder=Dy;var Ay=class extends ws{get ArrayType64(){return this._ArrayType64||(this._ArrayType64=this.buffer instanceof Int32Array?Ty.BigInt64Array:Ty.BigUint64Array)}set(e,r){switch(this.reserve(e-this.length+1),typeof r){case"bigint":this.buffer64[e]=r;break;case"number":this.buffer[e*this.stride]=r;break;default:this.buffer.set(r,e*this.stride)}return this}_resize(e){let r=super._resize(e),n=r.byteLength/(this.BYTES_PER_ELEMENT*this.stride);return Ty.BigIntAvailable&&(this.buffer64=new this.ArrayType64(r.buffer,r.byteOffset,n)),r}};fi.WideBufferBuilder=Ay});var Ae=b(pa=>{"use strict";Object.defineProperty(pa,"__esModule",{value:!0});var OO=xe(),bs=de(),MO=sr(),xO=bS(),My=Fn(),EO=ie(),Mt=class{constructor({type:e,nullValues:r}){this.length=0,this.finished=!1,this.type=e,this.children=[],this.nullValues=r,this.stride=EO.strideForType(e),this._nulls=new My.BitmapBufferBuilder,r&&r.length>0&&(this._isValid=xO.createIsValidFunction(r))}static new(e){}static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e){throw new Error('"throughDOM" not available in this environment')}static throughIterable(e){return UO(e)}static throughAsyncIterable(e){return VO(e)}toVector(){return OO.Vector.new(this.flush())}get ArrayType(){return this.type.ArrayType}get nullCount(){return this._nulls.numInvalid}get numChildren(){return this.children.length}get byteLength(){let e=0;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),this._typeIds&&(e+=this._typeIds.byteLength),this.children.reduce((r,n)=>r+n.byteLength,e)}get reservedLength(){return this._nulls.reservedLength}get reservedByteLength(){let e=0;return this._offsets&&(e+=this._offsets.reservedByteLength),this._values&&(e+=this._values.reservedByteLength),this._nulls&&(e+=this._nulls.reservedByteLength),this._typeIds&&(e+=this._typeIds.reservedByteLength),this.children.reduce((r,n)=>r+n.reservedByteLength,e)}get valueOffsets(){return this._offsets?this._offsets.buffer:null}get values(){return this._values?this._values.buffer:null}get nullBitmap(){return this._nulls?this._nulls.buffer:null}get typeIds(){return this._typeIds?this._typeIds.buffer:null}append(e){return this.set(this.length,e)}isValid(e){return this._isValid(e)}set(e,r){return this.setValid(e,this.isValid(r))&&this.setValue(e,r),this}setValue(e,r){this._setValue(this,e,r)}setValid(e,r){return this.length=this._nulls.set(e,+r).length,r}addChild(e,r=`${this.numChildren}`){throw new Error(`Cannot append children to non-nested type "${this.type}"`)}getChildAt(e){return this.children[e]||null}flush(){let e=[],r=this._values,n=this._offsets,i=this._typeIds,{length:s,nullCount:a}=this;i?(e[bs.BufferType.TYPE]=i.flush(s),n&&(e[bs.BufferType.OFFSET]=n.flush(s))):n?(r&&(e[bs.BufferType.DATA]=r.flush(n.last())),e[bs.BufferType.OFFSET]=n.flush(s)):r&&(e[bs.BufferType.DATA]=r.flush(s)),a>0&&(e[bs.BufferType.VALIDITY]=this._nulls.flush(s));let l=MO.Data.new(this.type,0,s,a,e,this.children.map(c=>c.flush()));return this.clear(),l}finish(){return this.finished=!0,this.children.forEach(e=>e.finish()),this}clear(){return this.length=0,this._offsets&&this._offsets.clear(),this._values&&this._values.clear(),this._nulls&&this._nulls.clear(),this._typeIds&&this._typeIds.clear(),this.children.forEach(e=>e.clear()),this}};pa.Builder=Mt;Mt.prototype.length=1;Mt.prototype.stride=1;Mt.prototype.children=null;Mt.prototype.finished=!1;Mt.prototype.nullValues=null;Mt.prototype._isValid=()=>!0;var Fy=class extends Mt{constructor(e){super(e),this._values=new My.DataBufferBuilder(new this.ArrayType(0),this.stride)}setValue(e,r){let n=this._values;return n.reserve(e-n.length+1),super.setValue(e,r)}};pa.FixedWidthBuilder=Fy;var Oy=class extends Mt{constructor(e){super(e),this._pendingLength=0,this._offsets=new My.OffsetsBufferBuilder}setValue(e,r){let n=this._pending||(this._pending=new Map),i=n.get(e);i&&(this._pendingLength-=i.length),this._pendingLength+=r.length,n.set(e,r)}setValid(e,r){return super.setValid(e,r)?!0:((this._pending||(this._pending=new Map)).set(e,void 0),!1)}clear(){return this._pendingLength=0,this._pending=void 0,super.clear()}flush(){return this._flush(),super.flush()}finish(){return this._flush(),super.finish()}_flush(){let e=this._pending,r=this._pendingLength;return this._pendingLength=0,this._pending=void 0,e&&e.size>0&&this._flushPending(e,r),this}};pa.VariableWidthBuilder=Oy;function UO(t){let{["queueingStrategy"]:e="count"}=t,{["highWaterMark"]:r=e!=="bytes"?1e3:2**14}=t,n=e!=="bytes"?"length":"byteLength";return function*(i){let s=0,a=Mt.new(t);for(let l of i)a.append(l)[n]>=r&&++s&&(yield a.toVector());(a.finish().length>0||s===0)&&(yield a.toVector())}}function VO(t){let{["queueingStrategy"]:e="count"}=t,{["highWaterMark"]:r=e!=="bytes"?1e3:2**14}=t,n=e!=="bytes"?"length":"byteLength";return async function*(i){let s=0,a=Mt.new(t);for await(let l of i)a.append(l)[n]>=r&&++s&&(yield a.toVector());(a.finish().length>0||s===0)&&(yield a.toVector())}}});var Uy=b(Ey=>{"use strict";Object.defineProperty(Ey,"__esModule",{value:!0});var NO=Fn(),kO=Ae(),xy=class extends kO.Builder{constructor(e){super(e),this._values=new NO.BitmapBufferBuilder}setValue(e,r){this._values.set(e,+r)}};Ey.BoolBuilder=xy});var ky=b(Ny=>{"use strict";Object.defineProperty(Ny,"__esModule",{value:!0});var LO=Ae(),Vy=class extends LO.Builder{setValue(e,r){}setValid(e,r){return this.length=Math.max(e+1,this.length),r}};Ny.NullBuilder=Vy});var Ry=b(ma=>{"use strict";Object.defineProperty(ma,"__esModule",{value:!0});var CO=Ae(),ya=class extends CO.FixedWidthBuilder{};ma.DateBuilder=ya;var Ly=class extends ya{};ma.DateDayBuilder=Ly;var Cy=class extends ya{};ma.DateMillisecondBuilder=Cy});var zy=b(jy=>{"use strict";Object.defineProperty(jy,"__esModule",{value:!0});var RO=Ae(),Py=class extends RO.FixedWidthBuilder{};jy.DecimalBuilder=Py});var Hy=b(Wy=>{"use strict";Object.defineProperty(Wy,"__esModule",{value:!0});var PO=ie(),qy=Ae(),$y=class extends qy.Builder{constructor({type:e,nullValues:r,dictionaryHashFunction:n}){super({type:new PO.Dictionary(e.dictionary,e.indices,e.id,e.isOrdered)}),this._nulls=null,this._dictionaryOffset=0,this._keysToIndices=Object.create(null),this.indices=qy.Builder.new({type:this.type.indices,nullValues:r}),this.dictionary=qy.Builder.new({type:this.type.dictionary,nullValues:null}),typeof n=="function"&&(this.valueToKey=n)}get values(){return this.indices.values}get nullCount(){return this.indices.nullCount}get nullBitmap(){return this.indices.nullBitmap}get byteLength(){return this.indices.byteLength+this.dictionary.byteLength}get reservedLength(){return this.indices.reservedLength+this.dictionary.reservedLength}get reservedByteLength(){return this.indices.reservedByteLength+this.dictionary.reservedByteLength}isValid(e){return this.indices.isValid(e)}setValid(e,r){let n=this.indices;return r=n.setValid(e,r),this.length=n.length,r}setValue(e,r){let n=this._keysToIndices,i=this.valueToKey(r),s=n[i];return s===void 0&&(n[i]=s=this._dictionaryOffset+this.dictionary.append(r).length-1),this.indices.setValue(e,s)}flush(){let e=this.type,r=this._dictionary,n=this.dictionary.toVector(),i=this.indices.flush().clone(e);return i.dictionary=r?r.concat(n):n,this.finished||(this._dictionaryOffset+=n.length),this._dictionary=i.dictionary,this.clear(),i}finish(){return this.indices.finish(),this.dictionary.finish(),this._dictionaryOffset=0,this._keysToIndices=Object.create(null),super.finish()}clear(){return this.indices.clear(),this.dictionary.clear(),super.clear()}valueToKey(e){return typeof e=="string"?e:`${e}`}};Wy.DictionaryBuilder=$y});var Qy=b(Ky=>{"use strict";Object.defineProperty(Ky,"__esModule",{value:!0});var jO=Ae(),Yy=class extends jO.FixedWidthBuilder{};Ky.FixedSizeBinaryBuilder=Yy});var ga=b(Bc=>{"use strict";Object.defineProperty(Bc,"__esModule",{value:!0});var TS=new Float64Array(1),Ss=new Uint32Array(TS.buffer);function zO(t){let e=(t&31744)>>10,r=(t&1023)/1024,n=(-1)**((t&32768)>>15);switch(e){case 31:return n*(r?NaN:1/0);case 0:return n*(r?6103515625e-14*r:0)}return n*2**(e-15)*(1+r)}Bc.uint16ToFloat64=zO;function qO(t){if(t!==t)return 32256;TS[0]=t;let e=(Ss[1]&2147483648)>>16&65535,r=Ss[1]&2146435072,n=0;return r>=1089470464?Ss[0]>0?r=31744:(r=(r&2080374784)>>16,n=(Ss[1]&1048575)>>10):r<=1056964608?(n=1048576+(Ss[1]&1048575),n=1048576+(n<<(r>>20)-998)>>21,r=0):(r=r-1056964608>>10,n=(Ss[1]&1048575)+512>>10),e|r|n&65535}Bc.float64ToUint16=qO});var Xy=b(Bs=>{"use strict";Object.defineProperty(Bs,"__esModule",{value:!0});var $O=ga(),WO=Ae(),Ts=class extends WO.FixedWidthBuilder{};Bs.FloatBuilder=Ts;var Jy=class extends Ts{setValue(e,r){this._values.set(e,$O.float64ToUint16(r))}};Bs.Float16Builder=Jy;var Gy=class extends Ts{setValue(e,r){this._values.set(e,r)}};Bs.Float32Builder=Gy;var Zy=class extends Ts{setValue(e,r){this._values.set(e,r)}};Bs.Float64Builder=Zy});var wa=b(ft=>{"use strict";Object.defineProperty(ft,"__esModule",{value:!0});var HO=Ve(),_a=st();ft.isArrowBigNumSymbol=Symbol.for("isArrowBigNum");function or(t,...e){return e.length===0?Object.setPrototypeOf(HO.toArrayBufferView(this.TypedArray,t),this.constructor.prototype):Object.setPrototypeOf(new this.TypedArray(t,...e),this.constructor.prototype)}or.prototype[ft.isArrowBigNumSymbol]=!0;or.prototype.toJSON=function(){return`"${ft.bignumToString(this)}"`};or.prototype.valueOf=function(){return BS(this)};or.prototype.toString=function(){return ft.bignumToString(this)};or.prototype[Symbol.toPrimitive]=function(t="default"){switch(t){case"number":return BS(this);case"string":return ft.bignumToString(this);case"default":return ft.bignumToBigInt(this)}return ft.bignumToString(this)};function Is(...t){return or.apply(this,t)}function Ds(...t){return or.apply(this,t)}function va(...t){return or.apply(this,t)}Object.setPrototypeOf(Is.prototype,Object.create(Int32Array.prototype));Object.setPrototypeOf(Ds.prototype,Object.create(Uint32Array.prototype));Object.setPrototypeOf(va.prototype,Object.create(Uint32Array.prototype));Object.assign(Is.prototype,or.prototype,{constructor:Is,signed:!0,TypedArray:Int32Array,BigIntArray:_a.BigInt64Array});Object.assign(Ds.prototype,or.prototype,{constructor:Ds,signed:!1,TypedArray:Uint32Array,BigIntArray:_a.BigUint64Array});Object.assign(va.prototype,or.prototype,{constructor:va,signed:!0,TypedArray:Uint32Array,BigIntArray:_a.BigUint64Array});function BS(t){let{buffer:e,byteOffset:r,length:n,signed:i}=t,s=new Int32Array(e,r,n),a=0,l=0,c=s.length,o,u;for(;l<c;)u=s[l++],o=s[l++],i||(o=o>>>0),a+=(u>>>0)+o*l**32;return a}_a.BigIntAvailable?(ft.bignumToBigInt=t=>t.byteLength===8?new t.BigIntArray(t.buffer,t.byteOffset,1)[0]:em(t),ft.bignumToString=t=>t.byteLength===8?`${new t.BigIntArray(t.buffer,t.byteOffset,1)[0]}`:em(t)):(ft.bignumToString=em,ft.bignumToBigInt=ft.bignumToString);function em(t){let e="",r=new Uint32Array(2),n=new Uint16Array(t.buffer,t.byteOffset,t.byteLength/2),i=new Uint32Array((n=new Uint16Array(n).reverse()).buffer),s=-1,a=n.length-1;do{for(r[0]=n[s=0];s<a;)n[s++]=r[1]=r[0]/10,r[0]=(r[0]-r[1]*10<<16)+n[s];n[s]=r[1]=r[0]/10,r[0]=r[0]-r[1]*10,e=`${r[0]}${e}`}while(i[0]||i[1]||i[2]||i[3]);return e||"0"}var tm=class t{constructor(e,r){return t.new(e,r)}static new(e,r){switch(r){case!0:return new Is(e);case!1:return new Ds(e)}switch(e.constructor){case Int8Array:case Int16Array:case Int32Array:case _a.BigInt64Array:return new Is(e)}return e.byteLength===16?new va(e):new Ds(e)}static signed(e){return new Is(e)}static unsigned(e){return new Ds(e)}static decimal(e){return new va(e)}};ft.BN=tm});var cm=b(lr=>{"use strict";Object.defineProperty(lr,"__esModule",{value:!0});var YO=wa(),IS=Fn(),KO=st(),QO=Ae(),ar=class extends QO.FixedWidthBuilder{setValue(e,r){this._values.set(e,r)}};lr.IntBuilder=ar;var rm=class extends ar{};lr.Int8Builder=rm;var nm=class extends ar{};lr.Int16Builder=nm;var im=class extends ar{};lr.Int32Builder=im;var sm=class extends ar{constructor(e){e.nullValues&&(e.nullValues=e.nullValues.map(Ic)),super(e),this._values=new IS.WideBufferBuilder(new Int32Array(0),2)}get values64(){return this._values.buffer64}isValid(e){return super.isValid(Ic(e))}};lr.Int64Builder=sm;var om=class extends ar{};lr.Uint8Builder=om;var am=class extends ar{};lr.Uint16Builder=am;var lm=class extends ar{};lr.Uint32Builder=lm;var um=class extends ar{constructor(e){e.nullValues&&(e.nullValues=e.nullValues.map(Ic)),super(e),this._values=new IS.WideBufferBuilder(new Uint32Array(0),2)}get values64(){return this._values.buffer64}isValid(e){return super.isValid(Ic(e))}};lr.Uint64Builder=um;var Ic=(t=>e=>(ArrayBuffer.isView(e)&&(t.buffer=e.buffer,t.byteOffset=e.byteOffset,t.byteLength=e.byteLength,e=YO.bignumToBigInt(t),t.buffer=null),e))({BigIntArray:KO.BigInt64Array})});var ym=b(pi=>{"use strict";Object.defineProperty(pi,"__esModule",{value:!0});var JO=Ae(),hi=class extends JO.FixedWidthBuilder{};pi.TimeBuilder=hi;var dm=class extends hi{};pi.TimeSecondBuilder=dm;var fm=class extends hi{};pi.TimeMillisecondBuilder=fm;var hm=class extends hi{};pi.TimeMicrosecondBuilder=hm;var pm=class extends hi{};pi.TimeNanosecondBuilder=pm});var wm=b(mi=>{"use strict";Object.defineProperty(mi,"__esModule",{value:!0});var GO=Ae(),yi=class extends GO.FixedWidthBuilder{};mi.TimestampBuilder=yi;var mm=class extends yi{};mi.TimestampSecondBuilder=mm;var gm=class extends yi{};mi.TimestampMillisecondBuilder=gm;var vm=class extends yi{};mi.TimestampMicrosecondBuilder=vm;var _m=class extends yi{};mi.TimestampNanosecondBuilder=_m});var Tm=b(Sa=>{"use strict";Object.defineProperty(Sa,"__esModule",{value:!0});var ZO=Ae(),ba=class extends ZO.FixedWidthBuilder{};Sa.IntervalBuilder=ba;var bm=class extends ba{};Sa.IntervalDayTimeBuilder=bm;var Sm=class extends ba{};Sa.IntervalYearMonthBuilder=Sm});var Dc=b(Im=>{"use strict";Object.defineProperty(Im,"__esModule",{value:!0});var XO=Ve(),eM=Fn(),tM=Ae(),Bm=class extends tM.VariableWidthBuilder{constructor(e){super(e),this._values=new eM.BufferBuilder(new Uint8Array(0))}get byteLength(){let e=this._pendingLength+this.length*4;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),e}setValue(e,r){return super.setValue(e,XO.toUint8Array(r))}_flushPending(e,r){let n=this._offsets,i=this._values.reserve(r).buffer,s=0,a=0,l=0,c;for([s,c]of e)c===void 0?n.set(s,0):(a=c.length,i.set(c,l),n.set(s,a),l+=a)}};Im.BinaryBuilder=Bm});var Fc=b(Dm=>{"use strict";Object.defineProperty(Dm,"__esModule",{value:!0});var rM=oi(),nM=Dc(),iM=Fn(),sM=Ae(),Ac=class extends sM.VariableWidthBuilder{constructor(e){super(e),this._values=new iM.BufferBuilder(new Uint8Array(0))}get byteLength(){let e=this._pendingLength+this.length*4;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),e}setValue(e,r){return super.setValue(e,rM.encodeUtf8(r))}_flushPending(e,r){}};Dm.Utf8Builder=Ac;Ac.prototype._flushPending=nM.BinaryBuilder.prototype._flushPending});var Om=b(Fm=>{"use strict";Object.defineProperty(Fm,"__esModule",{value:!0});var oM=xe(),Am=class{get length(){return this._values.length}get(e){return this._values[e]}clear(){return this._values=null,this}bind(e){return e instanceof oM.Vector?e:(this._values=e,this)}};Fm.Run=Am});var Ta=b(Oc=>{"use strict";Object.defineProperty(Oc,"__esModule",{value:!0});var DS=wy(),Ze=Symbol.for("parent"),As=Symbol.for("rowIndex"),Et=Symbol.for("keyToIdx"),xt=Symbol.for("idxToVal"),Mm=Symbol.for("nodejs.util.inspect.custom"),ur=class{constructor(e,r){this[Ze]=e,this.size=r}entries(){return this[Symbol.iterator]()}has(e){return this.get(e)!==void 0}get(e){let r;if(e!=null){let n=this[Et]||(this[Et]=new Map),i=n.get(e);if(i!==void 0){let s=this[xt]||(this[xt]=new Array(this.size));(r=s[i])!==void 0||(s[i]=r=this.getValue(i))}else if((i=this.getIndex(e))>-1){n.set(e,i);let s=this[xt]||(this[xt]=new Array(this.size));(r=s[i])!==void 0||(s[i]=r=this.getValue(i))}}return r}set(e,r){if(e!=null){let n=this[Et]||(this[Et]=new Map),i=n.get(e);if(i===void 0&&n.set(e,i=this.getIndex(e)),i>-1){let s=this[xt]||(this[xt]=new Array(this.size));s[i]=this.setValue(i,r)}}return this}clear(){throw new Error(`Clearing ${this[Symbol.toStringTag]} not supported.`)}delete(e){throw new Error(`Deleting ${this[Symbol.toStringTag]} values not supported.`)}*[Symbol.iterator](){let e=this.keys(),r=this.values(),n=this[Et]||(this[Et]=new Map),i=this[xt]||(this[xt]=new Array(this.size));for(let s,a,l=0,c,o;!((c=e.next()).done||(o=r.next()).done);++l)s=c.value,a=o.value,i[l]=a,n.has(s)||n.set(s,l),yield[s,a]}forEach(e,r){let n=this.keys(),i=this.values(),s=r===void 0?e:(c,o,u)=>e.call(r,c,o,u),a=this[Et]||(this[Et]=new Map),l=this[xt]||(this[xt]=new Array(this.size));for(let c,o,u=0,d,v;!((d=n.next()).done||(v=i.next()).done);++u)c=d.value,o=v.value,l[u]=o,a.has(c)||a.set(c,u),s(o,c,this)}toArray(){return[...this.values()]}toJSON(){let e={};return this.forEach((r,n)=>e[n]=r),e}inspect(){return this.toString()}[Mm](){return this.toString()}toString(){let e=[];return this.forEach((r,n)=>{n=DS.valueToString(n),r=DS.valueToString(r),e.push(`${n}: ${r}`)}),`{ ${e.join(", ")} }`}};ur[Symbol.toStringTag]=(t=>(Object.defineProperties(t,{size:{writable:!0,enumerable:!1,configurable:!1,value:0},[Ze]:{writable:!0,enumerable:!1,configurable:!1,value:null},[As]:{writable:!0,enumerable:!1,configurable:!1,value:-1}}),t[Symbol.toStringTag]="Row"))(ur.prototype);var xm=class extends ur{constructor(e){return super(e,e.length),aM(this)}keys(){return this[Ze].getChildAt(0)[Symbol.iterator]()}values(){return this[Ze].getChildAt(1)[Symbol.iterator]()}getKey(e){return this[Ze].getChildAt(0).get(e)}getIndex(e){return this[Ze].getChildAt(0).indexOf(e)}getValue(e){return this[Ze].getChildAt(1).get(e)}setValue(e,r){this[Ze].getChildAt(1).set(e,r)}};Oc.MapRow=xm;var Em=class extends ur{constructor(e){return super(e,e.type.children.length),AS(this)}*keys(){for(let e of this[Ze].type.children)yield e.name}*values(){for(let e of this[Ze].type.children)yield this[e.name]}getKey(e){return this[Ze].type.children[e].name}getIndex(e){return this[Ze].type.children.findIndex(r=>r.name===e)}getValue(e){return this[Ze].getChildAt(e).get(this[As])}setValue(e,r){return this[Ze].getChildAt(e).set(this[As],r)}};Oc.StructRow=Em;Object.setPrototypeOf(ur.prototype,Map.prototype);var AS=(()=>{let t={enumerable:!0,configurable:!1,get:null,set:null};return e=>{let r=-1,n=e[Et]||(e[Et]=new Map),i=a=>function(){return this.get(a)},s=a=>function(l){return this.set(a,l)};for(let a of e.keys())n.set(a,++r),t.get=i(a),t.set=s(a),e.hasOwnProperty(a)||(t.enumerable=!0,Object.defineProperty(e,a,t)),e.hasOwnProperty(r)||(t.enumerable=!1,Object.defineProperty(e,r,t));return t.get=t.set=null,e}})(),aM=(()=>{if(typeof Proxy>"u")return AS;let t=ur.prototype.has,e=ur.prototype.get,r=ur.prototype.set,n=ur.prototype.getKey,i={isExtensible(){return!1},deleteProperty(){return!1},preventExtensions(){return!0},ownKeys(s){return[...s.keys()].map(a=>`${a}`)},has(s,a){switch(a){case"getKey":case"getIndex":case"getValue":case"setValue":case"toArray":case"toJSON":case"inspect":case"constructor":case"isPrototypeOf":case"propertyIsEnumerable":case"toString":case"toLocaleString":case"valueOf":case"size":case"has":case"get":case"set":case"clear":case"delete":case"keys":case"values":case"entries":case"forEach":case"__proto__":case"__defineGetter__":case"__defineSetter__":case"hasOwnProperty":case"__lookupGetter__":case"__lookupSetter__":case Symbol.iterator:case Symbol.toStringTag:case Ze:case As:case xt:case Et:case Mm:return!0}return typeof a=="number"&&!s.has(a)&&(a=s.getKey(a)),s.has(a)},get(s,a,l){switch(a){case"getKey":case"getIndex":case"getValue":case"setValue":case"toArray":case"toJSON":case"inspect":case"constructor":case"isPrototypeOf":case"propertyIsEnumerable":case"toString":case"toLocaleString":case"valueOf":case"size":case"has":case"get":case"set":case"clear":case"delete":case"keys":case"values":case"entries":case"forEach":case"__proto__":case"__defineGetter__":case"__defineSetter__":case"hasOwnProperty":case"__lookupGetter__":case"__lookupSetter__":case Symbol.iterator:case Symbol.toStringTag:case Ze:case As:case xt:case Et:case Mm:return Reflect.get(s,a,l)}return typeof a=="number"&&!t.call(l,a)&&(a=n.call(l,a)),e.call(l,a)},set(s,a,l,c){switch(a){case Ze:case As:case xt:case Et:return Reflect.set(s,a,l,c);case"getKey":case"getIndex":case"getValue":case"setValue":case"toArray":case"toJSON":case"inspect":case"constructor":case"isPrototypeOf":case"propertyIsEnumerable":case"toString":case"toLocaleString":case"valueOf":case"size":case"has":case"get":case"set":case"clear":case"delete":case"keys":case"values":case"entries":case"forEach":case"__proto__":case"__defineGetter__":case"__defineSetter__":case"hasOwnProperty":case"__lookupGetter__":case"__lookupSetter__":case Symbol.iterator:case Symbol.toStringTag:return!1}return typeof a=="number"&&!t.call(c,a)&&(a=n.call(c,a)),t.call(c,a)?!!r.call(c,a,l):!1}};return s=>new Proxy(s,i)})()});var Da=b(Ia=>{"use strict";Object.defineProperty(Ia,"__esModule",{value:!0});var US=xe(),FS=Ta(),lM=Ve(),OS=st();function uM(t,e,r){let n=t.length,i=e>-1?e:n+e%n;return r?r(t,i):i}Ia.clampIndex=uM;var MS;function cM(t,e,r,n){let{length:i=0}=t,s=typeof e!="number"?0:e,a=typeof r!="number"?i:r;return s<0&&(s=(s%i+i)%i),a<0&&(a=(a%i+i)%i),a<s&&(MS=s,s=a,a=MS),a>i&&(a=i),n?n(t,s,a):[s,a]}Ia.clampRange=cM;var dM=OS.BigIntAvailable?OS.BigInt(0):0,xS=t=>t!==t;function Ba(t){let e=typeof t;if(e!=="object"||t===null)return xS(t)?xS:e!=="bigint"?r=>r===t:r=>dM+r===t;if(t instanceof Date){let r=t.valueOf();return n=>n instanceof Date?n.valueOf()===r:!1}return ArrayBuffer.isView(t)?r=>r?lM.compareArrayLike(t,r):!1:t instanceof Map?hM(t):Array.isArray(t)?fM(t):t instanceof US.Vector?pM(t):yM(t)}Ia.createElementComparator=Ba;function fM(t){let e=[];for(let r=-1,n=t.length;++r<n;)e[r]=Ba(t[r]);return Mc(e)}function hM(t){let e=-1,r=[];return t.forEach(n=>r[++e]=Ba(n)),Mc(r)}function pM(t){let e=[];for(let r=-1,n=t.length;++r<n;)e[r]=Ba(t.get(r));return Mc(e)}function yM(t){let e=Object.keys(t);if(e.length===0)return()=>!1;let r=[];for(let n=-1,i=e.length;++n<i;)r[n]=Ba(t[e[n]]);return Mc(r,e)}function Mc(t,e){return r=>{if(!r||typeof r!="object")return!1;switch(r.constructor){case Array:return mM(t,r);case Map:case FS.MapRow:case FS.StructRow:return ES(t,r,r.keys());case Object:case void 0:return ES(t,r,e||Object.keys(r))}return r instanceof US.Vector?gM(t,r):!1}}function mM(t,e){let r=t.length;if(e.length!==r)return!1;for(let n=-1;++n<r;)if(!t[n](e[n]))return!1;return!0}function gM(t,e){let r=t.length;if(e.length!==r)return!1;for(let n=-1;++n<r;)if(!t[n](e.get(n)))return!1;return!0}function ES(t,e,r){let n=r[Symbol.iterator](),i=e instanceof Map?e.keys():Object.keys(e)[Symbol.iterator](),s=e instanceof Map?e.values():Object.values(e)[Symbol.iterator](),a=0,l=t.length,c=s.next(),o=n.next(),u=i.next();for(;a<l&&!o.done&&!u.done&&!c.done&&!(o.value!==u.value||!t[a](c.value));++a,o=n.next(),u=i.next(),c=s.next());return a===l&&o.done&&u.done&&c.done?!0:(n.return&&n.return(),i.return&&i.return(),s.return&&s.return(),!1)}});var On=b(Vm=>{"use strict";Object.defineProperty(Vm,"__esModule",{value:!0});var vM=Da(),VS=ie(),_M=Mn(),NS=xe(),Um=class t extends NS.AbstractVector{constructor(e,r=[],n=wM(r)){super(),this._nullCount=-1,this._type=e,this._chunks=r,this._chunkOffsets=n,this._length=n[n.length-1],this._numChildren=(this._type.children||[]).length}static flatten(...e){return _M.selectChunkArgs(NS.Vector,e)}static concat(...e){let r=t.flatten(...e);return new t(r[0].type,r)}get type(){return this._type}get length(){return this._length}get chunks(){return this._chunks}get typeId(){return this._type.typeId}get VectorName(){return`Chunked<${this._type}>`}get data(){return this._chunks[0]?this._chunks[0].data:null}get ArrayType(){return this._type.ArrayType}get numChildren(){return this._numChildren}get stride(){return this._chunks[0]?this._chunks[0].stride:1}get byteLength(){return this._chunks.reduce((e,r)=>e+r.byteLength,0)}get nullCount(){let e=this._nullCount;return e<0&&(this._nullCount=e=this._chunks.reduce((r,{nullCount:n})=>r+n,0)),e}get indices(){if(VS.DataType.isDictionary(this._type)){if(!this._indices){let e=this._chunks;this._indices=e.length===1?e[0].indices:t.concat(...e.map(r=>r.indices))}return this._indices}return null}get dictionary(){return VS.DataType.isDictionary(this._type)?this._chunks[this._chunks.length-1].data.dictionary:null}*[Symbol.iterator](){for(let e of this._chunks)yield*e}clone(e=this._chunks){return new t(this._type,e)}concat(...e){return this.clone(t.flatten(this,...e))}slice(e,r){return vM.clampRange(this,e,r,this._sliceInternal)}getChildAt(e){if(e<0||e>=this._numChildren)return null;let r=this._children||(this._children=[]),n,i,s;return(n=r[e])?n:(i=(this._type.children||[])[e])&&(s=this._chunks.map(a=>a.getChildAt(e)).filter(a=>a!=null),s.length>0)?r[e]=new t(i.type,s):null}search(e,r){let n=e,i=this._chunkOffsets,s=i.length-1;if(n<0||n>=i[s])return null;if(s<=1)return r?r(this,0,n):[0,n];let a=0,l=0,c=0;do{if(a+1===s)return r?r(this,a,n-l):[a,n-l];c=a+(s-a)/2|0,n>=i[c]?a=c:s=c}while(n<i[s]&&n>=(l=i[a]));return null}isValid(e){return!!this.search(e,this.isValidInternal)}get(e){return this.search(e,this.getInternal)}set(e,r){this.search(e,({chunks:n},i,s)=>n[i].set(s,r))}indexOf(e,r){return r&&typeof r=="number"?this.search(r,(n,i,s)=>this.indexOfInternal(n,i,s,e)):this.indexOfInternal(this,0,Math.max(0,r||0),e)}toArray(){let{chunks:e}=this,r=e.length,n=this._type.ArrayType;if(r<=0)return new n(0);if(r<=1)return e[0].toArray();let i=0,s=new Array(r);for(let c=-1;++c<r;)i+=(s[c]=e[c].toArray()).length;n!==s[0].constructor&&(n=s[0].constructor);let a=new n(i),l=n===Array?SM:bM;for(let c=-1,o=0;++c<r;)o=l(s[c],a,o);return a}getInternal({_chunks:e},r,n){return e[r].get(n)}isValidInternal({_chunks:e},r,n){return e[r].isValid(n)}indexOfInternal({_chunks:e},r,n,i){let s=r-1,a=e.length,l=n,c=0,o=-1;for(;++s<a;){if(~(o=e[s].indexOf(i,l)))return c+o;l=0,c+=e[s].length}return-1}_sliceInternal(e,r,n){let i=[],{chunks:s,_chunkOffsets:a}=e;for(let l=-1,c=s.length;++l<c;){let o=s[l],u=o.length,d=a[l];if(d>=n)break;if(r>=d+u)continue;if(d>=r&&d+u<=n){i.push(o);continue}let v=Math.max(0,r-d),T=Math.min(n-d,u);i.push(o.slice(v,T))}return e.clone(i)}};Vm.Chunked=Um;function wM(t){let e=new Uint32Array((t||[]).length+1),r=e[0]=0,n=e.length;for(let i=0;++i<n;)e[i]=r+=t[i-1].length;return e}var bM=(t,e,r)=>(e.set(t,r),r+t.length),SM=(t,e,r)=>{let n=r;for(let i=-1,s=t.length;++i<s;)e[n++]=t[i];return n}});var Fs=b(km=>{"use strict";Object.defineProperty(km,"__esModule",{value:!0});var TM=$e(),kS=xe(),Nm=On(),xc=class t extends Nm.Chunked{constructor(e,r=[],n){if(r=Nm.Chunked.flatten(...r),super(e.type,r,n),this._field=e,r.length===1&&!(this instanceof Ec))return new Ec(e,r[0],this._chunkOffsets)}static new(e,r,...n){let i=Nm.Chunked.flatten(Array.isArray(r)?[...r,...n]:r instanceof kS.Vector?[r,...n]:[kS.Vector.new(r,...n)]);if(typeof e=="string"){let s=i[0].data.type;e=new TM.Field(e,s,!0)}else!e.nullable&&i.some(({nullCount:s})=>s>0)&&(e=e.clone({nullable:!0}));return new t(e,i)}get field(){return this._field}get name(){return this._field.name}get nullable(){return this._field.nullable}get metadata(){return this._field.metadata}clone(e=this._chunks){return new t(this._field,e)}getChildAt(e){if(e<0||e>=this.numChildren)return null;let r=this._children||(this._children=[]),n,i,s;return(n=r[e])?n:(i=(this.type.children||[])[e])&&(s=this._chunks.map(a=>a.getChildAt(e)).filter(a=>a!=null),s.length>0)?r[e]=new t(i,s):null}};km.Column=xc;var Ec=class extends xc{constructor(e,r,n){super(e,[r],n),this._chunk=r}search(e,r){return r?r(this,0,e):[0,e]}isValid(e){return this._chunk.isValid(e)}get(e){return this._chunk.get(e)}set(e,r){this._chunk.set(e,r)}indexOf(e,r){return this._chunk.indexOf(e,r)}}});var Mn=b(Un=>{"use strict";Object.defineProperty(Un,"__esModule",{value:!0});var LS=sr(),CS=$e(),xn=Fs(),Aa=xe(),RS=ie(),BM=On(),En=Array.isArray;Un.selectArgs=(t,e)=>Uc(t,e,[],0);Un.selectColumnArgs=t=>{let[e,r]=Cm(t,[[],[]]);return r.map((n,i)=>n instanceof xn.Column?xn.Column.new(n.field.clone(e[i]),n):n instanceof Aa.Vector?xn.Column.new(e[i],n):xn.Column.new(e[i],[]))};Un.selectFieldArgs=t=>Cm(t,[[],[]]);Un.selectChunkArgs=(t,e)=>Lm(t,e,[],0);Un.selectVectorChildrenArgs=(t,e)=>PS(t,e,[],0);Un.selectColumnChildrenArgs=(t,e)=>jS(t,e,[],0);function Uc(t,e,r,n){let i,s=n,a=-1,l=e.length;for(;++a<l;)En(i=e[a])?s=Uc(t,i,r,s).length:i instanceof t&&(r[s++]=i);return r}function Lm(t,e,r,n){let i,s=n,a=-1,l=e.length;for(;++a<l;)En(i=e[a])?s=Lm(t,i,r,s).length:i instanceof BM.Chunked?s=Lm(t,i.chunks,r,s).length:i instanceof t&&(r[s++]=i);return r}function PS(t,e,r,n){let i,s=n,a=-1,l=e.length;for(;++a<l;)En(i=e[a])?s=PS(t,i,r,s).length:i instanceof t?s=Uc(Aa.Vector,i.schema.fields.map((c,o)=>i.getChildAt(o)),r,s).length:i instanceof Aa.Vector&&(r[s++]=i);return r}function jS(t,e,r,n){let i,s=n,a=-1,l=e.length;for(;++a<l;)En(i=e[a])?s=jS(t,i,r,s).length:i instanceof t?s=Uc(xn.Column,i.schema.fields.map((c,o)=>xn.Column.new(c,i.getChildAt(o))),r,s).length:i instanceof xn.Column&&(r[s++]=i);return r}var IM=(t,[e,r],n)=>(t[0][n]=e,t[1][n]=r,t);function Cm(t,e){let r,n;switch(n=t.length){case 0:return e;case 1:if(r=e[0],!t[0])return e;if(En(t[0]))return Cm(t[0],e);t[0]instanceof LS.Data||t[0]instanceof Aa.Vector||t[0]instanceof RS.DataType||([r,t]=Object.entries(t[0]).reduce(IM,e));break;default:En(r=t[n-1])?t=En(t[0])?t[0]:t.slice(0,n-1):(t=En(t[0])?t[0]:t,r=[])}let i=-1,s=-1,a=-1,l=t.length,c,o,[u,d]=e;for(;++a<l;)o=t[a],o instanceof xn.Column&&(d[++s]=o)?u[++i]=o.field.clone(r[a],o.type,!0):({[a]:c=a}=r,o instanceof RS.DataType&&(d[++s]=o)?u[++i]=CS.Field.new(c,o,!0):o&&o.type&&(d[++s]=o)&&(o instanceof LS.Data&&(d[s]=o=Aa.Vector.new(o)),u[++i]=CS.Field.new(c,o.type,!0)));return e}});var $e=b(Nc=>{"use strict";Object.defineProperty(Nc,"__esModule",{value:!0});var DM=ie(),AM=Mn(),FM=Mn(),zS=iy(),Os=class t{constructor(e=[],r,n){this.fields=e||[],this.metadata=r||new Map,n||(n=Rm(e)),this.dictionaries=n}static from(...e){return t.new(e[0],e[1])}static new(...e){return new t(FM.selectFieldArgs(e)[0])}get[Symbol.toStringTag](){return"Schema"}toString(){return`Schema<{ ${this.fields.map((e,r)=>`${r}: ${e}`).join(", ")} }>`}compareTo(e){return zS.instance.compareSchemas(this,e)}select(...e){let r=e.reduce((n,i)=>(n[i]=!0)&&n,Object.create(null));return new t(this.fields.filter(n=>r[n.name]),this.metadata)}selectAt(...e){return new t(e.map(r=>this.fields[r]).filter(Boolean),this.metadata)}assign(...e){let r=e[0]instanceof t?e[0]:new t(AM.selectArgs(Vn,e)),n=[...this.fields],i=Vc(Vc(new Map,this.metadata),r.metadata),s=r.fields.filter(l=>{let c=n.findIndex(o=>o.name===l.name);return~c?(n[c]=l.clone({metadata:Vc(Vc(new Map,n[c].metadata),l.metadata)}))&&!1:!0}),a=Rm(s,new Map);return new t([...n,...s],i,new Map([...this.dictionaries,...a]))}};Nc.Schema=Os;var Vn=class t{constructor(e,r,n=!1,i){this.name=e,this.type=r,this.nullable=n,this.metadata=i||new Map}static new(...e){let[r,n,i,s]=e;return e[0]&&typeof e[0]=="object"&&({name:r}=e[0],n===void 0&&(n=e[0].type),i===void 0&&(i=e[0].nullable),s===void 0&&(s=e[0].metadata)),new t(`${r}`,n,i,s)}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return`${this.name}: ${this.type}`}compareTo(e){return zS.instance.compareField(this,e)}clone(...e){let[r,n,i,s]=e;return!e[0]||typeof e[0]!="object"?[r=this.name,n=this.type,i=this.nullable,s=this.metadata]=e:{name:r=this.name,type:n=this.type,nullable:i=this.nullable,metadata:s=this.metadata}=e[0],t.new(r,n,i,s)}};Nc.Field=Vn;function Vc(t,e){return new Map([...t||new Map,...e||new Map])}function Rm(t,e=new Map){for(let r=-1,n=t.length;++r<n;){let s=t[r].type;if(DM.DataType.isDictionary(s)){if(!e.has(s.id))e.set(s.id,s.dictionary);else if(e.get(s.id)!==s.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}s.children&&s.children.length>0&&Rm(s.children,e)}return e}Os.prototype.fields=null;Os.prototype.metadata=null;Os.prototype.dictionaries=null;Vn.prototype.type=null;Vn.prototype.name=null;Vn.prototype.nullable=null;Vn.prototype.metadata=null});var zm=b(jm=>{"use strict";Object.defineProperty(jm,"__esModule",{value:!0});var OM=Om(),MM=$e(),xM=ie(),EM=Fn(),UM=Ae(),Pm=class extends UM.VariableWidthBuilder{constructor(e){super(e),this._run=new OM.Run,this._offsets=new EM.OffsetsBufferBuilder}addChild(e,r="0"){if(this.numChildren>0)throw new Error("ListBuilder can only have one child.");return this.children[this.numChildren]=e,this.type=new xM.List(new MM.Field(r,e.type,!0)),this.numChildren-1}clear(){return this._run.clear(),super.clear()}_flushPending(e){let r=this._run,n=this._offsets,i=this._setValue,s=0,a;for([s,a]of e)a===void 0?n.set(s,0):(n.set(s,a.length),i(this,s,r.bind(a)))}};jm.ListBuilder=Pm});var Wm=b($m=>{"use strict";Object.defineProperty($m,"__esModule",{value:!0});var VM=Om(),NM=$e(),kM=Ae(),LM=ie(),qm=class extends kM.Builder{constructor(){super(...arguments),this._run=new VM.Run}setValue(e,r){super.setValue(e,this._run.bind(r))}addChild(e,r="0"){if(this.numChildren>0)throw new Error("FixedSizeListBuilder can only have one child.");let n=this.children.push(e);return this.type=new LM.FixedSizeList(this.type.listSize,new NM.Field(r,e.type,!0)),n}clear(){return this._run.clear(),super.clear()}};$m.FixedSizeListBuilder=qm});var Km=b(Ym=>{"use strict";Object.defineProperty(Ym,"__esModule",{value:!0});var CM=$e(),RM=ie(),PM=Ae(),Hm=class extends PM.VariableWidthBuilder{set(e,r){return super.set(e,r)}setValue(e,r){r=r instanceof Map?r:new Map(Object.entries(r));let n=this._pending||(this._pending=new Map),i=n.get(e);i&&(this._pendingLength-=i.size),this._pendingLength+=r.size,n.set(e,r)}addChild(e,r=`${this.numChildren}`){if(this.numChildren>0)throw new Error("ListBuilder can only have one child.");return this.children[this.numChildren]=e,this.type=new RM.Map_(new CM.Field(r,e.type,!0),this.type.keysSorted),this.numChildren-1}_flushPending(e){let r=this._offsets,n=this._setValue;e.forEach((i,s)=>{i===void 0?r.set(s,0):(r.set(s,i.size),n(this,s,i))})}};Ym.MapBuilder=Hm});var Gm=b(Jm=>{"use strict";Object.defineProperty(Jm,"__esModule",{value:!0});var jM=$e(),zM=Ae(),qM=ie(),Qm=class extends zM.Builder{addChild(e,r=`${this.numChildren}`){let n=this.children.push(e);return this.type=new qM.Struct([...this.type.children,new jM.Field(r,e.type,!0)]),n}};Jm.StructBuilder=Qm});var eg=b(Oa=>{"use strict";Object.defineProperty(Oa,"__esModule",{value:!0});var $M=$e(),qS=Fn(),WM=Ae(),HM=ie(),Fa=class extends WM.Builder{constructor(e){super(e),this._typeIds=new qS.DataBufferBuilder(new Int8Array(0),1),typeof e.valueToChildTypeId=="function"&&(this._valueToChildTypeId=e.valueToChildTypeId)}get typeIdToChildIndex(){return this.type.typeIdToChildIndex}append(e,r){return this.set(this.length,e,r)}set(e,r,n){return n===void 0&&(n=this._valueToChildTypeId(this,r,e)),this.setValid(e,this.isValid(r))&&this.setValue(e,r,n),this}setValue(e,r,n){this._typeIds.set(e,n),super.setValue(e,r)}addChild(e,r=`${this.children.length}`){let n=this.children.push(e),{type:{children:i,mode:s,typeIds:a}}=this,l=[...i,new $M.Field(r,e.type)];return this.type=new HM.Union(s,[...a,n],l),n}_valueToChildTypeId(e,r,n){throw new Error("Cannot map UnionBuilder value to child typeId. Pass the `childTypeId` as the second argument to unionBuilder.append(), or supply a `valueToChildTypeId` function as part of the UnionBuilder constructor options.")}};Oa.UnionBuilder=Fa;var Zm=class extends Fa{};Oa.SparseUnionBuilder=Zm;var Xm=class extends Fa{constructor(e){super(e),this._offsets=new qS.DataBufferBuilder(new Int32Array(0))}setValue(e,r,n){let i=this.type.typeIdToChildIndex[n];return this._offsets.set(e,this.getChildAt(i).length),super.setValue(e,r,n)}};Oa.DenseUnionBuilder=Xm});var ng=b(kc=>{"use strict";Object.defineProperty(kc,"__esModule",{value:!0});var YM=xe(),KM=Ge(),QM=oi(),JM=ga(),GM=Ve(),zt=de(),z=class extends KM.Visitor{};kc.SetVisitor=z;var ZM=(t,e,r)=>{t[e]=r/864e5|0},tg=(t,e,r)=>{t[e]=r%4294967296|0,t[e+1]=r/4294967296|0},XM=(t,e,r)=>{t[e]=r*1e3%4294967296|0,t[e+1]=r*1e3/4294967296|0},e2=(t,e,r)=>{t[e]=r*1e6%4294967296|0,t[e+1]=r*1e6/4294967296|0},$S=(t,e,r,n)=>{let{[r]:i,[r+1]:s}=e;i!=null&&s!=null&&t.set(n.subarray(0,s-i),i)},t2=({offset:t,values:e},r,n)=>{let i=t+r;n?e[i>>3]|=1<<i%8:e[i>>3]&=~(1<<i%8)},WS=({values:t},e,r)=>{ZM(t,e,r.valueOf())},HS=({values:t},e,r)=>{tg(t,e*2,r.valueOf())},Dr=({stride:t,values:e},r,n)=>{e[t*r]=n},YS=({stride:t,values:e},r,n)=>{e[t*r]=JM.float64ToUint16(n)},rg=(t,e,r)=>{switch(typeof r){case"bigint":t.values64[e]=r;break;case"number":t.values[e*t.stride]=r;break;default:let n=r,{stride:i,ArrayType:s}=t,a=GM.toArrayBufferView(s,n);t.values.set(a.subarray(0,i),i*e)}},r2=({stride:t,values:e},r,n)=>{e.set(n.subarray(0,t),t*r)},n2=({values:t,valueOffsets:e},r,n)=>$S(t,e,r,n),i2=({values:t,valueOffsets:e},r,n)=>{$S(t,e,r,QM.encodeUtf8(n))},s2=(t,e,r)=>{t.type.bitWidth<64?Dr(t,e,r):rg(t,e,r)},o2=(t,e,r)=>{t.type.precision!==zt.Precision.HALF?Dr(t,e,r):YS(t,e,r)},a2=(t,e,r)=>{t.type.unit===zt.DateUnit.DAY?WS(t,e,r):HS(t,e,r)},KS=({values:t},e,r)=>tg(t,e*2,r/1e3),QS=({values:t},e,r)=>tg(t,e*2,r),JS=({values:t},e,r)=>XM(t,e*2,r),GS=({values:t},e,r)=>e2(t,e*2,r),l2=(t,e,r)=>{switch(t.type.unit){case zt.TimeUnit.SECOND:return KS(t,e,r);case zt.TimeUnit.MILLISECOND:return QS(t,e,r);case zt.TimeUnit.MICROSECOND:return JS(t,e,r);case zt.TimeUnit.NANOSECOND:return GS(t,e,r)}},ZS=({values:t,stride:e},r,n)=>{t[e*r]=n},XS=({values:t,stride:e},r,n)=>{t[e*r]=n},eT=({values:t},e,r)=>{t.set(r.subarray(0,2),2*e)},tT=({values:t},e,r)=>{t.set(r.subarray(0,2),2*e)},u2=(t,e,r)=>{switch(t.type.unit){case zt.TimeUnit.SECOND:return ZS(t,e,r);case zt.TimeUnit.MILLISECOND:return XS(t,e,r);case zt.TimeUnit.MICROSECOND:return eT(t,e,r);case zt.TimeUnit.NANOSECOND:return tT(t,e,r)}},c2=({values:t},e,r)=>{t.set(r.subarray(0,4),4*e)},d2=(t,e,r)=>{let n=t.getChildAt(0),i=t.valueOffsets;for(let s=-1,a=i[e],l=i[e+1];a<l;)n.set(a++,r.get(++s))},f2=(t,e,r)=>{let n=t.getChildAt(0),i=t.valueOffsets,s=r instanceof Map?[...r]:Object.entries(r);for(let a=-1,l=i[e],c=i[e+1];l<c;)n.set(l++,s[++a])},h2=(t,e)=>(r,n,i)=>r&&r.set(t,e[i]),p2=(t,e)=>(r,n,i)=>r&&r.set(t,e.get(i)),y2=(t,e)=>(r,n,i)=>r&&r.set(t,e.get(n.name)),m2=(t,e)=>(r,n,i)=>r&&r.set(t,e[n.name]),g2=(t,e,r)=>{let n=r instanceof Map?y2(e,r):r instanceof YM.Vector?p2(e,r):Array.isArray(r)?h2(e,r):m2(e,r);t.type.children.forEach((i,s)=>n(t.getChildAt(s),i,s))},v2=(t,e,r)=>{t.type.mode===zt.UnionMode.Dense?rT(t,e,r):nT(t,e,r)},rT=(t,e,r)=>{let n=t.typeIdToChildIndex[t.typeIds[e]],i=t.getChildAt(n);i&&i.set(t.valueOffsets[e],r)},nT=(t,e,r)=>{let n=t.typeIdToChildIndex[t.typeIds[e]],i=t.getChildAt(n);i&&i.set(e,r)},_2=(t,e,r)=>{let n=t.getKey(e);n!==null&&t.setValue(n,r)},w2=(t,e,r)=>{t.type.unit===zt.IntervalUnit.DAY_TIME?iT(t,e,r):sT(t,e,r)},iT=({values:t},e,r)=>{t.set(r.subarray(0,2),2*e)},sT=({values:t},e,r)=>{t[e]=r[0]*12+r[1]%12},b2=(t,e,r)=>{let n=t.getChildAt(0),{stride:i}=t;for(let s=-1,a=e*i;++s<i;)n.set(a+s,r.get(s))};z.prototype.visitBool=t2;z.prototype.visitInt=s2;z.prototype.visitInt8=Dr;z.prototype.visitInt16=Dr;z.prototype.visitInt32=Dr;z.prototype.visitInt64=rg;z.prototype.visitUint8=Dr;z.prototype.visitUint16=Dr;z.prototype.visitUint32=Dr;z.prototype.visitUint64=rg;z.prototype.visitFloat=o2;z.prototype.visitFloat16=YS;z.prototype.visitFloat32=Dr;z.prototype.visitFloat64=Dr;z.prototype.visitUtf8=i2;z.prototype.visitBinary=n2;z.prototype.visitFixedSizeBinary=r2;z.prototype.visitDate=a2;z.prototype.visitDateDay=WS;z.prototype.visitDateMillisecond=HS;z.prototype.visitTimestamp=l2;z.prototype.visitTimestampSecond=KS;z.prototype.visitTimestampMillisecond=QS;z.prototype.visitTimestampMicrosecond=JS;z.prototype.visitTimestampNanosecond=GS;z.prototype.visitTime=u2;z.prototype.visitTimeSecond=ZS;z.prototype.visitTimeMillisecond=XS;z.prototype.visitTimeMicrosecond=eT;z.prototype.visitTimeNanosecond=tT;z.prototype.visitDecimal=c2;z.prototype.visitList=d2;z.prototype.visitStruct=g2;z.prototype.visitUnion=v2;z.prototype.visitDenseUnion=rT;z.prototype.visitSparseUnion=nT;z.prototype.visitDictionary=_2;z.prototype.visitInterval=w2;z.prototype.visitIntervalDayTime=iT;z.prototype.visitIntervalYearMonth=sT;z.prototype.visitFixedSizeList=b2;z.prototype.visitMap=f2;kc.instance=new z});var oT=b(Rc=>{"use strict";Object.defineProperty(Rc,"__esModule",{value:!0});var S2=Ge(),T2=Dc(),B2=Uy(),ig=Ry(),I2=zy(),D2=Hy(),A2=Qy(),F2=Wm(),Lc=Xy(),sg=Tm(),Jr=cm(),O2=zm(),M2=Km(),x2=ky(),E2=Gm(),Ma=wm(),xa=ym(),og=eg(),U2=Fc(),Cc=class extends S2.Visitor{visitNull(){return x2.NullBuilder}visitBool(){return B2.BoolBuilder}visitInt(){return Jr.IntBuilder}visitInt8(){return Jr.Int8Builder}visitInt16(){return Jr.Int16Builder}visitInt32(){return Jr.Int32Builder}visitInt64(){return Jr.Int64Builder}visitUint8(){return Jr.Uint8Builder}visitUint16(){return Jr.Uint16Builder}visitUint32(){return Jr.Uint32Builder}visitUint64(){return Jr.Uint64Builder}visitFloat(){return Lc.FloatBuilder}visitFloat16(){return Lc.Float16Builder}visitFloat32(){return Lc.Float32Builder}visitFloat64(){return Lc.Float64Builder}visitUtf8(){return U2.Utf8Builder}visitBinary(){return T2.BinaryBuilder}visitFixedSizeBinary(){return A2.FixedSizeBinaryBuilder}visitDate(){return ig.DateBuilder}visitDateDay(){return ig.DateDayBuilder}visitDateMillisecond(){return ig.DateMillisecondBuilder}visitTimestamp(){return Ma.TimestampBuilder}visitTimestampSecond(){return Ma.TimestampSecondBuilder}visitTimestampMillisecond(){return Ma.TimestampMillisecondBuilder}visitTimestampMicrosecond(){return Ma.TimestampMicrosecondBuilder}visitTimestampNanosecond(){return Ma.TimestampNanosecondBuilder}visitTime(){return xa.TimeBuilder}visitTimeSecond(){return xa.TimeSecondBuilder}visitTimeMillisecond(){return xa.TimeMillisecondBuilder}visitTimeMicrosecond(){return xa.TimeMicrosecondBuilder}visitTimeNanosecond(){return xa.TimeNanosecondBuilder}visitDecimal(){return I2.DecimalBuilder}visitList(){return O2.ListBuilder}visitStruct(){return E2.StructBuilder}visitUnion(){return og.UnionBuilder}visitDenseUnion(){return og.DenseUnionBuilder}visitSparseUnion(){return og.SparseUnionBuilder}visitDictionary(){return D2.DictionaryBuilder}visitInterval(){return sg.IntervalBuilder}visitIntervalDayTime(){return sg.IntervalDayTimeBuilder}visitIntervalYearMonth(){return sg.IntervalYearMonthBuilder}visitFixedSizeList(){return F2.FixedSizeListBuilder}visitMap(){return M2.MapBuilder}};Rc.GetBuilderCtor=Cc;Rc.instance=new Cc});var jc=b(q=>{"use strict";Object.defineProperty(q,"__esModule",{value:!0});var V2=Ae();q.Builder=V2.Builder;var N2=Uy();q.BoolBuilder=N2.BoolBuilder;var k2=ky();q.NullBuilder=k2.NullBuilder;var lg=Ry();q.DateBuilder=lg.DateBuilder;q.DateDayBuilder=lg.DateDayBuilder;q.DateMillisecondBuilder=lg.DateMillisecondBuilder;var L2=zy();q.DecimalBuilder=L2.DecimalBuilder;var C2=Hy();q.DictionaryBuilder=C2.DictionaryBuilder;var R2=Qy();q.FixedSizeBinaryBuilder=R2.FixedSizeBinaryBuilder;var Pc=Xy();q.FloatBuilder=Pc.FloatBuilder;q.Float16Builder=Pc.Float16Builder;q.Float32Builder=Pc.Float32Builder;q.Float64Builder=Pc.Float64Builder;var Gr=cm();q.IntBuilder=Gr.IntBuilder;q.Int8Builder=Gr.Int8Builder;q.Int16Builder=Gr.Int16Builder;q.Int32Builder=Gr.Int32Builder;q.Int64Builder=Gr.Int64Builder;q.Uint8Builder=Gr.Uint8Builder;q.Uint16Builder=Gr.Uint16Builder;q.Uint32Builder=Gr.Uint32Builder;q.Uint64Builder=Gr.Uint64Builder;var Ea=ym();q.TimeBuilder=Ea.TimeBuilder;q.TimeSecondBuilder=Ea.TimeSecondBuilder;q.TimeMillisecondBuilder=Ea.TimeMillisecondBuilder;q.TimeMicrosecondBuilder=Ea.TimeMicrosecondBuilder;q.TimeNanosecondBuilder=Ea.TimeNanosecondBuilder;var Ua=wm();q.TimestampBuilder=Ua.TimestampBuilder;q.TimestampSecondBuilder=Ua.TimestampSecondBuilder;q.TimestampMillisecondBuilder=Ua.TimestampMillisecondBuilder;q.TimestampMicrosecondBuilder=Ua.TimestampMicrosecondBuilder;q.TimestampNanosecondBuilder=Ua.TimestampNanosecondBuilder;var ug=Tm();q.IntervalBuilder=ug.IntervalBuilder;q.IntervalDayTimeBuilder=ug.IntervalDayTimeBuilder;q.IntervalYearMonthBuilder=ug.IntervalYearMonthBuilder;var P2=Fc();q.Utf8Builder=P2.Utf8Builder;var j2=Dc();q.BinaryBuilder=j2.BinaryBuilder;var z2=zm();q.ListBuilder=z2.ListBuilder;var q2=Wm();q.FixedSizeListBuilder=q2.FixedSizeListBuilder;var $2=Km();q.MapBuilder=$2.MapBuilder;var W2=Gm();q.StructBuilder=W2.StructBuilder;var cg=eg();q.UnionBuilder=cg.UnionBuilder;q.SparseUnionBuilder=cg.SparseUnionBuilder;q.DenseUnionBuilder=cg.DenseUnionBuilder;var ag=de(),H2=Fc(),Y2=Ae(),aT=ng(),lT=oT();Y2.Builder.new=uT;function uT(t){let e=t.type,r=new(lT.instance.getVisitFn(e)())(t);if(e.children&&e.children.length>0){let n=t.children||[],i={nullValues:t.nullValues},s=Array.isArray(n)?(a,l)=>n[l]||i:({name:a})=>n[a]||i;e.children.forEach((a,l)=>{let{type:c}=a,o=s(a,l);r.children.push(uT({...o,type:c}))})}return r}Object.keys(ag.Type).map(t=>ag.Type[t]).filter(t=>typeof t=="number"&&t!==ag.Type.NONE).forEach(t=>{let e=lT.instance.visit(t);e.prototype._setValue=aT.instance.getVisitFn(t)});H2.Utf8Builder.prototype._setValue=aT.instance.visitBinary});var dT=b(Ms=>{"use strict";Object.defineProperty(Ms,"__esModule",{value:!0});var dg=vs(),cT;(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsFooter(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}version(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):dg.org.apache.arrow.flatbuf.MetadataVersion.V1}schema(o){let u=this.bb.__offset(this.bb_pos,6);return u?(o||new dg.org.apache.arrow.flatbuf.Schema).__init(this.bb.__indirect(this.bb_pos+u),this.bb):null}dictionaries(o,u){let d=this.bb.__offset(this.bb_pos,8);return d?(u||new t.apache.arrow.flatbuf.Block).__init(this.bb.__vector(this.bb_pos+d)+o*24,this.bb):null}dictionariesLength(){let o=this.bb.__offset(this.bb_pos,8);return o?this.bb.__vector_len(this.bb_pos+o):0}recordBatches(o,u){let d=this.bb.__offset(this.bb_pos,10);return d?(u||new t.apache.arrow.flatbuf.Block).__init(this.bb.__vector(this.bb_pos+d)+o*24,this.bb):null}recordBatchesLength(){let o=this.bb.__offset(this.bb_pos,10);return o?this.bb.__vector_len(this.bb_pos+o):0}static startFooter(o){o.startObject(4)}static addVersion(o,u){o.addFieldInt16(0,u,dg.org.apache.arrow.flatbuf.MetadataVersion.V1)}static addSchema(o,u){o.addFieldOffset(1,u,0)}static addDictionaries(o,u){o.addFieldOffset(2,u,0)}static startDictionariesVector(o,u){o.startVector(24,u,8)}static addRecordBatches(o,u){o.addFieldOffset(3,u,0)}static startRecordBatchesVector(o,u){o.startVector(24,u,8)}static endFooter(o){return o.endObject()}static finishFooterBuffer(o,u){o.finish(u)}static createFooter(o,u,d,v,T){return l.startFooter(o),l.addVersion(o,u),l.addSchema(o,d),l.addDictionaries(o,v),l.addRecordBatches(o,T),l.endFooter(o)}}a.Footer=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(cT=Ms.org||(Ms.org={}));(function(t){var e;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}offset(){return this.bb.readInt64(this.bb_pos)}metaDataLength(){return this.bb.readInt32(this.bb_pos+8)}bodyLength(){return this.bb.readInt64(this.bb_pos+16)}static createBlock(o,u,d,v){return o.prep(8,24),o.writeInt64(v),o.pad(4),o.writeInt32(d),o.writeInt64(u),o.offset()}}a.Block=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(e=t.apache||(t.apache={}))})(cT=Ms.org||(Ms.org={}))});var pg=b(qc=>{"use strict";Object.defineProperty(qc,"__esModule",{value:!0});var yT=dT(),hg=ys(),fT=hg.flatbuffers.Long,K2=hg.flatbuffers.Builder,Q2=hg.flatbuffers.ByteBuffer,J2=yT.org.apache.arrow.flatbuf.Block,Ar=yT.org.apache.arrow.flatbuf.Footer,hT=$e(),pT=de(),G2=Ve(),zc=class{constructor(e,r=pT.MetadataVersion.V4,n,i){this.schema=e,this.version=r,n&&(this._recordBatches=n),i&&(this._dictionaryBatches=i)}static decode(e){e=new Q2(G2.toUint8Array(e));let r=Ar.getRootAsFooter(e),n=hT.Schema.decode(r.schema());return new fg(n,r)}static encode(e){let r=new K2,n=hT.Schema.encode(r,e.schema);Ar.startRecordBatchesVector(r,e.numRecordBatches),[...e.recordBatches()].slice().reverse().forEach(a=>gi.encode(r,a));let i=r.endVector();Ar.startDictionariesVector(r,e.numDictionaries),[...e.dictionaryBatches()].slice().reverse().forEach(a=>gi.encode(r,a));let s=r.endVector();return Ar.startFooter(r),Ar.addSchema(r,n),Ar.addVersion(r,pT.MetadataVersion.V4),Ar.addRecordBatches(r,i),Ar.addDictionaries(r,s),Ar.finishFooterBuffer(r,Ar.endFooter(r)),r.asUint8Array()}get numRecordBatches(){return this._recordBatches.length}get numDictionaries(){return this._dictionaryBatches.length}*recordBatches(){for(let e,r=-1,n=this.numRecordBatches;++r<n;)(e=this.getRecordBatch(r))&&(yield e)}*dictionaryBatches(){for(let e,r=-1,n=this.numDictionaries;++r<n;)(e=this.getDictionaryBatch(r))&&(yield e)}getRecordBatch(e){return e>=0&&e<this.numRecordBatches&&this._recordBatches[e]||null}getDictionaryBatch(e){return e>=0&&e<this.numDictionaries&&this._dictionaryBatches[e]||null}};qc.Footer=zc;var fg=class extends zc{constructor(e,r){super(e,r.version()),this._footer=r}get numRecordBatches(){return this._footer.recordBatchesLength()}get numDictionaries(){return this._footer.dictionariesLength()}getRecordBatch(e){if(e>=0&&e<this.numRecordBatches){let r=this._footer.recordBatches(e);if(r)return gi.decode(r)}return null}getDictionaryBatch(e){if(e>=0&&e<this.numDictionaries){let r=this._footer.dictionaries(e);if(r)return gi.decode(r)}return null}},gi=class t{static decode(e){return new t(e.metaDataLength(),e.bodyLength(),e.offset())}static encode(e,r){let{metaDataLength:n}=r,i=new fT(r.offset,0),s=new fT(r.bodyLength,0);return J2.createBlock(e,i,n,s)}constructor(e,r,n){this.metaDataLength=e,this.offset=typeof n=="number"?n:n.low,this.bodyLength=typeof r=="number"?r:r.low}};qc.FileBlock=gi});var kn=b(Na=>{"use strict";Object.defineProperty(Na,"__esModule",{value:!0});var Nn=Jo(),mT=oi(),Va=gs(),yg=Ve(),xs=st(),$c=class extends Va.AsyncQueue{write(e){if((e=yg.toUint8Array(e)).byteLength>0)return super.write(e)}toString(e=!1){return e?mT.decodeUtf8(this.toUint8Array(!0)):this.toUint8Array(!1).then(mT.decodeUtf8)}toUint8Array(e=!1){return e?yg.joinUint8Arrays(this._values)[0]:(async()=>{let r=[],n=0;for await(let i of this)r.push(i),n+=i.byteLength;return yg.joinUint8Arrays(r,n)[0]})()}};Na.AsyncByteQueue=$c;var mg=class{constructor(e){e&&(this.source=new vg(Nn.default.fromIterable(e)))}[Symbol.iterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}};Na.ByteStream=mg;var gg=class t{constructor(e){e instanceof t?this.source=e.source:e instanceof $c?this.source=new Zr(Nn.default.fromAsyncIterable(e)):xs.isReadableNodeStream(e)?this.source=new Zr(Nn.default.fromNodeStream(e)):xs.isReadableDOMStream(e)?this.source=new Zr(Nn.default.fromDOMStream(e)):xs.isFetchResponse(e)?this.source=new Zr(Nn.default.fromDOMStream(e.body)):xs.isIterable(e)?this.source=new Zr(Nn.default.fromIterable(e)):xs.isPromise(e)?this.source=new Zr(Nn.default.fromAsyncIterable(e)):xs.isAsyncIterable(e)&&(this.source=new Zr(Nn.default.fromAsyncIterable(e)))}[Symbol.asyncIterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}get closed(){return this.source.closed}cancel(e){return this.source.cancel(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}};Na.AsyncByteStream=gg;var vg=class{constructor(e){this.source=e}cancel(e){this.return(e)}peek(e){return this.next(e,"peek").value}read(e){return this.next(e,"read").value}next(e,r="read"){return this.source.next({cmd:r,size:e})}throw(e){return Object.create(this.source.throw&&this.source.throw(e)||Va.ITERATOR_DONE)}return(e){return Object.create(this.source.return&&this.source.return(e)||Va.ITERATOR_DONE)}},Zr=class{constructor(e){this.source=e,this._closedPromise=new Promise(r=>this._closedPromiseResolve=r)}async cancel(e){await this.return(e)}get closed(){return this._closedPromise}async read(e){return(await this.next(e,"read")).value}async peek(e){return(await this.next(e,"peek")).value}async next(e,r="read"){return await this.source.next({cmd:r,size:e})}async throw(e){let r=this.source.throw&&await this.source.throw(e)||Va.ITERATOR_DONE;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(r)}async return(e){let r=this.source.return&&await this.source.return(e)||Va.ITERATOR_DONE;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(r)}}});var bg=b(Wc=>{"use strict";Object.defineProperty(Wc,"__esModule",{value:!0});var gT=kn(),Z2=Ve(),_g=class extends gT.ByteStream{constructor(e,r){super(),this.position=0,this.buffer=Z2.toUint8Array(e),this.size=typeof r>"u"?this.buffer.byteLength:r}readInt32(e){let{buffer:r,byteOffset:n}=this.readAt(e,4);return new DataView(r,n).getInt32(0,!0)}seek(e){return this.position=Math.min(e,this.size),e<this.size}read(e){let{buffer:r,size:n,position:i}=this;return r&&i<n?(typeof e!="number"&&(e=1/0),this.position=Math.min(n,i+Math.min(n-i,e)),r.subarray(i,this.position)):null}readAt(e,r){let n=this.buffer,i=Math.min(this.size,e+r);return n?n.subarray(e,i):new Uint8Array(r)}close(){this.buffer&&(this.buffer=null)}throw(e){return this.close(),{done:!0,value:e}}return(e){return this.close(),{done:!0,value:e}}};Wc.RandomAccessFile=_g;var wg=class extends gT.AsyncByteStream{constructor(e,r){super(),this.position=0,this._handle=e,typeof r=="number"?this.size=r:this._pending=(async()=>{this.size=(await e.stat()).size,delete this._pending})()}async readInt32(e){let{buffer:r,byteOffset:n}=await this.readAt(e,4);return new DataView(r,n).getInt32(0,!0)}async seek(e){return this._pending&&await this._pending,this.position=Math.min(e,this.size),e<this.size}async read(e){this._pending&&await this._pending;let{_handle:r,size:n,position:i}=this;if(r&&i<n){typeof e!="number"&&(e=1/0);let s=i,a=0,l=0,c=Math.min(n,s+Math.min(n-s,e)),o=new Uint8Array(Math.max(0,(this.position=c)-s));for(;(s+=l)<c&&(a+=l)<o.byteLength;)({bytesRead:l}=await r.read(o,a,o.byteLength-a,s));return o}return null}async readAt(e,r){this._pending&&await this._pending;let{_handle:n,size:i}=this;if(n&&e+r<i){let s=Math.min(i,e+r),a=new Uint8Array(s-e);return(await n.read(a,0,r,e)).buffer}return new Uint8Array(r)}async close(){let e=this._handle;this._handle=null,e&&await e.close()}async throw(e){return await this.close(),{done:!0,value:e}}async return(e){return await this.close(),{done:!0,value:e}}};Wc.AsyncRandomAccessFile=wg});var Bg=b(Vs=>{"use strict";Object.defineProperty(Vs,"__esModule",{value:!0});var X2=65536;function Es(t){return t<0&&(t=4294967295+t+1),`0x${t.toString(16)}`}var Us=8,Tg=[1,10,100,1e3,1e4,1e5,1e6,1e7,1e8],ka=class{constructor(e){this.buffer=e}high(){return this.buffer[1]}low(){return this.buffer[0]}_times(e){let r=new Uint32Array([this.buffer[1]>>>16,this.buffer[1]&65535,this.buffer[0]>>>16,this.buffer[0]&65535]),n=new Uint32Array([e.buffer[1]>>>16,e.buffer[1]&65535,e.buffer[0]>>>16,e.buffer[0]&65535]),i=r[3]*n[3];this.buffer[0]=i&65535;let s=i>>>16;return i=r[2]*n[3],s+=i,i=r[3]*n[2]>>>0,s+=i,this.buffer[0]+=s<<16,this.buffer[1]=s>>>0<i?X2:0,this.buffer[1]+=s>>>16,this.buffer[1]+=r[1]*n[3]+r[2]*n[2]+r[3]*n[1],this.buffer[1]+=r[0]*n[3]+r[1]*n[2]+r[2]*n[1]+r[3]*n[0]<<16,this}_plus(e){let r=this.buffer[0]+e.buffer[0]>>>0;this.buffer[1]+=e.buffer[1],r<this.buffer[0]>>>0&&++this.buffer[1],this.buffer[0]=r}lessThan(e){return this.buffer[1]<e.buffer[1]||this.buffer[1]===e.buffer[1]&&this.buffer[0]<e.buffer[0]}equals(e){return this.buffer[1]===e.buffer[1]&&this.buffer[0]==e.buffer[0]}greaterThan(e){return e.lessThan(this)}hex(){return`${Es(this.buffer[1])} ${Es(this.buffer[0])}`}};Vs.BaseInt64=ka;var Be=class t extends ka{times(e){return this._times(e),this}plus(e){return this._plus(e),this}static from(e,r=new Uint32Array(2)){return t.fromString(typeof e=="string"?e:e.toString(),r)}static fromNumber(e,r=new Uint32Array(2)){return t.fromString(e.toString(),r)}static fromString(e,r=new Uint32Array(2)){let n=e.length,i=new t(r);for(let s=0;s<n;){let a=Us<n-s?Us:n-s,l=new t(new Uint32Array([parseInt(e.substr(s,a),10),0])),c=new t(new Uint32Array([Tg[a],0]));i.times(c),i.plus(l),s+=a}return i}static convertArray(e){let r=new Uint32Array(e.length*2);for(let n=-1,i=e.length;++n<i;)t.from(e[n],new Uint32Array(r.buffer,r.byteOffset+2*n*4,2));return r}static multiply(e,r){return new t(new Uint32Array(e.buffer)).times(r)}static add(e,r){return new t(new Uint32Array(e.buffer)).plus(r)}};Vs.Uint64=Be;var La=class t extends ka{negate(){return this.buffer[0]=~this.buffer[0]+1,this.buffer[1]=~this.buffer[1],this.buffer[0]==0&&++this.buffer[1],this}times(e){return this._times(e),this}plus(e){return this._plus(e),this}lessThan(e){let r=this.buffer[1]<<0,n=e.buffer[1]<<0;return r<n||r===n&&this.buffer[0]<e.buffer[0]}static from(e,r=new Uint32Array(2)){return t.fromString(typeof e=="string"?e:e.toString(),r)}static fromNumber(e,r=new Uint32Array(2)){return t.fromString(e.toString(),r)}static fromString(e,r=new Uint32Array(2)){let n=e.startsWith("-"),i=e.length,s=new t(r);for(let a=n?1:0;a<i;){let l=Us<i-a?Us:i-a,c=new t(new Uint32Array([parseInt(e.substr(a,l),10),0])),o=new t(new Uint32Array([Tg[l],0]));s.times(o),s.plus(c),a+=l}return n?s.negate():s}static convertArray(e){let r=new Uint32Array(e.length*2);for(let n=-1,i=e.length;++n<i;)t.from(e[n],new Uint32Array(r.buffer,r.byteOffset+2*n*4,2));return r}static multiply(e,r){return new t(new Uint32Array(e.buffer)).times(r)}static add(e,r){return new t(new Uint32Array(e.buffer)).plus(r)}};Vs.Int64=La;var Sg=class t{constructor(e){this.buffer=e}high(){return new La(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2))}low(){return new La(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset,2))}negate(){return this.buffer[0]=~this.buffer[0]+1,this.buffer[1]=~this.buffer[1],this.buffer[2]=~this.buffer[2],this.buffer[3]=~this.buffer[3],this.buffer[0]==0&&++this.buffer[1],this.buffer[1]==0&&++this.buffer[2],this.buffer[2]==0&&++this.buffer[3],this}times(e){let r=new Be(new Uint32Array([this.buffer[3],0])),n=new Be(new Uint32Array([this.buffer[2],0])),i=new Be(new Uint32Array([this.buffer[1],0])),s=new Be(new Uint32Array([this.buffer[0],0])),a=new Be(new Uint32Array([e.buffer[3],0])),l=new Be(new Uint32Array([e.buffer[2],0])),c=new Be(new Uint32Array([e.buffer[1],0])),o=new Be(new Uint32Array([e.buffer[0],0])),u=Be.multiply(s,o);this.buffer[0]=u.low();let d=new Be(new Uint32Array([u.high(),0]));return u=Be.multiply(i,o),d.plus(u),u=Be.multiply(s,c),d.plus(u),this.buffer[1]=d.low(),this.buffer[3]=d.lessThan(u)?1:0,this.buffer[2]=d.high(),new Be(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2)).plus(Be.multiply(n,o)).plus(Be.multiply(i,c)).plus(Be.multiply(s,l)),this.buffer[3]+=Be.multiply(r,o).plus(Be.multiply(n,c)).plus(Be.multiply(i,l)).plus(Be.multiply(s,a)).low(),this}plus(e){let r=new Uint32Array(4);return r[3]=this.buffer[3]+e.buffer[3]>>>0,r[2]=this.buffer[2]+e.buffer[2]>>>0,r[1]=this.buffer[1]+e.buffer[1]>>>0,r[0]=this.buffer[0]+e.buffer[0]>>>0,r[0]<this.buffer[0]>>>0&&++r[1],r[1]<this.buffer[1]>>>0&&++r[2],r[2]<this.buffer[2]>>>0&&++r[3],this.buffer[3]=r[3],this.buffer[2]=r[2],this.buffer[1]=r[1],this.buffer[0]=r[0],this}hex(){return`${Es(this.buffer[3])} ${Es(this.buffer[2])} ${Es(this.buffer[1])} ${Es(this.buffer[0])}`}static multiply(e,r){return new t(new Uint32Array(e.buffer)).times(r)}static add(e,r){return new t(new Uint32Array(e.buffer)).plus(r)}static from(e,r=new Uint32Array(4)){return t.fromString(typeof e=="string"?e:e.toString(),r)}static fromNumber(e,r=new Uint32Array(4)){return t.fromString(e.toString(),r)}static fromString(e,r=new Uint32Array(4)){let n=e.startsWith("-"),i=e.length,s=new t(r);for(let a=n?1:0;a<i;){let l=Us<i-a?Us:i-a,c=new t(new Uint32Array([parseInt(e.substr(a,l),10),0,0,0])),o=new t(new Uint32Array([Tg[l],0,0,0]));s.times(o),s.plus(c),a+=l}return n?s.negate():s}static convertArray(e){let r=new Uint32Array(e.length*4);for(let n=-1,i=e.length;++n<i;)t.from(e[n],new Uint32Array(r.buffer,r.byteOffset+4*4*n,4));return r}};Vs.Int128=Sg});var wT=b(Kc=>{"use strict";Object.defineProperty(Kc,"__esModule",{value:!0});var Ce=sr(),ex=$e(),Xr=ie(),tx=Ge(),vT=Ir(),rx=oi(),Hc=Bg(),_T=de(),Fr=Ve(),Yc=class extends tx.Visitor{constructor(e,r,n,i){super(),this.nodesIndex=-1,this.buffersIndex=-1,this.bytes=e,this.nodes=r,this.buffers=n,this.dictionaries=i}visit(e){return super.visit(e instanceof ex.Field?e.type:e)}visitNull(e,{length:r}=this.nextFieldNode()){return Ce.Data.Null(e,0,r)}visitBool(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Bool(e,0,r,n,this.readNullBitmap(e,n),this.readData(e))}visitInt(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Int(e,0,r,n,this.readNullBitmap(e,n),this.readData(e))}visitFloat(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Float(e,0,r,n,this.readNullBitmap(e,n),this.readData(e))}visitUtf8(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Utf8(e,0,r,n,this.readNullBitmap(e,n),this.readOffsets(e),this.readData(e))}visitBinary(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Binary(e,0,r,n,this.readNullBitmap(e,n),this.readOffsets(e),this.readData(e))}visitFixedSizeBinary(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.FixedSizeBinary(e,0,r,n,this.readNullBitmap(e,n),this.readData(e))}visitDate(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Date(e,0,r,n,this.readNullBitmap(e,n),this.readData(e))}visitTimestamp(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Timestamp(e,0,r,n,this.readNullBitmap(e,n),this.readData(e))}visitTime(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Time(e,0,r,n,this.readNullBitmap(e,n),this.readData(e))}visitDecimal(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Decimal(e,0,r,n,this.readNullBitmap(e,n),this.readData(e))}visitList(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.List(e,0,r,n,this.readNullBitmap(e,n),this.readOffsets(e),this.visit(e.children[0]))}visitStruct(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Struct(e,0,r,n,this.readNullBitmap(e,n),this.visitMany(e.children))}visitUnion(e){return e.mode===_T.UnionMode.Sparse?this.visitSparseUnion(e):this.visitDenseUnion(e)}visitDenseUnion(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Union(e,0,r,n,this.readNullBitmap(e,n),this.readTypeIds(e),this.readOffsets(e),this.visitMany(e.children))}visitSparseUnion(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Union(e,0,r,n,this.readNullBitmap(e,n),this.readTypeIds(e),this.visitMany(e.children))}visitDictionary(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Dictionary(e,0,r,n,this.readNullBitmap(e,n),this.readData(e.indices),this.readDictionary(e))}visitInterval(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Interval(e,0,r,n,this.readNullBitmap(e,n),this.readData(e))}visitFixedSizeList(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.FixedSizeList(e,0,r,n,this.readNullBitmap(e,n),this.visit(e.children[0]))}visitMap(e,{length:r,nullCount:n}=this.nextFieldNode()){return Ce.Data.Map(e,0,r,n,this.readNullBitmap(e,n),this.readOffsets(e),this.visit(e.children[0]))}nextFieldNode(){return this.nodes[++this.nodesIndex]}nextBufferRange(){return this.buffers[++this.buffersIndex]}readNullBitmap(e,r,n=this.nextBufferRange()){return r>0&&this.readData(e,n)||new Uint8Array(0)}readOffsets(e,r){return this.readData(e,r)}readTypeIds(e,r){return this.readData(e,r)}readData(e,{length:r,offset:n}=this.nextBufferRange()){return this.bytes.subarray(n,n+r)}readDictionary(e){return this.dictionaries.get(e.id)}};Kc.VectorLoader=Yc;var Ig=class extends Yc{constructor(e,r,n,i){super(new Uint8Array(0),r,n,i),this.sources=e}readNullBitmap(e,r,{offset:n}=this.nextBufferRange()){return r<=0?new Uint8Array(0):vT.packBools(this.sources[n])}readOffsets(e,{offset:r}=this.nextBufferRange()){return Fr.toArrayBufferView(Uint8Array,Fr.toArrayBufferView(Int32Array,this.sources[r]))}readTypeIds(e,{offset:r}=this.nextBufferRange()){return Fr.toArrayBufferView(Uint8Array,Fr.toArrayBufferView(e.ArrayType,this.sources[r]))}readData(e,{offset:r}=this.nextBufferRange()){let{sources:n}=this;return Xr.DataType.isTimestamp(e)||(Xr.DataType.isInt(e)||Xr.DataType.isTime(e))&&e.bitWidth===64||Xr.DataType.isDate(e)&&e.unit===_T.DateUnit.MILLISECOND?Fr.toArrayBufferView(Uint8Array,Hc.Int64.convertArray(n[r])):Xr.DataType.isDecimal(e)?Fr.toArrayBufferView(Uint8Array,Hc.Int128.convertArray(n[r])):Xr.DataType.isBinary(e)||Xr.DataType.isFixedSizeBinary(e)?nx(n[r]):Xr.DataType.isBool(e)?vT.packBools(n[r]):Xr.DataType.isUtf8(e)?rx.encodeUtf8(n[r].join("")):Fr.toArrayBufferView(Uint8Array,Fr.toArrayBufferView(e.ArrayType,n[r].map(i=>+i)))}};Kc.JSONVectorLoader=Ig;function nx(t){let e=t.join(""),r=new Uint8Array(e.length/2);for(let n=0;n<e.length;n+=2)r[n>>1]=parseInt(e.substr(n,2),16);return r}});var AT=b(ed=>{"use strict";Object.defineProperty(ed,"__esModule",{value:!0});var ix=ys(),sx=ix.flatbuffers.Long,We=vs(),ox=Ge(),bT=We.org.apache.arrow.flatbuf.Null,Qc=We.org.apache.arrow.flatbuf.Int,Dg=We.org.apache.arrow.flatbuf.FloatingPoint,ST=We.org.apache.arrow.flatbuf.Binary,TT=We.org.apache.arrow.flatbuf.Bool,BT=We.org.apache.arrow.flatbuf.Utf8,Jc=We.org.apache.arrow.flatbuf.Decimal,Ag=We.org.apache.arrow.flatbuf.Date,Gc=We.org.apache.arrow.flatbuf.Time,Zc=We.org.apache.arrow.flatbuf.Timestamp,Fg=We.org.apache.arrow.flatbuf.Interval,IT=We.org.apache.arrow.flatbuf.List,DT=We.org.apache.arrow.flatbuf.Struct_,Ns=We.org.apache.arrow.flatbuf.Union,Ca=We.org.apache.arrow.flatbuf.DictionaryEncoding,Og=We.org.apache.arrow.flatbuf.FixedSizeBinary,Mg=We.org.apache.arrow.flatbuf.FixedSizeList,xg=We.org.apache.arrow.flatbuf.Map,Xc=class extends ox.Visitor{visit(e,r){return e==null||r==null?void 0:super.visit(e,r)}visitNull(e,r){return bT.startNull(r),bT.endNull(r)}visitInt(e,r){return Qc.startInt(r),Qc.addBitWidth(r,e.bitWidth),Qc.addIsSigned(r,e.isSigned),Qc.endInt(r)}visitFloat(e,r){return Dg.startFloatingPoint(r),Dg.addPrecision(r,e.precision),Dg.endFloatingPoint(r)}visitBinary(e,r){return ST.startBinary(r),ST.endBinary(r)}visitBool(e,r){return TT.startBool(r),TT.endBool(r)}visitUtf8(e,r){return BT.startUtf8(r),BT.endUtf8(r)}visitDecimal(e,r){return Jc.startDecimal(r),Jc.addScale(r,e.scale),Jc.addPrecision(r,e.precision),Jc.endDecimal(r)}visitDate(e,r){return Ag.startDate(r),Ag.addUnit(r,e.unit),Ag.endDate(r)}visitTime(e,r){return Gc.startTime(r),Gc.addUnit(r,e.unit),Gc.addBitWidth(r,e.bitWidth),Gc.endTime(r)}visitTimestamp(e,r){let n=e.timezone&&r.createString(e.timezone)||void 0;return Zc.startTimestamp(r),Zc.addUnit(r,e.unit),n!==void 0&&Zc.addTimezone(r,n),Zc.endTimestamp(r)}visitInterval(e,r){return Fg.startInterval(r),Fg.addUnit(r,e.unit),Fg.endInterval(r)}visitList(e,r){return IT.startList(r),IT.endList(r)}visitStruct(e,r){return DT.startStruct_(r),DT.endStruct_(r)}visitUnion(e,r){Ns.startTypeIdsVector(r,e.typeIds.length);let n=Ns.createTypeIdsVector(r,e.typeIds);return Ns.startUnion(r),Ns.addMode(r,e.mode),Ns.addTypeIds(r,n),Ns.endUnion(r)}visitDictionary(e,r){let n=this.visit(e.indices,r);return Ca.startDictionaryEncoding(r),Ca.addId(r,new sx(e.id,0)),Ca.addIsOrdered(r,e.isOrdered),n!==void 0&&Ca.addIndexType(r,n),Ca.endDictionaryEncoding(r)}visitFixedSizeBinary(e,r){return Og.startFixedSizeBinary(r),Og.addByteWidth(r,e.byteWidth),Og.endFixedSizeBinary(r)}visitFixedSizeList(e,r){return Mg.startFixedSizeList(r),Mg.addListSize(r,e.listSize),Mg.endFixedSizeList(r)}visitMap(e,r){return xg.startMap(r),xg.addKeysSorted(r,e.keysSorted),xg.endMap(r)}};ed.TypeAssembler=Xc;ed.instance=new Xc});var VT=b(Cs=>{"use strict";Object.defineProperty(Cs,"__esModule",{value:!0});var Ls=$e(),ve=ie(),vi=_i(),ks=de();function ax(t,e=new Map){return new Ls.Schema(ux(t,e),td(t.customMetadata),e)}Cs.schemaFromJSON=ax;function xT(t){return new vi.RecordBatch(t.count,ET(t.columns),UT(t.columns))}Cs.recordBatchFromJSON=xT;function lx(t){return new vi.DictionaryBatch(xT(t.data),t.id,t.isDelta)}Cs.dictionaryBatchFromJSON=lx;function ux(t,e){return(t.fields||[]).filter(Boolean).map(r=>Ls.Field.fromJSON(r,e))}function FT(t,e){return(t.children||[]).filter(Boolean).map(r=>Ls.Field.fromJSON(r,e))}function ET(t){return(t||[]).reduce((e,r)=>[...e,new vi.FieldNode(r.count,cx(r.VALIDITY)),...ET(r.children)],[])}function UT(t,e=[]){for(let r=-1,n=(t||[]).length;++r<n;){let i=t[r];i.VALIDITY&&e.push(new vi.BufferRegion(e.length,i.VALIDITY.length)),i.TYPE&&e.push(new vi.BufferRegion(e.length,i.TYPE.length)),i.OFFSET&&e.push(new vi.BufferRegion(e.length,i.OFFSET.length)),i.DATA&&e.push(new vi.BufferRegion(e.length,i.DATA.length)),e=UT(i.children,e)}return e}function cx(t){return(t||[]).reduce((e,r)=>e+ +(r===0),0)}function dx(t,e){let r,n,i,s,a,l;return!e||!(s=t.dictionary)?(a=MT(t,FT(t,e)),i=new Ls.Field(t.name,a,t.nullable,td(t.customMetadata))):e.has(r=s.id)?(n=(n=s.indexType)?OT(n):new ve.Int32,l=new ve.Dictionary(e.get(r),n,r,s.isOrdered),i=new Ls.Field(t.name,l,t.nullable,td(t.customMetadata))):(n=(n=s.indexType)?OT(n):new ve.Int32,e.set(r,a=MT(t,FT(t,e))),l=new ve.Dictionary(a,n,r,s.isOrdered),i=new Ls.Field(t.name,l,t.nullable,td(t.customMetadata))),i||null}Cs.fieldFromJSON=dx;function td(t){return new Map(Object.entries(t||{}))}function OT(t){return new ve.Int(t.isSigned,t.bitWidth)}function MT(t,e){let r=t.type.name;switch(r){case"NONE":return new ve.Null;case"null":return new ve.Null;case"binary":return new ve.Binary;case"utf8":return new ve.Utf8;case"bool":return new ve.Bool;case"list":return new ve.List((e||[])[0]);case"struct":return new ve.Struct(e||[]);case"struct_":return new ve.Struct(e||[])}switch(r){case"int":{let n=t.type;return new ve.Int(n.isSigned,n.bitWidth)}case"floatingpoint":{let n=t.type;return new ve.Float(ks.Precision[n.precision])}case"decimal":{let n=t.type;return new ve.Decimal(n.scale,n.precision)}case"date":{let n=t.type;return new ve.Date_(ks.DateUnit[n.unit])}case"time":{let n=t.type;return new ve.Time(ks.TimeUnit[n.unit],n.bitWidth)}case"timestamp":{let n=t.type;return new ve.Timestamp(ks.TimeUnit[n.unit],n.timezone)}case"interval":{let n=t.type;return new ve.Interval(ks.IntervalUnit[n.unit])}case"union":{let n=t.type;return new ve.Union(ks.UnionMode[n.mode],n.typeIds||[],e||[])}case"fixedsizebinary":{let n=t.type;return new ve.FixedSizeBinary(n.byteWidth)}case"fixedsizelist":{let n=t.type;return new ve.FixedSizeList(n.listSize,(e||[])[0])}case"map":{let n=t.type;return new ve.Map_((e||[])[0],n.keysSorted)}}throw new Error(`Unrecognized type: "${r}"`)}});var _i=b(bi=>{"use strict";Object.defineProperty(bi,"__esModule",{value:!0});var Vg=ys(),Xe=vs(),nd=Jp(),He=$e(),fx=Ve(),Fe=de(),Eg=AT(),id=VT(),wi=Vg.flatbuffers.Long,hx=Vg.flatbuffers.Builder,px=Vg.flatbuffers.ByteBuffer,Re=Xe.org.apache.arrow.flatbuf.Type,cr=Xe.org.apache.arrow.flatbuf.Field,en=Xe.org.apache.arrow.flatbuf.Schema,yx=Xe.org.apache.arrow.flatbuf.Buffer,Ln=nd.org.apache.arrow.flatbuf.Message,Rn=Xe.org.apache.arrow.flatbuf.KeyValue,mx=nd.org.apache.arrow.flatbuf.FieldNode,NT=Xe.org.apache.arrow.flatbuf.Endianness,Cn=nd.org.apache.arrow.flatbuf.RecordBatch,Rs=nd.org.apache.arrow.flatbuf.DictionaryBatch,_e=ie(),Ug=class t{constructor(e,r,n,i){this._version=r,this._headerType=n,this.body=new Uint8Array(0),i&&(this._createHeader=()=>i),this._bodyLength=typeof e=="number"?e:e.low}static fromJSON(e,r){let n=new t(0,Fe.MetadataVersion.V4,r);return n._createHeader=gx(e,r),n}static decode(e){e=new px(fx.toUint8Array(e));let r=Ln.getRootAsMessage(e),n=r.bodyLength(),i=r.version(),s=r.headerType(),a=new t(n,i,s);return a._createHeader=vx(r,s),a}static encode(e){let r=new hx,n=-1;return e.isSchema()?n=He.Schema.encode(r,e.header()):e.isRecordBatch()?n=Ut.encode(r,e.header()):e.isDictionaryBatch()&&(n=dr.encode(r,e.header())),Ln.startMessage(r),Ln.addVersion(r,Fe.MetadataVersion.V4),Ln.addHeader(r,n),Ln.addHeaderType(r,e.headerType),Ln.addBodyLength(r,new wi(e.bodyLength,0)),Ln.finishMessageBuffer(r,Ln.endMessage(r)),r.asUint8Array()}static from(e,r=0){if(e instanceof He.Schema)return new t(0,Fe.MetadataVersion.V4,Fe.MessageHeader.Schema,e);if(e instanceof Ut)return new t(r,Fe.MetadataVersion.V4,Fe.MessageHeader.RecordBatch,e);if(e instanceof dr)return new t(r,Fe.MetadataVersion.V4,Fe.MessageHeader.DictionaryBatch,e);throw new Error(`Unrecognized Message header: ${e}`)}get type(){return this.headerType}get version(){return this._version}get headerType(){return this._headerType}get bodyLength(){return this._bodyLength}header(){return this._createHeader()}isSchema(){return this.headerType===Fe.MessageHeader.Schema}isRecordBatch(){return this.headerType===Fe.MessageHeader.RecordBatch}isDictionaryBatch(){return this.headerType===Fe.MessageHeader.DictionaryBatch}};bi.Message=Ug;var Ut=class{get nodes(){return this._nodes}get length(){return this._length}get buffers(){return this._buffers}constructor(e,r,n){this._nodes=r,this._buffers=n,this._length=typeof e=="number"?e:e.low}};bi.RecordBatch=Ut;var dr=class{get id(){return this._id}get data(){return this._data}get isDelta(){return this._isDelta}get length(){return this.data.length}get nodes(){return this.data.nodes}get buffers(){return this.data.buffers}constructor(e,r,n=!1){this._data=e,this._isDelta=n,this._id=typeof r=="number"?r:r.low}};bi.DictionaryBatch=dr;var Pn=class{constructor(e,r){this.offset=typeof e=="number"?e:e.low,this.length=typeof r=="number"?r:r.low}};bi.BufferRegion=Pn;var jn=class{constructor(e,r){this.length=typeof e=="number"?e:e.low,this.nullCount=typeof r=="number"?r:r.low}};bi.FieldNode=jn;function gx(t,e){return()=>{switch(e){case Fe.MessageHeader.Schema:return He.Schema.fromJSON(t);case Fe.MessageHeader.RecordBatch:return Ut.fromJSON(t);case Fe.MessageHeader.DictionaryBatch:return dr.fromJSON(t)}throw new Error(`Unrecognized Message type: { name: ${Fe.MessageHeader[e]}, type: ${e} }`)}}function vx(t,e){return()=>{switch(e){case Fe.MessageHeader.Schema:return He.Schema.decode(t.header(new en));case Fe.MessageHeader.RecordBatch:return Ut.decode(t.header(new Cn),t.version());case Fe.MessageHeader.DictionaryBatch:return dr.decode(t.header(new Rs),t.version())}throw new Error(`Unrecognized Message type: { name: ${Fe.MessageHeader[e]}, type: ${e} }`)}}He.Field.encode=Ox;He.Field.decode=Ax;He.Field.fromJSON=id.fieldFromJSON;He.Schema.encode=Fx;He.Schema.decode=_x;He.Schema.fromJSON=id.schemaFromJSON;Ut.encode=Mx;Ut.decode=wx;Ut.fromJSON=id.recordBatchFromJSON;dr.encode=xx;dr.decode=bx;dr.fromJSON=id.dictionaryBatchFromJSON;jn.encode=Ex;jn.decode=Tx;Pn.encode=Ux;Pn.decode=Sx;function _x(t,e=new Map){let r=Dx(t,e);return new He.Schema(r,rd(t),e)}function wx(t,e=Fe.MetadataVersion.V4){return new Ut(t.length(),Bx(t),Ix(t,e))}function bx(t,e=Fe.MetadataVersion.V4){return new dr(Ut.decode(t.data(),e),t.id(),t.isDelta())}function Sx(t){return new Pn(t.offset(),t.length())}function Tx(t){return new jn(t.length(),t.nullCount())}function Bx(t){let e=[];for(let r,n=-1,i=-1,s=t.nodesLength();++n<s;)(r=t.nodes(n))&&(e[++i]=jn.decode(r));return e}function Ix(t,e){let r=[];for(let n,i=-1,s=-1,a=t.buffersLength();++i<a;)(n=t.buffers(i))&&(e<Fe.MetadataVersion.V4&&(n.bb_pos+=8*(i+1)),r[++s]=Pn.decode(n));return r}function Dx(t,e){let r=[];for(let n,i=-1,s=-1,a=t.fieldsLength();++i<a;)(n=t.fields(i))&&(r[++s]=He.Field.decode(n,e));return r}function kT(t,e){let r=[];for(let n,i=-1,s=-1,a=t.childrenLength();++i<a;)(n=t.children(i))&&(r[++s]=He.Field.decode(n,e));return r}function Ax(t,e){let r,n,i,s,a,l;return!e||!(l=t.dictionary())?(i=CT(t,kT(t,e)),n=new He.Field(t.name(),i,t.nullable(),rd(t))):e.has(r=l.id().low)?(s=(s=l.indexType())?LT(s):new _e.Int32,a=new _e.Dictionary(e.get(r),s,r,l.isOrdered()),n=new He.Field(t.name(),a,t.nullable(),rd(t))):(s=(s=l.indexType())?LT(s):new _e.Int32,e.set(r,i=CT(t,kT(t,e))),a=new _e.Dictionary(i,s,r,l.isOrdered()),n=new He.Field(t.name(),a,t.nullable(),rd(t))),n||null}function rd(t){let e=new Map;if(t)for(let r,n,i=-1,s=t.customMetadataLength()|0;++i<s;)(r=t.customMetadata(i))&&(n=r.key())!=null&&e.set(n,r.value());return e}function LT(t){return new _e.Int(t.isSigned(),t.bitWidth())}function CT(t,e){let r=t.typeType();switch(r){case Re.NONE:return new _e.Null;case Re.Null:return new _e.Null;case Re.Binary:return new _e.Binary;case Re.Utf8:return new _e.Utf8;case Re.Bool:return new _e.Bool;case Re.List:return new _e.List((e||[])[0]);case Re.Struct_:return new _e.Struct(e||[])}switch(r){case Re.Int:{let n=t.type(new Xe.org.apache.arrow.flatbuf.Int);return new _e.Int(n.isSigned(),n.bitWidth())}case Re.FloatingPoint:{let n=t.type(new Xe.org.apache.arrow.flatbuf.FloatingPoint);return new _e.Float(n.precision())}case Re.Decimal:{let n=t.type(new Xe.org.apache.arrow.flatbuf.Decimal);return new _e.Decimal(n.scale(),n.precision())}case Re.Date:{let n=t.type(new Xe.org.apache.arrow.flatbuf.Date);return new _e.Date_(n.unit())}case Re.Time:{let n=t.type(new Xe.org.apache.arrow.flatbuf.Time);return new _e.Time(n.unit(),n.bitWidth())}case Re.Timestamp:{let n=t.type(new Xe.org.apache.arrow.flatbuf.Timestamp);return new _e.Timestamp(n.unit(),n.timezone())}case Re.Interval:{let n=t.type(new Xe.org.apache.arrow.flatbuf.Interval);return new _e.Interval(n.unit())}case Re.Union:{let n=t.type(new Xe.org.apache.arrow.flatbuf.Union);return new _e.Union(n.mode(),n.typeIdsArray()||[],e||[])}case Re.FixedSizeBinary:{let n=t.type(new Xe.org.apache.arrow.flatbuf.FixedSizeBinary);return new _e.FixedSizeBinary(n.byteWidth())}case Re.FixedSizeList:{let n=t.type(new Xe.org.apache.arrow.flatbuf.FixedSizeList);return new _e.FixedSizeList(n.listSize(),(e||[])[0])}case Re.Map:{let n=t.type(new Xe.org.apache.arrow.flatbuf.Map);return new _e.Map_((e||[])[0],n.keysSorted())}}throw new Error(`Unrecognized type: "${Re[r]}" (${r})`)}function Fx(t,e){let r=e.fields.map(s=>He.Field.encode(t,s));en.startFieldsVector(t,r.length);let n=en.createFieldsVector(t,r),i=e.metadata&&e.metadata.size>0?en.createCustomMetadataVector(t,[...e.metadata].map(([s,a])=>{let l=t.createString(`${s}`),c=t.createString(`${a}`);return Rn.startKeyValue(t),Rn.addKey(t,l),Rn.addValue(t,c),Rn.endKeyValue(t)})):-1;return en.startSchema(t),en.addFields(t,n),en.addEndianness(t,Vx?NT.Little:NT.Big),i!==-1&&en.addCustomMetadata(t,i),en.endSchema(t)}function Ox(t,e){let r=-1,n=-1,i=-1,s=e.type,a=e.typeId;_e.DataType.isDictionary(s)?(a=s.dictionary.typeId,i=Eg.instance.visit(s,t),n=Eg.instance.visit(s.dictionary,t)):n=Eg.instance.visit(s,t);let l=(s.children||[]).map(u=>He.Field.encode(t,u)),c=cr.createChildrenVector(t,l),o=e.metadata&&e.metadata.size>0?cr.createCustomMetadataVector(t,[...e.metadata].map(([u,d])=>{let v=t.createString(`${u}`),T=t.createString(`${d}`);return Rn.startKeyValue(t),Rn.addKey(t,v),Rn.addValue(t,T),Rn.endKeyValue(t)})):-1;return e.name&&(r=t.createString(e.name)),cr.startField(t),cr.addType(t,n),cr.addTypeType(t,a),cr.addChildren(t,c),cr.addNullable(t,!!e.nullable),r!==-1&&cr.addName(t,r),i!==-1&&cr.addDictionary(t,i),o!==-1&&cr.addCustomMetadata(t,o),cr.endField(t)}function Mx(t,e){let r=e.nodes||[],n=e.buffers||[];Cn.startNodesVector(t,r.length),r.slice().reverse().forEach(a=>jn.encode(t,a));let i=t.endVector();Cn.startBuffersVector(t,n.length),n.slice().reverse().forEach(a=>Pn.encode(t,a));let s=t.endVector();return Cn.startRecordBatch(t),Cn.addLength(t,new wi(e.length,0)),Cn.addNodes(t,i),Cn.addBuffers(t,s),Cn.endRecordBatch(t)}function xx(t,e){let r=Ut.encode(t,e.data);return Rs.startDictionaryBatch(t),Rs.addId(t,new wi(e.id,0)),Rs.addIsDelta(t,e.isDelta),Rs.addData(t,r),Rs.endDictionaryBatch(t)}function Ex(t,e){return mx.createFieldNode(t,new wi(e.length,0),new wi(e.nullCount,0))}function Ux(t,e){return yx.createBuffer(t,new wi(e.offset,0),new wi(e.length,0))}var Vx=function(){let t=new ArrayBuffer(2);return new DataView(t).setInt16(0,256,!0),new Int16Array(t)[0]===256}()});var ad=b(ye=>{"use strict";Object.defineProperty(ye,"__esModule",{value:!0});var zn=de(),Nx=ys(),RT=Nx.flatbuffers.ByteBuffer,Ra=_i(),kx=st(),Lx=bg(),PT=Ve(),sd=kn(),fr=gs(),Lg=t=>`Expected ${zn.MessageHeader[t]} Message in stream, but was null or length 0.`,Cg=t=>`Header pointer of flatbuffer-encoded ${zn.MessageHeader[t]} Message is null or length 0.`,jT=(t,e)=>`Expected to read ${t} metadata bytes, but only read ${e}.`,zT=(t,e)=>`Expected to read ${t} bytes for message body, but only read ${e}.`,od=class{constructor(e){this.source=e instanceof sd.ByteStream?e:new sd.ByteStream(e)}[Symbol.iterator](){return this}next(){let e;return(e=this.readMetadataLength()).done||e.value===-1&&(e=this.readMetadataLength()).done||(e=this.readMetadata(e.value)).done?fr.ITERATOR_DONE:e}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}readMessage(e){let r;if((r=this.next()).done)return null;if(e!=null&&r.value.headerType!==e)throw new Error(Lg(e));return r.value}readMessageBody(e){if(e<=0)return new Uint8Array(0);let r=PT.toUint8Array(this.source.read(e));if(r.byteLength<e)throw new Error(zT(e,r.byteLength));return r.byteOffset%8===0&&r.byteOffset+r.byteLength<=r.buffer.byteLength?r:r.slice()}readSchema(e=!1){let r=zn.MessageHeader.Schema,n=this.readMessage(r),i=n&&n.header();if(e&&!i)throw new Error(Cg(r));return i}readMetadataLength(){let e=this.source.read(ye.PADDING),r=e&&new RT(e),n=r&&r.readInt32(0)||0;return{done:n===0,value:n}}readMetadata(e){let r=this.source.read(e);if(!r)return fr.ITERATOR_DONE;if(r.byteLength<e)throw new Error(jT(e,r.byteLength));return{done:!1,value:Ra.Message.decode(r)}}};ye.MessageReader=od;var Ng=class{constructor(e,r){this.source=e instanceof sd.AsyncByteStream?e:kx.isFileHandle(e)?new Lx.AsyncRandomAccessFile(e,r):new sd.AsyncByteStream(e)}[Symbol.asyncIterator](){return this}async next(){let e;return(e=await this.readMetadataLength()).done||e.value===-1&&(e=await this.readMetadataLength()).done||(e=await this.readMetadata(e.value)).done?fr.ITERATOR_DONE:e}async throw(e){return await this.source.throw(e)}async return(e){return await this.source.return(e)}async readMessage(e){let r;if((r=await this.next()).done)return null;if(e!=null&&r.value.headerType!==e)throw new Error(Lg(e));return r.value}async readMessageBody(e){if(e<=0)return new Uint8Array(0);let r=PT.toUint8Array(await this.source.read(e));if(r.byteLength<e)throw new Error(zT(e,r.byteLength));return r.byteOffset%8===0&&r.byteOffset+r.byteLength<=r.buffer.byteLength?r:r.slice()}async readSchema(e=!1){let r=zn.MessageHeader.Schema,n=await this.readMessage(r),i=n&&n.header();if(e&&!i)throw new Error(Cg(r));return i}async readMetadataLength(){let e=await this.source.read(ye.PADDING),r=e&&new RT(e),n=r&&r.readInt32(0)||0;return{done:n===0,value:n}}async readMetadata(e){let r=await this.source.read(e);if(!r)return fr.ITERATOR_DONE;if(r.byteLength<e)throw new Error(jT(e,r.byteLength));return{done:!1,value:Ra.Message.decode(r)}}};ye.AsyncMessageReader=Ng;var kg=class extends od{constructor(e){super(new Uint8Array(0)),this._schema=!1,this._body=[],this._batchIndex=0,this._dictionaryIndex=0,this._json=e instanceof fr.ArrowJSON?e:new fr.ArrowJSON(e)}next(){let{_json:e}=this;if(!this._schema)return this._schema=!0,{done:!1,value:Ra.Message.fromJSON(e.schema,zn.MessageHeader.Schema)};if(this._dictionaryIndex<e.dictionaries.length){let r=e.dictionaries[this._dictionaryIndex++];return this._body=r.data.columns,{done:!1,value:Ra.Message.fromJSON(r,zn.MessageHeader.DictionaryBatch)}}if(this._batchIndex<e.batches.length){let r=e.batches[this._batchIndex++];return this._body=r.columns,{done:!1,value:Ra.Message.fromJSON(r,zn.MessageHeader.RecordBatch)}}return this._body=[],fr.ITERATOR_DONE}readMessageBody(e){return r(this._body);function r(n){return(n||[]).reduce((i,s)=>[...i,...s.VALIDITY&&[s.VALIDITY]||[],...s.TYPE&&[s.TYPE]||[],...s.OFFSET&&[s.OFFSET]||[],...s.DATA&&[s.DATA]||[],...r(s.children)],[])}}readMessage(e){let r;if((r=this.next()).done)return null;if(e!=null&&r.value.headerType!==e)throw new Error(Lg(e));return r.value}readSchema(){let e=zn.MessageHeader.Schema,r=this.readMessage(e),n=r&&r.header();if(!r||!n)throw new Error(Cg(e));return n}};ye.JSONMessageReader=kg;ye.PADDING=4;ye.MAGIC_STR="ARROW1";ye.MAGIC=new Uint8Array(ye.MAGIC_STR.length);for(let t=0;t<ye.MAGIC_STR.length;t+=1)ye.MAGIC[t]=ye.MAGIC_STR.charCodeAt(t);function Cx(t,e=0){for(let r=-1,n=ye.MAGIC.length;++r<n;)if(ye.MAGIC[r]!==t[e+r])return!1;return!0}ye.checkForMagicArrowString=Cx;ye.magicLength=ye.MAGIC.length;ye.magicAndPadding=ye.magicLength+ye.PADDING;ye.magicX2AndPadding=ye.magicLength*2+ye.PADDING});var YT=b(qg=>{"use strict";Object.defineProperty(qg,"__esModule",{value:!0});var Rx=Ge(),qT=de(),Px=tn(),jg=Ve(),Rg=Ir(),jx=Mn(),WT=_i(),$T=ie(),Pe=class t extends Rx.Visitor{constructor(){super(),this._byteLength=0,this._nodes=[],this._buffers=[],this._bufferRegions=[]}static assemble(...e){let r=new t,n=jx.selectVectorChildrenArgs(Px.RecordBatch,e),[i=r]=r.visitMany(n);return i}visit(e){if(!$T.DataType.isDictionary(e.type)){let{data:r,length:n,nullCount:i}=e;if(n>2147483647)throw new RangeError("Cannot write arrays larger than 2^31 - 1 in length");$T.DataType.isNull(e.type)||hr.call(this,i<=0?new Uint8Array(0):Rg.truncateBitmap(r.offset,n,r.nullBitmap)),this.nodes.push(new WT.FieldNode(n,i))}return super.visit(e)}visitNull(e){return this}visitDictionary(e){return this.visit(e.indices)}get nodes(){return this._nodes}get buffers(){return this._buffers}get byteLength(){return this._byteLength}get bufferRegions(){return this._bufferRegions}};qg.VectorAssembler=Pe;function hr(t){let e=t.byteLength+7&-8;return this.buffers.push(t),this.bufferRegions.push(new WT.BufferRegion(this._byteLength,e)),this._byteLength+=e,this}function zx(t){let{type:e,length:r,typeIds:n,valueOffsets:i}=t;if(hr.call(this,n),e.mode===qT.UnionMode.Sparse)return Pg.call(this,t);if(e.mode===qT.UnionMode.Dense){if(t.offset<=0)return hr.call(this,i),Pg.call(this,t);{let s=n.reduce((u,d)=>Math.max(u,d),n[0]),a=new Int32Array(s+1),l=new Int32Array(s+1).fill(-1),c=new Int32Array(r),o=jg.rebaseValueOffsets(-i[0],r,i);for(let u,d,v=-1;++v<r;)(d=l[u=n[v]])===-1&&(d=l[u]=o[u]),c[v]=o[v]-d,++a[u];hr.call(this,c);for(let u,d=-1,v=e.children.length;++d<v;)if(u=t.getChildAt(d)){let T=e.typeIds[d],I=Math.min(r,a[T]);this.visit(u.slice(l[T],I))}}}return this}function qx(t){let e;return t.nullCount>=t.length?hr.call(this,new Uint8Array(0)):(e=t.values)instanceof Uint8Array?hr.call(this,Rg.truncateBitmap(t.offset,t.length,e)):hr.call(this,Rg.packBools(t))}function qn(t){return hr.call(this,t.values.subarray(0,t.length*t.stride))}function HT(t){let{length:e,values:r,valueOffsets:n}=t,i=n[0],s=n[e],a=Math.min(s-i,r.byteLength-i);return hr.call(this,jg.rebaseValueOffsets(-n[0],e,n)),hr.call(this,r.subarray(i,i+a)),this}function zg(t){let{length:e,valueOffsets:r}=t;return r&&hr.call(this,jg.rebaseValueOffsets(r[0],e,r)),this.visit(t.getChildAt(0))}function Pg(t){return this.visitMany(t.type.children.map((e,r)=>t.getChildAt(r)).filter(Boolean))[0]}Pe.prototype.visitBool=qx;Pe.prototype.visitInt=qn;Pe.prototype.visitFloat=qn;Pe.prototype.visitUtf8=HT;Pe.prototype.visitBinary=HT;Pe.prototype.visitFixedSizeBinary=qn;Pe.prototype.visitDate=qn;Pe.prototype.visitTimestamp=qn;Pe.prototype.visitTime=qn;Pe.prototype.visitDecimal=qn;Pe.prototype.visitList=zg;Pe.prototype.visitStruct=Pg;Pe.prototype.visitUnion=zx;Pe.prototype.visitInterval=qn;Pe.prototype.visitFixedSizeList=zg;Pe.prototype.visitMap=zg});var KT=b(Wg=>{"use strict";Object.defineProperty(Wg,"__esModule",{value:!0});var $x=Ge(),Ie=de(),$g=class extends $x.Visitor{visit(e){return e==null?void 0:super.visit(e)}visitNull({typeId:e}){return{name:Ie.ArrowType[e].toLowerCase()}}visitInt({typeId:e,bitWidth:r,isSigned:n}){return{name:Ie.ArrowType[e].toLowerCase(),bitWidth:r,isSigned:n}}visitFloat({typeId:e,precision:r}){return{name:Ie.ArrowType[e].toLowerCase(),precision:Ie.Precision[r]}}visitBinary({typeId:e}){return{name:Ie.ArrowType[e].toLowerCase()}}visitBool({typeId:e}){return{name:Ie.ArrowType[e].toLowerCase()}}visitUtf8({typeId:e}){return{name:Ie.ArrowType[e].toLowerCase()}}visitDecimal({typeId:e,scale:r,precision:n}){return{name:Ie.ArrowType[e].toLowerCase(),scale:r,precision:n}}visitDate({typeId:e,unit:r}){return{name:Ie.ArrowType[e].toLowerCase(),unit:Ie.DateUnit[r]}}visitTime({typeId:e,unit:r,bitWidth:n}){return{name:Ie.ArrowType[e].toLowerCase(),unit:Ie.TimeUnit[r],bitWidth:n}}visitTimestamp({typeId:e,timezone:r,unit:n}){return{name:Ie.ArrowType[e].toLowerCase(),unit:Ie.TimeUnit[n],timezone:r}}visitInterval({typeId:e,unit:r}){return{name:Ie.ArrowType[e].toLowerCase(),unit:Ie.IntervalUnit[r]}}visitList({typeId:e}){return{name:Ie.ArrowType[e].toLowerCase()}}visitStruct({typeId:e}){return{name:Ie.ArrowType[e].toLowerCase()}}visitUnion({typeId:e,mode:r,typeIds:n}){return{name:Ie.ArrowType[e].toLowerCase(),mode:Ie.UnionMode[r],typeIds:[...n]}}visitDictionary(e){return this.visit(e.dictionary)}visitFixedSizeBinary({typeId:e,byteWidth:r}){return{name:Ie.ArrowType[e].toLowerCase(),byteWidth:r}}visitFixedSizeList({typeId:e,listSize:r}){return{name:Ie.ArrowType[e].toLowerCase(),listSize:r}}visitMap({typeId:e,keysSorted:r}){return{name:Ie.ArrowType[e].toLowerCase(),keysSorted:r}}};Wg.JSONTypeAssembler=$g});var GT=b(Kg=>{"use strict";Object.defineProperty(Kg,"__esModule",{value:!0});var Wx=wa(),Pa=Fs(),Hx=xe(),Yx=Ge(),Kx=de(),Qx=tn(),Hg=de(),ld=Ir(),Jx=Mn(),QT=ie(),Yg=class t extends Yx.Visitor{static assemble(...e){return new t().visitMany(Jx.selectColumnChildrenArgs(Qx.RecordBatch,e))}visit(e){let{data:r,name:n,length:i}=e,{offset:s,nullCount:a,nullBitmap:l}=r,c=QT.DataType.isDictionary(e.type)?e.type.indices:e.type,o=Object.assign([],r.buffers,{[Kx.BufferType.VALIDITY]:void 0});return{name:n,count:i,VALIDITY:QT.DataType.isNull(c)?void 0:a<=0?Array.from({length:i},()=>1):[...ld.iterateBits(l,s,i,null,ld.getBit)],...super.visit(Hx.Vector.new(r.clone(c,s,i,0,o)))}}visitNull(){return{}}visitBool({values:e,offset:r,length:n}){return{DATA:[...ld.iterateBits(e,r,n,null,ld.getBool)]}}visitInt(e){return{DATA:e.type.bitWidth<64?[...e.values]:[...ja(e.values,2)]}}visitFloat(e){return{DATA:[...e.values]}}visitUtf8(e){return{DATA:[...e],OFFSET:[...e.valueOffsets]}}visitBinary(e){return{DATA:[...JT(e)],OFFSET:[...e.valueOffsets]}}visitFixedSizeBinary(e){return{DATA:[...JT(e)]}}visitDate(e){return{DATA:e.type.unit===Hg.DateUnit.DAY?[...e.values]:[...ja(e.values,2)]}}visitTimestamp(e){return{DATA:[...ja(e.values,2)]}}visitTime(e){return{DATA:e.type.unit<Hg.TimeUnit.MICROSECOND?[...e.values]:[...ja(e.values,2)]}}visitDecimal(e){return{DATA:[...ja(e.values,4)]}}visitList(e){return{OFFSET:[...e.valueOffsets],children:e.type.children.map((r,n)=>this.visit(new Pa.Column(r,[e.getChildAt(n)])))}}visitStruct(e){return{children:e.type.children.map((r,n)=>this.visit(new Pa.Column(r,[e.getChildAt(n)])))}}visitUnion(e){return{TYPE:[...e.typeIds],OFFSET:e.type.mode===Hg.UnionMode.Dense?[...e.valueOffsets]:void 0,children:e.type.children.map((r,n)=>this.visit(new Pa.Column(r,[e.getChildAt(n)])))}}visitInterval(e){return{DATA:[...e.values]}}visitFixedSizeList(e){return{children:e.type.children.map((r,n)=>this.visit(new Pa.Column(r,[e.getChildAt(n)])))}}visitMap(e){return{OFFSET:[...e.valueOffsets],children:e.type.children.map((r,n)=>this.visit(new Pa.Column(r,[e.getChildAt(n)])))}}};Kg.JSONVectorAssembler=Yg;function*JT(t){for(let e of t)yield e.reduce((r,n)=>`${r}${("0"+(n&255).toString(16)).slice(-2)}`,"").toUpperCase()}function*ja(t,e){for(let r=-1,n=t.length/e;++r<n;)yield`${Wx.BN.new(t.subarray((r+0)*e,(r+1)*e),!1)}`}});var cd=b(zs=>{"use strict";Object.defineProperty(zs,"__esModule",{value:!0});var Zg=za(),Gx=ad(),Zx=Fs(),Xx=ie(),eE=$e(),ud=_i(),Qg=_i(),Ps=pg(),Xg=de(),Jg=kn(),ZT=YT(),tE=KT(),XT=GT(),rE=Ve(),Gg=tn(),nE=gs(),Or=st(),js=class extends nE.ReadableInterop{constructor(e){super(),this._position=0,this._started=!1,this._sink=new Jg.AsyncByteQueue,this._schema=null,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,Or.isObject(e)||(e={autoDestroy:!0,writeLegacyIpcFormat:!1}),this._autoDestroy=typeof e.autoDestroy=="boolean"?e.autoDestroy:!0,this._writeLegacyIpcFormat=typeof e.writeLegacyIpcFormat=="boolean"?e.writeLegacyIpcFormat:!1}static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e,r){throw new Error('"throughDOM" not available in this environment')}toString(e=!1){return this._sink.toString(e)}toUint8Array(e=!1){return this._sink.toUint8Array(e)}writeAll(e){return Or.isPromise(e)?e.then(r=>this.writeAll(r)):Or.isAsyncIterable(e)?iv(this,e):nv(this,e)}get closed(){return this._sink.closed}[Symbol.asyncIterator](){return this._sink[Symbol.asyncIterator]()}toDOMStream(e){return this._sink.toDOMStream(e)}toNodeStream(e){return this._sink.toNodeStream(e)}close(){return this.reset()._sink.close()}abort(e){return this.reset()._sink.abort(e)}finish(){return this._autoDestroy?this.close():this.reset(this._sink,this._schema),this}reset(e=this._sink,r=null){return e===this._sink||e instanceof Jg.AsyncByteQueue?this._sink=e:(this._sink=new Jg.AsyncByteQueue,e&&Or.isWritableDOMStream(e)?this.toDOMStream({type:"bytes"}).pipeTo(e):e&&Or.isWritableNodeStream(e)&&this.toNodeStream({objectMode:!1}).pipe(e)),this._started&&this._schema&&this._writeFooter(this._schema),this._started=!1,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,(!r||!r.compareTo(this._schema))&&(r===null?(this._position=0,this._schema=null):(this._started=!0,this._schema=r,this._writeSchema(r))),this}write(e){let r=null;if(this._sink){if(e==null)return this.finish()&&void 0;if(e instanceof Zg.Table&&!(r=e.schema))return this.finish()&&void 0;if(e instanceof Gg.RecordBatch&&!(r=e.schema))return this.finish()&&void 0}else throw new Error("RecordBatchWriter is closed");if(r&&!r.compareTo(this._schema)){if(this._started&&this._autoDestroy)return this.close();this.reset(this._sink,r)}e instanceof Gg.RecordBatch?e instanceof Gg._InternalEmptyPlaceholderRecordBatch||this._writeRecordBatch(e):e instanceof Zg.Table?this.writeAll(e.chunks):Or.isIterable(e)&&this.writeAll(e)}_writeMessage(e,r=8){let n=r-1,i=ud.Message.encode(e),s=i.byteLength,a=this._writeLegacyIpcFormat?4:8,l=s+a+n&~n,c=l-s-a;return e.headerType===Xg.MessageHeader.RecordBatch?this._recordBatchBlocks.push(new Ps.FileBlock(l,e.bodyLength,this._position)):e.headerType===Xg.MessageHeader.DictionaryBatch&&this._dictionaryBlocks.push(new Ps.FileBlock(l,e.bodyLength,this._position)),this._writeLegacyIpcFormat||this._write(Int32Array.of(-1)),this._write(Int32Array.of(l-a)),s>0&&this._write(i),this._writePadding(c)}_write(e){if(this._started){let r=rE.toUint8Array(e);r&&r.byteLength>0&&(this._sink.write(r),this._position+=r.byteLength)}return this}_writeSchema(e){return this._writeMessage(ud.Message.from(e))}_writeFooter(e){return this._writeLegacyIpcFormat?this._write(Int32Array.of(0)):this._write(Int32Array.of(-1,0))}_writeMagic(){return this._write(Gx.MAGIC)}_writePadding(e){return e>0?this._write(new Uint8Array(e)):this}_writeRecordBatch(e){let{byteLength:r,nodes:n,bufferRegions:i,buffers:s}=ZT.VectorAssembler.assemble(e),a=new Qg.RecordBatch(e.length,n,i),l=ud.Message.from(a,r);return this._writeDictionaries(e)._writeMessage(l)._writeBodyBuffers(s)}_writeDictionaryBatch(e,r,n=!1){this._dictionaryDeltaOffsets.set(r,e.length+(this._dictionaryDeltaOffsets.get(r)||0));let{byteLength:i,nodes:s,bufferRegions:a,buffers:l}=ZT.VectorAssembler.assemble(e),c=new Qg.RecordBatch(e.length,s,a),o=new Qg.DictionaryBatch(c,r,n),u=ud.Message.from(o,i);return this._writeMessage(u)._writeBodyBuffers(l)}_writeBodyBuffers(e){let r,n,i;for(let s=-1,a=e.length;++s<a;)(r=e[s])&&(n=r.byteLength)>0&&(this._write(r),(i=(n+7&-8)-n)>0&&this._writePadding(i));return this}_writeDictionaries(e){for(let[r,n]of e.dictionaries){let i=this._dictionaryDeltaOffsets.get(r)||0;if(i===0||(n=n.slice(i)).length>0){let s="chunks"in n?n.chunks:[n];for(let a of s)this._writeDictionaryBatch(a,r,i>0),i+=a.length}}return this}};zs.RecordBatchWriter=js;var ev=class t extends js{static writeAll(e,r){let n=new t(r);return Or.isPromise(e)?e.then(i=>n.writeAll(i)):Or.isAsyncIterable(e)?iv(n,e):nv(n,e)}};zs.RecordBatchStreamWriter=ev;var tv=class t extends js{constructor(){super(),this._autoDestroy=!0}static writeAll(e){let r=new t;return Or.isPromise(e)?e.then(n=>r.writeAll(n)):Or.isAsyncIterable(e)?iv(r,e):nv(r,e)}_writeSchema(e){return this._writeMagic()._writePadding(2)}_writeFooter(e){let r=Ps.Footer.encode(new Ps.Footer(e,Xg.MetadataVersion.V4,this._recordBatchBlocks,this._dictionaryBlocks));return super._writeFooter(e)._write(r)._write(Int32Array.of(r.byteLength))._writeMagic()}};zs.RecordBatchFileWriter=tv;var rv=class t extends js{constructor(){super(),this._autoDestroy=!0,this._recordBatches=[],this._dictionaries=[]}static writeAll(e){return new t().writeAll(e)}_writeMessage(){return this}_writeFooter(e){return this}_writeSchema(e){return this._write(`{
-  "schema": ${JSON.stringify({fields:e.fields.map(eB)},null,2)}`)}_writeDictionaries(e){return e.dictionaries.size>0&&this._dictionaries.push(e),this}_writeDictionaryBatch(e,r,n=!1){return this._dictionaryDeltaOffsets.set(r,e.length+(this._dictionaryDeltaOffsets.get(r)||0)),this._write(this._dictionaryBlocks.length===0?"    ":`,
-    `),this._write(`${iE(e,r,n)}`),this._dictionaryBlocks.push(new Ps.FileBlock(0,0,0)),this}_writeRecordBatch(e){return this._writeDictionaries(e),this._recordBatches.push(e),this}close(){if(this._dictionaries.length>0){this._write(`,
-  "dictionaries": [
-`);for(let e of this._dictionaries)super._writeDictionaries(e);this._write(`
-  ]`)}if(this._recordBatches.length>0){for(let e=-1,r=this._recordBatches.length;++e<r;)this._write(e===0?`,
-  "batches": [
-    `:`,
-    `),this._write(`${sE(this._recordBatches[e])}`),this._recordBatchBlocks.push(new Ps.FileBlock(0,0,0));this._write(`
-  ]`)}return this._schema&&this._write(`
-}`),this._dictionaries=[],this._recordBatches=[],super.close()}};zs.RecordBatchJSONWriter=rv;function nv(t,e){let r=e;e instanceof Zg.Table&&(r=e.chunks,t.reset(void 0,e.schema));for(let n of r)t.write(n);return t.finish()}async function iv(t,e){for await(let r of e)t.write(r);return t.finish()}function eB({name:t,type:e,nullable:r}){let n=new tE.JSONTypeAssembler;return{name:t,nullable:r,type:n.visit(e),children:(e.children||[]).map(eB),dictionary:Xx.DataType.isDictionary(e)?{id:e.id,isOrdered:e.isOrdered,indexType:n.visit(e.indices)}:void 0}}function iE(t,e,r=!1){let n=new eE.Field(`${e}`,t.type,t.nullCount>0),i=XT.JSONVectorAssembler.assemble(new Zx.Column(n,[t]));return JSON.stringify({id:e,isDelta:r,data:{count:t.length,columns:i}},null,2)}function sE(t){return JSON.stringify({count:t.length,columns:XT.JSONVectorAssembler.assemble(t)},null,2)}});var av=b(qa=>{"use strict";Object.defineProperty(qa,"__esModule",{value:!0});var tB=sr(),ov=$e(),oE=On(),aE=tn(),sv=new Uint8Array(0),rB=t=>[sv,sv,new Uint8Array(t),sv];function lE(t,e,r=e.reduce((n,i)=>Math.max(n,i.length),0)){let n,i,s=-1,a=e.length,l=[...t.fields],c=[],o=(r+63&-64)>>3;for(;++s<a;)(n=e[s])&&n.length===r?c[s]=n:((i=l[s]).nullable||(l[s]=l[s].clone({nullable:!0})),c[s]=n?n._changeLengthAndBackfillNullBitmap(r):tB.Data.new(i.type,0,r,r,rB(o)));return[new ov.Schema(l),r,c]}qa.ensureSameLengthData=lE;function uE(t){return nB(new ov.Schema(t.map(({field:e})=>e)),t)}qa.distributeColumnsIntoRecordBatches=uE;function nB(t,e){return cE(t,e.map(r=>r instanceof oE.Chunked?r.chunks.map(n=>n.data):[r.data]))}qa.distributeVectorsIntoRecordBatches=nB;function cE(t,e){let r=[...t.fields],n=[],i={numBatches:e.reduce((d,v)=>Math.max(d,v.length),0)},s=0,a=0,l=-1,c=e.length,o,u=[];for(;i.numBatches-- >0;){for(a=Number.POSITIVE_INFINITY,l=-1;++l<c;)u[l]=o=e[l].shift(),a=Math.min(a,o?o.length:a);isFinite(a)&&(u=dE(r,a,u,e,i),a>0&&(n[s++]=[a,u.slice()]))}return[t=new ov.Schema(r,t.metadata),n.map(d=>new aE.RecordBatch(t,...d))]}function dE(t,e,r,n,i){let s,a,l=0,c=-1,o=n.length,u=(e+63&-64)>>3;for(;++c<o;)(s=r[c])&&(l=s.length)>=e?l===e?r[c]=s:(r[c]=s.slice(0,e),s=s.slice(e,l-e),i.numBatches=Math.max(i.numBatches,n[c].unshift(s))):((a=t[c]).nullable||(t[c]=a.clone({nullable:!0})),r[c]=s?s._changeLengthAndBackfillNullBitmap(e):tB.Data.new(a.type,0,e,e,rB(u)));return r}});var Ee=b(uv=>{"use strict";Object.defineProperty(uv,"__esModule",{value:!0});var fE=de(),hE=On(),pE=Da(),lv=xe(),dd=class extends lv.AbstractVector{constructor(e,r){super(),this._children=r,this.numChildren=e.childData.length,this._bindDataAccessors(this.data=e)}get type(){return this.data.type}get typeId(){return this.data.typeId}get length(){return this.data.length}get offset(){return this.data.offset}get stride(){return this.data.stride}get nullCount(){return this.data.nullCount}get byteLength(){return this.data.byteLength}get VectorName(){return`${fE.Type[this.typeId]}Vector`}get ArrayType(){return this.type.ArrayType}get values(){return this.data.values}get typeIds(){return this.data.typeIds}get nullBitmap(){return this.data.nullBitmap}get valueOffsets(){return this.data.valueOffsets}get[Symbol.toStringTag](){return`${this.VectorName}<${this.type[Symbol.toStringTag]}>`}clone(e,r=this._children){return lv.Vector.new(e,r)}concat(...e){return hE.Chunked.concat(this,...e)}slice(e,r){return pE.clampRange(this,e,r,this._sliceInternal)}isValid(e){if(this.nullCount>0){let r=this.offset+e;return(this.nullBitmap[r>>3]&1<<r%8)!==0}return!0}getChildAt(e){return e<0||e>=this.numChildren?null:(this._children||(this._children=[]))[e]||(this._children[e]=lv.Vector.new(this.data.childData[e]))}toJSON(){return[...this]}_sliceInternal(e,r,n){return e.clone(e.data.slice(r,n-r),null)}_bindDataAccessors(e){}};uv.BaseVector=dd;dd.prototype[Symbol.isConcatSpreadable]=!0});var fv=b(dv=>{"use strict";Object.defineProperty(dv,"__esModule",{value:!0});var yE=xe(),mE=Ee(),gE=ie(),cv=class extends mE.BaseVector{asUtf8(){return yE.Vector.new(this.data.clone(new gE.Utf8))}};dv.BinaryVector=cv});var yv=b(pv=>{"use strict";Object.defineProperty(pv,"__esModule",{value:!0});var vE=ie(),_E=Ee(),wE=Mr(),hv=class extends _E.BaseVector{static from(e){return wE.vectorFromValuesWithType(()=>new vE.Bool,e)}};pv.BoolVector=hv});var _v=b(Wa=>{"use strict";Object.defineProperty(Wa,"__esModule",{value:!0});var bE=de(),SE=Ee(),iB=Mr(),mv=ie(),$a=class extends SE.BaseVector{static from(...e){return e.length===2?iB.vectorFromValuesWithType(()=>e[1]===bE.DateUnit.DAY?new mv.DateDay:new mv.DateMillisecond,e[0]):iB.vectorFromValuesWithType(()=>new mv.DateMillisecond,e[0])}};Wa.DateVector=$a;var gv=class extends $a{};Wa.DateDayVector=gv;var vv=class extends $a{};Wa.DateMillisecondVector=vv});var Sv=b(bv=>{"use strict";Object.defineProperty(bv,"__esModule",{value:!0});var TE=Ee(),wv=class extends TE.BaseVector{};bv.DecimalVector=wv});var hd=b(Tv=>{"use strict";Object.defineProperty(Tv,"__esModule",{value:!0});var BE=sr(),sB=xe(),IE=Ee(),DE=Mr(),AE=ie(),fd=class extends IE.BaseVector{constructor(e){super(e),this.indices=sB.Vector.new(e.clone(this.type.indices))}static from(...e){if(e.length===3){let[r,n,i]=e,s=new AE.Dictionary(r.type,n,null,null);return sB.Vector.new(BE.Data.Dictionary(s,0,i.length,0,null,i,r))}return DE.vectorFromValuesWithType(()=>e[0].type,e[0])}get dictionary(){return this.data.dictionary}reverseLookup(e){return this.dictionary.indexOf(e)}getKey(e){return this.indices.get(e)}getValue(e){return this.dictionary.get(e)}setKey(e,r){return this.indices.set(e,r)}setValue(e,r){return this.dictionary.set(e,r)}};Tv.DictionaryVector=fd;fd.prototype.indices=null});var Dv=b(Iv=>{"use strict";Object.defineProperty(Iv,"__esModule",{value:!0});var FE=Ee(),Bv=class extends FE.BaseVector{};Iv.FixedSizeBinaryVector=Bv});var Ov=b(Fv=>{"use strict";Object.defineProperty(Fv,"__esModule",{value:!0});var OE=Ee(),Av=class extends OE.BaseVector{};Fv.FixedSizeListVector=Av});var Mv=b($s=>{"use strict";Object.defineProperty($s,"__esModule",{value:!0});var ME=sr(),xE=xe(),EE=Ee(),UE=Mr(),Si=ie(),qs=class extends EE.BaseVector{static from(e){let r=kE(this);if(e instanceof ArrayBuffer||ArrayBuffer.isView(e)){let n=NE(e.constructor)||r;if(r===null&&(r=n),r&&r===n){let i=new r,s=e.byteLength/i.ArrayType.BYTES_PER_ELEMENT;if(!VE(r,e.constructor))return xE.Vector.new(ME.Data.Float(i,0,s,0,null,e))}}if(r)return UE.vectorFromValuesWithType(()=>new r,e);throw e instanceof DataView||e instanceof ArrayBuffer?new TypeError(`Cannot infer float type from instance of ${e.constructor.name}`):new TypeError("Unrecognized FloatVector input")}};$s.FloatVector=qs;var pd=class extends qs{toFloat32Array(){return new Float32Array(this)}toFloat64Array(){return new Float64Array(this)}};$s.Float16Vector=pd;var yd=class extends qs{};$s.Float32Vector=yd;var md=class extends qs{};$s.Float64Vector=md;var VE=(t,e)=>t===Si.Float16&&e!==Uint16Array,NE=t=>{switch(t){case Uint16Array:return Si.Float16;case Float32Array:return Si.Float32;case Float64Array:return Si.Float64;default:return null}},kE=t=>{switch(t){case pd:return Si.Float16;case yd:return Si.Float32;case md:return Si.Float64;default:return null}}});var Uv=b(Ya=>{"use strict";Object.defineProperty(Ya,"__esModule",{value:!0});var LE=Ee(),Ha=class extends LE.BaseVector{};Ya.IntervalVector=Ha;var xv=class extends Ha{};Ya.IntervalDayTimeVector=xv;var Ev=class extends Ha{};Ya.IntervalYearMonthVector=Ev});var Id=b(yr=>{"use strict";Object.defineProperty(yr,"__esModule",{value:!0});var CE=sr(),RE=xe(),PE=Ee(),jE=Mr(),oB=st(),aB=Ve(),Oe=ie(),pr=class extends PE.BaseVector{static from(...e){let[r,n=!1]=e,i=$E(this,n);if(r instanceof ArrayBuffer||ArrayBuffer.isView(r)){let s=qE(r.constructor,n)||i;if(i===null&&(i=s),i&&i===s){let a=new i,l=r.byteLength/a.ArrayType.BYTES_PER_ELEMENT;return zE(i,r.constructor)&&(l*=.5),RE.Vector.new(CE.Data.Int(a,0,l,0,null,r))}}if(i)return jE.vectorFromValuesWithType(()=>new i,r);throw r instanceof DataView||r instanceof ArrayBuffer?new TypeError(`Cannot infer integer type from instance of ${r.constructor.name}`):new TypeError("Unrecognized IntVector input")}};yr.IntVector=pr;var gd=class extends pr{};yr.Int8Vector=gd;var vd=class extends pr{};yr.Int16Vector=vd;var _d=class extends pr{};yr.Int32Vector=_d;var wd=class extends pr{toBigInt64Array(){return aB.toBigInt64Array(this.values)}get values64(){return this._values64||(this._values64=this.toBigInt64Array())}};yr.Int64Vector=wd;var bd=class extends pr{};yr.Uint8Vector=bd;var Sd=class extends pr{};yr.Uint16Vector=Sd;var Td=class extends pr{};yr.Uint32Vector=Td;var Bd=class extends pr{toBigUint64Array(){return aB.toBigUint64Array(this.values)}get values64(){return this._values64||(this._values64=this.toBigUint64Array())}};yr.Uint64Vector=Bd;var zE=(t,e)=>(t===Oe.Int64||t===Oe.Uint64)&&(e===Int32Array||e===Uint32Array),qE=(t,e)=>{switch(t){case Int8Array:return Oe.Int8;case Int16Array:return Oe.Int16;case Int32Array:return e?Oe.Int64:Oe.Int32;case oB.BigInt64Array:return Oe.Int64;case Uint8Array:return Oe.Uint8;case Uint16Array:return Oe.Uint16;case Uint32Array:return e?Oe.Uint64:Oe.Uint32;case oB.BigUint64Array:return Oe.Uint64;default:return null}},$E=(t,e)=>{switch(t){case gd:return Oe.Int8;case vd:return Oe.Int16;case _d:return e?Oe.Int64:Oe.Int32;case wd:return Oe.Int64;case bd:return Oe.Uint8;case Sd:return Oe.Uint16;case Td:return e?Oe.Uint64:Oe.Uint32;case Bd:return Oe.Uint64;default:return null}}});var kv=b(Nv=>{"use strict";Object.defineProperty(Nv,"__esModule",{value:!0});var WE=Ee(),Vv=class extends WE.BaseVector{};Nv.ListVector=Vv});var Rv=b(Cv=>{"use strict";Object.defineProperty(Cv,"__esModule",{value:!0});var HE=Ta(),YE=xe(),KE=Ee(),QE=ie(),Lv=class extends KE.BaseVector{asList(){let e=this.type.children[0];return YE.Vector.new(this.data.clone(new QE.List(e)))}bind(e){let r=this.getChildAt(0),{[e]:n,[e+1]:i}=this.valueOffsets;return new HE.MapRow(r.slice(n,i))}};Cv.MapVector=Lv});var zv=b(jv=>{"use strict";Object.defineProperty(jv,"__esModule",{value:!0});var JE=Ee(),Pv=class extends JE.BaseVector{};jv.NullVector=Pv});var Wv=b($v=>{"use strict";Object.defineProperty($v,"__esModule",{value:!0});var GE=Ta(),ZE=Ee(),XE=Symbol.for("rowIndex"),qv=class extends ZE.BaseVector{bind(e){let r=this._row||(this._row=new GE.StructRow(this)),n=Object.create(r);return n[XE]=e,n}};$v.StructVector=qv});var Jv=b(Bi=>{"use strict";Object.defineProperty(Bi,"__esModule",{value:!0});var eU=Ee(),Ti=class extends eU.BaseVector{};Bi.TimestampVector=Ti;var Hv=class extends Ti{};Bi.TimestampSecondVector=Hv;var Yv=class extends Ti{};Bi.TimestampMillisecondVector=Yv;var Kv=class extends Ti{};Bi.TimestampMicrosecondVector=Kv;var Qv=class extends Ti{};Bi.TimestampNanosecondVector=Qv});var t_=b(Di=>{"use strict";Object.defineProperty(Di,"__esModule",{value:!0});var tU=Ee(),Ii=class extends tU.BaseVector{};Di.TimeVector=Ii;var Gv=class extends Ii{};Di.TimeSecondVector=Gv;var Zv=class extends Ii{};Di.TimeMillisecondVector=Zv;var Xv=class extends Ii{};Di.TimeMicrosecondVector=Xv;var e_=class extends Ii{};Di.TimeNanosecondVector=e_});var i_=b(Qa=>{"use strict";Object.defineProperty(Qa,"__esModule",{value:!0});var rU=Ee(),Ka=class extends rU.BaseVector{get typeIdToChildIndex(){return this.data.type.typeIdToChildIndex}};Qa.UnionVector=Ka;var r_=class extends Ka{get valueOffsets(){return this.data.valueOffsets}};Qa.DenseUnionVector=r_;var n_=class extends Ka{};Qa.SparseUnionVector=n_});var a_=b(o_=>{"use strict";Object.defineProperty(o_,"__esModule",{value:!0});var nU=xe(),iU=Ee(),lB=ie(),sU=Mr(),s_=class extends iU.BaseVector{static from(e){return sU.vectorFromValuesWithType(()=>new lB.Utf8,e)}asBinary(){return nU.Vector.new(this.data.clone(new lB.Binary))}};o_.Utf8Vector=s_});var uB=b(Ja=>{"use strict";Object.defineProperty(Ja,"__esModule",{value:!0});function oU(t){return function(){return t(this)}}Ja.partial0=oU;function aU(t){return function(e){return t(this,e)}}Ja.partial1=aU;function lU(t){return function(e,r){return t(this,e,r)}}Ja.partial2=lU});var c_=b(Ad=>{"use strict";Object.defineProperty(Ad,"__esModule",{value:!0});var Dd=wa(),uU=Ge(),cU=oi(),dU=ga(),qt=de(),C=class extends uU.Visitor{};Ad.GetVisitor=C;var fU=(t,e)=>864e5*t[e],l_=(t,e)=>4294967296*t[e+1]+(t[e]>>>0),hU=(t,e)=>4294967296*(t[e+1]/1e3)+(t[e]>>>0)/1e3,pU=(t,e)=>4294967296*(t[e+1]/1e6)+(t[e]>>>0)/1e6,cB=t=>new Date(t),yU=(t,e)=>cB(fU(t,e)),mU=(t,e)=>cB(l_(t,e)),gU=(t,e)=>null,dB=(t,e,r)=>{let{[r]:n,[r+1]:i}=e;return n!=null&&i!=null?t.subarray(n,i):null},vU=({offset:t,values:e},r)=>{let n=t+r;return(e[n>>3]&1<<n%8)!==0},fB=({values:t},e)=>yU(t,e),hB=({values:t},e)=>mU(t,e*2),xr=({stride:t,values:e},r)=>e[t*r],pB=({stride:t,values:e},r)=>dU.uint16ToFloat64(e[t*r]),u_=({stride:t,values:e,type:r},n)=>Dd.BN.new(e.subarray(t*n,t*(n+1)),r.isSigned),_U=({stride:t,values:e},r)=>e.subarray(t*r,t*(r+1)),wU=({values:t,valueOffsets:e},r)=>dB(t,e,r),bU=({values:t,valueOffsets:e},r)=>{let n=dB(t,e,r);return n!==null?cU.decodeUtf8(n):null},SU=(t,e)=>t.type.bitWidth<64?xr(t,e):u_(t,e),TU=(t,e)=>t.type.precision!==qt.Precision.HALF?xr(t,e):pB(t,e),BU=(t,e)=>t.type.unit===qt.DateUnit.DAY?fB(t,e):hB(t,e),yB=({values:t},e)=>1e3*l_(t,e*2),mB=({values:t},e)=>l_(t,e*2),gB=({values:t},e)=>hU(t,e*2),vB=({values:t},e)=>pU(t,e*2),IU=(t,e)=>{switch(t.type.unit){case qt.TimeUnit.SECOND:return yB(t,e);case qt.TimeUnit.MILLISECOND:return mB(t,e);case qt.TimeUnit.MICROSECOND:return gB(t,e);case qt.TimeUnit.NANOSECOND:return vB(t,e)}},_B=({values:t,stride:e},r)=>t[e*r],wB=({values:t,stride:e},r)=>t[e*r],bB=({values:t},e)=>Dd.BN.signed(t.subarray(2*e,2*(e+1))),SB=({values:t},e)=>Dd.BN.signed(t.subarray(2*e,2*(e+1))),DU=(t,e)=>{switch(t.type.unit){case qt.TimeUnit.SECOND:return _B(t,e);case qt.TimeUnit.MILLISECOND:return wB(t,e);case qt.TimeUnit.MICROSECOND:return bB(t,e);case qt.TimeUnit.NANOSECOND:return SB(t,e)}},AU=({values:t},e)=>Dd.BN.decimal(t.subarray(4*e,4*(e+1))),FU=(t,e)=>{let r=t.getChildAt(0),{valueOffsets:n,stride:i}=t;return r.slice(n[e*i],n[e*i+1])},OU=(t,e)=>t.bind(e),MU=(t,e)=>t.bind(e),xU=(t,e)=>t.type.mode===qt.UnionMode.Dense?TB(t,e):BB(t,e),TB=(t,e)=>{let r=t.typeIdToChildIndex[t.typeIds[e]],n=t.getChildAt(r);return n?n.get(t.valueOffsets[e]):null},BB=(t,e)=>{let r=t.typeIdToChildIndex[t.typeIds[e]],n=t.getChildAt(r);return n?n.get(e):null},EU=(t,e)=>t.getValue(t.getKey(e)),UU=(t,e)=>t.type.unit===qt.IntervalUnit.DAY_TIME?IB(t,e):DB(t,e),IB=({values:t},e)=>t.subarray(2*e,2*(e+1)),DB=({values:t},e)=>{let r=t[e],n=new Int32Array(2);return n[0]=r/12|0,n[1]=r%12|0,n},VU=(t,e)=>{let r=t.getChildAt(0),{stride:n}=t;return r.slice(e*n,(e+1)*n)};C.prototype.visitNull=gU;C.prototype.visitBool=vU;C.prototype.visitInt=SU;C.prototype.visitInt8=xr;C.prototype.visitInt16=xr;C.prototype.visitInt32=xr;C.prototype.visitInt64=u_;C.prototype.visitUint8=xr;C.prototype.visitUint16=xr;C.prototype.visitUint32=xr;C.prototype.visitUint64=u_;C.prototype.visitFloat=TU;C.prototype.visitFloat16=pB;C.prototype.visitFloat32=xr;C.prototype.visitFloat64=xr;C.prototype.visitUtf8=bU;C.prototype.visitBinary=wU;C.prototype.visitFixedSizeBinary=_U;C.prototype.visitDate=BU;C.prototype.visitDateDay=fB;C.prototype.visitDateMillisecond=hB;C.prototype.visitTimestamp=IU;C.prototype.visitTimestampSecond=yB;C.prototype.visitTimestampMillisecond=mB;C.prototype.visitTimestampMicrosecond=gB;C.prototype.visitTimestampNanosecond=vB;C.prototype.visitTime=DU;C.prototype.visitTimeSecond=_B;C.prototype.visitTimeMillisecond=wB;C.prototype.visitTimeMicrosecond=bB;C.prototype.visitTimeNanosecond=SB;C.prototype.visitDecimal=AU;C.prototype.visitList=FU;C.prototype.visitStruct=MU;C.prototype.visitUnion=xU;C.prototype.visitDenseUnion=TB;C.prototype.visitSparseUnion=BB;C.prototype.visitDictionary=EU;C.prototype.visitInterval=UU;C.prototype.visitIntervalDayTime=IB;C.prototype.visitIntervalYearMonth=DB;C.prototype.visitFixedSizeList=VU;C.prototype.visitMap=OU;Ad.instance=new C});var MB=b(Fd=>{"use strict";Object.defineProperty(Fd,"__esModule",{value:!0});var NU=Ge(),AB=Ir(),FB=Da(),R=class extends NU.Visitor{};Fd.IndexOfVisitor=R;function kU(t,e){return e===null&&t.length>0?0:-1}function LU(t,e){let{nullBitmap:r}=t;if(!r||t.nullCount<=0)return-1;let n=0;for(let i of AB.iterateBits(r,t.data.offset+(e||0),t.length,r,AB.getBool)){if(!i)return n;++n}return-1}function J(t,e,r){if(e===void 0)return-1;if(e===null)return LU(t,r);let n=FB.createElementComparator(e);for(let i=(r||0)-1,s=t.length;++i<s;)if(n(t.get(i)))return i;return-1}function OB(t,e,r){let n=FB.createElementComparator(e);for(let i=(r||0)-1,s=t.length;++i<s;)if(n(t.get(i)))return i;return-1}R.prototype.visitNull=kU;R.prototype.visitBool=J;R.prototype.visitInt=J;R.prototype.visitInt8=J;R.prototype.visitInt16=J;R.prototype.visitInt32=J;R.prototype.visitInt64=J;R.prototype.visitUint8=J;R.prototype.visitUint16=J;R.prototype.visitUint32=J;R.prototype.visitUint64=J;R.prototype.visitFloat=J;R.prototype.visitFloat16=J;R.prototype.visitFloat32=J;R.prototype.visitFloat64=J;R.prototype.visitUtf8=J;R.prototype.visitBinary=J;R.prototype.visitFixedSizeBinary=J;R.prototype.visitDate=J;R.prototype.visitDateDay=J;R.prototype.visitDateMillisecond=J;R.prototype.visitTimestamp=J;R.prototype.visitTimestampSecond=J;R.prototype.visitTimestampMillisecond=J;R.prototype.visitTimestampMicrosecond=J;R.prototype.visitTimestampNanosecond=J;R.prototype.visitTime=J;R.prototype.visitTimeSecond=J;R.prototype.visitTimeMillisecond=J;R.prototype.visitTimeMicrosecond=J;R.prototype.visitTimeNanosecond=J;R.prototype.visitDecimal=J;R.prototype.visitList=J;R.prototype.visitStruct=J;R.prototype.visitUnion=J;R.prototype.visitDenseUnion=OB;R.prototype.visitSparseUnion=OB;R.prototype.visitDictionary=J;R.prototype.visitInterval=J;R.prototype.visitIntervalDayTime=J;R.prototype.visitIntervalYearMonth=J;R.prototype.visitFixedSizeList=J;R.prototype.visitMap=J;Fd.instance=new R});var d_=b(Md=>{"use strict";Object.defineProperty(Md,"__esModule",{value:!0});var Od=de(),CU=Ge(),RU=Ir(),xB=c_(),P=class extends CU.Visitor{};Md.IteratorVisitor=P;function PU(t){let e=xB.instance.getVisitFn(t);return RU.iterateBits(t.nullBitmap,t.offset,t.length,t,(r,n,i,s)=>i&1<<s?e(r,n):null)}function Y(t){if(t.nullCount>0)return PU(t);let{type:e,typeId:r,length:n}=t;return t.stride===1&&(r===Od.Type.Timestamp||r===Od.Type.Int&&e.bitWidth!==64||r===Od.Type.Time&&e.bitWidth!==64||r===Od.Type.Float&&e.precision>0)?t.values.subarray(0,n)[Symbol.iterator]():function*(i){for(let s=-1;++s<n;)yield i(t,s)}(xB.instance.getVisitFn(t))}P.prototype.visitNull=Y;P.prototype.visitBool=Y;P.prototype.visitInt=Y;P.prototype.visitInt8=Y;P.prototype.visitInt16=Y;P.prototype.visitInt32=Y;P.prototype.visitInt64=Y;P.prototype.visitUint8=Y;P.prototype.visitUint16=Y;P.prototype.visitUint32=Y;P.prototype.visitUint64=Y;P.prototype.visitFloat=Y;P.prototype.visitFloat16=Y;P.prototype.visitFloat32=Y;P.prototype.visitFloat64=Y;P.prototype.visitUtf8=Y;P.prototype.visitBinary=Y;P.prototype.visitFixedSizeBinary=Y;P.prototype.visitDate=Y;P.prototype.visitDateDay=Y;P.prototype.visitDateMillisecond=Y;P.prototype.visitTimestamp=Y;P.prototype.visitTimestampSecond=Y;P.prototype.visitTimestampMillisecond=Y;P.prototype.visitTimestampMicrosecond=Y;P.prototype.visitTimestampNanosecond=Y;P.prototype.visitTime=Y;P.prototype.visitTimeSecond=Y;P.prototype.visitTimeMillisecond=Y;P.prototype.visitTimeMicrosecond=Y;P.prototype.visitTimeNanosecond=Y;P.prototype.visitDecimal=Y;P.prototype.visitList=Y;P.prototype.visitStruct=Y;P.prototype.visitUnion=Y;P.prototype.visitDenseUnion=Y;P.prototype.visitSparseUnion=Y;P.prototype.visitDictionary=Y;P.prototype.visitInterval=Y;P.prototype.visitIntervalDayTime=Y;P.prototype.visitIntervalYearMonth=Y;P.prototype.visitFixedSizeList=Y;P.prototype.visitMap=Y;Md.instance=new P});var EB=b(xd=>{"use strict";Object.defineProperty(xd,"__esModule",{value:!0});var Ga=de(),jU=Ge(),zU=d_(),j=class extends jU.Visitor{};xd.ToArrayVisitor=j;function K(t){let{type:e,length:r,stride:n}=t;switch(e.typeId){case Ga.Type.Int:case Ga.Type.Float:case Ga.Type.Decimal:case Ga.Type.Time:case Ga.Type.Timestamp:return t.values.subarray(0,r*n)}return[...zU.instance.visit(t)]}j.prototype.visitNull=K;j.prototype.visitBool=K;j.prototype.visitInt=K;j.prototype.visitInt8=K;j.prototype.visitInt16=K;j.prototype.visitInt32=K;j.prototype.visitInt64=K;j.prototype.visitUint8=K;j.prototype.visitUint16=K;j.prototype.visitUint32=K;j.prototype.visitUint64=K;j.prototype.visitFloat=K;j.prototype.visitFloat16=K;j.prototype.visitFloat32=K;j.prototype.visitFloat64=K;j.prototype.visitUtf8=K;j.prototype.visitBinary=K;j.prototype.visitFixedSizeBinary=K;j.prototype.visitDate=K;j.prototype.visitDateDay=K;j.prototype.visitDateMillisecond=K;j.prototype.visitTimestamp=K;j.prototype.visitTimestampSecond=K;j.prototype.visitTimestampMillisecond=K;j.prototype.visitTimestampMicrosecond=K;j.prototype.visitTimestampNanosecond=K;j.prototype.visitTime=K;j.prototype.visitTimeSecond=K;j.prototype.visitTimeMillisecond=K;j.prototype.visitTimeMicrosecond=K;j.prototype.visitTimeNanosecond=K;j.prototype.visitDecimal=K;j.prototype.visitList=K;j.prototype.visitStruct=K;j.prototype.visitUnion=K;j.prototype.visitDenseUnion=K;j.prototype.visitSparseUnion=K;j.prototype.visitDictionary=K;j.prototype.visitInterval=K;j.prototype.visitIntervalDayTime=K;j.prototype.visitIntervalYearMonth=K;j.prototype.visitFixedSizeList=K;j.prototype.visitMap=K;xd.instance=new j});var UB=b(Ud=>{"use strict";Object.defineProperty(Ud,"__esModule",{value:!0});var qU=Ge(),$U=de(),Za=(t,e)=>t+e,f_=t=>`Cannot compute the byte width of variable-width column ${t}`,Ed=class extends qU.Visitor{visitNull(e){return 0}visitInt(e){return e.bitWidth/8}visitFloat(e){return e.ArrayType.BYTES_PER_ELEMENT}visitBinary(e){throw new Error(f_(e))}visitUtf8(e){throw new Error(f_(e))}visitBool(e){return 1/8}visitDecimal(e){return 16}visitDate(e){return(e.unit+1)*4}visitTime(e){return e.bitWidth/8}visitTimestamp(e){return e.unit===$U.TimeUnit.SECOND?4:8}visitInterval(e){return(e.unit+1)*4}visitList(e){throw new Error(f_(e))}visitStruct(e){return this.visitFields(e.children).reduce(Za,0)}visitUnion(e){return this.visitFields(e.children).reduce(Za,0)}visitFixedSizeBinary(e){return e.byteWidth}visitFixedSizeList(e){return e.listSize*this.visitFields(e.children).reduce(Za,0)}visitMap(e){return this.visitFields(e.children).reduce(Za,0)}visitDictionary(e){return this.visit(e.indices)}visitFields(e){return(e||[]).map(r=>this.visit(r.type))}visitSchema(e){return this.visitFields(e.fields).reduce(Za,0)}};Ud.ByteWidthVisitor=Ed;Ud.instance=new Ed});var VB=b(kd=>{"use strict";Object.defineProperty(kd,"__esModule",{value:!0});var WU=Ge(),HU=fv(),YU=yv(),h_=_v(),KU=Sv(),QU=hd(),JU=Dv(),GU=Ov(),Vd=Mv(),p_=Uv(),rn=Id(),ZU=kv(),XU=Rv(),eV=zv(),tV=Wv(),Xa=Jv(),el=t_(),y_=i_(),rV=a_(),Nd=class extends WU.Visitor{visitNull(){return eV.NullVector}visitBool(){return YU.BoolVector}visitInt(){return rn.IntVector}visitInt8(){return rn.Int8Vector}visitInt16(){return rn.Int16Vector}visitInt32(){return rn.Int32Vector}visitInt64(){return rn.Int64Vector}visitUint8(){return rn.Uint8Vector}visitUint16(){return rn.Uint16Vector}visitUint32(){return rn.Uint32Vector}visitUint64(){return rn.Uint64Vector}visitFloat(){return Vd.FloatVector}visitFloat16(){return Vd.Float16Vector}visitFloat32(){return Vd.Float32Vector}visitFloat64(){return Vd.Float64Vector}visitUtf8(){return rV.Utf8Vector}visitBinary(){return HU.BinaryVector}visitFixedSizeBinary(){return JU.FixedSizeBinaryVector}visitDate(){return h_.DateVector}visitDateDay(){return h_.DateDayVector}visitDateMillisecond(){return h_.DateMillisecondVector}visitTimestamp(){return Xa.TimestampVector}visitTimestampSecond(){return Xa.TimestampSecondVector}visitTimestampMillisecond(){return Xa.TimestampMillisecondVector}visitTimestampMicrosecond(){return Xa.TimestampMicrosecondVector}visitTimestampNanosecond(){return Xa.TimestampNanosecondVector}visitTime(){return el.TimeVector}visitTimeSecond(){return el.TimeSecondVector}visitTimeMillisecond(){return el.TimeMillisecondVector}visitTimeMicrosecond(){return el.TimeMicrosecondVector}visitTimeNanosecond(){return el.TimeNanosecondVector}visitDecimal(){return KU.DecimalVector}visitList(){return ZU.ListVector}visitStruct(){return tV.StructVector}visitUnion(){return y_.UnionVector}visitDenseUnion(){return y_.DenseUnionVector}visitSparseUnion(){return y_.SparseUnionVector}visitDictionary(){return QU.DictionaryVector}visitInterval(){return p_.IntervalVector}visitIntervalDayTime(){return p_.IntervalDayTimeVector}visitIntervalYearMonth(){return p_.IntervalYearMonthVector}visitFixedSizeList(){return GU.FixedSizeListVector}visitMap(){return XU.MapVector}};kd.GetVectorConstructor=Nd;kd.instance=new Nd});var Mr=b(N=>{"use strict";Object.defineProperty(N,"__esModule",{value:!0});var nV=xe();N.Vector=nV.Vector;var iV=Ee();N.BaseVector=iV.BaseVector;var sV=fv();N.BinaryVector=sV.BinaryVector;var oV=yv();N.BoolVector=oV.BoolVector;var aV=On();N.Chunked=aV.Chunked;var g_=_v();N.DateVector=g_.DateVector;N.DateDayVector=g_.DateDayVector;N.DateMillisecondVector=g_.DateMillisecondVector;var lV=Sv();N.DecimalVector=lV.DecimalVector;var uV=hd();N.DictionaryVector=uV.DictionaryVector;var cV=Dv();N.FixedSizeBinaryVector=cV.FixedSizeBinaryVector;var dV=Ov();N.FixedSizeListVector=dV.FixedSizeListVector;var Cd=Mv();N.FloatVector=Cd.FloatVector;N.Float16Vector=Cd.Float16Vector;N.Float32Vector=Cd.Float32Vector;N.Float64Vector=Cd.Float64Vector;var v_=Uv();N.IntervalVector=v_.IntervalVector;N.IntervalDayTimeVector=v_.IntervalDayTimeVector;N.IntervalYearMonthVector=v_.IntervalYearMonthVector;var nn=Id();N.IntVector=nn.IntVector;N.Int8Vector=nn.Int8Vector;N.Int16Vector=nn.Int16Vector;N.Int32Vector=nn.Int32Vector;N.Int64Vector=nn.Int64Vector;N.Uint8Vector=nn.Uint8Vector;N.Uint16Vector=nn.Uint16Vector;N.Uint32Vector=nn.Uint32Vector;N.Uint64Vector=nn.Uint64Vector;var fV=kv();N.ListVector=fV.ListVector;var hV=Rv();N.MapVector=hV.MapVector;var pV=zv();N.NullVector=pV.NullVector;var yV=Wv();N.StructVector=yV.StructVector;var rl=Jv();N.TimestampVector=rl.TimestampVector;N.TimestampSecondVector=rl.TimestampSecondVector;N.TimestampMillisecondVector=rl.TimestampMillisecondVector;N.TimestampMicrosecondVector=rl.TimestampMicrosecondVector;N.TimestampNanosecondVector=rl.TimestampNanosecondVector;var nl=t_();N.TimeVector=nl.TimeVector;N.TimeSecondVector=nl.TimeSecondVector;N.TimeMillisecondVector=nl.TimeMillisecondVector;N.TimeMicrosecondVector=nl.TimeMicrosecondVector;N.TimeNanosecondVector=nl.TimeNanosecondVector;var __=i_();N.UnionVector=__.UnionVector;N.DenseUnionVector=__.DenseUnionVector;N.SparseUnionVector=__.SparseUnionVector;var mV=a_();N.Utf8Vector=mV.Utf8Vector;var LB=Ta();N.MapRow=LB.MapRow;N.StructRow=LB.StructRow;var tl=uB(),m_=de(),Ws=xe(),NB=On(),Ai=Ee(),gV=Ir(),Ld=st(),kB=Ae(),CB=c_(),RB=ng(),PB=MB(),jB=EB(),zB=d_(),qB=UB(),$B=VB();Ws.Vector.new=vV;Ws.Vector.from=wV;function vV(t,...e){return new($B.instance.getVisitFn(t)())(t,...e)}function _V(t,e){if(Ld.isIterable(e))return Ws.Vector.from({nullValues:[null,void 0],type:t(),values:e});if(Ld.isAsyncIterable(e))return Ws.Vector.from({nullValues:[null,void 0],type:t(),values:e});let{values:r=[],type:n=t(),nullValues:i=[null,void 0]}={...e};return Ld.isIterable(r)?Ws.Vector.from({nullValues:i,...e,type:n}):Ws.Vector.from({nullValues:i,...e,type:n})}N.vectorFromValuesWithType=_V;function wV(t){let{values:e=[],...r}={nullValues:[null,void 0],...t};if(Ld.isIterable(e)){let n=[...kB.Builder.throughIterable(r)(e)];return n.length===1?n[0]:NB.Chunked.concat(n)}return(async n=>{let i=kB.Builder.throughAsyncIterable(r);for await(let s of i(e))n.push(s);return n.length===1?n[0]:NB.Chunked.concat(n)})([])}Ai.BaseVector.prototype.get=function(e){return CB.instance.visit(this,e)};Ai.BaseVector.prototype.set=function(e,r){return RB.instance.visit(this,e,r)};Ai.BaseVector.prototype.indexOf=function(e,r){return PB.instance.visit(this,e,r)};Ai.BaseVector.prototype.toArray=function(){return jB.instance.visit(this)};Ai.BaseVector.prototype.getByteWidth=function(){return qB.instance.visit(this.type)};Ai.BaseVector.prototype[Symbol.iterator]=function(){return zB.instance.visit(this)};Ai.BaseVector.prototype._bindDataAccessors=BV;Object.keys(m_.Type).map(t=>m_.Type[t]).filter(t=>typeof t=="number").filter(t=>t!==m_.Type.NONE).forEach(t=>{let e=$B.instance.visit(t);e.prototype.get=tl.partial1(CB.instance.getVisitFn(t)),e.prototype.set=tl.partial2(RB.instance.getVisitFn(t)),e.prototype.indexOf=tl.partial2(PB.instance.getVisitFn(t)),e.prototype.toArray=tl.partial0(jB.instance.getVisitFn(t)),e.prototype.getByteWidth=bV(qB.instance.getVisitFn(t)),e.prototype[Symbol.iterator]=tl.partial0(zB.instance.getVisitFn(t))});function bV(t){return function(){return t(this.type)}}function SV(t){return function(e){return this.isValid(e)?t.call(this,e):null}}function TV(t){return function(e,r){gV.setBool(this.nullBitmap,this.offset+e,r!=null)&&t.call(this,e,r)}}function BV(){let t=this.nullBitmap;t&&t.byteLength>0&&(this.get=SV(this.get),this.set=TV(this.set))}});var za=b(B_=>{"use strict";Object.defineProperty(B_,"__esModule",{value:!0});var IV=Fs(),WB=$e(),w_=tn(),DV=sl(),S_=ie(),HB=Mn(),b_=st(),YB=cd(),KB=av(),T_=Mr(),il=class t extends T_.Chunked{constructor(...e){let r=null;e[0]instanceof WB.Schema&&(r=e.shift());let n=HB.selectArgs(w_.RecordBatch,e);if(!r&&!(r=n[0]&&n[0].schema))throw new TypeError("Table must be initialized with a Schema or at least one RecordBatch");n[0]||(n[0]=new w_._InternalEmptyPlaceholderRecordBatch(r)),super(new S_.Struct(r.fields),n),this._schema=r,this._chunks=n}static empty(e=new WB.Schema([])){return new t(e,[])}static from(e){if(!e)return t.empty();if(typeof e=="object"){let n=b_.isIterable(e.values)?AV(e):b_.isAsyncIterable(e.values)?FV(e):null;if(n!==null)return n}let r=DV.RecordBatchReader.from(e);return b_.isPromise(r)?(async()=>await t.from(await r))():r.isSync()&&(r=r.open())?r.schema?new t(r.schema,[...r]):t.empty():(async n=>{let i=await n,s=i.schema,a=[];if(s){for await(let l of i)a.push(l);return new t(s,a)}return t.empty()})(r.open())}static async fromAsync(e){return await t.from(e)}static fromStruct(e){return t.new(e.data.childData,e.type.children)}static new(...e){return new t(...KB.distributeColumnsIntoRecordBatches(HB.selectColumnArgs(e)))}get schema(){return this._schema}get length(){return this._length}get chunks(){return this._chunks}get numCols(){return this._numChildren}clone(e=this._chunks){return new t(this._schema,e)}getColumn(e){return this.getColumnAt(this.getColumnIndex(e))}getColumnAt(e){return this.getChildAt(e)}getColumnIndex(e){return this._schema.fields.findIndex(r=>r.name===e)}getChildAt(e){if(e<0||e>=this.numChildren)return null;let r,n,i=this._schema.fields,s=this._children||(this._children=[]);if(n=s[e])return n;if(r=i[e]){let a=this._chunks.map(l=>l.getChildAt(e)).filter(l=>l!=null);if(a.length>0)return s[e]=new IV.Column(r,a)}return null}serialize(e="binary",r=!0){return(r?YB.RecordBatchStreamWriter:YB.RecordBatchFileWriter).writeAll(this).toUint8Array(!0)}count(){return this._length}select(...e){let r=this._schema.fields.reduce((n,i,s)=>n.set(i.name,s),new Map);return this.selectAt(...e.map(n=>r.get(n)).filter(n=>n>-1))}selectAt(...e){let r=this._schema.selectAt(...e);return new t(r,this._chunks.map(({length:n,data:{childData:i}})=>new w_.RecordBatch(r,n,e.map(s=>i[s]).filter(Boolean))))}assign(e){let r=this._schema.fields,[n,i]=e.schema.fields.reduce((l,c,o)=>{let[u,d]=l,v=r.findIndex(T=>T.name===c.name);return~v?d[v]=o:u.push(o),l},[[],[]]),s=this._schema.assign(e.schema),a=[...r.map((l,c,o,u=i[c])=>u===void 0?this.getColumnAt(c):e.getColumnAt(u)),...n.map(l=>e.getColumnAt(l))].filter(Boolean);return new t(...KB.distributeVectorsIntoRecordBatches(s,a))}};B_.Table=il;function AV(t){let{type:e}=t;return e instanceof S_.Struct?il.fromStruct(T_.StructVector.from(t)):null}function FV(t){let{type:e}=t;return e instanceof S_.Struct?T_.StructVector.from(t).then(r=>il.fromStruct(r)):null}});var tn=b(Pd=>{"use strict";Object.defineProperty(Pd,"__esModule",{value:!0});var D_=sr(),I_=za(),OV=xe(),MV=Ge(),xV=$e(),EV=st(),UV=On(),VV=Mn(),A_=ie(),NV=av(),kV=Mr(),Rd=class t extends kV.StructVector{constructor(...e){let r,n=e[0],i;if(e[1]instanceof D_.Data)[,r,i]=e;else{let s=n.fields,[,a,l]=e;r=D_.Data.Struct(new A_.Struct(s),0,a,0,null,l)}super(r,i),this._schema=n}static from(e){return EV.isIterable(e.values),I_.Table.from(e)}static new(...e){let[r,n]=VV.selectFieldArgs(e),i=n.filter(s=>s instanceof OV.Vector);return new t(...NV.ensureSameLengthData(new xV.Schema(r),i.map(s=>s.data)))}clone(e,r=this._children){return new t(this._schema,e,r)}concat(...e){let r=this._schema,n=UV.Chunked.flatten(this,...e);return new I_.Table(r,n.map(({data:i})=>new t(r,i)))}get schema(){return this._schema}get numCols(){return this._schema.fields.length}get dictionaries(){return this._dictionaries||(this._dictionaries=O_.collect(this))}select(...e){let r=this._schema.fields.reduce((n,i,s)=>n.set(i.name,s),new Map);return this.selectAt(...e.map(n=>r.get(n)).filter(n=>n>-1))}selectAt(...e){let r=this._schema.selectAt(...e),n=e.map(i=>this.data.childData[i]).filter(Boolean);return new t(r,this.length,n)}};Pd.RecordBatch=Rd;var F_=class extends Rd{constructor(e){super(e,0,e.fields.map(r=>D_.Data.new(r.type,0,0,0)))}};Pd._InternalEmptyPlaceholderRecordBatch=F_;var O_=class t extends MV.Visitor{constructor(){super(...arguments),this.dictionaries=new Map}static collect(e){return new t().visit(e.data,new A_.Struct(e.schema.fields)).dictionaries}visit(e,r){return A_.DataType.isDictionary(r)?this.visitDictionary(e,r):(e.childData.forEach((n,i)=>this.visit(n,r.children[i].type)),this)}visitDictionary(e,r){let n=e.dictionary;return n&&n.length>0&&this.dictionaries.set(r.id,n),this}}});var sl=b(Ei=>{"use strict";Object.defineProperty(Ei,"__esModule",{value:!0});var QB=xe(),jd=de(),eI=pg(),JB=Jo(),GB=kn(),ol=bg(),tI=wT(),E_=tn(),Fi=gs(),Wt=ad(),$t=st(),Oi=class t extends Fi.ReadableInterop{constructor(e){super(),this._impl=e}get closed(){return this._impl.closed}get schema(){return this._impl.schema}get autoDestroy(){return this._impl.autoDestroy}get dictionaries(){return this._impl.dictionaries}get numDictionaries(){return this._impl.numDictionaries}get numRecordBatches(){return this._impl.numRecordBatches}get footer(){return this._impl.isFile()?this._impl.footer:null}isSync(){return this._impl.isSync()}isAsync(){return this._impl.isAsync()}isFile(){return this._impl.isFile()}isStream(){return this._impl.isStream()}next(){return this._impl.next()}throw(e){return this._impl.throw(e)}return(e){return this._impl.return(e)}cancel(){return this._impl.cancel()}reset(e){return this._impl.reset(e),this._DOMStream=void 0,this._nodeStream=void 0,this}open(e){let r=this._impl.open(e);return $t.isPromise(r)?r.then(()=>this):this}readRecordBatch(e){return this._impl.isFile()?this._impl.readRecordBatch(e):null}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}toDOMStream(){return JB.default.toDOMStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this})}toNodeStream(){return JB.default.toNodeStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this},{objectMode:!0})}static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e,r){throw new Error('"throughDOM" not available in this environment')}static from(e){return e instanceof t?e:$t.isArrowJSON(e)?LV(e):$t.isFileHandle(e)?PV(e):$t.isPromise(e)?(async()=>await t.from(await e))():$t.isFetchResponse(e)||$t.isReadableDOMStream(e)||$t.isReadableNodeStream(e)||$t.isAsyncIterable(e)?RV(new GB.AsyncByteStream(e)):CV(new GB.ByteStream(e))}static readAll(e){return e instanceof t?e.isSync()?ZB(e):XB(e):$t.isArrowJSON(e)||ArrayBuffer.isView(e)||$t.isIterable(e)||$t.isIteratorResult(e)?ZB(e):XB(e)}};Ei.RecordBatchReader=Oi;var Mi=class extends Oi{constructor(e){super(e),this._impl=e}[Symbol.iterator](){return this._impl[Symbol.iterator]()}async*[Symbol.asyncIterator](){yield*this[Symbol.iterator]()}};Ei.RecordBatchStreamReader=Mi;var xi=class extends Oi{constructor(e){super(e),this._impl=e}[Symbol.iterator](){throw new Error("AsyncRecordBatchStreamReader is not Iterable")}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}};Ei.AsyncRecordBatchStreamReader=xi;var al=class extends Mi{constructor(e){super(e),this._impl=e}};Ei.RecordBatchFileReader=al;var zd=class extends xi{constructor(e){super(e),this._impl=e}};Ei.AsyncRecordBatchFileReader=zd;var qd=class{constructor(e=new Map){this.closed=!1,this.autoDestroy=!0,this._dictionaryIndex=0,this._recordBatchIndex=0,this.dictionaries=e}get numDictionaries(){return this._dictionaryIndex}get numRecordBatches(){return this._recordBatchIndex}isSync(){return!1}isAsync(){return!1}isFile(){return!1}isStream(){return!1}reset(e){return this._dictionaryIndex=0,this._recordBatchIndex=0,this.schema=e,this.dictionaries=new Map,this}_loadRecordBatch(e,r){return new E_.RecordBatch(this.schema,e.length,this._loadVectors(e,r,this.schema.fields))}_loadDictionaryBatch(e,r){let{id:n,isDelta:i,data:s}=e,{dictionaries:a,schema:l}=this,c=a.get(n);if(i||!c){let o=l.dictionaries.get(n);return c&&i?c.concat(QB.Vector.new(this._loadVectors(s,r,[o])[0])):QB.Vector.new(this._loadVectors(s,r,[o])[0])}return c}_loadVectors(e,r,n){return new tI.VectorLoader(r,e.nodes,e.buffers,this.dictionaries).visitMany(n)}},Hs=class extends qd{constructor(e,r){super(r),this._reader=$t.isArrowJSON(e)?new Wt.JSONMessageReader(this._handle=e):new Wt.MessageReader(this._handle=e)}isSync(){return!0}isStream(){return!0}[Symbol.iterator](){return this}cancel(){!this.closed&&(this.closed=!0)&&(this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}open(e){return this.closed||(this.autoDestroy=rI(this,e),this.schema||(this.schema=this._reader.readSchema())||this.cancel()),this}throw(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.throw(e):Fi.ITERATOR_DONE}return(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.return(e):Fi.ITERATOR_DONE}next(){if(this.closed)return Fi.ITERATOR_DONE;let e,{_reader:r}=this;for(;e=this._readNextMessageAndValidate();)if(e.isSchema())this.reset(e.header());else if(e.isRecordBatch()){this._recordBatchIndex++;let n=e.header(),i=r.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(n,i)}}else if(e.isDictionaryBatch()){this._dictionaryIndex++;let n=e.header(),i=r.readMessageBody(e.bodyLength),s=this._loadDictionaryBatch(n,i);this.dictionaries.set(n.id,s)}return this.schema&&this._recordBatchIndex===0?(this._recordBatchIndex++,{done:!1,value:new E_._InternalEmptyPlaceholderRecordBatch(this.schema)}):this.return()}_readNextMessageAndValidate(e){return this._reader.readMessage(e)}},Ys=class extends qd{constructor(e,r){super(r),this._reader=new Wt.AsyncMessageReader(this._handle=e)}isAsync(){return!0}isStream(){return!0}[Symbol.asyncIterator](){return this}async cancel(){!this.closed&&(this.closed=!0)&&(await this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}async open(e){return this.closed||(this.autoDestroy=rI(this,e),this.schema||(this.schema=await this._reader.readSchema())||await this.cancel()),this}async throw(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?await this.reset()._reader.throw(e):Fi.ITERATOR_DONE}async return(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?await this.reset()._reader.return(e):Fi.ITERATOR_DONE}async next(){if(this.closed)return Fi.ITERATOR_DONE;let e,{_reader:r}=this;for(;e=await this._readNextMessageAndValidate();)if(e.isSchema())await this.reset(e.header());else if(e.isRecordBatch()){this._recordBatchIndex++;let n=e.header(),i=await r.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(n,i)}}else if(e.isDictionaryBatch()){this._dictionaryIndex++;let n=e.header(),i=await r.readMessageBody(e.bodyLength),s=this._loadDictionaryBatch(n,i);this.dictionaries.set(n.id,s)}return this.schema&&this._recordBatchIndex===0?(this._recordBatchIndex++,{done:!1,value:new E_._InternalEmptyPlaceholderRecordBatch(this.schema)}):await this.return()}async _readNextMessageAndValidate(e){return await this._reader.readMessage(e)}},$d=class extends Hs{constructor(e,r){super(e instanceof ol.RandomAccessFile?e:new ol.RandomAccessFile(e),r)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isSync(){return!0}isFile(){return!0}open(e){if(!this.closed&&!this._footer){this.schema=(this._footer=this._readFooter()).schema;for(let r of this._footer.dictionaryBatches())r&&this._readDictionaryBatch(this._dictionaryIndex++)}return super.open(e)}readRecordBatch(e){if(this.closed)return null;this._footer||this.open();let r=this._footer&&this._footer.getRecordBatch(e);if(r&&this._handle.seek(r.offset)){let n=this._reader.readMessage(jd.MessageHeader.RecordBatch);if(n&&n.isRecordBatch()){let i=n.header(),s=this._reader.readMessageBody(n.bodyLength);return this._loadRecordBatch(i,s)}}return null}_readDictionaryBatch(e){let r=this._footer&&this._footer.getDictionaryBatch(e);if(r&&this._handle.seek(r.offset)){let n=this._reader.readMessage(jd.MessageHeader.DictionaryBatch);if(n&&n.isDictionaryBatch()){let i=n.header(),s=this._reader.readMessageBody(n.bodyLength),a=this._loadDictionaryBatch(i,s);this.dictionaries.set(i.id,a)}}}_readFooter(){let{_handle:e}=this,r=e.size-Wt.magicAndPadding,n=e.readInt32(r),i=e.readAt(r-n,n);return eI.Footer.decode(i)}_readNextMessageAndValidate(e){if(this._footer||this.open(),this._footer&&this._recordBatchIndex<this.numRecordBatches){let r=this._footer&&this._footer.getRecordBatch(this._recordBatchIndex);if(r&&this._handle.seek(r.offset))return this._reader.readMessage(e)}return null}},M_=class extends Ys{constructor(e,...r){let n=typeof r[0]!="number"?r.shift():void 0,i=r[0]instanceof Map?r.shift():void 0;super(e instanceof ol.AsyncRandomAccessFile?e:new ol.AsyncRandomAccessFile(e,n),i)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isFile(){return!0}isAsync(){return!0}async open(e){if(!this.closed&&!this._footer){this.schema=(this._footer=await this._readFooter()).schema;for(let r of this._footer.dictionaryBatches())r&&await this._readDictionaryBatch(this._dictionaryIndex++)}return await super.open(e)}async readRecordBatch(e){if(this.closed)return null;this._footer||await this.open();let r=this._footer&&this._footer.getRecordBatch(e);if(r&&await this._handle.seek(r.offset)){let n=await this._reader.readMessage(jd.MessageHeader.RecordBatch);if(n&&n.isRecordBatch()){let i=n.header(),s=await this._reader.readMessageBody(n.bodyLength);return this._loadRecordBatch(i,s)}}return null}async _readDictionaryBatch(e){let r=this._footer&&this._footer.getDictionaryBatch(e);if(r&&await this._handle.seek(r.offset)){let n=await this._reader.readMessage(jd.MessageHeader.DictionaryBatch);if(n&&n.isDictionaryBatch()){let i=n.header(),s=await this._reader.readMessageBody(n.bodyLength),a=this._loadDictionaryBatch(i,s);this.dictionaries.set(i.id,a)}}}async _readFooter(){let{_handle:e}=this;e._pending&&await e._pending;let r=e.size-Wt.magicAndPadding,n=await e.readInt32(r),i=await e.readAt(r-n,n);return eI.Footer.decode(i)}async _readNextMessageAndValidate(e){if(this._footer||await this.open(),this._footer&&this._recordBatchIndex<this.numRecordBatches){let r=this._footer.getRecordBatch(this._recordBatchIndex);if(r&&await this._handle.seek(r.offset))return await this._reader.readMessage(e)}return null}},x_=class extends Hs{constructor(e,r){super(e,r)}_loadVectors(e,r,n){return new tI.JSONVectorLoader(r,e.nodes,e.buffers,this.dictionaries).visitMany(n)}};function rI(t,e){return e&&typeof e.autoDestroy=="boolean"?e.autoDestroy:t.autoDestroy}function*ZB(t){let e=Oi.from(t);try{if(!e.open({autoDestroy:!1}).closed)do yield e;while(!e.reset().open().closed)}finally{e.cancel()}}async function*XB(t){let e=await Oi.from(t);try{if(!(await e.open({autoDestroy:!1})).closed)do yield e;while(!(await e.reset().open()).closed)}finally{await e.cancel()}}function LV(t){return new Mi(new x_(t))}function CV(t){let e=t.peek(Wt.magicLength+7&-8);return e&&e.byteLength>=4?Wt.checkForMagicArrowString(e)?new al(new $d(t.read())):new Mi(new Hs(t)):new Mi(new Hs(function*(){}()))}async function RV(t){let e=await t.peek(Wt.magicLength+7&-8);return e&&e.byteLength>=4?Wt.checkForMagicArrowString(e)?new al(new $d(await t.read())):new xi(new Ys(t)):new xi(new Ys(async function*(){}()))}async function PV(t){let{size:e}=await t.stat(),r=new ol.AsyncRandomAccessFile(t,e);return e>=Wt.magicX2AndPadding&&Wt.checkForMagicArrowString(await r.readAt(0,Wt.magicLength+7&-8))?new zd(new M_(r)):new xi(new Ys(r))}});var sI=b(U_=>{"use strict";Object.defineProperty(U_,"__esModule",{value:!0});var iI=Ve(),nI=st();function jV(t,e){if(nI.isAsyncIterable(t))return qV(t,e);if(nI.isIterable(t))return zV(t,e);throw new Error("toDOMStream() must be called with an Iterable or AsyncIterable")}U_.toDOMStream=jV;function zV(t,e){let r=null,n=e&&e.type==="bytes"||!1,i=e&&e.highWaterMark||2**24;return new ReadableStream({...e,start(a){s(a,r||(r=t[Symbol.iterator]()))},pull(a){r?s(a,r):a.close()},cancel(){(r&&r.return&&r.return()||!0)&&(r=null)}},{highWaterMark:n?i:void 0,...e});function s(a,l){let c,o=null,u=a.desiredSize||null;for(;!(o=l.next(n?u:null)).done;)if(ArrayBuffer.isView(o.value)&&(c=iI.toUint8Array(o.value))&&(u!=null&&n&&(u=u-c.byteLength+1),o.value=c),a.enqueue(o.value),u!=null&&--u<=0)return;a.close()}}function qV(t,e){let r=null,n=e&&e.type==="bytes"||!1,i=e&&e.highWaterMark||2**24;return new ReadableStream({...e,async start(a){await s(a,r||(r=t[Symbol.asyncIterator]()))},async pull(a){r?await s(a,r):a.close()},async cancel(){(r&&r.return&&await r.return()||!0)&&(r=null)}},{highWaterMark:n?i:void 0,...e});async function s(a,l){let c,o=null,u=a.desiredSize||null;for(;!(o=await l.next(n?u:null)).done;)if(ArrayBuffer.isView(o.value)&&(c=iI.toUint8Array(o.value))&&(u!=null&&n&&(u=u-c.byteLength+1),o.value=c),a.enqueue(o.value),u!=null&&--u<=0)return;a.close()}}});var lI=b(Hd=>{"use strict";Object.defineProperty(Hd,"__esModule",{value:!0});var $V=jc();function WV(t){return new Wd(t)}Hd.builderThroughDOMStream=WV;var Wd=class{constructor(e){this._numChunks=0,this._finished=!1,this._bufferedSize=0;let{["readableStrategy"]:r,["writableStrategy"]:n,["queueingStrategy"]:i="count",...s}=e;this._controller=null,this._builder=$V.Builder.new(s),this._getSize=i!=="bytes"?oI:aI;let{["highWaterMark"]:a=i==="bytes"?2**14:1e3}={...r},{["highWaterMark"]:l=i==="bytes"?2**14:1e3}={...n};this.readable=new ReadableStream({cancel:()=>{this._builder.clear()},pull:c=>{this._maybeFlush(this._builder,this._controller=c)},start:c=>{this._maybeFlush(this._builder,this._controller=c)}},{highWaterMark:a,size:i!=="bytes"?oI:aI}),this.writable=new WritableStream({abort:()=>{this._builder.clear()},write:()=>{this._maybeFlush(this._builder,this._controller)},close:()=>{this._maybeFlush(this._builder.finish(),this._controller)}},{highWaterMark:l,size:c=>this._writeValueAndReturnChunkSize(c)})}_writeValueAndReturnChunkSize(e){let r=this._bufferedSize;return this._bufferedSize=this._getSize(this._builder.append(e)),this._bufferedSize-r}_maybeFlush(e,r){r!==null&&(this._bufferedSize>=r.desiredSize&&++this._numChunks&&this._enqueue(r,e.toVector()),e.finished&&((e.length>0||this._numChunks===0)&&++this._numChunks&&this._enqueue(r,e.toVector()),!this._finished&&(this._finished=!0)&&this._enqueue(r,null)))}_enqueue(e,r){this._bufferedSize=0,this._controller=null,r===null?e.close():e.enqueue(r)}};Hd.BuilderTransform=Wd;var oI=t=>t.length,aI=t=>t.byteLength});var uI=b(V_=>{"use strict";Object.defineProperty(V_,"__esModule",{value:!0});var HV=kn(),YV=sl();function KV(t,e){let r=new HV.AsyncByteQueue,n=null,i=new ReadableStream({async cancel(){await r.close()},async start(l){await a(l,n||(n=await s()))},async pull(l){n?await a(l,n):l.close()}});return{writable:new WritableStream(r,{highWaterMark:2**14,...t}),readable:i};async function s(){return await(await YV.RecordBatchReader.from(r)).open(e)}async function a(l,c){let o=l.desiredSize,u=null;for(;!(u=await c.next()).done;)if(l.enqueue(u.value),o!=null&&--o<=0)return;l.close()}}V_.recordBatchReaderThroughDOMStream=KV});var cI=b(N_=>{"use strict";Object.defineProperty(N_,"__esModule",{value:!0});var QV=kn();function JV(t,e){let r=new this(t),n=new QV.AsyncByteStream(r),i=new ReadableStream({type:"bytes",async cancel(){await n.cancel()},async pull(a){await s(a)},async start(a){await s(a)}},{highWaterMark:2**14,...e});return{writable:new WritableStream(r,t),readable:i};async function s(a){let l=null,c=a.desiredSize;for(;l=await n.read(c||null);)if(a.enqueue(l),c!=null&&(c-=l.byteLength)<=0)return;a.close()}}N_.recordBatchWriterThroughDOMStream=JV});var k_=b(Ne=>{"use strict";Object.defineProperty(Ne,"__esModule",{value:!0});var GV=hd(),ll=class t{eq(e){return e instanceof t||(e=new Er(e)),new Kd(this,e)}le(e){return e instanceof t||(e=new Er(e)),new Qd(this,e)}ge(e){return e instanceof t||(e=new Er(e)),new Jd(this,e)}lt(e){return new Ui(this.ge(e))}gt(e){return new Ui(this.le(e))}ne(e){return new Ui(this.eq(e))}};Ne.Value=ll;var Er=class extends ll{constructor(e){super(),this.v=e}};Ne.Literal=Er;var Yd=class extends ll{constructor(e){super(),this.name=e}bind(e){if(!this.colidx){this.colidx=-1;let n=e.schema.fields;for(let i=-1;++i<n.length;)if(n[i].name===this.name){this.colidx=i;break}if(this.colidx<0)throw new Error(`Failed to bind Col "${this.name}"`)}let r=this.vector=e.getChildAt(this.colidx);return n=>r.get(n)}};Ne.Col=Yd;var Vi=class{and(...e){return new ul(this,...e)}or(...e){return new cl(this,...e)}not(){return new Ui(this)}};Ne.Predicate=Vi;var Ks=class extends Vi{constructor(e,r){super(),this.left=e,this.right=r}bind(e){return this.left instanceof Er?this.right instanceof Er?this._bindLitLit(e,this.left,this.right):this._bindLitCol(e,this.left,this.right):this.right instanceof Er?this._bindColLit(e,this.left,this.right):this._bindColCol(e,this.left,this.right)}};Ne.ComparisonPredicate=Ks;var Qs=class extends Vi{constructor(...e){super(),this.children=e}};Ne.CombinationPredicate=Qs;Qs.prototype.children=Object.freeze([]);var ul=class t extends Qs{constructor(...e){e=e.reduce((r,n)=>r.concat(n instanceof t?n.children:n),[]),super(...e)}bind(e){let r=this.children.map(n=>n.bind(e));return(n,i)=>r.every(s=>s(n,i))}};Ne.And=ul;var cl=class t extends Qs{constructor(...e){e=e.reduce((r,n)=>r.concat(n instanceof t?n.children:n),[]),super(...e)}bind(e){let r=this.children.map(n=>n.bind(e));return(n,i)=>r.some(s=>s(n,i))}};Ne.Or=cl;var Kd=class extends Ks{_bindLitLit(e,r,n){let i=r.v==n.v;return()=>i}_bindColCol(e,r,n){let i=r.bind(e),s=n.bind(e);return(a,l)=>i(a,l)==s(a,l)}_bindColLit(e,r,n){let i=r.bind(e);if(r.vector instanceof GV.DictionaryVector){let s,a=r.vector;return a.dictionary!==this.lastDictionary?(s=a.reverseLookup(n.v),this.lastDictionary=a.dictionary,this.lastKey=s):s=this.lastKey,s===-1?()=>!1:l=>a.getKey(l)===s}else return(s,a)=>i(s,a)==n.v}_bindLitCol(e,r,n){return this._bindColLit(e,n,r)}};Ne.Equals=Kd;var Qd=class extends Ks{_bindLitLit(e,r,n){let i=r.v<=n.v;return()=>i}_bindColCol(e,r,n){let i=r.bind(e),s=n.bind(e);return(a,l)=>i(a,l)<=s(a,l)}_bindColLit(e,r,n){let i=r.bind(e);return(s,a)=>i(s,a)<=n.v}_bindLitCol(e,r,n){let i=n.bind(e);return(s,a)=>r.v<=i(s,a)}};Ne.LTeq=Qd;var Jd=class extends Ks{_bindLitLit(e,r,n){let i=r.v>=n.v;return()=>i}_bindColCol(e,r,n){let i=r.bind(e),s=n.bind(e);return(a,l)=>i(a,l)>=s(a,l)}_bindColLit(e,r,n){let i=r.bind(e);return(s,a)=>i(s,a)>=n.v}_bindLitCol(e,r,n){let i=n.bind(e);return(s,a)=>r.v>=i(s,a)}};Ne.GTeq=Jd;var Ui=class extends Vi{constructor(e){super(),this.child=e}bind(e){let r=this.child.bind(e);return(n,i)=>!r(n,i)}};Ne.Not=Ui;var Gd=class extends Vi{constructor(e,r){super(),this.next=e,this.bind_=r}bind(e){return this.bind_(e),this.next}};Ne.CustomPredicate=Gd;function ZV(t){return new Er(t)}Ne.lit=ZV;function XV(t){return new Yd(t)}Ne.col=XV;function eN(...t){return new ul(...t)}Ne.and=eN;function tN(...t){return new cl(...t)}Ne.or=tN;function rN(t,e){return new Gd(t,e)}Ne.custom=rN});var pI=b(fl=>{"use strict";Object.defineProperty(fl,"__esModule",{value:!0});var Js=za(),dI=Id(),L_=$e(),fI=k_(),nN=tn(),hI=ie();Js.Table.prototype.countBy=function(t){return new $n(this.chunks).countBy(t)};Js.Table.prototype.scan=function(t,e){return new $n(this.chunks).scan(t,e)};Js.Table.prototype.scanReverse=function(t,e){return new $n(this.chunks).scanReverse(t,e)};Js.Table.prototype.filter=function(t){return new $n(this.chunks).filter(t)};var $n=class extends Js.Table{filter(e){return new Zd(this.chunks,e)}scan(e,r){let n=this.chunks,i=n.length;for(let s=-1;++s<i;){let a=n[s];r&&r(a);for(let l=-1,c=a.length;++l<c;)e(l,a)}}scanReverse(e,r){let n=this.chunks,i=n.length;for(let s=i;--s>=0;){let a=n[s];r&&r(a);for(let l=a.length;--l>=0;)e(l,a)}}countBy(e){let r=this.chunks,n=r.length,i=typeof e=="string"?new fI.Col(e):e;i.bind(r[n-1]);let s=i.vector;if(!hI.DataType.isDictionary(s.type))throw new Error("countBy currently only supports dictionary-encoded columns");let a=Math.ceil(Math.log(s.length)/Math.log(256)),l=a==4?Uint32Array:a>=2?Uint16Array:Uint8Array,c=new l(s.dictionary.length);for(let o=-1;++o<n;){let u=r[o];i.bind(u);let d=i.vector.indices;for(let v=-1,T=u.length;++v<T;){let I=d.get(v);I!==null&&c[I]++}}return new dl(s.dictionary,dI.IntVector.from(c))}};fl.DataFrame=$n;var dl=class extends Js.Table{constructor(e,r){let n=new L_.Schema([new L_.Field("values",e.type),new L_.Field("counts",r.type)]);super(new nN.RecordBatch(n,r.length,[e,r]))}toJSON(){let e=this.getColumnAt(0),r=this.getColumnAt(1),n={};for(let i=-1;++i<this.length;)n[e.get(i)]=r.get(i);return n}};fl.CountByResult=dl;var Zd=class t extends $n{constructor(e,r){super(e),this._predicate=r}scan(e,r){let n=this._chunks,i=n.length;for(let s=-1;++s<i;){let a=n[s],l=this._predicate.bind(a),c=!1;for(let o=-1,u=a.length;++o<u;)l(o,a)&&(r&&!c&&(r(a),c=!0),e(o,a))}}scanReverse(e,r){let n=this._chunks,i=n.length;for(let s=i;--s>=0;){let a=n[s],l=this._predicate.bind(a),c=!1;for(let o=a.length;--o>=0;)l(o,a)&&(r&&!c&&(r(a),c=!0),e(o,a))}}count(){let e=0,r=this._chunks,n=r.length;for(let i=-1;++i<n;){let s=r[i],a=this._predicate.bind(s);for(let l=-1,c=s.length;++l<c;)a(l,s)&&++e}return e}*[Symbol.iterator](){let e=this._chunks,r=e.length;for(let n=-1;++n<r;){let i=e[n],s=this._predicate.bind(i);for(let a=-1,l=i.length;++a<l;)s(a,i)&&(yield i.get(a))}}filter(e){return new t(this._chunks,this._predicate.and(e))}countBy(e){let r=this._chunks,n=r.length,i=typeof e=="string"?new fI.Col(e):e;i.bind(r[n-1]);let s=i.vector;if(!hI.DataType.isDictionary(s.type))throw new Error("countBy currently only supports dictionary-encoded columns");let a=Math.ceil(Math.log(s.length)/Math.log(256)),l=a==4?Uint32Array:a>=2?Uint16Array:Uint8Array,c=new l(s.dictionary.length);for(let o=-1;++o<n;){let u=r[o],d=this._predicate.bind(u);i.bind(u);let v=i.vector.indices;for(let T=-1,I=u.length;++T<I;){let D=v.get(T);D!==null&&d(T,u)&&c[D]++}}return new dl(s.dictionary,dI.IntVector.from(c))}};fl.FilteredDataFrame=Zd});var mI=b(p=>{"use strict";Object.defineProperty(p,"__esModule",{value:!0});var Ur=de();p.ArrowType=Ur.ArrowType;p.DateUnit=Ur.DateUnit;p.IntervalUnit=Ur.IntervalUnit;p.MessageHeader=Ur.MessageHeader;p.MetadataVersion=Ur.MetadataVersion;p.Precision=Ur.Precision;p.TimeUnit=Ur.TimeUnit;p.Type=Ur.Type;p.UnionMode=Ur.UnionMode;p.BufferType=Ur.BufferType;var iN=sr();p.Data=iN.Data;var W=ie();p.DataType=W.DataType;p.Null=W.Null;p.Bool=W.Bool;p.Int=W.Int;p.Int8=W.Int8;p.Int16=W.Int16;p.Int32=W.Int32;p.Int64=W.Int64;p.Uint8=W.Uint8;p.Uint16=W.Uint16;p.Uint32=W.Uint32;p.Uint64=W.Uint64;p.Float=W.Float;p.Float16=W.Float16;p.Float32=W.Float32;p.Float64=W.Float64;p.Utf8=W.Utf8;p.Binary=W.Binary;p.FixedSizeBinary=W.FixedSizeBinary;p.Date_=W.Date_;p.DateDay=W.DateDay;p.DateMillisecond=W.DateMillisecond;p.Timestamp=W.Timestamp;p.TimestampSecond=W.TimestampSecond;p.TimestampMillisecond=W.TimestampMillisecond;p.TimestampMicrosecond=W.TimestampMicrosecond;p.TimestampNanosecond=W.TimestampNanosecond;p.Time=W.Time;p.TimeSecond=W.TimeSecond;p.TimeMillisecond=W.TimeMillisecond;p.TimeMicrosecond=W.TimeMicrosecond;p.TimeNanosecond=W.TimeNanosecond;p.Decimal=W.Decimal;p.List=W.List;p.Struct=W.Struct;p.Union=W.Union;p.DenseUnion=W.DenseUnion;p.SparseUnion=W.SparseUnion;p.Dictionary=W.Dictionary;p.Interval=W.Interval;p.IntervalDayTime=W.IntervalDayTime;p.IntervalYearMonth=W.IntervalYearMonth;p.FixedSizeList=W.FixedSizeList;p.Map_=W.Map_;var sN=za();p.Table=sN.Table;var oN=Fs();p.Column=oN.Column;var aN=Ge();p.Visitor=aN.Visitor;var yI=$e();p.Schema=yI.Schema;p.Field=yI.Field;var $=Mr();p.Vector=$.Vector;p.BaseVector=$.BaseVector;p.BinaryVector=$.BinaryVector;p.BoolVector=$.BoolVector;p.Chunked=$.Chunked;p.DateVector=$.DateVector;p.DateDayVector=$.DateDayVector;p.DateMillisecondVector=$.DateMillisecondVector;p.DecimalVector=$.DecimalVector;p.DictionaryVector=$.DictionaryVector;p.FixedSizeBinaryVector=$.FixedSizeBinaryVector;p.FixedSizeListVector=$.FixedSizeListVector;p.FloatVector=$.FloatVector;p.Float16Vector=$.Float16Vector;p.Float32Vector=$.Float32Vector;p.Float64Vector=$.Float64Vector;p.IntervalVector=$.IntervalVector;p.IntervalDayTimeVector=$.IntervalDayTimeVector;p.IntervalYearMonthVector=$.IntervalYearMonthVector;p.IntVector=$.IntVector;p.Int8Vector=$.Int8Vector;p.Int16Vector=$.Int16Vector;p.Int32Vector=$.Int32Vector;p.Int64Vector=$.Int64Vector;p.Uint8Vector=$.Uint8Vector;p.Uint16Vector=$.Uint16Vector;p.Uint32Vector=$.Uint32Vector;p.Uint64Vector=$.Uint64Vector;p.ListVector=$.ListVector;p.MapVector=$.MapVector;p.NullVector=$.NullVector;p.StructVector=$.StructVector;p.TimestampVector=$.TimestampVector;p.TimestampSecondVector=$.TimestampSecondVector;p.TimestampMillisecondVector=$.TimestampMillisecondVector;p.TimestampMicrosecondVector=$.TimestampMicrosecondVector;p.TimestampNanosecondVector=$.TimestampNanosecondVector;p.TimeVector=$.TimeVector;p.TimeSecondVector=$.TimeSecondVector;p.TimeMillisecondVector=$.TimeMillisecondVector;p.TimeMicrosecondVector=$.TimeMicrosecondVector;p.TimeNanosecondVector=$.TimeNanosecondVector;p.UnionVector=$.UnionVector;p.DenseUnionVector=$.DenseUnionVector;p.SparseUnionVector=$.SparseUnionVector;p.Utf8Vector=$.Utf8Vector;var H=jc();p.Builder=H.Builder;p.BinaryBuilder=H.BinaryBuilder;p.BoolBuilder=H.BoolBuilder;p.DateBuilder=H.DateBuilder;p.DateDayBuilder=H.DateDayBuilder;p.DateMillisecondBuilder=H.DateMillisecondBuilder;p.DecimalBuilder=H.DecimalBuilder;p.DictionaryBuilder=H.DictionaryBuilder;p.FixedSizeBinaryBuilder=H.FixedSizeBinaryBuilder;p.FixedSizeListBuilder=H.FixedSizeListBuilder;p.FloatBuilder=H.FloatBuilder;p.Float16Builder=H.Float16Builder;p.Float32Builder=H.Float32Builder;p.Float64Builder=H.Float64Builder;p.IntervalBuilder=H.IntervalBuilder;p.IntervalDayTimeBuilder=H.IntervalDayTimeBuilder;p.IntervalYearMonthBuilder=H.IntervalYearMonthBuilder;p.IntBuilder=H.IntBuilder;p.Int8Builder=H.Int8Builder;p.Int16Builder=H.Int16Builder;p.Int32Builder=H.Int32Builder;p.Int64Builder=H.Int64Builder;p.Uint8Builder=H.Uint8Builder;p.Uint16Builder=H.Uint16Builder;p.Uint32Builder=H.Uint32Builder;p.Uint64Builder=H.Uint64Builder;p.ListBuilder=H.ListBuilder;p.MapBuilder=H.MapBuilder;p.NullBuilder=H.NullBuilder;p.StructBuilder=H.StructBuilder;p.TimestampBuilder=H.TimestampBuilder;p.TimestampSecondBuilder=H.TimestampSecondBuilder;p.TimestampMillisecondBuilder=H.TimestampMillisecondBuilder;p.TimestampMicrosecondBuilder=H.TimestampMicrosecondBuilder;p.TimestampNanosecondBuilder=H.TimestampNanosecondBuilder;p.TimeBuilder=H.TimeBuilder;p.TimeSecondBuilder=H.TimeSecondBuilder;p.TimeMillisecondBuilder=H.TimeMillisecondBuilder;p.TimeMicrosecondBuilder=H.TimeMicrosecondBuilder;p.TimeNanosecondBuilder=H.TimeNanosecondBuilder;p.UnionBuilder=H.UnionBuilder;p.DenseUnionBuilder=H.DenseUnionBuilder;p.SparseUnionBuilder=H.SparseUnionBuilder;p.Utf8Builder=H.Utf8Builder;var C_=kn();p.ByteStream=C_.ByteStream;p.AsyncByteStream=C_.AsyncByteStream;p.AsyncByteQueue=C_.AsyncByteQueue;var hl=sl();p.RecordBatchReader=hl.RecordBatchReader;p.RecordBatchFileReader=hl.RecordBatchFileReader;p.RecordBatchStreamReader=hl.RecordBatchStreamReader;p.AsyncRecordBatchFileReader=hl.AsyncRecordBatchFileReader;p.AsyncRecordBatchStreamReader=hl.AsyncRecordBatchStreamReader;var Xd=cd();p.RecordBatchWriter=Xd.RecordBatchWriter;p.RecordBatchFileWriter=Xd.RecordBatchFileWriter;p.RecordBatchStreamWriter=Xd.RecordBatchStreamWriter;p.RecordBatchJSONWriter=Xd.RecordBatchJSONWriter;var R_=ad();p.MessageReader=R_.MessageReader;p.AsyncMessageReader=R_.AsyncMessageReader;p.JSONMessageReader=R_.JSONMessageReader;var lN=_i();p.Message=lN.Message;var uN=tn();p.RecordBatch=uN.RecordBatch;var P_=pI();p.DataFrame=P_.DataFrame;p.FilteredDataFrame=P_.FilteredDataFrame;p.CountByResult=P_.CountByResult;var cN=wa(),dN=Bg(),fN=Ir(),hN=ga(),pN=Ve(),yN=Da(),mN=k_();p.predicate=mN;p.util={...cN,...dN,...fN,...hN,...pN,...yN}});var gI=b(y=>{"use strict";Object.defineProperty(y,"__esModule",{value:!0});var gN=Jo(),vN=jc(),_N=sl(),wN=cd(),bN=sI(),SN=lI(),TN=uI(),BN=cI();gN.default.toDOMStream=bN.toDOMStream;vN.Builder.throughDOM=SN.builderThroughDOMStream;_N.RecordBatchReader.throughDOM=TN.recordBatchReaderThroughDOMStream;wN.RecordBatchWriter.throughDOM=BN.recordBatchWriterThroughDOMStream;var m=mI();y.ArrowType=m.ArrowType;y.DateUnit=m.DateUnit;y.IntervalUnit=m.IntervalUnit;y.MessageHeader=m.MessageHeader;y.MetadataVersion=m.MetadataVersion;y.Precision=m.Precision;y.TimeUnit=m.TimeUnit;y.Type=m.Type;y.UnionMode=m.UnionMode;y.BufferType=m.BufferType;y.Data=m.Data;y.DataType=m.DataType;y.Null=m.Null;y.Bool=m.Bool;y.Int=m.Int;y.Int8=m.Int8;y.Int16=m.Int16;y.Int32=m.Int32;y.Int64=m.Int64;y.Uint8=m.Uint8;y.Uint16=m.Uint16;y.Uint32=m.Uint32;y.Uint64=m.Uint64;y.Float=m.Float;y.Float16=m.Float16;y.Float32=m.Float32;y.Float64=m.Float64;y.Utf8=m.Utf8;y.Binary=m.Binary;y.FixedSizeBinary=m.FixedSizeBinary;y.Date_=m.Date_;y.DateDay=m.DateDay;y.DateMillisecond=m.DateMillisecond;y.Timestamp=m.Timestamp;y.TimestampSecond=m.TimestampSecond;y.TimestampMillisecond=m.TimestampMillisecond;y.TimestampMicrosecond=m.TimestampMicrosecond;y.TimestampNanosecond=m.TimestampNanosecond;y.Time=m.Time;y.TimeSecond=m.TimeSecond;y.TimeMillisecond=m.TimeMillisecond;y.TimeMicrosecond=m.TimeMicrosecond;y.TimeNanosecond=m.TimeNanosecond;y.Decimal=m.Decimal;y.List=m.List;y.Struct=m.Struct;y.Union=m.Union;y.DenseUnion=m.DenseUnion;y.SparseUnion=m.SparseUnion;y.Dictionary=m.Dictionary;y.Interval=m.Interval;y.IntervalDayTime=m.IntervalDayTime;y.IntervalYearMonth=m.IntervalYearMonth;y.FixedSizeList=m.FixedSizeList;y.Map_=m.Map_;y.Table=m.Table;y.Column=m.Column;y.Schema=m.Schema;y.Field=m.Field;y.Visitor=m.Visitor;y.Vector=m.Vector;y.BaseVector=m.BaseVector;y.BinaryVector=m.BinaryVector;y.BoolVector=m.BoolVector;y.Chunked=m.Chunked;y.DateVector=m.DateVector;y.DateDayVector=m.DateDayVector;y.DateMillisecondVector=m.DateMillisecondVector;y.DecimalVector=m.DecimalVector;y.DictionaryVector=m.DictionaryVector;y.FixedSizeBinaryVector=m.FixedSizeBinaryVector;y.FixedSizeListVector=m.FixedSizeListVector;y.FloatVector=m.FloatVector;y.Float16Vector=m.Float16Vector;y.Float32Vector=m.Float32Vector;y.Float64Vector=m.Float64Vector;y.IntervalVector=m.IntervalVector;y.IntervalDayTimeVector=m.IntervalDayTimeVector;y.IntervalYearMonthVector=m.IntervalYearMonthVector;y.IntVector=m.IntVector;y.Int8Vector=m.Int8Vector;y.Int16Vector=m.Int16Vector;y.Int32Vector=m.Int32Vector;y.Int64Vector=m.Int64Vector;y.Uint8Vector=m.Uint8Vector;y.Uint16Vector=m.Uint16Vector;y.Uint32Vector=m.Uint32Vector;y.Uint64Vector=m.Uint64Vector;y.ListVector=m.ListVector;y.MapVector=m.MapVector;y.NullVector=m.NullVector;y.StructVector=m.StructVector;y.TimestampVector=m.TimestampVector;y.TimestampSecondVector=m.TimestampSecondVector;y.TimestampMillisecondVector=m.TimestampMillisecondVector;y.TimestampMicrosecondVector=m.TimestampMicrosecondVector;y.TimestampNanosecondVector=m.TimestampNanosecondVector;y.TimeVector=m.TimeVector;y.TimeSecondVector=m.TimeSecondVector;y.TimeMillisecondVector=m.TimeMillisecondVector;y.TimeMicrosecondVector=m.TimeMicrosecondVector;y.TimeNanosecondVector=m.TimeNanosecondVector;y.UnionVector=m.UnionVector;y.DenseUnionVector=m.DenseUnionVector;y.SparseUnionVector=m.SparseUnionVector;y.Utf8Vector=m.Utf8Vector;y.ByteStream=m.ByteStream;y.AsyncByteStream=m.AsyncByteStream;y.AsyncByteQueue=m.AsyncByteQueue;y.RecordBatchReader=m.RecordBatchReader;y.RecordBatchFileReader=m.RecordBatchFileReader;y.RecordBatchStreamReader=m.RecordBatchStreamReader;y.AsyncRecordBatchFileReader=m.AsyncRecordBatchFileReader;y.AsyncRecordBatchStreamReader=m.AsyncRecordBatchStreamReader;y.RecordBatchWriter=m.RecordBatchWriter;y.RecordBatchFileWriter=m.RecordBatchFileWriter;y.RecordBatchStreamWriter=m.RecordBatchStreamWriter;y.RecordBatchJSONWriter=m.RecordBatchJSONWriter;y.MessageReader=m.MessageReader;y.AsyncMessageReader=m.AsyncMessageReader;y.JSONMessageReader=m.JSONMessageReader;y.Message=m.Message;y.RecordBatch=m.RecordBatch;y.DataFrame=m.DataFrame;y.FilteredDataFrame=m.FilteredDataFrame;y.CountByResult=m.CountByResult;y.predicate=m.predicate;y.util=m.util;y.Builder=m.Builder;y.BinaryBuilder=m.BinaryBuilder;y.BoolBuilder=m.BoolBuilder;y.DateBuilder=m.DateBuilder;y.DateDayBuilder=m.DateDayBuilder;y.DateMillisecondBuilder=m.DateMillisecondBuilder;y.DecimalBuilder=m.DecimalBuilder;y.DictionaryBuilder=m.DictionaryBuilder;y.FixedSizeBinaryBuilder=m.FixedSizeBinaryBuilder;y.FixedSizeListBuilder=m.FixedSizeListBuilder;y.FloatBuilder=m.FloatBuilder;y.Float16Builder=m.Float16Builder;y.Float32Builder=m.Float32Builder;y.Float64Builder=m.Float64Builder;y.IntervalBuilder=m.IntervalBuilder;y.IntervalDayTimeBuilder=m.IntervalDayTimeBuilder;y.IntervalYearMonthBuilder=m.IntervalYearMonthBuilder;y.IntBuilder=m.IntBuilder;y.Int8Builder=m.Int8Builder;y.Int16Builder=m.Int16Builder;y.Int32Builder=m.Int32Builder;y.Int64Builder=m.Int64Builder;y.Uint8Builder=m.Uint8Builder;y.Uint16Builder=m.Uint16Builder;y.Uint32Builder=m.Uint32Builder;y.Uint64Builder=m.Uint64Builder;y.ListBuilder=m.ListBuilder;y.MapBuilder=m.MapBuilder;y.NullBuilder=m.NullBuilder;y.StructBuilder=m.StructBuilder;y.TimestampBuilder=m.TimestampBuilder;y.TimestampSecondBuilder=m.TimestampSecondBuilder;y.TimestampMillisecondBuilder=m.TimestampMillisecondBuilder;y.TimestampMicrosecondBuilder=m.TimestampMicrosecondBuilder;y.TimestampNanosecondBuilder=m.TimestampNanosecondBuilder;y.TimeBuilder=m.TimeBuilder;y.TimeSecondBuilder=m.TimeSecondBuilder;y.TimeMillisecondBuilder=m.TimeMillisecondBuilder;y.TimeMicrosecondBuilder=m.TimeMicrosecondBuilder;y.TimeNanosecondBuilder=m.TimeNanosecondBuilder;y.UnionBuilder=m.UnionBuilder;y.DenseUnionBuilder=m.DenseUnionBuilder;y.SparseUnionBuilder=m.SparseUnionBuilder;y.Utf8Builder=m.Utf8Builder});var SI=b(tf=>{"use strict";var FN=Zs(),ON=Symbol.for("react.element"),MN=Symbol.for("react.fragment"),xN=Object.prototype.hasOwnProperty,EN=FN.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,UN={key:!0,ref:!0,__self:!0,__source:!0};function bI(t,e,r){var n,i={},s=null,a=null;r!==void 0&&(s=""+r),e.key!==void 0&&(s=""+e.key),e.ref!==void 0&&(a=e.ref);for(n in e)xN.call(e,n)&&!UN.hasOwnProperty(n)&&(i[n]=e[n]);if(t&&t.defaultProps)for(n in e=t.defaultProps,e)i[n]===void 0&&(i[n]=e[n]);return{$$typeof:ON,type:t,key:s,ref:a,props:i,_owner:EN.current}}tf.Fragment=MN;tf.jsx=bI;tf.jsxs=bI});var ml=b((i3,TI)=>{"use strict";TI.exports=SI()});var z_=Ht(Zs()),II=Ht(Bb());var wI=Ht(Nb()),ki=Ht(Zb());var vI=Ht(lS());var Ni=Ht(gI());var ef=function(){function t(e,r,n,i){var s=this;this.getCell=function(a,l){var c=a<s.headerRows&&l<s.headerColumns,o=a>=s.headerRows&&l<s.headerColumns,u=a<s.headerRows&&l>=s.headerColumns;if(c){var d=["blank"];return l>0&&d.push("level"+a),{type:"blank",classNames:d.join(" "),content:""}}else if(u){var v=l-s.headerColumns,d=["col_heading","level"+a,"col"+v];return{type:"columns",classNames:d.join(" "),content:s.getContent(s.columnsTable,v,a)}}else if(o){var T=a-s.headerRows,d=["row_heading","level"+l,"row"+T];return{type:"index",id:"T_"+s.uuid+"level"+l+"_row"+T,classNames:d.join(" "),content:s.getContent(s.indexTable,T,l)}}else{var T=a-s.headerRows,v=l-s.headerColumns,d=["data","row"+T,"col"+v],I=s.styler?s.getContent(s.styler.displayValuesTable,T,v):s.getContent(s.dataTable,T,v);return{type:"data",id:"T_"+s.uuid+"row"+T+"_col"+v,classNames:d.join(" "),content:I}}},this.getContent=function(a,l,c){var o=a.getColumnAt(c);if(o===null)return"";var u=s.getColumnTypeId(a,c);switch(u){case Ni.Type.Timestamp:return s.nanosToDate(o.get(l));default:return o.get(l)}},this.dataTable=Ni.Table.from(e),this.indexTable=Ni.Table.from(r),this.columnsTable=Ni.Table.from(n),this.styler=i?{caption:i.caption,displayValuesTable:Ni.Table.from(i.displayValues),styles:i.styles,uuid:i.uuid}:void 0}return Object.defineProperty(t.prototype,"rows",{get:function(){return this.indexTable.length+this.columnsTable.numCols},enumerable:!0,configurable:!0}),Object.defineProperty(t.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.length},enumerable:!0,configurable:!0}),Object.defineProperty(t.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!0,configurable:!0}),Object.defineProperty(t.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!0,configurable:!0}),Object.defineProperty(t.prototype,"dataRows",{get:function(){return this.dataTable.length},enumerable:!0,configurable:!0}),Object.defineProperty(t.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!0,configurable:!0}),Object.defineProperty(t.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!0,configurable:!0}),Object.defineProperty(t.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!0,configurable:!0}),Object.defineProperty(t.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!0,configurable:!0}),Object.defineProperty(t.prototype,"table",{get:function(){return this.dataTable},enumerable:!0,configurable:!0}),Object.defineProperty(t.prototype,"index",{get:function(){return this.indexTable},enumerable:!0,configurable:!0}),Object.defineProperty(t.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!0,configurable:!0}),t.prototype.serialize=function(){return{data:this.dataTable.serialize(),index:this.indexTable.serialize(),columns:this.columnsTable.serialize()}},t.prototype.getColumnTypeId=function(e,r){return e.schema.fields[r].type.typeId},t.prototype.nanosToDate=function(e){return new Date(e/1e6)},t}();var pl=function(){return pl=Object.assign||function(t){for(var e,r=1,n=arguments.length;r<n;r++){e=arguments[r];for(var i in e)Object.prototype.hasOwnProperty.call(e,i)&&(t[i]=e[i])}return t},pl.apply(this,arguments)},yl;(function(t){t.COMPONENT_READY="streamlit:componentReady",t.SET_COMPONENT_VALUE="streamlit:setComponentValue",t.SET_FRAME_HEIGHT="streamlit:setFrameHeight"})(yl||(yl={}));var Vt=function(){function t(){}return t.API_VERSION=1,t.RENDER_EVENT="streamlit:render",t.events=new vI.EventTarget,t.registeredMessageListener=!1,t.setComponentReady=function(){t.registeredMessageListener||(window.addEventListener("message",t.onMessageEvent),t.registeredMessageListener=!0),t.sendBackMsg(yl.COMPONENT_READY,{apiVersion:t.API_VERSION})},t.setFrameHeight=function(e){e===void 0&&(e=document.body.scrollHeight),e!==t.lastFrameHeight&&(t.lastFrameHeight=e,t.sendBackMsg(yl.SET_FRAME_HEIGHT,{height:e}))},t.setComponentValue=function(e){var r;e instanceof ef?(r="dataframe",e=e.serialize()):DN(e)?(r="bytes",e=new Uint8Array(e.buffer)):e instanceof ArrayBuffer?(r="bytes",e=new Uint8Array(e)):r="json",t.sendBackMsg(yl.SET_COMPONENT_VALUE,{value:e,dataType:r})},t.onMessageEvent=function(e){var r=e.data.type;switch(r){case t.RENDER_EVENT:t.onRenderMessage(e.data);break}},t.onRenderMessage=function(e){var r=e.args;r==null&&(console.error("Got null args in onRenderMessage. This should never happen"),r={});var n=e.dfs&&e.dfs.length>0?t.argsDataframeToObject(e.dfs):{};r=pl(pl({},r),n);var i=!!e.disabled,s=e.theme;s&&IN(s);var a={disabled:i,args:r,theme:s},l=new CustomEvent(t.RENDER_EVENT,{detail:a});t.events.dispatchEvent(l)},t.argsDataframeToObject=function(e){var r=e.map(function(n){var i=n.key,s=n.value;return[i,t.toArrowTable(s)]});return Object.fromEntries(r)},t.toArrowTable=function(e){var r=e.data,n=r.data,i=r.index,s=r.columns,a=r.styler;return new ef(n,i,s,a)},t.sendBackMsg=function(e,r){window.parent.postMessage(pl({isStreamlitMessage:!0,type:e},r),"*")},t}();var IN=function(t){var e=document.createElement("style");document.head.appendChild(e),e.innerHTML=`
+    }`;if(e.length!==r.length)t=`if (x !== x) return false;
+${t}`;return Function("x",`${t}
+return true;`)}function qS(e){if(typeof e!=="bigint")return Ni(e);else if(zn)return`${Ni(e)}n`;return`"${Ni(e)}"`}var Zh=(e,t)=>(e*t+63&-64||64)/t,GS=(e,t=0)=>e.length>=t?e.subarray(0,t):Ns(new e.constructor(t),e,0);class $n{constructor(e,t=1){this.buffer=e,this.stride=t,this.BYTES_PER_ELEMENT=e.BYTES_PER_ELEMENT,this.ArrayType=e.constructor,this._resize(this.length=e.length/t|0)}get byteLength(){return this.length*this.stride*this.BYTES_PER_ELEMENT|0}get reservedLength(){return this.buffer.length/this.stride}get reservedByteLength(){return this.buffer.byteLength}set(e,t){return this}append(e){return this.set(this.length,e)}reserve(e){if(e>0){this.length+=e;let t=this.stride,r=this.length*t,n=this.buffer.length;if(r>=n)this._resize(n===0?Zh(r*1,this.BYTES_PER_ELEMENT):Zh(r*2,this.BYTES_PER_ELEMENT))}return this}flush(e=this.length){e=Zh(e*this.stride,this.BYTES_PER_ELEMENT);let t=GS(this.buffer,e);return this.clear(),t}clear(){return this.length=0,this._resize(0),this}_resize(e){return this.buffer=Ns(new this.ArrayType(e),this.buffer)}}$n.prototype.offset=0;class Wn extends $n{last(){return this.get(this.length-1)}get(e){return this.buffer[e]}set(e,t){return this.reserve(e-this.length+1),this.buffer[e*this.stride]=t,this}}class gl extends Wn{constructor(e=new Uint8Array(0)){super(e,0.125);this.numValid=0}get numInvalid(){return this.length-this.numValid}get(e){return this.buffer[e>>3]>>e%8&1}set(e,t){let{buffer:r}=this.reserve(e-this.length+1),n=e>>3,i=e%8,s=r[n]>>i&1;return t?s===0&&(r[n]|=1<<i,++this.numValid):s===1&&(r[n]&=~(1<<i),--this.numValid),this}clear(){return this.numValid=0,super.clear()}}class vl extends Wn{constructor(e=new Int32Array(1)){super(e,1)}append(e){return this.set(this.length-1,e)}set(e,t){let r=this.length-1,n=this.reserve(e-r+1).buffer;if(r<e++)n.fill(n[r],r,e);return n[e]=n[e-1]+t,this}flush(e=this.length-1){if(e>this.length)this.set(e-1,0);return super.flush(e+1)}}class xc extends $n{get ArrayType64(){return this._ArrayType64||(this._ArrayType64=this.buffer instanceof Int32Array?or:Gr)}set(e,t){switch(this.reserve(e-this.length+1),typeof t){case"bigint":this.buffer64[e]=t;break;case"number":this.buffer[e*this.stride]=t;break;default:this.buffer.set(t,e*this.stride)}return this}_resize(e){let t=super._resize(e),r=t.byteLength/(this.BYTES_PER_ELEMENT*this.stride);if(zn)this.buffer64=new this.ArrayType64(t.buffer,t.byteOffset,r);return t}}class q{constructor({type:e,nullValues:t}){if(this.length=0,this.finished=!1,this.type=e,this.children=[],this.nullValues=t,this.stride=Sc(e),this._nulls=new gl,t&&t.length>0)this._isValid=Qv(t)}static new(e){}static throughNode(e){throw Error('"throughNode" not available in this environment')}static throughDOM(e){throw Error('"throughDOM" not available in this environment')}static throughIterable(e){return ex(e)}static throughAsyncIterable(e){return tx(e)}toVector(){return F.new(this.flush())}get ArrayType(){return this.type.ArrayType}get nullCount(){return this._nulls.numInvalid}get numChildren(){return this.children.length}get byteLength(){let e=0;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),this._typeIds&&(e+=this._typeIds.byteLength),this.children.reduce((t,r)=>t+r.byteLength,e)}get reservedLength(){return this._nulls.reservedLength}get reservedByteLength(){let e=0;return this._offsets&&(e+=this._offsets.reservedByteLength),this._values&&(e+=this._values.reservedByteLength),this._nulls&&(e+=this._nulls.reservedByteLength),this._typeIds&&(e+=this._typeIds.reservedByteLength),this.children.reduce((t,r)=>t+r.reservedByteLength,e)}get valueOffsets(){return this._offsets?this._offsets.buffer:null}get values(){return this._values?this._values.buffer:null}get nullBitmap(){return this._nulls?this._nulls.buffer:null}get typeIds(){return this._typeIds?this._typeIds.buffer:null}append(e){return this.set(this.length,e)}isValid(e){return this._isValid(e)}set(e,t){if(this.setValid(e,this.isValid(t)))this.setValue(e,t);return this}setValue(e,t){this._setValue(this,e,t)}setValid(e,t){return this.length=this._nulls.set(e,+t).length,t}addChild(e,t=`${this.numChildren}`){throw Error(`Cannot append children to non-nested type "${this.type}"`)}getChildAt(e){return this.children[e]||null}flush(){let e=[],t=this._values,r=this._offsets,n=this._typeIds,{length:i,nullCount:s}=this;if(n)e[D.TYPE]=n.flush(i),r&&(e[D.OFFSET]=r.flush(i));else if(r)t&&(e[D.DATA]=t.flush(r.last())),e[D.OFFSET]=r.flush(i);else if(t)e[D.DATA]=t.flush(i);s>0&&(e[D.VALIDITY]=this._nulls.flush(i));let a=S.new(this.type,0,i,s,e,this.children.map((l)=>l.flush()));return this.clear(),a}finish(){return this.finished=!0,this.children.forEach((e)=>e.finish()),this}clear(){return this.length=0,this._offsets&&this._offsets.clear(),this._values&&this._values.clear(),this._nulls&&this._nulls.clear(),this._typeIds&&this._typeIds.clear(),this.children.forEach((e)=>e.clear()),this}}q.prototype.length=1;q.prototype.stride=1;q.prototype.children=null;q.prototype.finished=!1;q.prototype.nullValues=null;q.prototype._isValid=()=>!0;class We extends q{constructor(e){super(e);this._values=new Wn(new this.ArrayType(0),this.stride)}setValue(e,t){let r=this._values;return r.reserve(e-r.length+1),super.setValue(e,t)}}class an extends q{constructor(e){super(e);this._pendingLength=0,this._offsets=new vl}setValue(e,t){let r=this._pending||(this._pending=new Map),n=r.get(e);n&&(this._pendingLength-=n.length),this._pendingLength+=t.length,r.set(e,t)}setValid(e,t){if(!super.setValid(e,t))return(this._pending||(this._pending=new Map)).set(e,void 0),!1;return!0}clear(){return this._pendingLength=0,this._pending=void 0,super.clear()}flush(){return this._flush(),super.flush()}finish(){return this._flush(),super.finish()}_flush(){let e=this._pending,t=this._pendingLength;if(this._pendingLength=0,this._pending=void 0,e&&e.size>0)this._flushPending(e,t);return this}}function ex(e){let{["queueingStrategy"]:t="count"}=e,{["highWaterMark"]:r=t!=="bytes"?1000:16384}=e,n=t!=="bytes"?"length":"byteLength";return function*(i){let s=0,a=q.new(e);for(let l of i)if(a.append(l)[n]>=r)++s&&(yield a.toVector());if(a.finish().length>0||s===0)yield a.toVector()}}function tx(e){let{["queueingStrategy"]:t="count"}=e,{["highWaterMark"]:r=t!=="bytes"?1000:16384}=e,n=t!=="bytes"?"length":"byteLength";return async function*(i){let s=0,a=q.new(e);for await(let l of i)if(a.append(l)[n]>=r)++s&&(yield a.toVector());if(a.finish().length>0||s===0)yield a.toVector()}}class Us extends q{constructor(e){super(e);this._values=new gl}setValue(e,t){this._values.set(e,+t)}}class Cs extends q{setValue(e,t){}setValid(e,t){return this.length=Math.max(e+1,this.length),t}}class Hn extends We{}class Rs extends Hn{}class Ps extends Hn{}class zs extends We{}class Vs extends q{constructor({type:e,nullValues:t,dictionaryHashFunction:r}){super({type:new ct(e.dictionary,e.indices,e.id,e.isOrdered)});if(this._nulls=null,this._dictionaryOffset=0,this._keysToIndices=Object.create(null),this.indices=q.new({type:this.type.indices,nullValues:t}),this.dictionary=q.new({type:this.type.dictionary,nullValues:null}),typeof r==="function")this.valueToKey=r}get values(){return this.indices.values}get nullCount(){return this.indices.nullCount}get nullBitmap(){return this.indices.nullBitmap}get byteLength(){return this.indices.byteLength+this.dictionary.byteLength}get reservedLength(){return this.indices.reservedLength+this.dictionary.reservedLength}get reservedByteLength(){return this.indices.reservedByteLength+this.dictionary.reservedByteLength}isValid(e){return this.indices.isValid(e)}setValid(e,t){let r=this.indices;return t=r.setValid(e,t),this.length=r.length,t}setValue(e,t){let r=this._keysToIndices,n=this.valueToKey(t),i=r[n];if(i===void 0)r[n]=i=this._dictionaryOffset+this.dictionary.append(t).length-1;return this.indices.setValue(e,i)}flush(){let e=this.type,t=this._dictionary,r=this.dictionary.toVector(),n=this.indices.flush().clone(e);return n.dictionary=t?t.concat(r):r,this.finished||(this._dictionaryOffset+=r.length),this._dictionary=n.dictionary,this.clear(),n}finish(){return this.indices.finish(),this.dictionary.finish(),this._dictionaryOffset=0,this._keysToIndices=Object.create(null),super.finish()}clear(){return this.indices.clear(),this.dictionary.clear(),super.clear()}valueToKey(e){return typeof e==="string"?e:`${e}`}}class js extends We{}var qh={};ts(qh,{float64ToUint16:()=>_l,uint16ToFloat64:()=>Xh});var Jv=new Float64Array(1),$s=new Uint32Array(Jv.buffer);function Xh(e){let t=(e&31744)>>10,r=(e&1023)/1024,n=(-1)**((e&32768)>>15);switch(t){case 31:return n*(r?NaN:1/0);case 0:return n*(r?0.00006103515625*r:0)}return n*2**(t-15)*(1+r)}function _l(e){if(e!==e)return 32256;Jv[0]=e;let t=($s[1]&2147483648)>>16&65535,r=$s[1]&2146435072,n=0;if(r>=1089470464)if($s[0]>0)r=31744;else r=(r&2080374784)>>16,n=($s[1]&1048575)>>10;else if(r<=1056964608)n=1048576+($s[1]&1048575),n=1048576+(n<<(r>>20)-998)>>21,r=0;else r=r-1056964608>>10,n=($s[1]&1048575)+512>>10;return t|r|n&65535}class ln extends We{}class Ws extends ln{setValue(e,t){this._values.set(e,_l(t))}}class Hs extends ln{setValue(e,t){this._values.set(e,t)}}class Ys extends ln{setValue(e,t){this._values.set(e,t)}}var ep={};ts(ep,{BN:()=>un,bignumToBigInt:()=>Js,bignumToString:()=>Yn,isArrowBigNumSymbol:()=>Zv});var Zv=Symbol.for("isArrowBigNum");function mr(e,...t){if(t.length===0)return Object.setPrototypeOf(Y(this.TypedArray,e),this.constructor.prototype);return Object.setPrototypeOf(new this.TypedArray(e,...t),this.constructor.prototype)}mr.prototype[Zv]=!0;mr.prototype.toJSON=function(){return`"${Yn(this)}"`};mr.prototype.valueOf=function(){return Xv(this)};mr.prototype.toString=function(){return Yn(this)};mr.prototype[Symbol.toPrimitive]=function(e="default"){switch(e){case"number":return Xv(this);case"string":return Yn(this);case"default":return Js(this)}return Yn(this)};function Ks(...e){return mr.apply(this,e)}function Qs(...e){return mr.apply(this,e)}function wl(...e){return mr.apply(this,e)}Object.setPrototypeOf(Ks.prototype,Object.create(Int32Array.prototype));Object.setPrototypeOf(Qs.prototype,Object.create(Uint32Array.prototype));Object.setPrototypeOf(wl.prototype,Object.create(Uint32Array.prototype));Object.assign(Ks.prototype,mr.prototype,{constructor:Ks,signed:!0,TypedArray:Int32Array,BigIntArray:or});Object.assign(Qs.prototype,mr.prototype,{constructor:Qs,signed:!1,TypedArray:Uint32Array,BigIntArray:Gr});Object.assign(wl.prototype,mr.prototype,{constructor:wl,signed:!0,TypedArray:Uint32Array,BigIntArray:Gr});function Xv(e){let{buffer:t,byteOffset:r,length:n,signed:i}=e,s=new Int32Array(t,r,n),a=0,l=0,o=s.length,u,c;while(l<o)c=s[l++],u=s[l++],i||(u=u>>>0),a+=(c>>>0)+u*l**32;return a}var Yn,Js;if(!zn)Yn=Gh,Js=Yn;else Js=(e)=>e.byteLength===8?new e.BigIntArray(e.buffer,e.byteOffset,1)[0]:Gh(e),Yn=(e)=>e.byteLength===8?`${new e.BigIntArray(e.buffer,e.byteOffset,1)[0]}`:Gh(e);function Gh(e){let t="",r=new Uint32Array(2),n=new Uint16Array(e.buffer,e.byteOffset,e.byteLength/2),i=new Uint32Array((n=new Uint16Array(n).reverse()).buffer),s=-1,a=n.length-1;do{for(r[0]=n[s=0];s<a;)n[s++]=r[1]=r[0]/10,r[0]=(r[0]-r[1]*10<<16)+n[s];n[s]=r[1]=r[0]/10,r[0]=r[0]-r[1]*10,t=`${r[0]}${t}`}while(i[0]||i[1]||i[2]||i[3]);return t?t:"0"}class un{constructor(e,t){return un.new(e,t)}static new(e,t){switch(t){case!0:return new Ks(e);case!1:return new Qs(e)}switch(e.constructor){case Int8Array:case Int16Array:case Int32Array:case or:return new Ks(e)}if(e.byteLength===16)return new wl(e);return new Qs(e)}static signed(e){return new Ks(e)}static unsigned(e){return new Qs(e)}static decimal(e){return new wl(e)}}class _t extends We{setValue(e,t){this._values.set(e,t)}}class Zs extends _t{}class Xs extends _t{}class qs extends _t{}class Gs extends _t{constructor(e){if(e.nullValues)e.nullValues=e.nullValues.map(Bc);super(e);this._values=new xc(new Int32Array(0),2)}get values64(){return this._values.buffer64}isValid(e){return super.isValid(Bc(e))}}class eo extends _t{}class to extends _t{}class ro extends _t{}class no extends _t{constructor(e){if(e.nullValues)e.nullValues=e.nullValues.map(Bc);super(e);this._values=new xc(new Uint32Array(0),2)}get values64(){return this._values.buffer64}isValid(e){return super.isValid(Bc(e))}}var Bc=((e)=>(t)=>{if(ArrayBuffer.isView(t))e.buffer=t.buffer,e.byteOffset=t.byteOffset,e.byteLength=t.byteLength,t=Js(e),e.buffer=null;return t})({BigIntArray:or});class Er extends We{}class io extends Er{}class so extends Er{}class oo extends Er{}class ao extends Er{}class Or extends We{}class lo extends Or{}class uo extends Or{}class co extends Or{}class fo extends Or{}class Kn extends We{}class ho extends Kn{}class po extends Kn{}class Qn extends an{constructor(e){super(e);this._values=new $n(new Uint8Array(0))}get byteLength(){let e=this._pendingLength+this.length*4;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),e}setValue(e,t){return super.setValue(e,L(t))}_flushPending(e,t){let r=this._offsets,n=this._values.reserve(t).buffer,i=0,s=0,a=0,l;for([i,l]of e)if(l===void 0)r.set(i,0);else s=l.length,n.set(l,a),r.set(i,s),a+=s}}class cn extends an{constructor(e){super(e);this._values=new $n(new Uint8Array(0))}get byteLength(){let e=this._pendingLength+this.length*4;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),e}setValue(e,t){return super.setValue(e,Pn(t))}_flushPending(e,t){}}cn.prototype._flushPending=Qn.prototype._flushPending;class bl{get length(){return this._values.length}get(e){return this._values[e]}clear(){return this._values=null,this}bind(e){if(e instanceof F)return e;return this._values=e,this}}var rp={};ts(rp,{clampIndex:()=>nx,clampRange:()=>Sl,createElementComparator:()=>Jn});var He=Symbol.for("parent"),mo=Symbol.for("rowIndex"),kt=Symbol.for("keyToIdx"),Ot=Symbol.for("idxToVal"),tp=Symbol.for("nodejs.util.inspect.custom");class kr{constructor(e,t){this[He]=e,this.size=t}entries(){return this[Symbol.iterator]()}has(e){return this.get(e)!==void 0}get(e){let t=void 0;if(e!==null&&e!==void 0){let r=this[kt]||(this[kt]=new Map),n=r.get(e);if(n!==void 0){let i=this[Ot]||(this[Ot]=Array(this.size));(t=i[n])!==void 0||(i[n]=t=this.getValue(n))}else if((n=this.getIndex(e))>-1){r.set(e,n);let i=this[Ot]||(this[Ot]=Array(this.size));(t=i[n])!==void 0||(i[n]=t=this.getValue(n))}}return t}set(e,t){if(e!==null&&e!==void 0){let r=this[kt]||(this[kt]=new Map),n=r.get(e);if(n===void 0)r.set(e,n=this.getIndex(e));if(n>-1){let i=this[Ot]||(this[Ot]=Array(this.size));i[n]=this.setValue(n,t)}}return this}clear(){throw Error(`Clearing ${this[Symbol.toStringTag]} not supported.`)}delete(e){throw Error(`Deleting ${this[Symbol.toStringTag]} values not supported.`)}*[Symbol.iterator](){let e=this.keys(),t=this.values(),r=this[kt]||(this[kt]=new Map),n=this[Ot]||(this[Ot]=Array(this.size));for(let i,s,a=0,l,o;!((l=e.next()).done||(o=t.next()).done);++a)i=l.value,s=o.value,n[a]=s,r.has(i)||r.set(i,a),yield[i,s]}forEach(e,t){let r=this.keys(),n=this.values(),i=t===void 0?e:(l,o,u)=>e.call(t,l,o,u),s=this[kt]||(this[kt]=new Map),a=this[Ot]||(this[Ot]=Array(this.size));for(let l,o,u=0,c,p;!((c=r.next()).done||(p=n.next()).done);++u)l=c.value,o=p.value,a[u]=o,s.has(l)||s.set(l,u),i(o,l,this)}toArray(){return[...this.values()]}toJSON(){let e={};return this.forEach((t,r)=>e[r]=t),e}inspect(){return this.toString()}[tp](){return this.toString()}toString(){let e=[];return this.forEach((t,r)=>{r=Ni(r),t=Ni(t),e.push(`${r}: ${t}`)}),`{ ${e.join(", ")} }`}}kr[Symbol.toStringTag]=((e)=>(Object.defineProperties(e,{size:{writable:!0,enumerable:!1,configurable:!1,value:0},[He]:{writable:!0,enumerable:!1,configurable:!1,value:null},[mo]:{writable:!0,enumerable:!1,configurable:!1,value:-1}}),e[Symbol.toStringTag]="Row"))(kr.prototype);class yo extends kr{constructor(e){super(e,e.length);return rx(this)}keys(){return this[He].getChildAt(0)[Symbol.iterator]()}values(){return this[He].getChildAt(1)[Symbol.iterator]()}getKey(e){return this[He].getChildAt(0).get(e)}getIndex(e){return this[He].getChildAt(0).indexOf(e)}getValue(e){return this[He].getChildAt(1).get(e)}setValue(e,t){this[He].getChildAt(1).set(e,t)}}class go extends kr{constructor(e){super(e,e.type.children.length);return qv(this)}*keys(){for(let e of this[He].type.children)yield e.name}*values(){for(let e of this[He].type.children)yield this[e.name]}getKey(e){return this[He].type.children[e].name}getIndex(e){return this[He].type.children.findIndex((t)=>t.name===e)}getValue(e){return this[He].getChildAt(e).get(this[mo])}setValue(e,t){return this[He].getChildAt(e).set(this[mo],t)}}Object.setPrototypeOf(kr.prototype,Map.prototype);var qv=(()=>{let e={enumerable:!0,configurable:!1,get:null,set:null};return(t)=>{let r=-1,n=t[kt]||(t[kt]=new Map),i=(a)=>function(){return this.get(a)},s=(a)=>function(l){return this.set(a,l)};for(let a of t.keys())n.set(a,++r),e.get=i(a),e.set=s(a),t.hasOwnProperty(a)||(e.enumerable=!0,Object.defineProperty(t,a,e)),t.hasOwnProperty(r)||(e.enumerable=!1,Object.defineProperty(t,r,e));return e.get=e.set=null,t}})(),rx=(()=>{if(typeof Proxy>"u")return qv;let e=kr.prototype.has,t=kr.prototype.get,r=kr.prototype.set,n=kr.prototype.getKey,i={isExtensible(){return!1},deleteProperty(){return!1},preventExtensions(){return!0},ownKeys(s){return[...s.keys()].map((a)=>`${a}`)},has(s,a){switch(a){case"getKey":case"getIndex":case"getValue":case"setValue":case"toArray":case"toJSON":case"inspect":case"constructor":case"isPrototypeOf":case"propertyIsEnumerable":case"toString":case"toLocaleString":case"valueOf":case"size":case"has":case"get":case"set":case"clear":case"delete":case"keys":case"values":case"entries":case"forEach":case"__proto__":case"__defineGetter__":case"__defineSetter__":case"hasOwnProperty":case"__lookupGetter__":case"__lookupSetter__":case Symbol.iterator:case Symbol.toStringTag:case He:case mo:case Ot:case kt:case tp:return!0}if(typeof a==="number"&&!s.has(a))a=s.getKey(a);return s.has(a)},get(s,a,l){switch(a){case"getKey":case"getIndex":case"getValue":case"setValue":case"toArray":case"toJSON":case"inspect":case"constructor":case"isPrototypeOf":case"propertyIsEnumerable":case"toString":case"toLocaleString":case"valueOf":case"size":case"has":case"get":case"set":case"clear":case"delete":case"keys":case"values":case"entries":case"forEach":case"__proto__":case"__defineGetter__":case"__defineSetter__":case"hasOwnProperty":case"__lookupGetter__":case"__lookupSetter__":case Symbol.iterator:case Symbol.toStringTag:case He:case mo:case Ot:case kt:case tp:return Reflect.get(s,a,l)}if(typeof a==="number"&&!e.call(l,a))a=n.call(l,a);return t.call(l,a)},set(s,a,l,o){switch(a){case He:case mo:case Ot:case kt:return Reflect.set(s,a,l,o);case"getKey":case"getIndex":case"getValue":case"setValue":case"toArray":case"toJSON":case"inspect":case"constructor":case"isPrototypeOf":case"propertyIsEnumerable":case"toString":case"toLocaleString":case"valueOf":case"size":case"has":case"get":case"set":case"clear":case"delete":case"keys":case"values":case"entries":case"forEach":case"__proto__":case"__defineGetter__":case"__defineSetter__":case"hasOwnProperty":case"__lookupGetter__":case"__lookupSetter__":case Symbol.iterator:case Symbol.toStringTag:return!1}if(typeof a==="number"&&!e.call(o,a))a=n.call(o,a);return e.call(o,a)?!!r.call(o,a,l):!1}};return(s)=>new Proxy(s,i)})();function nx(e,t,r){let n=e.length,i=t>-1?t:n+t%n;return r?r(e,i):i}var Gv;function Sl(e,t,r,n){let{length:i=0}=e,s=typeof t!=="number"?0:t,a=typeof r!=="number"?i:r;return s<0&&(s=(s%i+i)%i),a<0&&(a=(a%i+i)%i),a<s&&(Gv=s,s=a,a=Gv),a>i&&(a=i),n?n(e,s,a):[s,a]}var ix=zn?zv(0):0,e0=(e)=>e!==e;function Jn(e){let t=typeof e;if(t!=="object"||e===null){if(e0(e))return e0;return t!=="bigint"?(r)=>r===e:(r)=>ix+r===e}if(e instanceof Date){let r=e.valueOf();return(n)=>n instanceof Date?n.valueOf()===r:!1}if(ArrayBuffer.isView(e))return(r)=>r?Ph(e,r):!1;if(e instanceof Map)return ox(e);if(Array.isArray(e))return sx(e);if(e instanceof F)return ax(e);return lx(e)}function sx(e){let t=[];for(let r=-1,n=e.length;++r<n;)t[r]=Jn(e[r]);return Ic(t)}function ox(e){let t=-1,r=[];return e.forEach((n)=>r[++t]=Jn(n)),Ic(r)}function ax(e){let t=[];for(let r=-1,n=e.length;++r<n;)t[r]=Jn(e.get(r));return Ic(t)}function lx(e){let t=Object.keys(e);if(t.length===0)return()=>!1;let r=[];for(let n=-1,i=t.length;++n<i;)r[n]=Jn(e[t[n]]);return Ic(r,t)}function Ic(e,t){return(r)=>{if(!r||typeof r!=="object")return!1;switch(r.constructor){case Array:return ux(e,r);case Map:case yo:case go:return t0(e,r,r.keys());case Object:case void 0:return t0(e,r,t||Object.keys(r))}return r instanceof F?cx(e,r):!1}}function ux(e,t){let r=e.length;if(t.length!==r)return!1;for(let n=-1;++n<r;)if(!e[n](t[n]))return!1;return!0}function cx(e,t){let r=e.length;if(t.length!==r)return!1;for(let n=-1;++n<r;)if(!e[n](t.get(n)))return!1;return!0}function t0(e,t,r){let n=r[Symbol.iterator](),i=t instanceof Map?t.keys():Object.keys(t)[Symbol.iterator](),s=t instanceof Map?t.values():Object.values(t)[Symbol.iterator](),a=0,l=e.length,o=s.next(),u=n.next(),c=i.next();for(;a<l&&!u.done&&!c.done&&!o.done;++a,u=n.next(),c=i.next(),o=s.next())if(u.value!==c.value||!e[a](o.value))break;if(a===l&&u.done&&c.done&&o.done)return!0;return n.return&&n.return(),i.return&&i.return(),s.return&&s.return(),!1}class le extends F{constructor(e,t=[],r=fx(t)){super();this._nullCount=-1,this._type=e,this._chunks=t,this._chunkOffsets=r,this._length=r[r.length-1],this._numChildren=(this._type.children||[]).length}static flatten(...e){return r0(F,e)}static concat(...e){let t=le.flatten(...e);return new le(t[0].type,t)}get type(){return this._type}get length(){return this._length}get chunks(){return this._chunks}get typeId(){return this._type.typeId}get VectorName(){return`Chunked<${this._type}>`}get data(){return this._chunks[0]?this._chunks[0].data:null}get ArrayType(){return this._type.ArrayType}get numChildren(){return this._numChildren}get stride(){return this._chunks[0]?this._chunks[0].stride:1}get byteLength(){return this._chunks.reduce((e,t)=>e+t.byteLength,0)}get nullCount(){let e=this._nullCount;if(e<0)this._nullCount=e=this._chunks.reduce((t,{nullCount:r})=>t+r,0);return e}get indices(){if(E.isDictionary(this._type)){if(!this._indices){let e=this._chunks;this._indices=e.length===1?e[0].indices:le.concat(...e.map((t)=>t.indices))}return this._indices}return null}get dictionary(){if(E.isDictionary(this._type))return this._chunks[this._chunks.length-1].data.dictionary;return null}*[Symbol.iterator](){for(let e of this._chunks)yield*e}clone(e=this._chunks){return new le(this._type,e)}concat(...e){return this.clone(le.flatten(this,...e))}slice(e,t){return Sl(this,e,t,this._sliceInternal)}getChildAt(e){if(e<0||e>=this._numChildren)return null;let t=this._children||(this._children=[]),r,n,i;if(r=t[e])return r;if(n=(this._type.children||[])[e]){if(i=this._chunks.map((s)=>s.getChildAt(e)).filter((s)=>s!=null),i.length>0)return t[e]=new le(n.type,i)}return null}search(e,t){let r=e,n=this._chunkOffsets,i=n.length-1;if(r<0)return null;if(r>=n[i])return null;if(i<=1)return t?t(this,0,r):[0,r];let s=0,a=0,l=0;do{if(s+1===i)return t?t(this,s,r-a):[s,r-a];l=s+(i-s)/2|0,r>=n[l]?s=l:i=l}while(r<n[i]&&r>=(a=n[s]));return null}isValid(e){return!!this.search(e,this.isValidInternal)}get(e){return this.search(e,this.getInternal)}set(e,t){this.search(e,({chunks:r},n,i)=>r[n].set(i,t))}indexOf(e,t){if(t&&typeof t==="number")return this.search(t,(r,n,i)=>this.indexOfInternal(r,n,i,e));return this.indexOfInternal(this,0,Math.max(0,t||0),e)}toArray(){let{chunks:e}=this,t=e.length,r=this._type.ArrayType;if(t<=0)return new r(0);if(t<=1)return e[0].toArray();let n=0,i=Array(t);for(let l=-1;++l<t;)n+=(i[l]=e[l].toArray()).length;if(r!==i[0].constructor)r=i[0].constructor;let s=new r(n),a=r===Array?hx:dx;for(let l=-1,o=0;++l<t;)o=a(i[l],s,o);return s}getInternal({_chunks:e},t,r){return e[t].get(r)}isValidInternal({_chunks:e},t,r){return e[t].isValid(r)}indexOfInternal({_chunks:e},t,r,n){let i=t-1,s=e.length,a=r,l=0,o=-1;while(++i<s){if(~(o=e[i].indexOf(n,a)))return l+o;a=0,l+=e[i].length}return-1}_sliceInternal(e,t,r){let n=[],{chunks:i,_chunkOffsets:s}=e;for(let a=-1,l=i.length;++a<l;){let o=i[a],u=o.length,c=s[a];if(c>=r)break;if(t>=c+u)continue;if(c>=t&&c+u<=r){n.push(o);continue}let p=Math.max(0,t-c),y=Math.min(r-c,u);n.push(o.slice(p,y))}return e.clone(n)}}function fx(e){let t=new Uint32Array((e||[]).length+1),r=t[0]=0,n=t.length;for(let i=0;++i<n;)t[i]=r+=e[i-1].length;return t}var dx=(e,t,r)=>(t.set(e,r),r+e.length),hx=(e,t,r)=>{let n=r;for(let i=-1,s=e.length;++i<s;)t[n++]=e[i];return n};class Ye extends le{constructor(e,t=[],r){t=le.flatten(...t);super(e.type,t,r);if(this._field=e,t.length===1&&!(this instanceof np))return new np(e,t[0],this._chunkOffsets)}static new(e,t,...r){let n=le.flatten(Array.isArray(t)?[...t,...r]:t instanceof F?[t,...r]:[F.new(t,...r)]);if(typeof e==="string"){let i=n[0].data.type;e=new U(e,i,!0)}else if(!e.nullable&&n.some(({nullCount:i})=>i>0))e=e.clone({nullable:!0});return new Ye(e,n)}get field(){return this._field}get name(){return this._field.name}get nullable(){return this._field.nullable}get metadata(){return this._field.metadata}clone(e=this._chunks){return new Ye(this._field,e)}getChildAt(e){if(e<0||e>=this.numChildren)return null;let t=this._children||(this._children=[]),r,n,i;if(r=t[e])return r;if(n=(this.type.children||[])[e]){if(i=this._chunks.map((s)=>s.getChildAt(e)).filter((s)=>s!=null),i.length>0)return t[e]=new Ye(n,i)}return null}}class np extends Ye{constructor(e,t,r){super(e,[t],r);this._chunk=t}search(e,t){return t?t(this,0,e):[0,e]}isValid(e){return this._chunk.isValid(e)}get(e){return this._chunk.get(e)}set(e,t){this._chunk.set(e,t)}indexOf(e,t){return this._chunk.indexOf(e,t)}}var Mi=Array.isArray,Tc=(e,t)=>sp(e,t,[],0),n0=(e)=>{let[t,r]=op(e,[[],[]]);return r.map((n,i)=>n instanceof Ye?Ye.new(n.field.clone(t[i]),n):n instanceof F?Ye.new(t[i],n):Ye.new(t[i],[]))},Fc=(e)=>op(e,[[],[]]),r0=(e,t)=>ip(e,t,[],0),i0=(e,t)=>s0(e,t,[],0);function sp(e,t,r,n){let i,s=n,a=-1,l=t.length;while(++a<l)if(Mi(i=t[a]))s=sp(e,i,r,s).length;else if(i instanceof e)r[s++]=i;return r}function ip(e,t,r,n){let i,s=n,a=-1,l=t.length;while(++a<l)if(Mi(i=t[a]))s=ip(e,i,r,s).length;else if(i instanceof le)s=ip(e,i.chunks,r,s).length;else if(i instanceof e)r[s++]=i;return r}function s0(e,t,r,n){let i,s=n,a=-1,l=t.length;while(++a<l)if(Mi(i=t[a]))s=s0(e,i,r,s).length;else if(i instanceof e)s=sp(F,i.schema.fields.map((o,u)=>i.getChildAt(u)),r,s).length;else if(i instanceof F)r[s++]=i;return r}var px=(e,[t,r],n)=>(e[0][n]=t,e[1][n]=r,e);function op(e,t){let r,n;switch(n=e.length){case 0:return t;case 1:if(r=t[0],!e[0])return t;if(Mi(e[0]))return op(e[0],t);if(!(e[0]instanceof S||e[0]instanceof F||e[0]instanceof E))[r,e]=Object.entries(e[0]).reduce(px,t);break;default:!Mi(r=e[n-1])?(e=Mi(e[0])?e[0]:e,r=[]):e=Mi(e[0])?e[0]:e.slice(0,n-1)}let i=-1,s=-1,a=-1,l=e.length,o,u,[c,p]=t;while(++a<l)if(u=e[a],u instanceof Ye&&(p[++s]=u))c[++i]=u.field.clone(r[a],u.type,!0);else if({[a]:o=a}=r,u instanceof E&&(p[++s]=u))c[++i]=U.new(o,u,!0);else if(u&&u.type&&(p[++s]=u))u instanceof S&&(p[s]=u=F.new(u)),c[++i]=U.new(o,u.type,!0);return t}class J{constructor(e=[],t,r){if(this.fields=e||[],this.metadata=t||new Map,!r)r=ap(e);this.dictionaries=r}static from(...e){return J.new(e[0],e[1])}static new(...e){return new J(Fc(e)[0])}get[Symbol.toStringTag](){return"Schema"}toString(){return`Schema<{ ${this.fields.map((e,t)=>`${t}: ${e}`).join(", ")} }>`}compareTo(e){return ut.compareSchemas(this,e)}select(...e){let t=e.reduce((r,n)=>(r[n]=!0)&&r,Object.create(null));return new J(this.fields.filter((r)=>t[r.name]),this.metadata)}selectAt(...e){return new J(e.map((t)=>this.fields[t]).filter(Boolean),this.metadata)}assign(...e){let t=e[0]instanceof J?e[0]:new J(Tc(U,e)),r=[...this.fields],n=Dc(Dc(new Map,this.metadata),t.metadata),i=t.fields.filter((a)=>{let l=r.findIndex((o)=>o.name===a.name);return~l?(r[l]=a.clone({metadata:Dc(Dc(new Map,r[l].metadata),a.metadata)}))&&!1:!0}),s=ap(i,new Map);return new J([...r,...i],n,new Map([...this.dictionaries,...s]))}}class U{constructor(e,t,r=!1,n){this.name=e,this.type=t,this.nullable=r,this.metadata=n||new Map}static new(...e){let[t,r,n,i]=e;if(e[0]&&typeof e[0]==="object")({name:t}=e[0]),r===void 0&&(r=e[0].type),n===void 0&&(n=e[0].nullable),i===void 0&&(i=e[0].metadata);return new U(`${t}`,r,n,i)}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return`${this.name}: ${this.type}`}compareTo(e){return ut.compareField(this,e)}clone(...e){let[t,r,n,i]=e;return!e[0]||typeof e[0]!=="object"?[t=this.name,r=this.type,n=this.nullable,i=this.metadata]=e:{name:t=this.name,type:r=this.type,nullable:n=this.nullable,metadata:i=this.metadata}=e[0],U.new(t,r,n,i)}}function Dc(e,t){return new Map([...e||new Map,...t||new Map])}function ap(e,t=new Map){for(let r=-1,n=e.length;++r<n;){let s=e[r].type;if(E.isDictionary(s)){if(!t.has(s.id))t.set(s.id,s.dictionary);else if(t.get(s.id)!==s.dictionary)throw Error("Cannot create Schema containing two different dictionaries with the same Id")}if(s.children&&s.children.length>0)ap(s.children,t)}return t}J.prototype.fields=null;J.prototype.metadata=null;J.prototype.dictionaries=null;U.prototype.type=null;U.prototype.name=null;U.prototype.nullable=null;U.prototype.metadata=null;class vo extends an{constructor(e){super(e);this._run=new bl,this._offsets=new vl}addChild(e,t="0"){if(this.numChildren>0)throw Error("ListBuilder can only have one child.");return this.children[this.numChildren]=e,this.type=new At(new U(t,e.type,!0)),this.numChildren-1}clear(){return this._run.clear(),super.clear()}_flushPending(e){let t=this._run,r=this._offsets,n=this._setValue,i=0,s;for([i,s]of e)if(s===void 0)r.set(i,0);else r.set(i,s.length),n(this,i,t.bind(s))}}class _o extends q{constructor(){super(...arguments);this._run=new bl}setValue(e,t){super.setValue(e,this._run.bind(t))}addChild(e,t="0"){if(this.numChildren>0)throw Error("FixedSizeListBuilder can only have one child.");let r=this.children.push(e);return this.type=new hr(this.type.listSize,new U(t,e.type,!0)),r}clear(){return this._run.clear(),super.clear()}}class wo extends an{set(e,t){return super.set(e,t)}setValue(e,t){t=t instanceof Map?t:new Map(Object.entries(t));let r=this._pending||(this._pending=new Map),n=r.get(e);n&&(this._pendingLength-=n.size),this._pendingLength+=t.size,r.set(e,t)}addChild(e,t=`${this.numChildren}`){if(this.numChildren>0)throw Error("ListBuilder can only have one child.");return this.children[this.numChildren]=e,this.type=new pr(new U(t,e.type,!0),this.type.keysSorted),this.numChildren-1}_flushPending(e){let t=this._offsets,r=this._setValue;e.forEach((n,i)=>{if(n===void 0)t.set(i,0);else t.set(i,n.size),r(this,i,n)})}}class bo extends q{addChild(e,t=`${this.numChildren}`){let r=this.children.push(e);return this.type=new Me([...this.type.children,new U(t,e.type,!0)]),r}}class Zn extends q{constructor(e){super(e);if(this._typeIds=new Wn(new Int8Array(0),1),typeof e.valueToChildTypeId==="function")this._valueToChildTypeId=e.valueToChildTypeId}get typeIdToChildIndex(){return this.type.typeIdToChildIndex}append(e,t){return this.set(this.length,e,t)}set(e,t,r){if(r===void 0)r=this._valueToChildTypeId(this,t,e);if(this.setValid(e,this.isValid(t)))this.setValue(e,t,r);return this}setValue(e,t,r){this._typeIds.set(e,r),super.setValue(e,t)}addChild(e,t=`${this.children.length}`){let r=this.children.push(e),{type:{children:n,mode:i,typeIds:s}}=this,a=[...n,new U(t,e.type)];return this.type=new dr(i,[...s,r],a),r}_valueToChildTypeId(e,t,r){throw Error("Cannot map UnionBuilder value to child typeId. Pass the `childTypeId` as the second argument to unionBuilder.append(), or supply a `valueToChildTypeId` function as part of the UnionBuilder constructor options.")}}class So extends Zn{}class xo extends Zn{constructor(e){super(e);this._offsets=new Wn(new Int32Array(0))}setValue(e,t,r){let n=this.type.typeIdToChildIndex[r];return this._offsets.set(e,this.getChildAt(n).length),super.setValue(e,t,r)}}class j extends A{}var mx=(e,t,r)=>{e[t]=r/86400000|0},lp=(e,t,r)=>{e[t]=r%4294967296|0,e[t+1]=r/4294967296|0},yx=(e,t,r)=>{e[t]=r*1000%4294967296|0,e[t+1]=r*1000/4294967296|0},gx=(e,t,r)=>{e[t]=r*1e6%4294967296|0,e[t+1]=r*1e6/4294967296|0},o0=(e,t,r,n)=>{let{[r]:i,[r+1]:s}=t;if(i!=null&&s!=null)e.set(n.subarray(0,s-i),i)},vx=({offset:e,values:t},r,n)=>{let i=e+r;n?t[i>>3]|=1<<i%8:t[i>>3]&=~(1<<i%8)},a0=({values:e},t,r)=>{mx(e,t,r.valueOf())},l0=({values:e},t,r)=>{lp(e,t*2,r.valueOf())},Nr=({stride:e,values:t},r,n)=>{t[e*r]=n},u0=({stride:e,values:t},r,n)=>{t[e*r]=_l(n)},up=(e,t,r)=>{switch(typeof r){case"bigint":e.values64[t]=r;break;case"number":e.values[t*e.stride]=r;break;default:let n=r,{stride:i,ArrayType:s}=e,a=Y(s,n);e.values.set(a.subarray(0,i),i*t)}},_x=({stride:e,values:t},r,n)=>{t.set(n.subarray(0,e),e*r)},wx=({values:e,valueOffsets:t},r,n)=>o0(e,t,r,n),bx=({values:e,valueOffsets:t},r,n)=>{o0(e,t,r,Pn(n))},Sx=(e,t,r)=>{e.type.bitWidth<64?Nr(e,t,r):up(e,t,r)},xx=(e,t,r)=>{e.type.precision!==De.HALF?Nr(e,t,r):u0(e,t,r)},Bx=(e,t,r)=>{e.type.unit===Be.DAY?a0(e,t,r):l0(e,t,r)},c0=({values:e},t,r)=>lp(e,t*2,r/1000),f0=({values:e},t,r)=>lp(e,t*2,r),d0=({values:e},t,r)=>yx(e,t*2,r),h0=({values:e},t,r)=>gx(e,t*2,r),Ix=(e,t,r)=>{switch(e.type.unit){case Q.SECOND:return c0(e,t,r);case Q.MILLISECOND:return f0(e,t,r);case Q.MICROSECOND:return d0(e,t,r);case Q.NANOSECOND:return h0(e,t,r)}},p0=({values:e,stride:t},r,n)=>{e[t*r]=n},m0=({values:e,stride:t},r,n)=>{e[t*r]=n},y0=({values:e},t,r)=>{e.set(r.subarray(0,2),2*t)},g0=({values:e},t,r)=>{e.set(r.subarray(0,2),2*t)},Tx=(e,t,r)=>{switch(e.type.unit){case Q.SECOND:return p0(e,t,r);case Q.MILLISECOND:return m0(e,t,r);case Q.MICROSECOND:return y0(e,t,r);case Q.NANOSECOND:return g0(e,t,r)}},Fx=({values:e},t,r)=>{e.set(r.subarray(0,4),4*t)},Dx=(e,t,r)=>{let n=e.getChildAt(0),i=e.valueOffsets;for(let s=-1,a=i[t],l=i[t+1];a<l;)n.set(a++,r.get(++s))},Ax=(e,t,r)=>{let n=e.getChildAt(0),i=e.valueOffsets,s=r instanceof Map?[...r]:Object.entries(r);for(let a=-1,l=i[t],o=i[t+1];l<o;)n.set(l++,s[++a])},Ex=(e,t)=>(r,n,i)=>r&&r.set(e,t[i]),Ox=(e,t)=>(r,n,i)=>r&&r.set(e,t.get(i)),kx=(e,t)=>(r,n,i)=>r&&r.set(e,t.get(n.name)),Nx=(e,t)=>(r,n,i)=>r&&r.set(e,t[n.name]),Mx=(e,t,r)=>{let n=r instanceof Map?kx(t,r):r instanceof F?Ox(t,r):Array.isArray(r)?Ex(t,r):Nx(t,r);e.type.children.forEach((i,s)=>n(e.getChildAt(s),i,s))},Lx=(e,t,r)=>{e.type.mode===Ie.Dense?v0(e,t,r):_0(e,t,r)},v0=(e,t,r)=>{let n=e.typeIdToChildIndex[e.typeIds[t]],i=e.getChildAt(n);i&&i.set(e.valueOffsets[t],r)},_0=(e,t,r)=>{let n=e.typeIdToChildIndex[e.typeIds[t]],i=e.getChildAt(n);i&&i.set(t,r)},Ux=(e,t,r)=>{let n=e.getKey(t);if(n!==null)e.setValue(n,r)},Cx=(e,t,r)=>{e.type.unit===gt.DAY_TIME?w0(e,t,r):b0(e,t,r)},w0=({values:e},t,r)=>{e.set(r.subarray(0,2),2*t)},b0=({values:e},t,r)=>{e[t]=r[0]*12+r[1]%12},Rx=(e,t,r)=>{let n=e.getChildAt(0),{stride:i}=e;for(let s=-1,a=t*i;++s<i;)n.set(a+s,r.get(s))};j.prototype.visitBool=vx;j.prototype.visitInt=Sx;j.prototype.visitInt8=Nr;j.prototype.visitInt16=Nr;j.prototype.visitInt32=Nr;j.prototype.visitInt64=up;j.prototype.visitUint8=Nr;j.prototype.visitUint16=Nr;j.prototype.visitUint32=Nr;j.prototype.visitUint64=up;j.prototype.visitFloat=xx;j.prototype.visitFloat16=u0;j.prototype.visitFloat32=Nr;j.prototype.visitFloat64=Nr;j.prototype.visitUtf8=bx;j.prototype.visitBinary=wx;j.prototype.visitFixedSizeBinary=_x;j.prototype.visitDate=Bx;j.prototype.visitDateDay=a0;j.prototype.visitDateMillisecond=l0;j.prototype.visitTimestamp=Ix;j.prototype.visitTimestampSecond=c0;j.prototype.visitTimestampMillisecond=f0;j.prototype.visitTimestampMicrosecond=d0;j.prototype.visitTimestampNanosecond=h0;j.prototype.visitTime=Tx;j.prototype.visitTimeSecond=p0;j.prototype.visitTimeMillisecond=m0;j.prototype.visitTimeMicrosecond=y0;j.prototype.visitTimeNanosecond=g0;j.prototype.visitDecimal=Fx;j.prototype.visitList=Dx;j.prototype.visitStruct=Mx;j.prototype.visitUnion=Lx;j.prototype.visitDenseUnion=v0;j.prototype.visitSparseUnion=_0;j.prototype.visitDictionary=Ux;j.prototype.visitInterval=Cx;j.prototype.visitIntervalDayTime=w0;j.prototype.visitIntervalYearMonth=b0;j.prototype.visitFixedSizeList=Rx;j.prototype.visitMap=Ax;var Bo=new j;class S0 extends A{visitNull(){return Cs}visitBool(){return Us}visitInt(){return _t}visitInt8(){return Zs}visitInt16(){return Xs}visitInt32(){return qs}visitInt64(){return Gs}visitUint8(){return eo}visitUint16(){return to}visitUint32(){return ro}visitUint64(){return no}visitFloat(){return ln}visitFloat16(){return Ws}visitFloat32(){return Hs}visitFloat64(){return Ys}visitUtf8(){return cn}visitBinary(){return Qn}visitFixedSizeBinary(){return js}visitDate(){return Hn}visitDateDay(){return Rs}visitDateMillisecond(){return Ps}visitTimestamp(){return Or}visitTimestampSecond(){return lo}visitTimestampMillisecond(){return uo}visitTimestampMicrosecond(){return co}visitTimestampNanosecond(){return fo}visitTime(){return Er}visitTimeSecond(){return io}visitTimeMillisecond(){return so}visitTimeMicrosecond(){return oo}visitTimeNanosecond(){return ao}visitDecimal(){return zs}visitList(){return vo}visitStruct(){return bo}visitUnion(){return Zn}visitDenseUnion(){return xo}visitSparseUnion(){return So}visitDictionary(){return Vs}visitInterval(){return Kn}visitIntervalDayTime(){return ho}visitIntervalYearMonth(){return po}visitFixedSizeList(){return _o}visitMap(){return wo}}var cp=new S0;q.new=x0;function x0(e){let t=e.type,r=new(cp.getVisitFn(t)())(e);if(t.children&&t.children.length>0){let n=e.children||[],i={nullValues:e.nullValues},s=Array.isArray(n)?(a,l)=>n[l]||i:({name:a})=>n[a]||i;t.children.forEach((a,l)=>{let{type:o}=a,u=s(a,l);r.children.push(x0({...u,type:o}))})}return r}Object.keys(f).map((e)=>f[e]).filter((e)=>typeof e==="number"&&e!==f.NONE).forEach((e)=>{let t=cp.visit(e);t.prototype._setValue=Bo.getVisitFn(e)});cn.prototype._setValue=Bo.visitBinary;var Li;(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}static getRootAsFooter(o,u){return(u||new l).__init(o.readInt32(o.position())+o.position(),o)}version(){let o=this.bb.__offset(this.bb_pos,4);return o?this.bb.readInt16(this.bb_pos+o):v.apache.arrow.flatbuf.MetadataVersion.V1}schema(o){let u=this.bb.__offset(this.bb_pos,6);return u?(o||new v.apache.arrow.flatbuf.Schema).__init(this.bb.__indirect(this.bb_pos+u),this.bb):null}dictionaries(o,u){let c=this.bb.__offset(this.bb_pos,8);return c?(u||new e.apache.arrow.flatbuf.Block).__init(this.bb.__vector(this.bb_pos+c)+o*24,this.bb):null}dictionariesLength(){let o=this.bb.__offset(this.bb_pos,8);return o?this.bb.__vector_len(this.bb_pos+o):0}recordBatches(o,u){let c=this.bb.__offset(this.bb_pos,10);return c?(u||new e.apache.arrow.flatbuf.Block).__init(this.bb.__vector(this.bb_pos+c)+o*24,this.bb):null}recordBatchesLength(){let o=this.bb.__offset(this.bb_pos,10);return o?this.bb.__vector_len(this.bb_pos+o):0}static startFooter(o){o.startObject(4)}static addVersion(o,u){o.addFieldInt16(0,u,v.apache.arrow.flatbuf.MetadataVersion.V1)}static addSchema(o,u){o.addFieldOffset(1,u,0)}static addDictionaries(o,u){o.addFieldOffset(2,u,0)}static startDictionariesVector(o,u){o.startVector(24,u,8)}static addRecordBatches(o,u){o.addFieldOffset(3,u,0)}static startRecordBatchesVector(o,u){o.startVector(24,u,8)}static endFooter(o){return o.endObject()}static finishFooterBuffer(o,u){o.finish(u)}static createFooter(o,u,c,p,y){return l.startFooter(o),l.addVersion(o,u),l.addSchema(o,c),l.addDictionaries(o,p),l.addRecordBatches(o,y),l.endFooter(o)}}a.Footer=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(Li||(Li={}));(function(e){var t;(function(r){var n;(function(i){var s;(function(a){class l{constructor(){this.bb=null,this.bb_pos=0}__init(o,u){return this.bb_pos=o,this.bb=u,this}offset(){return this.bb.readInt64(this.bb_pos)}metaDataLength(){return this.bb.readInt32(this.bb_pos+8)}bodyLength(){return this.bb.readInt64(this.bb_pos+16)}static createBlock(o,u,c,p){return o.prep(8,24),o.writeInt64(p),o.pad(4),o.writeInt32(c),o.writeInt64(u),o.offset()}}a.Block=l})(s=i.flatbuf||(i.flatbuf={}))})(n=r.arrow||(r.arrow={}))})(t=e.apache||(e.apache={}))})(Li||(Li={}));var B0=g.Long,zx=g.Builder,Vx=g.ByteBuffer,jx=Li.apache.arrow.flatbuf.Block,Mr=Li.apache.arrow.flatbuf.Footer;class Xn{constructor(e,t=et.V4,r,n){this.schema=e,this.version=t,r&&(this._recordBatches=r),n&&(this._dictionaryBatches=n)}static decode(e){e=new Vx(L(e));let t=Mr.getRootAsFooter(e),r=J.decode(t.schema());return new I0(r,t)}static encode(e){let t=new zx,r=J.encode(t,e.schema);Mr.startRecordBatchesVector(t,e.numRecordBatches),[...e.recordBatches()].slice().reverse().forEach((s)=>fn.encode(t,s));let n=t.endVector();Mr.startDictionariesVector(t,e.numDictionaries),[...e.dictionaryBatches()].slice().reverse().forEach((s)=>fn.encode(t,s));let i=t.endVector();return Mr.startFooter(t),Mr.addSchema(t,r),Mr.addVersion(t,et.V4),Mr.addRecordBatches(t,n),Mr.addDictionaries(t,i),Mr.finishFooterBuffer(t,Mr.endFooter(t)),t.asUint8Array()}get numRecordBatches(){return this._recordBatches.length}get numDictionaries(){return this._dictionaryBatches.length}*recordBatches(){for(let e,t=-1,r=this.numRecordBatches;++t<r;)if(e=this.getRecordBatch(t))yield e}*dictionaryBatches(){for(let e,t=-1,r=this.numDictionaries;++t<r;)if(e=this.getDictionaryBatch(t))yield e}getRecordBatch(e){return e>=0&&e<this.numRecordBatches&&this._recordBatches[e]||null}getDictionaryBatch(e){return e>=0&&e<this.numDictionaries&&this._dictionaryBatches[e]||null}}class I0 extends Xn{constructor(e,t){super(e,t.version());this._footer=t}get numRecordBatches(){return this._footer.recordBatchesLength()}get numDictionaries(){return this._footer.dictionariesLength()}getRecordBatch(e){if(e>=0&&e<this.numRecordBatches){let t=this._footer.recordBatches(e);if(t)return fn.decode(t)}return null}getDictionaryBatch(e){if(e>=0&&e<this.numDictionaries){let t=this._footer.dictionaries(e);if(t)return fn.decode(t)}return null}}class fn{static decode(e){return new fn(e.metaDataLength(),e.bodyLength(),e.offset())}static encode(e,t){let{metaDataLength:r}=t,n=new B0(t.offset,0),i=new B0(t.bodyLength,0);return jx.createBlock(e,n,r,i)}constructor(e,t,r){this.metaDataLength=e,this.offset=typeof r==="number"?r:r.low,this.bodyLength=typeof t==="number"?t:t.low}}class Lr extends kh{write(e){if((e=L(e)).byteLength>0)return super.write(e)}toString(e=!1){return e?al(this.toUint8Array(!0)):this.toUint8Array(!1).then(al)}toUint8Array(e=!1){return e?Ft(this._values)[0]:(async()=>{let t=[],r=0;for await(let n of this)t.push(n),r+=n.byteLength;return Ft(t,r)[0]})()}}class Ur{constructor(e){if(e)this.source=new T0($e.fromIterable(e))}[Symbol.iterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}}class Nt{constructor(e){if(e instanceof Nt)this.source=e.source;else if(e instanceof Lr)this.source=new qn($e.fromAsyncIterable(e));else if(vc(e))this.source=new qn($e.fromNodeStream(e));else if(ll(e))this.source=new qn($e.fromDOMStream(e));else if(gc(e))this.source=new qn($e.fromDOMStream(e.body));else if(Oe(e))this.source=new qn($e.fromIterable(e));else if(Tt(e))this.source=new qn($e.fromAsyncIterable(e));else if(Ge(e))this.source=new qn($e.fromAsyncIterable(e))}[Symbol.asyncIterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}get closed(){return this.source.closed}cancel(e){return this.source.cancel(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}}class T0{constructor(e){this.source=e}cancel(e){this.return(e)}peek(e){return this.next(e,"peek").value}read(e){return this.next(e,"read").value}next(e,t="read"){return this.source.next({cmd:t,size:e})}throw(e){return Object.create(this.source.throw&&this.source.throw(e)||de)}return(e){return Object.create(this.source.return&&this.source.return(e)||de)}}class qn{constructor(e){this.source=e,this._closedPromise=new Promise((t)=>this._closedPromiseResolve=t)}async cancel(e){await this.return(e)}get closed(){return this._closedPromise}async read(e){return(await this.next(e,"read")).value}async peek(e){return(await this.next(e,"peek")).value}async next(e,t="read"){return await this.source.next({cmd:t,size:e})}async throw(e){let t=this.source.throw&&await this.source.throw(e)||de;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(t)}async return(e){let t=this.source.return&&await this.source.return(e)||de;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(t)}}class Ac extends Ur{constructor(e,t){super();this.position=0,this.buffer=L(e),this.size=typeof t>"u"?this.buffer.byteLength:t}readInt32(e){let{buffer:t,byteOffset:r}=this.readAt(e,4);return new DataView(t,r).getInt32(0,!0)}seek(e){return this.position=Math.min(e,this.size),e<this.size}read(e){let{buffer:t,size:r,position:n}=this;if(t&&n<r){if(typeof e!=="number")e=1/0;return this.position=Math.min(r,n+Math.min(r-n,e)),t.subarray(n,this.position)}return null}readAt(e,t){let r=this.buffer,n=Math.min(this.size,e+t);return r?r.subarray(e,n):new Uint8Array(t)}close(){this.buffer&&(this.buffer=null)}throw(e){return this.close(),{done:!0,value:e}}return(e){return this.close(),{done:!0,value:e}}}class Ui extends Nt{constructor(e,t){super();if(this.position=0,this._handle=e,typeof t==="number")this.size=t;else this._pending=(async()=>{this.size=(await e.stat()).size,delete this._pending})()}async readInt32(e){let{buffer:t,byteOffset:r}=await this.readAt(e,4);return new DataView(t,r).getInt32(0,!0)}async seek(e){return this._pending&&await this._pending,this.position=Math.min(e,this.size),e<this.size}async read(e){this._pending&&await this._pending;let{_handle:t,size:r,position:n}=this;if(t&&n<r){if(typeof e!=="number")e=1/0;let i=n,s=0,a=0,l=Math.min(r,i+Math.min(r-i,e)),o=new Uint8Array(Math.max(0,(this.position=l)-i));while((i+=a)<l&&(s+=a)<o.byteLength)({bytesRead:a}=await t.read(o,s,o.byteLength-s,i));return o}return null}async readAt(e,t){this._pending&&await this._pending;let{_handle:r,size:n}=this;if(r&&e+t<n){let i=Math.min(n,e+t),s=new Uint8Array(i-e);return(await r.read(s,0,t,e)).buffer}return new Uint8Array(t)}async close(){let e=this._handle;this._handle=null,e&&await e.close()}async throw(e){return await this.close(),{done:!0,value:e}}async return(e){return await this.close(),{done:!0,value:e}}}var dp={};ts(dp,{BaseInt64:()=>Ec,Int128:()=>Zt,Int64:()=>tt,Uint64:()=>ie});function Io(e){if(e<0)e=4294967295+e+1;return`0x${e.toString(16)}`}var To=8,fp=[1,10,100,1000,1e4,1e5,1e6,1e7,1e8];class Ec{constructor(e){this.buffer=e}high(){return this.buffer[1]}low(){return this.buffer[0]}_times(e){let t=new Uint32Array([this.buffer[1]>>>16,this.buffer[1]&65535,this.buffer[0]>>>16,this.buffer[0]&65535]),r=new Uint32Array([e.buffer[1]>>>16,e.buffer[1]&65535,e.buffer[0]>>>16,e.buffer[0]&65535]),n=t[3]*r[3];this.buffer[0]=n&65535;let i=n>>>16;return n=t[2]*r[3],i+=n,n=t[3]*r[2]>>>0,i+=n,this.buffer[0]+=i<<16,this.buffer[1]=i>>>0<n?65536:0,this.buffer[1]+=i>>>16,this.buffer[1]+=t[1]*r[3]+t[2]*r[2]+t[3]*r[1],this.buffer[1]+=t[0]*r[3]+t[1]*r[2]+t[2]*r[1]+t[3]*r[0]<<16,this}_plus(e){let t=this.buffer[0]+e.buffer[0]>>>0;if(this.buffer[1]+=e.buffer[1],t<this.buffer[0]>>>0)++this.buffer[1];this.buffer[0]=t}lessThan(e){return this.buffer[1]<e.buffer[1]||this.buffer[1]===e.buffer[1]&&this.buffer[0]<e.buffer[0]}equals(e){return this.buffer[1]===e.buffer[1]&&this.buffer[0]==e.buffer[0]}greaterThan(e){return e.lessThan(this)}hex(){return`${Io(this.buffer[1])} ${Io(this.buffer[0])}`}}class ie extends Ec{times(e){return this._times(e),this}plus(e){return this._plus(e),this}static from(e,t=new Uint32Array(2)){return ie.fromString(typeof e==="string"?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(2)){return ie.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(2)){let r=e.length,n=new ie(t);for(let i=0;i<r;){let s=To<r-i?To:r-i,a=new ie(new Uint32Array([parseInt(e.substr(i,s),10),0])),l=new ie(new Uint32Array([fp[s],0]));n.times(l),n.plus(a),i+=s}return n}static convertArray(e){let t=new Uint32Array(e.length*2);for(let r=-1,n=e.length;++r<n;)ie.from(e[r],new Uint32Array(t.buffer,t.byteOffset+2*r*4,2));return t}static multiply(e,t){return new ie(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new ie(new Uint32Array(e.buffer)).plus(t)}}class tt extends Ec{negate(){if(this.buffer[0]=~this.buffer[0]+1,this.buffer[1]=~this.buffer[1],this.buffer[0]==0)++this.buffer[1];return this}times(e){return this._times(e),this}plus(e){return this._plus(e),this}lessThan(e){let t=this.buffer[1]<<0,r=e.buffer[1]<<0;return t<r||t===r&&this.buffer[0]<e.buffer[0]}static from(e,t=new Uint32Array(2)){return tt.fromString(typeof e==="string"?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(2)){return tt.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(2)){let r=e.startsWith("-"),n=e.length,i=new tt(t);for(let s=r?1:0;s<n;){let a=To<n-s?To:n-s,l=new tt(new Uint32Array([parseInt(e.substr(s,a),10),0])),o=new tt(new Uint32Array([fp[a],0]));i.times(o),i.plus(l),s+=a}return r?i.negate():i}static convertArray(e){let t=new Uint32Array(e.length*2);for(let r=-1,n=e.length;++r<n;)tt.from(e[r],new Uint32Array(t.buffer,t.byteOffset+2*r*4,2));return t}static multiply(e,t){return new tt(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new tt(new Uint32Array(e.buffer)).plus(t)}}class Zt{constructor(e){this.buffer=e}high(){return new tt(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2))}low(){return new tt(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset,2))}negate(){if(this.buffer[0]=~this.buffer[0]+1,this.buffer[1]=~this.buffer[1],this.buffer[2]=~this.buffer[2],this.buffer[3]=~this.buffer[3],this.buffer[0]==0)++this.buffer[1];if(this.buffer[1]==0)++this.buffer[2];if(this.buffer[2]==0)++this.buffer[3];return this}times(e){let t=new ie(new Uint32Array([this.buffer[3],0])),r=new ie(new Uint32Array([this.buffer[2],0])),n=new ie(new Uint32Array([this.buffer[1],0])),i=new ie(new Uint32Array([this.buffer[0],0])),s=new ie(new Uint32Array([e.buffer[3],0])),a=new ie(new Uint32Array([e.buffer[2],0])),l=new ie(new Uint32Array([e.buffer[1],0])),o=new ie(new Uint32Array([e.buffer[0],0])),u=ie.multiply(i,o);this.buffer[0]=u.low();let c=new ie(new Uint32Array([u.high(),0]));return u=ie.multiply(n,o),c.plus(u),u=ie.multiply(i,l),c.plus(u),this.buffer[1]=c.low(),this.buffer[3]=c.lessThan(u)?1:0,this.buffer[2]=c.high(),new ie(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2)).plus(ie.multiply(r,o)).plus(ie.multiply(n,l)).plus(ie.multiply(i,a)),this.buffer[3]+=ie.multiply(t,o).plus(ie.multiply(r,l)).plus(ie.multiply(n,a)).plus(ie.multiply(i,s)).low(),this}plus(e){let t=new Uint32Array(4);if(t[3]=this.buffer[3]+e.buffer[3]>>>0,t[2]=this.buffer[2]+e.buffer[2]>>>0,t[1]=this.buffer[1]+e.buffer[1]>>>0,t[0]=this.buffer[0]+e.buffer[0]>>>0,t[0]<this.buffer[0]>>>0)++t[1];if(t[1]<this.buffer[1]>>>0)++t[2];if(t[2]<this.buffer[2]>>>0)++t[3];return this.buffer[3]=t[3],this.buffer[2]=t[2],this.buffer[1]=t[1],this.buffer[0]=t[0],this}hex(){return`${Io(this.buffer[3])} ${Io(this.buffer[2])} ${Io(this.buffer[1])} ${Io(this.buffer[0])}`}static multiply(e,t){return new Zt(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new Zt(new Uint32Array(e.buffer)).plus(t)}static from(e,t=new Uint32Array(4)){return Zt.fromString(typeof e==="string"?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(4)){return Zt.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(4)){let r=e.startsWith("-"),n=e.length,i=new Zt(t);for(let s=r?1:0;s<n;){let a=To<n-s?To:n-s,l=new Zt(new Uint32Array([parseInt(e.substr(s,a),10),0,0,0])),o=new Zt(new Uint32Array([fp[a],0,0,0]));i.times(o),i.plus(l),s+=a}return r?i.negate():i}static convertArray(e){let t=new Uint32Array(e.length*4);for(let r=-1,n=e.length;++r<n;)Zt.from(e[r],new Uint32Array(t.buffer,t.byteOffset+16*r,4));return t}}class Oc extends A{constructor(e,t,r,n){super();this.nodesIndex=-1,this.buffersIndex=-1,this.bytes=e,this.nodes=t,this.buffers=r,this.dictionaries=n}visit(e){return super.visit(e instanceof U?e.type:e)}visitNull(e,{length:t}=this.nextFieldNode()){return S.Null(e,0,t)}visitBool(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Bool(e,0,t,r,this.readNullBitmap(e,r),this.readData(e))}visitInt(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Int(e,0,t,r,this.readNullBitmap(e,r),this.readData(e))}visitFloat(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Float(e,0,t,r,this.readNullBitmap(e,r),this.readData(e))}visitUtf8(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Utf8(e,0,t,r,this.readNullBitmap(e,r),this.readOffsets(e),this.readData(e))}visitBinary(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Binary(e,0,t,r,this.readNullBitmap(e,r),this.readOffsets(e),this.readData(e))}visitFixedSizeBinary(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.FixedSizeBinary(e,0,t,r,this.readNullBitmap(e,r),this.readData(e))}visitDate(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Date(e,0,t,r,this.readNullBitmap(e,r),this.readData(e))}visitTimestamp(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Timestamp(e,0,t,r,this.readNullBitmap(e,r),this.readData(e))}visitTime(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Time(e,0,t,r,this.readNullBitmap(e,r),this.readData(e))}visitDecimal(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Decimal(e,0,t,r,this.readNullBitmap(e,r),this.readData(e))}visitList(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.List(e,0,t,r,this.readNullBitmap(e,r),this.readOffsets(e),this.visit(e.children[0]))}visitStruct(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Struct(e,0,t,r,this.readNullBitmap(e,r),this.visitMany(e.children))}visitUnion(e){return e.mode===Ie.Sparse?this.visitSparseUnion(e):this.visitDenseUnion(e)}visitDenseUnion(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Union(e,0,t,r,this.readNullBitmap(e,r),this.readTypeIds(e),this.readOffsets(e),this.visitMany(e.children))}visitSparseUnion(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Union(e,0,t,r,this.readNullBitmap(e,r),this.readTypeIds(e),this.visitMany(e.children))}visitDictionary(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Dictionary(e,0,t,r,this.readNullBitmap(e,r),this.readData(e.indices),this.readDictionary(e))}visitInterval(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Interval(e,0,t,r,this.readNullBitmap(e,r),this.readData(e))}visitFixedSizeList(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.FixedSizeList(e,0,t,r,this.readNullBitmap(e,r),this.visit(e.children[0]))}visitMap(e,{length:t,nullCount:r}=this.nextFieldNode()){return S.Map(e,0,t,r,this.readNullBitmap(e,r),this.readOffsets(e),this.visit(e.children[0]))}nextFieldNode(){return this.nodes[++this.nodesIndex]}nextBufferRange(){return this.buffers[++this.buffersIndex]}readNullBitmap(e,t,r=this.nextBufferRange()){return t>0&&this.readData(e,r)||new Uint8Array(0)}readOffsets(e,t){return this.readData(e,t)}readTypeIds(e,t){return this.readData(e,t)}readData(e,{length:t,offset:r}=this.nextBufferRange()){return this.bytes.subarray(r,r+t)}readDictionary(e){return this.dictionaries.get(e.id)}}class hp extends Oc{constructor(e,t,r,n){super(new Uint8Array(0),t,r,n);this.sources=e}readNullBitmap(e,t,{offset:r}=this.nextBufferRange()){return t<=0?new Uint8Array(0):Ii(this.sources[r])}readOffsets(e,{offset:t}=this.nextBufferRange()){return Y(Uint8Array,Y(Int32Array,this.sources[t]))}readTypeIds(e,{offset:t}=this.nextBufferRange()){return Y(Uint8Array,Y(e.ArrayType,this.sources[t]))}readData(e,{offset:t}=this.nextBufferRange()){let{sources:r}=this;if(E.isTimestamp(e))return Y(Uint8Array,tt.convertArray(r[t]));else if((E.isInt(e)||E.isTime(e))&&e.bitWidth===64)return Y(Uint8Array,tt.convertArray(r[t]));else if(E.isDate(e)&&e.unit===Be.MILLISECOND)return Y(Uint8Array,tt.convertArray(r[t]));else if(E.isDecimal(e))return Y(Uint8Array,Zt.convertArray(r[t]));else if(E.isBinary(e)||E.isFixedSizeBinary(e))return $x(r[t]);else if(E.isBool(e))return Ii(r[t]);else if(E.isUtf8(e))return Pn(r[t].join(""));return Y(Uint8Array,Y(e.ArrayType,r[t].map((n)=>+n)))}}function $x(e){let t=e.join(""),r=new Uint8Array(t.length/2);for(let n=0;n<t.length;n+=2)r[n>>1]=parseInt(t.substr(n,2),16);return r}var Wx=g.Long,F0=v.apache.arrow.flatbuf.Null,kc=v.apache.arrow.flatbuf.Int,pp=v.apache.arrow.flatbuf.FloatingPoint,D0=v.apache.arrow.flatbuf.Binary,A0=v.apache.arrow.flatbuf.Bool,E0=v.apache.arrow.flatbuf.Utf8,Nc=v.apache.arrow.flatbuf.Decimal,mp=v.apache.arrow.flatbuf.Date,Mc=v.apache.arrow.flatbuf.Time,Lc=v.apache.arrow.flatbuf.Timestamp,yp=v.apache.arrow.flatbuf.Interval,O0=v.apache.arrow.flatbuf.List,k0=v.apache.arrow.flatbuf.Struct_,Fo=v.apache.arrow.flatbuf.Union,xl=v.apache.arrow.flatbuf.DictionaryEncoding,gp=v.apache.arrow.flatbuf.FixedSizeBinary,vp=v.apache.arrow.flatbuf.FixedSizeList,_p=v.apache.arrow.flatbuf.Map;class N0 extends A{visit(e,t){return e==null||t==null?void 0:super.visit(e,t)}visitNull(e,t){return F0.startNull(t),F0.endNull(t)}visitInt(e,t){return kc.startInt(t),kc.addBitWidth(t,e.bitWidth),kc.addIsSigned(t,e.isSigned),kc.endInt(t)}visitFloat(e,t){return pp.startFloatingPoint(t),pp.addPrecision(t,e.precision),pp.endFloatingPoint(t)}visitBinary(e,t){return D0.startBinary(t),D0.endBinary(t)}visitBool(e,t){return A0.startBool(t),A0.endBool(t)}visitUtf8(e,t){return E0.startUtf8(t),E0.endUtf8(t)}visitDecimal(e,t){return Nc.startDecimal(t),Nc.addScale(t,e.scale),Nc.addPrecision(t,e.precision),Nc.endDecimal(t)}visitDate(e,t){return mp.startDate(t),mp.addUnit(t,e.unit),mp.endDate(t)}visitTime(e,t){return Mc.startTime(t),Mc.addUnit(t,e.unit),Mc.addBitWidth(t,e.bitWidth),Mc.endTime(t)}visitTimestamp(e,t){let r=e.timezone&&t.createString(e.timezone)||void 0;if(Lc.startTimestamp(t),Lc.addUnit(t,e.unit),r!==void 0)Lc.addTimezone(t,r);return Lc.endTimestamp(t)}visitInterval(e,t){return yp.startInterval(t),yp.addUnit(t,e.unit),yp.endInterval(t)}visitList(e,t){return O0.startList(t),O0.endList(t)}visitStruct(e,t){return k0.startStruct_(t),k0.endStruct_(t)}visitUnion(e,t){Fo.startTypeIdsVector(t,e.typeIds.length);let r=Fo.createTypeIdsVector(t,e.typeIds);return Fo.startUnion(t),Fo.addMode(t,e.mode),Fo.addTypeIds(t,r),Fo.endUnion(t)}visitDictionary(e,t){let r=this.visit(e.indices,t);if(xl.startDictionaryEncoding(t),xl.addId(t,new Wx(e.id,0)),xl.addIsOrdered(t,e.isOrdered),r!==void 0)xl.addIndexType(t,r);return xl.endDictionaryEncoding(t)}visitFixedSizeBinary(e,t){return gp.startFixedSizeBinary(t),gp.addByteWidth(t,e.byteWidth),gp.endFixedSizeBinary(t)}visitFixedSizeList(e,t){return vp.startFixedSizeList(t),vp.addListSize(t,e.listSize),vp.endFixedSizeList(t)}visitMap(e,t){return _p.startMap(t),_p.addKeysSorted(t,e.keysSorted),_p.endMap(t)}}var Uc=new N0;function C0(e,t=new Map){return new J(Hx(e,t),Cc(e.customMetadata),t)}function wp(e){return new rt(e.count,P0(e.columns),z0(e.columns))}function R0(e){return new Lt(wp(e.data),e.id,e.isDelta)}function Hx(e,t){return(e.fields||[]).filter(Boolean).map((r)=>U.fromJSON(r,t))}function M0(e,t){return(e.children||[]).filter(Boolean).map((r)=>U.fromJSON(r,t))}function P0(e){return(e||[]).reduce((t,r)=>[...t,new Cr(r.count,Yx(r.VALIDITY)),...P0(r.children)],[])}function z0(e,t=[]){for(let r=-1,n=(e||[]).length;++r<n;){let i=e[r];i.VALIDITY&&t.push(new Mt(t.length,i.VALIDITY.length)),i.TYPE&&t.push(new Mt(t.length,i.TYPE.length)),i.OFFSET&&t.push(new Mt(t.length,i.OFFSET.length)),i.DATA&&t.push(new Mt(t.length,i.DATA.length)),t=z0(i.children,t)}return t}function Yx(e){return(e||[]).reduce((t,r)=>t+ +(r===0),0)}function V0(e,t){let r,n,i,s,a,l;if(!t||!(s=e.dictionary))a=U0(e,M0(e,t)),i=new U(e.name,a,e.nullable,Cc(e.customMetadata));else if(!t.has(r=s.id))n=(n=s.indexType)?L0(n):new Et,t.set(r,a=U0(e,M0(e,t))),l=new ct(a,n,r,s.isOrdered),i=new U(e.name,l,e.nullable,Cc(e.customMetadata));else n=(n=s.indexType)?L0(n):new Et,l=new ct(t.get(r),n,r,s.isOrdered),i=new U(e.name,l,e.nullable,Cc(e.customMetadata));return i||null}function Cc(e){return new Map(Object.entries(e||{}))}function L0(e){return new Ne(e.isSigned,e.bitWidth)}function U0(e,t){let r=e.type.name;switch(r){case"NONE":return new lr;case"null":return new lr;case"binary":return new ur;case"utf8":return new Dt;case"bool":return new cr;case"list":return new At((t||[])[0]);case"struct":return new Me(t||[]);case"struct_":return new Me(t||[])}switch(r){case"int":{let n=e.type;return new Ne(n.isSigned,n.bitWidth)}case"floatingpoint":{let n=e.type;return new Jt(De[n.precision])}case"decimal":{let n=e.type;return new tn(n.scale,n.precision)}case"date":{let n=e.type;return new fr(Be[n.unit])}case"time":{let n=e.type;return new rn(Q[n.unit],n.bitWidth)}case"timestamp":{let n=e.type;return new nn(Q[n.unit],n.timezone)}case"interval":{let n=e.type;return new sn(gt[n.unit])}case"union":{let n=e.type;return new dr(Ie[n.mode],n.typeIds||[],t||[])}case"fixedsizebinary":{let n=e.type;return new on(n.byteWidth)}case"fixedsizelist":{let n=e.type;return new hr(n.listSize,(t||[])[0])}case"map":{let n=e.type;return new pr((t||[])[0],n.keysSorted)}}throw Error(`Unrecognized type: "${r}"`)}var Ci=g.Long,Kx=g.Builder,Qx=g.ByteBuffer,Le=v.apache.arrow.flatbuf.Type,yr=v.apache.arrow.flatbuf.Field,dn=v.apache.arrow.flatbuf.Schema,Jx=v.apache.arrow.flatbuf.Buffer,Gn=ke.apache.arrow.flatbuf.Message,ti=v.apache.arrow.flatbuf.KeyValue,Zx=ke.apache.arrow.flatbuf.FieldNode,j0=v.apache.arrow.flatbuf.Endianness,ei=ke.apache.arrow.flatbuf.RecordBatch,Do=ke.apache.arrow.flatbuf.DictionaryBatch;class Ue{constructor(e,t,r,n){this._version=t,this._headerType=r,this.body=new Uint8Array(0),n&&(this._createHeader=()=>n),this._bodyLength=typeof e==="number"?e:e.low}static fromJSON(e,t){let r=new Ue(0,et.V4,t);return r._createHeader=Xx(e,t),r}static decode(e){e=new Qx(L(e));let t=Gn.getRootAsMessage(e),r=t.bodyLength(),n=t.version(),i=t.headerType(),s=new Ue(r,n,i);return s._createHeader=qx(t,i),s}static encode(e){let t=new Kx,r=-1;if(e.isSchema())r=J.encode(t,e.header());else if(e.isRecordBatch())r=rt.encode(t,e.header());else if(e.isDictionaryBatch())r=Lt.encode(t,e.header());return Gn.startMessage(t),Gn.addVersion(t,et.V4),Gn.addHeader(t,r),Gn.addHeaderType(t,e.headerType),Gn.addBodyLength(t,new Ci(e.bodyLength,0)),Gn.finishMessageBuffer(t,Gn.endMessage(t)),t.asUint8Array()}static from(e,t=0){if(e instanceof J)return new Ue(0,et.V4,ee.Schema,e);if(e instanceof rt)return new Ue(t,et.V4,ee.RecordBatch,e);if(e instanceof Lt)return new Ue(t,et.V4,ee.DictionaryBatch,e);throw Error(`Unrecognized Message header: ${e}`)}get type(){return this.headerType}get version(){return this._version}get headerType(){return this._headerType}get bodyLength(){return this._bodyLength}header(){return this._createHeader()}isSchema(){return this.headerType===ee.Schema}isRecordBatch(){return this.headerType===ee.RecordBatch}isDictionaryBatch(){return this.headerType===ee.DictionaryBatch}}class rt{get nodes(){return this._nodes}get length(){return this._length}get buffers(){return this._buffers}constructor(e,t,r){this._nodes=t,this._buffers=r,this._length=typeof e==="number"?e:e.low}}class Lt{get id(){return this._id}get data(){return this._data}get isDelta(){return this._isDelta}get length(){return this.data.length}get nodes(){return this.data.nodes}get buffers(){return this.data.buffers}constructor(e,t,r=!1){this._data=e,this._isDelta=r,this._id=typeof t==="number"?t:t.low}}class Mt{constructor(e,t){this.offset=typeof e==="number"?e:e.low,this.length=typeof t==="number"?t:t.low}}class Cr{constructor(e,t){this.length=typeof e==="number"?e:e.low,this.nullCount=typeof t==="number"?t:t.low}}function Xx(e,t){return()=>{switch(t){case ee.Schema:return J.fromJSON(e);case ee.RecordBatch:return rt.fromJSON(e);case ee.DictionaryBatch:return Lt.fromJSON(e)}throw Error(`Unrecognized Message type: { name: ${ee[t]}, type: ${t} }`)}}function qx(e,t){return()=>{switch(t){case ee.Schema:return J.decode(e.header(new dn));case ee.RecordBatch:return rt.decode(e.header(new ei),e.version());case ee.DictionaryBatch:return Lt.decode(e.header(new Do),e.version())}throw Error(`Unrecognized Message type: { name: ${ee[t]}, type: ${t} }`)}}U.encode=uB;U.decode=aB;U.fromJSON=V0;J.encode=lB;J.decode=Gx;J.fromJSON=C0;rt.encode=cB;rt.decode=eB;rt.fromJSON=wp;Lt.encode=fB;Lt.decode=tB;Lt.fromJSON=R0;Cr.encode=dB;Cr.decode=nB;Mt.encode=hB;Mt.decode=rB;function Gx(e,t=new Map){let r=oB(e,t);return new J(r,Rc(e),t)}function eB(e,t=et.V4){return new rt(e.length(),iB(e),sB(e,t))}function tB(e,t=et.V4){return new Lt(rt.decode(e.data(),t),e.id(),e.isDelta())}function rB(e){return new Mt(e.offset(),e.length())}function nB(e){return new Cr(e.length(),e.nullCount())}function iB(e){let t=[];for(let r,n=-1,i=-1,s=e.nodesLength();++n<s;)if(r=e.nodes(n))t[++i]=Cr.decode(r);return t}function sB(e,t){let r=[];for(let n,i=-1,s=-1,a=e.buffersLength();++i<a;)if(n=e.buffers(i)){if(t<et.V4)n.bb_pos+=8*(i+1);r[++s]=Mt.decode(n)}return r}function oB(e,t){let r=[];for(let n,i=-1,s=-1,a=e.fieldsLength();++i<a;)if(n=e.fields(i))r[++s]=U.decode(n,t);return r}function $0(e,t){let r=[];for(let n,i=-1,s=-1,a=e.childrenLength();++i<a;)if(n=e.children(i))r[++s]=U.decode(n,t);return r}function aB(e,t){let r,n,i,s,a,l;if(!t||!(l=e.dictionary()))i=H0(e,$0(e,t)),n=new U(e.name(),i,e.nullable(),Rc(e));else if(!t.has(r=l.id().low))s=(s=l.indexType())?W0(s):new Et,t.set(r,i=H0(e,$0(e,t))),a=new ct(i,s,r,l.isOrdered()),n=new U(e.name(),a,e.nullable(),Rc(e));else s=(s=l.indexType())?W0(s):new Et,a=new ct(t.get(r),s,r,l.isOrdered()),n=new U(e.name(),a,e.nullable(),Rc(e));return n||null}function Rc(e){let t=new Map;if(e){for(let r,n,i=-1,s=e.customMetadataLength()|0;++i<s;)if((r=e.customMetadata(i))&&(n=r.key())!=null)t.set(n,r.value())}return t}function W0(e){return new Ne(e.isSigned(),e.bitWidth())}function H0(e,t){let r=e.typeType();switch(r){case Le.NONE:return new lr;case Le.Null:return new lr;case Le.Binary:return new ur;case Le.Utf8:return new Dt;case Le.Bool:return new cr;case Le.List:return new At((t||[])[0]);case Le.Struct_:return new Me(t||[])}switch(r){case Le.Int:{let n=e.type(new v.apache.arrow.flatbuf.Int);return new Ne(n.isSigned(),n.bitWidth())}case Le.FloatingPoint:{let n=e.type(new v.apache.arrow.flatbuf.FloatingPoint);return new Jt(n.precision())}case Le.Decimal:{let n=e.type(new v.apache.arrow.flatbuf.Decimal);return new tn(n.scale(),n.precision())}case Le.Date:{let n=e.type(new v.apache.arrow.flatbuf.Date);return new fr(n.unit())}case Le.Time:{let n=e.type(new v.apache.arrow.flatbuf.Time);return new rn(n.unit(),n.bitWidth())}case Le.Timestamp:{let n=e.type(new v.apache.arrow.flatbuf.Timestamp);return new nn(n.unit(),n.timezone())}case Le.Interval:{let n=e.type(new v.apache.arrow.flatbuf.Interval);return new sn(n.unit())}case Le.Union:{let n=e.type(new v.apache.arrow.flatbuf.Union);return new dr(n.mode(),n.typeIdsArray()||[],t||[])}case Le.FixedSizeBinary:{let n=e.type(new v.apache.arrow.flatbuf.FixedSizeBinary);return new on(n.byteWidth())}case Le.FixedSizeList:{let n=e.type(new v.apache.arrow.flatbuf.FixedSizeList);return new hr(n.listSize(),(t||[])[0])}case Le.Map:{let n=e.type(new v.apache.arrow.flatbuf.Map);return new pr((t||[])[0],n.keysSorted())}}throw Error(`Unrecognized type: "${Le[r]}" (${r})`)}function lB(e,t){let r=t.fields.map((s)=>U.encode(e,s));dn.startFieldsVector(e,r.length);let n=dn.createFieldsVector(e,r),i=!(t.metadata&&t.metadata.size>0)?-1:dn.createCustomMetadataVector(e,[...t.metadata].map(([s,a])=>{let l=e.createString(`${s}`),o=e.createString(`${a}`);return ti.startKeyValue(e),ti.addKey(e,l),ti.addValue(e,o),ti.endKeyValue(e)}));if(dn.startSchema(e),dn.addFields(e,n),dn.addEndianness(e,pB?j0.Little:j0.Big),i!==-1)dn.addCustomMetadata(e,i);return dn.endSchema(e)}function uB(e,t){let r=-1,n=-1,i=-1,{type:s,typeId:a}=t;if(!E.isDictionary(s))n=Uc.visit(s,e);else a=s.dictionary.typeId,i=Uc.visit(s,e),n=Uc.visit(s.dictionary,e);let l=(s.children||[]).map((c)=>U.encode(e,c)),o=yr.createChildrenVector(e,l),u=!(t.metadata&&t.metadata.size>0)?-1:yr.createCustomMetadataVector(e,[...t.metadata].map(([c,p])=>{let y=e.createString(`${c}`),_=e.createString(`${p}`);return ti.startKeyValue(e),ti.addKey(e,y),ti.addValue(e,_),ti.endKeyValue(e)}));if(t.name)r=e.createString(t.name);if(yr.startField(e),yr.addType(e,n),yr.addTypeType(e,a),yr.addChildren(e,o),yr.addNullable(e,!!t.nullable),r!==-1)yr.addName(e,r);if(i!==-1)yr.addDictionary(e,i);if(u!==-1)yr.addCustomMetadata(e,u);return yr.endField(e)}function cB(e,t){let r=t.nodes||[],n=t.buffers||[];ei.startNodesVector(e,r.length),r.slice().reverse().forEach((a)=>Cr.encode(e,a));let i=e.endVector();ei.startBuffersVector(e,n.length),n.slice().reverse().forEach((a)=>Mt.encode(e,a));let s=e.endVector();return ei.startRecordBatch(e),ei.addLength(e,new Ci(t.length,0)),ei.addNodes(e,i),ei.addBuffers(e,s),ei.endRecordBatch(e)}function fB(e,t){let r=rt.encode(e,t.data);return Do.startDictionaryBatch(e),Do.addId(e,new Ci(t.id,0)),Do.addIsDelta(e,t.isDelta),Do.addData(e,r),Do.endDictionaryBatch(e)}function dB(e,t){return Zx.createFieldNode(e,new Ci(t.length,0),new Ci(t.nullCount,0))}function hB(e,t){return Jx.createBuffer(e,new Ci(t.offset,0),new Ci(t.length,0))}var pB=function(){let e=new ArrayBuffer(2);return new DataView(e).setInt16(0,256,!0),new Int16Array(e)[0]===256}();var Y0=g.ByteBuffer,Sp=(e)=>`Expected ${ee[e]} Message in stream, but was null or length 0.`,xp=(e)=>`Header pointer of flatbuffer-encoded ${ee[e]} Message is null or length 0.`,K0=(e,t)=>`Expected to read ${e} metadata bytes, but only read ${t}.`,Q0=(e,t)=>`Expected to read ${e} bytes for message body, but only read ${t}.`;class Eo{constructor(e){this.source=e instanceof Ur?e:new Ur(e)}[Symbol.iterator](){return this}next(){let e;if((e=this.readMetadataLength()).done)return de;if(e.value===-1&&(e=this.readMetadataLength()).done)return de;if((e=this.readMetadata(e.value)).done)return de;return e}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}readMessage(e){let t;if((t=this.next()).done)return null;if(e!=null&&t.value.headerType!==e)throw Error(Sp(e));return t.value}readMessageBody(e){if(e<=0)return new Uint8Array(0);let t=L(this.source.read(e));if(t.byteLength<e)throw Error(Q0(e,t.byteLength));return t.byteOffset%8===0&&t.byteOffset+t.byteLength<=t.buffer.byteLength?t:t.slice()}readSchema(e=!1){let t=ee.Schema,r=this.readMessage(t),n=r&&r.header();if(e&&!n)throw Error(xp(t));return n}readMetadataLength(){let e=this.source.read(Pc),t=e&&new Y0(e),r=t&&t.readInt32(0)||0;return{done:r===0,value:r}}readMetadata(e){let t=this.source.read(e);if(!t)return de;if(t.byteLength<e)throw Error(K0(e,t.byteLength));return{done:!1,value:Ue.decode(t)}}}class Bl{constructor(e,t){this.source=e instanceof Nt?e:yc(e)?new Ui(e,t):new Nt(e)}[Symbol.asyncIterator](){return this}async next(){let e;if((e=await this.readMetadataLength()).done)return de;if(e.value===-1&&(e=await this.readMetadataLength()).done)return de;if((e=await this.readMetadata(e.value)).done)return de;return e}async throw(e){return await this.source.throw(e)}async return(e){return await this.source.return(e)}async readMessage(e){let t;if((t=await this.next()).done)return null;if(e!=null&&t.value.headerType!==e)throw Error(Sp(e));return t.value}async readMessageBody(e){if(e<=0)return new Uint8Array(0);let t=L(await this.source.read(e));if(t.byteLength<e)throw Error(Q0(e,t.byteLength));return t.byteOffset%8===0&&t.byteOffset+t.byteLength<=t.buffer.byteLength?t:t.slice()}async readSchema(e=!1){let t=ee.Schema,r=await this.readMessage(t),n=r&&r.header();if(e&&!n)throw Error(xp(t));return n}async readMetadataLength(){let e=await this.source.read(Pc),t=e&&new Y0(e),r=t&&t.readInt32(0)||0;return{done:r===0,value:r}}async readMetadata(e){let t=await this.source.read(e);if(!t)return de;if(t.byteLength<e)throw Error(K0(e,t.byteLength));return{done:!1,value:Ue.decode(t)}}}class Il extends Eo{constructor(e){super(new Uint8Array(0));this._schema=!1,this._body=[],this._batchIndex=0,this._dictionaryIndex=0,this._json=e instanceof hc?e:new hc(e)}next(){let{_json:e}=this;if(!this._schema)return this._schema=!0,{done:!1,value:Ue.fromJSON(e.schema,ee.Schema)};if(this._dictionaryIndex<e.dictionaries.length){let t=e.dictionaries[this._dictionaryIndex++];return this._body=t.data.columns,{done:!1,value:Ue.fromJSON(t,ee.DictionaryBatch)}}if(this._batchIndex<e.batches.length){let t=e.batches[this._batchIndex++];return this._body=t.columns,{done:!1,value:Ue.fromJSON(t,ee.RecordBatch)}}return this._body=[],de}readMessageBody(e){return t(this._body);function t(r){return(r||[]).reduce((n,i)=>[...n,...i.VALIDITY&&[i.VALIDITY]||[],...i.TYPE&&[i.TYPE]||[],...i.OFFSET&&[i.OFFSET]||[],...i.DATA&&[i.DATA]||[],...t(i.children)],[])}}readMessage(e){let t;if((t=this.next()).done)return null;if(e!=null&&t.value.headerType!==e)throw Error(Sp(e));return t.value}readSchema(){let e=ee.Schema,t=this.readMessage(e),r=t&&t.header();if(!t||!r)throw Error(xp(e));return r}}var Pc=4,bp="ARROW1",Ao=new Uint8Array(bp.length);for(let e=0;e<bp.length;e+=1)Ao[e]=bp.charCodeAt(e);function zc(e,t=0){for(let r=-1,n=Ao.length;++r<n;)if(Ao[r]!==e[t+r])return!1;return!0}var Oo=Ao.length,Bp=Oo+Pc,J0=Oo*2+Pc;class Te extends A{constructor(){super();this._byteLength=0,this._nodes=[],this._buffers=[],this._bufferRegions=[]}static assemble(...e){let t=new Te,r=i0(we,e),[n=t]=t.visitMany(r);return n}visit(e){if(!E.isDictionary(e.type)){let{data:t,length:r,nullCount:n}=e;if(r>2147483647)throw RangeError("Cannot write arrays larger than 2^31 - 1 in length");if(!E.isNull(e.type))gr.call(this,n<=0?new Uint8Array(0):Ms(t.offset,r,t.nullBitmap));this.nodes.push(new Cr(r,n))}return super.visit(e)}visitNull(e){return this}visitDictionary(e){return this.visit(e.indices)}get nodes(){return this._nodes}get buffers(){return this._buffers}get byteLength(){return this._byteLength}get bufferRegions(){return this._bufferRegions}}function gr(e){let t=e.byteLength+7&-8;return this.buffers.push(e),this.bufferRegions.push(new Mt(this._byteLength,t)),this._byteLength+=t,this}function yB(e){let{type:t,length:r,typeIds:n,valueOffsets:i}=e;if(gr.call(this,n),t.mode===Ie.Sparse)return Ip.call(this,e);else if(t.mode===Ie.Dense)if(e.offset<=0)return gr.call(this,i),Ip.call(this,e);else{let s=n.reduce((c,p)=>Math.max(c,p),n[0]),a=new Int32Array(s+1),l=new Int32Array(s+1).fill(-1),o=new Int32Array(r),u=ul(-i[0],r,i);for(let c,p,y=-1;++y<r;){if((p=l[c=n[y]])===-1)p=l[c]=u[c];o[y]=u[y]-p,++a[c]}gr.call(this,o);for(let c,p=-1,y=t.children.length;++p<y;)if(c=e.getChildAt(p)){let _=t.typeIds[p],x=Math.min(r,a[_]);this.visit(c.slice(l[_],x))}}return this}function gB(e){let t;if(e.nullCount>=e.length)return gr.call(this,new Uint8Array(0));else if((t=e.values)instanceof Uint8Array)return gr.call(this,Ms(e.offset,e.length,t));return gr.call(this,Ii(e))}function ri(e){return gr.call(this,e.values.subarray(0,e.length*e.stride))}function Z0(e){let{length:t,values:r,valueOffsets:n}=e,i=n[0],s=n[t],a=Math.min(s-i,r.byteLength-i);return gr.call(this,ul(-n[0],t,n)),gr.call(this,r.subarray(i,i+a)),this}function Tp(e){let{length:t,valueOffsets:r}=e;if(r)gr.call(this,ul(r[0],t,r));return this.visit(e.getChildAt(0))}function Ip(e){return this.visitMany(e.type.children.map((t,r)=>e.getChildAt(r)).filter(Boolean))[0]}Te.prototype.visitBool=gB;Te.prototype.visitInt=ri;Te.prototype.visitFloat=ri;Te.prototype.visitUtf8=Z0;Te.prototype.visitBinary=Z0;Te.prototype.visitFixedSizeBinary=ri;Te.prototype.visitDate=ri;Te.prototype.visitTimestamp=ri;Te.prototype.visitTime=ri;Te.prototype.visitDecimal=ri;Te.prototype.visitList=Tp;Te.prototype.visitStruct=Ip;Te.prototype.visitUnion=yB;Te.prototype.visitInterval=ri;Te.prototype.visitFixedSizeList=Tp;Te.prototype.visitMap=Tp;class Ri extends sr{constructor(e){super();this._position=0,this._started=!1,this._sink=new Lr,this._schema=null,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,yt(e)||(e={autoDestroy:!0,writeLegacyIpcFormat:!1}),this._autoDestroy=typeof e.autoDestroy==="boolean"?e.autoDestroy:!0,this._writeLegacyIpcFormat=typeof e.writeLegacyIpcFormat==="boolean"?e.writeLegacyIpcFormat:!1}static throughNode(e){throw Error('"throughNode" not available in this environment')}static throughDOM(e,t){throw Error('"throughDOM" not available in this environment')}toString(e=!1){return this._sink.toString(e)}toUint8Array(e=!1){return this._sink.toUint8Array(e)}writeAll(e){if(Tt(e))return e.then((t)=>this.writeAll(t));else if(Ge(e))return Dp(this,e);return Fp(this,e)}get closed(){return this._sink.closed}[Symbol.asyncIterator](){return this._sink[Symbol.asyncIterator]()}toDOMStream(e){return this._sink.toDOMStream(e)}toNodeStream(e){return this._sink.toNodeStream(e)}close(){return this.reset()._sink.close()}abort(e){return this.reset()._sink.abort(e)}finish(){return this._autoDestroy?this.close():this.reset(this._sink,this._schema),this}reset(e=this._sink,t=null){if(e===this._sink||e instanceof Lr)this._sink=e;else if(this._sink=new Lr,e&&jv(e))this.toDOMStream({type:"bytes"}).pipeTo(e);else if(e&&$v(e))this.toNodeStream({objectMode:!1}).pipe(e);if(this._started&&this._schema)this._writeFooter(this._schema);if(this._started=!1,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,!t||!t.compareTo(this._schema))if(t===null)this._position=0,this._schema=null;else this._started=!0,this._schema=t,this._writeSchema(t);return this}write(e){let t=null;if(!this._sink)throw Error("RecordBatchWriter is closed");else if(e===null||e===void 0)return this.finish()&&void 0;else if(e instanceof Z&&!(t=e.schema))return this.finish()&&void 0;else if(e instanceof we&&!(t=e.schema))return this.finish()&&void 0;if(t&&!t.compareTo(this._schema)){if(this._started&&this._autoDestroy)return this.close();this.reset(this._sink,t)}if(e instanceof we){if(!(e instanceof ni))this._writeRecordBatch(e)}else if(e instanceof Z)this.writeAll(e.chunks);else if(Oe(e))this.writeAll(e)}_writeMessage(e,t=8){let r=t-1,n=Ue.encode(e),i=n.byteLength,s=!this._writeLegacyIpcFormat?8:4,a=i+s+r&~r,l=a-i-s;if(e.headerType===ee.RecordBatch)this._recordBatchBlocks.push(new fn(a,e.bodyLength,this._position));else if(e.headerType===ee.DictionaryBatch)this._dictionaryBlocks.push(new fn(a,e.bodyLength,this._position));if(!this._writeLegacyIpcFormat)this._write(Int32Array.of(-1));if(this._write(Int32Array.of(a-s)),i>0)this._write(n);return this._writePadding(l)}_write(e){if(this._started){let t=L(e);if(t&&t.byteLength>0)this._sink.write(t),this._position+=t.byteLength}return this}_writeSchema(e){return this._writeMessage(Ue.from(e))}_writeFooter(e){return this._writeLegacyIpcFormat?this._write(Int32Array.of(0)):this._write(Int32Array.of(-1,0))}_writeMagic(){return this._write(Ao)}_writePadding(e){return e>0?this._write(new Uint8Array(e)):this}_writeRecordBatch(e){let{byteLength:t,nodes:r,bufferRegions:n,buffers:i}=Te.assemble(e),s=new rt(e.length,r,n),a=Ue.from(s,t);return this._writeDictionaries(e)._writeMessage(a)._writeBodyBuffers(i)}_writeDictionaryBatch(e,t,r=!1){this._dictionaryDeltaOffsets.set(t,e.length+(this._dictionaryDeltaOffsets.get(t)||0));let{byteLength:n,nodes:i,bufferRegions:s,buffers:a}=Te.assemble(e),l=new rt(e.length,i,s),o=new Lt(l,t,r),u=Ue.from(o,n);return this._writeMessage(u)._writeBodyBuffers(a)}_writeBodyBuffers(e){let t,r,n;for(let i=-1,s=e.length;++i<s;)if((t=e[i])&&(r=t.byteLength)>0){if(this._write(t),(n=(r+7&-8)-r)>0)this._writePadding(n)}return this}_writeDictionaries(e){for(let[t,r]of e.dictionaries){let n=this._dictionaryDeltaOffsets.get(t)||0;if(n===0||(r=r.slice(n)).length>0){let i="chunks"in r?r.chunks:[r];for(let s of i)this._writeDictionaryBatch(s,t,n>0),n+=s.length}}return this}}class ko extends Ri{static writeAll(e,t){let r=new ko(t);if(Tt(e))return e.then((n)=>r.writeAll(n));else if(Ge(e))return Dp(r,e);return Fp(r,e)}}class No extends Ri{constructor(){super();this._autoDestroy=!0}static writeAll(e){let t=new No;if(Tt(e))return e.then((r)=>t.writeAll(r));else if(Ge(e))return Dp(t,e);return Fp(t,e)}_writeSchema(e){return this._writeMagic()._writePadding(2)}_writeFooter(e){let t=Xn.encode(new Xn(e,et.V4,this._recordBatchBlocks,this._dictionaryBlocks));return super._writeFooter(e)._write(t)._write(Int32Array.of(t.byteLength))._writeMagic()}}function Fp(e,t){let r=t;if(t instanceof Z)r=t.chunks,e.reset(void 0,t.schema);for(let n of r)e.write(n);return e.finish()}async function Dp(e,t){for await(let r of t)e.write(r);return e.finish()}var Ap=new Uint8Array(0),X0=(e)=>[Ap,Ap,new Uint8Array(e),Ap];function q0(e,t,r=t.reduce((n,i)=>Math.max(n,i.length),0)){let n,i,s=-1,a=t.length,l=[...e.fields],o=[],u=(r+63&-64)>>3;while(++s<a)if((n=t[s])&&n.length===r)o[s]=n;else(i=l[s]).nullable||(l[s]=l[s].clone({nullable:!0})),o[s]=n?n._changeLengthAndBackfillNullBitmap(r):S.new(i.type,0,r,r,X0(u));return[new J(l),r,o]}function G0(e){return Ep(new J(e.map(({field:t})=>t)),e)}function Ep(e,t){return vB(e,t.map((r)=>r instanceof le?r.chunks.map((n)=>n.data):[r.data]))}function vB(e,t){let r=[...e.fields],n=[],i={numBatches:t.reduce((p,y)=>Math.max(p,y.length),0)},s=0,a=0,l=-1,o=t.length,u,c=[];while(i.numBatches-- >0){for(a=Number.POSITIVE_INFINITY,l=-1;++l<o;)c[l]=u=t[l].shift(),a=Math.min(a,u?u.length:a);if(isFinite(a)){if(c=_B(r,a,c,t,i),a>0)n[s++]=[a,c.slice()]}}return[e=new J(r,e.metadata),n.map((p)=>new we(e,...p))]}function _B(e,t,r,n,i){let s,a,l=0,o=-1,u=n.length,c=(t+63&-64)>>3;while(++o<u)if((s=r[o])&&(l=s.length)>=t)if(l===t)r[o]=s;else r[o]=s.slice(0,t),s=s.slice(t,l-t),i.numBatches=Math.max(i.numBatches,n[o].unshift(s));else(a=e[o]).nullable||(e[o]=a.clone({nullable:!0})),r[o]=s?s._changeLengthAndBackfillNullBitmap(t):S.new(a.type,0,t,t,X0(c));return r}class M extends F{constructor(e,t){super();this._children=t,this.numChildren=e.childData.length,this._bindDataAccessors(this.data=e)}get type(){return this.data.type}get typeId(){return this.data.typeId}get length(){return this.data.length}get offset(){return this.data.offset}get stride(){return this.data.stride}get nullCount(){return this.data.nullCount}get byteLength(){return this.data.byteLength}get VectorName(){return`${f[this.typeId]}Vector`}get ArrayType(){return this.type.ArrayType}get values(){return this.data.values}get typeIds(){return this.data.typeIds}get nullBitmap(){return this.data.nullBitmap}get valueOffsets(){return this.data.valueOffsets}get[Symbol.toStringTag](){return`${this.VectorName}<${this.type[Symbol.toStringTag]}>`}clone(e,t=this._children){return F.new(e,t)}concat(...e){return le.concat(this,...e)}slice(e,t){return Sl(this,e,t,this._sliceInternal)}isValid(e){if(this.nullCount>0){let t=this.offset+e;return(this.nullBitmap[t>>3]&1<<t%8)!==0}return!0}getChildAt(e){return e<0||e>=this.numChildren?null:(this._children||(this._children=[]))[e]||(this._children[e]=F.new(this.data.childData[e]))}toJSON(){return[...this]}_sliceInternal(e,t,r){return e.clone(e.data.slice(t,r-t),null)}_bindDataAccessors(e){}}M.prototype[Symbol.isConcatSpreadable]=!0;class Mo extends M{asUtf8(){return F.new(this.data.clone(new Dt))}}class Lo extends M{static from(e){return Ut(()=>new cr,e)}}class ii extends M{static from(...e){if(e.length===2)return Ut(()=>e[1]===Be.DAY?new yl:new Ls,e[0]);return Ut(()=>new Ls,e[0])}}class Uo extends ii{}class Co extends ii{}class Ro extends M{}class hn extends M{constructor(e){super(e);this.indices=F.new(e.clone(this.type.indices))}static from(...e){if(e.length===3){let[t,r,n]=e,i=new ct(t.type,r,null,null);return F.new(S.Dictionary(i,0,n.length,0,null,n,t))}return Ut(()=>e[0].type,e[0])}get dictionary(){return this.data.dictionary}reverseLookup(e){return this.dictionary.indexOf(e)}getKey(e){return this.indices.get(e)}getValue(e){return this.dictionary.get(e)}setKey(e,t){return this.indices.set(e,t)}setValue(e,t){return this.dictionary.set(e,t)}}hn.prototype.indices=null;class Po extends M{}class zo extends M{}class pn extends M{static from(e){let t=SB(this);if(e instanceof ArrayBuffer||ArrayBuffer.isView(e)){let r=bB(e.constructor)||t;if(t===null)t=r;if(t&&t===r){let n=new t,i=e.byteLength/n.ArrayType.BYTES_PER_ELEMENT;if(!wB(t,e.constructor))return F.new(S.Float(n,0,i,0,null,e))}}if(t)return Ut(()=>new t,e);if(e instanceof DataView||e instanceof ArrayBuffer)throw TypeError(`Cannot infer float type from instance of ${e.constructor.name}`);throw TypeError("Unrecognized FloatVector input")}}class Pi extends pn{toFloat32Array(){return new Float32Array(this)}toFloat64Array(){return new Float64Array(this)}}class zi extends pn{}class Vi extends pn{}var wB=(e,t)=>e===jn&&t!==Uint16Array,bB=(e)=>{switch(e){case Uint16Array:return jn;case Float32Array:return Oi;case Float64Array:return ki;default:return null}},SB=(e)=>{switch(e){case Pi:return jn;case zi:return Oi;case Vi:return ki;default:return null}};class si extends M{}class Vo extends si{}class jo extends si{}class Ke extends M{static from(...e){let[t,r=!1]=e,n=IB(this,r);if(t instanceof ArrayBuffer||ArrayBuffer.isView(t)){let i=BB(t.constructor,r)||n;if(n===null)n=i;if(n&&n===i){let s=new n,a=t.byteLength/s.ArrayType.BYTES_PER_ELEMENT;if(xB(n,t.constructor))a*=0.5;return F.new(S.Int(s,0,a,0,null,t))}}if(n)return Ut(()=>new n,t);if(t instanceof DataView||t instanceof ArrayBuffer)throw TypeError(`Cannot infer integer type from instance of ${t.constructor.name}`);throw TypeError("Unrecognized IntVector input")}}class ji extends Ke{}class $i extends Ke{}class Wi extends Ke{}class Hi extends Ke{toBigInt64Array(){return Lh(this.values)}get values64(){return this._values64||(this._values64=this.toBigInt64Array())}}class Yi extends Ke{}class Ki extends Ke{}class Qi extends Ke{}class Ji extends Ke{toBigUint64Array(){return Uh(this.values)}get values64(){return this._values64||(this._values64=this.toBigUint64Array())}}var xB=(e,t)=>(e===Dr||e===Ar)&&(t===Int32Array||t===Uint32Array),BB=(e,t)=>{switch(e){case Int8Array:return Ti;case Int16Array:return Fi;case Int32Array:return t?Dr:Et;case or:return Dr;case Uint8Array:return Di;case Uint16Array:return Ai;case Uint32Array:return t?Ar:Ei;case Gr:return Ar;default:return null}},IB=(e,t)=>{switch(e){case ji:return Ti;case $i:return Fi;case Wi:return t?Dr:Et;case Hi:return Dr;case Yi:return Di;case Ki:return Ai;case Qi:return t?Ar:Ei;case Ji:return Ar;default:return null}};class $o extends M{}class Wo extends M{asList(){let e=this.type.children[0];return F.new(this.data.clone(new At(e)))}bind(e){let t=this.getChildAt(0),{[e]:r,[e+1]:n}=this.valueOffsets;return new yo(t.slice(r,n))}}class Ho extends M{}var TB=Symbol.for("rowIndex");class vr extends M{bind(e){let t=this._row||(this._row=new go(this)),r=Object.create(t);return r[TB]=e,r}}class Rr extends M{}class Yo extends Rr{}class Ko extends Rr{}class Qo extends Rr{}class Jo extends Rr{}class Pr extends M{}class Zo extends Pr{}class Xo extends Pr{}class qo extends Pr{}class Go extends Pr{}class oi extends M{get typeIdToChildIndex(){return this.data.type.typeIdToChildIndex}}class ea extends oi{get valueOffsets(){return this.data.valueOffsets}}class ta extends oi{}class ra extends M{static from(e){return Ut(()=>new Dt,e)}asBinary(){return F.new(this.data.clone(new ur))}}function Op(e){return function(){return e(this)}}function e_(e){return function(t){return e(this,t)}}function kp(e){return function(t,r){return e(this,t,r)}}class R extends A{}var DB=(e,t)=>86400000*e[t],Np=(e,t)=>4294967296*e[t+1]+(e[t]>>>0),AB=(e,t)=>4294967296*(e[t+1]/1000)+(e[t]>>>0)/1000,EB=(e,t)=>4294967296*(e[t+1]/1e6)+(e[t]>>>0)/1e6,t_=(e)=>new Date(e),OB=(e,t)=>t_(DB(e,t)),kB=(e,t)=>t_(Np(e,t)),NB=(e,t)=>null,r_=(e,t,r)=>{let{[r]:n,[r+1]:i}=t;return n!=null&&i!=null?e.subarray(n,i):null},MB=({offset:e,values:t},r)=>{let n=e+r;return(t[n>>3]&1<<n%8)!==0},n_=({values:e},t)=>OB(e,t),i_=({values:e},t)=>kB(e,t*2),zr=({stride:e,values:t},r)=>t[e*r],s_=({stride:e,values:t},r)=>Xh(t[e*r]),Mp=({stride:e,values:t,type:r},n)=>un.new(t.subarray(e*n,e*(n+1)),r.isSigned),LB=({stride:e,values:t},r)=>t.subarray(e*r,e*(r+1)),UB=({values:e,valueOffsets:t},r)=>r_(e,t,r),CB=({values:e,valueOffsets:t},r)=>{let n=r_(e,t,r);return n!==null?al(n):null},RB=(e,t)=>e.type.bitWidth<64?zr(e,t):Mp(e,t),PB=(e,t)=>e.type.precision!==De.HALF?zr(e,t):s_(e,t),zB=(e,t)=>e.type.unit===Be.DAY?n_(e,t):i_(e,t),o_=({values:e},t)=>1000*Np(e,t*2),a_=({values:e},t)=>Np(e,t*2),l_=({values:e},t)=>AB(e,t*2),u_=({values:e},t)=>EB(e,t*2),VB=(e,t)=>{switch(e.type.unit){case Q.SECOND:return o_(e,t);case Q.MILLISECOND:return a_(e,t);case Q.MICROSECOND:return l_(e,t);case Q.NANOSECOND:return u_(e,t)}},c_=({values:e,stride:t},r)=>e[t*r],f_=({values:e,stride:t},r)=>e[t*r],d_=({values:e},t)=>un.signed(e.subarray(2*t,2*(t+1))),h_=({values:e},t)=>un.signed(e.subarray(2*t,2*(t+1))),jB=(e,t)=>{switch(e.type.unit){case Q.SECOND:return c_(e,t);case Q.MILLISECOND:return f_(e,t);case Q.MICROSECOND:return d_(e,t);case Q.NANOSECOND:return h_(e,t)}},$B=({values:e},t)=>un.decimal(e.subarray(4*t,4*(t+1))),WB=(e,t)=>{let r=e.getChildAt(0),{valueOffsets:n,stride:i}=e;return r.slice(n[t*i],n[t*i+1])},HB=(e,t)=>e.bind(t),YB=(e,t)=>e.bind(t),KB=(e,t)=>e.type.mode===Ie.Dense?p_(e,t):m_(e,t),p_=(e,t)=>{let r=e.typeIdToChildIndex[e.typeIds[t]],n=e.getChildAt(r);return n?n.get(e.valueOffsets[t]):null},m_=(e,t)=>{let r=e.typeIdToChildIndex[e.typeIds[t]],n=e.getChildAt(r);return n?n.get(t):null},QB=(e,t)=>e.getValue(e.getKey(t)),JB=(e,t)=>e.type.unit===gt.DAY_TIME?y_(e,t):g_(e,t),y_=({values:e},t)=>e.subarray(2*t,2*(t+1)),g_=({values:e},t)=>{let r=e[t],n=new Int32Array(2);return n[0]=r/12|0,n[1]=r%12|0,n},ZB=(e,t)=>{let r=e.getChildAt(0),{stride:n}=e;return r.slice(t*n,(t+1)*n)};R.prototype.visitNull=NB;R.prototype.visitBool=MB;R.prototype.visitInt=RB;R.prototype.visitInt8=zr;R.prototype.visitInt16=zr;R.prototype.visitInt32=zr;R.prototype.visitInt64=Mp;R.prototype.visitUint8=zr;R.prototype.visitUint16=zr;R.prototype.visitUint32=zr;R.prototype.visitUint64=Mp;R.prototype.visitFloat=PB;R.prototype.visitFloat16=s_;R.prototype.visitFloat32=zr;R.prototype.visitFloat64=zr;R.prototype.visitUtf8=CB;R.prototype.visitBinary=UB;R.prototype.visitFixedSizeBinary=LB;R.prototype.visitDate=zB;R.prototype.visitDateDay=n_;R.prototype.visitDateMillisecond=i_;R.prototype.visitTimestamp=VB;R.prototype.visitTimestampSecond=o_;R.prototype.visitTimestampMillisecond=a_;R.prototype.visitTimestampMicrosecond=l_;R.prototype.visitTimestampNanosecond=u_;R.prototype.visitTime=jB;R.prototype.visitTimeSecond=c_;R.prototype.visitTimeMillisecond=f_;R.prototype.visitTimeMicrosecond=d_;R.prototype.visitTimeNanosecond=h_;R.prototype.visitDecimal=$B;R.prototype.visitList=WB;R.prototype.visitStruct=YB;R.prototype.visitUnion=KB;R.prototype.visitDenseUnion=p_;R.prototype.visitSparseUnion=m_;R.prototype.visitDictionary=QB;R.prototype.visitInterval=JB;R.prototype.visitIntervalDayTime=y_;R.prototype.visitIntervalYearMonth=g_;R.prototype.visitFixedSizeList=ZB;R.prototype.visitMap=HB;var na=new R;class P extends A{}function XB(e,t){return t===null&&e.length>0?0:-1}function qB(e,t){let{nullBitmap:r}=e;if(!r||e.nullCount<=0)return-1;let n=0;for(let i of Vn(r,e.data.offset+(t||0),e.length,r,dl)){if(!i)return n;++n}return-1}function K(e,t,r){if(t===void 0)return-1;if(t===null)return qB(e,r);let n=Jn(t);for(let i=(r||0)-1,s=e.length;++i<s;)if(n(e.get(i)))return i;return-1}function v_(e,t,r){let n=Jn(t);for(let i=(r||0)-1,s=e.length;++i<s;)if(n(e.get(i)))return i;return-1}P.prototype.visitNull=XB;P.prototype.visitBool=K;P.prototype.visitInt=K;P.prototype.visitInt8=K;P.prototype.visitInt16=K;P.prototype.visitInt32=K;P.prototype.visitInt64=K;P.prototype.visitUint8=K;P.prototype.visitUint16=K;P.prototype.visitUint32=K;P.prototype.visitUint64=K;P.prototype.visitFloat=K;P.prototype.visitFloat16=K;P.prototype.visitFloat32=K;P.prototype.visitFloat64=K;P.prototype.visitUtf8=K;P.prototype.visitBinary=K;P.prototype.visitFixedSizeBinary=K;P.prototype.visitDate=K;P.prototype.visitDateDay=K;P.prototype.visitDateMillisecond=K;P.prototype.visitTimestamp=K;P.prototype.visitTimestampSecond=K;P.prototype.visitTimestampMillisecond=K;P.prototype.visitTimestampMicrosecond=K;P.prototype.visitTimestampNanosecond=K;P.prototype.visitTime=K;P.prototype.visitTimeSecond=K;P.prototype.visitTimeMillisecond=K;P.prototype.visitTimeMicrosecond=K;P.prototype.visitTimeNanosecond=K;P.prototype.visitDecimal=K;P.prototype.visitList=K;P.prototype.visitStruct=K;P.prototype.visitUnion=K;P.prototype.visitDenseUnion=v_;P.prototype.visitSparseUnion=v_;P.prototype.visitDictionary=K;P.prototype.visitInterval=K;P.prototype.visitIntervalDayTime=K;P.prototype.visitIntervalYearMonth=K;P.prototype.visitFixedSizeList=K;P.prototype.visitMap=K;var Lp=new P;class z extends A{}function GB(e){let t=na.getVisitFn(e);return Vn(e.nullBitmap,e.offset,e.length,e,(r,n,i,s)=>(i&1<<s)!==0?t(r,n):null)}function W(e){if(e.nullCount>0)return GB(e);let{type:t,typeId:r,length:n}=e;if(e.stride===1&&(r===f.Timestamp||r===f.Int&&t.bitWidth!==64||r===f.Time&&t.bitWidth!==64||r===f.Float&&t.precision>0))return e.values.subarray(0,n)[Symbol.iterator]();return function*(i){for(let s=-1;++s<n;)yield i(e,s)}(na.getVisitFn(e))}z.prototype.visitNull=W;z.prototype.visitBool=W;z.prototype.visitInt=W;z.prototype.visitInt8=W;z.prototype.visitInt16=W;z.prototype.visitInt32=W;z.prototype.visitInt64=W;z.prototype.visitUint8=W;z.prototype.visitUint16=W;z.prototype.visitUint32=W;z.prototype.visitUint64=W;z.prototype.visitFloat=W;z.prototype.visitFloat16=W;z.prototype.visitFloat32=W;z.prototype.visitFloat64=W;z.prototype.visitUtf8=W;z.prototype.visitBinary=W;z.prototype.visitFixedSizeBinary=W;z.prototype.visitDate=W;z.prototype.visitDateDay=W;z.prototype.visitDateMillisecond=W;z.prototype.visitTimestamp=W;z.prototype.visitTimestampSecond=W;z.prototype.visitTimestampMillisecond=W;z.prototype.visitTimestampMicrosecond=W;z.prototype.visitTimestampNanosecond=W;z.prototype.visitTime=W;z.prototype.visitTimeSecond=W;z.prototype.visitTimeMillisecond=W;z.prototype.visitTimeMicrosecond=W;z.prototype.visitTimeNanosecond=W;z.prototype.visitDecimal=W;z.prototype.visitList=W;z.prototype.visitStruct=W;z.prototype.visitUnion=W;z.prototype.visitDenseUnion=W;z.prototype.visitSparseUnion=W;z.prototype.visitDictionary=W;z.prototype.visitInterval=W;z.prototype.visitIntervalDayTime=W;z.prototype.visitIntervalYearMonth=W;z.prototype.visitFixedSizeList=W;z.prototype.visitMap=W;var Tl=new z;class V extends A{}function H(e){let{type:t,length:r,stride:n}=e;switch(t.typeId){case f.Int:case f.Float:case f.Decimal:case f.Time:case f.Timestamp:return e.values.subarray(0,r*n)}return[...Tl.visit(e)]}V.prototype.visitNull=H;V.prototype.visitBool=H;V.prototype.visitInt=H;V.prototype.visitInt8=H;V.prototype.visitInt16=H;V.prototype.visitInt32=H;V.prototype.visitInt64=H;V.prototype.visitUint8=H;V.prototype.visitUint16=H;V.prototype.visitUint32=H;V.prototype.visitUint64=H;V.prototype.visitFloat=H;V.prototype.visitFloat16=H;V.prototype.visitFloat32=H;V.prototype.visitFloat64=H;V.prototype.visitUtf8=H;V.prototype.visitBinary=H;V.prototype.visitFixedSizeBinary=H;V.prototype.visitDate=H;V.prototype.visitDateDay=H;V.prototype.visitDateMillisecond=H;V.prototype.visitTimestamp=H;V.prototype.visitTimestampSecond=H;V.prototype.visitTimestampMillisecond=H;V.prototype.visitTimestampMicrosecond=H;V.prototype.visitTimestampNanosecond=H;V.prototype.visitTime=H;V.prototype.visitTimeSecond=H;V.prototype.visitTimeMillisecond=H;V.prototype.visitTimeMicrosecond=H;V.prototype.visitTimeNanosecond=H;V.prototype.visitDecimal=H;V.prototype.visitList=H;V.prototype.visitStruct=H;V.prototype.visitUnion=H;V.prototype.visitDenseUnion=H;V.prototype.visitSparseUnion=H;V.prototype.visitDictionary=H;V.prototype.visitInterval=H;V.prototype.visitIntervalDayTime=H;V.prototype.visitIntervalYearMonth=H;V.prototype.visitFixedSizeList=H;V.prototype.visitMap=H;var Up=new V;var Fl=(e,t)=>e+t,Cp=(e)=>`Cannot compute the byte width of variable-width column ${e}`;class __ extends A{visitNull(e){return 0}visitInt(e){return e.bitWidth/8}visitFloat(e){return e.ArrayType.BYTES_PER_ELEMENT}visitBinary(e){throw Error(Cp(e))}visitUtf8(e){throw Error(Cp(e))}visitBool(e){return 0.125}visitDecimal(e){return 16}visitDate(e){return(e.unit+1)*4}visitTime(e){return e.bitWidth/8}visitTimestamp(e){return e.unit===Q.SECOND?4:8}visitInterval(e){return(e.unit+1)*4}visitList(e){throw Error(Cp(e))}visitStruct(e){return this.visitFields(e.children).reduce(Fl,0)}visitUnion(e){return this.visitFields(e.children).reduce(Fl,0)}visitFixedSizeBinary(e){return e.byteWidth}visitFixedSizeList(e){return e.listSize*this.visitFields(e.children).reduce(Fl,0)}visitMap(e){return this.visitFields(e.children).reduce(Fl,0)}visitDictionary(e){return this.visit(e.indices)}visitFields(e){return(e||[]).map((t)=>this.visit(t.type))}visitSchema(e){return this.visitFields(e.fields).reduce(Fl,0)}}var Rp=new __;class w_ extends A{visitNull(){return Ho}visitBool(){return Lo}visitInt(){return Ke}visitInt8(){return ji}visitInt16(){return $i}visitInt32(){return Wi}visitInt64(){return Hi}visitUint8(){return Yi}visitUint16(){return Ki}visitUint32(){return Qi}visitUint64(){return Ji}visitFloat(){return pn}visitFloat16(){return Pi}visitFloat32(){return zi}visitFloat64(){return Vi}visitUtf8(){return ra}visitBinary(){return Mo}visitFixedSizeBinary(){return Po}visitDate(){return ii}visitDateDay(){return Uo}visitDateMillisecond(){return Co}visitTimestamp(){return Rr}visitTimestampSecond(){return Yo}visitTimestampMillisecond(){return Ko}visitTimestampMicrosecond(){return Qo}visitTimestampNanosecond(){return Jo}visitTime(){return Pr}visitTimeSecond(){return Zo}visitTimeMillisecond(){return Xo}visitTimeMicrosecond(){return qo}visitTimeNanosecond(){return Go}visitDecimal(){return Ro}visitList(){return $o}visitStruct(){return vr}visitUnion(){return oi}visitDenseUnion(){return ea}visitSparseUnion(){return ta}visitDictionary(){return hn}visitInterval(){return si}visitIntervalDayTime(){return Vo}visitIntervalYearMonth(){return jo}visitFixedSizeList(){return zo}visitMap(){return Wo}}var Pp=new w_;F.new=eI;F.from=tI;function eI(e,...t){return new(Pp.getVisitFn(e)())(e,...t)}function Ut(e,t){if(Oe(t))return F.from({nullValues:[null,void 0],type:e(),values:t});else if(Ge(t))return F.from({nullValues:[null,void 0],type:e(),values:t});let{values:r=[],type:n=e(),nullValues:i=[null,void 0]}={...t};return Oe(r)?F.from({nullValues:i,...t,type:n}):F.from({nullValues:i,...t,type:n})}function tI(e){let{values:t=[],...r}={nullValues:[null,void 0],...e};if(Oe(t)){let n=[...q.throughIterable(r)(t)];return n.length===1?n[0]:le.concat(n)}return(async(n)=>{let i=q.throughAsyncIterable(r);for await(let s of i(t))n.push(s);return n.length===1?n[0]:le.concat(n)})([])}M.prototype.get=function(t){return na.visit(this,t)};M.prototype.set=function(t,r){return Bo.visit(this,t,r)};M.prototype.indexOf=function(t,r){return Lp.visit(this,t,r)};M.prototype.toArray=function(){return Up.visit(this)};M.prototype.getByteWidth=function(){return Rp.visit(this.type)};M.prototype[Symbol.iterator]=function(){return Tl.visit(this)};M.prototype._bindDataAccessors=sI;Object.keys(f).map((e)=>f[e]).filter((e)=>typeof e==="number").filter((e)=>e!==f.NONE).forEach((e)=>{let t=Pp.visit(e);t.prototype.get=e_(na.getVisitFn(e)),t.prototype.set=kp(Bo.getVisitFn(e)),t.prototype.indexOf=kp(Lp.getVisitFn(e)),t.prototype.toArray=Op(Up.getVisitFn(e)),t.prototype.getByteWidth=rI(Rp.getVisitFn(e)),t.prototype[Symbol.iterator]=Op(Tl.getVisitFn(e))});function rI(e){return function(){return e(this.type)}}function nI(e){return function(t){return this.isValid(t)?e.call(this,t):null}}function iI(e){return function(t,r){if(Wh(this.nullBitmap,this.offset+t,!(r===null||r===void 0)))e.call(this,t,r)}}function sI(){let e=this.nullBitmap;if(e&&e.byteLength>0)this.get=nI(this.get),this.set=iI(this.set)}class Z extends le{constructor(...e){let t=null;if(e[0]instanceof J)t=e.shift();let r=Tc(we,e);if(!t&&!(t=r[0]&&r[0].schema))throw TypeError("Table must be initialized with a Schema or at least one RecordBatch");r[0]||(r[0]=new ni(t));super(new Me(t.fields),r);this._schema=t,this._chunks=r}static empty(e=new J([])){return new Z(e,[])}static from(e){if(!e)return Z.empty();if(typeof e==="object"){let r=Oe(e.values)?oI(e):Ge(e.values)?aI(e):null;if(r!==null)return r}let t=nt.from(e);if(Tt(t))return(async()=>await Z.from(await t))();if(t.isSync()&&(t=t.open()))return!t.schema?Z.empty():new Z(t.schema,[...t]);return(async(r)=>{let n=await r,i=n.schema,s=[];if(i){for await(let a of n)s.push(a);return new Z(i,s)}return Z.empty()})(t.open())}static async fromAsync(e){return await Z.from(e)}static fromStruct(e){return Z.new(e.data.childData,e.type.children)}static new(...e){return new Z(...G0(n0(e)))}get schema(){return this._schema}get length(){return this._length}get chunks(){return this._chunks}get numCols(){return this._numChildren}clone(e=this._chunks){return new Z(this._schema,e)}getColumn(e){return this.getColumnAt(this.getColumnIndex(e))}getColumnAt(e){return this.getChildAt(e)}getColumnIndex(e){return this._schema.fields.findIndex((t)=>t.name===e)}getChildAt(e){if(e<0||e>=this.numChildren)return null;let t,r,n=this._schema.fields,i=this._children||(this._children=[]);if(r=i[e])return r;if(t=n[e]){let s=this._chunks.map((a)=>a.getChildAt(e)).filter((a)=>a!=null);if(s.length>0)return i[e]=new Ye(t,s)}return null}serialize(e="binary",t=!0){return(!t?No:ko).writeAll(this).toUint8Array(!0)}count(){return this._length}select(...e){let t=this._schema.fields.reduce((r,n,i)=>r.set(n.name,i),new Map);return this.selectAt(...e.map((r)=>t.get(r)).filter((r)=>r>-1))}selectAt(...e){let t=this._schema.selectAt(...e);return new Z(t,this._chunks.map(({length:r,data:{childData:n}})=>new we(t,r,e.map((i)=>n[i]).filter(Boolean))))}assign(e){let t=this._schema.fields,[r,n]=e.schema.fields.reduce((a,l,o)=>{let[u,c]=a,p=t.findIndex((y)=>y.name===l.name);return~p?c[p]=o:u.push(o),a},[[],[]]),i=this._schema.assign(e.schema),s=[...t.map((a,l,o,u=n[l])=>u===void 0?this.getColumnAt(l):e.getColumnAt(u)),...r.map((a)=>e.getColumnAt(a))].filter(Boolean);return new Z(...Ep(i,s))}}function oI(e){let{type:t}=e;if(t instanceof Me)return Z.fromStruct(vr.from(e));return null}function aI(e){let{type:t}=e;if(t instanceof Me)return vr.from(e).then((r)=>Z.fromStruct(r));return null}class we extends vr{constructor(...e){let t,r=e[0],n;if(e[1]instanceof S)[,t,n]=e;else{let i=r.fields,[,s,a]=e;t=S.Struct(new Me(i),0,s,0,null,a)}super(t,n);this._schema=r}static from(e){if(Oe(e.values))return Z.from(e);return Z.from(e)}static new(...e){let[t,r]=Fc(e),n=r.filter((i)=>i instanceof F);return new we(...q0(new J(t),n.map((i)=>i.data)))}clone(e,t=this._children){return new we(this._schema,e,t)}concat(...e){let t=this._schema,r=le.flatten(this,...e);return new Z(t,r.map(({data:n})=>new we(t,n)))}get schema(){return this._schema}get numCols(){return this._schema.fields.length}get dictionaries(){return this._dictionaries||(this._dictionaries=zp.collect(this))}select(...e){let t=this._schema.fields.reduce((r,n,i)=>r.set(n.name,i),new Map);return this.selectAt(...e.map((r)=>t.get(r)).filter((r)=>r>-1))}selectAt(...e){let t=this._schema.selectAt(...e),r=e.map((n)=>this.data.childData[n]).filter(Boolean);return new we(t,this.length,r)}}class ni extends we{constructor(e){super(e,0,e.fields.map((t)=>S.new(t.type,0,0,0)))}}class zp extends A{constructor(){super(...arguments);this.dictionaries=new Map}static collect(e){return new zp().visit(e.data,new Me(e.schema.fields)).dictionaries}visit(e,t){if(E.isDictionary(t))return this.visitDictionary(e,t);else e.childData.forEach((r,n)=>this.visit(r,t.children[n].type));return this}visitDictionary(e,t){let r=e.dictionary;if(r&&r.length>0)this.dictionaries.set(t.id,r);return this}}class nt extends sr{constructor(e){super();this._impl=e}get closed(){return this._impl.closed}get schema(){return this._impl.schema}get autoDestroy(){return this._impl.autoDestroy}get dictionaries(){return this._impl.dictionaries}get numDictionaries(){return this._impl.numDictionaries}get numRecordBatches(){return this._impl.numRecordBatches}get footer(){return this._impl.isFile()?this._impl.footer:null}isSync(){return this._impl.isSync()}isAsync(){return this._impl.isAsync()}isFile(){return this._impl.isFile()}isStream(){return this._impl.isStream()}next(){return this._impl.next()}throw(e){return this._impl.throw(e)}return(e){return this._impl.return(e)}cancel(){return this._impl.cancel()}reset(e){return this._impl.reset(e),this._DOMStream=void 0,this._nodeStream=void 0,this}open(e){let t=this._impl.open(e);return Tt(t)?t.then(()=>this):this}readRecordBatch(e){return this._impl.isFile()?this._impl.readRecordBatch(e):null}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}toDOMStream(){return $e.toDOMStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this})}toNodeStream(){return $e.toNodeStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this},{objectMode:!0})}static throughNode(e){throw Error('"throughNode" not available in this environment')}static throughDOM(e,t){throw Error('"throughDOM" not available in this environment')}static from(e){if(e instanceof nt)return e;else if(pc(e))return lI(e);else if(yc(e))return fI(e);else if(Tt(e))return(async()=>await nt.from(await e))();else if(gc(e)||ll(e)||vc(e)||Ge(e))return cI(new Nt(e));return uI(new Ur(e))}static readAll(e){if(e instanceof nt)return e.isSync()?b_(e):S_(e);else if(pc(e)||ArrayBuffer.isView(e)||Oe(e)||mc(e))return b_(e);return S_(e)}}class Zi extends nt{constructor(e){super(e);this._impl=e}[Symbol.iterator](){return this._impl[Symbol.iterator]()}async*[Symbol.asyncIterator](){yield*this[Symbol.iterator]()}}class Xi extends nt{constructor(e){super(e);this._impl=e}[Symbol.iterator](){throw Error("AsyncRecordBatchStreamReader is not Iterable")}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}}class El extends Zi{constructor(e){super(e);this._impl=e}}class Vc extends Xi{constructor(e){super(e);this._impl=e}}class Vp{constructor(e=new Map){this.closed=!1,this.autoDestroy=!0,this._dictionaryIndex=0,this._recordBatchIndex=0,this.dictionaries=e}get numDictionaries(){return this._dictionaryIndex}get numRecordBatches(){return this._recordBatchIndex}isSync(){return!1}isAsync(){return!1}isFile(){return!1}isStream(){return!1}reset(e){return this._dictionaryIndex=0,this._recordBatchIndex=0,this.schema=e,this.dictionaries=new Map,this}_loadRecordBatch(e,t){return new we(this.schema,e.length,this._loadVectors(e,t,this.schema.fields))}_loadDictionaryBatch(e,t){let{id:r,isDelta:n,data:i}=e,{dictionaries:s,schema:a}=this,l=s.get(r);if(n||!l){let o=a.dictionaries.get(r);return l&&n?l.concat(F.new(this._loadVectors(i,t,[o])[0])):F.new(this._loadVectors(i,t,[o])[0])}return l}_loadVectors(e,t,r){return new Oc(t,e.nodes,e.buffers,this.dictionaries).visitMany(r)}}class Dl extends Vp{constructor(e,t){super(t);this._reader=!pc(e)?new Eo(this._handle=e):new Il(this._handle=e)}isSync(){return!0}isStream(){return!0}[Symbol.iterator](){return this}cancel(){if(!this.closed&&(this.closed=!0))this.reset()._reader.return(),this._reader=null,this.dictionaries=null}open(e){if(!this.closed){if(this.autoDestroy=I_(this,e),!(this.schema||(this.schema=this._reader.readSchema())))this.cancel()}return this}throw(e){if(!this.closed&&this.autoDestroy&&(this.closed=!0))return this.reset()._reader.throw(e);return de}return(e){if(!this.closed&&this.autoDestroy&&(this.closed=!0))return this.reset()._reader.return(e);return de}next(){if(this.closed)return de;let e,{_reader:t}=this;while(e=this._readNextMessageAndValidate())if(e.isSchema())this.reset(e.header());else if(e.isRecordBatch()){this._recordBatchIndex++;let r=e.header(),n=t.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(r,n)}}else if(e.isDictionaryBatch()){this._dictionaryIndex++;let r=e.header(),n=t.readMessageBody(e.bodyLength),i=this._loadDictionaryBatch(r,n);this.dictionaries.set(r.id,i)}if(this.schema&&this._recordBatchIndex===0)return this._recordBatchIndex++,{done:!1,value:new ni(this.schema)};return this.return()}_readNextMessageAndValidate(e){return this._reader.readMessage(e)}}class Al extends Vp{constructor(e,t){super(t);this._reader=new Bl(this._handle=e)}isAsync(){return!0}isStream(){return!0}[Symbol.asyncIterator](){return this}async cancel(){if(!this.closed&&(this.closed=!0))await this.reset()._reader.return(),this._reader=null,this.dictionaries=null}async open(e){if(!this.closed){if(this.autoDestroy=I_(this,e),!(this.schema||(this.schema=await this._reader.readSchema())))await this.cancel()}return this}async throw(e){if(!this.closed&&this.autoDestroy&&(this.closed=!0))return await this.reset()._reader.throw(e);return de}async return(e){if(!this.closed&&this.autoDestroy&&(this.closed=!0))return await this.reset()._reader.return(e);return de}async next(){if(this.closed)return de;let e,{_reader:t}=this;while(e=await this._readNextMessageAndValidate())if(e.isSchema())await this.reset(e.header());else if(e.isRecordBatch()){this._recordBatchIndex++;let r=e.header(),n=await t.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(r,n)}}else if(e.isDictionaryBatch()){this._dictionaryIndex++;let r=e.header(),n=await t.readMessageBody(e.bodyLength),i=this._loadDictionaryBatch(r,n);this.dictionaries.set(r.id,i)}if(this.schema&&this._recordBatchIndex===0)return this._recordBatchIndex++,{done:!1,value:new ni(this.schema)};return await this.return()}async _readNextMessageAndValidate(e){return await this._reader.readMessage(e)}}class jp extends Dl{constructor(e,t){super(e instanceof Ac?e:new Ac(e),t)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isSync(){return!0}isFile(){return!0}open(e){if(!this.closed&&!this._footer){this.schema=(this._footer=this._readFooter()).schema;for(let t of this._footer.dictionaryBatches())t&&this._readDictionaryBatch(this._dictionaryIndex++)}return super.open(e)}readRecordBatch(e){if(this.closed)return null;if(!this._footer)this.open();let t=this._footer&&this._footer.getRecordBatch(e);if(t&&this._handle.seek(t.offset)){let r=this._reader.readMessage(ee.RecordBatch);if(r&&r.isRecordBatch()){let n=r.header(),i=this._reader.readMessageBody(r.bodyLength);return this._loadRecordBatch(n,i)}}return null}_readDictionaryBatch(e){let t=this._footer&&this._footer.getDictionaryBatch(e);if(t&&this._handle.seek(t.offset)){let r=this._reader.readMessage(ee.DictionaryBatch);if(r&&r.isDictionaryBatch()){let n=r.header(),i=this._reader.readMessageBody(r.bodyLength),s=this._loadDictionaryBatch(n,i);this.dictionaries.set(n.id,s)}}}_readFooter(){let{_handle:e}=this,t=e.size-Bp,r=e.readInt32(t),n=e.readAt(t-r,r);return Xn.decode(n)}_readNextMessageAndValidate(e){if(!this._footer)this.open();if(this._footer&&this._recordBatchIndex<this.numRecordBatches){let t=this._footer&&this._footer.getRecordBatch(this._recordBatchIndex);if(t&&this._handle.seek(t.offset))return this._reader.readMessage(e)}return null}}class x_ extends Al{constructor(e,...t){let r=typeof t[0]!=="number"?t.shift():void 0,n=t[0]instanceof Map?t.shift():void 0;super(e instanceof Ui?e:new Ui(e,r),n)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isFile(){return!0}isAsync(){return!0}async open(e){if(!this.closed&&!this._footer){this.schema=(this._footer=await this._readFooter()).schema;for(let t of this._footer.dictionaryBatches())t&&await this._readDictionaryBatch(this._dictionaryIndex++)}return await super.open(e)}async readRecordBatch(e){if(this.closed)return null;if(!this._footer)await this.open();let t=this._footer&&this._footer.getRecordBatch(e);if(t&&await this._handle.seek(t.offset)){let r=await this._reader.readMessage(ee.RecordBatch);if(r&&r.isRecordBatch()){let n=r.header(),i=await this._reader.readMessageBody(r.bodyLength);return this._loadRecordBatch(n,i)}}return null}async _readDictionaryBatch(e){let t=this._footer&&this._footer.getDictionaryBatch(e);if(t&&await this._handle.seek(t.offset)){let r=await this._reader.readMessage(ee.DictionaryBatch);if(r&&r.isDictionaryBatch()){let n=r.header(),i=await this._reader.readMessageBody(r.bodyLength),s=this._loadDictionaryBatch(n,i);this.dictionaries.set(n.id,s)}}}async _readFooter(){let{_handle:e}=this;e._pending&&await e._pending;let t=e.size-Bp,r=await e.readInt32(t),n=await e.readAt(t-r,r);return Xn.decode(n)}async _readNextMessageAndValidate(e){if(!this._footer)await this.open();if(this._footer&&this._recordBatchIndex<this.numRecordBatches){let t=this._footer.getRecordBatch(this._recordBatchIndex);if(t&&await this._handle.seek(t.offset))return await this._reader.readMessage(e)}return null}}class B_ extends Dl{constructor(e,t){super(e,t)}_loadVectors(e,t,r){return new hp(t,e.nodes,e.buffers,this.dictionaries).visitMany(r)}}function I_(e,t){return t&&typeof t.autoDestroy==="boolean"?t.autoDestroy:e.autoDestroy}function*b_(e){let t=nt.from(e);try{if(!t.open({autoDestroy:!1}).closed)do yield t;while(!t.reset().open().closed)}finally{t.cancel()}}async function*S_(e){let t=await nt.from(e);try{if(!(await t.open({autoDestroy:!1})).closed)do yield t;while(!(await t.reset().open()).closed)}finally{await t.cancel()}}function lI(e){return new Zi(new B_(e))}function uI(e){let t=e.peek(Oo+7&-8);return t&&t.byteLength>=4?!zc(t)?new Zi(new Dl(e)):new El(new jp(e.read())):new Zi(new Dl(function*(){}()))}async function cI(e){let t=await e.peek(Oo+7&-8);return t&&t.byteLength>=4?!zc(t)?new Xi(new Al(e)):new El(new jp(await e.read())):new Xi(new Al(async function*(){}()))}async function fI(e){let{size:t}=await e.stat(),r=new Ui(e,t);if(t>=J0){if(zc(await r.readAt(0,Oo+7&-8)))return new Vc(new x_(r))}return new Xi(new Al(r))}function T_(e,t){if(Ge(e))return hI(e,t);if(Oe(e))return dI(e,t);throw Error("toDOMStream() must be called with an Iterable or AsyncIterable")}function dI(e,t){let r=null,n=t&&t.type==="bytes"||!1,i=t&&t.highWaterMark||16777216;return new ReadableStream({...t,start(a){s(a,r||(r=e[Symbol.iterator]()))},pull(a){r?s(a,r):a.close()},cancel(){(r&&(r.return&&r.return())||!0)&&(r=null)}},{highWaterMark:n?i:void 0,...t});function s(a,l){let o,u=null,c=a.desiredSize||null;while(!(u=l.next(n?c:null)).done){if(ArrayBuffer.isView(u.value)&&(o=L(u.value)))c!=null&&n&&(c=c-o.byteLength+1),u.value=o;if(a.enqueue(u.value),c!=null&&--c<=0)return}a.close()}}function hI(e,t){let r=null,n=t&&t.type==="bytes"||!1,i=t&&t.highWaterMark||16777216;return new ReadableStream({...t,async start(a){await s(a,r||(r=e[Symbol.asyncIterator]()))},async pull(a){r?await s(a,r):a.close()},async cancel(){(r&&(r.return&&await r.return())||!0)&&(r=null)}},{highWaterMark:n?i:void 0,...t});async function s(a,l){let o,u=null,c=a.desiredSize||null;while(!(u=await l.next(n?c:null)).done){if(ArrayBuffer.isView(u.value)&&(o=L(u.value)))c!=null&&n&&(c=c-o.byteLength+1),u.value=o;if(a.enqueue(u.value),c!=null&&--c<=0)return}a.close()}}function A_(e){return new E_(e)}class E_{constructor(e){this._numChunks=0,this._finished=!1,this._bufferedSize=0;let{["readableStrategy"]:t,["writableStrategy"]:r,["queueingStrategy"]:n="count",...i}=e;this._controller=null,this._builder=q.new(i),this._getSize=n!=="bytes"?F_:D_;let{["highWaterMark"]:s=n==="bytes"?16384:1000}={...t},{["highWaterMark"]:a=n==="bytes"?16384:1000}={...r};this.readable=new ReadableStream({["cancel"]:()=>{this._builder.clear()},["pull"]:(l)=>{this._maybeFlush(this._builder,this._controller=l)},["start"]:(l)=>{this._maybeFlush(this._builder,this._controller=l)}},{highWaterMark:s,size:n!=="bytes"?F_:D_}),this.writable=new WritableStream({["abort"]:()=>{this._builder.clear()},["write"]:()=>{this._maybeFlush(this._builder,this._controller)},["close"]:()=>{this._maybeFlush(this._builder.finish(),this._controller)}},{highWaterMark:a,size:(l)=>this._writeValueAndReturnChunkSize(l)})}_writeValueAndReturnChunkSize(e){let t=this._bufferedSize;return this._bufferedSize=this._getSize(this._builder.append(e)),this._bufferedSize-t}_maybeFlush(e,t){if(t===null)return;if(this._bufferedSize>=t.desiredSize)++this._numChunks&&this._enqueue(t,e.toVector());if(e.finished){if(e.length>0||this._numChunks===0)++this._numChunks&&this._enqueue(t,e.toVector());if(!this._finished&&(this._finished=!0))this._enqueue(t,null)}}_enqueue(e,t){this._bufferedSize=0,this._controller=null,t===null?e.close():e.enqueue(t)}}var F_=(e)=>e.length,D_=(e)=>e.byteLength;function O_(e,t){let r=new Lr,n=null,i=new ReadableStream({async cancel(){await r.close()},async start(l){await a(l,n||(n=await s()))},async pull(l){n?await a(l,n):l.close()}});return{writable:new WritableStream(r,{highWaterMark:16384,...e}),readable:i};async function s(){return await(await nt.from(r)).open(t)}async function a(l,o){let u=l.desiredSize,c=null;while(!(c=await o.next()).done)if(l.enqueue(c.value),u!=null&&--u<=0)return;l.close()}}function k_(e,t){let r=new this(e),n=new Nt(r),i=new ReadableStream({type:"bytes",async cancel(){await n.cancel()},async pull(a){await s(a)},async start(a){await s(a)}},{highWaterMark:16384,...t});return{writable:new WritableStream(r,e),readable:i};async function s(a){let l=null,o=a.desiredSize;while(l=await n.read(o||null))if(a.enqueue(l),o!=null&&(o-=l.byteLength)<=0)return;a.close()}}class ia{eq(e){if(!(e instanceof ia))e=new qi(e);return new N_(this,e)}le(e){if(!(e instanceof ia))e=new qi(e);return new M_(this,e)}ge(e){if(!(e instanceof ia))e=new qi(e);return new L_(this,e)}lt(e){return new Ol(this.ge(e))}gt(e){return new Ol(this.le(e))}ne(e){return new Ol(this.eq(e))}}class qi extends ia{constructor(e){super();this.v=e}}class jc extends ia{constructor(e){super();this.name=e}bind(e){if(!this.colidx){this.colidx=-1;let r=e.schema.fields;for(let n=-1;++n<r.length;)if(r[n].name===this.name){this.colidx=n;break}if(this.colidx<0)throw Error(`Failed to bind Col "${this.name}"`)}let t=this.vector=e.getChildAt(this.colidx);return(r)=>t.get(r)}}class $c{and(...e){return new $p(this,...e)}or(...e){return new Wp(this,...e)}not(){return new Ol(this)}}class Wc extends $c{constructor(e,t){super();this.left=e,this.right=t}bind(e){if(this.left instanceof qi)if(this.right instanceof qi)return this._bindLitLit(e,this.left,this.right);else return this._bindLitCol(e,this.left,this.right);else if(this.right instanceof qi)return this._bindColLit(e,this.left,this.right);else return this._bindColCol(e,this.left,this.right)}}class Hc extends $c{constructor(...e){super();this.children=e}}Hc.prototype.children=Object.freeze([]);class $p extends Hc{constructor(...e){e=e.reduce((t,r)=>t.concat(r instanceof $p?r.children:r),[]);super(...e)}bind(e){let t=this.children.map((r)=>r.bind(e));return(r,n)=>t.every((i)=>i(r,n))}}class Wp extends Hc{constructor(...e){e=e.reduce((t,r)=>t.concat(r instanceof Wp?r.children:r),[]);super(...e)}bind(e){let t=this.children.map((r)=>r.bind(e));return(r,n)=>t.some((i)=>i(r,n))}}class N_ extends Wc{_bindLitLit(e,t,r){let n=t.v==r.v;return()=>n}_bindColCol(e,t,r){let n=t.bind(e),i=r.bind(e);return(s,a)=>n(s,a)==i(s,a)}_bindColLit(e,t,r){let n=t.bind(e);if(t.vector instanceof hn){let i,s=t.vector;if(s.dictionary!==this.lastDictionary)i=s.reverseLookup(r.v),this.lastDictionary=s.dictionary,this.lastKey=i;else i=this.lastKey;if(i===-1)return()=>!1;else return(a)=>s.getKey(a)===i}else return(i,s)=>n(i,s)==r.v}_bindLitCol(e,t,r){return this._bindColLit(e,r,t)}}class M_ extends Wc{_bindLitLit(e,t,r){let n=t.v<=r.v;return()=>n}_bindColCol(e,t,r){let n=t.bind(e),i=r.bind(e);return(s,a)=>n(s,a)<=i(s,a)}_bindColLit(e,t,r){let n=t.bind(e);return(i,s)=>n(i,s)<=r.v}_bindLitCol(e,t,r){let n=r.bind(e);return(i,s)=>t.v<=n(i,s)}}class L_ extends Wc{_bindLitLit(e,t,r){let n=t.v>=r.v;return()=>n}_bindColCol(e,t,r){let n=t.bind(e),i=r.bind(e);return(s,a)=>n(s,a)>=i(s,a)}_bindColLit(e,t,r){let n=t.bind(e);return(i,s)=>n(i,s)>=r.v}_bindLitCol(e,t,r){let n=r.bind(e);return(i,s)=>t.v>=n(i,s)}}class Ol extends $c{constructor(e){super();this.child=e}bind(e){let t=this.child.bind(e);return(r,n)=>!t(r,n)}}Z.prototype.countBy=function(e){return new ai(this.chunks).countBy(e)};Z.prototype.scan=function(e,t){return new ai(this.chunks).scan(e,t)};Z.prototype.scanReverse=function(e,t){return new ai(this.chunks).scanReverse(e,t)};Z.prototype.filter=function(e){return new ai(this.chunks).filter(e)};class ai extends Z{filter(e){return new Nl(this.chunks,e)}scan(e,t){let r=this.chunks,n=r.length;for(let i=-1;++i<n;){let s=r[i];if(t)t(s);for(let a=-1,l=s.length;++a<l;)e(a,s)}}scanReverse(e,t){let r=this.chunks,n=r.length;for(let i=n;--i>=0;){let s=r[i];if(t)t(s);for(let a=s.length;--a>=0;)e(a,s)}}countBy(e){let t=this.chunks,r=t.length,n=typeof e==="string"?new jc(e):e;n.bind(t[r-1]);let i=n.vector;if(!E.isDictionary(i.type))throw Error("countBy currently only supports dictionary-encoded columns");let s=Math.ceil(Math.log(i.length)/Math.log(256)),l=new(s==4?Uint32Array:s>=2?Uint16Array:Uint8Array)(i.dictionary.length);for(let o=-1;++o<r;){let u=t[o];n.bind(u);let c=n.vector.indices;for(let p=-1,y=u.length;++p<y;){let _=c.get(p);if(_!==null)l[_]++}}return new kl(i.dictionary,Ke.from(l))}}class kl extends Z{constructor(e,t){let r=new J([new U("values",e.type),new U("counts",t.type)]);super(new we(r,t.length,[e,t]))}toJSON(){let e=this.getColumnAt(0),t=this.getColumnAt(1),r={};for(let n=-1;++n<this.length;)r[e.get(n)]=t.get(n);return r}}class Nl extends ai{constructor(e,t){super(e);this._predicate=t}scan(e,t){let r=this._chunks,n=r.length;for(let i=-1;++i<n;){let s=r[i],a=this._predicate.bind(s),l=!1;for(let o=-1,u=s.length;++o<u;)if(a(o,s)){if(t&&!l)t(s),l=!0;e(o,s)}}}scanReverse(e,t){let r=this._chunks,n=r.length;for(let i=n;--i>=0;){let s=r[i],a=this._predicate.bind(s),l=!1;for(let o=s.length;--o>=0;)if(a(o,s)){if(t&&!l)t(s),l=!0;e(o,s)}}}count(){let e=0,t=this._chunks,r=t.length;for(let n=-1;++n<r;){let i=t[n],s=this._predicate.bind(i);for(let a=-1,l=i.length;++a<l;)if(s(a,i))++e}return e}*[Symbol.iterator](){let e=this._chunks,t=e.length;for(let r=-1;++r<t;){let n=e[r],i=this._predicate.bind(n);for(let s=-1,a=n.length;++s<a;)if(i(s,n))yield n.get(s)}}filter(e){return new Nl(this._chunks,this._predicate.and(e))}countBy(e){let t=this._chunks,r=t.length,n=typeof e==="string"?new jc(e):e;n.bind(t[r-1]);let i=n.vector;if(!E.isDictionary(i.type))throw Error("countBy currently only supports dictionary-encoded columns");let s=Math.ceil(Math.log(i.length)/Math.log(256)),l=new(s==4?Uint32Array:s>=2?Uint16Array:Uint8Array)(i.dictionary.length);for(let o=-1;++o<r;){let u=t[o],c=this._predicate.bind(u);n.bind(u);let p=n.vector.indices;for(let y=-1,_=u.length;++y<_;){let x=p.get(y);if(x!==null&&c(y,u))l[x]++}}return new kl(i.dictionary,Ke.from(l))}}var FI={...ep,...dp,...Hh,...qh,...zh,...rp};$e.toDOMStream=T_;q.throughDOM=A_;nt.throughDOM=O_;Ri.throughDOM=k_;var Yc=function(){function e(t,r,n,i){var s=this;this.getCell=function(a,l){var o=a<s.headerRows&&l<s.headerColumns,u=a>=s.headerRows&&l<s.headerColumns,c=a<s.headerRows&&l>=s.headerColumns;if(o){var p=["blank"];if(l>0)p.push("level"+a);return{type:"blank",classNames:p.join(" "),content:""}}else if(c){var y=l-s.headerColumns,p=["col_heading","level"+a,"col"+y];return{type:"columns",classNames:p.join(" "),content:s.getContent(s.columnsTable,y,a)}}else if(u){var _=a-s.headerRows,p=["row_heading","level"+l,"row"+_];return{type:"index",id:"T_"+s.uuid+"level"+l+"_row"+_,classNames:p.join(" "),content:s.getContent(s.indexTable,_,l)}}else{var _=a-s.headerRows,y=l-s.headerColumns,p=["data","row"+_,"col"+y],x=s.styler?s.getContent(s.styler.displayValuesTable,_,y):s.getContent(s.dataTable,_,y);return{type:"data",id:"T_"+s.uuid+"row"+_+"_col"+y,classNames:p.join(" "),content:x}}},this.getContent=function(a,l,o){var u=a.getColumnAt(o);if(u===null)return"";var c=s.getColumnTypeId(a,o);switch(c){case f.Timestamp:return s.nanosToDate(u.get(l));default:return u.get(l)}},this.dataTable=Z.from(t),this.indexTable=Z.from(r),this.columnsTable=Z.from(n),this.styler=i?{caption:i.caption,displayValuesTable:Z.from(i.displayValues),styles:i.styles,uuid:i.uuid}:void 0}return Object.defineProperty(e.prototype,"rows",{get:function(){return this.indexTable.length+this.columnsTable.numCols},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.length},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"dataRows",{get:function(){return this.dataTable.length},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"table",{get:function(){return this.dataTable},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"index",{get:function(){return this.indexTable},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!0,configurable:!0}),e.prototype.serialize=function(){return{data:this.dataTable.serialize(),index:this.indexTable.serialize(),columns:this.columnsTable.serialize()}},e.prototype.getColumnTypeId=function(t,r){return t.schema.fields[r].type.typeId},e.prototype.nanosToDate=function(t){return new Date(t/1e6)},e}();var R_=new WeakMap,Hp=new WeakMap;function me(e){let t=R_.get(e);return console.assert(t!=null,"'this' is expected an Event object, but got",e),t}function C_(e){if(e.passiveListener!=null){if(typeof console<"u"&&typeof console.error==="function")console.error("Unable to preventDefault inside passive event listener invocation.",e.passiveListener);return}if(!e.event.cancelable)return;if(e.canceled=!0,typeof e.event.preventDefault==="function")e.event.preventDefault()}function sa(e,t){R_.set(this,{eventTarget:e,event:t,eventPhase:2,currentTarget:e,canceled:!1,stopped:!1,immediateStopped:!1,passiveListener:null,timeStamp:t.timeStamp||Date.now()}),Object.defineProperty(this,"isTrusted",{value:!1,enumerable:!0});let r=Object.keys(t);for(let n=0;n<r.length;++n){let i=r[n];if(!(i in this))Object.defineProperty(this,i,P_(i))}}sa.prototype={get type(){return me(this).event.type},get target(){return me(this).eventTarget},get currentTarget(){return me(this).currentTarget},composedPath(){let e=me(this).currentTarget;if(e==null)return[];return[e]},get NONE(){return 0},get CAPTURING_PHASE(){return 1},get AT_TARGET(){return 2},get BUBBLING_PHASE(){return 3},get eventPhase(){return me(this).eventPhase},stopPropagation(){let e=me(this);if(e.stopped=!0,typeof e.event.stopPropagation==="function")e.event.stopPropagation()},stopImmediatePropagation(){let e=me(this);if(e.stopped=!0,e.immediateStopped=!0,typeof e.event.stopImmediatePropagation==="function")e.event.stopImmediatePropagation()},get bubbles(){return Boolean(me(this).event.bubbles)},get cancelable(){return Boolean(me(this).event.cancelable)},preventDefault(){C_(me(this))},get defaultPrevented(){return me(this).canceled},get composed(){return Boolean(me(this).event.composed)},get timeStamp(){return me(this).timeStamp},get srcElement(){return me(this).eventTarget},get cancelBubble(){return me(this).stopped},set cancelBubble(e){if(!e)return;let t=me(this);if(t.stopped=!0,typeof t.event.cancelBubble==="boolean")t.event.cancelBubble=!0},get returnValue(){return!me(this).canceled},set returnValue(e){if(!e)C_(me(this))},initEvent(){}};Object.defineProperty(sa.prototype,"constructor",{value:sa,configurable:!0,writable:!0});if(typeof window<"u"&&typeof window.Event<"u")Object.setPrototypeOf(sa.prototype,window.Event.prototype),Hp.set(window.Event.prototype,sa);function P_(e){return{get(){return me(this).event[e]},set(t){me(this).event[e]=t},configurable:!0,enumerable:!0}}function DI(e){return{value(){let t=me(this).event;return t[e].apply(t,arguments)},configurable:!0,enumerable:!0}}function AI(e,t){let r=Object.keys(t);if(r.length===0)return e;function n(i,s){e.call(this,i,s)}n.prototype=Object.create(e.prototype,{constructor:{value:n,configurable:!0,writable:!0}});for(let i=0;i<r.length;++i){let s=r[i];if(!(s in e.prototype)){let l=typeof Object.getOwnPropertyDescriptor(t,s).value==="function";Object.defineProperty(n.prototype,s,l?DI(s):P_(s))}}return n}function z_(e){if(e==null||e===Object.prototype)return sa;let t=Hp.get(e);if(t==null)t=AI(z_(Object.getPrototypeOf(e)),e),Hp.set(e,t);return t}function V_(e,t){return new(z_(Object.getPrototypeOf(t)))(e,t)}function j_(e){return me(e).immediateStopped}function $_(e,t){me(e).eventPhase=t}function W_(e,t){me(e).currentTarget=t}function Yp(e,t){me(e).passiveListener=t}var Q_=new WeakMap,H_=1,Y_=2,Kc=3;function Qc(e){return e!==null&&typeof e==="object"}function Ml(e){let t=Q_.get(e);if(t==null)throw TypeError("'this' is expected an EventTarget object, but got another value.");return t}function EI(e){return{get(){let r=Ml(this).get(e);while(r!=null){if(r.listenerType===Kc)return r.listener;r=r.next}return null},set(t){if(typeof t!=="function"&&!Qc(t))t=null;let r=Ml(this),n=null,i=r.get(e);while(i!=null){if(i.listenerType===Kc)if(n!==null)n.next=i.next;else if(i.next!==null)r.set(e,i.next);else r.delete(e);else n=i;i=i.next}if(t!==null){let s={listener:t,listenerType:Kc,passive:!1,once:!1,next:null};if(n===null)r.set(e,s);else n.next=s}},configurable:!0,enumerable:!0}}function OI(e,t){Object.defineProperty(e,`on${t}`,EI(t))}function K_(e){function t(){mn.call(this)}t.prototype=Object.create(mn.prototype,{constructor:{value:t,configurable:!0,writable:!0}});for(let r=0;r<e.length;++r)OI(t.prototype,e[r]);return t}function mn(){if(this instanceof mn){Q_.set(this,new Map);return}if(arguments.length===1&&Array.isArray(arguments[0]))return K_(arguments[0]);if(arguments.length>0){let e=Array(arguments.length);for(let t=0;t<arguments.length;++t)e[t]=arguments[t];return K_(e)}throw TypeError("Cannot call a class as a function")}mn.prototype={addEventListener(e,t,r){if(t==null)return;if(typeof t!=="function"&&!Qc(t))throw TypeError("'listener' should be a function or an object.");let n=Ml(this),i=Qc(r),a=(i?Boolean(r.capture):Boolean(r))?H_:Y_,l={listener:t,listenerType:a,passive:i&&Boolean(r.passive),once:i&&Boolean(r.once),next:null},o=n.get(e);if(o===void 0){n.set(e,l);return}let u=null;while(o!=null){if(o.listener===t&&o.listenerType===a)return;u=o,o=o.next}u.next=l},removeEventListener(e,t,r){if(t==null)return;let n=Ml(this),s=(Qc(r)?Boolean(r.capture):Boolean(r))?H_:Y_,a=null,l=n.get(e);while(l!=null){if(l.listener===t&&l.listenerType===s){if(a!==null)a.next=l.next;else if(l.next!==null)n.set(e,l.next);else n.delete(e);return}a=l,l=l.next}},dispatchEvent(e){if(e==null||typeof e.type!=="string")throw TypeError('"event.type" should be a string.');let t=Ml(this),r=e.type,n=t.get(r);if(n==null)return!0;let i=V_(this,e),s=null;while(n!=null){if(n.once)if(s!==null)s.next=n.next;else if(n.next!==null)t.set(r,n.next);else t.delete(r);else s=n;if(Yp(i,n.passive?n.listener:null),typeof n.listener==="function")try{n.listener.call(this,i)}catch(a){if(typeof console<"u"&&typeof console.error==="function")console.error(a)}else if(n.listenerType!==Kc&&typeof n.listener.handleEvent==="function")n.listener.handleEvent(i);if(j_(i))break;n=n.next}return Yp(i,null),$_(i,0),W_(i,null),!i.defaultPrevented}};Object.defineProperty(mn.prototype,"constructor",{value:mn,configurable:!0,writable:!0});if(typeof window<"u"&&typeof window.EventTarget<"u")Object.setPrototypeOf(mn.prototype,window.EventTarget.prototype);var Ll=function(){return Ll=Object.assign||function(e){for(var t,r=1,n=arguments.length;r<n;r++){t=arguments[r];for(var i in t)if(Object.prototype.hasOwnProperty.call(t,i))e[i]=t[i]}return e},Ll.apply(this,arguments)},Ul;(function(e){e.COMPONENT_READY="streamlit:componentReady",e.SET_COMPONENT_VALUE="streamlit:setComponentValue",e.SET_FRAME_HEIGHT="streamlit:setFrameHeight"})(Ul||(Ul={}));var Ct=function(){function e(){}return e.API_VERSION=1,e.RENDER_EVENT="streamlit:render",e.events=new mn,e.registeredMessageListener=!1,e.setComponentReady=function(){if(!e.registeredMessageListener)window.addEventListener("message",e.onMessageEvent),e.registeredMessageListener=!0;e.sendBackMsg(Ul.COMPONENT_READY,{apiVersion:e.API_VERSION})},e.setFrameHeight=function(t){if(t===void 0)t=document.body.scrollHeight;if(t===e.lastFrameHeight)return;e.lastFrameHeight=t,e.sendBackMsg(Ul.SET_FRAME_HEIGHT,{height:t})},e.setComponentValue=function(t){var r;if(t instanceof Yc)r="dataframe",t=t.serialize();else if(NI(t))r="bytes",t=new Uint8Array(t.buffer);else if(t instanceof ArrayBuffer)r="bytes",t=new Uint8Array(t);else r="json";e.sendBackMsg(Ul.SET_COMPONENT_VALUE,{value:t,dataType:r})},e.onMessageEvent=function(t){var r=t.data.type;switch(r){case e.RENDER_EVENT:e.onRenderMessage(t.data);break}},e.onRenderMessage=function(t){var r=t.args;if(r==null)console.error("Got null args in onRenderMessage. This should never happen"),r={};var n=t.dfs&&t.dfs.length>0?e.argsDataframeToObject(t.dfs):{};r=Ll(Ll({},r),n);var i=Boolean(t.disabled),s=t.theme;if(s)kI(s);var a={disabled:i,args:r,theme:s},l=new CustomEvent(e.RENDER_EVENT,{detail:a});e.events.dispatchEvent(l)},e.argsDataframeToObject=function(t){var r=t.map(function(n){var{key:i,value:s}=n;return[i,e.toArrowTable(s)]});return Object.fromEntries(r)},e.toArrowTable=function(t){var r=t.data,{data:n,index:i,columns:s,styler:a}=r;return new Yc(n,i,s,a)},e.sendBackMsg=function(t,r){window.parent.postMessage(Ll({isStreamlitMessage:!0,type:t},r),"*")},e}();var kI=function(e){var t=document.createElement("style");document.head.appendChild(t),t.innerHTML=`
     :root {
-      --primary-color: `+t.primaryColor+`;
-      --background-color: `+t.backgroundColor+`;
-      --secondary-background-color: `+t.secondaryBackgroundColor+`;
-      --text-color: `+t.textColor+`;
-      --font: `+t.font+`;
+      --primary-color: `+e.primaryColor+`;
+      --background-color: `+e.backgroundColor+`;
+      --secondary-background-color: `+e.secondaryBackgroundColor+`;
+      --text-color: `+e.textColor+`;
+      --font: `+e.font+`;
     }
 
     body {
       background-color: var(--background-color);
       color: var(--text-color);
     }
-  `};function DN(t){var e=!1;try{e=t instanceof BigInt64Array||t instanceof BigUint64Array}catch{}return t instanceof Int8Array||t instanceof Uint8Array||t instanceof Uint8ClampedArray||t instanceof Int16Array||t instanceof Uint16Array||t instanceof Int32Array||t instanceof Uint32Array||t instanceof Float32Array||t instanceof Float64Array||e}var _I=function(){var t=function(e,r){return t=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(n,i){n.__proto__=i}||function(n,i){for(var s in i)i.hasOwnProperty(s)&&(n[s]=i[s])},t(e,r)};return function(e,r){t(e,r);function n(){this.constructor=e}e.prototype=r===null?Object.create(r):(n.prototype=r.prototype,new n)}}(),AN=function(t){_I(e,t);function e(){return t!==null&&t.apply(this,arguments)||this}return e.prototype.componentDidMount=function(){Vt.setFrameHeight()},e.prototype.componentDidUpdate=function(){Vt.setFrameHeight()},e}(ki.default.PureComponent);function j_(t){var e=function(r){_I(n,r);function n(i){var s=r.call(this,i)||this;return s.componentDidMount=function(){Vt.events.addEventListener(Vt.RENDER_EVENT,s.onRenderEvent),Vt.setComponentReady()},s.componentDidUpdate=function(){s.state.componentError!=null&&Vt.setFrameHeight()},s.componentWillUnmount=function(){Vt.events.removeEventListener(Vt.RENDER_EVENT,s.onRenderEvent)},s.onRenderEvent=function(a){var l=a;s.setState({renderData:l.detail})},s.render=function(){return s.state.componentError!=null?ki.default.createElement("div",null,ki.default.createElement("h1",null,"Component Error"),ki.default.createElement("span",null,s.state.componentError.message)):s.state.renderData==null?null:ki.default.createElement(t,{width:window.innerWidth,disabled:s.state.renderData.disabled,args:s.state.renderData.args,theme:s.state.renderData.theme})},s.state={renderData:void 0,componentError:void 0},s}return n.getDerivedStateFromError=function(i){return{componentError:i}},n}(ki.default.PureComponent);return(0,wI.default)(e,t)}var Vr=Ht(Zs()),mr=Ht(ml()),VN=({segments:t,answers:e,initialBank:r,initialFills:n,showFeedback:i,pageFrame:s="none",badPct:a=30})=>{let l=e.length,[c,o]=(0,Vr.useState)(r),[u,d]=(0,Vr.useState)(n),v=(0,Vr.useRef)(null);(0,Vr.useEffect)(()=>{o(r)},[r.join("|")]),(0,Vr.useEffect)(()=>{d(n)},[n.join("|")]);let T=h=>S=>{v.current=h,S.dataTransfer.setData("text/plain",h),S.dataTransfer.effectAllowed="move"},I=h=>h.preventDefault(),D=h=>{h.preventDefault();let S=h.dataTransfer.getData("text/plain");if(!S)return;let A=u.findIndex(E=>E===S);if(A>=0){let E=u.slice();E[A]=null,d(E),o(U=>[...U,S])}v.current=null},ne=h=>S=>{S.preventDefault();let A=S.dataTransfer.getData("text/plain");if(!A)return;let E=c.includes(A),U=u.findIndex(me=>me===A),V=u.slice();U>=0&&(V[U]=null),E&&o(me=>me.filter(ee=>ee!==A)),V[h]&&o(me=>[...me,V[h]]),V[h]=A,d(V),v.current=null},g=h=>{let S=["blank"];if(u[h]&&S.push("filled"),i&&u[h]){let A=u[h].trim().toLowerCase()===e[h].trim().toLowerCase();S.push(A?"correct":"wrong")}return S.join(" ")};window.__DND_CLOZE_STATE__={bank:c,fills:u};let f=s==="none"?null:(0,mr.jsx)("div",{className:`page-frame ${s}`,style:{"--badpct":`${a}%`}});return(0,mr.jsxs)("div",{className:"wrap",children:[f,(0,mr.jsx)("div",{className:"bank",onDrop:D,onDragOver:I,children:c.map((h,S)=>(0,mr.jsx)("div",{className:"chip",draggable:!0,onDragStart:T(h),title:"Drag into a blank",children:h},h+S))}),(0,mr.jsxs)("div",{className:"row",children:[Array.from({length:l}).map((h,S)=>(0,mr.jsxs)(Vr.default.Fragment,{children:[(0,mr.jsx)("span",{className:"seg",children:t[S]}),(0,mr.jsx)("span",{className:g(S),onDrop:ne(S),onDragOver:I,title:u[S]?"Drag back to the bank to remove":"Drop a word here",children:u[S]??" "})]},`seg-${S}`)),(0,mr.jsx)("span",{className:"seg",children:t[l]})]})]})},BI=VN;var q_=Ht(ml()),NN=t=>{let e=t.args;return z_.default.useEffect(()=>{Vt.setFrameHeight()}),z_.default.useEffect(()=>{let r=setInterval(()=>{let n=window.__DND_CLOZE_STATE__;n&&Vt.setComponentValue(n)},120);return()=>clearInterval(r)},[]),(0,q_.jsx)(BI,{segments:e.segments,answers:e.answers,initialBank:e.initialBank,initialFills:e.initialFills,showFeedback:e.showFeedback})},kN=j_(NN),LN=(0,II.createRoot)(document.getElementById("root"));LN.render((0,q_.jsx)(kN,{}));})();
-/*! Bundled license information:
+  `};function NI(e){var t=!1;try{t=e instanceof BigInt64Array||e instanceof BigUint64Array}catch(r){}return e instanceof Int8Array||e instanceof Uint8Array||e instanceof Uint8ClampedArray||e instanceof Int16Array||e instanceof Uint16Array||e instanceof Int32Array||e instanceof Uint32Array||e instanceof Float32Array||e instanceof Float64Array||t}var Bw=Vr(sw()),Gi=Vr(Sw());var xw=function(){var e=function(t,r){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(n,i){n.__proto__=i}||function(n,i){for(var s in i)if(i.hasOwnProperty(s))n[s]=i[s]},e(t,r)};return function(t,r){e(t,r);function n(){this.constructor=t}t.prototype=r===null?Object.create(r):(n.prototype=r.prototype,new n)}}(),dT=function(e){xw(t,e);function t(){return e!==null&&e.apply(this,arguments)||this}return t.prototype.componentDidMount=function(){Ct.setFrameHeight()},t.prototype.componentDidUpdate=function(){Ct.setFrameHeight()},t}(Gi.default.PureComponent);function am(e){var t=function(r){xw(n,r);function n(i){var s=r.call(this,i)||this;return s.componentDidMount=function(){Ct.events.addEventListener(Ct.RENDER_EVENT,s.onRenderEvent),Ct.setComponentReady()},s.componentDidUpdate=function(){if(s.state.componentError!=null)Ct.setFrameHeight()},s.componentWillUnmount=function(){Ct.events.removeEventListener(Ct.RENDER_EVENT,s.onRenderEvent)},s.onRenderEvent=function(a){var l=a;s.setState({renderData:l.detail})},s.render=function(){if(s.state.componentError!=null)return Gi.default.createElement("div",null,Gi.default.createElement("h1",null,"Component Error"),Gi.default.createElement("span",null,s.state.componentError.message));if(s.state.renderData==null)return null;return Gi.default.createElement(e,{width:window.innerWidth,disabled:s.state.renderData.disabled,args:s.state.renderData.args,theme:s.state.renderData.theme})},s.state={renderData:void 0,componentError:void 0},s}return n.getDerivedStateFromError=function(i){return{componentError:i}},n}(Gi.default.PureComponent);return Bw.default(t,e)}var zt=Vr(ca()),Pt=Vr(Pl()),Dw=(e,t)=>e.map((r,n)=>(t[n]??"").trim().toLowerCase()===r.trim().toLowerCase()),wT=({segments:e,answers:t,initialBank:r,initialFills:n,showFeedback:i,pageFrame:s="none",badPct:a=30,onChange:l,onSubmit:o})=>{let u=t.length,[c,p]=zt.useState(r),[y,_]=zt.useState(n),[x,B]=zt.useState(null),re=zt.useRef(null);zt.useEffect(()=>{p(r)},[r.join("|")]),zt.useEffect(()=>{_(n)},[n.join("|")]),zt.useEffect(()=>{if(!i)B(null)},[i]),zt.useEffect(()=>{l?.({bank:c,fills:y})},[c,y]);let h=i||x!==null,d=x??(i?Dw(t,y):null),m=()=>{let ne=Dw(t,y);B(ne),o?.({bank:c,fills:y,correct:ne,score:`${ne.filter(Boolean).length}/${ne.length}`})},b=(ne)=>(ue)=>{if(h){ue.preventDefault();return}re.current=ne,ue.dataTransfer.setData("text/plain",ne),ue.dataTransfer.effectAllowed="move"},T=(ne)=>ne.preventDefault(),O=(ne)=>{if(ne.preventDefault(),h)return;let ue=ne.dataTransfer.getData("text/plain");if(!ue)return;let gn=y.findIndex((es)=>es===ue);if(gn>=0){let es=y.slice();es[gn]=null,_(es),p((Vl)=>[...Vl,ue])}re.current=null},k=(ne)=>(ue)=>{if(ue.preventDefault(),h)return;let gn=ue.dataTransfer.getData("text/plain");if(!gn)return;let es=c.includes(gn),Vl=y.findIndex((la)=>la===gn),aa=y.slice();if(Vl>=0)aa[Vl]=null;if(es)p((la)=>la.filter((Ow)=>Ow!==gn));if(aa[ne])p((la)=>[...la,aa[ne]]);aa[ne]=gn,_(aa),re.current=null},N=(ne)=>{let ue=["blank"];if(y[ne])ue.push("filled");if(d&&y[ne])ue.push(d[ne]?"correct":"wrong");return ue.join(" ")},be=s,G=a;if(x){let ne=x.filter(Boolean).length,ue=x.length||1;be=ne===x.length?"good":"mixed",G=Math.round((ue-ne)/ue*100)}let wr=be==="none"?null:Pt.jsx("div",{className:`page-frame ${be}`,style:{"--badpct":`${G}%`}});return Pt.jsxs("div",{className:"wrap",children:[wr,Pt.jsx("div",{className:"bank",onDrop:O,onDragOver:T,children:c.map((ne,ue)=>Pt.jsx("div",{className:"chip",draggable:!h,onDragStart:b(ne),title:"Drag into a blank",children:ne},ne+ue))}),Pt.jsxs("div",{className:"row",children:[Array.from({length:u}).map((ne,ue)=>Pt.jsxs(zt.default.Fragment,{children:[Pt.jsx("span",{className:"seg",children:e[ue]}),Pt.jsx("span",{className:N(ue),onDrop:k(ue),onDragOver:T,title:y[ue]?"Drag back to the bank to remove":"Drop a word here",children:y[ue]??" "})]},`seg-${ue}`)),Pt.jsx("span",{className:"seg",children:e[u]})]}),o&&Pt.jsx("div",{className:"actions",children:Pt.jsx("button",{className:"submit",onClick:m,disabled:h,children:h&&d?`Score: ${d.filter(Boolean).length}/${d.length}`:"Submit"})})]})},Aw=wT;var lm=Vr(Pl()),bT=600,ST=(e)=>{let t=e.args,r=zl.default.useRef(null),n=zl.default.useRef(JSON.stringify({bank:t.initialBank,fills:t.initialFills,submitted:!1}));zl.default.useEffect(()=>{Ct.setFrameHeight()}),zl.default.useEffect(()=>()=>{if(r.current!==null)window.clearTimeout(r.current)},[]);let i=(l)=>{let o=JSON.stringify(l);if(o===n.current)return;n.current=o,Ct.setComponentValue(l)},s=(l)=>{if(r.current!==null)window.clearTimeout(r.current);r.current=window.setTimeout(()=>{r.current=null,i({bank:l.bank,fills:l.fills,submitted:!1})},bT)},a=(l)=>{if(r.current!==null)window.clearTimeout(r.current),r.current=null;i({...l,submitted:!0})};return lm.jsx(Aw,{segments:t.segments,answers:t.answers,initialBank:t.initialBank,initialFills:t.initialFills,showFeedback:t.showFeedback,pageFrame:t.pageFrame,badPct:t.badPct,onChange:s,onSubmit:a})},xT=am(ST),BT=Ew.createRoot(document.getElementById("root"));BT.render(lm.jsx(xT,{}));})();
 
-react/cjs/react.production.min.js:
-  (**
-   * @license React
-   * react.production.min.js
-   *
-   * Copyright (c) Facebook, Inc. and its affiliates.
-   *
-   * This source code is licensed under the MIT license found in the
-   * LICENSE file in the root directory of this source tree.
-   *)
-
-scheduler/cjs/scheduler.production.min.js:
-  (**
-   * @license React
-   * scheduler.production.min.js
-   *
-   * Copyright (c) Facebook, Inc. and its affiliates.
-   *
-   * This source code is licensed under the MIT license found in the
-   * LICENSE file in the root directory of this source tree.
-   *)
-
-react-dom/cjs/react-dom.production.min.js:
-  (**
-   * @license React
-   * react-dom.production.min.js
-   *
-   * Copyright (c) Facebook, Inc. and its affiliates.
-   *
-   * This source code is licensed under the MIT license found in the
-   * LICENSE file in the root directory of this source tree.
-   *)
-
-react-is/cjs/react-is.production.min.js:
-  (** @license React v16.13.1
-   * react-is.production.min.js
-   *
-   * Copyright (c) Facebook, Inc. and its affiliates.
-   *
-   * This source code is licensed under the MIT license found in the
-   * LICENSE file in the root directory of this source tree.
-   *)
-
-object-assign/index.js:
-  (*
-  object-assign
-  (c) Sindre Sorhus
-  @license MIT
-  *)
-
-react/cjs/react.production.min.js:
-  (** @license React v16.14.0
-   * react.production.min.js
-   *
-   * Copyright (c) Facebook, Inc. and its affiliates.
-   *
-   * This source code is licensed under the MIT license found in the
-   * LICENSE file in the root directory of this source tree.
-   *)
-
-react/cjs/react-jsx-runtime.production.min.js:
-  (**
-   * @license React
-   * react-jsx-runtime.production.min.js
-   *
-   * Copyright (c) Facebook, Inc. and its affiliates.
-   *
-   * This source code is licensed under the MIT license found in the
-   * LICENSE file in the root directory of this source tree.
-   *)
-
-streamlit-component-lib/dist/ArrowTable.js:
-  (**
-   * @license
-   * Copyright 2018-2021 Streamlit Inc.
-   *
-   * Licensed under the Apache License, Version 2.0 (the "License");
-   * you may not use this file except in compliance with the License.
-   * You may obtain a copy of the License at
-   *
-   *    http://www.apache.org/licenses/LICENSE-2.0
-   *
-   * Unless required by applicable law or agreed to in writing, software
-   * distributed under the License is distributed on an "AS IS" BASIS,
-   * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-   * See the License for the specific language governing permissions and
-   * limitations under the License.
-   *)
-
-streamlit-component-lib/dist/streamlit.js:
-  (**
-   * @license
-   * Copyright 2018-2021 Streamlit Inc.
-   *
-   * Licensed under the Apache License, Version 2.0 (the "License");
-   * you may not use this file except in compliance with the License.
-   * You may obtain a copy of the License at
-   *
-   *    http://www.apache.org/licenses/LICENSE-2.0
-   *
-   * Unless required by applicable law or agreed to in writing, software
-   * distributed under the License is distributed on an "AS IS" BASIS,
-   * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-   * See the License for the specific language governing permissions and
-   * limitations under the License.
-   *)
-
-streamlit-component-lib/dist/StreamlitReact.js:
-  (**
-   * @license
-   * Copyright 2018-2021 Streamlit Inc.
-   *
-   * Licensed under the Apache License, Version 2.0 (the "License");
-   * you may not use this file except in compliance with the License.
-   * You may obtain a copy of the License at
-   *
-   *    http://www.apache.org/licenses/LICENSE-2.0
-   *
-   * Unless required by applicable law or agreed to in writing, software
-   * distributed under the License is distributed on an "AS IS" BASIS,
-   * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-   * See the License for the specific language governing permissions and
-   * limitations under the License.
-   *)
-
-streamlit-component-lib/dist/index.js:
-  (**
-   * @license
-   * Copyright 2018-2021 Streamlit Inc.
-   *
-   * Licensed under the Apache License, Version 2.0 (the "License");
-   * you may not use this file except in compliance with the License.
-   * You may obtain a copy of the License at
-   *
-   *    http://www.apache.org/licenses/LICENSE-2.0
-   *
-   * Unless required by applicable law or agreed to in writing, software
-   * distributed under the License is distributed on an "AS IS" BASIS,
-   * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-   * See the License for the specific language governing permissions and
-   * limitations under the License.
-   *)
-*/
+//# debugId=C992F49446DA624564756E2164756E21
 //# sourceMappingURL=bundle.js.map
@@ -1,5 +1,15 @@
 import React, { useEffect, useRef, useState } from "react";
 
+export type ClozeState = {
+  bank: string[];
+  fills: (string | null)[];
+};
+
+export type GradedState = ClozeState & {
+  correct: boolean[];
+  score: string;                    // "c/total"
+};
+
 type Props = {
   segments: string[];               // len = n_blanks + 1
   answers: string[];                // correct tokens per blank
@@ -8,20 +18,40 @@ type Props = {
   showFeedback: boolean;            // add correct/wrong classes
   pageFrame?: "none" | "good" | "mixed"; // optional page-wide border
   badPct?: number;                  // % red for mixed
+  onChange?: (state: ClozeState) => void;   // every bank/fills change
+  onSubmit?: (state: GradedState) => void;  // graded here, on Submit
 };
 
+export const grade = (answers: string[], fills: (string | null)[]): boolean[] =>
+  answers.map((a, i) => (fills[i] ?? "").trim().toLowerCase() === a.trim().toLowerCase());
+
 const DndCloze: React.FC<Props> = ({
-  segments, answers, initialBank, initialFills, showFeedback, pageFrame = "none", badPct = 30
+  segments, answers, initialBank, initialFills, showFeedback, pageFrame = "none", badPct = 30,
+  onChange, onSubmit,
 }) => {
   const nBlanks = answers.length;
   const [bank, setBank] = useState<string[]>(initialBank);
   const [fills, setFills] = useState<(string | null)[]>(initialFills);
+  // graded locally on Submit; the server only hears about it once
+  const [correct, setCorrect] = useState<boolean[] | null>(null);
   const dragging = useRef<string | null>(null);
 
   useEffect(() => { setBank(initialBank); }, [initialBank.join("|")]);
   useEffect(() => { setFills(initialFills); }, [initialFills.join("|")]);
+  useEffect(() => { if (!showFeedback) setCorrect(null); }, [showFeedback]);
+  useEffect(() => { onChange?.({ bank, fills }); }, [bank, fills]);
+
+  const graded = showFeedback || correct !== null;
+  const flags = correct ?? (showFeedback ? grade(answers, fills) : null);
+
+  const submit = () => {
+    const c = grade(answers, fills);
+    setCorrect(c);
+    onSubmit?.({ bank, fills, correct: c, score: `${c.filter(Boolean).length}/${c.length}` });
+  };
 
   const onDragStartChip = (token: string) => (e: React.DragEvent) => {
+    if (graded) { e.preventDefault(); return; }
     dragging.current = token;
     e.dataTransfer.setData("text/plain", token);
     e.dataTransfer.effectAllowed = "move";
@@ -30,6 +60,7 @@ const DndCloze: React.FC<Props> = ({
 
   const onDropBank = (e: React.DragEvent) => {
     e.preventDefault();
+    if (graded) return;
     const tok = e.dataTransfer.getData("text/plain");
     if (!tok) return;
     const idx = fills.findIndex(f => f === tok);
@@ -43,6 +74,7 @@ const DndCloze: React.FC<Props> = ({
   };
   const onDropBlank = (i: number) => (e: React.DragEvent) => {
     e.preventDefault();
+    if (graded) return;
     const tok = e.dataTransfer.getData("text/plain");
     if (!tok) return;
     const inBank = bank.includes(tok);
@@ -60,20 +92,25 @@ const DndCloze: React.FC<Props> = ({
   const blankClass = (i: number) => {
     const base = ["blank"];
     if (fills[i]) base.push("filled");
-    if (showFeedback && fills[i]) {
-      const ok = fills[i]!.trim().toLowerCase() === answers[i].trim().toLowerCase();
-      base.push(ok ? "correct" : "wrong");
+    if (flags && fills[i]) {
+      base.push(flags[i] ? "correct" : "wrong");
     }
     return base.join(" ");
   };
 
-  // expose state to Streamlit wrapper
-  (window as any).__DND_CLOZE_STATE__ = { bank, fills };
-
-  // optional page-wide frame (inserted here so it renders inside the iframe)
+  // optional page-wide frame (inserted here so it renders inside the iframe);
+  // after a local Submit it follows the local grade straight away
+  let frameKind = pageFrame;
+  let framePct = badPct;
+  if (correct) {
+    const c = correct.filter(Boolean).length;
+    const total = correct.length || 1;
+    frameKind = c === correct.length ? "good" : "mixed";
+    framePct = Math.round((total - c) / total * 100);
+  }
   const frame =
-    pageFrame === "none" ? null :
-    <div className={`page-frame ${pageFrame}`} style={{"--badpct": `${badPct}%`} as React.CSSProperties} />;
+    frameKind === "none" ? null :
+    <div className={`page-frame ${frameKind}`} style={{"--badpct": `${framePct}%`} as React.CSSProperties} />;
 
   return (
     <div className="wrap">
@@ -83,7 +120,7 @@ const DndCloze: React.FC<Props> = ({
           <div
             key={tok + idx}
             className="chip"
-            draggable
+            draggable={!graded}
             onDragStart={onDragStartChip(tok)}
             title="Drag into a blank"
           >
@@ -108,6 +145,14 @@ const DndCloze: React.FC<Props> = ({
         ))}
         <span className="seg">{segments[nBlanks]}</span>
       </div>
+
+      {onSubmit && (
+        <div className="actions">
+          <button className="submit" onClick={submit} disabled={graded}>
+            {graded && flags ? `Score: ${flags.filter(Boolean).length}/${flags.length}` : "Submit"}
+          </button>
+        </div>
+      )}
     </div>
   );
 };
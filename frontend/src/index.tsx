@@ -1,7 +1,7 @@
 import React from "react";
 import { createRoot } from "react-dom/client";
 import { Streamlit, withStreamlitConnection } from "streamlit-component-lib";
-import DndCloze from "./DndCloze";
+import DndCloze, { ClozeState, GradedState } from "./DndCloze";
 
 type Args = {
   segments: string[];
@@ -9,26 +9,54 @@ type Args = {
   initialBank: string[];
   initialFills: (string | null)[];
   showFeedback: boolean;
+  pageFrame?: "none" | "good" | "mixed";
+  badPct?: number;
 };
 
+// Drags are reported once the student pauses; every send is a server rerun.
+const DEBOUNCE_MS = 600;
+
 const App = (props: any) => {
   const args = props.args as Args;
+  const timer = React.useRef<number | null>(null);
+  // Last value handed to Streamlit (seeded with what the server already has),
+  // so unchanged state is never re-sent.
+  const lastSent = React.useRef<string>(
+    JSON.stringify({ bank: args.initialBank, fills: args.initialFills, submitted: false })
+  );
 
   React.useEffect(() => {
     // Size to content
     Streamlit.setFrameHeight();
   });
 
-  // Push state upstream whenever internal state changes (on a small interval)
-  React.useEffect(() => {
-    const iv = setInterval(() => {
-      // @ts-ignore
-      const state = (window as any).__DND_CLOZE_STATE__;
-      if (state) Streamlit.setComponentValue(state);
-    }, 120);
-    return () => clearInterval(iv);
+  React.useEffect(() => () => {
+    if (timer.current !== null) window.clearTimeout(timer.current);
   }, []);
 
+  const send = (value: object) => {
+    const s = JSON.stringify(value);
+    if (s === lastSent.current) return;
+    lastSent.current = s;
+    Streamlit.setComponentValue(value);
+  };
+
+  const onChange = (state: ClozeState) => {
+    if (timer.current !== null) window.clearTimeout(timer.current);
+    timer.current = window.setTimeout(() => {
+      timer.current = null;
+      send({ bank: state.bank, fills: state.fills, submitted: false });
+    }, DEBOUNCE_MS);
+  };
+
+  const onSubmit = (state: GradedState) => {
+    if (timer.current !== null) {
+      window.clearTimeout(timer.current);
+      timer.current = null;
+    }
+    send({ ...state, submitted: true });
+  };
+
   return (
     <DndCloze
       segments={args.segments}
@@ -36,6 +64,10 @@ const App = (props: any) => {
       initialBank={args.initialBank}
       initialFills={args.initialFills}
       showFeedback={args.showFeedback}
+      pageFrame={args.pageFrame}
+      badPct={args.badPct}
+      onChange={onChange}
+      onSubmit={onSubmit}
     />
   );
 };
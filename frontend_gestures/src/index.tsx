@@ -1,4 +1,5 @@
-import React, { useEffect, useRef, useState } from "react";
+import React, { useEffect, useRef } from "react";
+import { createRoot } from "react-dom/client";
 import { withStreamlitConnection, Streamlit, ComponentProps } from "streamlit-component-lib";
 import "./styles.css";
 
@@ -7,108 +8,203 @@ type Item = {
   title: string;
   subtitle?: string;
   selected?: boolean;
+  count?: [number, number]; // selected / total dotpoints under the card
 };
 
 type Props = ComponentProps & {
   args: {
     items: Item[];
-    instructions?: string;
-    longPressMs?: number; // default 450
+    ack?: number | null;       // nonce of the last batch the server applied
+    clickToggles?: boolean;    // leaf cards: a click selects instead of opening
+    longPressMs?: number;      // default 450
+    flushMs?: number;          // default 700
   };
 };
 
-const GestureGrid: React.FC<Props> = ({ args, disabled }) => {
-  const { items, instructions, longPressMs = 450 } = args;
-
-  // Render a card that detects double click and long-press.
-  const Card: React.FC<{ item: Item }> = ({ item }) => {
-    const [pressPct, setPressPct] = useState(0);
-    const timerRef = useRef<number | null>(null);
-    const startRef = useRef<number>(0);
-    const rafRef = useRef<number | null>(null);
-
-    const onPointerDown = (e: React.PointerEvent) => {
-      if (disabled) return;
-      startRef.current = performance.now();
-      setPressPct(0);
-
-      const step = () => {
-        const elapsed = performance.now() - startRef.current;
-        const pct = Math.min(100, (elapsed / longPressMs) * 100);
-        setPressPct(pct);
-        if (pct < 100) rafRef.current = requestAnimationFrame(step);
-      };
-      rafRef.current = requestAnimationFrame(step);
-
-      // Fire select after longPressMs
-      timerRef.current = window.setTimeout(() => {
-        cleanupTimers();
-        sendEvent("select", item.id);
-      }, longPressMs);
-    };
+type Op = [string, boolean];
 
-    const cleanupTimers = () => {
-      if (timerRef.current) {
-        clearTimeout(timerRef.current);
-        timerRef.current = null;
-      }
-      if (rafRef.current) {
-        cancelAnimationFrame(rafRef.current);
-        rafRef.current = null;
-      }
-      setPressPct(0);
-    };
+type CardProps = {
+  title: string;
+  sub?: string;
+  hint: string;
+  selected: boolean;
+  disabled: boolean;
+  longPressMs: number;
+  onLongPress: () => void;
+  onClick: () => void;
+};
 
-    const onPointerUp = (e: React.PointerEvent) => {
-      cleanupTimers();
-    };
-    const onPointerLeave = (e: React.PointerEvent) => {
-      cleanupTimers();
+// A card that detects click and long-press. The progress bar is moved by
+// writing to its style from the animation frame, so a press never re-renders.
+const Card: React.FC<CardProps> = ({ title, sub, hint, selected, disabled, longPressMs, onLongPress, onClick }) => {
+  const ringRef = useRef<HTMLDivElement | null>(null);
+  const fillRef = useRef<HTMLDivElement | null>(null);
+  const timerRef = useRef<number | null>(null);
+  const rafRef = useRef<number | null>(null);
+  const startRef = useRef(0);
+  const longPressed = useRef(false);
+
+  const setBar = (pct: number) => {
+    if (fillRef.current) fillRef.current.style.transform = `scaleX(${pct})`;
+    if (ringRef.current) ringRef.current.style.visibility = pct > 0 ? "visible" : "hidden";
+  };
+
+  const cleanupTimers = () => {
+    if (timerRef.current !== null) {
+      clearTimeout(timerRef.current);
+      timerRef.current = null;
+    }
+    if (rafRef.current !== null) {
+      cancelAnimationFrame(rafRef.current);
+      rafRef.current = null;
+    }
+    setBar(0);
+  };
+
+  useEffect(() => cleanupTimers, []);
+
+  const onPointerDown = (e: React.PointerEvent) => {
+    if (disabled || e.button > 0) return;
+    longPressed.current = false;
+    startRef.current = performance.now();
+
+    const step = () => {
+      const pct = Math.min(1, (performance.now() - startRef.current) / longPressMs);
+      setBar(pct);
+      rafRef.current = pct < 1 ? requestAnimationFrame(step) : null;
     };
+    rafRef.current = requestAnimationFrame(step);
 
-    const onDoubleClick = (e: React.MouseEvent) => {
-      if (disabled) return;
+    // Toggle after longPressMs
+    timerRef.current = window.setTimeout(() => {
       cleanupTimers();
-      sendEvent("open", item.id);
-    };
+      longPressed.current = true;
+      onLongPress();
+    }, longPressMs);
+  };
 
-    const sendEvent = (type: "select" | "open", id: string) => {
-      Streamlit.setComponentValue({ type, id });
-    };
+  const onCardClick = () => {
+    // the click that ends a long-press is not a click
+    if (longPressed.current) {
+      longPressed.current = false;
+      return;
+    }
+    onClick();
+  };
 
-    return (
-      <div
-        className={`card ${item.selected ? "selected" : ""}`}
-        onPointerDown={onPointerDown}
-        onPointerUp={onPointerUp}
-        onPointerLeave={onPointerLeave}
-        onDoubleClick={onDoubleClick}
-      >
-        <div className="card-title">{item.title}</div>
-        {item.subtitle && <div className="card-sub">{item.subtitle}</div>}
-        <div className="hint">Long-press to Select / Unselect · Double-click to Open</div>
-
-        {/* Progress ring/bar for the long press */}
-        {pressPct > 0 && (
-          <div className="progress-bar">
-            <div className="progress-fill" style={{ width: `${pressPct}%` }} />
-          </div>
-        )}
+  return (
+    <div
+      className={`card ${selected ? "selected" : ""}`}
+      role="button"
+      aria-pressed={selected}
+      onPointerDown={onPointerDown}
+      onPointerUp={cleanupTimers}
+      onPointerLeave={cleanupTimers}
+      onPointerCancel={cleanupTimers}
+      onClick={onCardClick}
+      onContextMenu={(e) => e.preventDefault()}
+    >
+      <div className="card-title">{title}</div>
+      {sub && <div className="card-sub">{sub}</div>}
+      <div className="hint">{hint}</div>
+
+      {/* Progress bar for the long press */}
+      <div className="progress-bar" ref={ringRef} style={{ visibility: "hidden" }}>
+        <div className="progress-fill" ref={fillRef} />
       </div>
-    );
+    </div>
+  );
+};
+
+const GestureGrid: React.FC<Props> = ({ args, disabled }) => {
+  const { items, ack = null, clickToggles = false, longPressMs = 450, flushMs = 700 } = args;
+
+  // Toggles are shown immediately and queued in `pending`; a flush sends them
+  // as one value and keeps them in `inflight` until a render acks the nonce.
+  const pending = useRef(new Map<string, boolean>());
+  const inflight = useRef(new Map<string, [boolean, number]>());
+  const flushTimer = useRef<number | null>(null);
+  const lastNonce = useRef(0);
+  const [, setTick] = React.useState(0);
+  const repaint = () => setTick((n) => n + 1);
+
+  if (ack != null) {
+    inflight.current.forEach(([, nonce], id) => {
+      if (nonce <= ack) inflight.current.delete(id);
+    });
+  }
+
+  const shown = (it: Item) => {
+    if (pending.current.has(it.id)) return pending.current.get(it.id)!;
+    if (inflight.current.has(it.id)) return inflight.current.get(it.id)![0];
+    return !!it.selected;
   };
 
+  const flush = (openId: string | null) => {
+    if (flushTimer.current !== null) {
+      window.clearTimeout(flushTimer.current);
+      flushTimer.current = null;
+    }
+    if (!pending.current.size && openId === null) return;
+    const nonce = (lastNonce.current = Math.max(Date.now(), lastNonce.current + 1));
+    const ops: Op[] = Array.from(pending.current);
+    ops.forEach(([id, on]) => inflight.current.set(id, [on, nonce]));
+    pending.current.clear();
+    Streamlit.setComponentValue({ ops, open: openId, nonce });
+  };
+
+  const toggle = (it: Item) => {
+    if (disabled) return;
+    pending.current.set(it.id, !shown(it));
+    repaint();
+    if (flushTimer.current !== null) window.clearTimeout(flushTimer.current);
+    flushTimer.current = window.setTimeout(() => flush(null), flushMs);
+  };
+
+  const open = (it: Item) => {
+    if (!disabled) flush(it.id);
+  };
+
+  useEffect(() => {
+    const onHide = () => flush(null);
+    window.addEventListener("pagehide", onHide);
+    return () => window.removeEventListener("pagehide", onHide);
+  }, []);
+
   useEffect(() => {
     Streamlit.setFrameHeight();
   }, [items, disabled]);
 
   return (
     <div className="grid">
-      {items.map((it) => (
-        <Card key={it.id} item={it} />
-      ))}
+      {items.map((it) => {
+        const on = shown(it);
+        const local = pending.current.has(it.id) || inflight.current.has(it.id);
+        let sub = it.subtitle;
+        if (it.count) {
+          // a local toggle selects/clears the whole subtree
+          const [n, total] = it.count;
+          sub = `${local ? (on ? total : 0) : n} of ${total} dotpoints selected`;
+        }
+        return (
+          <Card
+            key={it.id}
+            title={it.title}
+            sub={sub}
+            selected={on}
+            disabled={!!disabled}
+            longPressMs={longPressMs}
+            hint={clickToggles
+              ? "Click or long-press to Select / Unselect"
+              : "Click to Open · Long-press to Select / Unselect"}
+            onLongPress={() => toggle(it)}
+            onClick={() => (clickToggles ? toggle(it) : open(it))}
+          />
+        );
+      })}
     </div>
   );
 };
 
-export default withStreamlitConnection(GestureGrid);
+const Connected = withStreamlitConnection(GestureGrid);
+createRoot(document.getElementById("root")!).render(<Connected />);
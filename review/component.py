@@ -0,0 +1,80 @@
+"""Virtualized Kept/Removed review list (``frontend_review/build``).
+
+The whole row list goes to the browser in one payload; the component renders
+only the rows in view, toggles Kept/Removed locally, and reports back once,
+when the user presses Apply or Submit.  A toggle therefore costs no rerun and
+no deltas, however many dotpoints are under review.
+"""
+
+from typing import Callable, List, Sequence, Tuple
+
+import streamlit as st
+
+from common.components import get_component, has_component
+from common.ui import stable_key_tuple
+
+Item = Tuple[str, str, str, str]
+
+
+def _rows_payload(rows: Sequence[Item]) -> List[List[str]]:
+    return [[f"{s} → {m} → {iq}", dp] for s, m, iq, dp in rows]
+
+
+def _fallback(rows: Sequence[Item], key: str, apply_label: str, submit_label: str, on_result):
+    labels = [f"{dp} — {s} → {m} → {iq}" for s, m, iq, dp in rows]
+    picked = st.multiselect("Mark as removed", range(len(rows)), key=f"{key}:fallback",
+                            format_func=lambda i: labels[i])
+    st.info(f"Kept: {len(rows) - len(picked)}   |   Removed: {len(picked)}")
+
+    def press(action):
+        on_result(action, sorted(st.session_state.get(f"{key}:fallback", [])))
+
+    c1, c2 = st.columns(2)
+    c1.button(apply_label, key=f"{key}:apply", use_container_width=True,
+              on_click=press, args=("apply",))
+    c2.button(submit_label, key=f"{key}:submit", type="primary", use_container_width=True,
+              on_click=press, args=("submit",))
+
+
+def review_list(
+    rows: Sequence[Item],
+    key: str,
+    on_result: Callable[[str, List[int]], None],
+    apply_label: str = "Apply changes",
+    submit_label: str = "Submit & Continue",
+    height: int = 560,
+):
+    """Render ``rows`` for review.
+
+    ``on_result(action, removed)`` is called from the widget callback once per
+    Apply/Submit press, before the rerun it causes: ``action`` is ``"apply"``
+    or ``"submit"`` and ``removed`` lists the indexes into ``rows`` marked
+    Removed.
+    """
+    if not has_component("review_list"):
+        return _fallback(rows, key, apply_label, submit_label, on_result)
+
+    # Lets the browser keep its local toggles across reruns that re-send the
+    # same list, and lets us ignore an answer given for a list that changed.
+    # (a digest, not hash(): the browser may answer a different worker process)
+    version = stable_key_tuple(field for row in rows for field in row)
+    n = len(rows)
+
+    def changed():
+        value = st.session_state.get(key)
+        if not value or value.get("nonce") == st.session_state.get(f"{key}:nonce"):
+            return
+        st.session_state[f"{key}:nonce"] = value.get("nonce")
+        if value.get("version") != version:
+            st.session_state[f"{key}:stale"] = True
+            return
+        removed = sorted({int(i) for i in value.get("removed", []) if 0 <= int(i) < n})
+        on_result(value.get("action"), removed)
+
+    get_component("review_list")(
+        rows=_rows_payload(rows), version=version,
+        applyLabel=apply_label, submitLabel=submit_label, height=height,
+        key=key, default=None, on_change=changed,
+    )
+    if st.session_state.pop(f"{key}:stale", False):
+        st.warning("The list changed while you were reviewing it; please review again.")
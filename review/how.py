@@ -21,9 +21,7 @@ def page_cram_how():
     st.write("")
     mid = st.columns(3)[1]
     with mid:
-        if st.button("Proceed", type="primary", use_container_width=True):
-            if mode.startswith("Prioritization"):
-                go("weakness_report")   # → FP engine (DnD cloze flow)
-            else:
-                # If you add an SR engine route later, swap this to that route.
-                go("srs_subjects")
+        # Prioritization → FP weakness workflow (DnD cloze flow); if you add an
+        # SR engine route later, swap srs_subjects to that route.
+        st.button("Proceed", type="primary", use_container_width=True, on_click=go,
+                  args=("weakness_report" if mode.startswith("Prioritization") else "srs_subjects",))
@@ -0,0 +1 @@
+from .search import page_search
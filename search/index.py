@@ -0,0 +1,144 @@
+"""Inverted index over dotpoint, IQ and module text.
+
+Built once per compiled syllabus (see ``search.search._search_index``) and
+shared by every session.  Two layers:
+
+* token postings: term -> sorted node IDs, kept separately per level
+  (dotpoints, IQs, modules), so an IQ or module hit scores its whole
+  contiguous dotpoint range with one slice add;
+* trigram postings over the vocabulary: trigram -> term IDs, so a partial or
+  in-word query token ("chatel", "osmo") finds its terms by intersecting a
+  few short lists instead of scanning the vocabulary.
+
+Scores are accumulated in a NumPy vector over dotpoint IDs: per query token
+``idf * field weight * match quality``, plus a bonus per matched token so
+hits that cover the whole query rank first.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from array import array
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from data.index import SyllabusIndex
+from data.text import char_ngrams, tokenize
+
+# field weights: a hit in the dotpoint itself beats one in its IQ or module
+W_DOTPOINT, W_IQ, W_MODULE = 3.0, 1.5, 1.0
+# match quality: whole term, prefix of a term, somewhere inside a term
+Q_EXACT, Q_PREFIX, Q_INFIX = 1.0, 0.8, 0.5
+COVERAGE_BONUS = 100.0
+
+
+class SearchIndex:
+    def __init__(self, idx: SyllabusIndex):
+        self.idx = idx
+        levels = (
+            (idx.dotpoints, W_DOTPOINT),
+            (idx.iqs, W_IQ),
+            (idx.modules, W_MODULE),
+        )
+        vocab: Dict[str, int] = {}
+        # per level: term ID -> node IDs containing it
+        self._postings: List[Dict[int, array]] = []
+        for texts, _ in levels:
+            post: Dict[int, array] = defaultdict(lambda: array("I"))
+            for node, text in enumerate(texts):
+                for tok in set(tokenize(text)):
+                    tid = vocab.setdefault(tok, len(vocab))
+                    post[tid].append(node)
+            self._postings.append(dict(post))
+        self._weights = [w for _, w in levels]
+        self._sizes = [len(idx.dotpoints), len(idx.iqs), len(idx.modules)]
+
+        self.terms: List[str] = [""] * len(vocab)
+        for tok, tid in vocab.items():
+            self.terms[tid] = tok
+        self._vocab = vocab
+        self._sorted_terms: List[Tuple[str, int]] = sorted(vocab.items())
+        self._sorted_keys = [t for t, _ in self._sorted_terms]
+
+        tri: Dict[str, array] = defaultdict(lambda: array("I"))
+        for tok, tid in vocab.items():
+            for g in char_ngrams(tok):
+                tri[g].append(tid)
+        self._trigrams = dict(tri)
+
+        # dotpoint ranges for IQ / module hits
+        self._iq_lo = np.frombuffer(bytes(idx.iq_dp), dtype=np.uint32).astype(np.int64)
+        self._mod_lo = self._iq_lo[np.frombuffer(bytes(idx.mod_iq), dtype=np.uint32)]
+
+    # ---------- term matching ----------
+
+    def _idf(self, tid: int, level: int) -> float:
+        n = len(self._postings[level].get(tid, ()))
+        return math.log(1.0 + (self._sizes[level] - n + 0.5) / (n + 0.5))
+
+    def _match_terms(self, q: str) -> List[Tuple[int, float]]:
+        """Vocabulary terms matched by one query token, with match quality."""
+        out: Dict[int, float] = {}
+        if len(q) < 3:
+            i = bisect.bisect_left(self._sorted_keys, q)
+            while i < len(self._sorted_keys) and self._sorted_keys[i].startswith(q):
+                tok, tid = self._sorted_terms[i]
+                out[tid] = Q_EXACT if tok == q else Q_PREFIX
+                i += 1
+            return list(out.items())
+
+        grams = sorted(char_ngrams(q),
+                       key=lambda g: len(self._trigrams.get(g, ())))
+        first = self._trigrams.get(grams[0])
+        if first is None:
+            return []
+        cands = set(first)
+        for g in grams[1:]:
+            cands.intersection_update(self._trigrams.get(g, ()))
+            if not cands:
+                return []
+        for tid in cands:
+            term = self.terms[tid]
+            if term == q:
+                out[tid] = Q_EXACT
+            elif term.startswith(q):
+                out[tid] = Q_PREFIX
+            elif q in term:
+                out[tid] = Q_INFIX
+        return list(out.items())
+
+    # ---------- querying ----------
+
+    def search(self, query: str) -> np.ndarray:
+        """Dotpoint IDs matching ``query``, best first."""
+        qtoks = list(dict.fromkeys(tokenize(query)))
+        if not qtoks:
+            return np.empty(0, dtype=np.int64)
+
+        n = len(self.idx.dotpoints)
+        scores = np.zeros(n, dtype=np.float64)
+        for q in qtoks:
+            tok_scores = np.zeros(n, dtype=np.float64)
+            for tid, quality in self._match_terms(q):
+                for level, post in enumerate(self._postings):
+                    nodes = post.get(tid)
+                    if nodes is None:
+                        continue
+                    w = self._weights[level] * quality * self._idf(tid, level)
+                    ids = np.frombuffer(nodes, dtype=np.uint32)
+                    if level == 0:
+                        np.maximum.at(tok_scores, ids, w)
+                    else:
+                        lo_arr = self._iq_lo if level == 1 else self._mod_lo
+                        for node in ids.tolist():
+                            lo, hi = lo_arr[node], lo_arr[node + 1]
+                            np.maximum(tok_scores[lo:hi], w, out=tok_scores[lo:hi])
+            hit = tok_scores > 0
+            scores[hit] += tok_scores[hit] + COVERAGE_BONUS
+
+        found = np.flatnonzero(scores)
+        # stable sort keeps document order among equal scores
+        return found[np.argsort(-scores[found], kind="stable")]
@@ -0,0 +1,80 @@
+import time
+
+import streamlit as st
+from common.ui import topbar
+from data.data import load_all_subjects
+from data.index import SyllabusIndex
+from search.index import SearchIndex
+from selection.state import sync_session
+
+PAGE_SIZE = 20
+
+# One index per compiled syllabus, shared by every session in the process.
+# Keyed by the syllabus fingerprint; the index object itself is not hashed.
+@st.cache_resource(show_spinner="Building search index…", max_entries=2)
+def _search_index(fingerprint: str, _idx: SyllabusIndex) -> SearchIndex:
+    return SearchIndex(_idx)
+
+def get_search_index(idx: SyllabusIndex) -> SearchIndex:
+    return _search_index(idx.fingerprint, idx)
+
+def _toggle(did: int):
+    sel = st.session_state["sel_dotpoints"]
+    sel.set_id(did, not sel.has_id(did))
+
+def _add_all(ids):
+    sel = st.session_state["sel_dotpoints"]
+    for did in ids:
+        sel.set_id(did, True)
+
+def _set_page(p: int):
+    st.session_state["search:page"] = p
+
+def page_search():
+    topbar("Search dotpoints", back_to="home")
+
+    # Search is global: make sure lazily sharded subjects are all in the index.
+    idx = load_all_subjects()
+    if idx is not st.session_state["_IDX"]:
+        sync_session(st.session_state, idx)
+    sindex = get_search_index(idx)
+    sel = st.session_state["sel_dotpoints"]
+
+    query = st.text_input("Search dotpoints, IQs and modules", key="search:q",
+                          placeholder="e.g., osmosis; Le Chatelier; projectile")
+    if st.session_state.get("search:last_q") != query:
+        st.session_state["search:last_q"] = query
+        st.session_state["search:page"] = 0
+    if not query.strip():
+        st.caption(f"{idx.n_dotpoints} dotpoints indexed.")
+        return
+
+    t0 = time.perf_counter()
+    hits = sindex.search(query)
+    ms = (time.perf_counter() - t0) * 1000
+
+    n_pages = max(1, -(-len(hits) // PAGE_SIZE))
+    page = min(st.session_state.get("search:page", 0), n_pages - 1)
+    shown = hits[page * PAGE_SIZE:(page + 1) * PAGE_SIZE].tolist()
+    st.caption(f"{len(hits)} hits in {ms:.1f} ms — page {page + 1} of {n_pages}")
+
+    for did in shown:
+        s, m, iq, dp = idx.items[did]
+        selected = sel.has_id(did)
+        with st.container(border=True):
+            c1, c2 = st.columns([5, 1], vertical_alignment="center")
+            with c1:
+                st.caption(f"{s} → {m} → {iq}")
+                st.write(f"**{dp}**")
+            with c2:
+                st.button("✓ Added" if selected else "Add", key=f"search:add:{did}",
+                          type="primary" if selected else "secondary",
+                          on_click=_toggle, args=(did,), use_container_width=True)
+
+    c1, c2, c3 = st.columns(3)
+    c1.button("← Prev", disabled=page == 0, use_container_width=True,
+              on_click=_set_page, args=(page - 1,))
+    c2.button("Add all on this page", use_container_width=True,
+              on_click=_add_all, args=(shown,))
+    c3.button("Next →", disabled=page >= n_pages - 1, use_container_width=True,
+              on_click=_set_page, args=(page + 1,))
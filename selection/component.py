@@ -0,0 +1,53 @@
+"""Long-press / click card grid (``frontend_gestures/build``).
+
+Select/unselect gestures are applied to the cards in the browser straight
+away and queued; the queue is flushed to Streamlit as one value after a short
+pause (or together with an Open), so a run of toggles costs a single rerun.
+Each flush carries a nonce which the next render echoes back as ``ack``; until
+then the browser keeps showing its own, newer, selection state.
+"""
+
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import streamlit as st
+
+from common.components import get_component, has_component
+
+Op = Tuple[str, bool]
+
+
+def available() -> bool:
+    return has_component("gesture_grid")
+
+
+def gesture_grid(
+    items: Sequence[dict],
+    key: str,
+    on_batch: Callable[[List[Op], Optional[str]], None],
+    click_toggles: bool = False,
+    long_press_ms: int = 450,
+    flush_ms: int = 700,
+):
+    """Render ``items`` (``{"id", "title", "selected", "count"?}``) as cards.
+
+    ``on_batch(ops, open_id)`` is called from the widget callback, before the
+    rerun it causes, once per flush: ``ops`` is a list of ``(id, on)`` in the
+    order the user made them and ``open_id`` is the card opened, if any.
+    With ``click_toggles`` a plain click selects too (for leaf cards).
+    """
+    nonce_key = f"{key}:nonce"
+
+    def changed():
+        value = st.session_state.get(key)
+        if not value or value.get("nonce") == st.session_state.get(nonce_key):
+            return
+        st.session_state[nonce_key] = value.get("nonce")
+        ops = [(str(i), bool(on)) for i, on in value.get("ops", [])]
+        open_id = value.get("open")
+        on_batch(ops, None if open_id is None else str(open_id))
+
+    get_component("gesture_grid")(
+        items=list(items), ack=st.session_state.get(nonce_key),
+        clickToggles=click_toggles, longPressMs=long_press_ms, flushMs=flush_ms,
+        key=key, default=None, on_change=changed,
+    )
@@ -0,0 +1,162 @@
+"""Selection state kept as a bitmap over compiled dotpoint IDs.
+
+``DotpointSelection`` replaces the old ``set`` of ``(subject, module, iq,
+dotpoint)`` tuples in ``st.session_state["sel_dotpoints"]``.  It stores one
+byte per dotpoint ID and keeps per-subject / module / IQ selected counts up to
+date on every change, so:
+
+* "is anything under this card selected?" and "n of m selected" are O(1);
+* selecting or clearing a whole subtree is a slice assignment over its
+  contiguous ID range.
+
+It still quacks like the old set (``add``/``discard``/``update``/``in``/
+iteration over tuples), so ``review_box`` and ``begin_fp_from_selection`` keep
+seeing ``(subject, module, iq, dotpoint)`` items.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Iterator, MutableMapping
+
+from data.data import remap_between
+from data.index import Item, SyllabusIndex
+
+
+class DotpointSelection:
+    def __init__(self, idx: SyllabusIndex, items: Iterable[Item] = ()):
+        self.idx = idx
+        self._bits = bytearray(idx.n_dotpoints)
+        self._n = 0
+        self._iq_n = array("I", bytes(4 * idx.n_iqs))
+        self._mod_n = array("I", bytes(4 * idx.n_modules))
+        self._subj_n = array("I", bytes(4 * idx.n_subjects))
+        self.update(items)
+
+    # ---------- ID-level operations ----------
+
+    def _bump(self, qid: int, delta: int):
+        idx = self.idx
+        mid = idx.iq_mod[qid]
+        self._iq_n[qid] += delta
+        self._mod_n[mid] += delta
+        self._subj_n[idx.mod_subj[mid]] += delta
+        self._n += delta
+
+    def has_id(self, did: int) -> bool:
+        return bool(self._bits[did])
+
+    def set_id(self, did: int, on: bool):
+        on = 1 if on else 0
+        if self._bits[did] != on:
+            self._bits[did] = on
+            self._bump(self.idx.dp_iq[did], 1 if on else -1)
+
+    def set_range(self, dps: range, on: bool):
+        """Select/unselect every dotpoint ID in ``dps`` (a subtree range)."""
+        if not dps:
+            return
+        idx = self.idx
+        fill = 1 if on else 0
+        # Split the range on IQ boundaries so each IQ's count gets its delta.
+        q = idx.dp_iq[dps.start]
+        lo = dps.start
+        while lo < dps.stop:
+            hi = min(idx.iq_dp[q + 1], dps.stop)
+            before = self._bits.count(1, lo, hi)
+            self._bits[lo:hi] = bytes([fill]) * (hi - lo)
+            after = (hi - lo) if on else 0
+            if after != before:
+                self._bump(q, after - before)
+            lo = hi
+            q += 1
+
+    def ids(self) -> Iterator[int]:
+        """Selected dotpoint IDs in ascending (document) order."""
+        bits = self._bits
+        i = bits.find(1)
+        while i >= 0:
+            yield i
+            i = bits.find(1, i + 1)
+
+    def remapped(self, idx: SyllabusIndex, remap=None) -> "DotpointSelection":
+        """Carry this selection over to a recompiled index.
+
+        ``remap[old_id]`` gives each dotpoint's new ID (-1 if it was removed);
+        without one, items are matched by their ``(s, m, iq, dp)`` tuple.
+        """
+        if remap is None:
+            return DotpointSelection(idx, self)
+        out = DotpointSelection(idx)
+        for did in self.ids():
+            new = remap[did]
+            if new >= 0:
+                out.set_id(new, True)
+        return out
+
+    # ---------- rolled-up counts ----------
+
+    def count_subject(self, sid: int) -> int:
+        return self._subj_n[sid]
+
+    def count_module(self, mid: int) -> int:
+        return self._mod_n[mid]
+
+    def count_iq(self, qid: int) -> int:
+        return self._iq_n[qid]
+
+    # ---------- set-compatible API over item tuples ----------
+
+    def add(self, item: Item):
+        did = self.idx.dotpoint_id(item)
+        if did >= 0:
+            self.set_id(did, True)
+
+    def discard(self, item: Item):
+        did = self.idx.dotpoint_id(item)
+        if did >= 0:
+            self.set_id(did, False)
+
+    def update(self, items: Iterable[Item]):
+        for it in items:
+            self.add(it)
+
+    def difference_update(self, items: Iterable[Item]):
+        for it in items:
+            self.discard(it)
+
+    def clear(self):
+        self.set_range(range(len(self._bits)), False)
+
+    def replace(self, items: Iterable[Item]):
+        """Make the selection exactly ``items``."""
+        self.clear()
+        self.update(items)
+
+    def __contains__(self, item) -> bool:
+        did = self.idx.dotpoint_id(item)
+        return did >= 0 and bool(self._bits[did])
+
+    def __iter__(self) -> Iterator[Item]:
+        items = self.idx.items
+        return (items[d] for d in self.ids())
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __bool__(self) -> bool:
+        return self._n > 0
+
+    def __repr__(self) -> str:
+        return f"DotpointSelection({self._n} of {len(self._bits)})"
+
+
+def sync_session(session: MutableMapping, idx: SyllabusIndex):
+    """Point a session at ``idx``, moving its selection onto the new IDs."""
+    session["_IDX"] = idx
+    sel = session.get("sel_dotpoints")
+    if not isinstance(sel, DotpointSelection):
+        # missing, or a plain set/list of item tuples (the pre-bitmap state)
+        session["sel_dotpoints"] = DotpointSelection(idx, (tuple(it) for it in sel or ()))
+    elif sel.idx is not idx:
+        session["sel_dotpoints"] = sel.remapped(idx, remap_between(sel.idx, idx))
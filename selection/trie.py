@@ -0,0 +1,84 @@
+"""Prefix tries for the type-ahead filter on the selection pages.
+
+Built once per compiled syllabus (see ``selection.widgets._filter_index``)
+and shared by every session.  There is one trie per level (subjects, modules,
+IQs, dotpoints) over the words of each node name; every trie node keeps the
+sorted IDs of the names with a word starting with that prefix.
+
+Since a parent's children are a contiguous ID range, filtering one page is a
+walk of each query word, an intersection of the (shortest-first) ID lists
+and a bisect into the parent's range: no scan of the names at all.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Sequence
+
+from data.index import SyllabusIndex
+from data.text import tokenize
+
+LEVELS = ("subjects", "modules", "iqs", "dotpoints")
+
+_EMPTY = array("I")
+
+
+class PrefixTrie:
+    """Word-prefix trie over ``names``; IDs are positions in ``names``."""
+
+    def __init__(self, names: Sequence[str]):
+        # node 0 is the root; children[n] maps a character to a node
+        self._children: List[Dict[str, int]] = [{}]
+        self._ids: List[array] = [array("I")]
+        for i, name in enumerate(names):
+            for word in set(tokenize(name, drop_stopwords=False)):
+                self._insert(word, i)
+
+    def _insert(self, word: str, i: int):
+        node = 0
+        for ch in word:
+            nxt = self._children[node].get(ch)
+            if nxt is None:
+                nxt = self._children[node][ch] = len(self._ids)
+                self._children.append({})
+                self._ids.append(array("I"))
+            node = nxt
+            ids = self._ids[node]
+            if not ids or ids[-1] != i:  # IDs arrive in order: stays sorted
+                ids.append(i)
+
+    def lookup(self, prefix: str) -> array:
+        """Sorted IDs of the names with a word starting with ``prefix``."""
+        node = 0
+        for ch in prefix:
+            node = self._children[node].get(ch)
+            if node is None:
+                return _EMPTY
+        return self._ids[node]
+
+    def match(self, query: str, ids: range) -> List[int]:
+        """IDs in ``ids`` whose name has a word starting with every query word."""
+        words = set(tokenize(query, drop_stopwords=False))
+        if not words:
+            return list(ids)
+        lists = sorted((self.lookup(w) for w in words), key=len)
+        lo, hi = ids.start, ids.stop
+        first = lists[0]
+        out = first[bisect_left(first, lo):bisect_left(first, hi)].tolist()
+        for other in lists[1:]:
+            if not out:
+                break
+            keep = set(other[bisect_left(other, lo):bisect_left(other, hi)])
+            out = [i for i in out if i in keep]
+        return out
+
+
+class SelectionFilter:
+    """One ``PrefixTrie`` per level of a ``SyllabusIndex``."""
+
+    def __init__(self, idx: SyllabusIndex):
+        self._tries = {level: PrefixTrie(getattr(idx, level)) for level in LEVELS}
+
+    def match(self, level: str, query: str, ids: range) -> List[int]:
+        return self._tries[level].match(query, ids)
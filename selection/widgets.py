@@ -1,6 +1,11 @@
 import streamlit as st
+from data.data import load_subject
+from data.index import SyllabusIndex
+from selection.state import sync_session
+from selection.component import available as gestures_available, gesture_grid
+from selection.trie import SelectionFilter
 from common.ui import (
-    topbar, get_go,
+    topbar, get_go, fragment, stable_key_tuple,
     k_subject_open, k_subject_toggle,
     k_module_open,  k_module_toggle,
     k_iq_open,      k_iq_toggle,
@@ -10,85 +15,354 @@ from common.ui import (
 # =============================
 # Helpers to add/remove in bulk
 # =============================
+#
+# Every subtree owns a contiguous range of dotpoint IDs in the compiled
+# index, and ``sel_dotpoints`` is a bitmap with rolled-up counts, so bulk
+# toggles are range operations and "is selected" checks are O(1).
+
+def _idx():
+    return st.session_state["_IDX"]
+
+def _sel():
+    return st.session_state["sel_dotpoints"]
+
+def _ensure_subject(subject: str):
+    """Load a sharded subject on first use and move the session onto it."""
+    idx = load_subject(subject)
+    if idx is not _idx():
+        sync_session(st.session_state, idx)
+
 
 def add_all_modules(subject: str, on: bool):
-    MODS = st.session_state["_MODS"]
-    IQS  = st.session_state["_IQS"]
-    DPS  = st.session_state["_DPS"]
-    sel  = st.session_state["sel_dotpoints"]
-    for m in MODS.get(subject, []):
-        for iq in IQS.get((subject, m), []):
-            for dp in DPS.get((subject, m, iq), []):
-                item = (subject, m, iq, dp)
-                if on: sel.add(item)
-                else:  sel.discard(item)
+    _ensure_subject(subject)
+    idx = _idx()
+    sid = idx.subject_id(subject)
+    if sid >= 0:
+        _sel().set_range(idx.subject_dps(sid), on)
 
 def add_all_iqs(subject: str, module: str, on: bool):
-    IQS  = st.session_state["_IQS"]
-    DPS  = st.session_state["_DPS"]
-    sel  = st.session_state["sel_dotpoints"]
-    for iq in IQS.get((subject, module), []):
-        for dp in DPS.get((subject, module, iq), []):
-            item = (subject, module, iq, dp)
-            if on: sel.add(item)
-            else:  sel.discard(item)
+    idx = _idx()
+    mid = idx.module_id(subject, module)
+    if mid >= 0:
+        _sel().set_range(idx.module_dps(mid), on)
 
 def add_all_dps(subject: str, module: str, iq: str, on: bool):
-    DPS = st.session_state["_DPS"]
-    sel = st.session_state["sel_dotpoints"]
-    for dp in DPS.get((subject, module, iq), []):
-        item = (subject, module, iq, dp)
-        if on: sel.add(item)
-        else:  sel.discard(item)
+    idx = _idx()
+    qid = idx.iq_id(subject, module, iq)
+    if qid >= 0:
+        _sel().set_range(idx.dps_of(qid), on)
+
+def subject_counts(subject: str) -> tuple[int, int]:
+    """(selected, total) dotpoints under a subject."""
+    idx = _idx()
+    sid = idx.subject_id(subject)
+    if sid < 0:
+        return 0, 0
+    return _sel().count_subject(sid), len(idx.subject_dps(sid))
+
+def module_counts(subject: str, module: str) -> tuple[int, int]:
+    idx = _idx()
+    mid = idx.module_id(subject, module)
+    if mid < 0:
+        return 0, 0
+    return _sel().count_module(mid), len(idx.module_dps(mid))
+
+def iq_counts(subject: str, module: str, iq: str) -> tuple[int, int]:
+    idx = _idx()
+    qid = idx.iq_id(subject, module, iq)
+    if qid < 0:
+        return 0, 0
+    return _sel().count_iq(qid), len(idx.dps_of(qid))
 
 def is_subject_selected(subject: str) -> bool:
-    return any(s==subject for (s, m, iq, dp) in st.session_state["sel_dotpoints"])
+    return subject_counts(subject)[0] > 0
 
 def is_module_selected(subject: str, module: str) -> bool:
-    return any((s==subject and m==module) for (s, m, iq, dp) in st.session_state["sel_dotpoints"])
+    return module_counts(subject, module)[0] > 0
 
 def is_iq_selected(subject: str, module: str, iq: str) -> bool:
-    return any((s==subject and m==module and i==iq) for (s, m, i, dp) in st.session_state["sel_dotpoints"])
+    return iq_counts(subject, module, iq)[0] > 0
 
 # =============================
-# CRAM pages
+# Cards (one fragment each)
 # =============================
+#
+# A Select/Unselect click reruns only the card it belongs to; "Open" changes
+# the route, which the fragment wrapper escalates to a full rerun.
 
-def page_cram_subjects():
+@fragment
+def _subject_card(s: str, mode: str):
     go = get_go()
-    SUBJECTS = st.session_state["_SUBJECTS"]
-    topbar("Choose Subject", back_to="srs_menu")
-    st.caption("Open drills down. “Select” toggles all children (modules → IQs → dotpoints).")
+    n_sel, n_all = subject_counts(s)
+    selected = n_sel > 0
+    box = st.container(border=True)
+    with box:
+        if selected:
+            st.markdown("<div class='sel-stripe'></div>", unsafe_allow_html=True)
+        st.subheader(s)
+        if n_all:  # sharded subjects report 0 until first opened
+            st.caption(f"{n_sel} of {n_all} dotpoints selected")
+        c1, c2 = st.columns([2,1])
+
+        # Open
+        with c1:
+            st.button(
+                "Open",
+                key=k_subject_open(s, mode),
+                on_click=lambda subj=s: st.session_state.update({"focus_subject": subj}) or go(f"{mode}_modules"),
+                use_container_width=True
+            )
+
+        # Select/Unselect whole subject
+        with c2:
+            label = "Unselect" if selected else "Select"
+            st.button(
+                label,
+                key=k_subject_toggle(s, mode),
+                on_click=lambda subj=s, sel=selected: (add_all_modules(subj, not sel),),
+                use_container_width=True
+            )
+
+@fragment
+def _module_card(s: str, m: str, mode: str):
+    go = get_go()
+    n_sel, n_all = module_counts(s, m)
+    selected = n_sel > 0
+    box = st.container(border=True)
+    with box:
+        if selected:
+            st.markdown("<div class='sel-stripe'></div>", unsafe_allow_html=True)
+        st.subheader(m)
+        st.caption(f"{n_sel} of {n_all} dotpoints selected")
+        c1, c2 = st.columns([2,1])
+
+        with c1:
+            st.button(
+                "Open",
+                key=k_module_open(s, m, mode),
+                on_click=lambda subj=s, mod=m: st.session_state.update({"focus_module": (subj, mod)}) or go(f"{mode}_iqs"),
+                use_container_width=True
+            )
+        with c2:
+            label = "Unselect" if selected else "Select"
+            st.button(
+                label,
+                key=k_module_toggle(s, m, mode),
+                on_click=lambda subj=s, mod=m, sel=selected: (add_all_iqs(subj, mod, not sel),),
+                use_container_width=True
+            )
+
+@fragment
+def _iq_card(s: str, m: str, iq: str, mode: str):
+    go = get_go()
+    n_sel, n_all = iq_counts(s, m, iq)
+    selected = n_sel > 0
+    box = st.container(border=True)
+    with box:
+        if selected:
+            st.markdown("<div class='sel-stripe'></div>", unsafe_allow_html=True)
+        st.subheader(iq)
+        st.caption(f"{n_sel} of {n_all} dotpoints selected")
+        c1, c2 = st.columns([2,1])
+
+        with c1:
+            st.button(
+                "Open",
+                key=k_iq_open(s, m, iq, mode),
+                on_click=lambda subj=s, mod=m, q=iq: st.session_state.update({"focus_iq": (subj, mod, q)}) or go(f"{mode}_dotpoints"),
+                use_container_width=True
+            )
+        with c2:
+            label = "Unselect" if selected else "Select"
+            st.button(
+                label,
+                key=k_iq_toggle(s, m, iq, mode),
+                on_click=lambda subj=s, mod=m, q=iq, sel=selected: (add_all_dps(subj, mod, q, not sel),),
+                use_container_width=True
+            )
+
+@fragment
+def _dp_card(s: str, m: str, iq: str, dp: str, mode: str):
+    item = (s, m, iq, dp)
+    selected = item in st.session_state["sel_dotpoints"]
+
+    box = st.container(border=True)
+    with box:
+        if selected:
+            st.markdown("<div class='sel-stripe dp'></div>", unsafe_allow_html=True)
+        st.write(f"**{dp}**")
+        label = "Unselect" if selected else "Select / Toggle"
+        st.button(
+            label,
+            key=k_dp_toggle(s, m, iq, dp, mode),
+            on_click=lambda it=item, sel=selected: (
+                st.session_state["sel_dotpoints"].discard(it) if sel
+                else st.session_state["sel_dotpoints"].add(it)
+            ),
+            use_container_width=True
+        )
 
+# =============================
+# Gesture grid (one component per page)
+# =============================
+#
+# With frontend_gestures built, a page's cards are one component: click
+# opens, long-press toggles, and toggles reach us in batches.  Otherwise the
+# per-card fragments above are used.
+
+_OPEN = {"subjects": "modules", "modules": "iqs", "iqs": "dotpoints"}
+
+def _counts(level: str, parent: tuple, name: str) -> tuple[int, int]:
+    if level == "subjects":
+        return subject_counts(name)
+    if level == "modules":
+        return module_counts(*parent, name)
+    if level == "iqs":
+        return iq_counts(*parent, name)
+    return int(parent + (name,) in _sel()), 1
+
+def _set(level: str, parent: tuple, name: str, on: bool):
+    if level == "subjects":
+        add_all_modules(name, on)
+    elif level == "modules":
+        add_all_iqs(*parent, name, on)
+    elif level == "iqs":
+        add_all_dps(*parent, name, on)
+    elif on:
+        _sel().add(parent + (name,))
+    else:
+        _sel().discard(parent + (name,))
+
+def _open(level: str, mode: str, parent: tuple, name: str):
+    focus = {"subjects": "focus_subject", "modules": "focus_module", "iqs": "focus_iq"}[level]
+    st.session_state[focus] = parent + (name,) if parent else name
+    get_go()(f"{mode}_{_OPEN[level]}")
+
+def _gesture_cards(level: str, mode: str, parent: tuple, ids):
+    names = getattr(_idx(), level)
+    items = []
+    for i in ids:
+        n_sel, n_all = _counts(level, parent, names[i])
+        item = {"id": str(i), "title": names[i], "selected": n_sel > 0}
+        if level != "dotpoints" and n_all:
+            item["count"] = [n_sel, n_all]
+        items.append(item)
+
+    # Ids are node IDs, so a batch flushed after the page or filter changed
+    # still names the right cards; only children of ``parent`` are accepted.
+    children = _children(level, parent)
+
+    def name(i):
+        return names[int(i)] if i.isdigit() and int(i) in children else None
+
+    def on_batch(ops, open_id):
+        for i, on in ops:
+            if name(i) is not None:
+                _set(level, parent, name(i), on)
+        if open_id is not None and level in _OPEN and name(open_id) is not None:
+            _open(level, mode, parent, name(open_id))
+
+    gesture_grid(
+        items, key=f"{mode}_grid_{level}_{stable_key_tuple(parent)}",
+        on_batch=on_batch, click_toggles=(level == "dotpoints"),
+    )
+
+def _cards(level: str, mode: str, parent: tuple, ids):
+    if gestures_available():
+        return _gesture_cards(level, mode, parent, ids)
+    names = [getattr(_idx(), level)[i] for i in ids]
+    if level == "dotpoints":
+        c1, c2 = st.columns(2)
+        for i, dp in enumerate(names):
+            with (c1 if i % 2 == 0 else c2):
+                _dp_card(*parent, dp, mode)
+        return
+    card = {"subjects": _subject_card, "modules": _module_card, "iqs": _iq_card}[level]
     cols = st.columns(2)
-    for i, s in enumerate(SUBJECTS):
+    for i, name in enumerate(names):
         with cols[i % 2]:
-            selected = is_subject_selected(s)
-            box = st.container(border=True)
-            with box:
-                if selected:
-                    st.markdown("<div style='height:6px;background:#3b82f6;border-radius:6px;margin:-8px -8px 8px -8px;'></div>", unsafe_allow_html=True)
-                st.subheader(s)
-                c1, c2 = st.columns([2,1])
-
-                # Open
-                with c1:
-                    st.button(
-                        "Open",
-                        key=k_subject_open(s, "cram"),
-                        on_click=lambda subj=s: st.session_state.update({"focus_subject": subj}) or go("cram_modules"),
-                        use_container_width=True
-                    )
-
-                # Select/Unselect whole subject
-                with c2:
-                    label = "Unselect" if selected else "Select"
-                    st.button(
-                        label,
-                        key=k_subject_toggle(s, "cram"),
-                        on_click=lambda subj=s, sel=selected: (add_all_modules(subj, not sel),),
-                        use_container_width=True
-                    )
+            card(*parent, name, mode)
+
+# =============================
+# Filter + pages
+# =============================
+#
+# Only one page of cards is rendered.  Long lists get a type-ahead filter
+# backed by the prefix tries in ``selection.trie``; typing or paging reruns
+# just this fragment.
+
+PAGE_SIZE = 24
+FILTER_MIN = 8  # shorter lists get no filter box
+
+# One filter per compiled syllabus, shared by every session in the process.
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _filter_index(fingerprint: str, _idx: SyllabusIndex) -> SelectionFilter:
+    return SelectionFilter(_idx)
+
+def _children(level: str, parent: tuple) -> range:
+    """Node IDs of ``parent``'s children at ``level`` (a contiguous range)."""
+    idx = _idx()
+    if level == "subjects":
+        return range(idx.n_subjects)
+    if level == "modules":
+        sid = idx.subject_id(*parent)
+        return idx.modules_of(sid) if sid >= 0 else range(0)
+    if level == "iqs":
+        mid = idx.module_id(*parent)
+        return idx.iqs_of(mid) if mid >= 0 else range(0)
+    qid = idx.iq_id(*parent)
+    return idx.dps_of(qid) if qid >= 0 else range(0)
+
+def _set_page(key: str, p: int):
+    st.session_state[f"{key}:page"] = p
+
+@fragment
+def _browse(level: str, mode: str, parent: tuple):
+    idx = _idx()
+    ids = _children(level, parent)
+    key = f"{mode}_browse_{level}_{stable_key_tuple(parent)}"
+
+    query = ""
+    if len(ids) > FILTER_MIN:
+        query = st.text_input(f"Filter {level}", key=f"{key}:q", placeholder="Type to filter…",
+                              label_visibility="collapsed")
+    if st.session_state.get(f"{key}:last_q") != query:
+        st.session_state[f"{key}:last_q"] = query
+        st.session_state[f"{key}:page"] = 0
+    hits = _filter_index(idx.fingerprint, idx).match(level, query, ids) if query.strip() else ids
+
+    n_pages = max(1, -(-len(hits) // PAGE_SIZE))
+    page = min(st.session_state.get(f"{key}:page", 0), n_pages - 1)
+    if query.strip() or n_pages > 1:
+        st.caption(f"{len(hits)} of {len(ids)} {level} — page {page + 1} of {n_pages}")
+    if not len(hits):
+        st.info("Nothing matches that filter.")
+        return
+
+    _cards(level, mode, parent, hits[page * PAGE_SIZE:(page + 1) * PAGE_SIZE])
+
+    if n_pages > 1:
+        c1, _, c3 = st.columns(3)
+        c1.button("← Prev", key=f"{key}:prev", disabled=page == 0, use_container_width=True,
+                  on_click=_set_page, args=(key, page - 1))
+        c3.button("Next →", key=f"{key}:next", disabled=page >= n_pages - 1, use_container_width=True,
+                  on_click=_set_page, args=(key, page + 1))
+
+def _intro():
+    if gestures_available():
+        st.caption("Click a card to drill down. Long-press it to select or unselect everything under it.")
+    else:
+        st.caption("Open drills down. “Select” toggles all children (modules → IQs → dotpoints).")
+
+# =============================
+# CRAM pages
+# =============================
+
+def page_cram_subjects():
+    go = get_go()
+    topbar("Choose Subject", back_to="srs_menu")
+    _intro()
+    _browse("subjects", "cram", ())
 
     mid = st.columns([1,1,1])[1]
     with mid:
@@ -96,40 +370,13 @@ def page_cram_subjects():
 
 def page_cram_modules():
     go = get_go()
-    MODS = st.session_state["_MODS"]
     s = st.session_state.get("focus_subject")
     if not s:
         return go("cram_subjects")
+    _ensure_subject(s)
 
     topbar(f"{s} — Modules", back_to="cram_subjects")
-    modules = MODS.get(s, [])
-    cols = st.columns(2)
-
-    for i, m in enumerate(modules):
-        with cols[i % 2]:
-            selected = is_module_selected(s, m)
-            box = st.container(border=True)
-            with box:
-                if selected:
-                    st.markdown("<div style='height:6px;background:#3b82f6;border-radius:6px;margin:-8px -8px 8px -8px;'></div>", unsafe_allow_html=True)
-                st.subheader(m)
-                c1, c2 = st.columns([2,1])
-
-                with c1:
-                    st.button(
-                        "Open",
-                        key=k_module_open(s, m, "cram"),
-                        on_click=lambda subj=s, mod=m: st.session_state.update({"focus_module": (subj, mod)}) or go("cram_iqs"),
-                        use_container_width=True
-                    )
-                with c2:
-                    label = "Unselect" if selected else "Select"
-                    st.button(
-                        label,
-                        key=k_module_toggle(s, m, "cram"),
-                        on_click=lambda subj=s, mod=m, sel=selected: (add_all_iqs(subj, mod, not sel),),
-                        use_container_width=True
-                    )
+    _browse("modules", "cram", (s,))
 
     mid = st.columns([1,1,1])[1]
     with mid:
@@ -137,41 +384,13 @@ def page_cram_modules():
 
 def page_cram_iqs():
     go = get_go()
-    IQS = st.session_state["_IQS"]
     sm = st.session_state.get("focus_module")
     if not sm:
         return go("cram_modules")
     s, m = sm
 
     topbar(f"{s} → {m} — IQs", back_to="cram_modules")
-    iqs = IQS.get((s, m), [])
-    cols = st.columns(2)
-
-    for i, iq in enumerate(iqs):
-        with cols[i % 2]:
-            selected = is_iq_selected(s, m, iq)
-            box = st.container(border=True)
-            with box:
-                if selected:
-                    st.markdown("<div style='height:6px;background:#3b82f6;border-radius:6px;margin:-8px -8px 8px -8px;'></div>", unsafe_allow_html=True)
-                st.subheader(iq)
-                c1, c2 = st.columns([2,1])
-
-                with c1:
-                    st.button(
-                        "Open",
-                        key=k_iq_open(s, m, iq, "cram"),
-                        on_click=lambda subj=s, mod=m, q=iq: st.session_state.update({"focus_iq": (subj, mod, q)}) or go("cram_dotpoints"),
-                        use_container_width=True
-                    )
-                with c2:
-                    label = "Unselect" if selected else "Select"
-                    st.button(
-                        label,
-                        key=k_iq_toggle(s, m, iq, "cram"),
-                        on_click=lambda subj=s, mod=m, q=iq, sel=selected: (add_all_dps(subj, mod, q, not sel),),
-                        use_container_width=True
-                    )
+    _browse("iqs", "cram", (s, m))
 
     mid = st.columns([1,1,1])[1]
     with mid:
@@ -179,36 +398,13 @@ def page_cram_iqs():
 
 def page_cram_dotpoints():
     go = get_go()
-    DPS = st.session_state["_DPS"]
     smi = st.session_state.get("focus_iq")
     if not smi:
         return go("cram_iqs")
     s, m, iq = smi
 
     topbar(f"{s} → {m} → {iq} — Dotpoints", back_to="cram_iqs")
-    dps = DPS.get((s, m, iq), [])
-    c1, c2 = st.columns(2)
-
-    for i, dp in enumerate(dps):
-        with (c1 if i % 2 == 0 else c2):
-            item = (s, m, iq, dp)
-            selected = item in st.session_state["sel_dotpoints"]
-
-            box = st.container(border=True)
-            with box:
-                if selected:
-                    st.markdown("<div style='height:6px;background:#16a34a;border-radius:6px;margin:-8px -8px 8px -8px;'></div>", unsafe_allow_html=True)
-                st.write(f"**{dp}**")
-                label = "Unselect" if selected else "Select / Toggle"
-                st.button(
-                    label,
-                    key=k_dp_toggle(s, m, iq, dp, "cram"),
-                    on_click=lambda it=item, sel=selected: (
-                        st.session_state["sel_dotpoints"].discard(it) if sel
-                        else st.session_state["sel_dotpoints"].add(it)
-                    ),
-                    use_container_width=True
-                )
+    _browse("dotpoints", "cram", (s, m, iq))
 
     mid = st.columns([1,1,1])[1]
     with mid:
@@ -220,36 +416,9 @@ def page_cram_dotpoints():
 
 def page_srs_subjects():
     go = get_go()
-    SUBJECTS = st.session_state["_SUBJECTS"]
     topbar("Choose Subject", back_to="srs_menu")
-    st.caption("Open drills down. “Select” toggles all children (modules → IQs → dotpoints).")
-
-    cols = st.columns(2)
-    for i, s in enumerate(SUBJECTS):
-        with cols[i % 2]:
-            selected = is_subject_selected(s)
-            box = st.container(border=True)
-            with box:
-                if selected:
-                    st.markdown("<div style='height:6px;background:#3b82f6;border-radius:6px;margin:-8px -8px 8px -8px;'></div>", unsafe_allow_html=True)
-                st.subheader(s)
-                c1, c2 = st.columns([2,1])
-
-                with c1:
-                    st.button(
-                        "Open",
-                        key=k_subject_open(s, "srs"),
-                        on_click=lambda subj=s: st.session_state.update({"focus_subject": subj}) or go("srs_modules"),
-                        use_container_width=True
-                    )
-                with c2:
-                    label = "Unselect" if selected else "Select"
-                    st.button(
-                        label,
-                        key=k_subject_toggle(s, "srs"),
-                        on_click=lambda subj=s, sel=selected: (add_all_modules(subj, not sel),),
-                        use_container_width=True
-                    )
+    _intro()
+    _browse("subjects", "srs", ())
 
     mid = st.columns([1,1,1])[1]
     with mid:
@@ -257,40 +426,13 @@ def page_srs_subjects():
 
 def page_srs_modules():
     go = get_go()
-    MODS = st.session_state["_MODS"]
     s = st.session_state.get("focus_subject")
     if not s:
         return go("srs_subjects")
+    _ensure_subject(s)
 
     topbar(f"{s} — Modules", back_to="srs_subjects")
-    modules = MODS.get(s, [])
-    cols = st.columns(2)
-
-    for i, m in enumerate(modules):
-        with cols[i % 2]:
-            selected = is_module_selected(s, m)
-            box = st.container(border=True)
-            with box:
-                if selected:
-                    st.markdown("<div style='height:6px;background:#3b82f6;border-radius:6px;margin:-8px -8px 8px -8px;'></div>", unsafe_allow_html=True)
-                st.subheader(m)
-                c1, c2 = st.columns([2,1])
-
-                with c1:
-                    st.button(
-                        "Open",
-                        key=k_module_open(s, m, "srs"),
-                        on_click=lambda subj=s, mod=m: st.session_state.update({"focus_module": (subj, mod)}) or go("srs_iqs"),
-                        use_container_width=True
-                    )
-                with c2:
-                    label = "Unselect" if selected else "Select"
-                    st.button(
-                        label,
-                        key=k_module_toggle(s, m, "srs"),
-                        on_click=lambda subj=s, mod=m, sel=selected: (add_all_iqs(subj, mod, not sel),),
-                        use_container_width=True
-                    )
+    _browse("modules", "srs", (s,))
 
     mid = st.columns([1,1,1])[1]
     with mid:
@@ -298,41 +440,13 @@ def page_srs_modules():
 
 def page_srs_iqs():
     go = get_go()
-    IQS = st.session_state["_IQS"]
     sm = st.session_state.get("focus_module")
     if not sm:
         return go("srs_modules")
     s, m = sm
 
     topbar(f"{s} → {m} — IQs", back_to="srs_modules")
-    iqs = IQS.get((s, m), [])
-    cols = st.columns(2)
-
-    for i, iq in enumerate(iqs):
-        with cols[i % 2]:
-            selected = is_iq_selected(s, m, iq)
-            box = st.container(border=True)
-            with box:
-                if selected:
-                    st.markdown("<div style='height:6px;background:#3b82f6;border-radius:6px;margin:-8px -8px 8px -8px;'></div>", unsafe_allow_html=True)
-                st.subheader(iq)
-                c1, c2 = st.columns([2,1])
-
-                with c1:
-                    st.button(
-                        "Open",
-                        key=k_iq_open(s, m, iq, "srs"),
-                        on_click=lambda subj=s, mod=m, q=iq: st.session_state.update({"focus_iq": (subj, mod, q)}) or go("srs_dotpoints"),
-                        use_container_width=True
-                    )
-                with c2:
-                    label = "Unselect" if selected else "Select"
-                    st.button(
-                        label,
-                        key=k_iq_toggle(s, m, iq, "srs"),
-                        on_click=lambda subj=s, mod=m, q=iq, sel=selected: (add_all_dps(subj, mod, q, not sel),),
-                        use_container_width=True
-                    )
+    _browse("iqs", "srs", (s, m))
 
     mid = st.columns([1,1,1])[1]
     with mid:
@@ -340,36 +454,13 @@ def page_srs_iqs():
 
 def page_srs_dotpoints():
     go = get_go()
-    DPS = st.session_state["_DPS"]
     smi = st.session_state.get("focus_iq")
     if not smi:
         return go("srs_iqs")
     s, m, iq = smi
 
     topbar(f"{s} → {m} → {iq} — Dotpoints", back_to="srs_iqs")
-    dps = DPS.get((s, m, iq), [])
-    c1, c2 = st.columns(2)
-
-    for i, dp in enumerate(dps):
-        with (c1 if i % 2 == 0 else c2):
-            item = (s, m, iq, dp)
-            selected = item in st.session_state["sel_dotpoints"]
-
-            box = st.container(border=True)
-            with box:
-                if selected:
-                    st.markdown("<div style='height:6px;background:#16a34a;border-radius:6px;margin:-8px -8px 8px -8px;'></div>", unsafe_allow_html=True)
-                st.write(f"**{dp}**")
-                label = "Unselect" if selected else "Select / Toggle"
-                st.button(
-                    label,
-                    key=k_dp_toggle(s, m, iq, dp, "srs"),
-                    on_click=lambda it=item, sel=selected: (
-                        st.session_state["sel_dotpoints"].discard(it) if sel
-                        else st.session_state["sel_dotpoints"].add(it)
-                    ),
-                    use_container_width=True
-                )
+    _browse("dotpoints", "srs", (s, m, iq))
 
     mid = st.columns([1,1,1])[1]
     with mid:
@@ -12,16 +12,20 @@ def page_srs_menu():
     topbar("Spaced Repetition", back_to="home")
     due_count = max(1, len(st.session_state["sel_dotpoints"]))
     st.write(f"**All (Today):** {due_count} dotpoints due")
+    def choose_subject():
+        st.session_state["cram_mode"] = False
+        go("srs_subjects")
+
+    def cram():
+        st.session_state["cram_mode"] = True
+        st.session_state["prioritization_mode"] = False
+        go("cram_subjects")
+
     c1, c2, c3 = st.columns(3)
     with c1:
         if st.button("Start: All (SR order)", use_container_width=True, type="primary"):
             st.info("SRS Engine (All) — placeholder for now.")
     with c2:
-        if st.button("Choose Subject (SR)", use_container_width=True):
-            st.session_state["cram_mode"] = False
-            go("srs_subjects")
+        st.button("Choose Subject (SR)", use_container_width=True, on_click=choose_subject)
     with c3:
-        if st.button("Cram Mode (mass select)", use_container_width=True):
-            st.session_state["cram_mode"] = True
-            st.session_state["prioritization_mode"] = False
-            go("cram_subjects")
+        st.button("Cram Mode (mass select)", use_container_width=True, on_click=cram)
@@ -2,88 +2,31 @@
 # Central router & bootstrap for Syllabuddy (modular pages)
 
 from __future__ import annotations
-import json
-import os
-from typing import Dict, List, Tuple
-
 import streamlit as st
 
+from data.data import get_index
+from selection.state import sync_session
+
 # ---- Import shared UI + page modules (your existing files) ----
-from common.ui import get_go
+from common.ui import get_go, safe_rerun
+from common.style import inject_css
+from common.perf import ENABLED as PERF_ENABLED, actions, timed
 go = None  # will be set in ensure_core_state()
 
-from homepage.homepage import page_home as _page_home, page_select_subject_main
-from srs.srs import page_srs_menu as _page_srs_menu
-
-from selection.widgets import (
-    page_cram_subjects, page_cram_modules, page_cram_iqs, page_cram_dotpoints,
-    page_srs_subjects,  page_srs_modules,  page_srs_iqs,  page_srs_dotpoints,
-)
+from common.routes import lazy
 
-from review.review import page_srs_review, page_cram_review
-
-# NEW: MVP FP engine
-from fp.fp_mvp import ensure_fp_state, begin_fp_from_selection, page_fp_run
+# Page modules are imported on the first visit to a route that needs them
+# (see common.routes), so home does not pay for NumPy, the FP engine or the
+# selection/review pages.
+from homepage.homepage import page_home as _page_home, page_select_subject_main
+_page_srs_menu = lazy("srs.srs", "page_srs_menu")
+start_fp_from_selection = lazy("fp.fp_mvp", "start_fp_from_selection")
 
 
 # ---------------- Page config ----------------
 st.set_page_config(page_title="Syllabuddy", layout="wide")
 
 
-# ---------------- Data loading ----------------
-def _fallback_syllabus() -> Dict:
-    return {
-        "Biology": {
-            "Module 6: Genetic Change": {
-                "IQ1: Mutations": [
-                    "Describe point vs frameshift mutations",
-                    "Explain mutagens and mutation rates"
-                ],
-                "IQ2: Biotechnology": [
-                    "Outline PCR steps and applications",
-                    "Summarise CRISPR-Cas9 mechanism"
-                ]
-            }
-        },
-        "Chemistry": {
-            "Module 5: Equilibrium": {
-                "IQ1: Le Chatelier": [
-                    "Predict shifts for concentration, pressure, temperature changes",
-                    "Relate Kc to reaction quotient Q"
-                ]
-            }
-        }
-    }
-
-def load_syllabus() -> Dict:
-    path = "syllabus.json"
-    if os.path.exists(path):
-        try:
-            with open(path, "r") as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return _fallback_syllabus()
-
-def explode_syllabus(data: Dict) -> Tuple[
-    List[str],
-    Dict[str, List[str]],
-    Dict[Tuple[str, str], List[str]],
-    Dict[Tuple[str, str, str], List[str]]
-]:
-    subjects = list(data.keys())
-    modules_by_subject = {s: list(data[s].keys()) for s in subjects}
-    iqs_by_subject_module = {}
-    dps_by_smi = {}
-    for s in subjects:
-        for m in data[s]:
-            iqs = list(data[s][m].keys())
-            iqs_by_subject_module[(s, m)] = iqs
-            for iq in iqs:
-                dps_by_smi[(s, m, iq)] = list(data[s][m][iq])
-    return subjects, modules_by_subject, iqs_by_subject_module, dps_by_smi
-
-
 # ---------------- Bootstrap shared state ----------------
 def ensure_core_state():
     global go
@@ -91,23 +34,20 @@ def ensure_core_state():
 
     # Route
     st.session_state.setdefault("route", "home")
-
-    # Selection sets used by selection/review pages
-    st.session_state.setdefault("sel_dotpoints", set())  # set of (subject, module, iq, dp)
+    if "diagnostics" in st.query_params:  # hidden route, opened as ?diagnostics
+        del st.query_params["diagnostics"]
+        st.session_state["route"] = "diagnostics"
+
+    # Compiled syllabus: one frozen, process-wide object shared read-only by
+    # every session (hot-reloaded when syllabus.json changes on disk)
+    # Selection used by selection/review pages (sel_dotpoints) is a bitmap
+    # over dotpoint IDs that iterates as (subject, module, iq, dp) tuples; after
+    # a reload it is moved onto the new IDs
+    sync_session(st.session_state, get_index())
     st.session_state.setdefault("focus_subject", None)
     st.session_state.setdefault("focus_module", None)  # (s, m)
     st.session_state.setdefault("focus_iq", None)      # (s, m, iq)
 
-    # Load syllabus fan-outs once
-    if "_SYL" not in st.session_state:
-        data = load_syllabus()
-        subjects, mods, iqs, dps = explode_syllabus(data)
-        st.session_state["_SYL"] = data
-        st.session_state["_SUBJECTS"] = subjects
-        st.session_state["_MODS"] = mods
-        st.session_state["_IQS"] = iqs
-        st.session_state["_DPS"] = dps
-
 
 # ---------------- Wrappers to add “Start FP” buttons ----------------
 def page_home():
@@ -115,15 +55,15 @@ def page_home():
     # If the user already picked dotpoints (e.g., via AI review or manual review), show Start FP
     if st.session_state.get("sel_dotpoints"):
         st.divider()
-        if st.button("▶ Start Focused Practice", type="primary", use_container_width=True):
-            begin_fp_from_selection()
+        st.button("▶ Start Focused Practice", type="primary", use_container_width=True,
+                  on_click=start_fp_from_selection)
 
 def page_srs_menu():
     _page_srs_menu()
     if st.session_state.get("sel_dotpoints"):
         st.info(f"{len(st.session_state['sel_dotpoints'])} selected dotpoint(s) ready.")
-        if st.button("▶ Start Focused Practice (SR selection)", type="primary", use_container_width=True):
-            begin_fp_from_selection()
+        st.button("▶ Start Focused Practice (SR selection)", type="primary", use_container_width=True,
+                  on_click=start_fp_from_selection)
 
 
 # ---------------- Router ----------------
@@ -134,41 +74,60 @@ ROUTES = {
     "srs_menu": page_srs_menu,
 
     # Selection (CRAM)
-    "cram_subjects": page_cram_subjects,
-    "cram_modules":  page_cram_modules,
-    "cram_iqs":      page_cram_iqs,
-    "cram_dotpoints": page_cram_dotpoints,
+    "cram_subjects":  lazy("selection.widgets", "page_cram_subjects"),
+    "cram_modules":   lazy("selection.widgets", "page_cram_modules"),
+    "cram_iqs":       lazy("selection.widgets", "page_cram_iqs"),
+    "cram_dotpoints": lazy("selection.widgets", "page_cram_dotpoints"),
 
     # Selection (SRS)
-    "srs_subjects": page_srs_subjects,
-    "srs_modules":  page_srs_modules,
-    "srs_iqs":      page_srs_iqs,
-    "srs_dotpoints": page_srs_dotpoints,
+    "srs_subjects":  lazy("selection.widgets", "page_srs_subjects"),
+    "srs_modules":   lazy("selection.widgets", "page_srs_modules"),
+    "srs_iqs":       lazy("selection.widgets", "page_srs_iqs"),
+    "srs_dotpoints": lazy("selection.widgets", "page_srs_dotpoints"),
 
     # Review screens (unchanged)
-    "srs_review":  page_srs_review,
-    "cram_review": page_cram_review,
+    "srs_review":  lazy("review.review", "page_srs_review"),
+    "cram_review": lazy("review.review", "page_cram_review"),
+
+    # Global dotpoint search
+    "search": lazy("search.search", "page_search"),
+
+    # AI selection (BM25-ranked suggestions from the weakness text)
+    "ai_select": lazy("ai.ai", "page_ai_select"),
+    "ai_review": lazy("ai.ai", "page_ai_review"),
 
     # NEW: FP MVP routes
-    "fp_start": begin_fp_from_selection,  # build queue + route to fp_run
-    "fp_run":   page_fp_run,
+    "fp_start": lazy("fp.fp_mvp", "begin_fp_from_selection"),  # build queue + route to fp_run
+    "fp_run":   lazy("fp.fp_mvp", "page_fp_run"),
+
+    # Hidden: per-route timings, deltas and bytes (see common.perf)
+    "diagnostics": lazy("diagnostics.diagnostics", "page_diagnostics"),
 }
 
 
 # ---------------- Main dispatch ----------------
 def main():
-    ensure_core_state()
-    ensure_fp_state()  # FP engine state
-
-    route = st.session_state.get("route", "home")
-    handler = ROUTES.get(route)
-    if handler is None:
-        st.session_state["route"] = "home"
-        st.rerun()
-
-    # If handler is a function that sets state and reruns (e.g., begin_fp_from_selection)
-    # just call it; otherwise render a page.
-    handler()
+    # Full reruns only: fragment reruns (cards, review lists, FP stages) skip
+    # this and are timed separately, see common.ui.fragment.  Timings, deltas
+    # and bytes per route are on the hidden ``?diagnostics`` route.
+    with timed("app"):
+        inject_css()  # first, so the loader keeps its place on every route
+        ensure_core_state()  # FP state is set up by the fp.fp_mvp handlers
+
+        route = st.session_state.get("route", "home")
+        handler = ROUTES.get(route)
+        if handler is None:
+            st.session_state["route"] = "home"
+            safe_rerun()
+
+        # If handler is a function that sets state and reruns (e.g., begin_fp_from_selection)
+        # just call it; otherwise render a page.
+        handler()
+
+    # Debug: script runs per user action (should be 1; see common.perf)
+    if PERF_ENABLED:
+        recent = actions()[-10:]
+        st.sidebar.caption("Runs per action: " + " · ".join(f"{r} {n}" for r, n in recent))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,6 @@
+"""Run the tests from the repository root: ``python -m pytest -q``."""
+
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
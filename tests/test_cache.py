@@ -0,0 +1,66 @@
+import time
+
+from ai.cache import ResponseCache, cache_key
+
+
+def test_keys_ignore_case_and_whitespace():
+    assert cache_key("m", "v1", "  Energy   is\nconserved ") == cache_key("m", "v1", "energy is conserved")
+    assert cache_key("m", "v1", "x") != cache_key("m", "v2", "x")
+
+
+def test_disk_hit_after_memory_eviction(tmp_path):
+    cache = ResponseCache(str(tmp_path / "c.sqlite3"), lru_size=1)
+    cache.put("a", {"weak": ["x"]})
+    cache.put("b", "text")  # pushes "a" out of the LRU
+    assert cache.get("a") == {"weak": ["x"]}
+    stats = cache.stats()
+    assert stats["disk_hits"] == 1 and stats["memory_entries"] == 1
+
+
+def test_expired_rows_are_misses_and_deleted(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path / "c.sqlite3"), ttl=60, lru_size=1)
+    cache.put("a", 1)
+    later = time.time() + 120
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert cache.get("a") is None
+    assert cache._count() == 0
+
+
+def test_eviction_keeps_recently_used_rows(tmp_path):
+    path = str(tmp_path / "c.sqlite3")
+    cache = ResponseCache(path, max_rows=10, lru_size=1)
+    for i in range(10):
+        cache.put(f"k{i}", i)
+    cache.get("k0")  # read from disk: now the most recently used
+    cache.put("k10", 10)
+    # one row over the cap drops that row plus a tenth of the cap: 11 - 2
+    assert cache._count() == 9
+    assert cache.get("k0") == 0 and cache.get("k1") is None
+    assert cache.stats()["evicted"] == 2
+    # the count is kept in memory, and taken again on open
+    assert ResponseCache(path, max_rows=10)._rows == cache._count()
+
+
+def test_get_or_compute_stores_once(tmp_path):
+    cache = ResponseCache(str(tmp_path / "c.sqlite3"))
+    calls = []
+    for _ in range(3):
+        assert cache.get_or_compute("m", "v", "Text", lambda: calls.append(1) or "out") == "out"
+    assert len(calls) == 1
+
+
+def test_stream_through_skips_blank_and_failed_streams(tmp_path):
+    cache = ResponseCache(str(tmp_path / "c.sqlite3"))
+
+    def broken():
+        yield "half an"
+        raise ConnectionError
+
+    try:
+        list(cache.stream_through("m", "v1", "q", broken))
+    except ConnectionError:
+        pass
+    assert list(cache.stream_through("m", "v1", "q", lambda: iter(["", " \n"]))) == ["", " \n"]
+    assert cache._count() == 0
+    assert list(cache.stream_through("m", "v1", "q", lambda: iter(["an ", "answer"]))) == ["an ", "answer"]
+    assert list(cache.stream_through("m", "v1", "q", lambda: iter(["other"]))) == ["an answer"]
@@ -0,0 +1,9 @@
+from common.routes import IMPORT_BUDGET_MARGIN, IMPORT_BUDGET_MS, check_budget
+
+
+def test_cold_imports_within_budget():
+    rows = check_budget()
+    assert any(where != "(bootstrap)" for where, _, _ in rows), "no lazy routes found"
+    limit = IMPORT_BUDGET_MS * IMPORT_BUDGET_MARGIN
+    over = [(where, module, round(ms, 1)) for where, module, ms in rows if ms > limit]
+    assert not over, f"over the {IMPORT_BUDGET_MS:.0f} ms import budget (x{IMPORT_BUDGET_MARGIN:g}): {over}"
@@ -0,0 +1,54 @@
+from data.index import SyllabusIndex
+
+TREE = {
+    "Biology": {
+        "M5": {"IQ1": ["Cell division", "DNA replication"]},
+        "M6": {"IQ1": ["Point mutations", "Mutagens"], "IQ2": ["PCR"]},
+    },
+    "Chemistry": {"M5": {"IQ1": ["Le Chatelier", "Kc and Q"]}},
+}
+
+
+def test_ids_follow_document_order():
+    idx = SyllabusIndex.from_tree(TREE)
+    assert idx.n_subjects == 2 and idx.n_modules == 3 and idx.n_iqs == 4 and idx.n_dotpoints == 7
+    assert [idx.dotpoints[d] for d in idx.subject_dps(idx.subject_id("Biology"))] == [
+        "Cell division", "DNA replication", "Point mutations", "Mutagens", "PCR"]
+    did = idx.dotpoint_id(("Biology", "M6", "IQ2", "PCR"))
+    assert idx.items[did] == ("Biology", "M6", "IQ2", "PCR")
+    assert idx.dotpoint_id(("Biology", "M6", "IQ2", "missing")) == -1
+
+
+def test_recompile_remaps_and_reuses_unchanged_modules():
+    old = SyllabusIndex.from_tree(TREE)
+    edited = {
+        "Biology": {
+            "M5": {"IQ1": ["Cell division"]},  # "DNA replication" removed
+            "M6": {"IQ1": ["Point mutations", "Mutagens"], "IQ2": ["PCR"]},
+        },
+        "Chemistry": {"M5": {"IQ1": ["Le Chatelier", "Kc and Q"]}},
+    }
+    new, remap = old.recompile(edited)
+    assert new.fingerprint == SyllabusIndex.from_tree(edited).fingerprint
+    for did, item in enumerate(old.items):
+        if item[3] == "DNA replication":
+            assert remap[did] == -1
+        else:
+            assert new.items[remap[did]] == item
+    # an unchanged module keeps its interned item tuples
+    pcr = old.dotpoint_id(("Biology", "M6", "IQ2", "PCR"))
+    assert new.items[remap[pcr]] is old.items[pcr]
+
+
+def test_recompile_without_changes_is_identity():
+    old = SyllabusIndex.from_tree(TREE)
+    new, remap = old.recompile(TREE)
+    assert new.fingerprint == old.fingerprint
+    assert list(remap) == list(range(old.n_dotpoints))
+
+
+def test_remap_to_matches_by_item():
+    old = SyllabusIndex.from_tree(TREE)
+    new = SyllabusIndex.from_tree({"Chemistry": TREE["Chemistry"], "Biology": TREE["Biology"]})
+    remap = old.remap_to(new)
+    assert all(new.items[remap[d]] == it for d, it in enumerate(old.items))
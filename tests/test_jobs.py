@@ -0,0 +1,24 @@
+from streamlit.testing.v1 import AppTest
+
+
+def _app():
+    import streamlit as st
+    from ai import jobs
+
+    ss = st.session_state
+    ss["runs"] = ss.get("runs", 0) + 1
+    if ss["runs"] == 1:
+        jobs.submit("t", str.upper, "done").result()
+        jobs.poll("t")  # the job is already done: reruns the app
+        st.write("unreachable")
+    else:
+        ss["value"] = jobs.take("t")
+        ss["pending"] = jobs.pending("t")
+
+
+def test_poll_reruns_once_the_job_is_done():
+    at = AppTest.from_function(_app, default_timeout=10).run()
+    assert not at.exception
+    assert at.session_state["runs"] == 2
+    assert at.session_state["value"] == "DONE" and not at.session_state["pending"]
+    assert not [m for m in at.markdown if m.value == "unreachable"]
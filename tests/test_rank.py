@@ -0,0 +1,49 @@
+from ai.rank import BM25Ranker
+from data.index import SyllabusIndex
+
+TREE = {
+    "Biology": {"Module 6: Genetic Change": {
+        "IQ1: Mutations": ["Describe point and frameshift mutations",
+                           "Explain mutagens and mutation rates"],
+        "IQ2: Biotechnology": ["Outline PCR steps and applications"],
+    }},
+    "Chemistry": {"Module 5: Equilibrium": {
+        "IQ1: Le Chatelier": ["Predict shifts for concentration and pressure changes",
+                              "Relate Kc to reaction quotient Q"],
+    }},
+}
+
+
+def _text(idx, did):
+    return idx.dotpoints[did]
+
+
+def test_best_match_first():
+    idx = SyllabusIndex.from_tree(TREE)
+    ranker = BM25Ranker(idx)
+    top = ranker.top_k("mutagens mutation rate", k=3)
+    assert _text(idx, top[0]) == "Explain mutagens and mutation rates"
+    # IQ and module titles count too: every "Mutations" dotpoint matches
+    assert {_text(idx, d) for d in top} == {"Explain mutagens and mutation rates",
+                                            "Describe point and frameshift mutations"}
+
+
+def test_only_positive_scores_and_k():
+    idx = SyllabusIndex.from_tree(TREE)
+    ranker = BM25Ranker(idx)
+    assert ranker.top_k("photosynthesis") == []
+    assert len(ranker.top_k("equilibrium mutations", k=1)) == 1
+    scores = ranker.scores("pressure")
+    assert scores.shape == (idx.n_dotpoints,)
+    assert [_text(idx, d) for d in scores.nonzero()[0]] == [
+        "Predict shifts for concentration and pressure changes"]
+
+
+def test_rare_terms_outweigh_common_ones():
+    idx = SyllabusIndex.from_tree(TREE)
+    ranker = BM25Ranker(idx)
+    # "pcr" is in one document, "mutation" (via the IQ title) in two
+    s = ranker.scores("pcr mutation")
+    pcr = idx.dotpoint_id(("Biology", "Module 6: Genetic Change", "IQ2: Biotechnology",
+                           "Outline PCR steps and applications"))
+    assert s.argmax() == pcr
@@ -0,0 +1,41 @@
+import os
+
+from data.index import SyllabusIndex
+from data.related import build_graph, load_graph, save_graph
+
+TREE = {
+    "Biology": {"M1": {"IQ1": [
+        "Describe point and frameshift mutations",
+        "Explain mutagens and mutation rates",
+        "Outline PCR steps and applications",
+    ]}},
+    "Chemistry": {"M5": {"IQ1": [
+        "Explain how mutagens change mutation rates in cells",
+        "Relate Kc to reaction quotient Q",
+    ]}},
+}
+
+
+def _saved(tmp_path):
+    full = SyllabusIndex.from_tree(TREE)
+    path = os.path.join(tmp_path, "syllabus.knn.npz")
+    assert save_graph(path, full, *build_graph(full))
+    return full, load_graph(path)
+
+
+def test_missing_graph_loads_as_none(tmp_path):
+    assert load_graph(os.path.join(tmp_path, "absent.knn.npz")) is None
+
+
+def test_related_maps_full_graph_onto_partial_index(tmp_path):
+    full, graph = _saved(tmp_path)
+    rates = ("Biology", "M1", "IQ1", "Explain mutagens and mutation rates")
+    related = graph.related(full, full.dotpoint_id(rates), n=1)
+    assert [full.items[d][0] for d, _ in related] == ["Chemistry"]
+
+    # only Biology loaded: its neighbours in Chemistry are skipped, and the IDs
+    # returned are the partial index's own
+    partial = SyllabusIndex.from_tree({"Biology": TREE["Biology"]})
+    for d, _ in graph.related(partial, partial.dotpoint_id(rates), n=5):
+        assert partial.items[d][0] == "Biology"
+        assert partial.items[d] != rates
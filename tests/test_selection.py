@@ -0,0 +1,64 @@
+from data.index import SyllabusIndex
+from selection.state import DotpointSelection, sync_session
+
+TREE = {
+    "Biology": {
+        "M5": {"IQ1": ["Cell division", "DNA replication"]},
+        "M6": {"IQ1": ["Point mutations", "Mutagens"], "IQ2": ["PCR"]},
+    },
+    "Chemistry": {"M5": {"IQ1": ["Le Chatelier", "Kc and Q"]}},
+}
+
+
+def _counts(sel, idx):
+    return ([sel.count_subject(s) for s in range(idx.n_subjects)],
+            [sel.count_module(m) for m in range(idx.n_modules)],
+            [sel.count_iq(q) for q in range(idx.n_iqs)])
+
+
+def test_rolled_up_counts_follow_item_changes():
+    idx = SyllabusIndex.from_tree(TREE)
+    sel = DotpointSelection(idx)
+    sel.add(("Biology", "M6", "IQ1", "Mutagens"))
+    sel.add(("Biology", "M6", "IQ1", "Mutagens"))  # no double count
+    sel.add(("Chemistry", "M5", "IQ1", "Kc and Q"))
+    sel.add(("Nope", "M", "IQ", "x"))  # unknown items are ignored
+    assert len(sel) == 2
+    assert _counts(sel, idx) == ([1, 1], [0, 1, 1], [0, 1, 0, 1])
+    sel.discard(("Biology", "M6", "IQ1", "Mutagens"))
+    assert _counts(sel, idx) == ([0, 1], [0, 0, 1], [0, 0, 0, 1])
+
+
+def test_set_range_over_subtree():
+    idx = SyllabusIndex.from_tree(TREE)
+    sel = DotpointSelection(idx)
+    bio = idx.subject_dps(idx.subject_id("Biology"))
+    sel.set_range(bio, True)
+    assert _counts(sel, idx) == ([5, 0], [2, 3, 0], [2, 2, 1, 0])
+    sel.set_range(idx.module_dps(idx.module_id("Biology", "M6")), False)
+    assert _counts(sel, idx) == ([2, 0], [2, 0, 0], [2, 0, 0, 0])
+    assert list(sel) == [("Biology", "M5", "IQ1", "Cell division"),
+                         ("Biology", "M5", "IQ1", "DNA replication")]
+    sel.clear()
+    assert not sel and _counts(sel, idx) == ([0, 0], [0, 0, 0], [0, 0, 0, 0])
+
+
+def test_remapped_carries_selection_across_recompile():
+    old = SyllabusIndex.from_tree(TREE)
+    sel = DotpointSelection(old, [("Biology", "M5", "IQ1", "DNA replication"),
+                                  ("Biology", "M6", "IQ2", "PCR")])
+    new, remap = old.recompile({"Biology": {"M6": TREE["Biology"]["M6"]},
+                                "Chemistry": TREE["Chemistry"]})
+    moved = sel.remapped(new, remap)
+    assert list(moved) == [("Biology", "M6", "IQ2", "PCR")]
+    assert moved.count_subject(new.subject_id("Biology")) == 1
+
+
+def test_sync_session_converts_plain_sets():
+    idx = SyllabusIndex.from_tree(TREE)
+    session = {"sel_dotpoints": {("Biology", "M6", "IQ2", "PCR"), ("Gone", "M", "IQ", "x")}}
+    sync_session(session, idx)
+    sel = session["sel_dotpoints"]
+    assert isinstance(sel, DotpointSelection) and sel.idx is idx
+    assert list(sel) == [("Biology", "M6", "IQ2", "PCR")]
+    assert session["_IDX"] is idx
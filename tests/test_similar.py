@@ -0,0 +1,105 @@
+import time
+
+import fp.fp_mvp as fp_mvp
+from ai.cache import ResponseCache
+from ai.similar import MAX_DISTANCE, SimHashIndex, simhash
+
+BLURT = ("Photosynthesis converts light energy into chemical energy stored in glucose "
+         "inside the chloroplast using water and carbon dioxide")
+REWORDED = ("Photosynthesis converts light energy into chemical energy stored as glucose "
+            "inside the chloroplasts using water and carbon dioxide")
+OTHER = ("Natural selection acts on heritable variation so organisms better suited "
+         "to their environment survive and reproduce more")
+
+
+def test_short_answers_are_not_indexed():
+    assert simhash("too short to trust") is None
+
+
+def test_near_duplicate_reuses_result():
+    idx = SimHashIndex("ns", path=None)
+    calls = []
+    first = idx.get_or_compute(BLURT, lambda: calls.append(1) or {"weak": ["a"]})
+    assert idx.get_or_compute(REWORDED, lambda: calls.append(1) or {"weak": ["b"]}) == first
+    assert idx.get_or_compute(OTHER, lambda: calls.append(1) or {"weak": ["c"]}) == {"weak": ["c"]}
+    assert len(calls) == 2
+    assert idx.stats()["near_hits"] == 1
+
+
+def test_distance_threshold():
+    idx = SimHashIndex("ns", path=None)
+    fp = 0x0123_4567_89AB_CDEF
+    idx._store(fp, "v")
+    within = fp ^ sum(1 << (b * 16 + 1) for b in range(MAX_DISTANCE))
+    beyond = fp ^ sum(1 << (b * 16 + 1) for b in range(MAX_DISTANCE + 1))
+    assert idx._lookup(within) == "v"
+    assert idx._lookup(beyond) is None
+
+
+def test_eviction_caps_memory_and_disk(tmp_path):
+    path = str(tmp_path / "c.sqlite3")
+    idx = SimHashIndex("ns", path=path, max_entries=10)
+    for i in range(25):
+        idx._store(i << 48 | i, i)
+    assert len(idx) <= 10
+    rows = idx._db.execute("SELECT COUNT(*) FROM near_answers").fetchone()[0]
+    assert rows == len(idx)
+    assert idx._lookup(24 << 48 | 24) == 24  # the newest survive
+    assert len(SimHashIndex("ns", path=path, max_entries=10)) == len(idx)
+
+
+def test_entries_expire(tmp_path):
+    idx = SimHashIndex("ns", path=str(tmp_path / "c.sqlite3"), ttl=0.01)
+    idx.add(BLURT, "v")
+    time.sleep(0.02)
+    assert idx.find(BLURT) is None
+
+
+class _FakeProvider:
+    live = True
+    model = "fake"
+    name = "fake"
+
+    def __init__(self):
+        self.prompts = []
+
+    def complete(self, prompt, max_tokens=120, temperature=0.2):
+        self.prompts.append(prompt)
+        return f"weak: w{len(self.prompts)}\nstrong: s"
+
+
+def test_cloze_answers_skip_near_duplicates(monkeypatch):
+    provider = _FakeProvider()
+    monkeypatch.setattr(fp_mvp, "get_provider", lambda: provider)
+    monkeypatch.setattr(fp_mvp, "get_cache", lambda: ResponseCache(None))
+    near = SimHashIndex("ns", path=None)
+    monkeypatch.setattr(fp_mvp, "get_near_index", lambda model, version: near)
+
+    bank = ("glucose chloroplast light water carbon oxygen stomata energy chlorophyll "
+            "enzyme membrane thylakoid stroma photon electron").split()
+    swapped = list(bank)
+    swapped[2], swapped[14] = swapped[14], swapped[2]
+    # a wrong fill order that SimHash cannot tell from the right one
+    assert bin(simhash(" | ".join(bank)) ^ simhash(" | ".join(swapped))).count("1") <= MAX_DISTANCE
+    right = fp_mvp._weak_strengths_task(" | ".join(bank))()
+    wrong = fp_mvp._weak_strengths_task(" | ".join(swapped))()
+    assert right != wrong and len(provider.prompts) == 2
+    assert len(near) == 0
+
+    fp_mvp._weak_strengths_task(BLURT, near_ok=True)()
+    assert fp_mvp._weak_strengths_task(REWORDED, near_ok=True)()["weak"] == ["w3"]
+    assert len(provider.prompts) == 3
+
+
+def test_opens_a_table_without_used_column(tmp_path):
+    import sqlite3
+    path = str(tmp_path / "c.sqlite3")
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE near_answers (id INTEGER PRIMARY KEY, ns TEXT NOT NULL,"
+               " fp INTEGER NOT NULL, value TEXT NOT NULL, created REAL NOT NULL)")
+    db.execute("INSERT INTO near_answers (ns, fp, value, created) VALUES ('ns', 5, '\"v\"', ?)",
+               (time.time(),))
+    db.commit()
+    db.close()
+    idx = SimHashIndex("ns", path=path)
+    assert len(idx) == 1 and idx._lookup(5) == "v"
@@ -0,0 +1,42 @@
+import json
+import os
+
+from data.index import SyllabusIndex
+from data.snapshot import publish, read_snapshot, snapshot_path
+
+TREE = {
+    "Biology": {"M6": {"IQ1": ["Point mutations", "Mutagens"], "IQ2": ["PCR"]}},
+    "Chemistry": {"M5": {"IQ1": ["Le Chatelier", "Kc and Q — équilibre"]}},
+}
+
+
+def _source(tmp_path, tree=TREE):
+    path = str(tmp_path / "syllabus.json")
+    with open(path, "w") as f:
+        json.dump(tree, f, ensure_ascii=False)
+    return path
+
+
+def test_snapshot_round_trip(tmp_path):
+    src = _source(tmp_path)
+    idx = SyllabusIndex.from_tree(TREE)
+    mapped = publish(idx, src)
+    assert mapped is not None and os.path.exists(snapshot_path(src))
+    assert mapped.fingerprint == idx.fingerprint
+    assert tuple(mapped.items) == idx.items
+    assert [mapped.items[d] for d in range(-1, len(idx))] == [idx.items[-1], *idx.items]
+    assert list(mapped.dotpoints) == list(idx.dotpoints)
+    assert mapped.to_tree() == TREE
+    did = idx.dotpoint_id(("Chemistry", "M5", "IQ1", "Kc and Q — équilibre"))
+    assert mapped.dotpoint_id(idx.items[did]) == did
+    assert ("Chemistry", "M5", "IQ1", "Kc and Q") not in mapped
+    # items of one IQ share the (decoded once) subject, module and IQ strings
+    assert mapped.items[0][0] is mapped.items[2][0]
+
+
+def test_stale_or_missing_snapshot_is_ignored(tmp_path):
+    src = _source(tmp_path)
+    assert read_snapshot(src) is None
+    assert publish(SyllabusIndex.from_tree(TREE), src) is not None
+    _source(tmp_path, {"Biology": TREE["Biology"]})  # the source changed since
+    assert read_snapshot(src) is None
@@ -0,0 +1,28 @@
+import pytest
+
+from data.text import stem, tokenize
+
+
+@pytest.mark.parametrize("singular, plural", [
+    ("rate", "rates"),
+    ("change", "changes"),
+    ("enzyme", "enzymes"),
+    ("mutation", "mutations"),
+    ("process", "processes"),
+    ("box", "boxes"),
+    ("match", "matches"),
+    ("gas", "gases"),
+    ("energy", "energies"),
+])
+def test_plural_pairs_meet(singular, plural):
+    assert stem(singular) == stem(plural)
+
+
+@pytest.mark.parametrize("word", ["mass", "nucleus", "analysis", "is", "gas"])
+def test_non_plurals_keep_their_s(word):
+    assert stem(word) == word
+
+
+def test_tokenize_drops_stopwords():
+    assert tokenize("The Rate of a Reaction") == ["rate", "reaction"]
+    assert tokenize("The rate", drop_stopwords=False) == ["the", "rate"]
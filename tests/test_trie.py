@@ -0,0 +1,30 @@
+from data.index import SyllabusIndex
+from selection.trie import PrefixTrie, SelectionFilter
+
+NAMES = ["Cell division", "DNA replication", "Point mutations", "Mutagens and mutation rates"]
+
+
+def test_prefix_lookup_is_sorted_ids():
+    trie = PrefixTrie(NAMES)
+    assert list(trie.lookup("mut")) == [2, 3]
+    assert list(trie.lookup("d")) == [0, 1]
+    assert list(trie.lookup("x")) == []
+
+
+def test_match_needs_every_word_within_the_range():
+    trie = PrefixTrie(NAMES)
+    assert trie.match("mut rat", range(0, 4)) == [3]
+    assert trie.match("MUT", range(0, 3)) == [2]
+    assert trie.match("  ", range(1, 3)) == [1, 2]  # empty query keeps everything
+    assert trie.match("cell dna", range(0, 4)) == []
+
+
+def test_selection_filter_per_level():
+    idx = SyllabusIndex.from_tree({
+        "Biology": {"Module 6: Genetic Change": {"IQ1: Mutations": NAMES}},
+        "Chemistry": {"Module 5: Equilibrium": {"IQ1: Le Chatelier": ["Predict shifts"]}},
+    })
+    flt = SelectionFilter(idx)
+    assert flt.match("subjects", "chem", range(idx.n_subjects)) == [1]
+    assert flt.match("modules", "gen", range(idx.n_modules)) == [0]
+    assert flt.match("dotpoints", "mut", idx.dps_of(0)) == [2, 3]